@@ -11,6 +11,7 @@ D16 Live Trading — FastAPI Backend
 - /signals: 신호 조회
 - /orders: 주문 조회
 - /executions: 실행 결과 조회
+- /ws/metrics, /ws/signals: 단일 StatePublisher가 변경 시에만 발행 (push fan-out)
 """
 
 import logging
@@ -22,6 +23,7 @@ import asyncio
 import json
 
 from arbitrage.state_manager import StateManager
+from arbitrage.ws_broadcast import BroadcastHub, StatePublisher
 
 logger = logging.getLogger(__name__)
 
@@ -30,19 +32,30 @@ app = FastAPI(title="Arbitrage Live Trading API")
 # 상태 관리자
 state_manager: Optional[StateManager] = None
 
+# WebSocket fan-out (뷰어 수와 무관하게 상태 조회는 publisher 1개)
+metrics_hub = BroadcastHub("metrics")
+signals_hub = BroadcastHub("signals")
+state_publisher: Optional[StatePublisher] = None
+
 
 @app.on_event("startup")
 async def startup():
     """앱 시작"""
-    global state_manager
+    global state_manager, state_publisher
     state_manager = StateManager()
     state_manager.connect()
+    state_publisher = StatePublisher(state_manager, metrics_hub, signals_hub)
+    await state_publisher.start()
     logger.info("API server started")
 
 
 @app.on_event("shutdown")
 async def shutdown():
     """앱 종료"""
+    if state_publisher:
+        await state_publisher.stop()
+    await metrics_hub.close()
+    await signals_hub.close()
     if state_manager:
         state_manager.disconnect()
     logger.info("API server stopped")
@@ -312,31 +325,10 @@ async def websocket_metrics(websocket: WebSocket):
     """
     실시간 메트릭 WebSocket
     
-    클라이언트에 1초마다 메트릭 전송.
+    접속 시 최신 메트릭을 받고, 이후 메트릭/포트폴리오가 바뀔 때마다 전송.
     """
     await websocket.accept()
-    
-    try:
-        while True:
-            if state_manager:
-                metrics = state_manager.get_metrics()
-                portfolio = state_manager.get_portfolio_state()
-                
-                data = {
-                    "type": "metrics",
-                    "metrics": metrics,
-                    "portfolio": portfolio,
-                    "timestamp": datetime.utcnow().isoformat()
-                }
-                
-                await websocket.send_json(data)
-            
-            await asyncio.sleep(1)
-    
-    except Exception as e:
-        logger.error(f"WebSocket error: {e}")
-    finally:
-        await websocket.close()
+    await metrics_hub.serve(websocket)
 
 
 @app.websocket("/ws/signals")
@@ -344,36 +336,21 @@ async def websocket_signals(websocket: WebSocket):
     """
     실시간 신호 WebSocket
     
-    클라이언트에 신호 업데이트 전송.
+    접속 시 현재 신호 전체를 받고, 이후 새로운/변경된 신호만 전송.
     """
     await websocket.accept()
-    
-    try:
-        last_signals = {}
-        
-        while True:
-            if state_manager:
-                signals = state_manager.get_all_signals()
-                
-                # 새로운 신호만 전송
-                for symbol, signal in signals.items():
-                    if symbol not in last_signals or last_signals[symbol] != signal:
-                        data = {
-                            "type": "signal",
-                            "symbol": symbol,
-                            "signal": signal,
-                            "timestamp": datetime.utcnow().isoformat()
-                        }
-                        await websocket.send_json(data)
-                
-                last_signals = signals
-            
-            await asyncio.sleep(1)
-    
-    except Exception as e:
-        logger.error(f"WebSocket error: {e}")
-    finally:
-        await websocket.close()
+    await signals_hub.serve(websocket)
+
+
+@app.get("/ws/stats")
+async def websocket_stats() -> Dict[str, Any]:
+    """WebSocket fan-out 통계"""
+    return {
+        "metrics": metrics_hub.get_stats(),
+        "signals": signals_hub.get_stats(),
+        "publisher_refreshes": state_publisher.refresh_count if state_publisher else 0,
+        "timestamp": datetime.utcnow().isoformat()
+    }
 
 
 # ========== 에러 핸들러 ==========
@@ -8,7 +8,7 @@ Deterministic and fully testable.
 
 import logging
 from dataclasses import dataclass, field
-from typing import Dict, List, Literal, Optional
+from typing import Any, Dict, List, Literal, Optional
 
 logger = logging.getLogger(__name__)
 
@@ -40,6 +40,7 @@ class OrderBookSnapshot:
     best_ask_a: float  # Exchange A 최저 매도가
     best_bid_b: float  # Exchange B 최고 매수가
     best_ask_b: float  # Exchange B 최저 매도가
+    trace: Any = field(default=None, repr=False, compare=False)  # D93-1: TickTrace
 
 
 @dataclass
@@ -70,6 +71,8 @@ class ArbitrageTrade:
     meta: Dict[str, str] = field(default_factory=dict)
     # D65: Exit 이유 추적
     exit_reason: Optional[str] = None  # "spread_reversal", "take_profit", "stop_loss", etc.
+    # D93-1: 이 거래를 개설/종료시킨 tick trace (직렬화 제외)
+    trace: Any = field(default=None, repr=False, compare=False)
 
     def close(
         self,
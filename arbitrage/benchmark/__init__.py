@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+"""
+D93-0: Benchmark & Regression Harness
+
+핫 경로(탐지, WS 파싱, 리스크 평가, 체결 모델, 상태 저장, 백테스트) 공통 벤치마크.
+- 결정적 합성/녹화 데이터셋
+- warmup + 반복 측정, 메모리/할당 추적, JSON baseline
+- Mann-Whitney U 기반 회귀 판정
+"""
+
+from .datasets import (
+    BenchmarkDataset,
+    Quote,
+    load_recorded,
+    save_recorded,
+    synthetic_dataset,
+)
+from .harness import (
+    BenchmarkCase,
+    BenchmarkReport,
+    BenchmarkResult,
+    BenchmarkRunner,
+    BenchmarkSettings,
+)
+from .compare import (
+    CaseComparison,
+    ComparisonReport,
+    compare_reports,
+    mann_whitney_u,
+)
+from .standins import InMemoryPostgresConnection, InMemoryRedis
+from .suite import default_cases, select_cases
+
+__all__ = [
+    "BenchmarkDataset",
+    "Quote",
+    "load_recorded",
+    "save_recorded",
+    "synthetic_dataset",
+    "BenchmarkCase",
+    "BenchmarkReport",
+    "BenchmarkResult",
+    "BenchmarkRunner",
+    "BenchmarkSettings",
+    "CaseComparison",
+    "ComparisonReport",
+    "compare_reports",
+    "mann_whitney_u",
+    "InMemoryPostgresConnection",
+    "InMemoryRedis",
+    "default_cases",
+    "select_cases",
+]
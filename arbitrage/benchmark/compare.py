@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+D93-0: Benchmark Comparator
+
+baseline 리포트 vs 현재 리포트 → 케이스별 회귀 판정.
+
+판정 규칙:
+- 시간: Mann-Whitney U (양측, 정규근사 + tie 보정 + 연속성 보정)로 p < alpha 이고
+  median 변화율이 threshold를 넘을 때만 regression/improvement
+  (통계적으로 유의하지만 미미한 변화, 크지만 노이즈인 변화 모두 unchanged)
+- 메모리: peak_bytes가 memory_threshold 이상 + MEMORY_MIN_DELTA_BYTES 이상 증가하면 memory_regression
+- dataset fingerprint가 다르면 비교 불가 (incomparable)
+
+정규근사는 표본이 작으면 보수적 (반복 5회씩이면 완전 분리돼도 p≈0.012).
+alpha=0.01 기준으로 반복 8회 이상 권장.
+
+Author: arbitrage-lite project
+Date: 2025-12-16 (D93-0)
+"""
+
+import math
+from dataclasses import dataclass, field
+from typing import List, Optional, Sequence, Tuple
+
+from arbitrage.benchmark.harness import BenchmarkReport
+
+MEMORY_MIN_DELTA_BYTES = 64 * 1024
+
+VERDICT_REGRESSION = "regression"
+VERDICT_IMPROVEMENT = "improvement"
+VERDICT_UNCHANGED = "unchanged"
+VERDICT_NEW = "new"
+VERDICT_MISSING = "missing"
+VERDICT_SKIPPED = "skipped"
+VERDICT_INCOMPARABLE = "incomparable"
+
+
+def mann_whitney_u(a: Sequence[float], b: Sequence[float]) -> Tuple[float, float]:
+    """
+    Mann-Whitney U 검정 (양측).
+    
+    Returns:
+        (U_a, p_value). 표본이 비었거나 모든 값이 같으면 p=1.0
+    """
+    n1, n2 = len(a), len(b)
+    if n1 == 0 or n2 == 0:
+        return 0.0, 1.0
+    
+    combined = sorted([(value, 0) for value in a] + [(value, 1) for value in b])
+    n = n1 + n2
+    rank_sum_a = 0.0
+    tie_term = 0.0
+    i = 0
+    while i < n:
+        j = i
+        while j + 1 < n and combined[j + 1][0] == combined[i][0]:
+            j += 1
+        # i..j 동점 → 평균 순위
+        average_rank = (i + j) / 2.0 + 1.0
+        ties = j - i + 1
+        tie_term += ties ** 3 - ties
+        rank_sum_a += average_rank * sum(1 for k in range(i, j + 1) if combined[k][1] == 0)
+        i = j + 1
+    
+    u_a = rank_sum_a - n1 * (n1 + 1) / 2.0
+    mu = n1 * n2 / 2.0
+    variance = n1 * n2 / 12.0 * ((n + 1) - tie_term / (n * (n - 1)))
+    if variance <= 0:
+        return u_a, 1.0
+    
+    z = max(0.0, abs(u_a - mu) - 0.5) / math.sqrt(variance)
+    return u_a, math.erfc(z / math.sqrt(2.0))
+
+
+@dataclass
+class CaseComparison:
+    """케이스 비교 결과"""
+    name: str
+    verdict: str
+    baseline_median_ns: Optional[float] = None
+    current_median_ns: Optional[float] = None
+    change: Optional[float] = None
+    p_value: Optional[float] = None
+    baseline_peak_bytes: Optional[int] = None
+    current_peak_bytes: Optional[int] = None
+    memory_regression: bool = False
+    
+    @property
+    def regressed(self) -> bool:
+        return self.verdict == VERDICT_REGRESSION or self.memory_regression
+    
+    def describe(self) -> str:
+        """한 줄 요약"""
+        parts = [f"{self.name:<28} {self.verdict:<12}"]
+        if self.change is not None:
+            parts.append(
+                f"{self.baseline_median_ns:10.0f} → {self.current_median_ns:10.0f} ns/op "
+                f"({self.change * 100:+6.1f}%, p={self.p_value:.4f})"
+            )
+        if self.memory_regression:
+            parts.append(f"peak {self.baseline_peak_bytes:,} → {self.current_peak_bytes:,} B")
+        return "  ".join(parts)
+
+
+@dataclass
+class ComparisonReport:
+    """리포트 비교 결과"""
+    comparisons: List[CaseComparison] = field(default_factory=list)
+    fingerprint_match: bool = True
+    alpha: float = 0.01
+    threshold: float = 0.05
+    
+    @property
+    def regressions(self) -> List[CaseComparison]:
+        return [c for c in self.comparisons if c.regressed]
+    
+    @property
+    def comparable(self) -> bool:
+        return self.fingerprint_match
+    
+    def get(self, name: str) -> Optional[CaseComparison]:
+        for comparison in self.comparisons:
+            if comparison.name == name:
+                return comparison
+        return None
+
+
+def compare_reports(
+    baseline: BenchmarkReport,
+    current: BenchmarkReport,
+    alpha: float = 0.01,
+    threshold: float = 0.05,
+    memory_threshold: float = 0.25,
+) -> ComparisonReport:
+    """
+    baseline vs current 비교.
+    
+    Args:
+        baseline: 기준 리포트
+        current: 현재 리포트
+        alpha: 유의수준
+        threshold: median 변화율 임계값 (0.05 = 5%)
+        memory_threshold: peak 메모리 증가율 임계값
+    """
+    fingerprint_match = baseline.dataset.get("fingerprint") == current.dataset.get("fingerprint")
+    report = ComparisonReport(fingerprint_match=fingerprint_match, alpha=alpha, threshold=threshold)
+    
+    names = [r.name for r in baseline.results]
+    names += [r.name for r in current.results if baseline.get(r.name) is None]
+    
+    for name in names:
+        base = baseline.get(name)
+        cur = current.get(name)
+        if cur is None:
+            report.comparisons.append(CaseComparison(name=name, verdict=VERDICT_MISSING))
+            continue
+        if base is None:
+            report.comparisons.append(CaseComparison(name=name, verdict=VERDICT_NEW))
+            continue
+        if not fingerprint_match:
+            report.comparisons.append(CaseComparison(name=name, verdict=VERDICT_INCOMPARABLE))
+            continue
+        if not (base.ok and cur.ok):
+            report.comparisons.append(CaseComparison(name=name, verdict=VERDICT_SKIPPED))
+            continue
+        
+        base_median = base.median_ns
+        cur_median = cur.median_ns
+        change = cur_median / base_median - 1.0 if base_median > 0 else 0.0
+        _, p_value = mann_whitney_u(base.samples_ns, cur.samples_ns)
+        
+        verdict = VERDICT_UNCHANGED
+        if p_value < alpha and change > threshold:
+            verdict = VERDICT_REGRESSION
+        elif p_value < alpha and change < -threshold:
+            verdict = VERDICT_IMPROVEMENT
+        
+        memory_regression = False
+        if base.peak_bytes is not None and cur.peak_bytes is not None:
+            delta = cur.peak_bytes - base.peak_bytes
+            memory_regression = (
+                delta >= MEMORY_MIN_DELTA_BYTES
+                and cur.peak_bytes > base.peak_bytes * (1.0 + memory_threshold)
+            )
+        
+        report.comparisons.append(CaseComparison(
+            name=name,
+            verdict=verdict,
+            baseline_median_ns=base_median,
+            current_median_ns=cur_median,
+            change=change,
+            p_value=p_value,
+            baseline_peak_bytes=base.peak_bytes,
+            current_peak_bytes=cur.peak_bytes,
+            memory_regression=memory_regression,
+        ))
+    return report
@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+D93-0: Benchmark Datasets
+
+벤치마크 입력 데이터셋 (결정적 합성 데이터 + 녹화 JSONL).
+
+Purpose:
+- 모든 케이스가 같은 원본(Upbit/Binance raw WS frame)에서 입력을 파생
+- seed 고정 합성 → 실행마다 동일 입력, 녹화 파일 → 실제 시장 분포
+- sha256 fingerprint로 baseline과 현재 실행이 같은 입력인지 확인
+
+녹화 파일 형식 (JSONL):
+- 1행: {"kind": "header", "schema": 1, "name": ..., "fx_rate": ...}
+- 이후: {"exchange": "upbit" | "binance", "raw": "<수신한 WS 메시지 원문>"}
+- Upbit/Binance frame은 각각 수신 순서대로 i번째끼리 한 tick으로 묶음
+
+Author: arbitrage-lite project
+Date: 2025-12-16 (D93-0)
+"""
+
+import hashlib
+import json
+import math
+import random
+from dataclasses import dataclass, field
+from itertools import zip_longest
+from typing import Any, Dict, List, NamedTuple, Optional
+
+DATASET_SCHEMA_VERSION = 1
+
+UPBIT_TICK_KRW = 1000.0
+BINANCE_TICK_USDT = 0.01
+
+
+class Quote(NamedTuple):
+    """한 tick의 양 거래소 최우선 호가 (A=Upbit KRW, B=Binance USDT)"""
+    timestamp_ms: int
+    bid_a: float
+    ask_a: float
+    bid_size_a: float
+    ask_size_a: float
+    bid_b: float
+    ask_b: float
+    bid_size_b: float
+    ask_size_b: float
+
+
+@dataclass
+class BenchmarkDataset:
+    """
+    벤치마크 데이터셋
+    
+    Attributes:
+        name: 데이터셋 이름
+        source: "synthetic" 또는 녹화 파일 경로
+        upbit_frames: Upbit orderbook raw 메시지 (JSON 문자열)
+        binance_frames: Binance depth raw 메시지 (JSON 문자열)
+        fx_rate: KRW/USDT 환율 (ArbitrageConfig.exchange_a_to_b_rate)
+        seed: 파생 입력(주문 수량, 리스크 상태 등) 생성용 seed
+    """
+    name: str
+    source: str
+    upbit_frames: List[str]
+    binance_frames: List[str]
+    fx_rate: float = 1400.0
+    seed: int = 0
+    _quotes: Optional[List[Quote]] = field(default=None, init=False, repr=False, compare=False)
+    _fingerprint: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    
+    @property
+    def ticks(self) -> int:
+        """tick 수 (Upbit/Binance frame 쌍)"""
+        return min(len(self.upbit_frames), len(self.binance_frames))
+    
+    @property
+    def fingerprint(self) -> str:
+        """입력 내용 sha256 (이름/출처 무관, frame + 환율 + seed)"""
+        if self._fingerprint is None:
+            digest = hashlib.sha256()
+            digest.update(f"schema={DATASET_SCHEMA_VERSION};fx={self.fx_rate!r};seed={self.seed}\n".encode())
+            for exchange, frames in (("upbit", self.upbit_frames), ("binance", self.binance_frames)):
+                for raw in frames:
+                    digest.update(exchange.encode())
+                    digest.update(raw.encode("utf-8"))
+                    digest.update(b"\n")
+            self._fingerprint = digest.hexdigest()
+        return self._fingerprint
+    
+    def quotes(self) -> List[Quote]:
+        """tick별 최우선 호가 (raw frame 1회 파싱 후 캐시)"""
+        if self._quotes is None:
+            quotes = []
+            for raw_a, raw_b in zip(self.upbit_frames, self.binance_frames):
+                upbit = json.loads(raw_a)
+                unit = upbit["orderbook_units"][0]
+                data = json.loads(raw_b)["data"]
+                bid_b, bid_size_b = data["bids"][0]
+                ask_b, ask_size_b = data["asks"][0]
+                quotes.append(Quote(
+                    timestamp_ms=int(upbit.get("timestamp", 0)),
+                    bid_a=float(unit["bid_price"]),
+                    ask_a=float(unit["ask_price"]),
+                    bid_size_a=float(unit["bid_size"]),
+                    ask_size_a=float(unit["ask_size"]),
+                    bid_b=float(bid_b),
+                    ask_b=float(ask_b),
+                    bid_size_b=float(bid_size_b),
+                    ask_size_b=float(ask_size_b),
+                ))
+            self._quotes = quotes
+        return self._quotes
+    
+    def describe(self) -> Dict[str, Any]:
+        """리포트용 요약"""
+        return {
+            "name": self.name,
+            "source": self.source,
+            "ticks": self.ticks,
+            "fx_rate": self.fx_rate,
+            "seed": self.seed,
+            "fingerprint": self.fingerprint,
+        }
+
+
+def _round_to_tick(price: float, tick: float) -> float:
+    return round(round(price / tick) * tick, 8)
+
+
+def synthetic_dataset(
+    ticks: int = 2000,
+    seed: int = 93,
+    fx_rate: float = 1400.0,
+    depth: int = 15,
+    name: Optional[str] = None,
+) -> BenchmarkDataset:
+    """
+    결정적 합성 데이터셋 (BTC, Upbit KRW vs Binance USDT).
+    
+    - Binance mid: 로그 랜덤워크 (tick당 ~2bp)
+    - 김프(bps): 20bps 중심 mean-reverting → 진입/청산이 섞이도록
+    - 호가 잔량: 레벨별 무작위
+    
+    Args:
+        ticks: tick 수
+        seed: random seed
+        fx_rate: KRW/USDT 환율
+        depth: Upbit 호가 레벨 수 (Binance는 depth20 고정)
+        name: 데이터셋 이름 (기본 synthetic-{ticks}-s{seed})
+    """
+    rng = random.Random(seed)
+    mid_b = 100_000.0
+    premium_bps = 20.0
+    timestamp_ms = 1_765_000_000_000
+    upbit_frames: List[str] = []
+    binance_frames: List[str] = []
+    
+    for i in range(ticks):
+        mid_b *= math.exp(rng.gauss(0.0, 2e-4))
+        premium_bps += 0.05 * (20.0 - premium_bps) + rng.gauss(0.0, 6.0)
+        mid_a = mid_b * fx_rate * (1.0 + premium_bps / 10_000.0)
+        timestamp_ms += rng.randint(50, 150)
+        
+        best_bid_a = _round_to_tick(mid_a - UPBIT_TICK_KRW * rng.randint(1, 3), UPBIT_TICK_KRW)
+        units = []
+        for level in range(depth):
+            units.append({
+                "ask_price": best_bid_a + UPBIT_TICK_KRW * (1 + level),
+                "bid_price": best_bid_a - UPBIT_TICK_KRW * level,
+                "ask_size": round(rng.uniform(0.001, 2.0), 8),
+                "bid_size": round(rng.uniform(0.001, 2.0), 8),
+            })
+        upbit_frames.append(json.dumps({
+            "type": "orderbook",
+            "code": "KRW-BTC",
+            "timestamp": timestamp_ms,
+            "total_ask_size": round(sum(u["ask_size"] for u in units), 8),
+            "total_bid_size": round(sum(u["bid_size"] for u in units), 8),
+            "orderbook_units": units,
+            "stream_type": "REALTIME",
+        }, separators=(",", ":")))
+        
+        best_bid_b = _round_to_tick(mid_b - BINANCE_TICK_USDT * rng.randint(1, 5), BINANCE_TICK_USDT)
+        best_ask_b = _round_to_tick(best_bid_b + BINANCE_TICK_USDT * rng.randint(1, 5), BINANCE_TICK_USDT)
+        bids = [[f"{best_bid_b - level * BINANCE_TICK_USDT:.2f}", f"{rng.uniform(0.001, 3.0):.5f}"] for level in range(20)]
+        asks = [[f"{best_ask_b + level * BINANCE_TICK_USDT:.2f}", f"{rng.uniform(0.001, 3.0):.5f}"] for level in range(20)]
+        binance_frames.append(json.dumps({
+            "stream": "btcusdt@depth20@100ms",
+            "data": {"lastUpdateId": 50_000_000 + i, "bids": bids, "asks": asks},
+        }, separators=(",", ":")))
+    
+    return BenchmarkDataset(
+        name=name or f"synthetic-{ticks}-s{seed}",
+        source="synthetic",
+        upbit_frames=upbit_frames,
+        binance_frames=binance_frames,
+        fx_rate=fx_rate,
+        seed=seed,
+    )
+
+
+def save_recorded(dataset: BenchmarkDataset, path: str) -> None:
+    """데이터셋 → 녹화 JSONL (합성 데이터 고정 보관 / 캡처 변환용)"""
+    with open(path, "w", encoding="utf-8") as f:
+        header = {
+            "kind": "header",
+            "schema": DATASET_SCHEMA_VERSION,
+            "name": dataset.name,
+            "fx_rate": dataset.fx_rate,
+            "seed": dataset.seed,
+        }
+        f.write(json.dumps(header) + "\n")
+        for raw_a, raw_b in zip_longest(dataset.upbit_frames, dataset.binance_frames):
+            if raw_a is not None:
+                f.write(json.dumps({"exchange": "upbit", "raw": raw_a}) + "\n")
+            if raw_b is not None:
+                f.write(json.dumps({"exchange": "binance", "raw": raw_b}) + "\n")
+
+
+def load_recorded(path: str, fx_rate: Optional[float] = None) -> BenchmarkDataset:
+    """
+    녹화 JSONL → 데이터셋.
+    
+    Args:
+        path: 녹화 파일 경로
+        fx_rate: 환율 (None이면 header 값, header도 없으면 1400.0)
+    
+    Raises:
+        ValueError: 형식 오류 (행 번호 포함)
+    """
+    header: Dict[str, Any] = {}
+    frames: Dict[str, List[str]] = {"upbit": [], "binance": []}
+    
+    with open(path, "r", encoding="utf-8") as f:
+        for line_no, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"[BENCHMARK_DATASET] {path}:{line_no}: invalid JSON ({e})") from e
+            if record.get("kind") == "header":
+                if record.get("schema", DATASET_SCHEMA_VERSION) != DATASET_SCHEMA_VERSION:
+                    raise ValueError(f"[BENCHMARK_DATASET] {path}: unsupported schema {record.get('schema')}")
+                header = record
+                continue
+            exchange = record.get("exchange")
+            raw = record.get("raw")
+            if exchange not in frames or not isinstance(raw, str):
+                raise ValueError(f"[BENCHMARK_DATASET] {path}:{line_no}: expected exchange/raw record")
+            frames[exchange].append(raw)
+    
+    if not frames["upbit"] or not frames["binance"]:
+        raise ValueError(f"[BENCHMARK_DATASET] {path}: needs both upbit and binance frames")
+    
+    return BenchmarkDataset(
+        name=header.get("name", path),
+        source=path,
+        upbit_frames=frames["upbit"],
+        binance_frames=frames["binance"],
+        fx_rate=fx_rate if fx_rate is not None else float(header.get("fx_rate", 1400.0)),
+        seed=int(header.get("seed", 0)),
+    )
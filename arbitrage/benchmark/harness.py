@@ -0,0 +1,333 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+D93-0: Benchmark Harness
+
+케이스 실행(warmup + 반복 측정) → 통계 + 메모리/할당 측정 → JSON 리포트(baseline).
+
+측정 방식:
+- 반복마다 setup(dataset)을 새로 호출 (엔진 상태 초기화, setup 비용은 측정 제외)
+- 시간: perf_counter_ns, 반복별 op당 ns 샘플 → mean/median/stdev/p95/min
+- GC: 측정 구간의 세대별 collection 횟수 (할당 churn 지표)
+- 메모리: 별도 1회 실행을 tracemalloc으로 측정 (tracemalloc 오버헤드가 시간 샘플에 섞이지 않도록)
+  peak/retained bytes, net 할당 block 수 (sys.getallocatedblocks)
+- 선택 의존성 누락(ImportError)은 skipped, 그 외 예외는 error로 기록하고 다음 케이스 진행
+
+Author: arbitrage-lite project
+Date: 2025-12-16 (D93-0)
+"""
+
+import gc
+import json
+import logging
+import math
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from arbitrage.benchmark.datasets import BenchmarkDataset
+
+logger = logging.getLogger(__name__)
+
+REPORT_SCHEMA_VERSION = 1
+
+STATUS_OK = "ok"
+STATUS_SKIPPED = "skipped"
+STATUS_ERROR = "error"
+
+
+@dataclass
+class BenchmarkCase:
+    """
+    벤치마크 케이스
+    
+    Attributes:
+        name: "그룹.세부" 형식 (예: "detection.on_snapshot")
+        setup: dataset → 1회 실행 함수. 실행 함수는 처리한 op 수를 반환
+        description: 측정 대상 설명
+    """
+    name: str
+    setup: Callable[[BenchmarkDataset], Callable[[], int]]
+    description: str = ""
+    
+    @property
+    def group(self) -> str:
+        return self.name.split(".", 1)[0]
+
+
+@dataclass
+class BenchmarkSettings:
+    """실행 설정"""
+    warmup: int = 2
+    repetitions: int = 10
+    track_memory: bool = True
+
+
+@dataclass
+class BenchmarkResult:
+    """
+    케이스 결과
+    
+    Attributes:
+        name: 케이스 이름
+        status: ok / skipped / error
+        reason: skipped/error 사유
+        ops: 반복당 op 수
+        samples_ns: 반복별 op당 ns
+        gc_collections: 측정 구간 GC 횟수 [gen0, gen1, gen2] (전체 반복 합)
+        peak_bytes: 1회 실행 중 최대 추가 메모리 (tracemalloc)
+        retained_bytes: 1회 실행 후 남은 메모리
+        net_blocks: 1회 실행 후 net 할당 block 수
+    """
+    name: str
+    status: str = STATUS_OK
+    reason: str = ""
+    ops: int = 0
+    samples_ns: List[float] = field(default_factory=list)
+    gc_collections: List[int] = field(default_factory=lambda: [0, 0, 0])
+    peak_bytes: Optional[int] = None
+    retained_bytes: Optional[int] = None
+    net_blocks: Optional[int] = None
+    
+    @property
+    def ok(self) -> bool:
+        return self.status == STATUS_OK and bool(self.samples_ns)
+    
+    @property
+    def mean_ns(self) -> float:
+        return statistics.fmean(self.samples_ns) if self.samples_ns else math.nan
+    
+    @property
+    def median_ns(self) -> float:
+        return statistics.median(self.samples_ns) if self.samples_ns else math.nan
+    
+    @property
+    def stdev_ns(self) -> float:
+        return statistics.stdev(self.samples_ns) if len(self.samples_ns) > 1 else 0.0
+    
+    @property
+    def min_ns(self) -> float:
+        return min(self.samples_ns) if self.samples_ns else math.nan
+    
+    @property
+    def p95_ns(self) -> float:
+        """nearest-rank p95"""
+        if not self.samples_ns:
+            return math.nan
+        ordered = sorted(self.samples_ns)
+        return ordered[max(0, math.ceil(0.95 * len(ordered)) - 1)]
+    
+    @property
+    def cv(self) -> float:
+        """변동계수 (stdev / mean)"""
+        mean = self.mean_ns
+        return self.stdev_ns / mean if self.samples_ns and mean > 0 else 0.0
+    
+    def to_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        if self.ok:
+            data["stats"] = {
+                "mean_ns": self.mean_ns,
+                "median_ns": self.median_ns,
+                "stdev_ns": self.stdev_ns,
+                "min_ns": self.min_ns,
+                "p95_ns": self.p95_ns,
+                "cv": self.cv,
+            }
+        return data
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "BenchmarkResult":
+        return cls(
+            name=data["name"],
+            status=data.get("status", STATUS_OK),
+            reason=data.get("reason", ""),
+            ops=data.get("ops", 0),
+            samples_ns=[float(v) for v in data.get("samples_ns", [])],
+            gc_collections=list(data.get("gc_collections", [0, 0, 0])),
+            peak_bytes=data.get("peak_bytes"),
+            retained_bytes=data.get("retained_bytes"),
+            net_blocks=data.get("net_blocks"),
+        )
+
+
+@dataclass
+class BenchmarkReport:
+    """실행 리포트 (baseline JSON 단위)"""
+    dataset: Dict[str, Any]
+    settings: Dict[str, Any]
+    environment: Dict[str, Any]
+    results: List[BenchmarkResult]
+    created_at: str = ""
+    schema_version: int = REPORT_SCHEMA_VERSION
+    
+    def get(self, name: str) -> Optional[BenchmarkResult]:
+        for result in self.results:
+            if result.name == name:
+                return result
+        return None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "schema_version": self.schema_version,
+            "created_at": self.created_at,
+            "dataset": self.dataset,
+            "settings": self.settings,
+            "environment": self.environment,
+            "results": [result.to_dict() for result in self.results],
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "BenchmarkReport":
+        if data.get("schema_version") != REPORT_SCHEMA_VERSION:
+            raise ValueError(f"[BENCHMARK] unsupported report schema {data.get('schema_version')}")
+        return cls(
+            dataset=data.get("dataset", {}),
+            settings=data.get("settings", {}),
+            environment=data.get("environment", {}),
+            results=[BenchmarkResult.from_dict(r) for r in data.get("results", [])],
+            created_at=data.get("created_at", ""),
+        )
+    
+    def save(self, path: str) -> None:
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, indent=2)
+    
+    @classmethod
+    def load(cls, path: str) -> "BenchmarkReport":
+        with open(path, "r", encoding="utf-8") as f:
+            return cls.from_dict(json.load(f))
+
+
+def _git_revision() -> Optional[str]:
+    try:
+        output = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=Path(__file__).resolve().parent,
+            capture_output=True,
+            text=True,
+            timeout=5,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return output.stdout.strip() or None
+
+
+def environment_info() -> Dict[str, Any]:
+    """리포트 환경 정보 (비교 시 참고용)"""
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "git_revision": _git_revision(),
+    }
+
+
+def _gc_collections() -> List[int]:
+    return [stats["collections"] for stats in gc.get_stats()]
+
+
+class BenchmarkRunner:
+    """
+    케이스 실행기
+    
+    사용 예:
+        runner = BenchmarkRunner(BenchmarkSettings(warmup=2, repetitions=10))
+        report = runner.run(default_cases(), synthetic_dataset())
+        report.save("logs/d93/baseline.json")
+    """
+    
+    def __init__(self, settings: Optional[BenchmarkSettings] = None):
+        self.settings = settings or BenchmarkSettings()
+    
+    def run_case(self, case: BenchmarkCase, dataset: BenchmarkDataset) -> BenchmarkResult:
+        """단일 케이스 실행 (예외는 결과 status로 기록)"""
+        result = BenchmarkResult(name=case.name)
+        try:
+            for _ in range(self.settings.warmup):
+                case.setup(dataset)()
+            
+            for _ in range(max(1, self.settings.repetitions)):
+                run_once = case.setup(dataset)
+                gc.collect()
+                collections_before = _gc_collections()
+                started = time.perf_counter_ns()
+                ops = run_once()
+                elapsed = time.perf_counter_ns() - started
+                collections_after = _gc_collections()
+                
+                if ops <= 0:
+                    raise ValueError(f"case returned ops={ops}")
+                result.ops = ops
+                result.samples_ns.append(elapsed / ops)
+                result.gc_collections = [
+                    total + after - before
+                    for total, before, after in zip(result.gc_collections, collections_before, collections_after)
+                ]
+            
+            if self.settings.track_memory:
+                self._measure_memory(case, dataset, result)
+        except ImportError as e:
+            result.status = STATUS_SKIPPED
+            result.reason = f"missing dependency: {e}"
+            result.samples_ns = []
+            logger.warning(f"[BENCHMARK] {case.name} skipped ({result.reason})")
+        except Exception as e:
+            result.status = STATUS_ERROR
+            result.reason = f"{type(e).__name__}: {e}"
+            result.samples_ns = []
+            logger.exception(f"[BENCHMARK] {case.name} failed")
+        return result
+    
+    @staticmethod
+    def _measure_memory(case: BenchmarkCase, dataset: BenchmarkDataset, result: BenchmarkResult) -> None:
+        run_once = case.setup(dataset)
+        gc.collect()
+        was_tracing = tracemalloc.is_tracing()
+        if not was_tracing:
+            tracemalloc.start()
+        try:
+            tracemalloc.reset_peak()
+            baseline, _ = tracemalloc.get_traced_memory()
+            blocks_before = sys.getallocatedblocks()
+            run_once()
+            blocks_after = sys.getallocatedblocks()
+            current, peak = tracemalloc.get_traced_memory()
+        finally:
+            if not was_tracing:
+                tracemalloc.stop()
+        result.peak_bytes = max(0, peak - baseline)
+        result.retained_bytes = current - baseline
+        result.net_blocks = blocks_after - blocks_before
+    
+    def run(
+        self,
+        cases: Iterable[BenchmarkCase],
+        dataset: BenchmarkDataset,
+        progress: Optional[Callable[[BenchmarkResult], None]] = None,
+    ) -> BenchmarkReport:
+        """케이스 순차 실행 → 리포트"""
+        results = []
+        for case in cases:
+            result = self.run_case(case, dataset)
+            results.append(result)
+            if progress is not None:
+                progress(result)
+        return BenchmarkReport(
+            dataset=dataset.describe(),
+            settings=asdict(self.settings),
+            environment=environment_info(),
+            results=results,
+            created_at=datetime.now(timezone.utc).isoformat(),
+        )
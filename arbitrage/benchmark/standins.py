@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+D93-0: Local Redis / PostgreSQL Stand-ins
+
+StateStore 쓰기 경로를 서버 없이 측정하기 위한 in-process 대체 구현.
+
+- InMemoryRedis: StateStore가 쓰는 set/get/delete/scan_iter/ping/exists만 구현
+  (redis-py처럼 값은 bytes로 저장 → 직렬화/인코딩 비용은 그대로 측정)
+- InMemoryPostgresConnection: psycopg2 connection/cursor 인터페이스 최소 구현
+  INSERT/COPY는 테이블별 row로 보관, RETURNING은 증가 id 반환, commit/rollback은 트랜잭션 단위 반영
+  (COPY ... FORMAT csv 본문은 PostgreSQL 규칙대로 파싱: 따옴표 없는 빈 값 = NULL)
+
+네트워크/서버 처리 비용은 포함되지 않음 (클라이언트 측 CPU/할당 비용 비교용).
+
+Author: arbitrage-lite project
+Date: 2025-12-16 (D93-0)
+"""
+
+import re
+from fnmatch import fnmatchcase
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+_INSERT_RE = re.compile(r"^\s*INSERT\s+INTO\s+(?:\w+\.)?(\w+)", re.IGNORECASE)
+_UPDATE_RE = re.compile(r"^\s*UPDATE\s+(?:\w+\.)?(\w+)", re.IGNORECASE)
+_COPY_RE = re.compile(r"^\s*COPY\s+(?:\w+\.)?(\w+)\s*\([^)]*\)\s+FROM\s+STDIN", re.IGNORECASE)
+_CSV_FIELD_RE = re.compile(r'"((?:[^"]|"")*)"|([^,\r\n]*)')
+
+
+def parse_copy_csv(text: str) -> List[Tuple[Optional[str], ...]]:
+    """COPY (FORMAT csv) 본문 → row 목록 (따옴표 없는 빈 값 = None, 값은 서버가 받는 텍스트 그대로)"""
+    rows = []
+    row: List[Optional[str]] = []
+    pos = 0
+    while pos < len(text):
+        match = _CSV_FIELD_RE.match(text, pos)
+        quoted, plain = match.groups()
+        row.append(quoted.replace('""', '"') if quoted is not None else (plain or None))
+        pos = match.end()
+        if text.startswith(",", pos):
+            pos += 1
+            continue
+        rows.append(tuple(row))
+        row = []
+        pos += 2 if text.startswith("\r\n", pos) else 1
+    return rows
+
+
+class InMemoryRedis:
+    """redis.Redis 최소 대체 (decode_responses=False 동작)"""
+    
+    def __init__(self):
+        self._data: Dict[bytes, bytes] = {}
+        self.commands = 0
+    
+    @staticmethod
+    def _encode(value: Any) -> bytes:
+        if isinstance(value, bytes):
+            return value
+        if isinstance(value, str):
+            return value.encode("utf-8")
+        if isinstance(value, (int, float)):
+            return repr(value).encode("ascii")
+        raise TypeError(f"Invalid input of type: {type(value).__name__!r}")
+    
+    def ping(self) -> bool:
+        self.commands += 1
+        return True
+    
+    def set(self, name: Any, value: Any, ex: Optional[int] = None) -> bool:
+        self.commands += 1
+        self._data[self._encode(name)] = self._encode(value)
+        return True
+    
+    def get(self, name: Any) -> Optional[bytes]:
+        self.commands += 1
+        return self._data.get(self._encode(name))
+    
+    def exists(self, *names: Any) -> int:
+        self.commands += 1
+        return sum(1 for name in names if self._encode(name) in self._data)
+    
+    def delete(self, *names: Any) -> int:
+        self.commands += 1
+        removed = 0
+        for name in names:
+            if self._data.pop(self._encode(name), None) is not None:
+                removed += 1
+        return removed
+    
+    def scan_iter(self, match: Optional[str] = None, count: Optional[int] = None) -> Iterator[bytes]:
+        self.commands += 1
+        for key in list(self._data):
+            if match is None or fnmatchcase(key.decode("utf-8"), match):
+                yield key
+    
+    def flushdb(self) -> bool:
+        self._data.clear()
+        return True
+    
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class InMemoryCursor:
+    """psycopg2 cursor 최소 대체"""
+    
+    def __init__(self, connection: "InMemoryPostgresConnection"):
+        self._connection = connection
+        self._result: List[Tuple] = []
+        self.closed = False
+    
+    def execute(self, query: str, params: Optional[Sequence[Any]] = None) -> None:
+        if self.closed:
+            raise RuntimeError("cursor already closed")
+        self._result = []
+        match = _INSERT_RE.match(query)
+        if match is None:
+            update = _UPDATE_RE.match(query)
+            if update is not None:
+                self._connection._record("UPDATE", update.group(1), tuple(params or ()))
+            # SELECT 등은 빈 결과 (쓰기 경로 측정용)
+            return
+        row_id = self._connection._insert(match.group(1), tuple(params or ()))
+        if "RETURNING" in query.upper():
+            self._result = [(row_id,)]
+    
+    def executemany(self, query: str, params_seq: Sequence[Sequence[Any]]) -> None:
+        for params in params_seq:
+            self.execute(query, params)
+    
+    def copy_expert(self, sql: str, file: Any) -> None:
+        if self.closed:
+            raise RuntimeError("cursor already closed")
+        match = _COPY_RE.match(sql)
+        if match is None:
+            raise ValueError(f"unsupported COPY statement: {sql}")
+        for row in parse_copy_csv(file.read()):
+            self._connection._record("COPY", match.group(1), row)
+    
+    def fetchone(self) -> Optional[Tuple]:
+        return self._result.pop(0) if self._result else None
+    
+    def fetchall(self) -> List[Tuple]:
+        rows, self._result = self._result, []
+        return rows
+    
+    def close(self) -> None:
+        self.closed = True
+
+
+class InMemoryPostgresConnection:
+    """psycopg2 connection 최소 대체 (테이블별 row 보관)"""
+    
+    def __init__(self):
+        self.tables: Dict[str, List[Tuple]] = {}
+        self.statements: List[Tuple[str, str, Tuple]] = []  # commit된 쓰기 (INSERT/COPY/UPDATE, table, row) 순서
+        self.fail_on: Optional[Tuple[str, Exception]] = None  # (op, 예외): 다음 해당 op 쓰기에서 1회 발생
+        self._pending: List[Tuple[str, str, Tuple]] = []
+        self._next_id = 1
+        self.commits = 0
+        self.rollbacks = 0
+    
+    def cursor(self) -> InMemoryCursor:
+        return InMemoryCursor(self)
+    
+    def _record(self, op: str, table: str, params: Tuple) -> None:
+        if self.fail_on is not None and self.fail_on[0] == op:
+            error, self.fail_on = self.fail_on[1], None
+            raise error
+        self._pending.append((op, table, params))
+    
+    def _insert(self, table: str, params: Tuple) -> int:
+        self._record("INSERT", table, params)
+        row_id = self._next_id
+        self._next_id += 1
+        return row_id
+    
+    def commit(self) -> None:
+        for op, table, params in self._pending:
+            if op != "UPDATE":
+                self.tables.setdefault(table, []).append(params)
+        self.statements.extend(self._pending)
+        self._pending = []
+        self.commits += 1
+    
+    def rollback(self) -> None:
+        self._pending = []
+        self.rollbacks += 1
+    
+    def close(self) -> None:
+        self._pending = []
+    
+    def row_count(self, table: str) -> int:
+        return len(self.tables.get(table, []))
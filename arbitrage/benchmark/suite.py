@@ -0,0 +1,360 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+D93-0: Default Benchmark Suite
+
+핫 경로별 기본 케이스. 모든 입력은 BenchmarkDataset(raw WS frame)에서 결정적으로 파생.
+
+| 케이스                      | 대상                                              | op       |
+|-----------------------------|---------------------------------------------------|----------|
+| detection.on_snapshot       | ArbitrageEngine.on_snapshot                       | snapshot |
+| ws_parse.upbit              | json.loads + UpbitWebSocketAdapter.on_message     | frame    |
+| ws_parse.binance            | json.loads + BinanceWebSocketAdapter.on_message   | frame    |
+| risk.four_tier_evaluate     | FourTierRiskGuard.evaluate (route별)              | route    |
+| fill.simple                 | SimpleFillModel.execute                           | order    |
+| fill.advanced               | AdvancedFillModel.execute                         | order    |
+| state_store.redis_write     | StateStore.save_state_to_redis (InMemoryRedis)    | save     |
+| state_store.snapshot_write  | StateStore.save_snapshot_to_db (InMemoryPostgres) | save     |
+| backtest.run                | ArbitrageBacktester.run                           | snapshot |
+
+대상 모듈은 setup 안에서 import → 선택 의존성이 없으면 해당 케이스만 skipped.
+
+Author: arbitrage-lite project
+Date: 2025-12-16 (D93-0)
+"""
+
+import json
+import random
+from fnmatch import fnmatchcase
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from arbitrage.benchmark.datasets import BenchmarkDataset
+from arbitrage.benchmark.harness import BenchmarkCase
+from arbitrage.benchmark.standins import InMemoryPostgresConnection, InMemoryRedis
+
+RISK_ROUTES_PER_TICK = 4
+STATE_SAVES = 200
+
+
+def _core_snapshots(dataset: BenchmarkDataset) -> List[Any]:
+    from arbitrage.arbitrage_core import OrderBookSnapshot
+    
+    return [
+        OrderBookSnapshot(
+            timestamp=str(q.timestamp_ms),
+            best_bid_a=q.bid_a,
+            best_ask_a=q.ask_a,
+            best_bid_b=q.bid_b,
+            best_ask_b=q.ask_b,
+        )
+        for q in dataset.quotes()
+    ]
+
+
+def _arbitrage_config(dataset: BenchmarkDataset) -> Any:
+    from arbitrage.arbitrage_core import ArbitrageConfig
+    
+    return ArbitrageConfig(
+        min_spread_bps=30.0,
+        taker_fee_a_bps=5.0,
+        taker_fee_b_bps=10.0,
+        slippage_bps=5.0,
+        max_position_usd=1000.0,
+        exchange_a_to_b_rate=dataset.fx_rate,
+    )
+
+
+def _setup_detection(dataset: BenchmarkDataset) -> Callable[[], int]:
+    from arbitrage.arbitrage_core import ArbitrageEngine
+    
+    snapshots = _core_snapshots(dataset)
+    engine = ArbitrageEngine(_arbitrage_config(dataset))
+    
+    def run() -> int:
+        on_snapshot = engine.on_snapshot
+        for snapshot in snapshots:
+            on_snapshot(snapshot)
+        return len(snapshots)
+    return run
+
+
+def _setup_ws_upbit(dataset: BenchmarkDataset) -> Callable[[], int]:
+    from arbitrage.exchanges.upbit_ws_adapter import UpbitWebSocketAdapter
+    
+    adapter = UpbitWebSocketAdapter(symbols=["KRW-BTC"], callback=lambda snapshot: None)
+    frames = dataset.upbit_frames
+    
+    def run() -> int:
+        loads = json.loads
+        on_message = adapter.on_message
+        for raw in frames:
+            on_message(loads(raw))
+        return len(frames)
+    return run
+
+
+def _setup_ws_binance(dataset: BenchmarkDataset) -> Callable[[], int]:
+    from arbitrage.exchanges.binance_ws_adapter import BinanceWebSocketAdapter
+    
+    adapter = BinanceWebSocketAdapter(symbols=["btcusdt"], callback=lambda snapshot: None)
+    frames = dataset.binance_frames
+    
+    def run() -> int:
+        loads = json.loads
+        on_message = adapter.on_message
+        for raw in frames:
+            on_message(loads(raw))
+        return len(frames)
+    return run
+
+
+def risk_ticks(dataset: BenchmarkDataset, routes: int = RISK_ROUTES_PER_TICK) -> List[tuple]:
+    """
+    tick별 리스크 입력 (exchange_states, route_states, symbol_states, global_state).
+    
+    route gross spread는 실제 호가 김프(bps)에서, 나머지 상태는 dataset.seed 기반 난수로 생성
+    (대부분 정상 범위, 일부 임계값 초과).
+    """
+    from arbitrage.domain.arb_route import RouteScore
+    from arbitrage.domain.risk_guard import ExchangeState, GlobalState, RouteState, SymbolState
+    from arbitrage.infrastructure.exchange_health import ExchangeHealthStatus, HealthMetrics
+    
+    rng = random.Random(dataset.seed)
+    statuses = [ExchangeHealthStatus.HEALTHY] * 17 + [
+        ExchangeHealthStatus.DEGRADED,
+        ExchangeHealthStatus.FROZEN,
+        ExchangeHealthStatus.DOWN,
+    ]
+    pairs = [("KRW-BTC", "BTCUSDT"), ("KRW-ETH", "ETHUSDT"), ("KRW-XRP", "XRPUSDT"), ("KRW-SOL", "SOLUSDT")]
+    
+    def rare() -> bool:
+        return rng.random() < 0.05
+    
+    ticks = []
+    for q in dataset.quotes():
+        gross_spread_bps = abs(q.bid_a - q.ask_b * dataset.fx_rate) / q.bid_a * 10_000.0
+        exchange_states = {
+            name: ExchangeState(
+                exchange_name=name,
+                health_status=rng.choice(statuses),
+                health_metrics=HealthMetrics(),
+                rate_limit_remaining_pct=rng.uniform(0.0, 0.3) if rare() else rng.uniform(0.3, 1.0),
+                daily_loss_usd=rng.uniform(10000.0, 20000.0) if rare() else rng.uniform(0.0, 5000.0),
+            )
+            for name in ("UPBIT", "BINANCE")
+        }
+        route_states = [
+            RouteState(
+                symbol_a=symbol_a,
+                symbol_b=symbol_b,
+                route_score=RouteScore(
+                    spread_score=rng.uniform(20.0, 100.0),
+                    health_score=rng.uniform(30.0, 100.0),
+                    fee_score=rng.uniform(30.0, 100.0),
+                    inventory_penalty=rng.uniform(20.0, 100.0),
+                ) if rng.random() < 0.8 else None,
+                gross_spread_bps=gross_spread_bps * rng.uniform(0.5, 1.5),
+                recent_trades=[-1.0 if rng.random() < 0.25 else 1.0 for _ in range(rng.randint(0, 6))],
+            )
+            for symbol_a, symbol_b in (rng.choice(pairs) for _ in range(routes))
+        ]
+        symbol_states = {}
+        for symbol in rng.sample(["BTC", "ETH", "XRP", "SOL"], rng.randint(0, 3)):
+            peak = rng.uniform(0.0, 1000.0)
+            symbol_states[symbol] = SymbolState(
+                symbol=symbol,
+                total_exposure_usd=rng.uniform(0.0, 70000.0) if rare() else rng.uniform(0.0, 30000.0),
+                total_notional_usd=0.0,
+                unrealized_pnl_usd=0.0,
+                intraday_pnl_usd=peak * rng.uniform(0.6, 1.0) if rare() else peak * rng.uniform(0.9, 1.0),
+                intraday_peak_usd=peak,
+                volatility_proxy=rng.uniform(0.1, 0.2) if rare() else rng.uniform(0.0, 0.1),
+            )
+        global_state = GlobalState(
+            total_portfolio_value_usd=100000.0,
+            total_exposure_usd=rng.uniform(100000.0, 120000.0) if rare() else rng.uniform(0.0, 90000.0),
+            total_margin_used_usd=0.0,
+            global_daily_loss_usd=rng.uniform(50000.0, 60000.0) if rare() else rng.uniform(0.0, 20000.0),
+            global_cumulative_loss_usd=0.0,
+            cross_exchange_imbalance_ratio=rng.uniform(-1.0, 1.0) if rare() else rng.uniform(-0.4, 0.4),
+            cross_exchange_exposure_risk=rng.uniform(0.8, 1.0) if rare() else rng.uniform(0.0, 0.7),
+        )
+        ticks.append((exchange_states, route_states, symbol_states, global_state))
+    return ticks
+
+
+def _setup_risk(dataset: BenchmarkDataset) -> Callable[[], int]:
+    from arbitrage.domain.risk_guard import FourTierRiskGuard, FourTierRiskGuardConfig
+    
+    ticks = risk_ticks(dataset)
+    timestamps = [q.timestamp_ms / 1000.0 for q in dataset.quotes()]
+    now = [timestamps[0] if timestamps else 0.0]
+    guard = FourTierRiskGuard(FourTierRiskGuardConfig(), clock=lambda: now[0])
+    
+    def run() -> int:
+        evaluate = guard.evaluate
+        evaluations = 0
+        for timestamp, (exchange_states, route_states, symbol_states, global_state) in zip(timestamps, ticks):
+            now[0] = timestamp
+            for route_state in route_states:
+                evaluate(exchange_states, route_state, symbol_states, global_state)
+            evaluations += len(route_states)
+        return evaluations
+    return run
+
+
+def fill_contexts(dataset: BenchmarkDataset) -> List[Any]:
+    """tick별 주문 2건 (Upbit 매수 @ask, Binance 매도 @bid), 수량은 최우선 잔량의 0.1~2배"""
+    from arbitrage.execution.fill_model import FillContext
+    from arbitrage.types import OrderSide
+    
+    rng = random.Random(dataset.seed + 1)
+    contexts = []
+    for q in dataset.quotes():
+        contexts.append(FillContext(
+            symbol="KRW-BTC",
+            side=OrderSide.BUY,
+            order_quantity=q.ask_size_a * rng.uniform(0.1, 2.0),
+            target_price=q.ask_a,
+            available_volume=q.ask_size_a,
+        ))
+        contexts.append(FillContext(
+            symbol="BTCUSDT",
+            side=OrderSide.SELL,
+            order_quantity=q.bid_size_b * rng.uniform(0.1, 2.0),
+            target_price=q.bid_b,
+            available_volume=q.bid_size_b,
+        ))
+    return contexts
+
+
+def _fill_setup(model_name: str) -> Callable[[BenchmarkDataset], Callable[[], int]]:
+    def setup(dataset: BenchmarkDataset) -> Callable[[], int]:
+        from arbitrage.execution.fill_model import AdvancedFillModel, SimpleFillModel
+        
+        model = SimpleFillModel() if model_name == "simple" else AdvancedFillModel()
+        contexts = fill_contexts(dataset)
+        
+        def run() -> int:
+            execute = model.execute
+            for context in contexts:
+                execute(context)
+            return len(contexts)
+        return run
+    return setup
+
+
+def state_payloads(dataset: BenchmarkDataset, count: int = STATE_SAVES) -> List[Dict[str, Any]]:
+    """paper runner 저장 형태(session/positions/metrics/risk_guard)의 상태 스냅샷"""
+    quotes = dataset.quotes()
+    rng = random.Random(dataset.seed + 2)
+    symbols = ["BTC", "ETH", "XRP", "SOL"]
+    payloads = []
+    for i in range(count):
+        q = quotes[i % len(quotes)]
+        start_time = 1_765_000_000.0
+        active_orders = {
+            f"{symbol}_{i}_{k}": {
+                "trade": {"side": "LONG_A_SHORT_B", "entry_spread_bps": rng.uniform(20.0, 60.0), "notional_usd": 1000.0},
+                "order_a": {"price": q.ask_a, "quantity": q.ask_size_a, "exchange": "upbit"},
+                "order_b": {"price": q.bid_b, "quantity": q.bid_size_b, "exchange": "binance"},
+                "position_open_time": start_time + i,
+            }
+            for k, symbol in enumerate(rng.sample(symbols, rng.randint(0, 3)))
+        }
+        per_symbol = {symbol: rng.uniform(-50.0, 50.0) for symbol in symbols}
+        payloads.append({
+            "session": {
+                "start_time": start_time,
+                "mode": "paper",
+                "paper_campaign_id": "D93-0",
+                "config": {"min_spread_bps": 30.0, "symbols": symbols},
+                "loop_count": i,
+                "status": "running",
+            },
+            "positions": {"active_orders": active_orders},
+            "metrics": {
+                "total_trades_opened": i,
+                "total_trades_closed": max(0, i - len(active_orders)),
+                "total_winning_trades": i // 2,
+                "total_pnl_usd": sum(per_symbol.values()),
+                "max_dd_usd": rng.uniform(0.0, 100.0),
+                "per_symbol_pnl": per_symbol,
+                "per_symbol_trades_opened": {symbol: i for symbol in symbols},
+                "per_symbol_trades_closed": {symbol: i for symbol in symbols},
+                "per_symbol_winning_trades": {symbol: i // 2 for symbol in symbols},
+                "portfolio_initial_capital": 10000.0,
+                "portfolio_equity": 10000.0 + sum(per_symbol.values()),
+            },
+            "risk_guard": {
+                "session_start_time": start_time,
+                "daily_loss_usd": rng.uniform(0.0, 500.0),
+                "per_symbol_loss": per_symbol,
+                "per_symbol_trades_rejected": {symbol: rng.randint(0, 5) for symbol in symbols},
+                "per_symbol_trades_allowed": {symbol: rng.randint(0, 50) for symbol in symbols},
+                "per_symbol_capital_used": {symbol: rng.uniform(0.0, 5000.0) for symbol in symbols},
+                "per_symbol_position_count": {symbol: rng.randint(0, 2) for symbol in symbols},
+            },
+        })
+    return payloads
+
+
+def _setup_redis_write(dataset: BenchmarkDataset) -> Callable[[], int]:
+    from arbitrage.state_store import StateStore
+    
+    store = StateStore(redis_client=InMemoryRedis(), db_conn=None, env="paper")
+    payloads = state_payloads(dataset)
+    
+    def run() -> int:
+        for i, payload in enumerate(payloads):
+            store.save_state_to_redis(f"bench_{i % 4}", payload)
+        return len(payloads)
+    return run
+
+
+def _setup_snapshot_write(dataset: BenchmarkDataset) -> Callable[[], int]:
+    from arbitrage.state_store import StateStore
+    
+    store = StateStore(redis_client=None, db_conn=InMemoryPostgresConnection(), env="paper")
+    payloads = state_payloads(dataset)
+    
+    def run() -> int:
+        for i, payload in enumerate(payloads):
+            store.save_snapshot_to_db(f"bench_{i % 4}", payload)
+        return len(payloads)
+    return run
+
+
+def _setup_backtest(dataset: BenchmarkDataset) -> Callable[[], int]:
+    from arbitrage.arbitrage_backtest import ArbitrageBacktester, BacktestConfig
+    from arbitrage.arbitrage_core import ArbitrageEngine
+    
+    snapshots = _core_snapshots(dataset)
+    backtester = ArbitrageBacktester(ArbitrageEngine(_arbitrage_config(dataset)), BacktestConfig())
+    
+    def run() -> int:
+        backtester.run(snapshots)
+        return len(snapshots)
+    return run
+
+
+def default_cases() -> List[BenchmarkCase]:
+    """기본 케이스 목록 (실행 순서)"""
+    return [
+        BenchmarkCase("detection.on_snapshot", _setup_detection, "ArbitrageEngine.on_snapshot"),
+        BenchmarkCase("ws_parse.upbit", _setup_ws_upbit, "json.loads + UpbitWebSocketAdapter.on_message"),
+        BenchmarkCase("ws_parse.binance", _setup_ws_binance, "json.loads + BinanceWebSocketAdapter.on_message"),
+        BenchmarkCase("risk.four_tier_evaluate", _setup_risk, "FourTierRiskGuard.evaluate per route"),
+        BenchmarkCase("fill.simple", _fill_setup("simple"), "SimpleFillModel.execute"),
+        BenchmarkCase("fill.advanced", _fill_setup("advanced"), "AdvancedFillModel.execute"),
+        BenchmarkCase("state_store.redis_write", _setup_redis_write, "StateStore.save_state_to_redis"),
+        BenchmarkCase("state_store.snapshot_write", _setup_snapshot_write, "StateStore.save_snapshot_to_db"),
+        BenchmarkCase("backtest.run", _setup_backtest, "ArbitrageBacktester.run"),
+    ]
+
+
+def select_cases(cases: Sequence[BenchmarkCase], patterns: Optional[Sequence[str]]) -> List[BenchmarkCase]:
+    """이름 glob 패턴으로 케이스 선택 (예: "ws_parse.*", "fill.*"). 패턴 없으면 전체"""
+    if not patterns:
+        return list(cases)
+    return [case for case in cases if any(fnmatchcase(case.name, pattern) for pattern in patterns)]
@@ -35,6 +35,7 @@ Usage:
 """
 
 import logging
+import threading
 import time
 from dataclasses import dataclass
 from decimal import Decimal, ROUND_HALF_EVEN
@@ -1098,6 +1099,23 @@ class WebSocketFxRateProvider:
 
 # D80-5: FxCache import
 from arbitrage.common.fx_cache import FxCache
+from arbitrage.common.fx_aggregator import FxAggregate, IncrementalFxAggregator
+
+
+@dataclass(frozen=True)
+class FxRateSnapshot:
+    """
+    MultiSourceFxRateProvider 발행 스냅샷 (불변, 참조 교체로 원자적 발행).
+    
+    Attributes:
+        rates: {(base, quote): rate} (발행 후 수정 금지)
+        updated_at: 발행 시각
+        aggregate: 소스 집계 결과 (median/MAD/outliers)
+    """
+    rates: Dict[Tuple[Currency, Currency], Decimal]
+    updated_at: float
+    aggregate: FxAggregate
+
 
 class MultiSourceFxRateProvider:
     """
@@ -1106,14 +1124,15 @@ class MultiSourceFxRateProvider:
     Features:
     - 3소스 WebSocket 집계 (Binance + OKX + Bybit)
     - Outlier detection & removal (median ±5%)
-    - Median aggregation
+    - Median aggregation (IncrementalFxAggregator, 값 변화 시에만 재계산)
+    - 불변 FxRateSnapshot 발행 → get_rate()는 lock 없이 스냅샷 조회
     - HTTP fallback (RealFxRateProvider)
     - Static fallback
     
     Architecture:
         Binance WS ─┐
-        OKX WS     ─┼→ Outlier Filter → Median → FxCache
-        Bybit WS   ─┘
+        OKX WS     ─┼→ IncrementalFxAggregator → FxRateSnapshot + FxCache
+        Bybit WS   ─┘   (outlier filter, median, MAD)
                           ↓ (fallback)
                     RealFxRateProvider (HTTP)
                           ↓ (fallback)
@@ -1129,6 +1148,9 @@ class MultiSourceFxRateProvider:
         bybit_symbol: str = "BTCUSDT",
         cache_ttl_seconds: float = 3.0,
         enable_websocket: bool = True,
+        rate_epsilon: float = 0.0,
+        max_source_age_seconds: Optional[float] = None,
+        staleness_half_life_seconds: Optional[float] = None,
     ):
         """
         Args:
@@ -1137,6 +1159,9 @@ class MultiSourceFxRateProvider:
             bybit_symbol: Bybit symbol (e.g., "BTCUSDT")
             cache_ttl_seconds: FxCache TTL (초)
             enable_websocket: WebSocket 활성화 여부
+            rate_epsilon: 재집계 기준 상대 변화량 (0: 값이 바뀌면 재집계)
+            max_source_age_seconds: 집계에서 제외할 소스 나이 (None: 제외 안 함)
+            staleness_half_life_seconds: 소스 가중치 반감기 (None: 동일 가중)
         """
         # Shared cache
         self.cache = FxCache(ttl_seconds=cache_ttl_seconds)
@@ -1163,6 +1188,18 @@ class MultiSourceFxRateProvider:
             "bybit": 0.0,
         }
         
+        # Incremental aggregation + 발행 스냅샷
+        self.aggregator = IncrementalFxAggregator(
+            tuple(self._source_rates),
+            outlier_threshold_pct=self.OUTLIER_THRESHOLD_PCT,
+            rate_epsilon=rate_epsilon,
+            max_source_age_seconds=max_source_age_seconds,
+            staleness_half_life_seconds=staleness_half_life_seconds,
+        )
+        self._snapshot: Optional[FxRateSnapshot] = None
+        # 여러 WS 스레드의 발행 직렬화 (cache + 스냅샷을 같은 집계로 갱신)
+        self._publish_lock = threading.Lock()
+        
         # Stats
         self._outlier_count_total = 0
         
@@ -1229,9 +1266,10 @@ class MultiSourceFxRateProvider:
         self._source_rates[source] = rate
         self._source_timestamps[source] = timestamp
         
-        logger.debug(
-            f"[MULTI_SOURCE_FX] Source update: {source}={rate}, ts={timestamp}"
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"[MULTI_SOURCE_FX] Source update: {source}={rate}, ts={timestamp}"
+            )
         
         # D80-8: FX-001 Alert (Source down check)
         # Check other sources for staleness (>60s)
@@ -1250,26 +1288,28 @@ class MultiSourceFxRateProvider:
         except Exception as e:
             logger.debug(f"[MULTI_SOURCE_FX] Alert emission failed: {e}")
         
-        # Aggregate and update cache
-        self._aggregate_and_update_cache()
+        # Incremental aggregate (값 변화 없으면 재계산 생략) → 발행
+        now = time.time()
+        aggregate, recomputed = self.aggregator.update(source, rate, now)
+        if aggregate is None:
+            self._aggregate_and_update_cache()
+            return
+        self._publish(aggregate, recomputed, now)
     
     def _aggregate_and_update_cache(self) -> None:
         """
-        멀티소스 집계 및 FxCache 업데이트.
+        멀티소스 전체 재집계 및 발행.
         
         Steps:
-        1. 유효한 소스(rate != None) 수집
+        1. 유효한 소스 수집 (IncrementalFxAggregator 상태)
         2. Outlier 제거 (median ±5%)
         3. Median 계산
-        4. FxCache 업데이트 (USDT→USD, USDT→KRW 체인)
+        4. FxRateSnapshot 발행 + FxCache 업데이트 (USDT→USD, USDT→KRW 체인)
         """
-        # 1. Collect valid rates
-        valid_rates = []
-        for source, rate in self._source_rates.items():
-            if rate is not None:
-                valid_rates.append(rate)
+        now = time.time()
+        aggregate = self.aggregator.recompute(now)
         
-        if len(valid_rates) == 0:
+        if aggregate is None:
             # No valid sources, fallback to HTTP
             logger.debug("[MULTI_SOURCE_FX] No valid sources, skipping aggregation")
             
@@ -1286,31 +1326,90 @@ class MultiSourceFxRateProvider:
             
             return
         
-        # 2. Outlier detection & removal
-        original_count = len(valid_rates)
-        if len(valid_rates) >= 3:
-            valid_rates = self._remove_outliers(valid_rates)
-            outliers_removed = original_count - len(valid_rates)
-            if outliers_removed > 0:
-                self._outlier_count_total += outliers_removed
+        self._publish(aggregate, True, now)
+    
+    def _publish(self, aggregate: FxAggregate, recomputed: bool, timestamp: float) -> None:
+        """
+        집계 결과 발행.
         
-        # 3. Median aggregation
-        median_rate = self._calculate_median(valid_rates)
+        FxCache(기존 reader/HTTP fallback 공유)와 FxRateSnapshot을 갱신.
+        스냅샷은 새 객체로 만든 뒤 참조 한 번으로 교체한다.
         
-        # 4. Update cache
-        timestamp = time.time()
-        self.cache.set(Currency.USDT, Currency.USD, median_rate, updated_at=timestamp)
+        aggregator lock 밖에서 여러 소스 스레드가 동시에 호출하므로 발행은
+        _publish_lock으로 직렬화하고, 이미 발행된 것보다 오래된 집계
+        ((sequence, timestamp) 역전)는 버린다.
+        """
+        median_rate = aggregate.rate
+        with self._publish_lock:
+            current = self._snapshot
+            if current is not None and (
+                (aggregate.sequence, timestamp)
+                < (current.aggregate.sequence, current.updated_at)
+            ):
+                logger.debug(
+                    f"[MULTI_SOURCE_FX] Dropped stale aggregate seq={aggregate.sequence} "
+                    f"(published seq={current.aggregate.sequence})"
+                )
+                return
+            
+            if aggregate.outliers:
+                self._outlier_count_total += len(aggregate.outliers)
+            
+            rates = {(Currency.USDT, Currency.USD): median_rate}
+            self.cache.set(Currency.USDT, Currency.USD, median_rate, updated_at=timestamp)
+            
+            # Chain: USDT→KRW = USDT→USD × USD→KRW
+            usd_krw = self.cache.get(Currency.USD, Currency.KRW)
+            if usd_krw is not None:
+                usdt_krw = median_rate * usd_krw
+                rates[(Currency.USDT, Currency.KRW)] = usdt_krw
+                self.cache.set(Currency.USDT, Currency.KRW, usdt_krw, updated_at=timestamp)
+            
+            self._snapshot = FxRateSnapshot(rates, timestamp, aggregate)
         
-        # Chain: USDT→KRW = USDT→USD × USD→KRW
-        usd_krw = self.cache.get(Currency.USD, Currency.KRW)
-        if usd_krw is not None:
-            usdt_krw = median_rate * usd_krw
-            self.cache.set(Currency.USDT, Currency.KRW, usdt_krw, updated_at=timestamp)
+        if aggregate.outliers and recomputed:
+            self._report_outliers(aggregate)
         
-        logger.debug(
-            f"[MULTI_SOURCE_FX] Aggregated rate: {median_rate} "
-            f"(sources={len(valid_rates)}, outliers_removed={original_count - len(valid_rates)})"
+        if recomputed and logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"[MULTI_SOURCE_FX] Aggregated rate: {median_rate} "
+                f"(sources={aggregate.sources_used}, outliers_removed={len(aggregate.outliers)}, "
+                f"mad={aggregate.mad})"
+            )
+    
+    def _report_outliers(self, aggregate: FxAggregate) -> None:
+        """Outlier 제거 로그 + FX-003 Alert (재집계 시에만)"""
+        median = aggregate.median_all
+        outliers = list(aggregate.outliers)
+        logger.warning(
+            f"[MULTI_SOURCE_FX] Removed outliers: "
+            f"outliers={outliers}, used={aggregate.sources_used}, median={median}"
         )
+        deviation_pct = float(max(abs(r - median) / median for r in outliers))
+        self._emit_median_deviation_alert(median, deviation_pct, len(outliers))
+    
+    def _emit_median_deviation_alert(
+        self,
+        median: Decimal,
+        deviation_pct: float,
+        outliers_removed: int,
+    ) -> None:
+        """D80-8: FX-003 Alert (Median deviation)"""
+        try:
+            from arbitrage.alerting import emit_fx_median_deviation_alert
+            threshold_pct = float(self.OUTLIER_THRESHOLD_PCT) * 100
+            expected_min = float(median * (Decimal("1.0") - self.OUTLIER_THRESHOLD_PCT))
+            expected_max = float(median * (Decimal("1.0") + self.OUTLIER_THRESHOLD_PCT))
+            emit_fx_median_deviation_alert(
+                pair="USDT/USD",
+                median_rate=float(median),
+                expected_min=expected_min,
+                expected_max=expected_max,
+                deviation_percent=deviation_pct * 100,
+                outliers=str(outliers_removed),
+            )
+        except Exception as e:
+            logger.debug(f"[MULTI_SOURCE_FX] Alert emission failed: {e}")
     
     def _remove_outliers(self, rates: List[Decimal]) -> List[Decimal]:
         """
@@ -1350,21 +1449,7 @@ class MultiSourceFxRateProvider:
             )
             
             # D80-8: FX-003 Alert (Median deviation)
-            try:
-                from arbitrage.alerting import emit_fx_median_deviation_alert
-                threshold_pct = float(self.OUTLIER_THRESHOLD_PCT) * 100
-                expected_min = float(median * (Decimal("1.0") - self.OUTLIER_THRESHOLD_PCT))
-                expected_max = float(median * (Decimal("1.0") + self.OUTLIER_THRESHOLD_PCT))
-                emit_fx_median_deviation_alert(
-                    pair="USDT/USD",
-                    median_rate=float(median),
-                    expected_min=expected_min,
-                    expected_max=expected_max,
-                    deviation_percent=deviation_pct * 100,
-                    outliers=str(outliers_removed),
-                )
-            except Exception as e:
-                logger.debug(f"[MULTI_SOURCE_FX] Alert emission failed: {e}")
+            self._emit_median_deviation_alert(median, deviation_pct, outliers_removed)
         
         return filtered
     
@@ -1407,6 +1492,13 @@ class MultiSourceFxRateProvider:
         if base == quote:
             return Decimal("1.0")
         
+        # 0. 발행 스냅샷 (lock 없이 참조 1회 읽기, FxCache TTL과 동일 기준)
+        snapshot = self._snapshot
+        if snapshot is not None:
+            rate = snapshot.rates.get((base, quote))
+            if rate is not None and time.time() - snapshot.updated_at <= self.cache.ttl_seconds:
+                return rate
+        
         # 1. Cache hit
         cached_rate = self.cache.get(base, quote)
         if cached_rate is not None:
@@ -1458,3 +1550,8 @@ class MultiSourceFxRateProvider:
     def get_outlier_count_total(self) -> int:
         """제거된 outlier 누적 개수 조회."""
         return self._outlier_count_total
+    
+    def get_aggregate(self) -> Optional[FxAggregate]:
+        """최신 집계 결과 (median/MAD/outliers) 조회."""
+        snapshot = self._snapshot
+        return snapshot.aggregate if snapshot is not None else None
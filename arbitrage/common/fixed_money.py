@@ -0,0 +1,437 @@
+# -*- coding: utf-8 -*-
+"""
+D80-1: Fixed-point Money (scaled int64)
+
+Risk/PnL hot path용 고정소수점 금액 표현.
+
+Money(Decimal)는 연산마다 통화 검증 + Decimal 객체 할당이 발생한다.
+FixedMoney는 통화별 scale(10^scale 단위)의 정수로 금액을 보관하고,
+경계(Money ↔ FixedMoney)에서만 정확 변환한다.
+
+Features:
+- 통화별 scale (FIXED_SCALES, 최소 단위 + 여유 자릿수)
+- int64 범위 overflow 검사 (OverflowError)
+- Money ↔ FixedMoney 정확 변환 (표현 불가 시 ValueError / None)
+- Decimal 지수(exponent) 추적 → to_money() 결과가 Decimal 경로와 동일 표현
+- NumPy 벡터 연산 (포트폴리오 합산)
+
+Exactness:
+    금액 지수가 -scale 이상이고 |units| < 2^63 이면 유효숫자 19자리 이하.
+    Decimal 기본 context(28자리)에서 Decimal 경로도 반올림 없이 계산되므로
+    두 경로의 결과는 값과 지수까지 동일하다.
+
+Usage:
+    >>> fixed = FixedMoney.from_money(Money(Decimal("10"), Currency.USD))
+    >>> krw = fixed.convert_to(Currency.KRW, Decimal("1420.50"))
+    >>> krw.to_money()
+    Money(Decimal("14205.00"), Currency.KRW)
+"""
+
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy는 requirements 포함
+    np = None
+
+from arbitrage.common.currency import Currency, FxRateProvider, Money
+
+INT64_MIN = -(2 ** 63)
+INT64_MAX = 2 ** 63 - 1
+
+# 통화별 scale: 최소 단위 아래 여유 자릿수 (FX 변환/수수료 분할용) 포함.
+# int64 한도: KRW 약 9.2조, USD 약 922억, BTC 약 920만, ETH 약 920만
+FIXED_SCALES: Dict[Currency, int] = {
+    Currency.KRW: 6,
+    Currency.USD: 8,
+    Currency.USDT: 8,
+    Currency.BTC: 12,
+    Currency.ETH: 12,
+}
+
+_POW10 = [10 ** i for i in range(40)]
+
+
+def _pow10(exponent: int) -> int:
+    """10^exponent (정수, exponent >= 0)"""
+    return _POW10[exponent] if exponent < 40 else 10 ** exponent
+
+
+def _check_range(units: int) -> int:
+    """int64 범위 검사"""
+    if units < INT64_MIN or units > INT64_MAX:
+        raise OverflowError(f"Fixed-point amount out of int64 range: {units}")
+    return units
+
+
+def _split_decimal(value: Decimal) -> Optional[Tuple[int, int]]:
+    """Decimal → (계수, 지수). NaN/Infinity는 None"""
+    if not value.is_finite():
+        return None
+    exponent = value.as_tuple().exponent
+    return int(value.scaleb(-exponent)), exponent
+
+
+# =============================================================================
+# Scalar conversion (hot path용 함수)
+# =============================================================================
+
+def decimal_to_fixed(amount: Decimal, currency: Currency) -> Optional[Tuple[int, int]]:
+    """
+    Decimal 금액 → (units, exponent).
+    
+    지수가 -scale 미만이거나 int64 범위를 벗어나면 None (Decimal 경로 사용).
+    """
+    split = _split_decimal(amount)
+    if split is None:
+        return None
+    coefficient, exponent = split
+    shift = exponent + FIXED_SCALES[currency]
+    if shift < 0:
+        return None
+    units = coefficient * _pow10(shift)
+    if units < INT64_MIN or units > INT64_MAX:
+        return None
+    return units, exponent
+
+
+def fixed_to_decimal(units: int, exponent: int, currency: Currency) -> Decimal:
+    """(units, exponent) → Decimal (지수 exponent 표현)"""
+    shift = exponent + FIXED_SCALES[currency]
+    if shift >= 0:
+        return Decimal(units // _pow10(shift)).scaleb(exponent)
+    return Decimal(units * _pow10(-shift)).scaleb(exponent)
+
+
+def convert_fixed(
+    units: int,
+    exponent: int,
+    source: Currency,
+    target: Currency,
+    rate: Decimal,
+) -> Optional[Tuple[int, int]]:
+    """
+    환율 적용 (units, exponent) → target 통화 (units, exponent).
+    
+    Decimal 경로의 amount * rate와 같은 값/지수. 표현 불가 시 None.
+    """
+    split = _split_decimal(rate)
+    if split is None:
+        return None
+    rate_coefficient, rate_exponent = split
+    new_exponent = exponent + rate_exponent
+    target_shift = new_exponent + FIXED_SCALES[target]
+    if target_shift < 0:
+        return None
+    coefficient = units // _pow10(exponent + FIXED_SCALES[source])
+    converted = coefficient * rate_coefficient * _pow10(target_shift)
+    if converted < INT64_MIN or converted > INT64_MAX:
+        return None
+    return converted, new_exponent
+
+
+# =============================================================================
+# FixedMoney Value Object
+# =============================================================================
+
+@dataclass(frozen=True, eq=False)
+class FixedMoney:
+    """
+    고정소수점 금액 (units = amount * 10^scale).
+    
+    Money와 같은 통화 규칙 (다른 통화 연산/비교 시 ValueError).
+    
+    Attributes:
+        units: scale 단위 정수 금액 (int64 범위)
+        currency: 통화
+        exponent: Decimal 표현 지수 (to_money() 복원용, -scale 이상,
+            units는 10^(exponent + scale)의 배수). None이면 -scale
+    """
+    units: int
+    currency: Currency
+    exponent: Optional[int] = None
+    
+    def __post_init__(self):
+        """exponent 기본값 + int64 범위 검사"""
+        if self.exponent is None:
+            object.__setattr__(self, 'exponent', -FIXED_SCALES[self.currency])
+        _check_range(self.units)
+    
+    def __eq__(self, other: object) -> bool:
+        """값 비교 (Decimal과 같이 지수 무시)"""
+        if not isinstance(other, FixedMoney):
+            return NotImplemented
+        return self.units == other.units and self.currency == other.currency
+    
+    def __hash__(self) -> int:
+        return hash((self.units, self.currency))
+    
+    @property
+    def scale(self) -> int:
+        """통화별 scale"""
+        return FIXED_SCALES[self.currency]
+    
+    @classmethod
+    def from_money(cls, money: Money) -> 'FixedMoney':
+        """
+        Money → FixedMoney (정확 변환).
+        
+        Raises:
+            ValueError: scale로 표현할 수 없는 금액
+        """
+        fixed = decimal_to_fixed(money.amount, money.currency)
+        if fixed is None:
+            raise ValueError(
+                f"Cannot represent {money.amount} {money.currency.value} "
+                f"at scale {FIXED_SCALES[money.currency]}"
+            )
+        return cls(fixed[0], money.currency, fixed[1])
+    
+    @classmethod
+    def try_from_money(cls, money: Money) -> Optional['FixedMoney']:
+        """Money → FixedMoney (표현 불가 시 None)"""
+        fixed = decimal_to_fixed(money.amount, money.currency)
+        if fixed is None:
+            return None
+        return cls(fixed[0], money.currency, fixed[1])
+    
+    def to_money(self) -> Money:
+        """FixedMoney → Money (Decimal 경로와 동일 표현)"""
+        return Money(fixed_to_decimal(self.units, self.exponent, self.currency), self.currency)
+    
+    def _require_same(self, other: 'FixedMoney', verb: str) -> None:
+        """통화 검증"""
+        if not isinstance(other, FixedMoney):
+            raise TypeError(f"Cannot {verb} FixedMoney with {type(other).__name__}")
+        if self.currency != other.currency:
+            raise ValueError(
+                f"Cannot {verb} different currencies: {self.currency.value} vs {other.currency.value}"
+            )
+    
+    def __add__(self, other: 'FixedMoney') -> 'FixedMoney':
+        """덧셈 (같은 통화만, overflow 검사)"""
+        self._require_same(other, "add")
+        return FixedMoney(
+            self.units + other.units,
+            self.currency,
+            min(self.exponent, other.exponent),
+        )
+    
+    def __sub__(self, other: 'FixedMoney') -> 'FixedMoney':
+        """뺄셈 (같은 통화만, overflow 검사)"""
+        self._require_same(other, "subtract")
+        return FixedMoney(
+            self.units - other.units,
+            self.currency,
+            min(self.exponent, other.exponent),
+        )
+    
+    def __mul__(self, scalar: Union[int, float, Decimal]) -> 'FixedMoney':
+        """
+        스칼라 곱셈 (Money와 같이 Decimal(str(scalar)) 기준).
+        
+        Raises:
+            ValueError: 결과가 scale로 표현 불가
+            OverflowError: int64 범위 초과
+        """
+        if isinstance(scalar, (int, float)):
+            scalar = Decimal(str(scalar))
+        converted = convert_fixed(self.units, self.exponent, self.currency, self.currency, scalar)
+        if converted is None:
+            split = _split_decimal(scalar)
+            if split is not None and split[1] + self.exponent + self.scale >= 0:
+                raise OverflowError(f"Fixed-point product out of int64 range: {self} * {scalar}")
+            raise ValueError(f"Cannot represent {self} * {scalar} at scale {self.scale}")
+        return FixedMoney(converted[0], self.currency, converted[1])
+    
+    def __rmul__(self, scalar: Union[int, float, Decimal]) -> 'FixedMoney':
+        """역방향 스칼라 곱셈"""
+        return self.__mul__(scalar)
+    
+    def __neg__(self) -> 'FixedMoney':
+        """부호 반전"""
+        return FixedMoney(-self.units, self.currency, self.exponent)
+    
+    def __abs__(self) -> 'FixedMoney':
+        """절댓값"""
+        return FixedMoney(abs(self.units), self.currency, self.exponent)
+    
+    def __lt__(self, other: 'FixedMoney') -> bool:
+        """Less than"""
+        self._require_same(other, "compare")
+        return self.units < other.units
+    
+    def __le__(self, other: 'FixedMoney') -> bool:
+        """Less than or equal"""
+        self._require_same(other, "compare")
+        return self.units <= other.units
+    
+    def __gt__(self, other: 'FixedMoney') -> bool:
+        """Greater than"""
+        self._require_same(other, "compare")
+        return self.units > other.units
+    
+    def __ge__(self, other: 'FixedMoney') -> bool:
+        """Greater than or equal"""
+        self._require_same(other, "compare")
+        return self.units >= other.units
+    
+    def convert_to(self, target_currency: Currency, rate: Decimal) -> 'FixedMoney':
+        """
+        환율 적용 변환 (rate는 호출자가 FxRateProvider에서 1회 조회).
+        
+        Raises:
+            ValueError: 결과가 target scale로 표현 불가 또는 int64 범위 초과
+        """
+        if self.currency == target_currency:
+            return self
+        converted = convert_fixed(self.units, self.exponent, self.currency, target_currency, rate)
+        if converted is None:
+            raise ValueError(
+                f"Cannot represent {self} * {rate} at {target_currency.value} "
+                f"scale {FIXED_SCALES[target_currency]}"
+            )
+        return FixedMoney(converted[0], target_currency, converted[1])
+    
+    @property
+    def is_zero(self) -> bool:
+        """0인지 확인"""
+        return self.units == 0
+    
+    @property
+    def is_positive(self) -> bool:
+        """양수인지 확인"""
+        return self.units > 0
+    
+    @property
+    def is_negative(self) -> bool:
+        """음수인지 확인"""
+        return self.units < 0
+    
+    def __str__(self) -> str:
+        """Money와 같은 형식"""
+        return str(self.to_money())
+
+
+# =============================================================================
+# Vectorized ops (NumPy, 포트폴리오 합산)
+# =============================================================================
+
+def _require_numpy() -> None:
+    """numpy 미설치 시 ImportError"""
+    if np is None:
+        raise ImportError("numpy is required for vectorized fixed-point ops")
+
+
+def to_units_array(amounts: Iterable[Money], currency: Currency) -> Tuple["np.ndarray", int]:
+    """
+    Money 목록 → (int64 units 배열, 최소 exponent).
+    
+    Raises:
+        ValueError: 통화 불일치 또는 scale 표현 불가
+    """
+    _require_numpy()
+    units: List[int] = []
+    exponent = 0
+    for money in amounts:
+        if money.currency != currency:
+            raise ValueError(
+                f"Cannot stack different currencies: {money.currency.value} vs {currency.value}"
+            )
+        fixed = decimal_to_fixed(money.amount, currency)
+        if fixed is None:
+            raise ValueError(
+                f"Cannot represent {money.amount} {currency.value} at scale {FIXED_SCALES[currency]}"
+            )
+        units.append(fixed[0])
+        if fixed[1] < exponent:
+            exponent = fixed[1]
+    return np.array(units, dtype=np.int64), exponent
+
+
+def sum_units(units: "np.ndarray") -> int:
+    """
+    int64 units 배열 합 (overflow 검사).
+    
+    최대 절댓값 * 길이가 int64 안이면 np.sum, 아니면 Python int 합산 후 범위 검사.
+    
+    Raises:
+        OverflowError: 합계가 int64 범위 초과
+    """
+    _require_numpy()
+    if len(units) == 0:
+        return 0
+    # abs(INT64_MIN)은 int64에서 overflow → 양끝값을 Python int로 비교
+    bound = max(-int(units.min()), int(units.max()))
+    if bound * len(units) <= INT64_MAX:
+        return int(units.sum())
+    return _check_range(sum(units.tolist()))
+
+
+def convert_units_array(
+    units: "np.ndarray",
+    exponent: int,
+    source: Currency,
+    target: Currency,
+    rate: Decimal,
+) -> Optional[Tuple["np.ndarray", int]]:
+    """
+    units 배열 환율 변환 (배열 공통 exponent 기준). 표현 불가/overflow 시 None.
+    
+    exponent는 배열의 최소 지수이므로 모든 원소가 exponent로 표현 가능하다.
+    """
+    _require_numpy()
+    split = _split_decimal(rate)
+    if split is None:
+        return None
+    rate_coefficient, rate_exponent = split
+    new_exponent = exponent + rate_exponent
+    target_shift = new_exponent + FIXED_SCALES[target]
+    if target_shift < 0:
+        return None
+    divisor = _pow10(exponent + FIXED_SCALES[source])
+    multiplier = rate_coefficient * _pow10(target_shift)
+    if len(units) == 0:
+        return units.copy(), new_exponent
+    bound = max(-int(units.min()), int(units.max())) // divisor
+    if bound * abs(multiplier) > INT64_MAX:
+        return None
+    return (units // divisor) * multiplier, new_exponent
+
+
+def sum_money(
+    amounts: Sequence[Money],
+    target: Currency,
+    fx_provider: Optional[FxRateProvider] = None,
+) -> Money:
+    """
+    포트폴리오 합산: sum(m.convert_to(target, fx)) 와 동일 결과.
+    
+    통화별로 묶어 NumPy로 변환/합산, 표현 불가 시 Decimal 경로로 폴백.
+    """
+    groups: Dict[Currency, List[Money]] = {}
+    for money in amounts:
+        groups.setdefault(money.currency, []).append(money)
+    
+    total_units = 0
+    total_exponent = 0  # Decimal 경로 시작값 Money(Decimal("0")) 지수
+    try:
+        for currency, members in groups.items():
+            units, exponent = to_units_array(members, currency)
+            if currency != target:
+                converted = convert_units_array(
+                    units, exponent, currency, target, fx_provider.get_rate(currency, target)
+                )
+                if converted is None:
+                    raise ValueError("inexact conversion")
+                units, exponent = converted
+            total_units = _check_range(total_units + sum_units(units))
+            total_exponent = min(total_exponent, exponent)
+    except (ValueError, OverflowError):
+        total = Money(Decimal("0"), target)
+        for money in amounts:
+            total += money.convert_to(target, fx_provider)
+        return total
+    return Money(fixed_to_decimal(total_units, total_exponent, target), target)
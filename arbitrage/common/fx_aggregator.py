@@ -0,0 +1,286 @@
+# -*- coding: utf-8 -*-
+"""
+D80-5: Incremental Multi-Source FX Aggregator
+
+소스별 최신 환율을 고정 배열(slot)로 유지하고, 정렬 배열을 bisect로 갱신하여
+median / outlier 필터 / MAD를 O(sources)로 계산한다.
+
+Features:
+- 값이 epsilon 이상 바뀐 경우에만 재계산 (아니면 timestamp만 갱신)
+- Outlier 제거 (median ±threshold, 기존 MultiSourceFxRateProvider 규칙과 동일)
+- MAD (median absolute deviation) 동시 산출
+- 소스별 staleness: max_source_age 초과 소스 제외, half-life 가중 median (옵션)
+- 불변 FxAggregate 스냅샷을 참조 교체로 발행 (reader lock 불필요)
+
+Architecture:
+    update(source, rate, now)  ← WS 스레드 (writer lock)
+            ↓
+    slot 배열 + 정렬 배열 (bisect insort/remove)
+            ↓
+    FxAggregate (frozen) → self.snapshot (원자적 참조 교체)
+            ↓
+    reader: aggregator.snapshot (lock 없음)
+"""
+
+import threading
+from bisect import bisect_left, bisect_right, insort
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Dict, List, Optional, Sequence, Tuple
+
+_ONE = Decimal("1.0")
+_TWO = Decimal("2")
+
+
+@dataclass(frozen=True)
+class FxAggregate:
+    """
+    집계 결과 스냅샷 (불변).
+    
+    Attributes:
+        rate: 집계 환율 (outlier 제거 후 median, 가중 시 weighted median)
+        mad: median absolute deviation (rate 기준, outlier 제거 후)
+        median_all: outlier 제거 전 median
+        sources_used: 집계에 포함된 소스 수 (outlier 제외)
+        outliers: 제거된 환율 값
+        computed_at: 재계산 시각 (값 변화 없는 tick은 last_update만 갱신)
+        sequence: 재계산 번호
+    """
+    rate: Decimal
+    mad: Decimal
+    median_all: Decimal
+    sources_used: int
+    outliers: Tuple[Decimal, ...]
+    computed_at: float
+    sequence: int
+
+
+def _median(values: Sequence[Decimal]) -> Decimal:
+    """정렬된 값의 median (짝수 개면 가운데 두 값 평균)"""
+    n = len(values)
+    if n % 2 == 1:
+        return values[n // 2]
+    return (values[n // 2 - 1] + values[n // 2]) / _TWO
+
+
+def _mad(values: Sequence[Decimal], center: Decimal) -> Decimal:
+    """
+    정렬된 값의 MAD.
+    
+    center 양쪽으로 두 포인터를 벌려 가며 편차를 오름차순으로 병합 (O(n)).
+    """
+    n = len(values)
+    if n == 0:
+        return Decimal("0")
+    right = bisect_left(values, center)
+    left = right - 1
+    deviations: List[Decimal] = []
+    while len(deviations) <= n // 2:
+        if right >= n or (left >= 0 and center - values[left] <= values[right] - center):
+            deviations.append(center - values[left])
+            left -= 1
+        else:
+            deviations.append(values[right] - center)
+            right += 1
+    if n % 2 == 1:
+        return deviations[n // 2]
+    return (deviations[n // 2 - 1] + deviations[n // 2]) / _TWO
+
+
+class IncrementalFxAggregator:
+    """
+    증분 멀티소스 환율 집계기.
+    
+    Example:
+        >>> agg = IncrementalFxAggregator(("binance", "okx", "bybit"))
+        >>> _ = agg.update("binance", Decimal("1.000"), now=1.0)
+        >>> _ = agg.update("okx", Decimal("0.999"), now=1.1)
+        >>> agg.snapshot.rate
+        Decimal('0.9995')
+    """
+    
+    def __init__(
+        self,
+        sources: Sequence[str],
+        outlier_threshold_pct: Decimal = Decimal("0.05"),
+        rate_epsilon: float = 0.0,
+        max_source_age_seconds: Optional[float] = None,
+        staleness_half_life_seconds: Optional[float] = None,
+    ):
+        """
+        Args:
+            sources: 소스 이름 목록 (slot 순서)
+            outlier_threshold_pct: outlier 판정 비율 (median ±)
+            rate_epsilon: 재계산 기준 상대 변화량 (0이면 값이 다르면 재계산)
+            max_source_age_seconds: 이 시간보다 오래된 소스는 집계 제외 (None: 제외 안 함)
+            staleness_half_life_seconds: 소스 가중치 반감기 (None: 동일 가중)
+        """
+        self.sources = tuple(sources)
+        self.outlier_threshold_pct = outlier_threshold_pct
+        self.rate_epsilon = rate_epsilon
+        self.max_source_age_seconds = max_source_age_seconds
+        self.staleness_half_life_seconds = staleness_half_life_seconds
+        
+        self._slots: Dict[str, int] = {source: i for i, source in enumerate(self.sources)}
+        self._values: List[Optional[Decimal]] = [None] * len(self.sources)
+        self._timestamps: List[float] = [0.0] * len(self.sources)
+        self._active: List[bool] = [False] * len(self.sources)
+        self._sorted: List[Decimal] = []
+        self._lock = threading.Lock()
+        self._sequence = 0
+        
+        # 발행 스냅샷 (reader는 참조만 읽음) + 마지막 소스 수신 시각
+        self.snapshot: Optional[FxAggregate] = None
+        self.last_update: float = 0.0
+        
+        # Stats
+        self.update_count = 0
+        self.recompute_count = 0
+    
+    def update(self, source: str, rate: Decimal, now: float) -> Tuple[Optional[FxAggregate], bool]:
+        """
+        소스 환율 갱신.
+        
+        Args:
+            source: 소스 이름
+            rate: 환율
+            now: 수신 시각
+        
+        Returns:
+            (발행된 스냅샷, 재계산 여부)
+        """
+        with self._lock:
+            self.update_count += 1
+            self.last_update = now
+            slot = self._slots[source]
+            old = self._values[slot]
+            self._timestamps[slot] = now
+            
+            if old is not None and self._is_same(old, rate):
+                # 값 변화 없음 + staleness 미사용 → 재계산 없이 기존 스냅샷 유지
+                if self.max_source_age_seconds is None and self.staleness_half_life_seconds is None:
+                    return self.snapshot, False
+                changed = False
+            else:
+                if self._active[slot]:
+                    del self._sorted[bisect_left(self._sorted, old)]
+                    insort(self._sorted, rate)
+                self._values[slot] = rate
+                changed = True
+            
+            if self._refresh_active(now):
+                changed = True
+            
+            if changed or self.snapshot is None or self.staleness_half_life_seconds is not None:
+                return self._recompute(now), True
+            return self.snapshot, False
+    
+    def recompute(self, now: float) -> Optional[FxAggregate]:
+        """현재 소스 값으로 강제 재계산 (유효 소스 없으면 None)"""
+        with self._lock:
+            self._refresh_active(now)
+            return self._recompute(now)
+    
+    def _is_same(self, old: Decimal, rate: Decimal) -> bool:
+        """epsilon 이내 변화인지"""
+        if self.rate_epsilon <= 0.0:
+            return old == rate
+        return abs(float(rate) - float(old)) <= abs(float(old)) * self.rate_epsilon
+    
+    def _refresh_active(self, now: float) -> bool:
+        """staleness 기준 집계 포함 여부 갱신 → 멤버십 변경 여부"""
+        max_age = self.max_source_age_seconds
+        membership_changed = False
+        for slot, value in enumerate(self._values):
+            fresh = value is not None and (
+                max_age is None or now - self._timestamps[slot] <= max_age
+            )
+            if fresh != self._active[slot]:
+                self._active[slot] = fresh
+                if fresh:
+                    insort(self._sorted, value)
+                else:
+                    del self._sorted[bisect_left(self._sorted, value)]
+                membership_changed = True
+        return membership_changed
+    
+    def _recompute(self, now: float) -> Optional[FxAggregate]:
+        """median / outlier / MAD 재계산 후 발행"""
+        values = self._sorted
+        if not values:
+            self.snapshot = None
+            return None
+        
+        self.recompute_count += 1
+        self._sequence += 1
+        n = len(values)
+        median_all = _median(values)
+        filtered: Sequence[Decimal] = values
+        outliers: Tuple[Decimal, ...] = ()
+        
+        if n >= 3:
+            low = bisect_left(values, median_all * (_ONE - self.outlier_threshold_pct))
+            high = bisect_right(values, median_all * (_ONE + self.outlier_threshold_pct))
+            # 전부 outlier면 원본 유지
+            if high > low and (low > 0 or high < n):
+                filtered = values[low:high]
+                outliers = tuple(values[:low]) + tuple(values[high:])
+        
+        if self.staleness_half_life_seconds is None:
+            rate = _median(filtered)
+        else:
+            rate = self._weighted_median(filtered, outliers, now)
+        
+        snapshot = FxAggregate(
+            rate=rate,
+            mad=_mad(filtered, rate),
+            median_all=median_all,
+            sources_used=len(filtered),
+            outliers=outliers,
+            computed_at=now,
+            sequence=self._sequence,
+        )
+        self.snapshot = snapshot
+        return snapshot
+    
+    def _weighted_median(
+        self,
+        filtered: Sequence[Decimal],
+        outliers: Tuple[Decimal, ...],
+        now: float,
+    ) -> Decimal:
+        """
+        staleness 가중 median (weight = 0.5^(age / half_life)).
+        
+        누적 가중치가 정확히 절반에서 끊기면 두 값 평균 (동일 가중 시 일반 median과 같음).
+        """
+        half_life = self.staleness_half_life_seconds
+        excluded = list(outliers)
+        weighted: List[Tuple[Decimal, float]] = []
+        for slot, value in enumerate(self._values):
+            if not self._active[slot]:
+                continue
+            if value in excluded:
+                excluded.remove(value)
+                continue
+            age = max(0.0, now - self._timestamps[slot])
+            weighted.append((value, 0.5 ** (age / half_life)))
+        weighted.sort(key=lambda item: item[0])
+        
+        half = sum(weight for _, weight in weighted) / 2.0
+        cumulative = 0.0
+        for i, (value, weight) in enumerate(weighted):
+            cumulative += weight
+            if abs(cumulative - half) <= 1e-12 * half and i + 1 < len(weighted):
+                return (value + weighted[i + 1][0]) / _TWO
+            if cumulative > half:
+                return value
+        return _median(filtered)
+    
+    def get_stats(self) -> Dict[str, int]:
+        """갱신/재계산 횟수"""
+        return {
+            "updates": self.update_count,
+            "recomputes": self.recompute_count,
+            "active_sources": len(self._sorted),
+        }
@@ -108,7 +108,8 @@ class FxCache:
         entry = self._cache.get(key)
         
         if entry is None:
-            logger.debug(f"[FX_CACHE] MISS: {base.value}→{quote.value}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"[FX_CACHE] MISS: {base.value}→{quote.value}")
             return None
         
         # TTL 체크
@@ -122,10 +123,11 @@ class FxCache:
             del self._cache[key]
             return None
         
-        logger.debug(
-            f"[FX_CACHE] HIT: {base.value}→{quote.value} = {entry.rate} "
-            f"(age={age:.1f}s)"
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"[FX_CACHE] HIT: {base.value}→{quote.value} = {entry.rate} "
+                f"(age={age:.1f}s)"
+            )
         return entry.rate
     
     def set(
@@ -157,10 +159,11 @@ class FxCache:
             updated_at=timestamp
         )
         
-        logger.debug(
-            f"[FX_CACHE] SET: {base.value}→{quote.value} = {rate} "
-            f"(updated_at={timestamp:.0f})"
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"[FX_CACHE] SET: {base.value}→{quote.value} = {rate} "
+                f"(updated_at={timestamp:.0f})"
+            )
     
     def get_updated_at(self, base: Currency, quote: Currency) -> Optional[float]:
         """
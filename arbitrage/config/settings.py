@@ -123,7 +123,7 @@ class TopNSelectionConfig:
     - TOPN_SELECTION_MAX_SYMBOLS: TopN 최대 심볼 수 (default: 50)
     - TOPN_ENTRY_EXIT_DATA_SOURCE: Entry/Exit 스프레드 데이터 소스 (mock|real, default: real)
     - TOPN_SELECTION_RATE_LIMIT_ENABLED: Real Selection Rate Limit 활성화 (default: true)
-    - TOPN_SELECTION_BATCH_SIZE: Real Selection 배치 크기 (default: 10)
+    - TOPN_SELECTION_BATCH_SIZE: Real Selection 요청당 마켓 수 (default: 50)
     - TOPN_SELECTION_BATCH_DELAY_SEC: Real Selection 배치 간 지연 (default: 1.5s)
     """
     selection_data_source: str = "mock"  # "mock" | "real"
@@ -133,7 +133,7 @@ class TopNSelectionConfig:
     
     # D82-3: Real Selection용 Rate Limit 옵션
     selection_rate_limit_enabled: bool = True
-    selection_batch_size: int = 10  # 한 번에 처리할 심볼 수
+    selection_batch_size: int = 50  # 다중 마켓 ticker/orderbook 요청 1회당 마켓 수
     selection_batch_delay_sec: float = 1.5  # 배치 간 인터벌 (초)
 
 
@@ -375,7 +375,7 @@ class Settings:
         
         # D82-3: Real Selection Rate Limit 옵션
         topn_selection_rate_limit_enabled = os.getenv("TOPN_SELECTION_RATE_LIMIT_ENABLED", "true").lower() == "true"
-        topn_selection_batch_size = int(os.getenv("TOPN_SELECTION_BATCH_SIZE", "10"))
+        topn_selection_batch_size = int(os.getenv("TOPN_SELECTION_BATCH_SIZE", "50"))
         topn_selection_batch_delay_sec = float(os.getenv("TOPN_SELECTION_BATCH_DELAY_SEC", "1.5"))
         
         # Validation
@@ -392,8 +392,8 @@ class Settings:
             topn_selection_cache_ttl_sec = 600
         
         if topn_selection_batch_size < 1:
-            print(f"Warning: Invalid TOPN_SELECTION_BATCH_SIZE '{topn_selection_batch_size}', defaulting to 10")
-            topn_selection_batch_size = 10
+            print(f"Warning: Invalid TOPN_SELECTION_BATCH_SIZE '{topn_selection_batch_size}', defaulting to 50")
+            topn_selection_batch_size = 50
         
         if topn_selection_batch_delay_sec < 0:
             print(f"Warning: Invalid TOPN_SELECTION_BATCH_DELAY_SEC '{topn_selection_batch_delay_sec}', defaulting to 1.5")
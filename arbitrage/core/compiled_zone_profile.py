@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+D92-8: Compiled Zone Profile
+
+정규화된 심볼별 Zone Profile(dict)을 조회 전용 배열 구조로 컴파일하는 모듈.
+
+Purpose:
+- 심볼 → row 인덱스 1회 매핑, threshold는 연속 float 배열(array('d')) + 심볼별 flat dict
+- Zone 경계는 심볼별 정렬된 lows/highs 튜플 → bisect로 Zone 판정
+  (array('d')는 bisect probe마다 float boxing이 발생해 튜플이 더 빠름)
+- 컴파일 시점에 전체 검증 (검증 실패 시 ValueError, 부분 적용 없음)
+- 불변 객체 → 참조 교체만으로 원자적 hot reload 가능
+
+Zone 판정 규칙:
+- lo <= spread_bps <= hi 인 첫 번째 Zone (CalibrationTable과 동일한 inclusive first-match)
+- 경계는 정렬 + 비중첩(lo_i >= hi_{i-1})이어야 하며, 공유 경계값은 앞 Zone에 속함
+
+Author: arbitrage-lite project
+Date: 2025-12-15 (D92-8)
+"""
+
+import logging
+import math
+from array import array
+from bisect import bisect_left
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+def _to_float(value: Any, what: str) -> float:
+    """숫자 필드 → 유한 float (아니면 ValueError)"""
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise ValueError(f"[ZONE_PROFILE_COMPILE] {what} must be numeric, got {value!r}")
+    result = float(value)
+    if not math.isfinite(result):
+        raise ValueError(f"[ZONE_PROFILE_COMPILE] {what} must be finite, got {value!r}")
+    return result
+
+
+def _compile_boundaries(symbol: str, zone_boundaries: Any) -> Tuple[Tuple[float, float], ...]:
+    """Zone 경계 검증 + (min, max) 튜플로 정규화"""
+    if not isinstance(zone_boundaries, (list, tuple)) or not zone_boundaries:
+        raise ValueError(
+            f"[ZONE_PROFILE_COMPILE] {symbol}: zone_boundaries must be non-empty list, got {zone_boundaries!r}"
+        )
+    
+    boundaries: List[Tuple[float, float]] = []
+    for i, zone in enumerate(zone_boundaries):
+        if not isinstance(zone, (list, tuple)) or len(zone) != 2:
+            raise ValueError(
+                f"[ZONE_PROFILE_COMPILE] {symbol}: zone_boundaries[{i}] must be [min, max], got {zone!r}"
+            )
+        zone_min = _to_float(zone[0], f"{symbol}.zone_boundaries[{i}].min")
+        zone_max = _to_float(zone[1], f"{symbol}.zone_boundaries[{i}].max")
+        if zone_min > zone_max:
+            raise ValueError(
+                f"[ZONE_PROFILE_COMPILE] {symbol}: zone_boundaries[{i}] min > max ({zone_min} > {zone_max})"
+            )
+        if boundaries and zone_min < boundaries[-1][1]:
+            raise ValueError(
+                f"[ZONE_PROFILE_COMPILE] {symbol}: zone_boundaries[{i}] overlaps previous zone "
+                f"({zone_min} < {boundaries[-1][1]})"
+            )
+        boundaries.append((zone_min, zone_max))
+    return tuple(boundaries)
+
+
+def entry_threshold_bps(symbol: str, profile: Dict[str, Any]) -> float:
+    """
+    Zone Profile에서 entry threshold(bps) 계산.
+    
+    D92-4: YAML에 명시된 threshold_bps가 있으면 우선 사용
+    
+    Advisory 모드 (threshold_bps 없을 때):
+    - Zone 가중치가 높은 Zone의 중간값을 threshold로 사용
+    - 예: advisory_z2_focus → Z2(7-12 bps) 중간값 = 9.5 bps
+    
+    Strict 모드:
+    - Zone 경계값 최소값을 threshold로 사용
+    """
+    zone_boundaries = profile["zone_boundaries"]
+    zone_weights = profile["profile_weights"]
+    
+    if "threshold_bps" in profile and profile["threshold_bps"] is not None:
+        threshold_bps = profile["threshold_bps"]
+        logger.info(f"[D92-4] {symbol}: Using explicit threshold_bps={threshold_bps:.2f} from YAML")
+    elif profile["mode"] == "advisory":
+        # 가중치가 가장 높은 Zone의 중간값
+        max_weight_idx = zone_weights.index(max(zone_weights))
+        zone_min, zone_max = zone_boundaries[max_weight_idx]
+        logger.info(f"[D92-2-DEBUG] {symbol}: max_weight_idx={max_weight_idx}, zone=({zone_min}, {zone_max})")
+        threshold_bps = (zone_min + zone_max) / 2.0
+    else:  # strict
+        # 첫 번째 Zone의 최소값
+        threshold_bps = zone_boundaries[0][0]
+    return threshold_bps
+
+
+@dataclass(frozen=True, eq=False)
+class CompiledZoneProfile:
+    """
+    컴파일된 Zone Profile (불변, 조회 전용).
+    
+    Attributes:
+        symbols: 심볼 목록 (row 순서)
+        index: 심볼 → row
+        thresholds: row별 entry threshold (decimal, 연속 float 배열)
+        threshold_map: 심볼 → entry threshold (decimal)
+        zone_lows: row별 Zone 하한 (정렬)
+        zone_highs: row별 Zone 상한 (정렬)
+        zone_tables: 심볼 → (zone_lows, zone_highs)
+        boundaries: row별 [(min, max), ...]
+        symbol_profiles: 컴파일 입력 (정규화된 심볼별 설정)
+        version: 컴파일 번호 (reload마다 증가)
+        source_path: 원본 YAML 경로 (없으면 None)
+        source_mtime: 원본 YAML mtime (없으면 None)
+    """
+    symbols: Tuple[str, ...]
+    index: Dict[str, int]
+    thresholds: array
+    threshold_map: Dict[str, float]
+    zone_lows: Tuple[Tuple[float, ...], ...]
+    zone_highs: Tuple[Tuple[float, ...], ...]
+    zone_tables: Dict[str, Tuple[Tuple[float, ...], Tuple[float, ...]]]
+    boundaries: Tuple[Tuple[Tuple[float, float], ...], ...]
+    symbol_profiles: Dict[str, Dict[str, Any]]
+    version: int = 0
+    source_path: Optional[str] = None
+    source_mtime: Optional[float] = None
+    
+    def row(self, symbol: str) -> int:
+        """심볼 row (없으면 -1)"""
+        return self.index.get(symbol, -1)
+    
+    def threshold(self, symbol: str) -> float:
+        """심볼별 entry threshold (decimal). 없으면 KeyError"""
+        return self.threshold_map[symbol]
+    
+    def zone_index(self, symbol: str, spread_bps: float) -> int:
+        """
+        spread_bps가 속한 Zone 인덱스.
+        
+        Returns:
+            0-based Zone 인덱스 (심볼 없음/범위 밖/gap이면 -1)
+        """
+        table = self.zone_tables.get(symbol)
+        if table is None:
+            return -1
+        lows, highs = table
+        i = bisect_left(highs, spread_bps)
+        if i < len(highs) and lows[i] <= spread_bps:
+            return i
+        return -1
+
+
+def compile_zone_profiles(
+    symbol_profiles: Dict[str, Dict[str, Any]],
+    version: int = 0,
+    source_path: Optional[str] = None,
+    source_mtime: Optional[float] = None,
+) -> CompiledZoneProfile:
+    """
+    정규화된 심볼별 Zone Profile → CompiledZoneProfile.
+    
+    Args:
+        symbol_profiles: ZoneProfileApplier 입력과 동일한 구조
+            {"BTC": {"profile_name", "profile_weights", "zone_boundaries", "mode", "threshold_bps"?}, ...}
+        version: 컴파일 번호
+        source_path: 원본 YAML 경로
+        source_mtime: 원본 YAML mtime
+    
+    Returns:
+        CompiledZoneProfile
+    
+    Raises:
+        ValueError: 검증 실패 (어떤 심볼/필드인지 메시지에 포함)
+    """
+    if not isinstance(symbol_profiles, dict):
+        raise ValueError(f"[ZONE_PROFILE_COMPILE] symbol_profiles must be dict, got {type(symbol_profiles)}")
+    
+    symbols: List[str] = []
+    thresholds = array("d")
+    zone_lows: List[Tuple[float, ...]] = []
+    zone_highs: List[Tuple[float, ...]] = []
+    all_boundaries: List[Tuple[Tuple[float, float], ...]] = []
+    
+    for symbol, profile in symbol_profiles.items():
+        if not isinstance(profile, dict):
+            raise ValueError(f"[ZONE_PROFILE_COMPILE] {symbol}: profile must be dict, got {type(profile)}")
+        missing = [f for f in ("profile_name", "profile_weights", "zone_boundaries", "mode") if f not in profile]
+        if missing:
+            raise ValueError(f"[ZONE_PROFILE_COMPILE] {symbol}: missing fields {missing}")
+        
+        boundaries = _compile_boundaries(symbol, profile["zone_boundaries"])
+        
+        weights = profile["profile_weights"]
+        if not isinstance(weights, (list, tuple)) or not weights:
+            raise ValueError(f"[ZONE_PROFILE_COMPILE] {symbol}: profile_weights must be non-empty list, got {weights!r}")
+        for i, weight in enumerate(weights):
+            if _to_float(weight, f"{symbol}.profile_weights[{i}]") < 0:
+                raise ValueError(f"[ZONE_PROFILE_COMPILE] {symbol}: profile_weights[{i}] must be >= 0, got {weight}")
+        
+        try:
+            threshold_bps = entry_threshold_bps(symbol, profile)
+        except (IndexError, TypeError, ValueError) as e:
+            raise ValueError(f"[ZONE_PROFILE_COMPILE] {symbol}: cannot derive entry threshold: {e}") from e
+        threshold_bps = _to_float(threshold_bps, f"{symbol}.threshold_bps")
+        if threshold_bps < 0:
+            raise ValueError(f"[ZONE_PROFILE_COMPILE] {symbol}: threshold_bps must be >= 0, got {threshold_bps}")
+        
+        symbols.append(symbol)
+        # BPS → decimal (10 bps = 0.001 = 0.1%)
+        thresholds.append(threshold_bps / 10000.0)
+        zone_lows.append(tuple(zone_min for zone_min, _ in boundaries))
+        zone_highs.append(tuple(zone_max for _, zone_max in boundaries))
+        all_boundaries.append(boundaries)
+    
+    return CompiledZoneProfile(
+        symbols=tuple(symbols),
+        index={symbol: row for row, symbol in enumerate(symbols)},
+        thresholds=thresholds,
+        threshold_map=dict(zip(symbols, thresholds)),
+        zone_lows=tuple(zone_lows),
+        zone_highs=tuple(zone_highs),
+        zone_tables={symbol: (zone_lows[row], zone_highs[row]) for row, symbol in enumerate(symbols)},
+        boundaries=tuple(all_boundaries),
+        symbol_profiles=symbol_profiles,
+        version=version,
+        source_path=source_path,
+        source_mtime=source_mtime,
+    )
+
@@ -16,8 +16,14 @@ Date: 2025-12-12 (D92-1-FIX)
 
 import json
 import logging
+import os
+import threading
+import time
+from dataclasses import replace
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
+
+from arbitrage.core.compiled_zone_profile import CompiledZoneProfile, compile_zone_profiles
 
 logger = logging.getLogger(__name__)
 
@@ -31,7 +37,7 @@ class ZoneProfileApplier:
     - 심볼별 entry threshold, zone boundaries를 runtime에 override
     """
     
-    def __init__(self, symbol_profiles: Dict[str, Dict[str, Any]]):
+    def __init__(self, symbol_profiles: Dict[str, Dict[str, Any]], reload_check_interval_seconds: float = 5.0):
         """
         Args:
             symbol_profiles: 심볼별 Zone Profile 설정
@@ -44,17 +50,29 @@ class ZoneProfileApplier:
                     },
                     ...
                 }
-        """
-        self.symbol_profiles = symbol_profiles
-        self._symbol_thresholds: Dict[str, float] = {}
-        self._symbol_zone_boundaries: Dict[str, List[tuple]] = {}
-        
-        # 초기화 시 threshold 계산
-        self._compute_thresholds()
+            reload_check_interval_seconds: maybe_reload()의 파일 stat 최소 간격 (D92-8)
         
+        Raises:
+            ValueError: Zone Profile 검증 실패
+        """
+        # D92-8: 컴파일된 조회 테이블 (reload 시 참조 교체)
+        self._compiled: CompiledZoneProfile = compile_zone_profiles(symbol_profiles)
+        self._yaml_path: Optional[str] = None
+        self._fallback_threshold_count = 0
+        self._reload_lock = threading.Lock()
+        self.reload_check_interval_seconds = reload_check_interval_seconds
+        self._next_reload_check = 0.0
+        self.reload_count = 0
+        self.reload_failures = 0
+        
+        self._log_applied(self._compiled)
+    
+    @staticmethod
+    def _log_applied(compiled: CompiledZoneProfile) -> None:
+        """심볼별 적용 Profile 로깅"""
         logger.info("=" * 80)
-        logger.info("[ZONE_PROFILE_APPLIER] Initialized with %d symbols", len(symbol_profiles))
-        for symbol, profile in symbol_profiles.items():
+        logger.info("[ZONE_PROFILE_APPLIER] Initialized with %d symbols", len(compiled.symbols))
+        for symbol, profile in compiled.symbol_profiles.items():
             logger.info(
                 "[ZONE_PROFILE_APPLIED] %s → %s (Z1=%.1f%%, Z2=%.1f%%, Z3=%.1f%%, Z4=%.1f%%, threshold=%.5f)",
                 symbol,
@@ -63,46 +81,30 @@ class ZoneProfileApplier:
                 profile["profile_weights"][1] * 10,
                 profile["profile_weights"][2] * 10,
                 profile["profile_weights"][3] * 10,
-                self._symbol_thresholds.get(symbol, 0.0),
+                compiled.threshold(symbol),
             )
         logger.info("=" * 80)
     
-    def _compute_thresholds(self) -> None:
-        """
-        Zone Profile에서 entry threshold를 계산.
-        
-        D92-4: YAML에 명시된 threshold_bps가 있으면 우선 사용
-        
-        Advisory 모드 (threshold_bps 없을 때):
-        - Zone 가중치가 높은 Zone의 중간값을 threshold로 사용
-        - 예: advisory_z2_focus → Z2(7-12 bps) 중간값 = 9.5 bps
-        
-        Strict 모드:
-        - Zone 경계값 최소값을 threshold로 사용
-        """
-        for symbol, profile in self.symbol_profiles.items():
-            zone_boundaries = profile["zone_boundaries"]
-            zone_weights = profile["profile_weights"]
-            mode = profile["mode"]
-            
-            # D92-4: YAML에 threshold_bps가 명시되어 있으면 우선 사용
-            if "threshold_bps" in profile and profile["threshold_bps"] is not None:
-                threshold_bps = profile["threshold_bps"]
-                logger.info(f"[D92-4] {symbol}: Using explicit threshold_bps={threshold_bps:.2f} from YAML")
-            elif mode == "advisory":
-                # 가중치가 가장 높은 Zone 찾기
-                max_weight_idx = zone_weights.index(max(zone_weights))
-                zone_min, zone_max = zone_boundaries[max_weight_idx]
-                logger.info(f"[D92-2-DEBUG] {symbol}: max_weight_idx={max_weight_idx}, zone=({zone_min}, {zone_max})")
-                # Zone 중간값을 threshold로 사용
-                threshold_bps = (zone_min + zone_max) / 2.0
-            else:  # strict
-                # 첫 번째 Zone의 최소값을 threshold로 사용
-                threshold_bps = zone_boundaries[0][0]
-            
-            # BPS를 decimal로 변환 (10 bps = 0.001 = 0.1%)
-            self._symbol_thresholds[symbol] = threshold_bps / 10000.0
-            self._symbol_zone_boundaries[symbol] = zone_boundaries
+    @property
+    def compiled(self) -> CompiledZoneProfile:
+        """현재 컴파일된 Zone Profile (조회 시점 스냅샷)"""
+        return self._compiled
+    
+    @property
+    def symbol_profiles(self) -> Dict[str, Dict[str, Any]]:
+        """정규화된 심볼별 Zone Profile 설정"""
+        return self._compiled.symbol_profiles
+    
+    @property
+    def _symbol_thresholds(self) -> Dict[str, float]:
+        """심볼별 entry threshold (decimal)"""
+        return dict(self._compiled.threshold_map)
+    
+    @property
+    def _symbol_zone_boundaries(self) -> Dict[str, List[tuple]]:
+        """심볼별 zone boundaries"""
+        compiled = self._compiled
+        return {symbol: list(compiled.boundaries[row]) for row, symbol in enumerate(compiled.symbols)}
     
     def get_entry_threshold(self, symbol: str) -> float:
         """
@@ -114,12 +116,13 @@ class ZoneProfileApplier:
         Returns:
             Entry threshold (decimal, 예: 0.00095 = 9.5 bps)
         """
-        if symbol not in self._symbol_thresholds:
+        try:
+            return self._compiled.threshold_map[symbol]
+        except KeyError:
             raise ValueError(
                 f"[ZONE_PROFILE_APPLIER] No Zone Profile configured for symbol: {symbol}. "
-                f"Available symbols: {list(self._symbol_thresholds.keys())}"
-            )
-        return self._symbol_thresholds[symbol]
+                f"Available symbols: {list(self._compiled.symbols)}"
+            ) from None
     
     def get_zone_boundaries(self, symbol: str) -> List[tuple]:
         """
@@ -131,11 +134,26 @@ class ZoneProfileApplier:
         Returns:
             Zone boundaries [(min, max), ...]
         """
-        if symbol not in self._symbol_zone_boundaries:
+        compiled = self._compiled
+        row = compiled.index.get(symbol, -1)
+        if row < 0:
             raise ValueError(
                 f"[ZONE_PROFILE_APPLIER] No Zone boundaries for symbol: {symbol}"
             )
-        return self._symbol_zone_boundaries[symbol]
+        return list(compiled.boundaries[row])
+    
+    def get_zone_index(self, symbol: str, spread_bps: float) -> int:
+        """
+        D92-8: spread_bps가 속한 Zone 인덱스 (bisect).
+        
+        Args:
+            symbol: 심볼 (예: "BTC")
+            spread_bps: 스프레드 (bps)
+        
+        Returns:
+            0-based Zone 인덱스 (심볼 없음/범위 밖이면 -1)
+        """
+        return self._compiled.zone_index(symbol, spread_bps)
     
     def has_profile(self, symbol: str) -> bool:
         """
@@ -147,7 +165,7 @@ class ZoneProfileApplier:
         Returns:
             True if profile exists
         """
-        return symbol in self.symbol_profiles
+        return symbol in self._compiled.index
     
     @classmethod
     def from_json(cls, json_str: str) -> "ZoneProfileApplier":
@@ -188,12 +206,46 @@ class ZoneProfileApplier:
         Returns:
             ZoneProfileApplier 인스턴스
         
+        Raises:
+            FileNotFoundError: YAML 파일 없음
+            ValueError: 파싱/검증 실패
+        """
+        yaml_mtime = cls._stat_mtime(yaml_path)
+        symbol_profiles, fallback_threshold_count = cls._load_yaml_profiles(yaml_path)
+        
+        # 인스턴스 생성
+        instance = cls(symbol_profiles=symbol_profiles)
+        
+        # D92-7-4: 메타데이터 저장
+        instance._yaml_path = yaml_path
+        instance._fallback_threshold_count = fallback_threshold_count
+        instance._compiled = replace(instance._compiled, source_path=yaml_path, source_mtime=yaml_mtime)
+        
+        logger.info(f"[D92-7-4] Zone Profile loaded: {len(symbol_profiles)} symbols, {fallback_threshold_count} fallback thresholds")
+        
+        return instance
+    
+    @staticmethod
+    def _stat_mtime(yaml_path: str) -> Optional[float]:
+        """YAML mtime (파일 없으면 None)"""
+        try:
+            return os.stat(yaml_path).st_mtime
+        except OSError:
+            return None
+    
+    @staticmethod
+    def _load_yaml_profiles(yaml_path: str) -> Tuple[Dict[str, Dict[str, Any]], int]:
+        """
+        YAML 파싱 + 스키마 정규화 (from_file / reload 공용).
+        
+        Returns:
+            (symbol_profiles, fallback_threshold_count)
+        
         Raises:
             FileNotFoundError: YAML 파일 없음
             ValueError: 파싱/검증 실패
         """
         import yaml
-        from pathlib import Path
         
         yaml_path_obj = Path(yaml_path)
         if not yaml_path_obj.exists():
@@ -286,13 +338,67 @@ class ZoneProfileApplier:
         if not symbol_profiles:
             raise ValueError(f"[D92-7-4] No symbols loaded from {yaml_path}")
         
-        # 인스턴스 생성
-        instance = cls(symbol_profiles=symbol_profiles)
+        return symbol_profiles, fallback_threshold_count
+    
+    def reload(self) -> bool:
+        """
+        D92-8: YAML 재로드 → 검증/컴파일 성공 시에만 원자적 교체.
         
-        # D92-7-4: 메타데이터 저장
-        instance._yaml_path = yaml_path
-        instance._fallback_threshold_count = fallback_threshold_count
+        실패 시 기존 Profile을 그대로 유지한다 (runner 재시작 불필요).
         
-        logger.info(f"[D92-7-4] Zone Profile loaded: {len(symbol_profiles)} symbols, {fallback_threshold_count} fallback thresholds")
+        Returns:
+            True if 교체됨
+        """
+        yaml_path = self._yaml_path
+        if yaml_path is None:
+            return False
+        
+        with self._reload_lock:
+            yaml_mtime = self._stat_mtime(yaml_path)
+            try:
+                symbol_profiles, fallback_threshold_count = self._load_yaml_profiles(yaml_path)
+                compiled = compile_zone_profiles(
+                    symbol_profiles,
+                    version=self._compiled.version + 1,
+                    source_path=yaml_path,
+                    source_mtime=yaml_mtime,
+                )
+                logger.info(
+                    f"[ZONE_PROFILE_RELOAD] {yaml_path} → version {compiled.version} ({len(compiled.symbols)} symbols)"
+                )
+                self._log_applied(compiled)
+            except (OSError, ValueError, IndexError) as e:
+                self.reload_failures += 1
+                # 같은 파일 재시도 방지 (다음 변경 시 재시도)
+                self._compiled = replace(self._compiled, source_mtime=yaml_mtime)
+                logger.error(f"[ZONE_PROFILE_RELOAD] Rejected {yaml_path}, keeping version {self._compiled.version}: {e}")
+                return False
+            
+            self._fallback_threshold_count = fallback_threshold_count
+            self._compiled = compiled
+            self.reload_count += 1
+        return True
+    
+    def maybe_reload(self, now: Optional[float] = None) -> bool:
+        """
+        D92-8: 파일 mtime 변경 시 reload (stat은 reload_check_interval_seconds마다 1회).
         
-        return instance
+        Runner 루프에서 iteration마다 호출해도 된다.
+        
+        Args:
+            now: 현재 시각 (None이면 time.monotonic())
+        
+        Returns:
+            True if 교체됨
+        """
+        if self._yaml_path is None:
+            return False
+        if now is None:
+            now = time.monotonic()
+        if now < self._next_reload_check:
+            return False
+        self._next_reload_check = now + self.reload_check_interval_seconds
+        
+        if self._stat_mtime(self._yaml_path) == self._compiled.source_mtime:
+            return False
+        return self.reload()
@@ -10,28 +10,37 @@ Features:
 - Rollback logic
 - Health/Secrets/RiskGuard validation
 - Position state machine integration (OPEN → CLOSING → CLOSED)
+- Concurrent two-leg submission (shared deadline, leg latency / skew metrics)
 
 Architecture:
     CrossExchangeDecision (Paper)
             ↓
     CrossExchangeExecutor (Real Orders)
             ↓
-    ├─> Upbit order
-    ├─> Binance order
+    ├─> Upbit order   ┐ 동시 제출 (공유 deadline)
+    ├─> Binance order ┘
     ├─> Fill monitoring
-    └─> Partial fill handling / Rollback
+    └─> Partial fill handling / Hedge / Rollback
 """
 
 import logging
+import threading
 import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from dataclasses import replace
 from decimal import Decimal
-from typing import Optional, Dict, Any, Literal, TYPE_CHECKING
+from functools import partial
+from typing import Optional, Dict, Any, Literal, Tuple, TYPE_CHECKING
 from dataclasses import dataclass, asdict, field
 
+import numpy as np
+
 if TYPE_CHECKING:
     from arbitrage.execution.fill_model_integration import FillModelIntegration
 
-from .integration import CrossExchangeDecision, CrossExchangeAction
+from .integration import CrossExchangeIntegration, CrossExchangeDecision, CrossExchangeAction
 from .position_manager import CrossExchangePositionManager
 from .fx_converter import FXConverter
 from .risk_guard import CrossExchangeRiskGuard, CrossRiskDecision
@@ -48,11 +57,14 @@ class LegExecutionResult:
     """
     exchange: Literal["upbit", "binance"]
     order_id: Optional[str]
-    status: Literal["accepted", "partially_filled", "filled", "canceled", "failed"]
+    status: Literal["accepted", "partially_filled", "filled", "canceled", "failed", "pending"]
     filled_qty: float
     requested_qty: float
     avg_price: Optional[float]
     error: Optional[str] = None
+    side: Optional[OrderSide] = None
+    latency_ms: Optional[float] = None  # 제출 → 응답 (ms)
+    completed_at: Optional[float] = None  # 응답 시각 (perf_counter)
     
     def is_filled(self) -> bool:
         """완전 체결 여부"""
@@ -61,6 +73,10 @@ class LegExecutionResult:
     def is_partial(self) -> bool:
         """부분 체결 여부"""
         return self.status == "partially_filled"
+    
+    def is_pending(self) -> bool:
+        """deadline 내 응답 없음 (주문이 거래소에 살아 있을 수 있음, 체결 수량 미확정)"""
+        return self.status == "pending"
 
 
 @dataclass
@@ -73,11 +89,14 @@ class CrossExecutionResult:
     decision: CrossExchangeDecision
     upbit: LegExecutionResult
     binance: LegExecutionResult
-    status: Literal["success", "partial_hedged", "rolled_back", "failed", "blocked"]
+    # hedge_pending: deadline 내 응답 없는 레그가 있어 헷지 주문 없이 반환 (레그 도착 시 정산)
+    status: Literal["success", "partial_hedged", "hedge_pending", "rolled_back", "failed", "blocked"]
     pnl: Optional[Money] = None  # D80-2: Money 기반 PnL
     pnl_krw: Optional[float] = None  # DEPRECATED: backward compat
     note: Optional[str] = None
     execution_time_ms: Optional[float] = None
+    leg_skew_ms: Optional[float] = None  # 양 레그 체결 응답 시각 차이
+    hedge: Optional[LegExecutionResult] = None  # 부분 체결 보상 주문
     
     def is_success(self) -> bool:
         """성공 여부"""
@@ -114,6 +133,9 @@ class CrossExchangeExecutor:
     - Rollback logic
     - Health/Secrets/RiskGuard validation
     
+    두 레그는 스레드 풀에서 동시에 제출되고 공유 deadline까지 대기한다.
+    (거래소 어댑터는 blocking REST 클라이언트)
+    
     Example:
         executor = CrossExchangeExecutor(
             upbit_client=upbit_client,
@@ -135,44 +157,71 @@ class CrossExchangeExecutor:
     # Default order sizes (나중에 설정으로 변경 가능)
     DEFAULT_NOTIONAL_KRW = 100_000_000  # 100M KRW
     FILL_WAIT_TIMEOUT = 5.0  # 5 seconds
+    LEG_STATS_WINDOW = 1024  # 레그 지연/skew 샘플 수
+    OPEN_LEG_STATUSES = ("accepted", "partially_filled")
+    EXPOSURE_EPSILON = 0.0001
     
     def __init__(
         self,
-        upbit_exchange: BaseExchange,
-        binance_exchange: BaseExchange,
+        upbit_client: BaseExchange,
+        binance_client: BaseExchange,
         position_manager: CrossExchangePositionManager,
         fx_converter: FXConverter,
+        health_monitor: Optional[Any] = None,  # ExchangeHealthMonitor
+        settings: Optional[Any] = None,  # Settings (secrets)
         risk_guard: Optional[CrossExchangeRiskGuard] = None,
+        metrics_collector: Optional[Any] = None,  # CrossExchangeMetrics (D79-6)
+        alert_manager: Optional[Any] = None,
         secrets_checker: Optional[Any] = None,  # SecretsChecker
         dry_run: bool = False,
         fill_model_integration: Optional["FillModelIntegration"] = None,
         fx_provider: Optional[FxRateProvider] = None,  # D80-2
         base_currency: Currency = Currency.KRW,  # D80-2
+        leg_deadline_sec: float = FILL_WAIT_TIMEOUT,
+        concurrent_legs: bool = True,
+        auto_hedge: bool = False,
     ):
         """
         Initialize CrossExchangeExecutor
         
         Args:
-            upbit_exchange: Upbit exchange adapter (BaseExchange)
-            binance_exchange: Binance exchange adapter (BaseExchange)
+            upbit_client: Upbit exchange adapter (BaseExchange)
+            binance_client: Binance exchange adapter (BaseExchange)
             position_manager: CrossExchangePositionManager
             fx_converter: FXConverter
+            health_monitor: Exchange health monitor (optional)
+            settings: Secrets 설정 (optional)
             risk_guard: CrossExchangeRiskGuard (optional, D79-5)
+            metrics_collector: CrossExchangeMetrics (optional, D79-6)
+            alert_manager: AlertManager (optional)
             secrets_checker: SecretsChecker (optional)
             dry_run: Dry run mode (optional)
             fill_model_integration: FillModelIntegration (optional)
             fx_provider: FxRateProvider (optional, D80-2)
             base_currency: 기본 통화 (D80-2)
+            leg_deadline_sec: 양 레그 공유 응답 deadline (초)
+            concurrent_legs: False면 Upbit → Binance 순차 제출
+            auto_hedge: True면 부분 체결 노출을 보상 주문으로 즉시 헷지
         """
-        self.upbit_exchange = upbit_exchange
-        self.binance_exchange = binance_exchange
+        self.upbit_client = upbit_client
+        self.binance_client = binance_client
         self.position_manager = position_manager
         self.fx_converter = fx_converter
+        self.health_monitor = health_monitor
+        self.settings = settings
         self.risk_guard = risk_guard
+        self.metrics_collector = metrics_collector
+        self.alert_manager = alert_manager
         self.secrets_checker = secrets_checker
         self.dry_run = dry_run
         self.fill_model_integration = fill_model_integration
         
+        # 동시 레그 제출
+        self.leg_deadline_sec = leg_deadline_sec
+        self.concurrent_legs = concurrent_legs
+        self.auto_hedge = auto_hedge
+        self._leg_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="cross-leg")
+        
         # D80-2/D80-3: Multi-Currency 지원
         if fx_provider is None:
             # D80-3: RealFxRateProvider 기본 사용 (fallback to static)
@@ -198,7 +247,15 @@ class CrossExchangeExecutor:
         self.successful_executions = 0
         self.failed_executions = 0
         self.partial_hedged_executions = 0
+        self.hedge_pending_executions = 0
         self.rolled_back_executions = 0
+        self.hedge_orders = 0
+        self.late_legs = 0
+        self._leg_latency_ms: Dict[str, deque] = {
+            "upbit": deque(maxlen=self.LEG_STATS_WINDOW),
+            "binance": deque(maxlen=self.LEG_STATS_WINDOW),
+        }
+        self._leg_skew_ms: deque = deque(maxlen=self.LEG_STATS_WINDOW)
         
         logger.info(
             "[CROSS_EXECUTOR] Initialized (metrics=%s, base_currency=%s)",
@@ -269,9 +326,14 @@ class CrossExchangeExecutor:
                 self.successful_executions += 1
             elif result.status in ["partial_hedged", "rolled_back"]:
                 self.partial_hedged_executions += 1
+            elif result.status == "hedge_pending":
+                self.hedge_pending_executions += 1
             else:
                 self.failed_executions += 1
             
+            # 레그 지연 / skew 기록
+            self._record_leg_stats(result)
+            
             # Record metrics to CrossExchangeMetrics (D79-6)
             self._record_execution_metrics(result)
             
@@ -449,20 +511,8 @@ class CrossExchangeExecutor:
             upbit_side = OrderSide.BUY
             binance_side = OrderSide.SELL
         
-        # Place orders
-        upbit_result = self._place_upbit_order(
-            symbol=decision.symbol_upbit,
-            side=upbit_side,
-            qty=sizes["upbit_qty"],
-            price=sizes["upbit_price"],
-        )
-        
-        binance_result = self._place_binance_order(
-            symbol=decision.symbol_binance,
-            side=binance_side,
-            qty=sizes["binance_qty"],
-            price=sizes["binance_price"],
-        )
+        # Place orders (동시 제출)
+        upbit_result, binance_result, late = self._place_legs(decision, upbit_side, binance_side, sizes)
         
         # Check fill status
         if upbit_result.is_filled() and binance_result.is_filled():
@@ -476,10 +526,11 @@ class CrossExchangeExecutor:
                 binance=binance_result,
                 status="success",
                 note="Entry executed successfully",
+                leg_skew_ms=self._leg_skew(upbit_result, binance_result),
             )
         else:
             # Partial fill or failure
-            return self._handle_partial_fill(decision, upbit_result, binance_result)
+            return self._handle_partial_fill(decision, upbit_result, binance_result, late)
     
     def _execute_exit(
         self,
@@ -513,20 +564,8 @@ class CrossExchangeExecutor:
         # Mark position as CLOSING
         self.position_manager.mark_position_closing(decision.symbol_upbit)
         
-        # Place orders
-        upbit_result = self._place_upbit_order(
-            symbol=decision.symbol_upbit,
-            side=upbit_side,
-            qty=sizes["upbit_qty"],
-            price=sizes["upbit_price"],
-        )
-        
-        binance_result = self._place_binance_order(
-            symbol=decision.symbol_binance,
-            side=binance_side,
-            qty=sizes["binance_qty"],
-            price=sizes["binance_price"],
-        )
+        # Place orders (동시 제출)
+        upbit_result, binance_result, late = self._place_legs(decision, upbit_side, binance_side, sizes)
         
         # Check fill status
         if upbit_result.is_filled() and binance_result.is_filled():
@@ -541,17 +580,128 @@ class CrossExchangeExecutor:
                 status="success",
                 pnl_krw=decision.exit_pnl_krw,
                 note="Exit executed successfully",
+                leg_skew_ms=self._leg_skew(upbit_result, binance_result),
             )
         else:
             # Partial fill or failure
-            return self._handle_partial_fill(decision, upbit_result, binance_result)
+            return self._handle_partial_fill(decision, upbit_result, binance_result, late)
+    
+    def _place_legs(
+        self,
+        decision: CrossExchangeDecision,
+        upbit_side: OrderSide,
+        binance_side: OrderSide,
+        sizes: Dict[str, Any],
+    ) -> Tuple[LegExecutionResult, LegExecutionResult, Dict[str, Future]]:
+        """
+        양 레그 주문 제출
+        
+        concurrent_legs=True면 두 주문을 동시에 제출하고 공유 deadline까지 대기.
+        deadline 내 응답이 없는 레그는 pending으로 처리 (주문이 거래소에 살아 있을 수
+        있으므로 failed/체결 0으로 간주하지 않음). 응답 Future는 _handle_partial_fill이
+        추가 대기 / _on_late_leg 정리에 사용.
+        
+        Returns:
+            (upbit 결과, binance 결과, {exchange: 응답 대기 중인 Future})
+        """
+        upbit_kwargs = dict(
+            symbol=decision.symbol_upbit,
+            side=upbit_side,
+            qty=sizes["upbit_qty"],
+            price=sizes["upbit_price"],
+        )
+        binance_kwargs = dict(
+            symbol=decision.symbol_binance,
+            side=binance_side,
+            qty=sizes["binance_qty"],
+            price=sizes["binance_price"],
+        )
+        
+        if not self.concurrent_legs:
+            return self._place_upbit_order(**upbit_kwargs), self._place_binance_order(**binance_kwargs), {}
+        
+        deadline = time.perf_counter() + self.leg_deadline_sec
+        futures = {
+            self._leg_pool.submit(self._place_upbit_order, **upbit_kwargs): ("upbit", upbit_kwargs),
+            self._leg_pool.submit(self._place_binance_order, **binance_kwargs): ("binance", binance_kwargs),
+        }
+        
+        results: Dict[str, LegExecutionResult] = {}
+        pending = set(futures)
+        while pending:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            done, pending = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+            for future in done:
+                results[futures[future][0]] = future.result()
+        
+        late: Dict[str, Future] = {}
+        for future in pending:
+            exchange, kwargs = futures[future]
+            logger.error(
+                f"[CROSS_EXECUTOR] {exchange} leg missed deadline "
+                f"({self.leg_deadline_sec:.2f}s): {kwargs['symbol']}"
+            )
+            results[exchange] = LegExecutionResult(
+                exchange=exchange,
+                order_id=None,
+                status="pending",
+                filled_qty=0.0,
+                requested_qty=kwargs["qty"],
+                avg_price=None,
+                error="deadline exceeded",
+                side=kwargs["side"],
+            )
+            late[exchange] = future
+        
+        return results["upbit"], results["binance"], late
+    
+    def _on_late_leg(
+        self,
+        decision: CrossExchangeDecision,
+        legs: Dict[str, LegExecutionResult],
+        lock: threading.Lock,
+        exchange: str,
+        future: Future,
+    ) -> None:
+        """
+        deadline 이후 도착한 레그 응답 정리
+        
+        열린 주문은 취소 후 실제 체결 수량을 조회하고, 양 레그가 모두 확정되면
+        남은 노출을 정산 (auto_hedge면 초과 체결분 보상 주문).
+        """
+        self.late_legs += 1
+        leg = self._finalize_leg(future.result())
+        logger.error(
+            f"[CROSS_EXECUTOR] Late {exchange} leg: order_id={leg.order_id}, "
+            f"status={leg.status}, filled={leg.filled_qty:.6f}"
+        )
+        with lock:
+            legs[exchange] = leg
+            if any(other.is_pending() for other in legs.values()):
+                return
+            upbit_result, binance_result = legs["upbit"], legs["binance"]
+        
+        exposure = upbit_result.filled_qty - binance_result.filled_qty
+        if abs(exposure) <= self.EXPOSURE_EPSILON:
+            logger.info(f"[CROSS_EXECUTOR] Late {exchange} leg reconciled, no exposure")
+            return
+        if self.auto_hedge:
+            self._submit_hedge(decision, upbit_result, binance_result)
+        else:
+            logger.error(
+                f"[CROSS_EXECUTOR] Unhedged exposure after late {exchange} leg: "
+                f"upbit={upbit_result.filled_qty:.6f}, binance={binance_result.filled_qty:.6f}"
+            )
     
     def _place_upbit_order(
         self,
         symbol: str,
         side: OrderSide,
         qty: float,
-        price: float,
+        price: Optional[float],
+        order_type: OrderType = OrderType.LIMIT,
     ) -> LegExecutionResult:
         """
         Upbit 주문 실행
@@ -561,58 +711,20 @@ class CrossExchangeExecutor:
             side: OrderSide (BUY/SELL)
             qty: 수량
             price: 가격
+            order_type: 주문 유형
         
         Returns:
             LegExecutionResult
         """
-        try:
-            order_result = self.upbit_client.create_order(
-                symbol=symbol,
-                side=side,
-                qty=qty,
-                price=price,
-                order_type=OrderType.LIMIT,
-            )
-            
-            # Map OrderStatus to LegExecutionResult status
-            if order_result.status == OrderStatus.FILLED:
-                status = "filled"
-            elif order_result.status == OrderStatus.PARTIALLY_FILLED:
-                status = "partially_filled"
-            elif order_result.status in [OrderStatus.OPEN, OrderStatus.PENDING]:
-                status = "accepted"
-            elif order_result.status == OrderStatus.CANCELED:
-                status = "canceled"
-            else:
-                status = "failed"
-            
-            return LegExecutionResult(
-                exchange="upbit",
-                order_id=order_result.order_id,
-                status=status,
-                filled_qty=order_result.filled_qty,
-                requested_qty=qty,
-                avg_price=order_result.price,
-            )
-        
-        except Exception as e:
-            logger.error(f"[CROSS_EXECUTOR] Upbit order failed: {e}", exc_info=True)
-            return LegExecutionResult(
-                exchange="upbit",
-                order_id=None,
-                status="failed",
-                filled_qty=0.0,
-                requested_qty=qty,
-                avg_price=None,
-                error=str(e),
-            )
+        return self._place_order("upbit", self.upbit_client, symbol, side, qty, price, order_type)
     
     def _place_binance_order(
         self,
         symbol: str,
         side: OrderSide,
         qty: float,
-        price: float,
+        price: Optional[float],
+        order_type: OrderType = OrderType.LIMIT,
     ) -> LegExecutionResult:
         """
         Binance 주문 실행
@@ -622,57 +734,126 @@ class CrossExchangeExecutor:
             side: OrderSide (BUY/SELL)
             qty: 수량
             price: 가격
+            order_type: 주문 유형
         
         Returns:
             LegExecutionResult
         """
+        return self._place_order("binance", self.binance_client, symbol, side, qty, price, order_type)
+    
+    def _place_order(
+        self,
+        exchange: Literal["upbit", "binance"],
+        client: BaseExchange,
+        symbol: str,
+        side: OrderSide,
+        qty: float,
+        price: Optional[float],
+        order_type: OrderType,
+    ) -> LegExecutionResult:
+        """단일 레그 주문 실행 (지연/응답 시각 기록)"""
+        started = time.perf_counter()
         try:
-            order_result = self.binance_client.create_order(
+            order_result = client.create_order(
                 symbol=symbol,
                 side=side,
                 qty=qty,
                 price=price,
-                order_type=OrderType.LIMIT,
+                order_type=order_type,
             )
-            
-            # Map OrderStatus to LegExecutionResult status
-            if order_result.status == OrderStatus.FILLED:
-                status = "filled"
-            elif order_result.status == OrderStatus.PARTIALLY_FILLED:
-                status = "partially_filled"
-            elif order_result.status in [OrderStatus.OPEN, OrderStatus.PENDING]:
-                status = "accepted"
-            elif order_result.status == OrderStatus.CANCELED:
-                status = "canceled"
-            else:
-                status = "failed"
+            completed = time.perf_counter()
             
             return LegExecutionResult(
-                exchange="binance",
+                exchange=exchange,
                 order_id=order_result.order_id,
-                status=status,
+                status=self._leg_status(order_result.status),
                 filled_qty=order_result.filled_qty,
                 requested_qty=qty,
                 avg_price=order_result.price,
+                side=side,
+                latency_ms=(completed - started) * 1000,
+                completed_at=completed,
             )
         
         except Exception as e:
-            logger.error(f"[CROSS_EXECUTOR] Binance order failed: {e}", exc_info=True)
+            completed = time.perf_counter()
+            logger.error(f"[CROSS_EXECUTOR] {exchange.capitalize()} order failed: {e}", exc_info=True)
             return LegExecutionResult(
-                exchange="binance",
+                exchange=exchange,
                 order_id=None,
                 status="failed",
                 filled_qty=0.0,
                 requested_qty=qty,
                 avg_price=None,
                 error=str(e),
+                side=side,
+                latency_ms=(completed - started) * 1000,
+                completed_at=completed,
             )
     
+    @staticmethod
+    def _leg_status(order_status: OrderStatus) -> str:
+        """OrderStatus → LegExecutionResult status"""
+        if order_status == OrderStatus.FILLED:
+            return "filled"
+        if order_status == OrderStatus.PARTIALLY_FILLED:
+            return "partially_filled"
+        if order_status in [OrderStatus.OPEN, OrderStatus.PENDING]:
+            return "accepted"
+        if order_status == OrderStatus.CANCELED:
+            return "canceled"
+        return "failed"
+    
+    def _finalize_leg(self, leg: LegExecutionResult) -> LegExecutionResult:
+        """
+        열린 레그 취소 후 실제 체결 수량 조회
+        
+        취소 요청과 응답 사이에도 체결될 수 있으므로 헷지 판단 전에 거래소에서
+        최종 체결 수량을 다시 읽는다. (조회 실패 시 기존 값 유지)
+        """
+        if not leg.order_id or leg.status not in self.OPEN_LEG_STATUSES:
+            return leg
+        self._cancel_leg(leg)
+        client = self.upbit_client if leg.exchange == "upbit" else self.binance_client
+        if not getattr(client, "supports_order_status", True):
+            logger.warning(
+                f"[CROSS_EXECUTOR] {leg.exchange.capitalize()} adapter cannot query order status, "
+                f"using reported fill for {leg.order_id}"
+            )
+            return leg
+        try:
+            order = client.get_order_status(leg.order_id)
+        except Exception as e:
+            logger.error(f"[CROSS_EXECUTOR] Failed to query {leg.exchange.capitalize()} order {leg.order_id}: {e}")
+            return leg
+        return replace(leg, status=self._leg_status(order.status), filled_qty=order.filled_qty)
+    
+    def _cancel_leg(self, leg: LegExecutionResult) -> bool:
+        """레그 미체결 주문 취소"""
+        client = self.upbit_client if leg.exchange == "upbit" else self.binance_client
+        try:
+            client.cancel_order(leg.order_id)
+            logger.info(f"[CROSS_EXECUTOR] Canceled {leg.exchange.capitalize()} order: {leg.order_id}")
+            return True
+        except Exception as e:
+            logger.error(f"[CROSS_EXECUTOR] Failed to cancel {leg.exchange.capitalize()} order: {e}")
+            return False
+    
+    @staticmethod
+    def _leg_skew(upbit_result: LegExecutionResult, binance_result: LegExecutionResult) -> Optional[float]:
+        """양 레그 체결 응답 시각 차이 (ms, 양쪽 모두 체결분이 있을 때만)"""
+        if upbit_result.completed_at is None or binance_result.completed_at is None:
+            return None
+        if upbit_result.filled_qty <= 0 or binance_result.filled_qty <= 0:
+            return None
+        return abs(upbit_result.completed_at - binance_result.completed_at) * 1000
+    
     def _handle_partial_fill(
         self,
         decision: CrossExchangeDecision,
         upbit_result: LegExecutionResult,
         binance_result: LegExecutionResult,
+        late: Optional[Dict[str, Future]] = None,
     ) -> CrossExecutionResult:
         """
         부분 체결 처리
@@ -681,33 +862,84 @@ class CrossExchangeExecutor:
         - One-side filled: Cancel other side, try hedge
         - Both partial: Cancel both, try hedge remaining
         - Both failed: Return failed result
+        - Deadline 초과 (pending): 응답을 한 번 더 기다려 취소 + 실제 체결 수량 조회 후 판단,
+          그래도 응답이 없으면 헷지하지 않고 _on_late_leg에서 정산
+        
+        auto_hedge=True면 노출이 확정되는 즉시 보상 주문을 비동기 제출.
+        (상대 레그가 이미 종료 상태면 취소를 기다리지 않음)
         """
         logger.warning(
             f"[CROSS_EXECUTOR] Partial fill detected: "
             f"upbit={upbit_result.status}, binance={binance_result.status}"
         )
         
-        # Cancel unfilled orders
-        if upbit_result.status in ["accepted", "partially_filled"] and upbit_result.order_id:
+        legs = {"upbit": upbit_result, "binance": binance_result}
+        unresolved: Dict[str, Future] = {}
+        for exchange, future in (late or {}).items():
             try:
-                self.upbit_client.cancel_order(upbit_result.order_id)
-                logger.info(f"[CROSS_EXECUTOR] Canceled Upbit order: {upbit_result.order_id}")
-            except Exception as e:
-                logger.error(f"[CROSS_EXECUTOR] Failed to cancel Upbit order: {e}")
-        
-        if binance_result.status in ["accepted", "partially_filled"] and binance_result.order_id:
-            try:
-                self.binance_client.cancel_order(binance_result.order_id)
-                logger.info(f"[CROSS_EXECUTOR] Canceled Binance order: {binance_result.order_id}")
-            except Exception as e:
-                logger.error(f"[CROSS_EXECUTOR] Failed to cancel Binance order: {e}")
+                legs[exchange] = future.result(timeout=self.leg_deadline_sec)
+                self.late_legs += 1
+            except FutureTimeoutError:
+                unresolved[exchange] = future
+        upbit_result, binance_result = legs["upbit"], legs["binance"]
+        
+        open_legs = [
+            leg for leg in (upbit_result, binance_result)
+            if leg.status in self.OPEN_LEG_STATUSES and leg.order_id
+        ]
+        
+        # 노출 확정 여부: 체결이 더 진행될 수 있는 상대 레그가 없으면 즉시 헷지
+        hedge_future: Optional[Future] = None
+        hedged_qty = 0.0
+        if self.auto_hedge and not self._exposure_may_grow(upbit_result, binance_result):
+            hedge_future = self._submit_hedge(decision, upbit_result, binance_result)
+            if hedge_future is not None:
+                hedged_qty = abs(upbit_result.filled_qty - binance_result.filled_qty)
+        
+        # Cancel unfilled orders + 실제 체결 수량 재조회 (병렬)
+        finalize_futures = {
+            leg.exchange: self._leg_pool.submit(self._finalize_leg, leg) for leg in open_legs
+        }
+        done, _ = wait(finalize_futures.values(), timeout=self.leg_deadline_sec)
+        for exchange, future in finalize_futures.items():
+            if future in done:
+                legs[exchange] = future.result()
+        upbit_result, binance_result = legs["upbit"], legs["binance"]
+        
+        if unresolved:
+            # 응답 없는 레그는 체결 수량을 모르므로 헷지 보류 → 도착 시 _on_late_leg에서 정산
+            pending_legs = dict(legs)
+            lock = threading.Lock()
+            for exchange, future in unresolved.items():
+                future.add_done_callback(partial(self._on_late_leg, decision, pending_legs, lock, exchange))
+        elif self.auto_hedge:
+            # 즉시 헷지 이후 선행 레그가 더 체결되었으면 차이만큼 추가 헷지
+            top_up = self._submit_hedge(decision, upbit_result, binance_result, hedged_qty=hedged_qty)
+            if hedge_future is None:
+                hedge_future = top_up
         
         # Calculate exposure
         upbit_filled = upbit_result.filled_qty
         binance_filled = binance_result.filled_qty
         exposure_diff = abs(upbit_filled - binance_filled)
+        leg_skew_ms = self._leg_skew(upbit_result, binance_result)
         
-        if exposure_diff > 0.0001:  # Non-zero exposure
+        if unresolved:
+            note = (
+                f"Leg pending after deadline ({', '.join(sorted(unresolved))}): "
+                f"Upbit filled {upbit_filled:.6f}, Binance filled {binance_filled:.6f}, "
+                "hedge deferred to late-leg reconcile"
+            )
+            return CrossExecutionResult(
+                decision=decision,
+                upbit=upbit_result,
+                binance=binance_result,
+                status="hedge_pending",
+                note=note,
+                leg_skew_ms=leg_skew_ms,
+            )
+        
+        if exposure_diff > self.EXPOSURE_EPSILON:  # Non-zero exposure
             # Send alert (if alert_manager available)
             if self.alert_manager:
                 # Future implementation
@@ -719,12 +951,23 @@ class CrossExchangeExecutor:
                 f"exposure={exposure_diff:.6f}"
             )
             
+            hedge = None
+            if hedge_future is not None:
+                try:
+                    hedge = hedge_future.result(timeout=self.leg_deadline_sec)
+                    note += f", hedge={hedge.exchange}:{hedge.status}"
+                except Exception as e:
+                    logger.error(f"[CROSS_EXECUTOR] Hedge order not confirmed: {e}")
+                    note += ", hedge=unconfirmed"
+            
             return CrossExecutionResult(
                 decision=decision,
                 upbit=upbit_result,
                 binance=binance_result,
                 status="partial_hedged",
                 note=note,
+                leg_skew_ms=leg_skew_ms,
+                hedge=hedge,
             )
         else:
             # No exposure (both failed or both canceled)
@@ -735,7 +978,7 @@ class CrossExchangeExecutor:
                     symbol=f"{decision.symbol_upbit}/{decision.symbol_binance}",
                     exchange="cross_exchange",
                     filled_qty=0.0,
-                    requested_qty=float(sizes.get("upbit_qty", 0)),
+                    requested_qty=float(upbit_result.requested_qty),
                     status="rolled_back",
                 )
             except Exception as e:
@@ -747,8 +990,64 @@ class CrossExchangeExecutor:
                 binance=binance_result,
                 status="rolled_back",
                 note="Both orders canceled, no exposure",
+                leg_skew_ms=leg_skew_ms,
             )
     
+    @classmethod
+    def _exposure_may_grow(cls, upbit_result: LegExecutionResult, binance_result: LegExecutionResult) -> bool:
+        """적게 체결된 레그에 아직 열린 주문이 있거나 응답 대기(pending) 레그가 있으면 노출이 변할 수 있음"""
+        if upbit_result.is_pending() or binance_result.is_pending():
+            return True
+        lagging = upbit_result if upbit_result.filled_qty < binance_result.filled_qty else binance_result
+        return lagging.status in cls.OPEN_LEG_STATUSES
+    
+    def _submit_hedge(
+        self,
+        decision: CrossExchangeDecision,
+        upbit_result: LegExecutionResult,
+        binance_result: LegExecutionResult,
+        hedged_qty: float = 0.0,
+    ) -> Optional[Future]:
+        """
+        노출 보상 주문 비동기 제출
+        
+        더 많이 체결된 레그의 거래소에 반대 방향 시장가 주문으로 초과분을 청산.
+        
+        Args:
+            hedged_qty: 이미 제출한 보상 주문 수량 (차이만 추가 헷지)
+        
+        Returns:
+            보상 주문 Future (남은 노출이 없으면 None)
+        """
+        exposure = upbit_result.filled_qty - binance_result.filled_qty
+        if abs(exposure) - hedged_qty <= self.EXPOSURE_EPSILON:
+            return None
+        
+        leg = upbit_result if exposure > 0 else binance_result
+        if leg.side is None:
+            return None
+        hedge_side = OrderSide.BUY if leg.side == OrderSide.SELL else OrderSide.SELL
+        
+        if leg.exchange == "upbit":
+            place, symbol = self._place_upbit_order, decision.symbol_upbit
+        else:
+            place, symbol = self._place_binance_order, decision.symbol_binance
+        
+        qty = abs(exposure) - hedged_qty
+        self.hedge_orders += 1
+        logger.warning(
+            f"[CROSS_EXECUTOR] Hedging exposure: {leg.exchange} {hedge_side} "
+            f"{qty:.6f} {symbol}"
+        )
+        return self._leg_pool.submit(
+            place,
+            symbol=symbol,
+            side=hedge_side,
+            qty=qty,
+            price=None,
+            order_type=OrderType.MARKET,
+        )
+    
     def _estimate_order_cost(
         self,
         exchange: BaseExchange,
@@ -846,12 +1145,20 @@ class CrossExchangeExecutor:
             # (cross_exchange_metrics.py의 CrossExecutionResult와 호환)
             from arbitrage.monitoring.cross_exchange_metrics import CrossExecutionResult as MetricsResult
             
+            leg_latencies = {
+                leg.exchange: leg.latency_ms / 1000.0  # ms → s
+                for leg in (result.upbit, result.binance)
+                if leg.latency_ms is not None
+            }
+            
             metrics_result = MetricsResult(
                 status=result.status,
                 upbit_result=result.upbit,
                 binance_result=result.binance,
                 total_latency=result.execution_time_ms / 1000.0 if result.execution_time_ms else None,  # ms → s
                 rollback_reason=result.note if result.status == "rolled_back" else None,
+                leg_latencies=leg_latencies or None,
+                leg_skew=result.leg_skew_ms / 1000.0 if result.leg_skew_ms is not None else None,
             )
             
             self.metrics_collector.record_execution_result(metrics_result)
@@ -859,20 +1166,48 @@ class CrossExchangeExecutor:
         except Exception as e:
             logger.error(f"[CROSS_EXECUTOR] Metrics recording failed: {e}", exc_info=True)
     
+    def _record_leg_stats(self, result: CrossExecutionResult) -> None:
+        """레그별 지연 / leg skew 샘플 기록"""
+        for leg in (result.upbit, result.binance):
+            if leg.latency_ms is not None:
+                self._leg_latency_ms[leg.exchange].append(leg.latency_ms)
+        if result.leg_skew_ms is not None:
+            self._leg_skew_ms.append(result.leg_skew_ms)
+    
     def get_metrics(self) -> Dict[str, Any]:
         """실행 메트릭 반환"""
-        return {
+        metrics = {
             "total_executions": self.total_executions,
             "successful_executions": self.successful_executions,
             "failed_executions": self.failed_executions,
             "partial_hedged_executions": self.partial_hedged_executions,
+            "hedge_pending_executions": self.hedge_pending_executions,
             "rolled_back_executions": self.rolled_back_executions,
             "success_rate": (
                 self.successful_executions / self.total_executions
                 if self.total_executions > 0
                 else 0.0
             ),
+            "hedge_orders": self.hedge_orders,
+            "late_legs": self.late_legs,
         }
+        
+        samples = {f"{name}_leg_latency": values for name, values in self._leg_latency_ms.items()}
+        samples["leg_skew"] = self._leg_skew_ms
+        for name, values in samples.items():
+            if values:
+                p50, p99 = np.percentile(np.fromiter(values, dtype=np.float64), [50, 99])
+                metrics[f"{name}_p50_ms"] = float(p50)
+                metrics[f"{name}_p99_ms"] = float(p99)
+            else:
+                metrics[f"{name}_p50_ms"] = 0.0
+                metrics[f"{name}_p99_ms"] = 0.0
+        
+        return metrics
+    
+    def close(self) -> None:
+        """레그 스레드 풀 종료"""
+        self._leg_pool.shutdown(wait=False)
 
 
 class CrossExchangeOrchestrator:
@@ -29,7 +29,7 @@ import time
 from dataclasses import dataclass, field
 from decimal import Decimal
 from enum import Enum
-from typing import Dict, List, Optional, Any, Literal, Union, TYPE_CHECKING
+from typing import Dict, List, Optional, Any, Literal, Sequence, Tuple, Union, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from arbitrage.execution.fill_model_integration import FillModelIntegration
@@ -38,6 +38,14 @@ from .integration import CrossExchangeDecision, CrossExchangeAction
 from .position_manager import CrossExchangePositionManager
 from arbitrage.domain.cross_sync import InventoryTracker, RebalanceSignal
 from arbitrage.common.currency import Currency, Money, FxRateProvider, StaticFxRateProvider
+from arbitrage.common.fixed_money import (
+    INT64_MAX,
+    INT64_MIN,
+    convert_fixed,
+    decimal_to_fixed,
+    fixed_to_decimal,
+    sum_money,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -129,6 +137,10 @@ class CrossExchangePnLTracker:
     Daily PnL 및 Consecutive loss 추적.
     Base Currency 기준으로 모든 PnL을 통합 집계.
     
+    Daily PnL은 고정소수점(int64 units + exponent)으로 누적하고
+    get_daily_pnl()에서만 Money로 변환한다. scale로 표현할 수 없는 금액이나
+    overflow 발생 시 Decimal(Money) 누적으로 폴백 (결과 동일).
+    
     Note: 현재는 in-memory 구현. 향후 Redis 등으로 확장 가능.
     """
     
@@ -151,10 +163,73 @@ class CrossExchangePnLTracker:
             (Currency.USDT, Currency.KRW): Decimal("1500.00"),
         })
         
-        self._daily_pnl: Money = Money(Decimal("0"), base_currency)
+        # 고정소수점 누적 (_daily_units is None → Decimal 모드, _daily_decimal 사용)
+        self._daily_units: Optional[int] = 0
+        self._daily_exponent: int = 0
+        self._daily_decimal: Optional[Money] = None
+        self._daily_pnl = Money(Decimal("0"), base_currency)
         self._daily_pnl_reset_time: float = 0.0
         self._consecutive_loss_count: int = 0
-        self._last_trade_pnl: Money = Money(Decimal("0"), base_currency)
+        self._last_trade_negative: bool = False
+    
+    @property
+    def _daily_pnl(self) -> Money:
+        """일일 PnL 누적값 (Money 경계 변환)"""
+        if self._daily_units is None:
+            return self._daily_decimal
+        return Money(
+            fixed_to_decimal(self._daily_units, self._daily_exponent, self.base_currency),
+            self.base_currency,
+        )
+    
+    @_daily_pnl.setter
+    def _daily_pnl(self, value: Money) -> None:
+        """누적값 설정 (표현 가능하면 고정소수점, 아니면 Decimal 모드)"""
+        fixed = None
+        if value.currency == self.base_currency:
+            fixed = decimal_to_fixed(value.amount, value.currency)
+        if fixed is None:
+            self._daily_units = None
+            self._daily_decimal = value
+        else:
+            self._daily_units, self._daily_exponent = fixed
+            self._daily_decimal = None
+    
+    def _roll_daily(self) -> None:
+        """Daily PnL 초기화 (자정 기준)"""
+        now = time.time()
+        current_day = int(now / 86400)
+        reset_day = int(self._daily_pnl_reset_time / 86400)
+        
+        if current_day != reset_day:
+            self._daily_units = 0
+            self._daily_exponent = 0
+            self._daily_decimal = None
+            self._daily_pnl_reset_time = now
+    
+    def _accumulate(
+        self,
+        fixed: Optional[Tuple[int, int]],
+        amount: Decimal,
+        rate: Optional[Decimal] = None,
+    ) -> None:
+        """
+        Base currency 금액 누적.
+        
+        Args:
+            fixed: base currency (units, exponent), 표현 불가 시 None
+            amount: 원 통화 금액 (폴백용)
+            rate: 원 통화 → base 환율 (같은 통화면 None)
+        """
+        if fixed is not None and self._daily_units is not None:
+            units = self._daily_units + fixed[0]
+            if INT64_MIN <= units <= INT64_MAX:
+                self._daily_units = units
+                if fixed[1] < self._daily_exponent:
+                    self._daily_exponent = fixed[1]
+                return
+        amount_in_base = amount if rate is None else amount * rate
+        self._daily_pnl = self._daily_pnl + Money(amount_in_base, self.base_currency)
     
     def add_trade(
         self,
@@ -182,48 +257,85 @@ class CrossExchangePnLTracker:
                 currency = Currency.KRW  # Default to KRW
             pnl = Money(Decimal(str(pnl)), currency)
         
-        # Daily PnL 초기화 (자정 기준)
-        now = time.time()
-        current_day = int(now / 86400)
-        reset_day = int(self._daily_pnl_reset_time / 86400)
+        self._roll_daily()
         
-        if current_day != reset_day:
-            self._daily_pnl = Money(Decimal("0"), self.base_currency)
-            self._daily_pnl_reset_time = now
+        # Base currency로 변환 후 누적 (환율은 거래당 1회 조회)
+        amount = pnl.amount
+        if pnl.currency == self.base_currency:
+            fixed = decimal_to_fixed(amount, pnl.currency)
+            self._accumulate(fixed, amount)
+        else:
+            rate = self.fx_provider.get_rate(pnl.currency, self.base_currency)
+            fixed = decimal_to_fixed(amount, pnl.currency)
+            if fixed is not None:
+                fixed = convert_fixed(fixed[0], fixed[1], pnl.currency, self.base_currency, rate)
+            self._accumulate(fixed, amount, rate)
+        
+        self._count_loss(amount < 0)
+        
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"[CROSS_PNL_TRACKER] Trade added: {pnl}, "
+                f"Daily PnL: {self._daily_pnl}, "
+                f"Consecutive loss: {self._consecutive_loss_count}"
+            )
+    
+    def add_trades(self, pnls: Sequence[Money]) -> None:
+        """
+        여러 거래 PnL 일괄 추가 (포트폴리오 정산용).
         
-        # Base currency로 변환 후 누적
-        pnl_in_base = pnl.convert_to(self.base_currency, self.fx_provider)
-        self._daily_pnl += pnl_in_base
+        통화별 NumPy 합산 후 1회 누적. add_trade() 순차 호출과 같은 결과.
         
-        # Consecutive loss 카운팅 (부호만 확인)
-        if pnl.is_negative:
-            if self._last_trade_pnl.is_negative:
+        Args:
+            pnls: 거래 손익 목록 (Money, 시간순)
+        """
+        if not pnls:
+            return
+        
+        self._roll_daily()
+        
+        total = sum_money(pnls, self.base_currency, self.fx_provider)
+        self._accumulate(decimal_to_fixed(total.amount, self.base_currency), total.amount)
+        
+        for pnl in pnls:
+            self._count_loss(pnl.amount < 0)
+    
+    def _count_loss(self, negative: bool) -> None:
+        """Consecutive loss 카운팅 (부호만 확인)"""
+        if negative:
+            if self._last_trade_negative:
                 self._consecutive_loss_count += 1
             else:
                 self._consecutive_loss_count = 1
         else:
             self._consecutive_loss_count = 0
         
-        self._last_trade_pnl = pnl_in_base
-        
-        logger.debug(
-            f"[CROSS_PNL_TRACKER] Trade added: {pnl}, "
-            f"Daily PnL: {self._daily_pnl}, "
-            f"Consecutive loss: {self._consecutive_loss_count}"
-        )
+        self._last_trade_negative = negative
+    
+    def _is_stale_day(self) -> bool:
+        """마지막 리셋 이후 날짜가 바뀌었는지"""
+        return int(time.time() / 86400) != int(self._daily_pnl_reset_time / 86400)
     
     def get_daily_pnl(self) -> Money:
         """일일 PnL 조회 (Money)"""
         # Daily PnL 초기화 확인
-        now = time.time()
-        current_day = int(now / 86400)
-        reset_day = int(self._daily_pnl_reset_time / 86400)
-        
-        if current_day != reset_day:
+        if self._is_stale_day():
             return Money(Decimal("0"), self.base_currency)
         
         return self._daily_pnl
     
+    def get_daily_pnl_units(self) -> Optional[int]:
+        """
+        일일 PnL 고정소수점 units 조회 (hot path 비교용).
+        
+        Returns:
+            base currency scale 단위 정수, Decimal 모드이면 None
+        """
+        if self._is_stale_day():
+            return 0
+        
+        return self._daily_units
+    
     def get_daily_pnl_amount(self) -> float:
         """일일 PnL amount 조회 (Backward compatible, float)"""
         return float(self.get_daily_pnl().amount)
@@ -300,6 +412,9 @@ class CrossExchangeRiskGuard:
         # Cooldown state (symbol → cooldown_until timestamp)
         self._cooldown_state: Dict[str, float] = {}
         
+        # Daily loss limit 고정소수점 캐시 (config.max_daily_loss 객체 → units)
+        self._loss_limit_cache: Tuple[Optional[Money], Optional[Tuple[int, int]]] = (None, None)
+        
         # Metrics counters (내부용, 하위 호환성 유지)
         self.total_checks = 0
         self.blocked_by_tier: Dict[str, int] = {
@@ -707,11 +822,10 @@ class CrossExchangeRiskGuard:
         Rule 4: Daily Loss Limit
         Rule 5: Consecutive Loss Limit
         """
-        # Rule 4: Daily Loss Limit (Money 비교)
-        daily_pnl = self.pnl_tracker.get_daily_pnl()  # Money
-        
-        # Money 비교: daily_pnl < -max_daily_loss
-        if daily_pnl < -self.config.max_daily_loss:
+        # Rule 4: Daily Loss Limit (고정소수점 비교, Money는 차단 시에만 생성)
+        if self._is_daily_loss_exceeded():
+            daily_pnl = self.pnl_tracker.get_daily_pnl()  # Money
+            
             logger.error(
                 f"[CROSS_RISK_GUARD] Daily loss limit exceeded: "
                 f"{daily_pnl} < {-self.config.max_daily_loss}"
@@ -781,6 +895,29 @@ class CrossExchangeRiskGuard:
             details={},
         )
     
+    def _is_daily_loss_exceeded(self) -> bool:
+        """
+        daily_pnl < -max_daily_loss 판정.
+        
+        tracker가 고정소수점 모드이고 한도와 통화가 같으면 units 정수 비교,
+        아니면 Money 비교 (다른 통화 시 ValueError 동일).
+        """
+        max_daily_loss = self.config.max_daily_loss
+        get_units = getattr(self.pnl_tracker, "get_daily_pnl_units", None)
+        if get_units is not None and max_daily_loss.currency == self.pnl_tracker.base_currency:
+            daily_units = get_units()
+            if daily_units is not None:
+                if self._loss_limit_cache[0] is not max_daily_loss:
+                    self._loss_limit_cache = (
+                        max_daily_loss,
+                        decimal_to_fixed(max_daily_loss.amount, max_daily_loss.currency),
+                    )
+                limit = self._loss_limit_cache[1]
+                if limit is not None:
+                    return daily_units < -limit[0]
+        
+        return self.pnl_tracker.get_daily_pnl() < -max_daily_loss
+    
     def _set_cooldown(self, symbol: str, cooldown_until: float) -> None:
         """Cooldown 설정"""
         self._cooldown_state[symbol] = cooldown_until
@@ -17,6 +17,7 @@ from arbitrage.domain.arb_universe import (
     UniverseMode,
     UniverseProvider,
     UniverseDecision,
+    VectorizedRouteScorer,
 )
 from arbitrage.domain.cross_sync import (
     Inventory,
@@ -25,6 +26,8 @@ from arbitrage.domain.cross_sync import (
 )
 from arbitrage.domain.risk_guard import (
     FourTierRiskGuard,
+    CompiledGuardPlan,
+    LazyTierDecisions,
     RiskGuardDecision,
     TierDecision,
     GuardTier,
@@ -53,10 +56,13 @@ __all__ = [
     "UniverseMode",
     "UniverseProvider",
     "UniverseDecision",
+    "VectorizedRouteScorer",
     "Inventory",
     "InventoryTracker",
     "RebalanceSignal",
     "FourTierRiskGuard",
+    "CompiledGuardPlan",
+    "LazyTierDecisions",
     "RiskGuardDecision",
     "TierDecision",
     "GuardTier",
@@ -6,6 +6,7 @@ Multi-symbol arbitrage universe 관리:
 - Route ranking (score-based)
 - Spread normalization
 - Dynamic symbol selection
+- Vectorized route scoring (NumPy, argpartition top-N)
 """
 
 import time
@@ -13,8 +14,10 @@ from dataclasses import dataclass, field
 from enum import Enum
 from typing import Dict, List, Optional, Tuple
 
+import numpy as np
+
 from arbitrage.arbitrage_core import OrderBookSnapshot
-from arbitrage.domain.arb_route import ArbRoute, ArbRouteDecision, RouteDirection
+from arbitrage.domain.arb_route import ArbRoute, ArbRouteDecision, RouteDirection, RouteScore
 from arbitrage.domain.fee_model import FeeModel
 from arbitrage.domain.market_spec import MarketSpec
 from arbitrage.infrastructure.exchange_health import HealthMonitor
@@ -62,6 +65,244 @@ class UniverseDecision:
         return self.ranked_routes[:n]
 
 
+# 벡터화 경로의 direction 코드
+_DIRECTION_SKIP = 0
+_DIRECTION_LONG_B_SHORT_A = 1
+_DIRECTION_LONG_A_SHORT_B = 2
+
+_DIRECTIONS = {
+    _DIRECTION_LONG_B_SHORT_A: RouteDirection.LONG_B_SHORT_A,
+    _DIRECTION_LONG_A_SHORT_B: RouteDirection.LONG_A_SHORT_B,
+}
+
+
+@dataclass
+class RouteScoreBatch:
+    """
+    벡터화 scoring 결과 (후보 route 순서와 정렬된 배열).
+    
+    direction: 0=SKIP, 1=LONG_B_SHORT_A, 2=LONG_A_SHORT_B
+    """
+    keys: List[Tuple[str, str]]
+    direction: np.ndarray
+    gross_spread: np.ndarray
+    spread_score: np.ndarray
+    health_score: np.ndarray
+    fee_score: np.ndarray
+    inventory_penalty: np.ndarray
+    total_score: np.ndarray
+    
+    def __len__(self) -> int:
+        return len(self.keys)
+
+
+class VectorizedRouteScorer:
+    """
+    ArbRoute.evaluate의 벡터화 버전.
+    
+    Route 파라미터(환율, 진입 비용, 최소 spread, 진입 수수료)를 정렬된 배열로 보관하고
+    snapshot/health/inventory를 배열로 모아 모든 route의 점수를 한 번에 계산한다.
+    연산 순서는 ArbRoute와 동일하게 유지하여 per-route 경로와 같은 값을 낸다.
+    
+    Health metrics는 매 평가마다 읽지만, 등록 이후 MarketSpec/FeeModel 값이나
+    health monitor 객체를 교체했다면 refresh()를 호출해야 한다.
+    """
+    
+    def __init__(self):
+        self._routes: List[ArbRoute] = []
+        self._positions: Dict[Tuple[str, str], int] = {}
+        
+        # (N,) 파라미터 배열 (refresh()에서 재구성)
+        self._fx_rate = np.empty(0)
+        self._total_cost = np.empty(0)
+        self._min_spread = np.empty(0)
+        self._entry_fee = np.empty(0)
+        
+        # Health monitor (고유 monitor 목록 + route별 인덱스, 없으면 -1)
+        self._monitors: List[HealthMonitor] = []
+        self._monitor_a = np.empty(0, dtype=np.intp)
+        self._monitor_b = np.empty(0, dtype=np.intp)
+        self._dirty = False
+    
+    def add_route(self, route: ArbRoute) -> None:
+        """Route 추가 (같은 key면 교체)"""
+        key = (route.symbol_a, route.symbol_b)
+        position = self._positions.get(key)
+        if position is None:
+            self._positions[key] = len(self._routes)
+            self._routes.append(route)
+        else:
+            self._routes[position] = route
+        self._dirty = True
+    
+    def refresh(self) -> None:
+        """Route 객체에서 파라미터 배열 재구성"""
+        routes = self._routes
+        self._fx_rate = np.array([r.market_spec.fx_rate_a_to_b for r in routes], dtype=np.float64)
+        self._total_cost = np.array(
+            [r.fee_model.total_entry_fee_bps() + r.slippage_bps for r in routes], dtype=np.float64
+        )
+        self._min_spread = np.array([r.min_spread_bps for r in routes], dtype=np.float64)
+        self._entry_fee = np.array(
+            [r.fee_model.total_entry_fee_bps() for r in routes], dtype=np.float64
+        )
+        
+        monitors: Dict[int, int] = {}
+        self._monitors = []
+        
+        def monitor_index(monitor: Optional[HealthMonitor]) -> int:
+            if not monitor:
+                return -1
+            index = monitors.get(id(monitor))
+            if index is None:
+                index = monitors[id(monitor)] = len(self._monitors)
+                self._monitors.append(monitor)
+            return index
+        
+        self._monitor_a = np.array([monitor_index(r.health_monitor_a) for r in routes], dtype=np.intp)
+        self._monitor_b = np.array([monitor_index(r.health_monitor_b) for r in routes], dtype=np.intp)
+        self._dirty = False
+    
+    def __len__(self) -> int:
+        return len(self._routes)
+    
+    def __contains__(self, key: Tuple[str, str]) -> bool:
+        return key in self._positions
+    
+    def score(
+        self,
+        snapshots: Dict[Tuple[str, str], OrderBookSnapshot],
+        inventory_state: Optional[Dict[Tuple[str, str], float]] = None,
+        allowed: Optional[set] = None,
+    ) -> RouteScoreBatch:
+        """
+        등록된 route 중 snapshot이 있는 route 전체를 한 번에 평가.
+        
+        Args:
+            snapshots: {(symbol_a, symbol_b): OrderBookSnapshot}
+            inventory_state: {(symbol_a, symbol_b): imbalance_ratio}
+            allowed: 지정 시 이 key 집합에 속한 route만 평가
+        
+        Returns:
+            RouteScoreBatch (snapshots 순서 유지)
+        """
+        if self._dirty:
+            self.refresh()
+        inventory_state = inventory_state or {}
+        
+        keys: List[Tuple[str, str]] = []
+        positions: List[int] = []
+        quotes: List[Tuple[float, float, float, float]] = []
+        for key, snapshot in snapshots.items():
+            position = self._positions.get(key)
+            if position is None or (allowed is not None and key not in allowed):
+                continue
+            keys.append(key)
+            positions.append(position)
+            quotes.append(
+                (snapshot.best_bid_a, snapshot.best_ask_a, snapshot.best_bid_b, snapshot.best_ask_b)
+            )
+        
+        idx = np.asarray(positions, dtype=np.intp)
+        book = np.asarray(quotes, dtype=np.float64).reshape(-1, 4)
+        bid_a, ask_a, bid_b, ask_b = book.T
+        imbalance = np.array([inventory_state.get(k, 0.0) for k in keys], dtype=np.float64)
+        
+        fx_rate = self._fx_rate[idx]
+        total_cost = self._total_cost[idx]
+        min_spread = self._min_spread[idx]
+        
+        with np.errstate(divide="ignore", invalid="ignore"):
+            # 1. Spread (ArbRoute._calculate_spread_a_to_b / _b_to_a)
+            ask_a_norm = ask_a / fx_rate
+            spread_a_to_b = (bid_b - ask_a_norm) / ask_a_norm * 10_000.0 - total_cost
+            bid_a_norm = bid_a / fx_rate
+            spread_b_to_a = (bid_a_norm - ask_b) / ask_b * 10_000.0 - total_cost
+            
+            # 2. Direction
+            use_a_to_b = spread_a_to_b >= min_spread
+            use_b_to_a = ~use_a_to_b & (spread_b_to_a >= min_spread)
+            direction = np.where(
+                use_a_to_b,
+                _DIRECTION_LONG_B_SHORT_A,
+                np.where(use_b_to_a, _DIRECTION_LONG_A_SHORT_B, _DIRECTION_SKIP),
+            )
+            gross_spread = np.where(use_a_to_b, spread_a_to_b, spread_b_to_a)
+            
+            # 3. Score 구성 요소
+            spread_score = np.minimum(100.0, np.maximum(0.0, (gross_spread - 30.0) / 0.7 + 50.0))
+            health_score = self._health_scores(idx)
+            
+            entry_fee = self._entry_fee[idx]
+            fee_impact = np.where(
+                gross_spread <= 0, 1.0, np.minimum(1.0, entry_fee / gross_spread)
+            )
+            fee_score = np.maximum(0.0, (1.0 - fee_impact) * 100.0)
+        
+        inventory_penalty = np.full(len(keys), 100.0)
+        long_a = (direction == _DIRECTION_LONG_A_SHORT_B) & (imbalance > 0.3)
+        long_b = (direction == _DIRECTION_LONG_B_SHORT_A) & (imbalance < -0.3)
+        inventory_penalty[long_a] = np.maximum(0.0, 100.0 - imbalance[long_a] * 100.0)
+        inventory_penalty[long_b] = np.maximum(0.0, 100.0 - np.abs(imbalance[long_b]) * 100.0)
+        
+        # RouteScore.total_score()와 같은 순서로 합산
+        total_score = (
+            spread_score * 0.4
+            + health_score * 0.3
+            + fee_score * 0.2
+            + inventory_penalty * 0.1
+        )
+        total_score = np.where(direction == _DIRECTION_SKIP, 0.0, total_score)
+        
+        return RouteScoreBatch(
+            keys=keys,
+            direction=direction,
+            gross_spread=gross_spread,
+            spread_score=spread_score,
+            health_score=health_score,
+            fee_score=fee_score,
+            inventory_penalty=inventory_penalty,
+            total_score=total_score,
+        )
+    
+    def _health_scores(self, idx: np.ndarray) -> np.ndarray:
+        """
+        Health score 배열 (ArbRoute._calculate_health_score).
+        
+        Monitor는 여러 route가 공유하므로 고유 monitor별로 한 번만 metrics를 읽고
+        route별 monitor 인덱스 배열로 펼친다.
+        """
+        monitor_a = self._monitor_a[idx]
+        monitor_b = self._monitor_b[idx]
+        monitored = (monitor_a >= 0) & (monitor_b >= 0)
+        if not monitored.any():
+            return np.full(len(idx), 100.0)
+        
+        metrics = np.array(
+            [
+                (m.metrics.rest_latency_ms, m.metrics.error_ratio, m.metrics.orderbook_age_ms)
+                for m in self._monitors
+            ],
+            dtype=np.float64,
+        )
+        lat_a, err_a, age_a = metrics[monitor_a].T
+        lat_b, err_b, age_b = metrics[monitor_b].T
+        
+        latency_penalty = (lat_a + lat_b) / 2.0 * 0.1
+        freshness_a = np.maximum(0.0, (age_a - 1000.0) / 100.0)
+        freshness_b = np.maximum(0.0, (age_b - 1000.0) / 100.0)
+        score = (
+            100.0
+            - latency_penalty
+            - err_a * 200.0
+            - err_b * 200.0
+            - freshness_a
+            - freshness_b
+        )
+        score = np.maximum(0.0, np.minimum(100.0, score))
+        return np.where(monitored, score, 100.0)
+
+
 class UniverseProvider:
     """
     Arbitrage Universe Provider.
@@ -75,6 +316,7 @@ class UniverseProvider:
         top_n: int = 10,
         custom_symbols: Optional[List[Tuple[str, str]]] = None,
         min_score_threshold: float = 50.0,
+        vectorized: bool = True,
     ):
         """
         Args:
@@ -83,14 +325,18 @@ class UniverseProvider:
             custom_symbols: CUSTOM_LIST 모드일 때 symbol 리스트
                 [(symbol_a, symbol_b), ...]
             min_score_threshold: 최소 score threshold (이하는 필터링)
+            vectorized: True면 VectorizedRouteScorer로 일괄 평가,
+                False면 route별 ArbRoute.evaluate 호출
         """
         self.mode = mode
         self.top_n = top_n
         self.custom_symbols = custom_symbols or []
         self.min_score_threshold = min_score_threshold
+        self.vectorized = vectorized
         
         # Route cache
         self._route_cache: Dict[Tuple[str, str], ArbRoute] = {}
+        self._scorer = VectorizedRouteScorer()
     
     def register_route(
         self,
@@ -113,6 +359,11 @@ class UniverseProvider:
             min_spread_bps=min_spread_bps,
         )
         self._route_cache[(symbol_a, symbol_b)] = route
+        self._scorer.add_route(route)
+    
+    def refresh_route_params(self) -> None:
+        """등록된 route의 MarketSpec/FeeModel/monitor 변경을 벡터화 scorer에 반영"""
+        self._scorer.refresh()
     
     def evaluate_universe(
         self,
@@ -129,6 +380,95 @@ class UniverseProvider:
         Returns:
             UniverseDecision
         """
+        if self.vectorized:
+            return self._evaluate_vectorized(snapshots, inventory_state)
+        return self._evaluate_per_route(snapshots, inventory_state)
+    
+    def _evaluate_vectorized(
+        self,
+        snapshots: Dict[Tuple[str, str], OrderBookSnapshot],
+        inventory_state: Optional[Dict[Tuple[str, str], float]],
+    ) -> UniverseDecision:
+        """
+        벡터화 평가.
+        
+        CUSTOM_LIST 필터는 정렬과 무관하므로 scoring 전에 적용하고,
+        TOP_N은 argpartition으로 후보를 줄인 뒤 stable 정렬하여
+        per-route 경로(list.sort, 동점은 입력 순서)와 같은 순위를 만든다.
+        RouteRanking/ArbRouteDecision은 최종 선택된 route만 생성한다.
+        """
+        allowed = None
+        if self.mode == UniverseMode.CUSTOM_LIST:
+            allowed = set(self.custom_symbols)
+        
+        batch = self._scorer.score(snapshots, inventory_state, allowed=allowed)
+        
+        # 1. SKIP / score < 50 (ArbRoute) / threshold 필터
+        total = batch.total_score
+        valid = (
+            (batch.direction != _DIRECTION_SKIP)
+            & (total >= 50.0)
+            & (total >= self.min_score_threshold)
+        )
+        candidates = np.flatnonzero(valid)
+        scores = total[candidates]
+        
+        # 2. TOP_N: k번째 점수 이상(동점 포함)만 남긴 뒤 정렬
+        if self.mode == UniverseMode.TOP_N and 0 < self.top_n < len(candidates):
+            kth = np.argpartition(-scores, self.top_n - 1)[self.top_n - 1]
+            keep = scores >= scores[kth]
+            candidates = candidates[keep]
+            scores = scores[keep]
+        
+        # 3. Score 내림차순 (stable)
+        order = candidates[np.argsort(-scores, kind="stable")]
+        if self.mode == UniverseMode.TOP_N:
+            order = order[:self.top_n]
+        
+        rankings = [self._materialize(batch, int(i)) for i in order]
+        
+        return UniverseDecision(
+            ranked_routes=rankings,
+            mode=self.mode,
+            total_candidates=len(snapshots),
+            valid_routes=len(rankings),
+        )
+    
+    @staticmethod
+    def _materialize(batch: RouteScoreBatch, i: int) -> RouteRanking:
+        """배치 결과 i번째 route를 RouteRanking으로 변환"""
+        symbol_a, symbol_b = batch.keys[i]
+        direction = _DIRECTIONS[int(batch.direction[i])]
+        gross_spread = float(batch.gross_spread[i])
+        score = float(batch.total_score[i])
+        reason = f"Good opportunity: spread={gross_spread:.2f}bps, score={score:.1f}"
+        
+        decision = ArbRouteDecision(
+            direction=direction,
+            score=score,
+            reason=reason,
+            route_score=RouteScore(
+                spread_score=float(batch.spread_score[i]),
+                health_score=float(batch.health_score[i]),
+                fee_score=float(batch.fee_score[i]),
+                inventory_penalty=float(batch.inventory_penalty[i]),
+            ),
+        )
+        return RouteRanking(
+            symbol_a=symbol_a,
+            symbol_b=symbol_b,
+            direction=direction,
+            score=score,
+            reason=reason,
+            decision=decision,
+        )
+    
+    def _evaluate_per_route(
+        self,
+        snapshots: Dict[Tuple[str, str], OrderBookSnapshot],
+        inventory_state: Optional[Dict[Tuple[str, str], float]],
+    ) -> UniverseDecision:
+        """Route별 ArbRoute.evaluate 평가 (기존 경로)"""
         inventory_state = inventory_state or {}
         
         # 1. 모든 route 평가
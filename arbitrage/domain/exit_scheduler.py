@@ -0,0 +1,401 @@
+"""
+D77-0: Exit Scheduler
+
+ExitStrategy.check_exit를 모든 열린 position에 매 iteration 호출하는 대신,
+조건을 넘은 position만 평가:
+- TIME_LIMIT: 계층형 타이머 휠 (deadline 만료 시에만 평가)
+- TP/SL: price_a - price_b 기준 트리거 레벨로 변환, 심볼별 정렬 리스트로 인덱싱
+- Spread reversal: 임계값 미만일 때 해당 심볼 position 평가
+
+트리거된 후보만 ExitStrategy.check_exit로 최종 판단하므로 사유 우선순위
+(TP > SL > TIME > SPREAD)와 결과는 전체 스캔과 같다.
+"""
+
+import math
+import time
+from bisect import bisect_left, bisect_right, insort
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Hashable, List, Optional, Set, Tuple
+
+from arbitrage.domain.exit_strategy import ExitDecision, ExitStrategy
+
+# 트리거 레벨 비교 허용 오차 (가격 규모 대비, check_exit 부동소수 오차 흡수)
+TRIGGER_RELATIVE_TOLERANCE = 1e-9
+
+
+class TimerWheel:
+    """
+    계층형 타이머 휠.
+    
+    Level 0 slot 하나가 tick_seconds, 상위 level은 slots_per_level배씩 넓다.
+    Deadline은 tick 단위로 올림하므로 만료는 deadline 이전에 발생하지 않고
+    최대 tick_seconds 늦다. 범위를 넘는 deadline은 overflow에 두었다가 재배치.
+    """
+    
+    def __init__(
+        self,
+        tick_seconds: float = 0.1,
+        slots_per_level: int = 64,
+        levels: int = 4,
+        start_time: Optional[float] = None,
+    ):
+        """
+        Args:
+            tick_seconds: Level 0 slot 크기 (초)
+            slots_per_level: Level당 slot 수
+            levels: Level 수
+            start_time: 시작 시각 (기본: time.time())
+        """
+        if tick_seconds <= 0:
+            raise ValueError("tick_seconds must be positive")
+        if slots_per_level < 2 or levels < 1:
+            raise ValueError("slots_per_level >= 2 and levels >= 1 required")
+        
+        self.tick_seconds = tick_seconds
+        self.slots_per_level = slots_per_level
+        self.levels = levels
+        
+        # slot: {key: deadline_tick}
+        self._wheels: List[List[Dict[Hashable, int]]] = [
+            [{} for _ in range(slots_per_level)] for _ in range(levels)
+        ]
+        self._overflow: Dict[Hashable, int] = {}
+        self._expired: Dict[Hashable, int] = {}  # 이미 지난 deadline (다음 advance에서 반환)
+        self._locations: Dict[Hashable, Dict[Hashable, int]] = {}  # key -> 소속 slot
+        
+        start = time.time() if start_time is None else start_time
+        self._tick = math.floor(start / tick_seconds)
+    
+    def __len__(self) -> int:
+        return len(self._locations)
+    
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._locations
+    
+    @property
+    def current_time(self) -> float:
+        """휠이 처리한 마지막 tick 시각"""
+        return self._tick * self.tick_seconds
+    
+    def schedule(self, key: Hashable, deadline: float) -> None:
+        """Deadline 등록 (같은 key가 있으면 교체)"""
+        self.cancel(key)
+        self._insert(key, math.ceil(deadline / self.tick_seconds))
+    
+    def cancel(self, key: Hashable) -> bool:
+        """Deadline 취소"""
+        bucket = self._locations.pop(key, None)
+        if bucket is None:
+            return False
+        del bucket[key]
+        return True
+    
+    def advance(self, now: float) -> List[Hashable]:
+        """
+        now까지 휠 진행.
+        
+        Returns:
+            만료된 key 목록 (만료 순서)
+        """
+        target = math.floor(now / self.tick_seconds)
+        fired = self._drain(self._expired)
+        slots = self.slots_per_level
+        
+        while self._tick < target:
+            if not self._locations:
+                self._tick = target
+                break
+            self._tick += 1
+            tick = self._tick
+            
+            # 상위 level cascade (level L slot 경계마다 한 단계 아래로 재배치)
+            span = 1
+            for level in range(1, self.levels):
+                span *= slots
+                if tick % span:
+                    break
+                self._cascade(self._wheels[level][(tick // span) % slots])
+            else:
+                self._cascade(self._overflow)
+            
+            fired.extend(self._drain(self._expired))
+            fired.extend(self._drain(self._wheels[0][tick % slots]))
+        
+        return fired
+    
+    def _insert(self, key: Hashable, deadline_tick: int) -> None:
+        delta = deadline_tick - self._tick
+        if delta <= 0:
+            bucket = self._expired
+        else:
+            bucket = self._overflow
+            slots = self.slots_per_level
+            span = 1
+            for level in range(self.levels):
+                if delta < span * slots:
+                    bucket = self._wheels[level][(deadline_tick // span) % slots]
+                    break
+                span *= slots
+        bucket[key] = deadline_tick
+        self._locations[key] = bucket
+    
+    def _cascade(self, bucket: Dict[Hashable, int]) -> None:
+        if not bucket:
+            return
+        items = list(bucket.items())
+        bucket.clear()
+        for key, deadline_tick in items:
+            self._insert(key, deadline_tick)
+    
+    def _drain(self, bucket: Dict[Hashable, int]) -> List[Hashable]:
+        if not bucket:
+            return []
+        keys = list(bucket)
+        bucket.clear()
+        for key in keys:
+            del self._locations[key]
+        return keys
+
+
+@dataclass
+class SymbolTriggers:
+    """심볼별 트리거 인덱스"""
+    take_profit: List[Tuple[float, int]] = field(default_factory=list)  # (x 하한, position_id) 오름차순
+    stop_loss: List[Tuple[float, int]] = field(default_factory=list)  # (x 상한, position_id) 오름차순
+    levels: Dict[int, Tuple[float, float]] = field(default_factory=dict)  # position_id -> (tp, sl)
+    positions: Set[int] = field(default_factory=set)
+    unindexed: Set[int] = field(default_factory=set)  # entry_price_a <= 0 (항상 평가)
+    due: Set[int] = field(default_factory=set)  # TIME_LIMIT 만료 (exit 전까지 매번 평가)
+    scale: float = 0.0  # 최대 |entry_price_a| + |entry_price_b| (허용 오차 계산용)
+    book: Optional[Tuple[float, float, float]] = None  # 마지막 (price_a, price_b, spread_bps)
+
+
+def _remove_sorted(items: List[Tuple[float, int]], item: Tuple[float, int]) -> None:
+    index = bisect_left(items, item)
+    if index < len(items) and items[index] == item:
+        del items[index]
+
+
+class ExitScheduler:
+    """
+    이벤트 기반 Exit 스케줄러.
+    
+    ExitStrategy에 position을 등록하면서 TP/SL 레벨과 TIME_LIMIT deadline을
+    인덱싱한다. on_book_update()는 레벨을 넘은 position만, poll()은 deadline이
+    (1 tick 이내로) 다가온 position만 ExitStrategy.check_exit로 평가한다.
+    
+    PnL% = ((price_a - price_b) - (entry_a - entry_b)) / entry_a * 100 이므로
+    TP/SL은 x = price_a - price_b에 대한 단일 레벨로 변환된다.
+    ExitConfig를 바꾼 뒤에는 position을 다시 track()해야 한다.
+    """
+    
+    def __init__(
+        self,
+        strategy: ExitStrategy,
+        tick_seconds: float = 0.1,
+        clock: Callable[[], float] = time.time,
+    ):
+        """
+        Args:
+            strategy: Exit 판단을 위임할 ExitStrategy
+            tick_seconds: TIME_LIMIT 타이머 해상도 (초)
+            clock: 현재 시각 함수
+        """
+        self.strategy = strategy
+        self.clock = clock
+        self.timers = TimerWheel(tick_seconds=tick_seconds, start_time=clock())
+        
+        self._symbols: Dict[str, SymbolTriggers] = {}
+        self._position_symbols: Dict[int, str] = {}
+        
+        self.stats = {
+            "book_updates": 0,
+            "exit_checks": 0,
+            "exit_signals": 0,
+            "timer_expirations": 0,
+        }
+    
+    def register_position(
+        self,
+        position_id: int,
+        symbol_a: str,
+        symbol_b: str,
+        entry_price_a: float,
+        entry_price_b: float,
+        entry_spread_bps: float,
+        size: float,
+    ) -> None:
+        """ExitStrategy 등록 + 트리거 인덱싱 (Entry 시점)"""
+        self.strategy.register_position(
+            position_id=position_id,
+            symbol_a=symbol_a,
+            symbol_b=symbol_b,
+            entry_price_a=entry_price_a,
+            entry_price_b=entry_price_b,
+            entry_spread_bps=entry_spread_bps,
+            size=size,
+            open_time=self.clock(),
+        )
+        self.track(position_id)
+    
+    def unregister_position(self, position_id: int) -> None:
+        """인덱스 + ExitStrategy에서 제거 (Exit 완료 시)"""
+        self.untrack(position_id)
+        self.strategy.unregister_position(position_id)
+    
+    def track(self, position_id: int) -> bool:
+        """
+        ExitStrategy에 이미 등록된 position 인덱싱 (복원/설정 변경 시).
+        
+        Returns:
+            인덱싱 여부 (ExitStrategy에 없으면 False)
+        """
+        position = self.strategy.get_position(position_id)
+        if position is None:
+            return False
+        self.untrack(position_id)
+        
+        config = self.strategy.config
+        symbol = position.symbol_a
+        triggers = self._symbols.get(symbol)
+        if triggers is None:
+            triggers = self._symbols[symbol] = SymbolTriggers()
+        
+        entry_a = position.entry_price_a
+        entry_b = position.entry_price_b
+        if entry_a > 0:
+            base = entry_a - entry_b
+            tp_level = base + config.tp_threshold_pct * entry_a / 100.0
+            sl_level = base - config.sl_threshold_pct * entry_a / 100.0
+            insort(triggers.take_profit, (tp_level, position_id))
+            insort(triggers.stop_loss, (sl_level, position_id))
+            triggers.levels[position_id] = (tp_level, sl_level)
+            triggers.scale = max(triggers.scale, abs(entry_a) + abs(entry_b))
+        else:
+            triggers.unindexed.add(position_id)
+        
+        triggers.positions.add(position_id)
+        self._position_symbols[position_id] = symbol
+        self.timers.schedule(position_id, position.open_time + config.max_hold_time_seconds)
+        return True
+    
+    def untrack(self, position_id: int) -> None:
+        """Position 인덱스 제거"""
+        symbol = self._position_symbols.pop(position_id, None)
+        if symbol is None:
+            return
+        self.timers.cancel(position_id)
+        
+        triggers = self._symbols[symbol]
+        levels = triggers.levels.pop(position_id, None)
+        if levels is not None:
+            _remove_sorted(triggers.take_profit, (levels[0], position_id))
+            _remove_sorted(triggers.stop_loss, (levels[1], position_id))
+        triggers.positions.discard(position_id)
+        triggers.unindexed.discard(position_id)
+        triggers.due.discard(position_id)
+        if not triggers.positions:
+            del self._symbols[symbol]
+    
+    def tracked_symbols(self) -> List[str]:
+        """열린 position이 있는 심볼 목록"""
+        return list(self._symbols)
+    
+    def on_book_update(
+        self,
+        symbol: str,
+        price_a: float,
+        price_b: float,
+        spread_bps: float,
+        now: Optional[float] = None,
+    ) -> List[Tuple[int, ExitDecision]]:
+        """
+        호가 갱신 처리.
+        
+        Args:
+            symbol: Position symbol_a
+            price_a: 현재 price A
+            price_b: 현재 price B
+            spread_bps: 현재 spread (bps)
+            now: 현재 시각 (기본: clock())
+        
+        Returns:
+            Exit 대상 [(position_id, ExitDecision)] (position_id 순)
+        """
+        now = self.clock() if now is None else now
+        self._advance(now)
+        self.stats["book_updates"] += 1
+        
+        triggers = self._symbols.get(symbol)
+        if triggers is None:
+            return []
+        triggers.book = (price_a, price_b, spread_bps)
+        
+        if spread_bps < self.strategy.config.spread_reversal_threshold_bps:
+            candidates = set(triggers.positions)
+        else:
+            x = price_a - price_b
+            tolerance = TRIGGER_RELATIVE_TOLERANCE * (abs(price_a) + abs(price_b) + triggers.scale)
+            tp_end = bisect_right(triggers.take_profit, (x + tolerance, math.inf))
+            sl_start = bisect_left(triggers.stop_loss, (x - tolerance, -math.inf))
+            candidates = triggers.due | triggers.unindexed
+            candidates.update(position_id for _, position_id in triggers.take_profit[:tp_end])
+            candidates.update(position_id for _, position_id in triggers.stop_loss[sl_start:])
+        
+        return self._check(candidates, triggers.book, now)
+    
+    def poll(self, now: Optional[float] = None) -> List[Tuple[int, ExitDecision]]:
+        """
+        타이머 진행 (호가 갱신 없이 TIME_LIMIT 처리).
+        
+        마지막 호가가 있는 심볼의 만료 position만 평가하고, 나머지는
+        다음 on_book_update()에서 평가한다.
+        
+        Returns:
+            Exit 대상 [(position_id, ExitDecision)]
+        """
+        now = self.clock() if now is None else now
+        decisions = []
+        for position_id in self._advance(now):
+            triggers = self._symbols[self._position_symbols[position_id]]
+            if triggers.book is not None:
+                decisions.extend(self._check((position_id,), triggers.book, now))
+        return decisions
+    
+    def get_stats(self) -> Dict[str, int]:
+        """스케줄러 통계"""
+        return {
+            **self.stats,
+            "tracked_positions": len(self._position_symbols),
+            "pending_timers": len(self.timers),
+        }
+    
+    def _advance(self, now: float) -> List[int]:
+        # 1 tick 먼저 꺼내고 check_exit로 확정 (tick 올림으로 인한 지연 없음)
+        expired = self.timers.advance(now + self.timers.tick_seconds)
+        for position_id in expired:
+            self._symbols[self._position_symbols[position_id]].due.add(position_id)
+        self.stats["timer_expirations"] += len(expired)
+        return expired
+    
+    def _check(
+        self,
+        candidates,
+        book: Tuple[float, float, float],
+        now: float,
+    ) -> List[Tuple[int, ExitDecision]]:
+        price_a, price_b, spread_bps = book
+        decisions = []
+        for position_id in sorted(candidates):
+            decision = self.strategy.check_exit(
+                position_id=position_id,
+                current_price_a=price_a,
+                current_price_b=price_b,
+                current_spread_bps=spread_bps,
+                now=now,
+            )
+            if decision.should_exit:
+                decisions.append((position_id, decision))
+        self.stats["exit_checks"] += len(candidates)
+        self.stats["exit_signals"] += len(decisions)
+        return decisions
@@ -59,9 +59,9 @@ class PositionState:
     entry_spread_bps: float
     size: float
     
-    def time_held(self) -> float:
+    def time_held(self, now: Optional[float] = None) -> float:
         """Position hold time (seconds)"""
-        return time.time() - self.open_time
+        return (time.time() if now is None else now) - self.open_time
 
 
 @dataclass
@@ -111,6 +111,7 @@ class ExitStrategy:
         entry_price_b: float,
         entry_spread_bps: float,
         size: float,
+        open_time: Optional[float] = None,
     ) -> None:
         """
         Position 등록 (Entry 시점).
@@ -123,12 +124,13 @@ class ExitStrategy:
             entry_price_b: Entry price B
             entry_spread_bps: Entry spread (bps)
             size: Position size
+            open_time: Entry 시각 (기본: 현재 시각)
         """
         self._positions[position_id] = PositionState(
             position_id=position_id,
             symbol_a=symbol_a,
             symbol_b=symbol_b,
-            open_time=time.time(),
+            open_time=time.time() if open_time is None else open_time,
             entry_price_a=entry_price_a,
             entry_price_b=entry_price_b,
             entry_spread_bps=entry_spread_bps,
@@ -141,6 +143,7 @@ class ExitStrategy:
         current_price_a: float,
         current_price_b: float,
         current_spread_bps: float,
+        now: Optional[float] = None,
     ) -> ExitDecision:
         """
         Exit 조건 체크.
@@ -150,6 +153,7 @@ class ExitStrategy:
             current_price_a: 현재 price A
             current_price_b: 현재 price B
             current_spread_bps: 현재 spread (bps)
+            now: 현재 시각 (기본: time.time())
         
         Returns:
             ExitDecision
@@ -169,7 +173,7 @@ class ExitStrategy:
             current_price_b,
         )
         
-        time_held = position.time_held()
+        time_held = position.time_held(now)
         
         # 1. Take Profit
         if current_pnl_pct >= self.config.tp_threshold_pct:
@@ -238,6 +242,15 @@ class ExitStrategy:
         """
         self._positions.pop(position_id, None)
     
+    def get_position(self, position_id: int) -> Optional[PositionState]:
+        """
+        Position 조회.
+        
+        Returns:
+            PositionState (없으면 None)
+        """
+        return self._positions.get(position_id)
+    
     def get_open_positions(self) -> Dict[int, PositionState]:
         """
         열린 position 목록.
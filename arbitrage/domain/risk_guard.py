@@ -11,9 +11,12 @@ D75-5: 4-Tier RiskGuard
 """
 
 import time
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
 
 from arbitrage.domain.arb_route import RouteScore
 from arbitrage.infrastructure.exchange_health import ExchangeHealthStatus, HealthMetrics
@@ -86,7 +89,7 @@ class RiskGuardDecision:
     degraded: bool  # 축소 허용 여부
     cooldown_seconds: float  # Cooldown 시간
     max_notional: Optional[float]  # 최대 거래 금액
-    tier_decisions: Dict[GuardTier, TierDecision] = field(default_factory=dict)
+    tier_decisions: Mapping = field(default_factory=dict)  # GuardTier -> TierDecision
     timestamp: float = 0.0
     
     def __post_init__(self):
@@ -106,6 +109,46 @@ class RiskGuardDecision:
         return "; ".join(blocked_tiers)
 
 
+class LazyTierDecisions(Mapping):
+    """
+    Tier별 TierDecision을 처음 조회할 때 생성하는 Mapping.
+    
+    Compiled plan 경로는 결정 코드만 계산하고, reason/details 문자열은
+    로깅/알림 등으로 tier_decisions를 읽는 시점에 만든다.
+    """
+    
+    __slots__ = ("_builder", "_decisions")
+    
+    def __init__(self, builder: Callable[[], Dict[GuardTier, TierDecision]]):
+        self._builder = builder
+        self._decisions: Optional[Dict[GuardTier, TierDecision]] = None
+    
+    @property
+    def loaded(self) -> bool:
+        """TierDecision 생성 여부"""
+        return self._decisions is not None
+    
+    def _load(self) -> Dict[GuardTier, TierDecision]:
+        if self._decisions is None:
+            self._decisions = self._builder()
+            self._builder = None
+        return self._decisions
+    
+    def __getitem__(self, tier: GuardTier) -> TierDecision:
+        return self._load()[tier]
+    
+    def __iter__(self) -> Iterator[GuardTier]:
+        return iter(self._load())
+    
+    def __len__(self) -> int:
+        return len(self._load())
+    
+    def __repr__(self) -> str:
+        if self._decisions is None:
+            return "LazyTierDecisions(<pending>)"
+        return f"LazyTierDecisions({self._decisions!r})"
+
+
 # ============================================================================
 # Configuration Classes
 # ============================================================================
@@ -230,6 +273,168 @@ class GlobalState:
     cross_exchange_exposure_risk: float  # Cross-exchange exposure risk (0.0 ~ 1.0)
 
 
+# ============================================================================
+# Compiled Evaluation Plan
+# ============================================================================
+
+# 결정 코드 (값이 클수록 보수적: BLOCK > COOLDOWN_ONLY > DEGRADE > ALLOW)
+DECISION_ALLOW = 1
+DECISION_DEGRADE = 2
+DECISION_COOLDOWN = 3
+DECISION_BLOCK = 4
+
+DECISION_TYPES = {
+    DECISION_ALLOW: GuardDecisionType.ALLOW,
+    DECISION_DEGRADE: GuardDecisionType.DEGRADE,
+    DECISION_COOLDOWN: GuardDecisionType.COOLDOWN_ONLY,
+    DECISION_BLOCK: GuardDecisionType.BLOCK,
+}
+
+# RouteScore.inventory_penalty 하한 (미만이면 DEGRADE)
+ROUTE_INVENTORY_PENALTY_FLOOR = 50.0
+
+# CompiledGuardPlan.thresholds 배열 순서
+THRESHOLD_FIELDS = (
+    "exchange_max_daily_loss_usd",
+    "exchange_rate_limit_buffer_pct",
+    "route_min_score",
+    "route_max_streak_loss",
+    "route_abnormal_spread_bps",
+    "route_cooldown_seconds",
+    "symbol_max_exposure_ratio",
+    "symbol_max_dd_ratio",
+    "symbol_high_volatility",
+    "global_max_daily_loss_usd",
+    "global_max_total_exposure_usd",
+    "global_max_imbalance_ratio",
+    "global_max_exposure_risk",
+)
+
+
+def _route_row(route_state: RouteState) -> Tuple[float, float, float, float, float, float]:
+    """evaluate_many 배열 행: (spread, score 유무, spread/health/fee score, inventory penalty)"""
+    score = route_state.route_score
+    if not score:
+        return (route_state.gross_spread_bps, 0.0, 0.0, 0.0, 0.0, 0.0)
+    return (
+        route_state.gross_spread_bps,
+        1.0,
+        score.spread_score,
+        score.health_score,
+        score.fee_score,
+        score.inventory_penalty,
+    )
+
+
+class CompiledGuardPlan:
+    """
+    FourTierRiskGuardConfig를 평탄화한 평가 plan.
+    
+    임계값은 THRESHOLD_FIELDS 순서의 float64 배열(thresholds, 배치 경로용)과
+    같은 값의 float 속성(단건 경로용)으로 보관한다.
+    config를 수정한 뒤에는 FourTierRiskGuard.recompile()을 호출해야 한다.
+    """
+    
+    __slots__ = THRESHOLD_FIELDS + (
+        "thresholds",
+        "exchange_block_on_down",
+        "exchange_degrade_on_degraded",
+    )
+    
+    def __init__(self, thresholds: np.ndarray, block_on_down: bool, degrade_on_degraded: bool):
+        self.thresholds = thresholds
+        for name, value in zip(THRESHOLD_FIELDS, thresholds.tolist()):
+            setattr(self, name, value)
+        self.exchange_block_on_down = block_on_down
+        self.exchange_degrade_on_degraded = degrade_on_degraded
+    
+    @classmethod
+    def compile(cls, config: FourTierRiskGuardConfig) -> "CompiledGuardPlan":
+        """Config → plan"""
+        thresholds = np.array([
+            config.exchange.max_daily_loss_usd,
+            config.exchange.rate_limit_buffer_pct,
+            config.route.min_route_score,
+            config.route.max_streak_loss,
+            config.route.abnormal_spread_threshold_bps,
+            config.route.cooldown_after_streak_loss,
+            config.symbol.max_exposure_ratio,
+            config.symbol.max_dd_ratio,
+            config.symbol.high_volatility_threshold,
+            config.global_guard.max_global_daily_loss_usd,
+            config.global_guard.max_total_exposure_usd,
+            config.global_guard.max_imbalance_ratio,
+            config.global_guard.max_exposure_risk,
+        ], dtype=np.float64)
+        return cls(
+            thresholds,
+            bool(config.exchange.health_status_block_on_down),
+            bool(config.exchange.health_status_degrade_on_degraded),
+        )
+    
+    def global_code(self, state: GlobalState) -> int:
+        """Tier 4 결정 코드 (스칼라 비교 4회)"""
+        if (
+            state.global_daily_loss_usd > self.global_max_daily_loss_usd
+            or state.total_exposure_usd > self.global_max_total_exposure_usd
+            or abs(state.cross_exchange_imbalance_ratio) > self.global_max_imbalance_ratio
+        ):
+            return DECISION_BLOCK
+        if state.cross_exchange_exposure_risk > self.global_max_exposure_risk:
+            return DECISION_DEGRADE
+        return DECISION_ALLOW
+    
+    def exchange_code(self, exchange_states: Dict[str, ExchangeState]) -> int:
+        """Tier 1 결정 코드 (첫 BLOCK에서 종료)"""
+        code = DECISION_ALLOW
+        for state in exchange_states.values():
+            status = state.health_status
+            if (
+                (status == ExchangeHealthStatus.DOWN and self.exchange_block_on_down)
+                or status == ExchangeHealthStatus.FROZEN
+                or state.daily_loss_usd > self.exchange_max_daily_loss_usd
+            ):
+                return DECISION_BLOCK
+            if (
+                (status == ExchangeHealthStatus.DEGRADED and self.exchange_degrade_on_degraded)
+                or state.rate_limit_remaining_pct < self.exchange_rate_limit_buffer_pct
+            ):
+                code = DECISION_DEGRADE
+        return code
+    
+    def symbol_code(self, symbol_states: Dict[str, SymbolState], total_portfolio_value: float) -> int:
+        """
+        Tier 3 결정 코드.
+        
+        _evaluate_symbol과 같은 순서로 갱신한다 (뒤 심볼의 exposure 초과가 앞 심볼의
+        BLOCK을 DEGRADE로 바꾸므로 루프 중간에 종료하지 않음).
+        """
+        code = DECISION_ALLOW
+        for state in symbol_states.values():
+            if state.get_exposure_ratio(total_portfolio_value) > self.symbol_max_exposure_ratio:
+                code = DECISION_DEGRADE
+            if code == DECISION_ALLOW:
+                if state.get_drawdown_ratio() > self.symbol_max_dd_ratio:
+                    code = DECISION_BLOCK
+                elif state.volatility_proxy > self.symbol_high_volatility:
+                    code = DECISION_DEGRADE
+        return code
+    
+    def route_code(self, route_state: RouteState, streak_hit: bool) -> int:
+        """Tier 2 결정 코드 (cooldown 중이 아닐 때)"""
+        if route_state.gross_spread_bps > self.route_abnormal_spread_bps:
+            return DECISION_DEGRADE
+        if streak_hit:
+            return DECISION_BLOCK
+        score = route_state.route_score
+        if score:
+            if score.total_score() < self.route_min_score:
+                return DECISION_BLOCK
+            if score.inventory_penalty < ROUTE_INVENTORY_PENALTY_FLOOR:
+                return DECISION_DEGRADE
+        return DECISION_ALLOW
+
+
 # ============================================================================
 # Core RiskGuard Class
 # ============================================================================
@@ -239,18 +444,33 @@ class FourTierRiskGuard:
     4-Tier RiskGuard.
     
     각 Tier를 독립적으로 평가하고, 가장 보수적인 결정을 최종 결정으로 사용.
+    
+    evaluate()/evaluate_many()는 CompiledGuardPlan으로 결정 코드만 계산하고
+    BLOCK이 확정되면 나머지 Tier를 건너뛴다. Route cooldown(상태 변경)은 항상
+    먼저 처리하므로 결정/cooldown은 evaluate_full()과 동일하다.
     """
     
-    def __init__(self, config: FourTierRiskGuardConfig):
+    def __init__(
+        self,
+        config: FourTierRiskGuardConfig,
+        clock: Callable[[], float] = time.time,
+    ):
         """
         Args:
             config: 4-Tier RiskGuard 설정
+            clock: 현재 시각 함수 (cooldown 계산용)
         """
         self.config = config
+        self.clock = clock
+        self.plan = CompiledGuardPlan.compile(config)
         
         # Tier별 cooldown 추적
         self._route_cooldown_until: Dict[Tuple[str, str], float] = {}  # (symbol_a, symbol_b) -> cooldown_until
     
+    def recompile(self) -> None:
+        """Config 변경 후 평가 plan 재생성"""
+        self.plan = CompiledGuardPlan.compile(self.config)
+    
     def evaluate(
         self,
         exchange_states: Dict[str, ExchangeState],  # exchange_name -> ExchangeState
@@ -259,7 +479,11 @@ class FourTierRiskGuard:
         global_state: GlobalState,
     ) -> RiskGuardDecision:
         """
-        4-Tier RiskGuard 평가.
+        4-Tier RiskGuard 평가 (compiled plan, 단락 평가).
+        
+        평가 순서: Route cooldown/streak → Global → Exchange → Symbol → Route 나머지.
+        tier_decisions는 처음 조회될 때 생성되며, 그 사이 상태 객체를 수정하면
+        reason이 최종 결정과 어긋날 수 있다.
         
         Args:
             exchange_states: 거래소별 상태
@@ -267,6 +491,118 @@ class FourTierRiskGuard:
             symbol_states: Symbol별 상태
             global_state: Global 상태
         
+        Returns:
+            RiskGuardDecision
+        """
+        plan = self.plan
+        now = self.clock()
+        cooldown_until, cooling, streak_hit, cooldown_seconds = self._route_cooldown_stage(
+            plan, route_state, now
+        )
+        
+        code = DECISION_COOLDOWN if cooling else plan.route_code(route_state, streak_hit)
+        if code != DECISION_BLOCK:
+            code = max(code, plan.global_code(global_state))
+        if code != DECISION_BLOCK:
+            code = max(code, plan.exchange_code(exchange_states))
+        if code != DECISION_BLOCK:
+            code = max(
+                code,
+                plan.symbol_code(symbol_states, global_state.total_portfolio_value_usd),
+            )
+        
+        return RiskGuardDecision(
+            allow=code == DECISION_ALLOW,
+            degraded=code == DECISION_DEGRADE,
+            cooldown_seconds=max(0.0, cooldown_seconds),
+            max_notional=None,
+            tier_decisions=LazyTierDecisions(self._tier_builder(
+                exchange_states, route_state, symbol_states, global_state, cooldown_until, now
+            )),
+            timestamp=now,
+        )
+    
+    def evaluate_many(
+        self,
+        exchange_states: Dict[str, ExchangeState],
+        route_states: Sequence[RouteState],
+        symbol_states: Dict[str, SymbolState],
+        global_state: GlobalState,
+    ) -> List[RiskGuardDecision]:
+        """
+        여러 후보 Route 배치 평가.
+        
+        Exchange/Symbol/Global Tier는 1회만 평가하고, Route Tier는 spread/score를
+        배열로 모아 벡터 연산한다. Cooldown 처리는 입력 순서대로 진행하므로
+        결과는 route마다 evaluate()를 순서대로 호출한 것과 같다.
+        
+        Returns:
+            route_states 순서의 RiskGuardDecision 리스트
+        """
+        plan = self.plan
+        now = self.clock()
+        count = len(route_states)
+        if count == 0:
+            return []
+        
+        # Route cooldown/streak (상태 변경, 순차 처리)
+        stages = [self._route_cooldown_stage(plan, route_state, now) for route_state in route_states]
+        cooldown_untils, cooling, streak_hit, cooldowns = zip(*stages)
+        
+        # 공통 Tier (BLOCK이면 나머지 생략)
+        shared_code = plan.global_code(global_state)
+        if shared_code != DECISION_BLOCK:
+            shared_code = max(shared_code, plan.exchange_code(exchange_states))
+        if shared_code != DECISION_BLOCK:
+            shared_code = max(
+                shared_code,
+                plan.symbol_code(symbol_states, global_state.total_portfolio_value_usd),
+            )
+        
+        # Route Tier 벡터 평가 (RouteScore.total_score와 같은 연산 순서)
+        spreads, scored, *components = np.array(
+            [_route_row(route_state) for route_state in route_states], dtype=np.float64
+        ).T
+        has_score = scored > 0.0
+        total_scores = (
+            components[0] * 0.4
+            + components[1] * 0.3
+            + components[2] * 0.2
+            + components[3] * 0.1
+        )
+        
+        route_codes = np.full(count, DECISION_ALLOW, dtype=np.int8)
+        route_codes[has_score & (components[3] < ROUTE_INVENTORY_PENALTY_FLOOR)] = DECISION_DEGRADE
+        route_codes[has_score & (total_scores < plan.route_min_score)] = DECISION_BLOCK
+        route_codes[np.array(streak_hit, dtype=bool)] = DECISION_BLOCK
+        route_codes[spreads > plan.route_abnormal_spread_bps] = DECISION_DEGRADE
+        route_codes[np.array(cooling, dtype=bool)] = DECISION_COOLDOWN
+        codes = np.maximum(route_codes, shared_code).tolist()
+        
+        decisions = []
+        for i, route_state in enumerate(route_states):
+            decisions.append(RiskGuardDecision(
+                allow=codes[i] == DECISION_ALLOW,
+                degraded=codes[i] == DECISION_DEGRADE,
+                cooldown_seconds=max(0.0, cooldowns[i]),
+                max_notional=None,
+                tier_decisions=LazyTierDecisions(self._tier_builder(
+                    exchange_states, route_state, symbol_states, global_state, cooldown_untils[i], now
+                )),
+                timestamp=now,
+            ))
+        return decisions
+    
+    def evaluate_full(
+        self,
+        exchange_states: Dict[str, ExchangeState],
+        route_state: RouteState,
+        symbol_states: Dict[str, SymbolState],
+        global_state: GlobalState,
+    ) -> RiskGuardDecision:
+        """
+        4-Tier 전체 평가 (모든 Tier의 TierDecision 즉시 생성, reference 경로).
+        
         Returns:
             RiskGuardDecision
         """
@@ -289,6 +625,55 @@ class FourTierRiskGuard:
         # Aggregate: 가장 보수적인 결정 선택
         return self._aggregate_decisions(tier_decisions)
     
+    def _route_cooldown_stage(
+        self,
+        plan: CompiledGuardPlan,
+        route_state: RouteState,
+        now: float,
+    ) -> Tuple[Optional[float], bool, bool, float]:
+        """
+        Route cooldown/streak 처리 (만료 cooldown 삭제, streak loss 시 cooldown 설정).
+        
+        Returns:
+            (평가 전 cooldown_until, cooldown 중 여부, streak loss 여부, cooldown 초)
+        """
+        route_key = (route_state.symbol_a, route_state.symbol_b)
+        cooldown_until = self._route_cooldown_until.get(route_key)
+        if cooldown_until is not None:
+            if now < cooldown_until:
+                return cooldown_until, True, False, cooldown_until - now
+            # Cooldown 만료
+            del self._route_cooldown_until[route_key]
+            cooldown_until = None
+        
+        cooldown_seconds = 0.0
+        streak_hit = route_state.get_streak_loss_count() >= plan.route_max_streak_loss
+        if streak_hit:
+            cooldown_seconds = plan.route_cooldown_seconds
+            self._route_cooldown_until[route_key] = now + cooldown_seconds
+        return cooldown_until, False, streak_hit, cooldown_seconds
+    
+    def _tier_builder(
+        self,
+        exchange_states: Dict[str, ExchangeState],
+        route_state: RouteState,
+        symbol_states: Dict[str, SymbolState],
+        global_state: GlobalState,
+        cooldown_until: Optional[float],
+        now: float,
+    ) -> Callable[[], Dict[GuardTier, TierDecision]]:
+        """LazyTierDecisions용 builder"""
+        def build() -> Dict[GuardTier, TierDecision]:
+            return {
+                GuardTier.EXCHANGE: self._evaluate_exchange(exchange_states),
+                GuardTier.ROUTE: self._route_decision(route_state, cooldown_until, now),
+                GuardTier.SYMBOL: self._evaluate_symbol(
+                    symbol_states, global_state.total_portfolio_value_usd
+                ),
+                GuardTier.GLOBAL: self._evaluate_global(global_state),
+            }
+        return build
+    
     def _evaluate_exchange(
         self,
         exchange_states: Dict[str, ExchangeState],
@@ -344,27 +729,45 @@ class FourTierRiskGuard:
         self,
         route_state: RouteState,
     ) -> TierDecision:
-        """Tier 2: Route Guard 평가"""
+        """Tier 2: Route Guard 평가 (cooldown 상태 갱신 포함)"""
+        now = self.clock()
+        route_key = (route_state.symbol_a, route_state.symbol_b)
+        cooldown_until = self._route_cooldown_until.get(route_key)
+        if cooldown_until is not None and now >= cooldown_until:
+            # Cooldown 만료
+            del self._route_cooldown_until[route_key]
+            cooldown_until = None
+        
+        decision = self._route_decision(route_state, cooldown_until, now)
+        if (
+            decision.decision != GuardDecisionType.COOLDOWN_ONLY
+            and GuardReasonCode.ROUTE_STREAK_LOSS in decision.reasons
+        ):
+            # Set cooldown
+            self._route_cooldown_until[route_key] = now + decision.cooldown_seconds
+        return decision
+    
+    def _route_decision(
+        self,
+        route_state: RouteState,
+        cooldown_until: Optional[float],
+        now: float,
+    ) -> TierDecision:
+        """Tier 2 TierDecision 생성 (상태 변경 없음)"""
         config = self.config.route
         reasons = []
         decision_type = GuardDecisionType.ALLOW
         cooldown_seconds = 0.0
         
         # Cooldown check
-        route_key = (route_state.symbol_a, route_state.symbol_b)
-        if route_key in self._route_cooldown_until:
-            if time.time() < self._route_cooldown_until[route_key]:
-                remaining = self._route_cooldown_until[route_key] - time.time()
-                return TierDecision(
-                    tier=GuardTier.ROUTE,
-                    decision=GuardDecisionType.COOLDOWN_ONLY,
-                    cooldown_seconds=remaining,
-                    reasons=[GuardReasonCode.ROUTE_STREAK_LOSS],
-                    details=f"Cooldown until {self._route_cooldown_until[route_key]:.0f}"
-                )
-            else:
-                # Cooldown 만료
-                del self._route_cooldown_until[route_key]
+        if cooldown_until is not None and now < cooldown_until:
+            return TierDecision(
+                tier=GuardTier.ROUTE,
+                decision=GuardDecisionType.COOLDOWN_ONLY,
+                cooldown_seconds=cooldown_until - now,
+                reasons=[GuardReasonCode.ROUTE_STREAK_LOSS],
+                details=f"Cooldown until {cooldown_until:.0f}"
+            )
         
         # Route score check
         if route_state.route_score:
@@ -379,8 +782,6 @@ class FourTierRiskGuard:
             reasons.append(GuardReasonCode.ROUTE_STREAK_LOSS)
             decision_type = GuardDecisionType.BLOCK
             cooldown_seconds = config.cooldown_after_streak_loss
-            # Set cooldown
-            self._route_cooldown_until[route_key] = time.time() + cooldown_seconds
         
         # Abnormal spread check
         if route_state.gross_spread_bps > config.abnormal_spread_threshold_bps:
@@ -388,7 +789,7 @@ class FourTierRiskGuard:
             decision_type = GuardDecisionType.DEGRADE  # 의심스러운 spread → 사이즈 축소
         
         # Inventory penalty check (from RouteScore)
-        if route_state.route_score and route_state.route_score.inventory_penalty < 50.0:
+        if route_state.route_score and route_state.route_score.inventory_penalty < ROUTE_INVENTORY_PENALTY_FLOOR:
             reasons.append(GuardReasonCode.ROUTE_INVENTORY_PENALTY)
             if decision_type == GuardDecisionType.ALLOW:
                 decision_type = GuardDecisionType.DEGRADE
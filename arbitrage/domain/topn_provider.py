@@ -11,13 +11,19 @@ D77-0: TopN Universe Provider
 D77-0-RM:
 - data_source: "mock" | "real" 지원
 - Real Market 모드에서 Public Data Clients 사용
+
+Stale-while-revalidate:
+- background_refresh=True 시 TTL 만료 후에도 이전 결과를 즉시 반환하고
+  백그라운드 스레드에서 갱신
+- 갱신 결과의 추가/제거 심볼은 churn 이벤트로 통지
 """
 
 import logging
+import threading
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 
 import requests
 
@@ -76,6 +82,15 @@ class TopNResult:
     churn_rate: float = 0.0  # 이전 대비 변경 비율
 
 
+@dataclass
+class TopNChurnEvent:
+    """TopN 갱신 시 심볼 변경 이벤트"""
+    added: List[Tuple[str, str]]
+    removed: List[Tuple[str, str]]
+    result: TopNResult
+    timestamp: float = field(default_factory=time.time)
+
+
 @dataclass
 class SpreadSnapshot:
     """D82-1: 실시간 스프레드 스냅샷"""
@@ -129,8 +144,9 @@ class TopNProvider:
         max_spread_bps: float = 50.0,  # 0.5%
         # D82-3: Real Selection Rate Limit 옵션
         selection_rate_limit_enabled: bool = True,
-        selection_batch_size: int = 10,
+        selection_batch_size: int = 50,
         selection_batch_delay_sec: float = 1.5,
+        background_refresh: bool = False,
     ):
         """
         D82-2: Hybrid Mode initialization.
@@ -146,6 +162,9 @@ class TopNProvider:
             min_volume_usd: Minimum volume (USD)
             min_liquidity_usd: Minimum liquidity (USD)
             max_spread_bps: Maximum spread (bps)
+            selection_batch_size: Markets per multi-market ticker/orderbook request
+            selection_batch_delay_sec: Delay between request batches (seconds)
+            background_refresh: Serve stale cache while refreshing in background
         """
         self.mode = mode
         self.selection_data_source = selection_data_source
@@ -170,6 +189,12 @@ class TopNProvider:
         # Previous result (for churn calculation)
         self._previous_symbols: List[Tuple[str, str]] = []
         
+        # Stale-while-revalidate
+        self.background_refresh = background_refresh
+        self._refresh_lock = threading.Lock()
+        self._refresh_thread: Optional[threading.Thread] = None
+        self._churn_listeners: List[Callable[[TopNChurnEvent], None]] = []
+        
         # D77-0-RM: Public Data Clients (lazy init)
         self._upbit_client = None
         self._binance_client = None
@@ -194,8 +219,11 @@ class TopNProvider:
         Uses `selection_data_source` for selecting symbols.
         Cache is checked first (10-minute TTL by default).
         
+        With background_refresh, an expired cache is returned as-is while a
+        background thread fetches the new selection (stale-while-revalidate).
+        
         Args:
-            force_refresh: Ignore cache and force refresh
+            force_refresh: Ignore cache and force refresh (synchronous)
         
         Returns:
             TopNResult
@@ -205,10 +233,64 @@ class TopNProvider:
         if not force_refresh and self._selection_cache is not None:
             cache_age = now - self._selection_cache_ts
             if cache_age < self.cache_ttl_seconds:
-                logger.info(
+                logger.debug(
                     f"[TOPN_PROVIDER] Using cached TopN selection (age: {cache_age:.1f}s / {self.cache_ttl_seconds}s)"
                 )
                 return self._selection_cache
+            
+            if self.background_refresh:
+                self._start_background_refresh()
+                return self._selection_cache
+        
+        return self._refresh_selection()
+    
+    def add_churn_listener(self, listener: Callable[[TopNChurnEvent], None]) -> None:
+        """
+        TopN 변경 콜백 등록.
+        
+        Note: background_refresh 사용 시 갱신 스레드에서 호출됨
+        """
+        self._churn_listeners.append(listener)
+    
+    def is_refreshing(self) -> bool:
+        """백그라운드 갱신 진행 여부"""
+        return self._refresh_thread is not None and self._refresh_thread.is_alive()
+    
+    def wait_for_refresh(self, timeout: Optional[float] = None) -> bool:
+        """
+        진행 중인 백그라운드 갱신 완료 대기.
+        
+        Returns:
+            True if no refresh is running after the wait
+        """
+        thread = self._refresh_thread
+        if thread is not None:
+            thread.join(timeout)
+        return not self.is_refreshing()
+    
+    def _start_background_refresh(self) -> None:
+        with self._refresh_lock:
+            if self.is_refreshing():
+                return
+            self._refresh_thread = threading.Thread(
+                target=self._background_refresh_worker,
+                name="topn-refresh",
+                daemon=True,
+            )
+            self._refresh_thread.start()
+        logger.info("[TOPN_PROVIDER] TopN cache expired, refreshing in background")
+    
+    def _background_refresh_worker(self) -> None:
+        try:
+            self._refresh_selection()
+        except Exception as e:
+            # 실패 시 이전 결과 유지, 다음 TTL 주기에 재시도
+            logger.error(f"[TOPN_PROVIDER] Background refresh failed: {e}")
+            self._selection_cache_ts = time.time()
+    
+    def _refresh_selection(self) -> TopNResult:
+        """TopN selection fetch + cache update + churn event"""
+        now = time.time()
         
         # D82-2: Fetch new selection (uses selection_data_source)
         logger.info(f"[TOPN_PROVIDER] Refreshing TopN selection (source: {self.selection_data_source})")
@@ -244,6 +326,7 @@ class TopNProvider:
         
         # Calculate churn rate
         churn_rate = self._calculate_churn_rate(symbols)
+        previous = self._previous_symbols
         
         result = TopNResult(
             symbols=symbols,
@@ -263,8 +346,30 @@ class TopNProvider:
             f"churn_rate={churn_rate:.2%}, source={self.selection_data_source}"
         )
         
+        self._emit_churn(previous, symbols, result)
         return result
     
+    def _emit_churn(
+        self,
+        previous: List[Tuple[str, str]],
+        symbols: List[Tuple[str, str]],
+        result: TopNResult,
+    ) -> None:
+        """추가/제거 심볼이 있으면 churn 이벤트 통지 (순서 유지)"""
+        previous_set = set(previous)
+        current_set = set(symbols)
+        added = [pair for pair in symbols if pair not in previous_set]
+        removed = [pair for pair in previous if pair not in current_set]
+        if not added and not removed:
+            return
+        
+        event = TopNChurnEvent(added=added, removed=removed, result=result)
+        for listener in self._churn_listeners:
+            try:
+                listener(event)
+            except Exception as e:
+                logger.error(f"[TOPN_PROVIDER] Churn listener error: {e}")
+    
     def _fetch_selection_metrics(self) -> Dict[str, SymbolMetrics]:
         """
         D82-2/D82-3: Fetch metrics for TopN selection.
@@ -396,8 +501,8 @@ class TopNProvider:
         - global: 600 req/min
         
         Strategy:
-        - Batch processing: Process N symbols at a time
-        - Delay between batches to avoid rate limits
+        - Multi-market ticker/orderbook endpoints (selection_batch_size markets per request)
+        - Delay between request batches to avoid rate limits
         - Use RateLimiter to enforce limits
         - Fallback to mock if all symbols fail
         
@@ -418,7 +523,7 @@ class TopNProvider:
             )
             logger.info("[TOPN_PROVIDER] RateLimiter initialized for Real Selection")
         
-        # 1) 후보 심볼 리스트 가져오기 (이미 Upbit API 1회 호출)
+        # 1) 후보 심볼 리스트 가져오기
         try:
             candidate_symbols = self._upbit_client.fetch_top_symbols(
                 market="KRW",
@@ -435,85 +540,34 @@ class TopNProvider:
             logger.warning("[TOPN_PROVIDER] No candidate symbols, falling back to MOCK")
             return self._fetch_mock_metrics()
         
-        # 2) 배치 단위로 metrics 수집
+        # 2) 배치 단위 다중 마켓 조회 (배치당 ticker 1회 + orderbook 1회)
         metrics: Dict[str, SymbolMetrics] = {}
-        batch_size = self.selection_batch_size
-        batch_delay = self.selection_batch_delay_sec
+        batch_size = max(1, self.selection_batch_size)
+        total_batches = (len(candidate_symbols) + batch_size - 1) // batch_size
         
         for batch_idx in range(0, len(candidate_symbols), batch_size):
             batch = candidate_symbols[batch_idx:batch_idx + batch_size]
-            batch_num = batch_idx // batch_size + 1
-            total_batches = (len(candidate_symbols) + batch_size - 1) // batch_size
             
-            logger.info(
-                f"[TOPN_PROVIDER] Real Selection Batch {batch_num}/{total_batches}: "
-                f"Processing {len(batch)} symbols"
-            )
+            try:
+                self._acquire_rate_limit()
+                tickers = self._upbit_client.fetch_tickers(batch)
+                self._acquire_rate_limit()
+                orderbooks = self._upbit_client.fetch_orderbooks(batch)
+            except Exception as e:
+                logger.warning(f"[TOPN_PROVIDER] Failed to fetch batch {batch_idx // batch_size + 1}: {e}")
+                continue
             
-            # 배치 처리
             for upbit_symbol in batch:
-                try:
-                    # D82-3: Rate Limiter 체크 (ticker 호출 전)
-                    if self._rate_limiter is not None:
-                        while not self._rate_limiter.consume():
-                            wait_time = self._rate_limiter.wait_time()
-                            if wait_time > 0:
-                                time.sleep(wait_time)
-                    
-                    # Upbit ticker
-                    ticker = self._upbit_client.fetch_ticker(upbit_symbol)
-                    if ticker is None:
-                        continue
-                    
-                    # D82-3: Rate Limiter 체크 (orderbook 호출 전)
-                    if self._rate_limiter is not None:
-                        while not self._rate_limiter.consume():
-                            wait_time = self._rate_limiter.wait_time()
-                            if wait_time > 0:
-                                time.sleep(wait_time)
-                    
-                    # Upbit orderbook
-                    orderbook = self._upbit_client.fetch_orderbook(upbit_symbol)
-                    if orderbook is None or not orderbook.bids or not orderbook.asks:
-                        continue
-                    
-                    # Calculate metrics
-                    volume_krw = ticker.acc_trade_price_24h
-                    volume_usd = volume_krw / 1300.0  # Approx KRW/USD conversion
-                    
-                    # Liquidity: sum of top 5 bid/ask levels
-                    liquidity_krw = sum(b.price * b.size for b in orderbook.bids[:5])
-                    liquidity_krw += sum(a.price * a.size for a in orderbook.asks[:5])
-                    liquidity_usd = liquidity_krw / 1300.0
-                    
-                    # Spread
-                    best_bid = orderbook.bids[0].price if orderbook.bids else 0.0
-                    best_ask = orderbook.asks[0].price if orderbook.asks else 0.0
-                    mid = (best_bid + best_ask) / 2.0 if (best_bid and best_ask) else 0.0
-                    spread_bps = ((best_ask - best_bid) / mid * 10000.0) if mid > 0 else 999.0
-                    
-                    # Convert symbol format: "KRW-BTC" → "BTC/KRW"
-                    parts = upbit_symbol.split("-")
-                    if len(parts) == 2:
-                        symbol_formatted = f"{parts[1]}/{parts[0]}"
-                    else:
-                        symbol_formatted = upbit_symbol
-                    
-                    metrics[symbol_formatted] = SymbolMetrics(
-                        symbol=symbol_formatted,
-                        volume_24h=volume_usd,
-                        liquidity_depth=liquidity_usd,
-                        spread_bps=spread_bps,
-                    )
-                
-                except Exception as e:
-                    logger.warning(f"[TOPN_PROVIDER] Failed to fetch metrics for {upbit_symbol}: {e}")
+                ticker = tickers.get(upbit_symbol)
+                orderbook = orderbooks.get(upbit_symbol)
+                if ticker is None or orderbook is None or not orderbook.bids or not orderbook.asks:
                     continue
+                m = self._build_symbol_metrics(upbit_symbol, ticker, orderbook)
+                metrics[m.symbol] = m
             
             # 3) 배치 간 지연 (마지막 배치가 아닌 경우)
-            if batch_idx + batch_size < len(candidate_symbols):
-                logger.info(f"[TOPN_PROVIDER] Batch delay: {batch_delay}s")
-                time.sleep(batch_delay)
+            if batch_idx + batch_size < len(candidate_symbols) and self.selection_batch_delay_sec > 0:
+                time.sleep(self.selection_batch_delay_sec)
         
         # 4) 결과 검증
         if not metrics:
@@ -527,6 +581,41 @@ class TopNProvider:
         )
         return metrics
     
+    def _acquire_rate_limit(self) -> None:
+        """D82-3: Rate Limiter 토큰 확보 (요청 1회당 1토큰)"""
+        if self._rate_limiter is None:
+            return
+        while not self._rate_limiter.consume():
+            wait_time = self._rate_limiter.wait_time()
+            if wait_time > 0:
+                time.sleep(wait_time)
+    
+    @staticmethod
+    def _build_symbol_metrics(upbit_symbol: str, ticker, orderbook) -> SymbolMetrics:
+        """Upbit ticker/orderbook → SymbolMetrics ("KRW-BTC" → "BTC/KRW")"""
+        volume_usd = ticker.acc_trade_price_24h / 1300.0  # Approx KRW/USD conversion
+        
+        # Liquidity: sum of top 5 bid/ask levels
+        liquidity_krw = sum(b.price * b.size for b in orderbook.bids[:5])
+        liquidity_krw += sum(a.price * a.size for a in orderbook.asks[:5])
+        liquidity_usd = liquidity_krw / 1300.0
+        
+        # Spread
+        best_bid = orderbook.bids[0].price
+        best_ask = orderbook.asks[0].price
+        mid = (best_bid + best_ask) / 2.0 if (best_bid and best_ask) else 0.0
+        spread_bps = ((best_ask - best_bid) / mid * 10000.0) if mid > 0 else 999.0
+        
+        parts = upbit_symbol.split("-")
+        symbol_formatted = f"{parts[1]}/{parts[0]}" if len(parts) == 2 else upbit_symbol
+        
+        return SymbolMetrics(
+            symbol=symbol_formatted,
+            volume_24h=volume_usd,
+            liquidity_depth=liquidity_usd,
+            spread_bps=spread_bps,
+        )
+    
     def _filter_by_thresholds(
         self,
         metrics: Dict[str, SymbolMetrics],
@@ -5,14 +5,21 @@ D17 Paper/Shadow Mode — Simulated Exchange
 ===========================================
 
 Upbit/Binance와 동일한 인터페이스를 가진 시뮬레이션 거래소.
-주문 체결, 슬리피지, 수수료, 부분 체결, 취소, 지연 시뮬레이션.
+
+특징:
+- OrderBook: 전체 L2 호가 (녹화/실시간 스냅샷 또는 delta로 갱신)
+- 가격-시간 우선 매칭: 호가 레벨을 순서대로 소진 (VWAP 체결가)
+- 지정가 잔존 주문: 호가가 움직여 가격에 닿으면 체결
+- 이벤트 시간 지연 큐: 주문 도착 / 체결 보고(ack)가 latency_ms 후에 반영
 """
 
+import heapq
+import itertools
 import logging
-from typing import Dict, List, Optional, Tuple
+from bisect import bisect_left, bisect_right
+from collections import deque
+from typing import Dict, Iterable, List, Optional, Tuple
 from datetime import datetime, timezone
-import uuid
-import numpy as np
 
 from arbitrage.types import (
     Price, Order, OrderSide, OrderStatus, ExchangeType, Position
@@ -20,16 +27,220 @@ from arbitrage.types import (
 
 logger = logging.getLogger(__name__)
 
+# 지연 큐 이벤트 종류
+EVENT_ARRIVAL = 0
+EVENT_CANCEL = 1
+EVENT_REPORT = 2
+
+TIME_IN_FORCE_GTC = "GTC"  # 미체결분 잔존
+TIME_IN_FORCE_IOC = "IOC"  # 미체결분 즉시 취소
+
+QTY_EPSILON = 1e-12  # 수량 비교 허용 오차
+
+
+class BookSide:
+    """
+    호가 한쪽 (bid 또는 ask)
+    
+    최우선 호가가 리스트 끝에 오도록 key = sign * price 오름차순으로 저장.
+    (bid: sign=+1, ask: sign=-1) → 최우선 레벨 소진이 O(1) pop.
+    """
+    
+    __slots__ = ("sign", "keys", "qtys")
+    
+    def __init__(self, sign: int, levels: Iterable[Tuple[float, float]] = ()):
+        self.sign = sign
+        self.keys: List[float] = []
+        self.qtys: List[float] = []
+        self.set_levels(levels)
+    
+    def set_levels(self, levels: Iterable[Tuple[float, float]]) -> None:
+        """전체 레벨 교체 (스냅샷)"""
+        # bid: 가격 오름차순, ask: 가격 내림차순 (스냅샷은 대부분 정렬 상태라 timsort가 선형)
+        sign = self.sign
+        ordered = sorted(levels, reverse=sign < 0)
+        self.keys = [sign * price for price, qty in ordered if qty > 0]
+        self.qtys = [qty for _, qty in ordered if qty > 0]
+    
+    def apply(self, price: float, qty: float) -> None:
+        """단일 레벨 갱신 (qty <= 0이면 삭제)"""
+        key = self.sign * price
+        index = bisect_left(self.keys, key)
+        exists = index < len(self.keys) and self.keys[index] == key
+        if qty > 0:
+            if exists:
+                self.qtys[index] = qty
+            else:
+                self.keys.insert(index, key)
+                self.qtys.insert(index, qty)
+        elif exists:
+            del self.keys[index]
+            del self.qtys[index]
+    
+    @property
+    def best_price(self) -> Optional[float]:
+        return self.sign * self.keys[-1] if self.keys else None
+    
+    @property
+    def best_qty(self) -> float:
+        return self.qtys[-1] if self.qtys else 0.0
+    
+    def crosses(self, limit_price: float) -> bool:
+        """최우선 호가가 limit_price에 닿는지 (테이커 기준)"""
+        return bool(self.keys) and self.keys[-1] >= self.sign * limit_price
+    
+    def take(self, quantity: float, limit_price: Optional[float] = None) -> Tuple[float, float]:
+        """
+        최우선 레벨부터 소진
+        
+        Args:
+            quantity: 요청 수량
+            limit_price: 지정가 (None = 시장가)
+        
+        Returns:
+            (미체결 잔량, 체결 금액)
+        """
+        keys, qtys, sign = self.keys, self.qtys, self.sign
+        floor = float("-inf") if limit_price is None else sign * limit_price
+        remaining = quantity
+        notional = 0.0
+        while remaining > 0 and keys and keys[-1] >= floor:
+            available = qtys[-1]
+            price = sign * keys[-1]
+            if available <= remaining + QTY_EPSILON:
+                # 레벨 전체 소진 (부동소수 잔여분은 같이 정리)
+                keys.pop()
+                qtys.pop()
+                notional += available * price
+                remaining = max(remaining - available, 0.0)
+            else:
+                qtys[-1] = available - remaining
+                notional += remaining * price
+                remaining = 0.0
+        return remaining, notional
+    
+    def levels(self, depth: Optional[int] = None) -> List[Tuple[float, float]]:
+        """최우선부터 (price, qty) 목록"""
+        count = len(self.keys) if depth is None else min(depth, len(self.keys))
+        sign = self.sign
+        return [
+            (sign * self.keys[-1 - i], self.qtys[-1 - i])
+            for i in range(count)
+        ]
+
 
 class OrderBook:
-    """주문장"""
+    """주문장 (L2)"""
+    
+    def __init__(
+        self,
+        symbol: str,
+        bid: Optional[float] = None,
+        ask: Optional[float] = None,
+        volume: float = 1000.0,
+    ):
+        """
+        Args:
+            symbol: 심볼
+            bid: 최우선 매수호가 (단일 레벨 합성 호가, 시나리오용)
+            ask: 최우선 매도호가
+            volume: 합성 호가 레벨 수량 (기본 유동성)
+        """
+        self.symbol = symbol
+        self.timestamp = 0.0
+        self.bids = BookSide(1, [(bid, volume)] if bid is not None else ())
+        self.asks = BookSide(-1, [(ask, volume)] if ask is not None else ())
+        # 합성 호가(깊이 정보 없음)에는 슬리피지 가정을 추가로 적용
+        self.synthetic = True
+    
+    @classmethod
+    def from_levels(
+        cls,
+        symbol: str,
+        bids: Iterable[Tuple[float, float]],
+        asks: Iterable[Tuple[float, float]],
+        timestamp: float = 0.0,
+    ) -> "OrderBook":
+        """L2 레벨로 생성"""
+        book = cls(symbol)
+        book.update(bids, asks, timestamp)
+        return book
+    
+    def update(
+        self,
+        bids: Iterable[Tuple[float, float]],
+        asks: Iterable[Tuple[float, float]],
+        timestamp: float = 0.0,
+    ) -> None:
+        """스냅샷으로 전체 교체"""
+        self.bids.set_levels(bids)
+        self.asks.set_levels(asks)
+        self.timestamp = timestamp
+        self.synthetic = False
+    
+    def side(self, side: OrderSide) -> BookSide:
+        """테이커 주문이 소진하는 쪽 (BUY → asks)"""
+        return self.asks if side == OrderSide.BUY else self.bids
+    
+    @property
+    def bid(self) -> Optional[float]:
+        return self.bids.best_price
+    
+    @property
+    def ask(self) -> Optional[float]:
+        return self.asks.best_price
+    
+    @property
+    def bid_volume(self) -> float:
+        return self.bids.best_qty
+    
+    @property
+    def ask_volume(self) -> float:
+        return self.asks.best_qty
+
+
+class VenueOrder:
+    """
+    거래소 측 주문 상태
     
-    def __init__(self, symbol: str, bid: float, ask: float):
+    체결 상태(remaining/notional)는 거래소 시간 기준, reported_*는 지연 후
+    클라이언트에 보고된 상태. 클라이언트 Order는 조회 시점에만 생성한다.
+    """
+    
+    __slots__ = (
+        "order_id", "symbol", "side", "is_buy", "price", "quantity", "remaining",
+        "notional", "time_in_force", "active", "created_at",
+        "reported_filled", "reported_status", "order",
+    )
+    
+    def __init__(
+        self,
+        order_id: str,
+        symbol: str,
+        side: OrderSide,
+        quantity: float,
+        price: Optional[float],
+        time_in_force: str,
+        created_at: float,
+    ):
+        self.order_id = order_id
         self.symbol = symbol
-        self.bid = bid
-        self.ask = ask
-        self.bid_volume = 1000.0  # 기본 유동성
-        self.ask_volume = 1000.0
+        self.side = side
+        self.is_buy = side is OrderSide.BUY
+        self.price = price
+        self.quantity = quantity
+        self.remaining = quantity
+        self.notional = 0.0
+        self.time_in_force = time_in_force
+        self.active = True
+        self.created_at = created_at
+        self.reported_filled = 0.0
+        self.reported_status = OrderStatus.PENDING
+        self.order: Optional[Order] = None
+    
+    @property
+    def filled(self) -> float:
+        return self.quantity - self.remaining
 
 
 class SimulatedExchange:
@@ -38,23 +249,27 @@ class SimulatedExchange:
     
     Paper/Shadow 모드에서 사용.
     실제 거래소 API 호출 없이 시뮬레이션된 주문 체결.
+    
+    시간은 이벤트 시간(초)으로 진행: 호가 스냅샷의 timestamp 또는
+    advance_to()로만 움직이며, 주문은 now + latency에 거래소에 도착하고
+    체결 보고는 다시 latency 후에 클라이언트 Order에 반영된다.
     """
     
     def __init__(
         self,
         exchange_type: ExchangeType = ExchangeType.UPBIT,
         initial_balance: Dict[str, float] = None,
-        slippage_bps: float = 5.0,  # 슬리피지 (기본 5bp)
+        slippage_bps: float = 5.0,  # 슬리피지 (합성 호가 전용, 기본 5bp)
         fee_bps: float = 2.5,  # 수수료 (기본 2.5bp)
-        latency_ms: float = 100.0  # 지연 (기본 100ms)
+        latency_ms: float = 100.0  # 단방향 지연 (기본 100ms)
     ):
         """
         Args:
             exchange_type: 거래소 타입
             initial_balance: 초기 잔액 {asset: amount}
-            slippage_bps: 슬리피지 (basis points)
+            slippage_bps: 슬리피지 (basis points, set_price 합성 호가에만 적용)
             fee_bps: 수수료 (basis points)
-            latency_ms: 네트워크 지연 (밀리초)
+            latency_ms: 네트워크 단방향 지연 (밀리초)
         """
         self.exchange_type = exchange_type
         self.slippage_bps = slippage_bps
@@ -65,13 +280,26 @@ class SimulatedExchange:
         self.balance = initial_balance or {"KRW": 10_000_000, "USDT": 1000}
         
         # 주문 기록
-        self._orders: Dict[str, Order] = {}
+        self._venue_orders: Dict[str, VenueOrder] = {}
         self._order_books: Dict[str, OrderBook] = {}
         self._positions: Dict[str, Position] = {}
+        self._assets: Dict[str, Tuple[str, str]] = {}
+        
+        # 잔존 지정가 주문 (가격-시간 우선 heap, 취소는 lazy 삭제)
+        # bid: (-price, seq, order), ask: (price, seq, order)
+        self._resting: Dict[str, Tuple[list, list]] = {}
+        
+        # 이벤트 시간 지연 큐: (due, kind, venue_order, filled, status)
+        # 고정 지연 + 단조 증가 시간 → 예약 순서 = 만기 순서이므로 FIFO deque (O(1))
+        self.now = 0.0
+        self._events: deque = deque()
+        self._seq = itertools.count()
+        self._order_ids = itertools.count(1)
         
         # 통계
         self.total_fees = 0.0
         self.total_trades = 0
+        self.total_fills = 0
     
     async def connect(self) -> None:
         """연결 (no-op)"""
@@ -87,10 +315,10 @@ class SimulatedExchange:
     
     async def get_ticker(self, symbol: str) -> Optional[Price]:
         """현재 가격 조회"""
-        if symbol not in self._order_books:
+        ob = self._order_books.get(symbol)
+        if ob is None or ob.bid is None or ob.ask is None:
             return None
         
-        ob = self._order_books[symbol]
         return Price(
             exchange=self.exchange_type,
             symbol=symbol,
@@ -99,9 +327,13 @@ class SimulatedExchange:
             timestamp=datetime.now(timezone.utc)
         )
     
+    def get_order_book(self, symbol: str) -> Optional[OrderBook]:
+        """주문장 조회 (시뮬레이션 내부 상태)"""
+        return self._order_books.get(symbol)
+    
     def set_price(self, symbol: str, bid: float, ask: float) -> None:
         """
-        가격 설정 (시나리오용)
+        가격 설정 (시나리오용, 단일 레벨 합성 호가)
         
         Args:
             symbol: 심볼
@@ -109,72 +341,203 @@ class SimulatedExchange:
             ask: 매도호가
         """
         self._order_books[symbol] = OrderBook(symbol, bid, ask)
+        self._match_resting(symbol)
+    
+    def update_order_book(
+        self,
+        symbol: str,
+        bids: Iterable[Tuple[float, float]],
+        asks: Iterable[Tuple[float, float]],
+        timestamp: Optional[float] = None,
+    ) -> None:
+        """
+        L2 스냅샷 반영
+        
+        timestamp까지의 지연 이벤트를 먼저 처리한 뒤(이전 호가 기준)
+        호가를 교체하고, 새 호가에 닿은 잔존 주문을 체결한다.
+        
+        Args:
+            symbol: 심볼
+            bids: [(price, qty), ...]
+            asks: [(price, qty), ...]
+            timestamp: 스냅샷 이벤트 시간 (초, None = 현재 시뮬레이션 시간)
+        """
+        if timestamp is not None:
+            self.advance_to(timestamp)
+        
+        book = self._order_books.get(symbol)
+        if book is None:
+            book = self._order_books[symbol] = OrderBook(symbol)
+        book.update(bids, asks, self.now)
+        self._match_resting(symbol)
+    
+    def apply_snapshot(self, snapshot) -> None:
+        """OrderBookSnapshot(arbitrage.exchanges.base) 반영"""
+        self.update_order_book(snapshot.symbol, snapshot.bids, snapshot.asks, snapshot.timestamp)
+    
+    def apply_delta(
+        self,
+        symbol: str,
+        side: OrderSide,
+        price: float,
+        qty: float,
+        timestamp: Optional[float] = None,
+    ) -> None:
+        """
+        단일 레벨 delta 반영 (qty=0 → 레벨 삭제)
+        
+        Args:
+            side: BUY = bid 레벨, SELL = ask 레벨
+        """
+        if timestamp is not None:
+            self.advance_to(timestamp)
+        
+        book = self._order_books.get(symbol)
+        if book is None:
+            book = self._order_books[symbol] = OrderBook(symbol)
+            book.synthetic = False
+        (book.bids if side == OrderSide.BUY else book.asks).apply(price, qty)
+        self._match_resting(symbol)
+    
+    def advance_to(self, timestamp: float) -> None:
+        """시뮬레이션 시간 진행 (due <= timestamp 이벤트 처리)"""
+        events = self._events
+        popleft = events.popleft
+        while events and events[0][0] <= timestamp:
+            due, kind, venue_order, filled, status = popleft()
+            self.now = due
+            if kind == EVENT_REPORT:
+                self._deliver_report(venue_order, filled, status)
+            elif kind == EVENT_ARRIVAL:
+                self._on_arrival(venue_order)
+            else:
+                self._on_cancel(venue_order)
+        if timestamp > self.now:
+            self.now = timestamp
+    
+    def submit_order(
+        self,
+        symbol: str,
+        side: OrderSide,
+        quantity: float,
+        price: Optional[float] = None,
+        time_in_force: str = TIME_IN_FORCE_GTC,
+    ) -> str:
+        """
+        주문 전송 (동기, 지연 큐에 도착 이벤트 등록)
+        
+        Args:
+            symbol: 심볼
+            side: 주문 방향
+            quantity: 수량
+            price: 지정가 (None 또는 0 이하 = 시장가, 미체결분 취소)
+            time_in_force: GTC (잔존) / IOC (미체결분 취소)
+        
+        Returns:
+            order_id (상태는 get_order()로 조회)
+        """
+        order_id = str(next(self._order_ids))
+        limit_price = price if price is not None and price > 0 else None
+        venue_order = VenueOrder(order_id, symbol, side, quantity, limit_price, time_in_force, self.now)
+        
+        self._venue_orders[order_id] = venue_order
+        self.total_trades += 1
+        self._schedule(self.latency_ms, EVENT_ARRIVAL, venue_order)
+        return order_id
+    
+    def get_order(self, order_id: str) -> Optional[Order]:
+        """클라이언트 Order (보고된 상태 기준, 이후 보고 시 갱신됨)"""
+        venue_order = self._venue_orders.get(order_id)
+        if venue_order is None:
+            return None
+        
+        if venue_order.order is None:
+            created_at = datetime.fromtimestamp(venue_order.created_at, timezone.utc)
+            venue_order.order = Order(
+                order_id=order_id,
+                exchange=self.exchange_type,
+                symbol=venue_order.symbol,
+                side=venue_order.side,
+                quantity=venue_order.quantity,
+                price=venue_order.price or 0.0,
+                status=venue_order.reported_status,
+                filled_quantity=venue_order.reported_filled,
+                created_at=created_at,
+                updated_at=created_at,
+            )
+        return venue_order.order
     
     async def place_order(
         self,
         symbol: str,
         side: OrderSide,
         quantity: float,
-        price: float
+        price: float,
+        time_in_force: str = TIME_IN_FORCE_GTC,
     ) -> Optional[Order]:
         """
         주문 생성
         
+        latency_ms=0이면 즉시 매칭되어 체결 결과가 반영된 Order를 반환하고,
+        그 외에는 시뮬레이션 시간이 진행될 때 상태가 갱신된다.
+        
         Args:
             symbol: 심볼
             side: 주문 방향
             quantity: 수량
-            price: 가격
+            price: 지정가 (0 이하 = 시장가)
+            time_in_force: GTC / IOC
         
         Returns:
             Order 객체 또는 None
         """
-        order_id = str(uuid.uuid4())[:8]
+        order = self.get_order(self.submit_order(symbol, side, quantity, price, time_in_force))
         
-        # 주문 생성
-        order = Order(
-            order_id=order_id,
-            exchange=self.exchange_type,
-            symbol=symbol,
-            side=side,
-            quantity=quantity,
-            price=price,
-            status=OrderStatus.PENDING,
-            created_at=datetime.now(timezone.utc)
-        )
-        
-        # 즉시 체결 시뮬레이션
-        await self._simulate_execution(order)
-        
-        self._orders[order_id] = order
-        self.total_trades += 1
-        
-        logger.info(
-            f"Order placed: {order_id} {side.value} {quantity} @ {price} "
-            f"(filled: {order.filled_quantity})"
+        logger.debug(
+            "Order placed: %s %s %s @ %s (status: %s)",
+            order.order_id, side.value, quantity, price, order.status.value,
         )
         
         return order
     
-    async def cancel_order(self, order_id: str) -> bool:
-        """주문 취소"""
-        if order_id not in self._orders:
-            return False
+    def submit_cancel(self, order_id: str) -> bool:
+        """
+        주문 취소 요청 (동기)
         
-        order = self._orders[order_id]
+        취소 요청도 지연 후 도착하므로, 그 사이 체결되면 취소되지 않는다.
+        최종 결과는 클라이언트 Order 상태로 확인.
         
-        # 미체결 부분만 취소 가능
-        if order.status in [OrderStatus.FILLED, OrderStatus.CANCELLED]:
+        Returns:
+            요청 전송 여부 (알 수 없거나 이미 종료된 주문이면 False)
+        """
+        venue_order = self._venue_orders.get(order_id)
+        if venue_order is None:
             return False
         
-        order.status = OrderStatus.CANCELLED
-        logger.info(f"Order cancelled: {order_id}")
+        # 미체결 부분만 취소 가능
+        if venue_order.reported_status in [OrderStatus.FILLED, OrderStatus.CANCELLED, OrderStatus.REJECTED]:
+            return False
         
+        self._schedule(self.latency_ms, EVENT_CANCEL, venue_order)
         return True
     
+    async def cancel_order(self, order_id: str) -> bool:
+        """주문 취소 요청 (submit_cancel 참고)"""
+        requested = self.submit_cancel(order_id)
+        if requested:
+            logger.debug("Cancel requested: %s", order_id)
+        return requested
+    
     async def get_order_status(self, order_id: str) -> Optional[Order]:
         """주문 상태 조회"""
-        return self._orders.get(order_id)
+        return self.get_order(order_id)
+    
+    def get_average_fill_price(self, order_id: str) -> Optional[float]:
+        """거래소 측 평균 체결가 (VWAP, 미체결이면 None)"""
+        venue_order = self._venue_orders.get(order_id)
+        if venue_order is None or venue_order.filled <= 0:
+            return None
+        return venue_order.notional / venue_order.filled
     
     async def subscribe_prices(
         self,
@@ -190,84 +553,157 @@ class SimulatedExchange:
         """
         logger.info(f"Subscribed to {len(symbols)} symbols (simulated)")
     
-    async def _simulate_execution(self, order: Order) -> None:
-        """
-        주문 체결 시뮬레이션
+    def _schedule(self, delay_ms: float, kind: int, venue_order: VenueOrder) -> None:
+        self._enqueue(self.now + delay_ms / 1000.0, kind, venue_order)
+        if delay_ms <= 0:
+            self.advance_to(self.now)
+    
+    def _on_arrival(self, venue_order: VenueOrder) -> None:
+        """주문 도착: 테이커 매칭 후 잔량 처리"""
+        book = self._order_books.get(venue_order.symbol)
+        if book is None:
+            # 주문장 없으면 거부
+            venue_order.active = False
+            self._report(venue_order, OrderStatus.REJECTED)
+            return
         
-        Args:
-            order: 주문
-        """
-        if order.symbol not in self._order_books:
-            # 주문장 없으면 미체결
-            order.status = OrderStatus.PENDING
+        self._execute(book, venue_order)
+        
+        if venue_order.remaining <= 0:
+            return
+        if venue_order.price is None or venue_order.time_in_force == TIME_IN_FORCE_IOC:
+            venue_order.active = False
+            self._report(venue_order, OrderStatus.PARTIALLY_FILLED if venue_order.filled > 0 else OrderStatus.CANCELLED)
             return
         
-        ob = self._order_books[order.symbol]
+        # 지정가 잔존
+        bids, asks = self._resting.setdefault(venue_order.symbol, ([], []))
+        if venue_order.is_buy:
+            heapq.heappush(bids, (-venue_order.price, next(self._seq), venue_order))
+        else:
+            heapq.heappush(asks, (venue_order.price, next(self._seq), venue_order))
+        if venue_order.filled <= 0:
+            self._report(venue_order, OrderStatus.PENDING)
+    
+    def _on_cancel(self, venue_order: VenueOrder) -> None:
+        """취소 도착 (heap에서는 lazy 삭제)"""
+        if not venue_order.active:
+            return
+        venue_order.active = False
+        self._report(venue_order, OrderStatus.CANCELLED)
+    
+    def _match_resting(self, symbol: str) -> None:
+        """호가 변경 후 잔존 지정가 주문 매칭 (가격-시간 우선)"""
+        resting = self._resting.get(symbol)
+        if not resting:
+            return
+        book = self._order_books[symbol]
         
-        # 슬리피지 적용
-        slippage_ratio = self.slippage_bps / 10000
+        for heap, book_side in ((resting[0], book.asks), (resting[1], book.bids)):
+            while heap:
+                venue_order = heap[0][2]
+                if not venue_order.active:
+                    heapq.heappop(heap)
+                    continue
+                if not book_side.crosses(venue_order.price):
+                    break
+                self._execute(book, venue_order)
+                if venue_order.remaining > 0:
+                    break  # 해당 가격까지 유동성 소진
+                heapq.heappop(heap)
+    
+    def _execute(self, book: OrderBook, venue_order: VenueOrder) -> None:
+        """호가 레벨을 소진하며 체결, 잔액/수수료 반영 후 보고 예약"""
+        is_buy = venue_order.is_buy
+        before = venue_order.remaining
+        remaining, notional = (book.asks if is_buy else book.bids).take(before, venue_order.price)
+        if remaining >= before:
+            return
+        filled = before - remaining
         
-        if order.side == OrderSide.BUY:
-            # 매수: ask 가격에 슬리피지 추가
-            execution_price = ob.ask * (1 + slippage_ratio)
-            
-            # 유동성 확인
-            if order.quantity <= ob.ask_volume:
-                # 전부 체결
-                order.filled_quantity = order.quantity
-                order.status = OrderStatus.FILLED
-            else:
-                # 부분 체결
-                order.filled_quantity = ob.ask_volume * 0.8  # 80% 체결
-                order.status = OrderStatus.PARTIALLY_FILLED
+        if book.synthetic and self.slippage_bps:
+            # 깊이 정보 없는 합성 호가: 슬리피지 가정 적용
+            slippage = notional * self.slippage_bps / 10000
+            notional += slippage if is_buy else -slippage
         
-        else:  # SELL
-            # 매도: bid 가격에 슬리피지 차감
-            execution_price = ob.bid * (1 - slippage_ratio)
-            
-            # 유동성 확인
-            if order.quantity <= ob.bid_volume:
-                # 전부 체결
-                order.filled_quantity = order.quantity
-                order.status = OrderStatus.FILLED
-            else:
-                # 부분 체결
-                order.filled_quantity = ob.bid_volume * 0.8
-                order.status = OrderStatus.PARTIALLY_FILLED
+        venue_order.remaining = remaining
+        venue_order.notional += notional
+        self.total_fills += 1
         
         # 수수료 계산
-        fee_ratio = self.fee_bps / 10000
-        fee = order.filled_quantity * execution_price * fee_ratio
+        fee = notional * self.fee_bps / 10000
         self.total_fees += fee
         
         # 잔액 업데이트
-        if order.side == OrderSide.BUY:
-            cost = order.filled_quantity * execution_price + fee
-            base_asset = "KRW" if self.exchange_type == ExchangeType.UPBIT else "USDT"
-            self.balance[base_asset] -= cost
-            
-            quote_asset = order.symbol.split("-")[-1] if "-" in order.symbol else order.symbol.replace("USDT", "")
-            self.balance[quote_asset] = self.balance.get(quote_asset, 0) + order.filled_quantity
-        
+        base_asset, quote_asset = self._assets_of(venue_order.symbol)
+        balance = self.balance
+        if is_buy:
+            balance[base_asset] = balance.get(base_asset, 0) - (notional + fee)
+            balance[quote_asset] = balance.get(quote_asset, 0) + filled
         else:  # SELL
-            revenue = order.filled_quantity * execution_price - fee
-            base_asset = "KRW" if self.exchange_type == ExchangeType.UPBIT else "USDT"
-            self.balance[base_asset] += revenue
-            
-            quote_asset = order.symbol.split("-")[-1] if "-" in order.symbol else order.symbol.replace("USDT", "")
-            self.balance[quote_asset] = self.balance.get(quote_asset, 0) - order.filled_quantity
+            balance[base_asset] = balance.get(base_asset, 0) + (notional - fee)
+            balance[quote_asset] = balance.get(quote_asset, 0) - filled
         
-        logger.debug(
-            f"Execution simulated: {order.order_id} "
-            f"filled={order.filled_quantity} @ {execution_price:.0f} "
-            f"fee={fee:.0f}"
-        )
+        if remaining <= 0:
+            venue_order.active = False
+            self._report(venue_order, OrderStatus.FILLED)
+        elif venue_order.price is not None and venue_order.time_in_force == TIME_IN_FORCE_GTC:
+            self._report(venue_order, OrderStatus.PARTIALLY_FILLED)
+    
+    def _assets_of(self, symbol: str) -> Tuple[str, str]:
+        """(결제 자산, 거래 자산) (심볼별 캐시)"""
+        assets = self._assets.get(symbol)
+        if assets is None:
+            base_asset = "KRW" if self.exchange_type == ExchangeType.UPBIT else "USDT"
+            quote_asset = symbol.split("-")[-1] if "-" in symbol else symbol.replace("USDT", "")
+            assets = self._assets[symbol] = (base_asset, quote_asset)
+        return assets
+    
+    def _report(self, venue_order: VenueOrder, status: OrderStatus) -> None:
+        """체결/상태 보고를 지연 큐에 등록 (클라이언트 반영은 latency 후)"""
+        filled = venue_order.quantity - venue_order.remaining
+        if self.latency_ms <= 0:
+            self._deliver_report(venue_order, filled, status)
+        else:
+            self._enqueue(self.now + self.latency_ms / 1000.0, EVENT_REPORT, venue_order, filled, status)
+    
+    def _enqueue(
+        self,
+        due: float,
+        kind: int,
+        venue_order: VenueOrder,
+        filled: float = 0.0,
+        status: Optional[OrderStatus] = None,
+    ) -> None:
+        events = self._events
+        event = (due, kind, venue_order, filled, status)
+        if not events or events[-1][0] <= due:
+            events.append(event)
+        else:
+            # 실행 중 latency_ms 감소 시에만 발생 (같은 만기는 예약 순서 유지)
+            events.insert(bisect_right(events, due, key=lambda queued: queued[0]), event)
+    
+    @staticmethod
+    def _deliver_report(venue_order: VenueOrder, filled: float, status: OrderStatus) -> None:
+        venue_order.reported_filled = filled
+        venue_order.reported_status = status
+        order = venue_order.order
+        if order is not None:
+            order.filled_quantity = filled
+            order.status = status
     
     def get_stats(self) -> Dict:
         """통계 조회"""
         return {
             "total_trades": self.total_trades,
+            "total_fills": self.total_fills,
             "total_fees": self.total_fees,
             "balance": self.balance.copy(),
-            "orders_count": len(self._orders),
+            "orders_count": len(self._venue_orders),
+            "resting_orders": sum(
+                1 for venue_order in self._venue_orders.values()
+                if venue_order.active and venue_order.price is not None
+            ),
+            "pending_events": len(self._events),
+            "sim_time": self.now,
         }
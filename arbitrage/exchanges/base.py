@@ -59,6 +59,7 @@ class OrderBookSnapshot:
     timestamp: float
     bids: List[tuple]  # [(price, qty), ...]
     asks: List[tuple]  # [(price, qty), ...]
+    trace: Any = field(default=None, repr=False, compare=False)  # D93-1: TickTrace (WS 수신 시 부착)
     
     def best_bid(self) -> Optional[float]:
         """최고 매수가"""
@@ -156,6 +157,9 @@ class BaseExchange(ABC):
     D80-2: base_currency 속성 및 make_money() 헬퍼 추가
     """
     
+    # get_order_status가 실제 거래소 조회를 수행하는지 (placeholder 구현이면 False)
+    supports_order_status: bool = True
+    
     def __init__(self, name: str, config: Optional[Dict[str, Any]] = None):
         """
         Args:
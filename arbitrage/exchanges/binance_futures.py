@@ -8,6 +8,9 @@ D46: Read-Only 모드 추가
 - get_orderbook: 실제 Binance API 호출
 - get_balance: 실제 Binance API 호출
 - create_order/cancel_order: live_enabled=True일 때만 실행
+
+모든 REST 호출은 거래소별 공유 keep-alive 커넥션 풀을 사용하며,
+서명 컨텍스트(HMAC 키, API 키 헤더)는 초기화 시 한 번만 생성.
 """
 
 import logging
@@ -15,8 +18,6 @@ import time
 import os
 from typing import Dict, List, Optional, Any
 import requests
-import hmac
-import hashlib
 import json
 from urllib.parse import urlencode
 
@@ -40,6 +41,8 @@ from arbitrage.exchanges.exceptions import (
     OrderNotFoundError,
 )
 from arbitrage.exchanges.http_client import HTTPClient, RateLimitConfig
+from arbitrage.exchanges.signing import HmacSigner
+from arbitrage.exchanges.transport import TransportConfig, get_shared_transport
 
 logger = logging.getLogger(__name__)
 
@@ -51,6 +54,9 @@ class BinanceFuturesExchange(BaseExchange):
     Binance Futures REST API를 사용하여 선물 거래를 수행.
     """
     
+    # get_order_status 미구현 (고정값 반환, 조회에 필요한 symbol 없음) → reconcile/체결 재조회 대상 아님
+    supports_order_status = False
+    
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         """
         Args:
@@ -61,6 +67,8 @@ class BinanceFuturesExchange(BaseExchange):
                 - timeout: 요청 타임아웃 (초)
                 - leverage: 레버리지 (기본: 1)
                 - rate_limit: RateLimitConfig dict (D48)
+                - transport: TransportConfig dict (커넥션 풀/DNS 캐시)
+                - prewarm: True면 초기화 시 커넥션 pre-warm
         """
         super().__init__("binance_futures", config)
         
@@ -73,6 +81,13 @@ class BinanceFuturesExchange(BaseExchange):
         # 실제 거래 활성화 여부
         self.live_enabled = self.config.get("live_enabled", False)
         
+        # 거래소별 공유 커넥션 풀
+        transport_config = self.config.get("transport", {})
+        self.transport = get_shared_transport(
+            self.name,
+            TransportConfig(**transport_config) if isinstance(transport_config, dict) else None,
+        )
+        
         # D48: HTTP 클라이언트 (레이트리밋/재시도)
         rate_limit_config = self.config.get("rate_limit", {})
         if isinstance(rate_limit_config, dict):
@@ -81,10 +96,18 @@ class BinanceFuturesExchange(BaseExchange):
                     max_requests_per_sec=rate_limit_config.get("max_requests_per_sec", 5.0),
                     max_retry=rate_limit_config.get("max_retry", 3),
                     base_backoff_seconds=rate_limit_config.get("base_backoff_seconds", 0.5),
-                )
+                ),
+                transport=self.transport,
             )
         else:
-            self.http_client = HTTPClient()
+            self.http_client = HTTPClient(transport=self.transport)
+        
+        # 서명 컨텍스트 사전 계산
+        self._signer = HmacSigner(self.api_secret)
+        self._api_key_headers = {"X-MBX-APIKEY": self.api_key}
+        
+        if self.config.get("prewarm", False):
+            self.prewarm()
         
         if not self.live_enabled:
             logger.warning("[D42_BINANCE] Live trading is DISABLED. Use Paper mode or enable live_enabled=True")
@@ -103,6 +126,24 @@ class BinanceFuturesExchange(BaseExchange):
         """
         return self.config.get("base_currency", Currency.USDT)
     
+    def _sign(self, params: Dict[str, Any]) -> Dict[str, str]:
+        """
+        파라미터 서명 (signature 추가) 후 인증 헤더 반환
+        
+        사전 계산된 HMAC 키 / 헤더 템플릿 사용.
+        """
+        params["signature"] = self._signer.sign(urlencode(params))
+        return dict(self._api_key_headers)
+    
+    def prewarm(self) -> int:
+        """
+        커넥션 pre-warm (첫 주문 전에 DNS/TCP/TLS 수행)
+        
+        Returns:
+            성공한 URL 수
+        """
+        return self.transport.prewarm([f"{self.base_url}/fapi/v1/ping"])
+    
     def get_orderbook(self, symbol: str) -> OrderBookSnapshot:
         """
         호가 정보 조회 (D46: 실제 API 호출).
@@ -122,14 +163,14 @@ class BinanceFuturesExchange(BaseExchange):
             url = f"{self.base_url}/fapi/v1/depth"
             params = {"symbol": symbol, "limit": 5}
             
-            response = requests.get(
+            response = self.transport.get(
                 url,
                 params=params,
                 timeout=self.timeout,
             )
             response.raise_for_status()
             
-            data = response.json()
+            data = self.transport.parse_json(response)
             
             # Binance API 응답 파싱
             # {
@@ -201,22 +242,10 @@ class BinanceFuturesExchange(BaseExchange):
             # Binance API 서명 생성
             timestamp = int(time.time() * 1000)
             params = {"timestamp": timestamp}
-            query_string = urlencode(params)
-            
-            signature = hmac.new(
-                self.api_secret.encode(),
-                query_string.encode(),
-                hashlib.sha256
-            ).hexdigest()
-            
-            params["signature"] = signature
-            
-            headers = {
-                "X-MBX-APIKEY": self.api_key,
-            }
+            headers = self._sign(params)
             
             url = f"{self.base_url}/fapi/v2/account"
-            response = requests.get(
+            response = self.transport.get(
                 url,
                 params=params,
                 headers=headers,
@@ -224,7 +253,7 @@ class BinanceFuturesExchange(BaseExchange):
             )
             response.raise_for_status()
             
-            data = response.json()
+            data = self.transport.parse_json(response)
             
             # Binance API 응답 파싱
             # {
@@ -334,18 +363,7 @@ class BinanceFuturesExchange(BaseExchange):
                 params["price"] = str(price)
             
             # 서명 생성
-            query_string = urlencode(params)
-            signature = hmac.new(
-                self.api_secret.encode(),
-                query_string.encode(),
-                hashlib.sha256
-            ).hexdigest()
-            
-            params["signature"] = signature
-            
-            headers = {
-                "X-MBX-APIKEY": self.api_key,
-            }
+            headers = self._sign(params)
             
             # HTTP 요청 (레이트리밋/재시도 포함)
             response = self.http_client.post(
@@ -356,7 +374,7 @@ class BinanceFuturesExchange(BaseExchange):
             )
             
             response.raise_for_status()
-            data = response.json()
+            data = self.transport.parse_json(response)
             
             # 응답 파싱
             order_id = str(data.get("orderId", ""))
@@ -444,18 +462,7 @@ class BinanceFuturesExchange(BaseExchange):
                 params["symbol"] = symbol
             
             # 서명 생성
-            query_string = urlencode(params)
-            signature = hmac.new(
-                self.api_secret.encode(),
-                query_string.encode(),
-                hashlib.sha256
-            ).hexdigest()
-            
-            params["signature"] = signature
-            
-            headers = {
-                "X-MBX-APIKEY": self.api_key,
-            }
+            headers = self._sign(params)
             
             # HTTP 요청 (레이트리밋/재시도 포함)
             response = self.http_client.delete(
@@ -477,6 +484,54 @@ class BinanceFuturesExchange(BaseExchange):
             logger.error(f"[D48_BINANCE] Parse error: {e}")
             raise NetworkError(f"Binance API response parse failed: {e}")
     
+    def create_listen_key(self) -> str:
+        """
+        User Data Stream listenKey 발급 (POST /fapi/v1/listenKey).
+        
+        Returns:
+            listenKey (60분 유효, keepalive로 연장)
+        
+        Raises:
+            AuthenticationError: API 키 부족
+            NetworkError: API 호출 실패
+        """
+        if not self.api_key:
+            raise AuthenticationError("Binance API key not configured")
+        
+        try:
+            response = self.http_client.post(
+                f"{self.base_url}/fapi/v1/listenKey",
+                headers=dict(self._api_key_headers),
+                timeout=self.timeout,
+            )
+            response.raise_for_status()
+            return self.transport.parse_json(response)["listenKey"]
+        except requests.RequestException as e:
+            logger.error(f"[D48_BINANCE] Network error: {e}")
+            raise NetworkError(f"Binance API request failed: {e}")
+        except (KeyError, ValueError, json.JSONDecodeError) as e:
+            logger.error(f"[D48_BINANCE] Parse error: {e}")
+            raise NetworkError(f"Binance API response parse failed: {e}")
+    
+    def keepalive_listen_key(self) -> None:
+        """
+        listenKey 유효기간 연장 (PUT /fapi/v1/listenKey).
+        
+        Raises:
+            NetworkError: API 호출 실패
+        """
+        try:
+            response = self.http_client.request(
+                "PUT",
+                f"{self.base_url}/fapi/v1/listenKey",
+                headers=dict(self._api_key_headers),
+                timeout=self.timeout,
+            )
+            response.raise_for_status()
+        except requests.RequestException as e:
+            logger.error(f"[D48_BINANCE] Network error: {e}")
+            raise NetworkError(f"Binance API request failed: {e}")
+    
     def get_open_positions(self) -> List[Position]:
         """
         미결제 포지션 조회.
@@ -26,6 +26,7 @@ from typing import List, Optional, Callable, Dict, Any
 
 from arbitrage.exchanges.base import OrderBookSnapshot
 from arbitrage.exchanges.ws_client import BaseWebSocketClient
+from arbitrage.tracing import STAGE_AGGREGATE, STAGE_WS_PARSE
 
 logger = logging.getLogger(__name__)
 
@@ -121,7 +122,15 @@ class BinanceWebSocketAdapter(BaseWebSocketClient):
                 snapshot = self._parse_message(message)
                 if snapshot:
                     logger.debug(f"[D83-2_BINANCE_DEBUG] Snapshot parsed successfully: {snapshot.symbol}")
+                    # D93-1: tick trace 부착 (parse → aggregate 구간 기록)
+                    # callback 발행 후에는 runner가 trace를 점유하므로 발행 전에 마지막 mark
+                    trace = self._active_trace
+                    if trace is not None:
+                        trace.mark(STAGE_WS_PARSE)
+                        snapshot.trace = trace
                     self._last_snapshots[snapshot.symbol] = snapshot
+                    if trace is not None:
+                        trace.mark(STAGE_AGGREGATE)
                     self.callback(snapshot)
             else:
                 logger.debug(f"[D83-2_BINANCE_DEBUG] Ignoring non-depth message: stream={msg_stream}, data_keys={list(data.keys())}")
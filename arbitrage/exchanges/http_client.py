@@ -3,6 +3,7 @@
 D48: HTTP Client with Rate Limit & Retry
 
 레이트 리밋 및 exponential backoff 재시도 기능을 제공하는 HTTP 클라이언트.
+실제 전송은 keep-alive 커넥션 풀(PooledTransport)을 사용.
 """
 
 import logging
@@ -12,6 +13,8 @@ from dataclasses import dataclass
 
 import requests
 
+from arbitrage.exchanges.transport import PooledTransport
+
 logger = logging.getLogger(__name__)
 
 
@@ -34,17 +37,23 @@ class HTTPClient:
     
     역할:
     - 레이트 리밋 체크 (초당 요청 수 제한)
-    - HTTP 요청 실행
+    - HTTP 요청 실행 (PooledTransport, 커넥션 재사용)
     - 429/timeout/특정 에러 시 exponential backoff 재시도
     - 모든 재시도 실패 시 예외 발생
     """
     
-    def __init__(self, config: Optional[RateLimitConfig] = None):
+    def __init__(
+        self,
+        config: Optional[RateLimitConfig] = None,
+        transport: Optional[PooledTransport] = None,
+    ):
         """
         Args:
             config: RateLimitConfig 인스턴스
+            transport: 공유 PooledTransport (None이면 전용 인스턴스 생성)
         """
         self.config = config or RateLimitConfig()
+        self.transport = transport or PooledTransport()
         
         # 레이트 리밋 추적
         self._request_times = []  # 최근 요청 시간들
@@ -123,7 +132,7 @@ class HTTPClient:
                     f"[D48_HTTP_CLIENT] {method} {url} (attempt {attempt + 1}/{self.config.max_retry})"
                 )
                 
-                response = requests.request(
+                response = self.transport.request(
                     method=method,
                     url=url,
                     headers=headers,
@@ -233,3 +242,7 @@ class HTTPClient:
             params=params,
             timeout=timeout,
         )
+    
+    def get_latency_stats(self) -> Dict[str, Any]:
+        """전송 계층 단계별 지연 통계"""
+        return self.transport.get_stats()
@@ -39,6 +39,7 @@ from arbitrage.exchanges.upbit_l2_ws_provider import UpbitL2WebSocketProvider
 from arbitrage.exchanges.binance_l2_ws_provider import BinanceL2WebSocketProvider
 from arbitrage.exchanges.upbit_ws_adapter import UpbitWebSocketAdapter
 from arbitrage.exchanges.binance_ws_adapter import BinanceWebSocketAdapter
+from arbitrage.tracing import TickTracer
 
 logger = logging.getLogger(__name__)
 
@@ -367,6 +368,7 @@ class MultiExchangeL2Provider(MarketDataProvider):
         binance_timeout: float = 10.0,
         binance_max_reconnect_attempts: int = 5,
         binance_reconnect_backoff: float = 2.0,
+        tracer: Optional[TickTracer] = None,
     ):
         """
         Args:
@@ -374,6 +376,7 @@ class MultiExchangeL2Provider(MarketDataProvider):
             staleness_threshold_seconds: Stale 판단 임계값 (초)
             upbit_*: Upbit Provider 설정
             binance_*: Binance Provider 설정
+            tracer: TickTracer (D93-1, 선택). 두 WS 어댑터 수신 메시지에 tick trace 부착
         """
         self.symbols = symbols
         self.staleness_threshold = staleness_threshold_seconds
@@ -424,6 +427,11 @@ class MultiExchangeL2Provider(MarketDataProvider):
             reconnect_backoff=binance_reconnect_backoff,
         )
         
+        # D93-1: WS 수신 → aggregate 구간 trace
+        self.tracer = tracer
+        upbit_ws_adapter.tracer = tracer
+        binance_ws_adapter.tracer = tracer
+        
         logger.info(
             f"[D83-3_MULTI_L2] MultiExchangeL2Provider initialized for symbols={symbols}"
         )
@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+"""
+Request Signing
+
+거래소 private API 서명 컨텍스트.
+
+HMAC 키 패딩(ipad/opad)을 생성 시 한 번만 계산하고,
+요청마다 copy()로 복제하여 서명한다.
+"""
+
+import hashlib
+import hmac
+
+
+class HmacSigner:
+    """
+    사전 계산된 HMAC-SHA256 서명기
+    
+    ``hmac.new(secret, message, sha256).hexdigest()``와 동일한 결과.
+    """
+    
+    __slots__ = ("_base",)
+    
+    def __init__(self, secret: str):
+        """
+        Args:
+            secret: API 시크릿
+        """
+        self._base = hmac.new(secret.encode(), digestmod=hashlib.sha256)
+    
+    def sign(self, message: str) -> str:
+        """메시지 서명 (hex digest)"""
+        mac = self._base.copy()
+        mac.update(message.encode())
+        return mac.hexdigest()
@@ -0,0 +1,331 @@
+# -*- coding: utf-8 -*-
+"""
+Pooled HTTP Transport
+
+거래소별 공유 keep-alive 세션.
+
+- requests.Session + 커넥션 풀 (요청마다 TCP/TLS 핸드셰이크 제거)
+- DNS 캐시 (신규 커넥션 생성 시에만 조회, TTL 적용)
+- 시작 시 커넥션 pre-warm
+- 단계별 지연 계측: connect / TLS / TTFB / transfer / parse
+"""
+
+import logging
+import socket
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Any, Deque, Dict, Iterable, Optional, Tuple
+
+import numpy as np
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.poolmanager import PoolManager
+
+logger = logging.getLogger(__name__)
+
+TIMING_PHASES = ("connect", "tls", "ttfb", "transfer", "parse", "total")
+
+
+@dataclass
+class TransportConfig:
+    """전송 계층 설정"""
+    pool_connections: int = 4  # 호스트별 풀 개수
+    pool_maxsize: int = 8  # 풀당 유지 커넥션 수
+    dns_ttl_seconds: float = 60.0  # DNS 캐시 TTL
+    prewarm_timeout: float = 3.0  # pre-warm 요청 타임아웃 (초)
+    latency_window: int = 1024  # 단계별 지연 샘플 수
+
+
+@dataclass
+class RequestTiming:
+    """요청 1건의 단계별 지연 (ms)"""
+    connect_ms: float = 0.0
+    tls_ms: float = 0.0
+    ttfb_ms: float = 0.0
+    transfer_ms: float = 0.0
+    parse_ms: float = 0.0
+    total_ms: float = 0.0
+    reused: bool = True  # keep-alive 커넥션 재사용 여부
+
+
+class DNSCache:
+    """TTL 기반 DNS 캐시 (스레드 안전)"""
+    
+    def __init__(self, ttl_seconds: float = 60.0):
+        self.ttl_seconds = ttl_seconds
+        self._entries: Dict[Tuple[str, int], Tuple[str, float]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+    
+    def resolve(self, host: str, port: int) -> str:
+        """
+        호스트를 IP로 변환 (캐시 우선)
+        
+        조회 실패 시 원래 호스트를 반환하여 기본 경로로 위임.
+        """
+        key = (host, port)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] > now:
+                self.hits += 1
+                return entry[0]
+        
+        try:
+            infos = socket.getaddrinfo(host, port, 0, socket.SOCK_STREAM)
+        except socket.gaierror:
+            return host
+        address = infos[0][4][0]
+        
+        with self._lock:
+            self.misses += 1
+            self._entries[key] = (address, now + self.ttl_seconds)
+        return address
+    
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class _InstrumentedConnectionMixin:
+    """DNS 캐시 + connect/TLS 시간 기록"""
+    
+    def __init__(self, *args, transport: Optional["PooledTransport"] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._transport = transport
+        self._tcp_seconds = 0.0
+    
+    def _new_conn(self):
+        started = time.perf_counter()
+        dns_host = self._dns_host
+        if self._transport is not None:
+            # 소켓 연결에만 캐시된 IP 사용 (SNI/Host 헤더는 원래 호스트 유지)
+            self._dns_host = self._transport.dns_cache.resolve(dns_host, self.port)
+        try:
+            return super()._new_conn()
+        finally:
+            self._dns_host = dns_host
+            self._tcp_seconds = time.perf_counter() - started
+    
+    def connect(self):
+        started = time.perf_counter()
+        super().connect()
+        if self._transport is not None:
+            elapsed = time.perf_counter() - started
+            self._transport._record_connect(self._tcp_seconds, max(0.0, elapsed - self._tcp_seconds))
+
+
+class _InstrumentedHTTPConnection(_InstrumentedConnectionMixin, HTTPConnection):
+    pass
+
+
+class _InstrumentedHTTPSConnection(_InstrumentedConnectionMixin, HTTPSConnection):
+    pass
+
+
+class _TransportPoolManager(PoolManager):
+    """계측 커넥션 클래스를 사용하는 PoolManager"""
+    
+    def __init__(self, *args, transport: "PooledTransport", **kwargs):
+        super().__init__(*args, **kwargs)
+        self._transport = transport
+    
+    def _new_pool(self, scheme, host, port, request_context=None):
+        pool = super()._new_pool(scheme, host, port, request_context)
+        pool.ConnectionCls = (
+            _InstrumentedHTTPSConnection if scheme == "https" else _InstrumentedHTTPConnection
+        )
+        pool.conn_kw["transport"] = self._transport
+        return pool
+
+
+class _TransportAdapter(HTTPAdapter):
+    """PooledTransport 전용 HTTPAdapter (재시도는 HTTPClient가 담당)"""
+    
+    def __init__(self, transport: "PooledTransport", **kwargs):
+        self._transport = transport
+        super().__init__(max_retries=0, **kwargs)
+    
+    def init_poolmanager(self, connections, maxsize, block=False, **pool_kwargs):
+        self._pool_connections = connections
+        self._pool_maxsize = maxsize
+        self._pool_block = block
+        self.poolmanager = _TransportPoolManager(
+            num_pools=connections,
+            maxsize=maxsize,
+            block=block,
+            transport=self._transport,
+            **pool_kwargs,
+        )
+
+
+class PooledTransport:
+    """
+    keep-alive 커넥션 풀 기반 HTTP 전송 계층
+    
+    역할:
+    - requests.Session 공유 (커넥션 재사용)
+    - 신규 커넥션의 connect/TLS 시간과 요청별 TTFB/transfer/parse 시간 기록
+    - pre-warm으로 첫 주문 전에 커넥션 확보
+    """
+    
+    def __init__(self, config: Optional[TransportConfig] = None, name: str = "default"):
+        """
+        Args:
+            config: TransportConfig 인스턴스
+            name: 로그/통계용 이름 (거래소명)
+        """
+        self.config = config or TransportConfig()
+        self.name = name
+        self.dns_cache = DNSCache(self.config.dns_ttl_seconds)
+        
+        self.session = requests.Session()
+        adapter = _TransportAdapter(
+            self,
+            pool_connections=self.config.pool_connections,
+            pool_maxsize=self.config.pool_maxsize,
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._samples: Dict[str, Deque[float]] = {
+            phase: deque(maxlen=self.config.latency_window) for phase in TIMING_PHASES
+        }
+        self.requests_sent = 0
+        self.connections_opened = 0
+        
+        logger.info(
+            f"[TRANSPORT] {name}: pool_connections={self.config.pool_connections}, "
+            f"pool_maxsize={self.config.pool_maxsize}, dns_ttl={self.config.dns_ttl_seconds}s"
+        )
+    
+    def _record_connect(self, tcp_seconds: float, tls_seconds: float) -> None:
+        """신규 커넥션의 connect/TLS 시간 (요청 스레드에서 호출)"""
+        self._local.connect = (tcp_seconds, tls_seconds)
+    
+    def request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        """
+        단일 요청 실행 (재시도/레이트리밋 없음)
+        
+        Returns:
+            requests.Response (``timing`` 속성에 RequestTiming 첨부)
+        """
+        self._local.connect = None
+        started = time.perf_counter()
+        response = self.session.request(method=method, url=url, **kwargs)
+        total = time.perf_counter() - started
+        
+        timing = RequestTiming(total_ms=total * 1000.0)
+        connect = self._local.connect
+        if connect is not None:
+            timing.connect_ms = connect[0] * 1000.0
+            timing.tls_ms = connect[1] * 1000.0
+            timing.reused = False
+        elapsed = getattr(response, "elapsed", None)
+        if isinstance(elapsed, timedelta):
+            # elapsed: 전송 시작 ~ 응답 헤더 수신 (connect/TLS 포함)
+            headers_ms = elapsed.total_seconds() * 1000.0
+            timing.ttfb_ms = max(0.0, headers_ms - timing.connect_ms - timing.tls_ms)
+            timing.transfer_ms = max(0.0, timing.total_ms - headers_ms)
+        
+        try:
+            response.timing = timing
+        except AttributeError:
+            pass
+        self._record_timing(timing)
+        return response
+    
+    def get(self, url: str, **kwargs: Any) -> requests.Response:
+        """GET 요청"""
+        return self.request("GET", url, **kwargs)
+    
+    def parse_json(self, response: requests.Response) -> Any:
+        """응답 JSON 파싱 (parse 시간 기록)"""
+        started = time.perf_counter()
+        data = response.json()
+        parse_ms = (time.perf_counter() - started) * 1000.0
+        
+        timing = getattr(response, "timing", None)
+        if isinstance(timing, RequestTiming):
+            timing.parse_ms = parse_ms
+        with self._lock:
+            self._samples["parse"].append(parse_ms)
+        return data
+    
+    def _record_timing(self, timing: RequestTiming) -> None:
+        with self._lock:
+            self.requests_sent += 1
+            if not timing.reused:
+                self.connections_opened += 1
+                self._samples["connect"].append(timing.connect_ms)
+                self._samples["tls"].append(timing.tls_ms)
+            self._samples["ttfb"].append(timing.ttfb_ms)
+            self._samples["transfer"].append(timing.transfer_ms)
+            self._samples["total"].append(timing.total_ms)
+    
+    def prewarm(self, urls: Iterable[str]) -> int:
+        """
+        커넥션 pre-warm (HEAD 요청으로 DNS/TCP/TLS 미리 수행)
+        
+        Returns:
+            성공한 URL 수
+        """
+        warmed = 0
+        for url in urls:
+            try:
+                self.request("HEAD", url, timeout=self.config.prewarm_timeout)
+                warmed += 1
+            except requests.RequestException as e:
+                logger.warning(f"[TRANSPORT] {self.name}: prewarm failed for {url}: {e}")
+        logger.info(f"[TRANSPORT] {self.name}: prewarmed {warmed} connection(s)")
+        return warmed
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """단계별 지연 통계 (p50/p99, ms)"""
+        with self._lock:
+            samples = {phase: np.fromiter(values, dtype=np.float64) for phase, values in self._samples.items()}
+            stats: Dict[str, Any] = {
+                "requests_sent": self.requests_sent,
+                "connections_opened": self.connections_opened,
+                "connection_reuse_ratio": (
+                    1.0 - self.connections_opened / self.requests_sent if self.requests_sent else 0.0
+                ),
+                "dns_cache_hits": self.dns_cache.hits,
+                "dns_cache_misses": self.dns_cache.misses,
+            }
+        for phase, values in samples.items():
+            if len(values):
+                p50, p99 = np.percentile(values, [50, 99])
+            else:
+                p50 = p99 = 0.0
+            stats[f"{phase}_p50_ms"] = float(p50)
+            stats[f"{phase}_p99_ms"] = float(p99)
+        return stats
+    
+    def close(self) -> None:
+        self.session.close()
+
+
+_shared_transports: Dict[str, PooledTransport] = {}
+_shared_lock = threading.Lock()
+
+
+def get_shared_transport(name: str, config: Optional[TransportConfig] = None) -> PooledTransport:
+    """
+    거래소별 공유 PooledTransport 반환 (최초 호출 시 생성)
+    
+    동일 거래소 어댑터 인스턴스들이 커넥션 풀을 공유.
+    """
+    with _shared_lock:
+        transport = _shared_transports.get(name)
+        if transport is None:
+            transport = PooledTransport(config, name=name)
+            _shared_transports[name] = transport
+        return transport
@@ -9,6 +9,7 @@ Features:
 - 호가 조회 (orderbook)
 - 티커 조회 (ticker)
 - Top symbols 조회 (거래량 기준)
+- 다중 마켓 티커/호가 조회 (요청 1회로 여러 심볼)
 - No authentication required
 - Rate limit (429) handling with exponential backoff (D77-5)
 """
@@ -180,15 +181,7 @@ class UpbitPublicDataClient:
                 logger.warning(f"[UPBIT_PUBLIC] No ticker data for {symbol}")
                 return None
             
-            item = data[0]
-            return TickerInfo(
-                symbol=symbol,
-                trade_price=item.get("trade_price", 0.0),
-                trade_volume_24h=item.get("trade_volume", 0.0),
-                acc_trade_volume_24h=item.get("acc_trade_volume_24h", 0.0),
-                acc_trade_price_24h=item.get("acc_trade_price_24h", 0.0),
-                change_rate=item.get("signed_change_rate", 0.0),
-            )
+            return self._parse_ticker(symbol, data[0])
         
         except requests.exceptions.HTTPError as e:
             logger.error(f"[UPBIT_PUBLIC] HTTP error for ticker {symbol}: {e}")
@@ -225,29 +218,7 @@ class UpbitPublicDataClient:
                 logger.warning(f"[UPBIT_PUBLIC] No orderbook data for {symbol}")
                 return None
             
-            item = data[0]
-            orderbook_units = item.get("orderbook_units", [])
-            
-            bids = []
-            asks = []
-            for unit in orderbook_units:
-                # Upbit: bid_price/ask_price, bid_size/ask_size
-                bids.append(OrderbookLevel(
-                    price=unit.get("bid_price", 0.0),
-                    size=unit.get("bid_size", 0.0),
-                ))
-                asks.append(OrderbookLevel(
-                    price=unit.get("ask_price", 0.0),
-                    size=unit.get("ask_size", 0.0),
-                ))
-            
-            # Upbit는 이미 정렬되어 옴 (bids: 높은 가격순, asks: 낮은 가격순)
-            return OrderbookData(
-                symbol=symbol,
-                timestamp=item.get("timestamp", time.time() * 1000) / 1000.0,
-                bids=bids,
-                asks=asks,
-            )
+            return self._parse_orderbook(symbol, data[0])
         
         except requests.exceptions.HTTPError as e:
             logger.error(f"[UPBIT_PUBLIC] HTTP error for orderbook {symbol}: {e}")
@@ -256,6 +227,100 @@ class UpbitPublicDataClient:
             logger.error(f"[UPBIT_PUBLIC] Failed to parse orderbook data for {symbol}: {e}")
             return None
     
+    def fetch_tickers(self, symbols: List[str]) -> Dict[str, TickerInfo]:
+        """
+        다중 마켓 티커 조회 (요청 1회)
+        
+        Args:
+            symbols: 거래 쌍 리스트 (예: ["KRW-BTC", "KRW-ETH"])
+        
+        Returns:
+            {symbol: TickerInfo} (실패 시 빈 dict)
+        """
+        if not symbols:
+            return {}
+        
+        url = f"{self.BASE_URL}/ticker"
+        resp = self._request_with_retry(
+            url, {"markets": ",".join(symbols)}, operation_name=f"fetch_tickers({len(symbols)})"
+        )
+        if not resp:
+            return {}
+        
+        try:
+            resp.raise_for_status()
+            return {item["market"]: self._parse_ticker(item["market"], item) for item in resp.json()}
+        except requests.exceptions.HTTPError as e:
+            logger.error(f"[UPBIT_PUBLIC] HTTP error for tickers: {e}")
+            return {}
+        except (ValueError, KeyError) as e:
+            logger.error(f"[UPBIT_PUBLIC] Failed to parse tickers data: {e}")
+            return {}
+    
+    def fetch_orderbooks(self, symbols: List[str]) -> Dict[str, OrderbookData]:
+        """
+        다중 마켓 호가 조회 (요청 1회)
+        
+        Args:
+            symbols: 거래 쌍 리스트 (예: ["KRW-BTC", "KRW-ETH"])
+        
+        Returns:
+            {symbol: OrderbookData} (실패 시 빈 dict)
+        """
+        if not symbols:
+            return {}
+        
+        url = f"{self.BASE_URL}/orderbook"
+        resp = self._request_with_retry(
+            url, {"markets": ",".join(symbols)}, operation_name=f"fetch_orderbooks({len(symbols)})"
+        )
+        if not resp:
+            return {}
+        
+        try:
+            resp.raise_for_status()
+            return {item["market"]: self._parse_orderbook(item["market"], item) for item in resp.json()}
+        except requests.exceptions.HTTPError as e:
+            logger.error(f"[UPBIT_PUBLIC] HTTP error for orderbooks: {e}")
+            return {}
+        except (ValueError, KeyError) as e:
+            logger.error(f"[UPBIT_PUBLIC] Failed to parse orderbooks data: {e}")
+            return {}
+    
+    @staticmethod
+    def _parse_ticker(symbol: str, item: Dict[str, Any]) -> TickerInfo:
+        return TickerInfo(
+            symbol=symbol,
+            trade_price=item.get("trade_price", 0.0),
+            trade_volume_24h=item.get("trade_volume", 0.0),
+            acc_trade_volume_24h=item.get("acc_trade_volume_24h", 0.0),
+            acc_trade_price_24h=item.get("acc_trade_price_24h", 0.0),
+            change_rate=item.get("signed_change_rate", 0.0),
+        )
+    
+    @staticmethod
+    def _parse_orderbook(symbol: str, item: Dict[str, Any]) -> OrderbookData:
+        bids = []
+        asks = []
+        for unit in item.get("orderbook_units", []):
+            # Upbit: bid_price/ask_price, bid_size/ask_size
+            bids.append(OrderbookLevel(
+                price=unit.get("bid_price", 0.0),
+                size=unit.get("bid_size", 0.0),
+            ))
+            asks.append(OrderbookLevel(
+                price=unit.get("ask_price", 0.0),
+                size=unit.get("ask_size", 0.0),
+            ))
+        
+        # Upbit는 이미 정렬되어 옴 (bids: 높은 가격순, asks: 낮은 가격순)
+        return OrderbookData(
+            symbol=symbol,
+            timestamp=item.get("timestamp", time.time() * 1000) / 1000.0,
+            bids=bids,
+            asks=asks,
+        )
+    
     def fetch_top_symbols(
         self,
         market: str = "KRW",
@@ -8,6 +8,9 @@ D46: Read-Only 모드 추가
 - get_orderbook: 실제 Upbit API 호출
 - get_balance: 실제 Upbit API 호출
 - create_order/cancel_order: live_enabled=True일 때만 실행
+
+모든 REST 호출은 거래소별 공유 keep-alive 커넥션 풀을 사용하며,
+서명 컨텍스트(HMAC 키, 인증 헤더 템플릿)는 초기화 시 한 번만 생성.
 """
 
 import logging
@@ -15,8 +18,6 @@ import time
 import os
 from typing import Dict, List, Optional, Any
 import requests
-import hmac
-import hashlib
 import uuid
 import json
 from urllib.parse import urlencode
@@ -40,6 +41,8 @@ from arbitrage.exchanges.exceptions import (
     OrderNotFoundError,
 )
 from arbitrage.exchanges.http_client import HTTPClient, RateLimitConfig
+from arbitrage.exchanges.signing import HmacSigner
+from arbitrage.exchanges.transport import TransportConfig, get_shared_transport
 
 logger = logging.getLogger(__name__)
 
@@ -51,6 +54,9 @@ class UpbitSpotExchange(BaseExchange):
     Upbit REST API를 사용하여 현물 거래를 수행.
     """
     
+    # get_order_status 미구현 (고정값 반환) → reconcile/체결 재조회 대상 아님
+    supports_order_status = False
+    
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         """
         Args:
@@ -60,6 +66,8 @@ class UpbitSpotExchange(BaseExchange):
                 - base_url: API 엔드포인트 (기본: https://api.upbit.com)
                 - timeout: 요청 타임아웃 (초)
                 - rate_limit: RateLimitConfig dict (D48)
+                - transport: TransportConfig dict (커넥션 풀/DNS 캐시)
+                - prewarm: True면 초기화 시 커넥션 pre-warm
         """
         super().__init__("upbit", config)
         
@@ -71,6 +79,13 @@ class UpbitSpotExchange(BaseExchange):
         # 실제 거래 활성화 여부
         self.live_enabled = self.config.get("live_enabled", False)
         
+        # 거래소별 공유 커넥션 풀
+        transport_config = self.config.get("transport", {})
+        self.transport = get_shared_transport(
+            self.name,
+            TransportConfig(**transport_config) if isinstance(transport_config, dict) else None,
+        )
+        
         # D48: HTTP 클라이언트 (레이트리밋/재시도)
         rate_limit_config = self.config.get("rate_limit", {})
         if isinstance(rate_limit_config, dict):
@@ -79,10 +94,18 @@ class UpbitSpotExchange(BaseExchange):
                     max_requests_per_sec=rate_limit_config.get("max_requests_per_sec", 5.0),
                     max_retry=rate_limit_config.get("max_retry", 3),
                     base_backoff_seconds=rate_limit_config.get("base_backoff_seconds", 0.5),
-                )
+                ),
+                transport=self.transport,
             )
         else:
-            self.http_client = HTTPClient()
+            self.http_client = HTTPClient(transport=self.transport)
+        
+        # 서명 컨텍스트 사전 계산
+        self._signer = HmacSigner(self.api_secret)
+        self._auth_header_template = {"Authorization": f"Bearer {self.api_key}"}
+        
+        if self.config.get("prewarm", False):
+            self.prewarm()
         
         if not self.live_enabled:
             logger.warning("[D42_UPBIT] Live trading is DISABLED. Use Paper mode or enable live_enabled=True")
@@ -98,6 +121,26 @@ class UpbitSpotExchange(BaseExchange):
         """
         return self.config.get("base_currency", Currency.KRW)
     
+    def _auth_headers(self, query_string: str = "") -> Dict[str, str]:
+        """인증 헤더 생성 (사전 계산된 HMAC 키 / 헤더 템플릿 사용)"""
+        nonce = str(uuid.uuid4())
+        timestamp = str(int(time.time() * 1000))
+        
+        headers = dict(self._auth_header_template)
+        headers["X-Nonce"] = nonce
+        headers["X-Timestamp"] = timestamp
+        headers["X-Signature"] = self._signer.sign(f"{nonce}{timestamp}{query_string}")
+        return headers
+    
+    def prewarm(self) -> int:
+        """
+        커넥션 pre-warm (첫 주문 전에 DNS/TCP/TLS 수행)
+        
+        Returns:
+            성공한 URL 수
+        """
+        return self.transport.prewarm([f"{self.base_url}/v1/market/all"])
+    
     def get_orderbook(self, symbol: str) -> OrderBookSnapshot:
         """
         호가 정보 조회 (D46: 실제 API 호출).
@@ -117,14 +160,14 @@ class UpbitSpotExchange(BaseExchange):
             url = f"{self.base_url}/v1/orderbook"
             params = {"markets": symbol}
             
-            response = requests.get(
+            response = self.transport.get(
                 url,
                 params=params,
                 timeout=self.timeout,
             )
             response.raise_for_status()
             
-            data = response.json()
+            data = self.transport.parse_json(response)
             
             # Upbit API 응답 파싱
             # {
@@ -203,33 +246,17 @@ class UpbitSpotExchange(BaseExchange):
         
         try:
             # Upbit API 인증 헤더 생성
-            nonce = str(uuid.uuid4())
-            timestamp = str(int(time.time() * 1000))
-            
-            # 요청 서명
-            message = f"{nonce}{timestamp}"
-            signature = hmac.new(
-                self.api_secret.encode(),
-                message.encode(),
-                hashlib.sha256
-            ).hexdigest()
-            
-            headers = {
-                "Authorization": f"Bearer {self.api_key}",
-                "X-Nonce": nonce,
-                "X-Timestamp": timestamp,
-                "X-Signature": signature,
-            }
+            headers = self._auth_headers()
             
             url = f"{self.base_url}/v1/accounts"
-            response = requests.get(
+            response = self.transport.get(
                 url,
                 headers=headers,
                 timeout=self.timeout,
             )
             response.raise_for_status()
             
-            data = response.json()
+            data = self.transport.parse_json(response)
             
             # Upbit API 응답 파싱
             # [
@@ -330,23 +357,7 @@ class UpbitSpotExchange(BaseExchange):
             params = {k: v for k, v in params.items() if v is not None}
             
             # 인증 헤더 생성
-            nonce = str(uuid.uuid4())
-            timestamp = str(int(time.time() * 1000))
-            query_string = urlencode(params)
-            message = f"{nonce}{timestamp}{query_string}"
-            
-            signature = hmac.new(
-                self.api_secret.encode(),
-                message.encode(),
-                hashlib.sha256
-            ).hexdigest()
-            
-            headers = {
-                "Authorization": f"Bearer {self.api_key}",
-                "X-Nonce": nonce,
-                "X-Timestamp": timestamp,
-                "X-Signature": signature,
-            }
+            headers = self._auth_headers(urlencode(params))
             
             # HTTP 요청 (레이트리밋/재시도 포함)
             response = self.http_client.post(
@@ -357,7 +368,7 @@ class UpbitSpotExchange(BaseExchange):
             )
             
             response.raise_for_status()
-            data = response.json()
+            data = self.transport.parse_json(response)
             
             # 응답 파싱
             order_id = data.get("uuid", "")
@@ -432,22 +443,7 @@ class UpbitSpotExchange(BaseExchange):
             url = f"{self.base_url}/v1/orders/{order_id}"
             
             # 인증 헤더 생성
-            nonce = str(uuid.uuid4())
-            timestamp = str(int(time.time() * 1000))
-            message = f"{nonce}{timestamp}"
-            
-            signature = hmac.new(
-                self.api_secret.encode(),
-                message.encode(),
-                hashlib.sha256
-            ).hexdigest()
-            
-            headers = {
-                "Authorization": f"Bearer {self.api_key}",
-                "X-Nonce": nonce,
-                "X-Timestamp": timestamp,
-                "X-Signature": signature,
-            }
+            headers = self._auth_headers()
             
             # HTTP 요청 (레이트리밋/재시도 포함)
             response = self.http_client.delete(
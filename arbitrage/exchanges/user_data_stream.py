@@ -0,0 +1,470 @@
+# -*- coding: utf-8 -*-
+"""
+Private User Data Streams
+
+REST 주문 상태 폴링 대신 거래소 private WebSocket으로 주문/체결/잔고 push 수신.
+
+- OrderStateTable: exchange order_id 기준 주문 상태 테이블 (push 이벤트로 갱신)
+- BinanceUserDataStream: listenKey 기반 ORDER_TRADE_UPDATE / ACCOUNT_UPDATE
+- UpbitPrivateStream: myOrder / myAsset 구독
+- REST 조회(get_order_status)는 재연결/gap 발생 시 reconcile에만 사용
+"""
+
+import asyncio
+import logging
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from arbitrage.exchanges.base import Balance, OrderSide, OrderStatus
+from arbitrage.exchanges.ws_client import BaseWebSocketClient, ReconnectBackoffConfig
+
+logger = logging.getLogger(__name__)
+
+TERMINAL_STATUSES = frozenset({OrderStatus.FILLED, OrderStatus.CANCELED, OrderStatus.REJECTED})
+
+
+@dataclass
+class OrderUpdate:
+    """주문 상태 이벤트 (push 또는 REST reconcile)"""
+    exchange: str
+    order_id: str
+    symbol: str
+    status: OrderStatus
+    side: Optional[OrderSide] = None
+    qty: float = 0.0
+    filled_qty: float = 0.0
+    avg_price: float = 0.0
+    event_time: float = field(default_factory=time.time)  # 거래소 이벤트 시각 (초)
+    
+    @property
+    def is_terminal(self) -> bool:
+        return self.status in TERMINAL_STATUSES
+
+
+class OrderStateTable:
+    """
+    push 이벤트 기반 주문 상태 테이블 (스레드 안전)
+    
+    - 상태는 단조 갱신: 종료 상태 이후 / 과거 이벤트 / 체결량 감소 이벤트는 무시
+    - wait_for_fill: 종료 상태(FILLED/CANCELED/REJECTED)까지 대기 (폴링 없음)
+    """
+    
+    def __init__(self):
+        self._orders: Dict[str, OrderUpdate] = {}
+        self._cond = threading.Condition()
+        self._waiters: Dict[str, List[Tuple[asyncio.AbstractEventLoop, asyncio.Future]]] = {}
+        self._listeners: List[Callable[[OrderUpdate], None]] = []
+        self.updates_applied = 0
+        self.updates_ignored = 0
+    
+    def add_listener(self, listener: Callable[[OrderUpdate], None]) -> None:
+        """상태 변경 콜백 등록 (갱신 스레드에서 호출)"""
+        self._listeners.append(listener)
+    
+    def track(self, exchange: str, order_id: str, symbol: str, side: Optional[OrderSide] = None, qty: float = 0.0) -> None:
+        """
+        제출한 주문 등록 (이벤트 수신 전에도 reconcile 대상이 되도록)
+        
+        이미 이벤트가 도착한 주문은 그대로 유지.
+        """
+        with self._cond:
+            if order_id not in self._orders:
+                self._orders[order_id] = OrderUpdate(
+                    exchange=exchange,
+                    order_id=order_id,
+                    symbol=symbol,
+                    status=OrderStatus.OPEN,
+                    side=side,
+                    qty=qty,
+                    event_time=0.0,
+                )
+    
+    def apply(self, update: OrderUpdate) -> bool:
+        """
+        이벤트 반영
+        
+        Returns:
+            반영 여부 (stale 이벤트면 False)
+        """
+        with self._cond:
+            current = self._orders.get(update.order_id)
+            if current is not None and (
+                current.is_terminal
+                or update.event_time < current.event_time
+                or update.filled_qty < current.filled_qty
+            ):
+                self.updates_ignored += 1
+                return False
+            
+            if current is not None:
+                # 이벤트에 없는 필드는 기존 값 유지
+                update.side = update.side or current.side
+                update.qty = update.qty or current.qty
+                update.symbol = update.symbol or current.symbol
+            self._orders[update.order_id] = update
+            self.updates_applied += 1
+            
+            waiters = self._waiters.pop(update.order_id, []) if update.is_terminal else []
+            self._cond.notify_all()
+        
+        for loop, future in waiters:
+            loop.call_soon_threadsafe(_resolve, future, update)
+        for listener in self._listeners:
+            try:
+                listener(update)
+            except Exception as e:
+                logger.error(f"[USER_STREAM] Listener error: {e}")
+        return True
+    
+    def get(self, order_id: str) -> Optional[OrderUpdate]:
+        with self._cond:
+            return self._orders.get(order_id)
+    
+    def open_orders(self, exchange: Optional[str] = None) -> List[OrderUpdate]:
+        """종료되지 않은 주문 목록"""
+        with self._cond:
+            return [
+                order for order in self._orders.values()
+                if not order.is_terminal and (exchange is None or order.exchange == exchange)
+            ]
+    
+    def discard(self, order_id: str) -> None:
+        with self._cond:
+            self._orders.pop(order_id, None)
+    
+    async def wait_for_fill(self, order_id: str, timeout: float) -> OrderUpdate:
+        """
+        주문 종료 상태까지 대기 (asyncio)
+        
+        Raises:
+            asyncio.TimeoutError: timeout 내 종료 이벤트 없음
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        with self._cond:
+            current = self._orders.get(order_id)
+            if current is not None and current.is_terminal:
+                return current
+            self._waiters.setdefault(order_id, []).append((loop, future))
+        try:
+            return await asyncio.wait_for(future, timeout=timeout)
+        finally:
+            with self._cond:
+                waiters = self._waiters.get(order_id)
+                if waiters and (loop, future) in waiters:
+                    waiters.remove((loop, future))
+                    if not waiters:
+                        del self._waiters[order_id]
+    
+    def wait_for_fill_sync(self, order_id: str, timeout: float) -> OrderUpdate:
+        """
+        주문 종료 상태까지 대기 (동기 호출자용)
+        
+        Raises:
+            TimeoutError: timeout 내 종료 이벤트 없음
+        """
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            while True:
+                current = self._orders.get(order_id)
+                if current is not None and current.is_terminal:
+                    return current
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError(f"order {order_id} not terminal within {timeout}s")
+                self._cond.wait(remaining)
+
+
+def _resolve(future: asyncio.Future, update: OrderUpdate) -> None:
+    if not future.done():
+        future.set_result(update)
+
+
+class UserDataStream(BaseWebSocketClient, ABC):
+    """
+    private 주문/잔고 스트림 베이스
+    
+    - 메시지 → OrderUpdate / Balance 변환은 구현체 parse_message에서 수행
+    - 재연결 시 재구독 후 미종료 주문만 REST로 reconcile (push 누락 구간 보정)
+    """
+    
+    exchange_name = ""
+    
+    def __init__(
+        self,
+        exchange: Any,
+        url: str,
+        orders: Optional[OrderStateTable] = None,
+        reconnect_config: Optional[ReconnectBackoffConfig] = None,
+        heartbeat_interval: float = 300.0,
+        timeout: float = 10.0,
+    ):
+        """
+        Args:
+            exchange: 거래소 어댑터 (reconcile 시 get_order_status 사용)
+            url: private WebSocket URL
+            orders: 공유 OrderStateTable (None이면 신규 생성)
+            heartbeat_interval: 무수신 허용 간격 (private 스트림은 이벤트가 드묾)
+        """
+        super().__init__(url, reconnect_config, heartbeat_interval, timeout)
+        self.exchange = exchange
+        self.orders = orders or OrderStateTable()
+        self.balances: Dict[str, Balance] = {}
+        self.reconciles = 0
+        self._task: Optional[asyncio.Task] = None
+        self._resync_task: Optional[asyncio.Task] = None
+    
+    async def start(self) -> None:
+        """연결 + 구독 + 수신 루프 시작"""
+        await self.connect()
+        await self.subscribe([])
+        await self.reconcile()
+        self._task = asyncio.create_task(self.receive_loop())
+    
+    async def stop(self) -> None:
+        await self.disconnect()
+        for task in (self._task, self._resync_task):
+            if task is not None and not task.done():
+                task.cancel()
+                try:
+                    await task
+                except (asyncio.CancelledError, Exception):
+                    pass
+    
+    @abstractmethod
+    def parse_message(self, message: Dict[str, Any]) -> Optional[OrderUpdate]:
+        """메시지 → OrderUpdate (잔고 메시지는 self.balances 갱신 후 None)"""
+        pass
+    
+    def on_message(self, message: Dict[str, Any]) -> None:
+        try:
+            update = self.parse_message(message)
+        except (KeyError, TypeError, ValueError) as e:
+            logger.error(f"[USER_STREAM] {self.exchange_name}: parse error: {e}")
+            return
+        if update is not None:
+            self.orders.apply(update)
+    
+    def on_reconnect(self) -> None:
+        super().on_reconnect()
+        self._resync_task = asyncio.get_running_loop().create_task(self._resync())
+    
+    async def _resync(self) -> None:
+        try:
+            await self.subscribe([])
+            await self.reconcile()
+        except Exception as e:
+            logger.error(f"[USER_STREAM] {self.exchange_name}: resync failed: {e}")
+    
+    async def reconcile(self) -> int:
+        """
+        미종료 주문 REST 조회로 상태 보정 (재연결/gap 시에만)
+        
+        어댑터가 주문 조회를 지원하지 않으면(supports_order_status=False) 건너뜀.
+        (placeholder 응답으로 상태를 덮어쓰지 않도록)
+        
+        Returns:
+            조회한 주문 수
+        """
+        pending = self.orders.open_orders(self.exchange_name)
+        if not pending:
+            return 0
+        if not getattr(self.exchange, "supports_order_status", True):
+            logger.warning(
+                f"[USER_STREAM] {self.exchange_name}: adapter does not support order status query, "
+                f"skipping reconcile of {len(pending)} open order(s)"
+            )
+            return 0
+        self.reconciles += 1
+        for order in pending:
+            try:
+                result = await asyncio.to_thread(self.exchange.get_order_status, order.order_id)
+            except Exception as e:
+                logger.warning(f"[USER_STREAM] {self.exchange_name}: reconcile {order.order_id} failed: {e}")
+                continue
+            self.orders.apply(OrderUpdate(
+                exchange=self.exchange_name,
+                order_id=order.order_id,
+                symbol=result.symbol,
+                status=result.status,
+                side=result.side,
+                qty=result.qty,
+                filled_qty=result.filled_qty,
+                avg_price=result.price or 0.0,
+                event_time=max(order.event_time, result.timestamp),
+            ))
+        logger.info(f"[USER_STREAM] {self.exchange_name}: reconciled {len(pending)} open order(s)")
+        return len(pending)
+    
+    async def wait_for_fill(self, order_id: str, timeout: float) -> OrderUpdate:
+        return await self.orders.wait_for_fill(order_id, timeout)
+
+
+_BINANCE_STATUS = {
+    "NEW": OrderStatus.OPEN,
+    "PARTIALLY_FILLED": OrderStatus.PARTIALLY_FILLED,
+    "FILLED": OrderStatus.FILLED,
+    "CANCELED": OrderStatus.CANCELED,
+    "EXPIRED": OrderStatus.CANCELED,
+    "EXPIRED_IN_MATCH": OrderStatus.CANCELED,
+    "REJECTED": OrderStatus.REJECTED,
+}
+
+
+class BinanceUserDataStream(UserDataStream):
+    """
+    Binance Futures User Data Stream
+    
+    - listenKey 발급 → wss://fstream.binance.com/ws/<listenKey>
+    - keepalive_interval마다 listenKey 연장
+    - listenKeyExpired 수신 시 재발급 + 재연결 + reconcile
+    """
+    
+    exchange_name = "binance"
+    
+    def __init__(
+        self,
+        exchange: Any,
+        orders: Optional[OrderStateTable] = None,
+        ws_base_url: str = "wss://fstream.binance.com",
+        keepalive_interval: float = 1800.0,
+        **kwargs: Any,
+    ):
+        super().__init__(exchange, "", orders, **kwargs)
+        self.ws_base_url = ws_base_url.rstrip("/")
+        self.keepalive_interval = keepalive_interval
+        self.listen_key: Optional[str] = None
+        self._keepalive_task: Optional[asyncio.Task] = None
+    
+    async def connect(self) -> None:
+        # 재연결마다 listenKey 재발급 (만료된 key 재사용 방지)
+        self.listen_key = await asyncio.to_thread(self.exchange.create_listen_key)
+        self.url = f"{self.ws_base_url}/ws/{self.listen_key}"
+        await super().connect()
+    
+    async def start(self) -> None:
+        await super().start()
+        self._keepalive_task = asyncio.create_task(self._keepalive_loop())
+    
+    async def stop(self) -> None:
+        if self._keepalive_task is not None:
+            self._keepalive_task.cancel()
+        await super().stop()
+    
+    async def _keepalive_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.keepalive_interval)
+            try:
+                await asyncio.to_thread(self.exchange.keepalive_listen_key)
+            except Exception as e:
+                logger.warning(f"[USER_STREAM] binance: listenKey keepalive failed: {e}")
+    
+    async def subscribe(self, channels: List[str]) -> None:
+        # listenKey 스트림은 별도 구독 불필요
+        pass
+    
+    def on_message(self, message: Dict[str, Any]) -> None:
+        if message.get("e") == "listenKeyExpired":
+            logger.warning("[USER_STREAM] binance: listenKey expired, reconnecting")
+            asyncio.get_running_loop().create_task(self._drop_connection())
+            return
+        super().on_message(message)
+    
+    def parse_message(self, message: Dict[str, Any]) -> Optional[OrderUpdate]:
+        event = message.get("e")
+        if event == "ORDER_TRADE_UPDATE":
+            order = message["o"]
+            return OrderUpdate(
+                exchange=self.exchange_name,
+                order_id=str(order["i"]),
+                symbol=order["s"],
+                status=_BINANCE_STATUS.get(order["X"], OrderStatus.OPEN),
+                side=OrderSide(order["S"]),
+                qty=float(order["q"]),
+                filled_qty=float(order["z"]),
+                avg_price=float(order.get("ap", 0.0)),
+                event_time=message["E"] / 1000.0,
+            )
+        if event == "ACCOUNT_UPDATE":
+            for balance in message["a"].get("B", []):
+                wallet = float(balance["wb"])
+                free = float(balance["cw"])
+                self.balances[balance["a"]] = Balance(
+                    asset=balance["a"],
+                    free=free,
+                    locked=max(0.0, wallet - free),
+                )
+        return None
+
+
+_UPBIT_STATUS = {
+    "wait": OrderStatus.OPEN,
+    "watch": OrderStatus.OPEN,
+    "done": OrderStatus.FILLED,
+    "cancel": OrderStatus.CANCELED,
+    "prevented": OrderStatus.CANCELED,
+}
+
+
+class UpbitPrivateStream(UserDataStream):
+    """
+    Upbit private WebSocket (myOrder / myAsset)
+    
+    - 연결 시 어댑터와 동일한 인증 헤더 사용 (재연결마다 nonce 갱신)
+    """
+    
+    exchange_name = "upbit"
+    
+    def __init__(
+        self,
+        exchange: Any,
+        orders: Optional[OrderStateTable] = None,
+        url: str = "wss://api.upbit.com/websocket/v1/private",
+        **kwargs: Any,
+    ):
+        super().__init__(exchange, url, orders, **kwargs)
+    
+    async def connect(self) -> None:
+        self.connect_headers = self.exchange._auth_headers()
+        await super().connect()
+    
+    async def subscribe(self, channels: List[str]) -> None:
+        await self.send_message([
+            {"ticket": str(uuid.uuid4())},
+            {"type": "myOrder"},
+            {"type": "myAsset"},
+        ])
+    
+    def parse_message(self, message: Dict[str, Any]) -> Optional[OrderUpdate]:
+        kind = message.get("type")
+        if kind == "myOrder":
+            state = message["state"]
+            filled = float(message.get("executed_volume") or 0.0)
+            remaining = float(message.get("remaining_volume") or 0.0)
+            if state == "trade":
+                status = OrderStatus.PARTIALLY_FILLED if remaining > 0 else OrderStatus.FILLED
+            else:
+                status = _UPBIT_STATUS.get(state, OrderStatus.OPEN)
+            return OrderUpdate(
+                exchange=self.exchange_name,
+                order_id=message["uuid"],
+                symbol=message["code"],
+                status=status,
+                side=OrderSide.BUY if message.get("ask_bid") == "BID" else OrderSide.SELL,
+                qty=float(message.get("volume") or 0.0),
+                filled_qty=filled,
+                avg_price=float(message.get("avg_price") or 0.0),
+                event_time=message["timestamp"] / 1000.0,
+            )
+        if kind == "myAsset":
+            for asset in message.get("assets", []):
+                self.balances[asset["currency"]] = Balance(
+                    asset=asset["currency"],
+                    free=float(asset["balance"]),
+                    locked=float(asset["locked"]),
+                )
+        return None
@@ -20,6 +20,8 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from typing import List, Optional, Callable, Dict, Any
 
+from arbitrage.tracing import STAGE_WS_DECODE, TickTrace, TickTracer
+
 logger = logging.getLogger(__name__)
 
 
@@ -89,10 +91,15 @@ class BaseWebSocketClient(ABC):
         self.timeout = timeout
         
         self.ws = None
+        self.connect_headers: Optional[Dict[str, str]] = None  # 인증 헤더 (private 스트림)
         self.is_connected = False
         self.is_running = False
         self._reconnect_attempt = 0
         self._last_heartbeat = time.time()
+        
+        # D93-1: tick tracing (None이면 비활성)
+        self.tracer: Optional[TickTracer] = None
+        self._active_trace: Optional[TickTrace] = None
     
     @abstractmethod
     async def subscribe(self, channels: List[str]) -> None:
@@ -149,7 +156,7 @@ class BaseWebSocketClient(ABC):
                 )
             
             self.ws = await asyncio.wait_for(
-                websockets.connect(self.url),
+                websockets.connect(self.url, **self._connect_kwargs(websockets)),
                 timeout=self.timeout,
             )
             
@@ -165,6 +172,25 @@ class BaseWebSocketClient(ABC):
         except Exception as e:
             raise WebSocketConnectionError(f"Connection failed: {e}")
     
+    def _connect_kwargs(self, websockets_module) -> Dict[str, Any]:
+        """connect_headers → websockets 버전별 헤더 인자"""
+        if not self.connect_headers:
+            return {}
+        major = int(websockets_module.__version__.split(".")[0])
+        key = "additional_headers" if major >= 14 else "extra_headers"
+        return {key: self.connect_headers}
+    
+    async def _drop_connection(self) -> None:
+        """
+        현재 연결만 종료 (receive_loop는 유지 → 다음 루프에서 재연결)
+        """
+        self.is_connected = False
+        try:
+            if self.ws:
+                await self.ws.close()
+        except Exception as e:
+            logger.debug(f"[D49_WS] Close error: {e}")
+    
     async def disconnect(self) -> None:
         """
         WebSocket 종료
@@ -192,6 +218,8 @@ class BaseWebSocketClient(ABC):
             try:
                 if not self.is_connected:
                     await self._reconnect()
+                    if not self.is_connected:
+                        continue
                 
                 # 메시지 수신
                 raw_message = await asyncio.wait_for(
@@ -199,43 +227,65 @@ class BaseWebSocketClient(ABC):
                     timeout=self.timeout,
                 )
                 
-                # D83-1.6 DEBUG: raw 메시지 정보
-                logger.debug(
-                    f"[D49_WS_DEBUG] Received message: type={type(raw_message)}, "
-                    f"len={len(raw_message) if isinstance(raw_message, (str, bytes)) else 'N/A'}"
-                )
-                
-                # D83-1.6 FIX: bytes를 str로 변환 (Upbit은 binary로 메시지 전송)
-                if isinstance(raw_message, bytes):
-                    try:
-                        message_str = raw_message.decode('utf-8')
-                        logger.debug(f"[D49_WS_DEBUG] Decoded bytes to UTF-8: {message_str[:100]}...")
-                    except UnicodeDecodeError as e:
-                        logger.error(f"[D49_WS] Failed to decode bytes message: {e}")
-                        continue
-                else:
-                    message_str = raw_message
-                
-                # JSON 파싱
-                try:
-                    message = json.loads(message_str)
-                    logger.debug(f"[D49_WS_DEBUG] Parsed JSON message: keys={list(message.keys())}")
-                    self.on_message(message)
-                    self._last_heartbeat = time.time()
-                except json.JSONDecodeError as e:
-                    logger.error(f"[D49_WS] JSON parse error: {e}")
-                    self.on_error(WebSocketProtocolError(f"Invalid JSON: {e}"))
+                self._handle_raw_message(raw_message)
             
             except asyncio.TimeoutError:
                 # heartbeat 체크
                 if time.time() - self._last_heartbeat > self.heartbeat_interval * 2:
                     logger.warning(f"[D49_WS] Heartbeat timeout")
-                    await self.disconnect()
+                    await self._drop_connection()
             
+            except asyncio.CancelledError:
+                raise
             except Exception as e:
+                if not self.is_running:
+                    break
                 logger.error(f"[D49_WS] Receive error: {e}")
                 self.on_error(e)
-                await self.disconnect()
+                await self._drop_connection()
+    
+    def _handle_raw_message(self, raw_message: Any) -> None:
+        """
+        수신 메시지 1건 처리 (decode → JSON 파싱 → on_message)
+        
+        D93-1: tracer가 설정되어 있으면 recv 반환 시점부터 tick trace 시작.
+        on_message 처리 동안 self._active_trace로 노출 (어댑터가 스냅샷에 부착)
+        """
+        tracer = self.tracer
+        trace = tracer.start() if tracer is not None else None
+        
+        # D83-1.6 DEBUG: raw 메시지 정보
+        logger.debug(
+            f"[D49_WS_DEBUG] Received message: type={type(raw_message)}, "
+            f"len={len(raw_message) if isinstance(raw_message, (str, bytes)) else 'N/A'}"
+        )
+        
+        # D83-1.6 FIX: bytes를 str로 변환 (Upbit은 binary로 메시지 전송)
+        if isinstance(raw_message, bytes):
+            try:
+                message_str = raw_message.decode('utf-8')
+                logger.debug(f"[D49_WS_DEBUG] Decoded bytes to UTF-8: {message_str[:100]}...")
+            except UnicodeDecodeError as e:
+                logger.error(f"[D49_WS] Failed to decode bytes message: {e}")
+                return
+        else:
+            message_str = raw_message
+        
+        # JSON 파싱
+        try:
+            message = json.loads(message_str)
+            logger.debug(f"[D49_WS_DEBUG] Parsed JSON message: keys={list(message.keys())}")
+            if trace is not None:
+                trace.mark(STAGE_WS_DECODE)
+                self._active_trace = trace
+            try:
+                self.on_message(message)
+            finally:
+                self._active_trace = None
+            self._last_heartbeat = time.time()
+        except json.JSONDecodeError as e:
+            logger.error(f"[D49_WS] JSON parse error: {e}")
+            self.on_error(WebSocketProtocolError(f"Invalid JSON: {e}"))
     
     async def _reconnect(self) -> None:
         """
@@ -253,7 +303,7 @@ class BaseWebSocketClient(ABC):
         try:
             await self.connect()
             self.on_reconnect()
-        except WebSocketConnectionError:
+        except WebSocketError:
             self._reconnect_attempt += 1
             # 다음 루프에서 재시도
     
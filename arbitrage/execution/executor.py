@@ -6,6 +6,7 @@ D61: Multi-Symbol Paper Execution — Executor Base Classes
 """
 
 import logging
+import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -51,6 +52,10 @@ class ExecutionResult:
     sell_slippage_bps: float = 0.0
     buy_fill_ratio: float = 1.0
     sell_fill_ratio: float = 1.0
+    
+    # 부분 체결 시 초과 체결분 청산 주문
+    unwind_order_id: Optional[str] = None
+    unwind_qty: float = 0.0
 
 
 class BaseExecutor(ABC):
@@ -762,6 +767,8 @@ class LiveExecutor(BaseExecutor):
     dry_run=True 시 로그만 출력하고 실제 주문은 하지 않는다.
     """
     
+    EXPOSURE_EPSILON = 1e-9
+    
     def __init__(
         self,
         symbol: str,
@@ -770,6 +777,8 @@ class LiveExecutor(BaseExecutor):
         upbit_api=None,
         binance_api=None,
         dry_run: bool = True,
+        order_state=None,
+        fill_timeout: float = 5.0,
     ):
         """
         Args:
@@ -779,11 +788,15 @@ class LiveExecutor(BaseExecutor):
             upbit_api: Upbit API 클라이언트
             binance_api: Binance API 클라이언트
             dry_run: 드라이런 모드 (True면 실제 주문 안 함)
+            order_state: private 스트림 OrderStateTable (있으면 체결 push 대기)
+            fill_timeout: 양 레그 체결 대기 시간 (초, 공유 deadline)
         """
         super().__init__(symbol, portfolio_state, risk_guard)
         self.upbit_api = upbit_api
         self.binance_api = binance_api
         self.dry_run = dry_run
+        self.order_state = order_state
+        self.fill_timeout = fill_timeout
         self.positions: Dict[str, Position] = {}
         self.orders: Dict[str, Order] = {}
         self.pnl_history: List[Tuple[datetime, float]] = []
@@ -841,8 +854,8 @@ class LiveExecutor(BaseExecutor):
             result = self._execute_single_trade(trade)
             results.append(result)
             
-            # 3. 상태 업데이트
-            if result.status == "success":
+            # 3. 상태 업데이트 (부분 체결은 매칭된 수량만 반영)
+            if result.status == "success" or (result.status == "partial" and result.quantity > 0):
                 self.execution_count += 1
                 self.total_pnl += result.pnl
                 
@@ -985,6 +998,18 @@ class LiveExecutor(BaseExecutor):
                             status="failed",
                         )
             
+            # 2-1. 체결 확인 (private 스트림 push, REST 폴링 없음)
+            if not self.dry_run and self.order_state is not None and buy_order_id and sell_order_id:
+                buy_fill_ratio, sell_fill_ratio = self._await_fills(
+                    trade, str(buy_order_id), str(sell_order_id)
+                )
+                if buy_fill_ratio < 1.0 or sell_fill_ratio < 1.0:
+                    logger.warning(
+                        f"[D64_LIVE_EXECUTOR] Partial fill for {self.symbol}: "
+                        f"buy={buy_fill_ratio:.2f}, sell={sell_fill_ratio:.2f}"
+                    )
+                    return self._settle_partial_fill(trade, str(buy_order_id), str(sell_order_id))
+            
             # 3. 포지션 생성
             position_id = f"POS_{self.symbol}_{self.execution_count}"
             position = Position(
@@ -1028,6 +1053,150 @@ class LiveExecutor(BaseExecutor):
                 status="failed",
             )
     
+    def _await_fills(self, trade, buy_order_id: str, sell_order_id: str) -> Tuple[float, float]:
+        """
+        양 레그 종료 이벤트 대기 (공유 deadline)
+        
+        Returns:
+            (매수 체결 비율, 매도 체결 비율)
+        """
+        deadline = time.monotonic() + self.fill_timeout
+        ratios = []
+        for exchange, order_id in (
+            (trade.buy_exchange, buy_order_id),
+            (trade.sell_exchange, sell_order_id),
+        ):
+            self.order_state.track(exchange, order_id, trade.symbol, qty=trade.quantity)
+            try:
+                update = self.order_state.wait_for_fill_sync(
+                    order_id, max(0.0, deadline - time.monotonic())
+                )
+            except TimeoutError:
+                update = self.order_state.get(order_id)
+            filled = update.filled_qty if update is not None else 0.0
+            ratios.append(min(1.0, filled / trade.quantity) if trade.quantity else 0.0)
+        return ratios[0], ratios[1]
+    
+    def _settle_partial_fill(self, trade, buy_order_id: str, sell_order_id: str) -> ExecutionResult:
+        """
+        부분 체결 정리
+        
+        1. 미종료 레그 잔량 취소 후 종료 이벤트로 최종 체결 수량 확정
+        2. 양 레그 공통 체결 수량은 포지션으로 기록
+        3. 한쪽 초과 체결분은 해당 거래소에서 반대 방향 시장가로 청산
+        
+        Returns:
+            status="partial" 결과 (quantity = 매칭된 수량)
+        """
+        filled = []
+        for exchange, order_id in (
+            (trade.buy_exchange, buy_order_id),
+            (trade.sell_exchange, sell_order_id),
+        ):
+            update = self.order_state.get(order_id)
+            if update is None or not update.is_terminal:
+                self._cancel_order(exchange, order_id)
+                try:
+                    update = self.order_state.wait_for_fill_sync(order_id, self.fill_timeout)
+                except TimeoutError:
+                    logger.warning(
+                        f"[D64_LIVE_EXECUTOR] Cancel not confirmed for {exchange} order {order_id}, "
+                        f"using last known fill"
+                    )
+                    update = self.order_state.get(order_id)
+            filled.append(min(trade.quantity, update.filled_qty) if update is not None else 0.0)
+        buy_filled, sell_filled = filled
+        
+        # 초과 체결분 청산 (매수 초과 → 매수 거래소에서 매도, 매도 초과 → 매도 거래소에서 재매수)
+        excess = buy_filled - sell_filled
+        unwind_order_id = None
+        if excess > self.EXPOSURE_EPSILON:
+            unwind_order_id = self._unwind(trade, trade.buy_exchange, OrderSide.SELL, excess, trade.buy_price)
+        elif excess < -self.EXPOSURE_EPSILON:
+            unwind_order_id = self._unwind(trade, trade.sell_exchange, OrderSide.BUY, -excess, trade.sell_price)
+        
+        matched = min(buy_filled, sell_filled)
+        pnl = 0.0
+        if matched > 0:
+            position_id = f"POS_{self.symbol}_{self.execution_count}"
+            self.positions[position_id] = Position(
+                symbol=self.symbol,
+                quantity=matched,
+                entry_price=trade.buy_price,
+                current_price=trade.sell_price,
+                side=OrderSide.BUY,
+                timestamp=datetime.utcnow(),
+            )
+            pnl = (trade.sell_price - trade.buy_price) * matched
+        
+        logger.warning(
+            f"[D64_LIVE_EXECUTOR] Partial fill settled for {self.symbol}: "
+            f"matched={matched}, unwind={abs(excess)} (order_id={unwind_order_id})"
+        )
+        return ExecutionResult(
+            symbol=self.symbol,
+            trade_id=trade.trade_id,
+            status="partial",
+            buy_order_id=buy_order_id,
+            sell_order_id=sell_order_id,
+            buy_price=trade.buy_price,
+            sell_price=trade.sell_price,
+            quantity=matched,
+            pnl=pnl,
+            buy_fill_ratio=buy_filled / trade.quantity if trade.quantity else 0.0,
+            sell_fill_ratio=sell_filled / trade.quantity if trade.quantity else 0.0,
+            unwind_order_id=unwind_order_id,
+            unwind_qty=abs(excess) if unwind_order_id is not None else 0.0,
+        )
+    
+    def _cancel_order(self, exchange: str, order_id: str) -> bool:
+        """미체결 잔량 취소 (실패 시 False)"""
+        api = self.upbit_api if exchange == "upbit" else self.binance_api
+        try:
+            api.cancel_order(order_id)
+            return True
+        except Exception as e:
+            logger.error(f"[D64_LIVE_EXECUTOR] Cancel failed for {exchange} order {order_id}: {e}")
+            return False
+    
+    def _unwind(self, trade, exchange: str, side: OrderSide, qty: float, ref_price: float) -> Optional[str]:
+        """
+        초과 체결분 시장가 청산
+        
+        Upbit 시장가 매수는 KRW 총액(ord_type="price")으로 주문.
+        
+        Returns:
+            청산 주문 ID (실패 시 None)
+        """
+        base = trade.symbol.split('-')[1]
+        try:
+            if exchange == "upbit":
+                if side == OrderSide.BUY:
+                    order = self.upbit_api.create_order(
+                        market=f"KRW-{base}", side="bid", ord_type="price", price=qty * ref_price,
+                    )
+                else:
+                    order = self.upbit_api.create_order(
+                        market=f"KRW-{base}", side="ask", ord_type="market", volume=qty,
+                    )
+                order_id = order.get("uuid")
+            else:
+                order = self.binance_api.create_order(
+                    symbol=f"{base}USDT", side=side.value.upper(), type="MARKET", quantity=qty,
+                )
+                order_id = order.get("orderId")
+        except Exception as e:
+            logger.error(
+                f"[D64_LIVE_EXECUTOR] Unwind failed on {exchange}: {side.value} {qty} {self.symbol}: {e} "
+                f"(manual intervention required)"
+            )
+            return None
+        logger.warning(
+            f"[D64_LIVE_EXECUTOR] Unwound excess fill on {exchange}: "
+            f"{side.value} {qty} {self.symbol} (order_id={order_id})"
+        )
+        return order_id
+    
     def get_positions(self) -> Dict[str, Position]:
         """
         포지션 조회
@@ -18,8 +18,9 @@ Date: 2025-12-04
 
 import logging
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from typing import Tuple
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from typing import Any, Optional, Tuple
 
 from arbitrage.types import OrderSide
 
@@ -619,6 +620,22 @@ class CalibrationZone:
     samples: int
 
 
+def _to_calibration_zone(zone_data: Any) -> CalibrationZone:
+    """Calibration JSON dict → CalibrationZone (필요한 필드만 추출)"""
+    if isinstance(zone_data, dict):
+        return CalibrationZone(
+            zone_id=zone_data["zone_id"],
+            entry_min=zone_data["entry_min"],
+            entry_max=zone_data["entry_max"],
+            tp_min=zone_data["tp_min"],
+            tp_max=zone_data["tp_max"],
+            buy_fill_ratio=zone_data["buy_fill_ratio"],
+            sell_fill_ratio=zone_data["sell_fill_ratio"],
+            samples=zone_data["samples"],
+        )
+    return zone_data
+
+
 @dataclass
 class CalibrationTable:
     """
@@ -641,10 +658,35 @@ class CalibrationTable:
     created_at: str
     source: str
     
+    # D92-8: Entry 구간 인덱스 (zones 리스트 교체/길이 변경 시 재생성)
+    _index: Optional[Tuple[Any, ...]] = field(default=None, init=False, repr=False, compare=False)
+    
+    def _build_index(self) -> Tuple[Any, ...]:
+        """
+        Entry 경계값 정렬 배열 + slot별 후보 Zone (원래 순서 유지).
+        
+        slot 2k: (edges[k-1], edges[k]) 개구간, slot 2k+1: edges[k] 한 점.
+        """
+        zones = [_to_calibration_zone(zone_data) for zone_data in self.zones]
+        edges = sorted({edge for zone in zones for edge in (zone.entry_min, zone.entry_max)})
+        slots = []
+        for k in range(len(edges) + 1):
+            low = edges[k - 1] if k > 0 else float("-inf")
+            high = edges[k] if k < len(edges) else float("inf")
+            slots.append(tuple(z for z in zones if z.entry_min <= low and high <= z.entry_max))
+            if k < len(edges):
+                slots.append(tuple(z for z in zones if z.entry_min <= high <= z.entry_max))
+        index = (self.zones, len(self.zones), edges, tuple(slots))
+        self._index = index
+        return index
+    
     def select_zone(self, entry_bps: float, tp_bps: float) -> CalibrationZone:
         """
         Entry/TP에 해당하는 Zone 선택
         
+        D92-8: Entry는 bisect로 slot을 찾고, slot 후보 중 TP 범위가 맞는 첫 Zone 반환
+        (기존 선형 스캔과 동일한 first-match 결과).
+        
         Args:
             entry_bps: Entry Threshold (bps)
             tp_bps: TP Threshold (bps)
@@ -652,24 +694,14 @@ class CalibrationTable:
         Returns:
             매칭된 Zone (없으면 None)
         """
-        for zone_data in self.zones:
-            if isinstance(zone_data, dict):
-                # CalibrationZone에 필요한 필드만 추출
-                zone = CalibrationZone(
-                    zone_id=zone_data["zone_id"],
-                    entry_min=zone_data["entry_min"],
-                    entry_max=zone_data["entry_max"],
-                    tp_min=zone_data["tp_min"],
-                    tp_max=zone_data["tp_max"],
-                    buy_fill_ratio=zone_data["buy_fill_ratio"],
-                    sell_fill_ratio=zone_data["sell_fill_ratio"],
-                    samples=zone_data["samples"],
-                )
-            else:
-                zone = zone_data
-            
-            if (zone.entry_min <= entry_bps <= zone.entry_max and
-                zone.tp_min <= tp_bps <= zone.tp_max):
+        index = self._index
+        if index is None or index[0] is not self.zones or index[1] != len(self.zones):
+            index = self._build_index()
+        edges = index[2]
+        k = bisect_left(edges, entry_bps)
+        slot = 2 * k + 1 if k < len(edges) and edges[k] == entry_bps else 2 * k
+        for zone in index[3][slot]:
+            if zone.tp_min <= tp_bps <= zone.tp_max:
                 return zone
         return None
     
@@ -3,18 +3,32 @@
 D34 Kubernetes Health History Persistence (File-based, Read-Only)
 
 건강 상태 스냅샷을 파일 기반 저장소에 저장합니다.
+
+히스토리 파일(JSONL) 옆에 두 개의 사이드카 파일을 유지합니다:
+- ``<path>.idx``: 희소 오프셋 인덱스 (INDEX_STRIDE 레코드마다 timestamp → byte offset)
+- ``<path>.summary.json``: 증분 요약 카운터 (전체 레코드 수, 상태별 카운트, 마지막 레코드)
+
+사이드카는 언제든 히스토리 파일로부터 재구성할 수 있으며, 누락/손상/불일치 시
+자동으로 재구성됩니다. 조회 비용은 전체 히스토리가 아닌 limit/범위에 비례합니다.
 """
 
+import bisect
 import json
 import logging
 import os
 from dataclasses import dataclass, asdict
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Iterator, Tuple
 
 from arbitrage.k8s_health import K8sHealthSnapshot, HealthLevel
 
 logger = logging.getLogger(__name__)
 
+# 희소 인덱스 간격 (레코드 수)
+INDEX_STRIDE = 64
+
+# 역방향 tail-read 블록 크기 (bytes)
+TAIL_READ_BLOCK_SIZE = 64 * 1024
+
 
 @dataclass
 class K8sHealthHistoryRecord:
@@ -40,6 +54,13 @@ class K8sHealthHistoryStore:
             path: 히스토리 파일 경로 (예: 'outputs/k8s_health_history.jsonl')
         """
         self.path = path
+        self.index_path = f"{path}.idx"
+        self.summary_path = f"{path}.summary.json"
+        
+        # 사이드카 메모리 캐시 (지연 로드)
+        self._summary: Optional[Dict[str, Any]] = None
+        self._index: Optional[List[Tuple[str, int]]] = None
+        
         logger.info(f"[D34_K8S_HISTORY] Initialized history store: {path}")
     
     def append(self, snapshot: K8sHealthSnapshot) -> K8sHealthHistoryRecord:
@@ -83,6 +104,8 @@ class K8sHealthHistoryStore:
         """
         최근 N개 레코드 로드
         
+        파일 끝에서부터 블록 단위로 역방향 읽기하므로 비용은 limit에 비례합니다.
+        
         Args:
             limit: 로드할 최대 레코드 수
         
@@ -93,52 +116,136 @@ class K8sHealthHistoryStore:
             logger.info(f"[D34_K8S_HISTORY] History file not found: {self.path}")
             return []
         
-        records = []
+        if limit <= 0:
+            return []
+        
+        records: List[K8sHealthHistoryRecord] = []
         
         try:
-            with open(self.path, 'r', encoding='utf-8') as f:
-                for line in f:
-                    line = line.strip()
-                    if not line:
+            with open(self.path, 'rb') as f:
+                for raw_line in self._iter_lines_reverse(f):
+                    record = self._parse_line(raw_line)
+                    if record is None:
+                        continue
+                    records.append(record)
+                    if len(records) >= limit:
+                        break
+        
+        except IOError as e:
+            logger.error(f"[D34_K8S_HISTORY] Error reading history file: {e}")
+            return []
+        
+        records.reverse()
+        return records
+    
+    def load_range(
+        self,
+        start_timestamp: Optional[str] = None,
+        end_timestamp: Optional[str] = None,
+    ) -> List[K8sHealthHistoryRecord]:
+        """
+        타임스탬프 범위 레코드 로드 (양 끝 포함)
+        
+        희소 인덱스에서 시작 오프셋을 이진 탐색한 뒤 범위 끝까지만 순방향으로 읽습니다.
+        레코드는 시간 순서로 추가된다고 가정합니다 (ISO 8601 문자열 비교).
+        
+        Args:
+            start_timestamp: 시작 타임스탬프 (None이면 처음부터)
+            end_timestamp: 종료 타임스탬프 (None이면 끝까지)
+        
+        Returns:
+            K8sHealthHistoryRecord 목록 (오래된 것부터 최신 순)
+        """
+        if not os.path.exists(self.path):
+            logger.info(f"[D34_K8S_HISTORY] History file not found: {self.path}")
+            return []
+        
+        self._sync_sidecars()
+        
+        start_offset = 0
+        if start_timestamp is not None and self._index:
+            timestamps = [ts for ts, _ in self._index]
+            # start_timestamp 미만인 마지막 인덱스 엔트리부터 스캔
+            pos = bisect.bisect_left(timestamps, start_timestamp) - 1
+            if pos >= 0:
+                start_offset = self._index[pos][1]
+        
+        records: List[K8sHealthHistoryRecord] = []
+        
+        try:
+            with open(self.path, 'rb') as f:
+                f.seek(start_offset)
+                for raw_line in f:
+                    record = self._parse_line(raw_line)
+                    if record is None:
                         continue
-                    
-                    try:
-                        data = json.loads(line)
-                        record = K8sHealthHistoryRecord(
-                            timestamp=data.get("timestamp", ""),
-                            namespace=data.get("namespace", ""),
-                            selector=data.get("selector", ""),
-                            overall_health=data.get("overall_health", "OK"),
-                            jobs_ok=data.get("jobs_ok", 0),
-                            jobs_warn=data.get("jobs_warn", 0),
-                            jobs_error=data.get("jobs_error", 0),
-                            raw_snapshot=data.get("raw_snapshot")
-                        )
-                        records.append(record)
-                    
-                    except json.JSONDecodeError as e:
-                        logger.warning(f"[D34_K8S_HISTORY] Skipping corrupted line: {e}")
+                    if start_timestamp is not None and record.timestamp < start_timestamp:
                         continue
+                    if end_timestamp is not None and record.timestamp > end_timestamp:
+                        break
+                    records.append(record)
         
         except IOError as e:
             logger.error(f"[D34_K8S_HISTORY] Error reading history file: {e}")
             return []
         
-        # 최근 limit개만 반환
-        return records[-limit:] if records else []
+        return records
     
     def summarize(self, window: Optional[int] = None) -> Dict[str, Any]:
         """
         히스토리 요약
         
+        window가 없으면 증분 요약 카운터를 사용하고 (파일 재스캔 없음),
+        window가 있으면 최근 window개 레코드만 tail-read 합니다.
+        
         Args:
             window: 고려할 최근 레코드 수 (None이면 전체)
         
         Returns:
             요약 정보 (JSON 호환)
         """
-        records = self.load_recent(limit=window or 10000)
+        if window:
+            return self._summarize_records(self.load_recent(limit=window))
+        
+        if not os.path.exists(self.path):
+            return self._summarize_records([])
         
+        self._sync_sidecars()
+        summary = self._summary
+        
+        if not summary or summary["total_records"] == 0:
+            return self._summarize_records([])
+        
+        last = summary["last_record"]
+        return {
+            "total_records": summary["total_records"],
+            "ok_count": summary["ok_count"],
+            "warn_count": summary["warn_count"],
+            "error_count": summary["error_count"],
+            "last_overall_health": last["overall_health"],
+            "last_timestamp": last["timestamp"],
+            "last_jobs_ok": last["jobs_ok"],
+            "last_jobs_warn": last["jobs_warn"],
+            "last_jobs_error": last["jobs_error"]
+        }
+    
+    def rebuild_sidecars(self) -> None:
+        """
+        히스토리 파일 전체를 스캔하여 인덱스/요약 사이드카를 재구성
+        """
+        self._summary = self._empty_summary()
+        self._index = []
+        self._scan_into_sidecars()
+        self._save_summary()
+        self._save_index()
+        logger.info(
+            f"[D34_K8S_HISTORY] Rebuilt sidecars: "
+            f"records={self._summary['total_records']}, index_entries={len(self._index)}"
+        )
+    
+    @staticmethod
+    def _summarize_records(records: List[K8sHealthHistoryRecord]) -> Dict[str, Any]:
+        """레코드 목록 요약"""
         if not records:
             return {
                 "total_records": 0,
@@ -170,7 +277,7 @@ class K8sHealthHistoryStore:
     
     def _write_record(self, record: K8sHealthHistoryRecord) -> None:
         """
-        레코드를 파일에 JSON 라인으로 작성
+        레코드를 파일에 JSON 라인으로 작성하고 사이드카 갱신
         
         Args:
             record: K8sHealthHistoryRecord
@@ -181,7 +288,209 @@ class K8sHealthHistoryStore:
             os.makedirs(directory, exist_ok=True)
             logger.info(f"[D34_K8S_HISTORY] Created directory: {directory}")
         
+        # 외부에서 추가된 라인이 있으면 먼저 반영
+        self._sync_sidecars()
+        
         # JSON 라인 작성
-        with open(self.path, 'a', encoding='utf-8') as f:
+        with open(self.path, 'ab') as f:
+            offset = f.tell()
             line = json.dumps(asdict(record), ensure_ascii=False)
-            f.write(line + '\n')
+            f.write((line + '\n').encode('utf-8'))
+            end_offset = f.tell()
+        
+        index_grew = self._account_record(record, offset)
+        self._summary["offset"] = end_offset
+        self._save_summary()
+        if index_grew:
+            self._append_index_entry(self._index[-1])
+    
+    # ------------------------------------------------------------------
+    # 사이드카 (인덱스/요약) 관리
+    # ------------------------------------------------------------------
+    
+    @staticmethod
+    def _empty_summary() -> Dict[str, Any]:
+        return {
+            "offset": 0,
+            "total_records": 0,
+            "ok_count": 0,
+            "warn_count": 0,
+            "error_count": 0,
+            "last_record": None,
+        }
+    
+    def _sync_sidecars(self) -> None:
+        """
+        사이드카를 히스토리 파일과 동기화
+        
+        - 사이드카 누락/손상/파일 축소(로테이션) → 전체 재구성
+        - 파일이 요약 오프셋 이후로 늘어남 → 늘어난 부분만 증분 스캔
+        """
+        if self._summary is None or self._index is None:
+            self._summary = self._load_summary()
+            self._index = self._load_index()
+        
+        file_size = os.path.getsize(self.path) if os.path.exists(self.path) else 0
+        
+        if self._summary is None or self._index is None or file_size < self._summary["offset"]:
+            self.rebuild_sidecars()
+            return
+        
+        if file_size > self._summary["offset"]:
+            index_len = len(self._index)
+            self._scan_into_sidecars()
+            self._save_summary()
+            for entry in self._index[index_len:]:
+                self._append_index_entry(entry)
+    
+    def _scan_into_sidecars(self) -> None:
+        """요약 오프셋부터 파일 끝까지 스캔하며 카운터/인덱스 갱신"""
+        if not os.path.exists(self.path):
+            return
+        
+        with open(self.path, 'rb') as f:
+            offset = self._summary["offset"]
+            f.seek(offset)
+            for raw_line in f:
+                # 쓰기 도중의 불완전한 마지막 라인은 다음 동기화 때 처리
+                if not raw_line.endswith(b'\n'):
+                    break
+                record = self._parse_line(raw_line)
+                if record is not None:
+                    self._account_record(record, offset)
+                offset += len(raw_line)
+            self._summary["offset"] = offset
+    
+    def _account_record(self, record: K8sHealthHistoryRecord, offset: int) -> bool:
+        """
+        레코드 1개를 요약 카운터/인덱스에 반영
+        
+        Returns:
+            인덱스 엔트리가 추가되었는지 여부
+        """
+        summary = self._summary
+        index_grew = summary["total_records"] % INDEX_STRIDE == 0
+        if index_grew:
+            self._index.append((record.timestamp, offset))
+        
+        summary["total_records"] += 1
+        if record.overall_health == "OK":
+            summary["ok_count"] += 1
+        elif record.overall_health == "WARN":
+            summary["warn_count"] += 1
+        elif record.overall_health == "ERROR":
+            summary["error_count"] += 1
+        summary["last_record"] = {
+            "timestamp": record.timestamp,
+            "overall_health": record.overall_health,
+            "jobs_ok": record.jobs_ok,
+            "jobs_warn": record.jobs_warn,
+            "jobs_error": record.jobs_error,
+        }
+        return index_grew
+    
+    def _load_summary(self) -> Optional[Dict[str, Any]]:
+        """요약 사이드카 로드 (누락/손상 시 None)"""
+        if not os.path.exists(self.summary_path):
+            return None
+        try:
+            with open(self.summary_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if not all(key in data for key in self._empty_summary()):
+                return None
+            return data
+        except (IOError, json.JSONDecodeError) as e:
+            logger.warning(f"[D34_K8S_HISTORY] Invalid summary sidecar, rebuilding: {e}")
+            return None
+    
+    def _save_summary(self) -> None:
+        """요약 사이드카 저장 (임시 파일 + rename으로 원자적 교체)"""
+        tmp_path = f"{self.summary_path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self._summary, f, ensure_ascii=False)
+        os.replace(tmp_path, self.summary_path)
+    
+    def _load_index(self) -> Optional[List[Tuple[str, int]]]:
+        """인덱스 사이드카 로드 (누락/손상 시 None)"""
+        if not os.path.exists(self.index_path):
+            return None
+        index: List[Tuple[str, int]] = []
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    data = json.loads(line)
+                    index.append((data["timestamp"], int(data["offset"])))
+        except (IOError, json.JSONDecodeError, KeyError, ValueError) as e:
+            logger.warning(f"[D34_K8S_HISTORY] Invalid index sidecar, rebuilding: {e}")
+            return None
+        return index
+    
+    def _save_index(self) -> None:
+        """인덱스 사이드카 전체 저장"""
+        tmp_path = f"{self.index_path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            for timestamp, offset in self._index:
+                f.write(json.dumps({"timestamp": timestamp, "offset": offset}) + '\n')
+        os.replace(tmp_path, self.index_path)
+    
+    def _append_index_entry(self, entry: Tuple[str, int]) -> None:
+        """인덱스 사이드카에 엔트리 1개 추가"""
+        timestamp, offset = entry
+        with open(self.index_path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps({"timestamp": timestamp, "offset": offset}) + '\n')
+    
+    # ------------------------------------------------------------------
+    # 파싱 헬퍼
+    # ------------------------------------------------------------------
+    
+    @staticmethod
+    def _iter_lines_reverse(f, block_size: int = TAIL_READ_BLOCK_SIZE) -> Iterator[bytes]:
+        """바이너리 파일을 끝에서부터 블록 단위로 읽어 라인을 역순으로 반환"""
+        f.seek(0, os.SEEK_END)
+        position = f.tell()
+        remainder = b''
+        
+        while position > 0:
+            read_size = min(block_size, position)
+            position -= read_size
+            f.seek(position)
+            chunk = f.read(read_size) + remainder
+            lines = chunk.split(b'\n')
+            # 첫 조각은 이전 블록과 이어질 수 있으므로 보류
+            remainder = lines[0]
+            for line in reversed(lines[1:]):
+                yield line
+        
+        if remainder:
+            yield remainder
+    
+    @staticmethod
+    def _parse_line(raw_line: bytes) -> Optional[K8sHealthHistoryRecord]:
+        """JSON 라인 1개를 레코드로 파싱 (빈 라인/손상 라인은 None)"""
+        line = raw_line.strip()
+        if not line:
+            return None
+        
+        try:
+            data = json.loads(line.decode('utf-8'))
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
+            logger.warning(f"[D34_K8S_HISTORY] Skipping corrupted line: {e}")
+            return None
+        
+        if not isinstance(data, dict):
+            logger.warning("[D34_K8S_HISTORY] Skipping corrupted line: not a JSON object")
+            return None
+        
+        return K8sHealthHistoryRecord(
+            timestamp=data.get("timestamp", ""),
+            namespace=data.get("namespace", ""),
+            selector=data.get("selector", ""),
+            overall_health=data.get("overall_health", "OK"),
+            jobs_ok=data.get("jobs_ok", 0),
+            jobs_warn=data.get("jobs_warn", 0),
+            jobs_error=data.get("jobs_error", 0),
+            raw_snapshot=data.get("raw_snapshot")
+        )
@@ -16,7 +16,7 @@ import time
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Set
 
 from arbitrage.arbitrage_core import (
     ArbitrageEngine,
@@ -40,6 +40,22 @@ from arbitrage.infrastructure.exchange_health import (
     HealthMonitor,
     ExchangeHealthStatus,
 )
+from arbitrage.domain.exit_scheduler import TimerWheel
+from arbitrage.risk.multi_symbol_risk_guard import RiskGuardDecision as CoordinatorDecision
+from arbitrage.tracing import (
+    STAGE_CLOSE,
+    STAGE_ENGINE,
+    STAGE_EXECUTE,
+    STAGE_HANDOFF,
+    STAGE_QUEUE_WAIT,
+    STAGE_REST_FETCH,
+    STAGE_RISK,
+    STAGE_SUBMIT,
+    LoopLagSampler,
+    TickTrace,
+    TickTracer,
+    newest_trace,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -461,6 +477,9 @@ class ArbitrageLiveRunner:
         market_data_provider: Optional["MarketDataProvider"] = None,
         metrics_collector: Optional["MetricsCollector"] = None,
         state_store: Optional["StateStore"] = None,
+        tracer: Optional[TickTracer] = None,
+        risk_coordinator: Optional["MultiSymbolRiskCoordinator"] = None,
+        risk_symbol: Optional[str] = None,
     ):
         """
         Args:
@@ -471,6 +490,11 @@ class ArbitrageLiveRunner:
             market_data_provider: MarketDataProvider (D50.5, 선택사항)
             metrics_collector: MetricsCollector (D50.5, 선택사항)
             state_store: StateStore (D70, 선택사항)
+            tracer: TickTracer (D93-1, 선택사항). WS provider는 어댑터가 trace를 시작하고,
+                REST 경로는 runner가 스냅샷 조회 시점부터 trace 시작
+            risk_coordinator: MultiSymbolRiskCoordinator (D74-6, 선택사항). 진입 전 reserve_trade로
+                공유 원장에 노출을 예약하고, 진입/청산 결과를 commit/cancel/release로 반영
+            risk_symbol: coordinator 심볼 키 (기본: config.symbol_b)
         """
         self.engine = engine
         self.exchange_a = exchange_a
@@ -488,6 +512,10 @@ class ArbitrageLiveRunner:
         
         # RiskGuard 초기화 (D44)
         self._risk_guard = RiskGuard(config.risk_limits)
+        self._risk_coordinator = risk_coordinator
+        self._risk_symbol = risk_symbol or config.symbol_b
+        # coordinator 원장에 진입이 확정된 거래 (id) — 종료 시 이 거래만 노출 해제
+        self._committed_entries: Set[int] = set()
         self._session_stop_requested = False
         
         # 상태 추적
@@ -520,6 +548,9 @@ class ArbitrageLiveRunner:
         # Paper 모드에서 Exit 신호를 생성할 시간 간격 (초)
         # D65: 캠페인별로 다르게 설정 가능
         self._paper_exit_trigger_interval = 2.0  # 2초 후 Exit 신호 생성 (D65: 더 빠른 Exit)
+        # 포지션별 Exit 트리거 deadline (만료된 포지션만 _aged_position_ids로 이동, 최대 0.1초 지연)
+        self._position_timers = TimerWheel(tick_seconds=0.1)
+        self._aged_position_ids: Set[int] = set()
         
         # D65: TP/SL 기반 Exit 설정
         self._paper_take_profit_bps = 30.0  # Take Profit 임계값 (bps)
@@ -544,6 +575,14 @@ class ArbitrageLiveRunner:
         self._health_monitor_a = HealthMonitor("UPBIT")
         self._health_monitor_b = HealthMonitor("BINANCE")
         
+        # D93-1: tick-to-order tracing (process_snapshot → execute_trades로 전달)
+        self.tracer = tracer
+        self._active_trace: Optional[TickTrace] = None
+        # tracer가 있으면 이벤트 루프 지연도 같이 측정 (run_forever에서 시작/정지)
+        self.loop_lag_sampler: Optional[LoopLagSampler] = (
+            LoopLagSampler() if tracer is not None else None
+        )
+        
         logger.info(
             f"[D43_LIVE] ArbitrageLiveRunner initialized: "
             f"{config.symbol_a} vs {config.symbol_b}, mode={config.mode}, "
@@ -608,6 +647,7 @@ class ArbitrageLiveRunner:
                     best_ask_a=best_ask_a,
                     best_bid_b=best_bid_b,
                     best_ask_b=best_ask_b,
+                    trace=newest_trace(snapshot_a, snapshot_b),
                 )
                 
                 logger.debug(
@@ -736,16 +776,17 @@ class ArbitrageLiveRunner:
             trade_id = id(trade)
             if trade_id not in self._position_open_times:
                 self._position_open_times[trade_id] = current_time
+                self._position_timers.schedule(trade_id, current_time + self._paper_exit_trigger_interval)
                 logger.info(f"[D65_PAPER] Position opened: {trade.side} at {current_time}")
         
         # 닫힌 포지션 정리
         # 현재 열린 포지션의 ID만 유지
         current_trade_ids = {id(t) for t in open_trades}
-        self._position_open_times = {
-            tid: open_time 
-            for tid, open_time in self._position_open_times.items() 
-            if tid in current_trade_ids
-        }
+        for trade_id in self._position_open_times.keys() - current_trade_ids:
+            del self._position_open_times[trade_id]
+            self._position_timers.cancel(trade_id)
+            self._aged_position_ids.discard(trade_id)
+        self._aged_position_ids.update(self._position_timers.advance(current_time))
         
         # D65: 캠페인별 Exit 로직 결정
         # C1 (Mixed): 기본 스프레드 역전 + 시간 기반
@@ -772,10 +813,7 @@ class ArbitrageLiveRunner:
         # 포지션이 많고 오래된 것이 있으면 Exit 신호, 그렇지 않으면 Entry 신호
         has_old_position = (
             len(open_trades) > 10 and  # D74-3: 포지션이 많을 때만 Exit 신호
-            any(
-                current_time - open_time >= self._paper_exit_trigger_interval
-                for open_time in self._position_open_times.values()
-            )
+            bool(self._aged_position_ids)
         )
         
         # D65: C3 캠페인에서는 Entry 스프레드도 나쁘게 설정하여 손실 거래 생성
@@ -912,15 +950,52 @@ class ArbitrageLiveRunner:
         Returns:
             이 스냅샷에서 개설/종료된 거래 목록
         """
+        # D93-1: 처음 처리하는 스냅샷의 trace만 점유 (같은 WS 스냅샷 재조회 시 중복 기록 방지)
+        trace = getattr(snapshot, "trace", None)
+        if not isinstance(trace, TickTrace) or not trace.claim():
+            trace = None
+        if self._active_trace is not None:
+            # 이전 tick의 execute_trades가 호출되지 않은 경우
+            self._active_trace.finish()
+            self._active_trace = None
+        
         try:
+            if trace is not None:
+                trace.mark(STAGE_QUEUE_WAIT)
             trades = self.engine.on_snapshot(snapshot)
             logger.debug(f"[D43_LIVE] Engine returned {len(trades)} trades")
+            if trace is not None:
+                trace.mark(STAGE_ENGINE)
+                if trades:
+                    for trade in trades:
+                        trade.trace = trace
+                    self._active_trace = trace
+                else:
+                    trace.finish()
             return trades
         
         except Exception as e:
             logger.error(f"[D43_LIVE] Error processing snapshot: {e}")
+            if trace is not None:
+                trace.finish()
             return []
     
+    def _build_traced_snapshot(self) -> Optional[OrderBookSnapshot]:
+        """
+        D93-1: build_snapshot + REST 경로 trace 시작
+        
+        WS provider 스냅샷은 어댑터가 시작한 trace를 그대로 사용.
+        provider가 없으면(REST 폴링) 호가 조회 시작 시점을 origin으로 trace 생성
+        """
+        if self.tracer is None or self.market_data_provider is not None:
+            return self.build_snapshot()
+        trace = self.tracer.start()
+        snapshot = self.build_snapshot()
+        if trace is not None and snapshot is not None:
+            trace.mark(STAGE_REST_FETCH)
+            snapshot.trace = trace
+        return snapshot
+    
     def execute_trades(self, trades: List[ArbitrageTrade]) -> None:
         """
         거래 목록을 실제 주문으로 변환하여 실행.
@@ -930,6 +1005,20 @@ class ArbitrageLiveRunner:
         Args:
             trades: ArbitrageTrade 목록
         """
+        # D93-1: process_snapshot이 넘긴 trace (run_once의 event loop yield = handoff)
+        trace, self._active_trace = self._active_trace, None
+        if trace is not None:
+            trace.mark(STAGE_HANDOFF)
+            execute_span = trace.begin(STAGE_EXECUTE)
+        try:
+            self._execute_trades(trades, trace)
+        finally:
+            if trace is not None:
+                trace.end(execute_span)
+                trace.finish()
+    
+    def _execute_trades(self, trades: List[ArbitrageTrade], trace: Optional[TickTrace]) -> None:
+        """execute_trades 본문 (trace: risk.check / executor.submit / executor.close 기록)"""
         # D75-2: snapshot 1회만 조회하여 재사용 (Phase 3 최적화)
         cached_snapshot = None
         
@@ -941,6 +1030,8 @@ class ArbitrageLiveRunner:
                         trade,
                         len(self._active_orders)
                     )
+                    if trace is not None:
+                        trace.mark(STAGE_RISK)
                     
                     if decision == RiskGuardDecision.SESSION_STOP:
                         if logger.isEnabledFor(logging.ERROR):  # D75-2: logging 최적화
@@ -953,16 +1044,29 @@ class ArbitrageLiveRunner:
                             logger.warning(f"[D44_RISKGUARD] Trade rejected: {trade.side}")
                         continue
                     
+                    # D74-6: 샤드 간 공유 한도 체크 + 노출 예약 (원자적)
+                    if not self._reserve_entry(trade):
+                        continue
+                    
                     # D75-2: snapshot 전달하여 중복 조회 방지 (Phase 3 최적화)
-                    if cached_snapshot is None:
-                        cached_snapshot = self.build_snapshot()
-                    # 신규 거래 개설
-                    self._execute_open_trade(trade, cached_snapshot)
+                    opened = False
+                    try:
+                        if cached_snapshot is None:
+                            cached_snapshot = self.build_snapshot()
+                        # 신규 거래 개설
+                        opened = self._execute_open_trade(trade, cached_snapshot)
+                    finally:
+                        self._settle_entry(trade, opened)
                     self._total_trades_opened += 1
+                    if trace is not None:
+                        trace.mark(STAGE_SUBMIT)
                 else:
                     # 거래 종료
                     self._execute_close_trade(trade)
                     self._total_trades_closed += 1
+                    self._release_entry(trade)
+                    if trace is not None:
+                        trace.mark(STAGE_CLOSE)
                     
                     # PnL 누적 및 RiskGuard 업데이트 (D44)
                     if trade.pnl_usd is not None:
@@ -972,7 +1076,47 @@ class ArbitrageLiveRunner:
             except Exception as e:
                 logger.error(f"[D43_LIVE] Error executing trade: {e}")
     
-    def _execute_open_trade(self, trade: ArbitrageTrade, snapshot=None) -> None:
+    def _reserve_entry(self, trade: ArbitrageTrade) -> bool:
+        """
+        D74-6: coordinator 공유 원장에 진입 노출 예약
+        
+        Returns:
+            진행 가능 여부 (coordinator 없으면 항상 True)
+        """
+        if self._risk_coordinator is None:
+            return True
+        decision = self._risk_coordinator.reserve_trade(self._risk_symbol, trade.notional_usd)
+        if decision != CoordinatorDecision.OK:
+            if logger.isEnabledFor(logging.WARNING):
+                logger.warning(
+                    f"[D74-6_RISK] {self._risk_symbol} entry rejected by coordinator: {decision.value}"
+                )
+            return False
+        return True
+    
+    def _settle_entry(self, trade: ArbitrageTrade, opened: bool) -> None:
+        """D74-6: 예약 노출 확정(진입 성공) 또는 취소(실패)"""
+        if self._risk_coordinator is None:
+            return
+        if opened:
+            self._risk_coordinator.on_trade_entry(self._risk_symbol, trade.notional_usd, reserved=True)
+            self._committed_entries.add(id(trade))
+        else:
+            self._risk_coordinator.cancel_reservation(self._risk_symbol, trade.notional_usd)
+    
+    def _release_entry(self, trade: ArbitrageTrade) -> None:
+        """
+        D74-6: 종료 거래의 원장 노출 해제
+        
+        엔진은 거절/실패한 진입도 open으로 유지하다 종료하므로, _settle_entry에서
+        확정된 거래만 해제 (미확정 거래 해제 시 원장 노출이 음수로 내려감)
+        """
+        if self._risk_coordinator is None or id(trade) not in self._committed_entries:
+            return
+        self._committed_entries.discard(id(trade))
+        self._risk_coordinator.on_trade_exit(self._risk_symbol, trade.notional_usd, trade.pnl_usd or 0.0)
+    
+    def _execute_open_trade(self, trade: ArbitrageTrade, snapshot=None) -> bool:
         """
         신규 거래 개설: 양쪽 거래소에 주문 생성.
         
@@ -982,6 +1126,9 @@ class ArbitrageLiveRunner:
         Args:
             trade: ArbitrageTrade
             snapshot: 미리 조회한 OrderBookSnapshot (D75-2: 성능 최적화)
+        
+        Returns:
+            양쪽 주문 제출 여부
         """
         if logger.isEnabledFor(logging.INFO):  # D75-2: logging 최적화
             logger.info(
@@ -996,7 +1143,7 @@ class ArbitrageLiveRunner:
         if not snapshot:
             if logger.isEnabledFor(logging.ERROR):  # D75-2: logging 최적화
                 logger.error("[D45_QUANTITY] Failed to get snapshot for quantity calculation")
-            return
+            return False
         
         # 기준가: Exchange A의 ask 가격 사용
         # notional_usd를 환율로 변환하여 수량 계산
@@ -1076,9 +1223,13 @@ class ArbitrageLiveRunner:
                 # D67: 심볼별 거래 오픈 수 업데이트
                 symbol = self.config.symbol_b
                 self._per_symbol_trades_opened[symbol] = self._per_symbol_trades_opened.get(symbol, 0) + 1
+            else:
+                return False
+            return True
         
         except Exception as e:
             logger.error(f"[D43_LIVE] Failed to execute trade: {e}")
+            return False
     
     def _execute_close_trade(self, trade: ArbitrageTrade) -> None:
         """
@@ -1226,7 +1377,7 @@ class ArbitrageLiveRunner:
             logger.debug(f"[D74-3_DEBUG] {self.config.symbol_b}: Starting loop {self._loop_count}")
         
         # 스냅샷 생성
-        snapshot = self.build_snapshot()
+        snapshot = self._build_traced_snapshot()
         if snapshot is None:
             logger.warning(f"[D43_LIVE] {self.config.symbol_b}: Failed to build snapshot")
             return False
@@ -1292,27 +1443,45 @@ class ArbitrageLiveRunner:
             f"max_runtime={self.config.max_runtime_seconds}s"
         )
         
-        while True:
-            # RiskGuard session_stop 확인 (D44)
-            if self._session_stop_requested:
-                logger.info("[D44_RISKGUARD] Session stopped by RiskGuard")
-                break
-            
-            # 런타임 제한 확인
-            if self.config.max_runtime_seconds is not None:
-                elapsed = time.time() - self._start_time
-                if elapsed > self.config.max_runtime_seconds:
-                    logger.info(
-                        f"[D43_LIVE] Max runtime exceeded: {elapsed:.1f}s > "
-                        f"{self.config.max_runtime_seconds}s"
-                    )
+        self.start_loop_lag_sampler()
+        try:
+            while True:
+                # RiskGuard session_stop 확인 (D44)
+                if self._session_stop_requested:
+                    logger.info("[D44_RISKGUARD] Session stopped by RiskGuard")
                     break
-            
-            # 1회 루프 실행
-            await self.run_once()
-            
-            # 대기
-            await asyncio.sleep(self.config.poll_interval_seconds)
+                
+                # 런타임 제한 확인
+                if self.config.max_runtime_seconds is not None:
+                    elapsed = time.time() - self._start_time
+                    if elapsed > self.config.max_runtime_seconds:
+                        logger.info(
+                            f"[D43_LIVE] Max runtime exceeded: {elapsed:.1f}s > "
+                            f"{self.config.max_runtime_seconds}s"
+                        )
+                        break
+                
+                # 1회 루프 실행
+                await self.run_once()
+                
+                # 대기
+                await asyncio.sleep(self.config.poll_interval_seconds)
+        finally:
+            await self.stop_loop_lag_sampler()
+    
+    def start_loop_lag_sampler(self) -> None:
+        """
+        D93-1: 이벤트 루프 지연 샘플러 시작 (tracer가 있을 때만).
+        
+        실행 중인 이벤트 루프 안에서 호출해야 한다. 이미 실행 중이면 무시.
+        """
+        if self.loop_lag_sampler is not None:
+            self.loop_lag_sampler.start()
+    
+    async def stop_loop_lag_sampler(self) -> None:
+        """D93-1: 이벤트 루프 지연 샘플러 정지"""
+        if self.loop_lag_sampler is not None:
+            await self.loop_lag_sampler.stop()
     
     def get_stats(self) -> Dict[str, Any]:
         """
@@ -1323,7 +1492,7 @@ class ArbitrageLiveRunner:
         """
         elapsed = time.time() - self._start_time
         
-        return {
+        stats = {
             "elapsed_seconds": elapsed,
             "loop_count": self._loop_count,
             "total_trades_opened": self._total_trades_opened,
@@ -1332,6 +1501,9 @@ class ArbitrageLiveRunner:
             "active_orders": len(self._active_orders),
             "avg_loop_time_ms": (elapsed / self._loop_count * 1000) if self._loop_count > 0 else 0,
         }
+        if self.loop_lag_sampler is not None:
+            stats.update(self.loop_lag_sampler.get_metrics())
+        return stats
     
     async def arun_once(self) -> bool:
         """
@@ -1374,10 +1546,11 @@ class ArbitrageLiveRunner:
                 best_ask_a=best_ask_a,
                 best_bid_b=best_bid_b,
                 best_ask_b=best_ask_b,
+                trace=newest_trace(snapshot_a, snapshot_b),
             )
         else:
             # Fallback to sync snapshot
-            snapshot = self.build_snapshot()
+            snapshot = self._build_traced_snapshot()
         
         if snapshot is None:
             logger.warning("[D54_ASYNC] Failed to build snapshot")
@@ -1746,6 +1919,10 @@ class ArbitrageLiveRunner:
             # Paper 모드 포지션 열린 시간 복원 (간단 버전)
             paper_times = positions_data.get('paper_position_open_times', {})
             self._position_open_times = {int(k): float(v) for k, v in paper_times.items() if v}
+            self._position_timers = TimerWheel(tick_seconds=0.1)
+            self._aged_position_ids = set()
+            for trade_id, open_time in self._position_open_times.items():
+                self._position_timers.schedule(trade_id, open_time + self._paper_exit_trigger_interval)
             
             # 메트릭 복원
             metrics_data = snapshot.get('metrics', {})
@@ -193,6 +193,8 @@ class CrossExecutionResult:
     binance_result: Optional[Any] = None  # OrderResult
     total_latency: Optional[float] = None  # 초 단위
     rollback_reason: Optional[str] = None  # partial_fill, one_side_fill 등
+    leg_latencies: Optional[Dict[str, float]] = None  # 거래소별 주문 응답 지연 (초)
+    leg_skew: Optional[float] = None  # 양 레그 체결 응답 시각 차이 (초)
 
 
 class CrossExchangeMetrics:
@@ -365,6 +367,20 @@ class CrossExchangeMetrics:
                 labels={"exchange": "combined"}
             )
         
+        # Histogram: Leg latency / skew
+        for exchange_name, latency in (result.leg_latencies or {}).items():
+            self.backend.observe_histogram(
+                "cross_leg_latency_seconds",
+                value=latency,
+                labels={"exchange": exchange_name}
+            )
+        if result.leg_skew is not None:
+            self.backend.observe_histogram(
+                "cross_leg_skew_seconds",
+                value=result.leg_skew,
+                labels={}
+            )
+        
         # Counter: Rollback
         if result.status == "rollback":
             self.backend.inc_counter(
@@ -3,17 +3,34 @@
 D51 Long-run Analyzer
 
 롱런 테스트 결과 분석 및 이상 징후 탐지.
+
+D93-2: 스트리밍 분석
+- StreamingLongrunAnalyzer: JSONL/Parquet 메트릭 파일을 chunk 단위로 1회 통과 분석 (메모리 상한 고정)
+- MetricStats: Welford 온라인 평균/표준편차 (O(1) 갱신, 값 보관 선택)
+- TrendStats: 온라인 선형 회귀 (루프 시간 drift, 메모리 누수 기울기, 에러율 추세)
+- 지연 percentile: LatencyHistogram (HDR 버킷)
+- checkpoint 저장 후 파일 중간부터 재개
 """
 
+import copy
+import hashlib
 import json
 import logging
-from dataclasses import dataclass, field
+import os
+from dataclasses import asdict, dataclass, field, fields
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterable, List, Optional, Any
 from datetime import datetime
 
+from arbitrage.perf import DEFAULT_PERCENTILES, LatencyHistogram
+
 logger = logging.getLogger(__name__)
 
+CHUNK_BYTES = 4 * 1024 * 1024
+CHECKPOINT_EVERY_BYTES = 64 * 1024 * 1024
+CHECKPOINT_VERSION = 1
+HEAD_DIGEST_BYTES = 4096
+
 
 @dataclass
 class MetricStats:
@@ -24,18 +41,84 @@ class MetricStats:
     max: float = float('-inf')
     stddev: float = 0.0
     values: List[float] = field(default_factory=list)
+    total: float = 0.0
+    m2: float = 0.0  # D93-2: Welford 편차 제곱합
+    keep_values: bool = True  # False면 values 미보관 (스트리밍 분석)
     
     def update(self, value: float):
-        """값 추가"""
-        self.values.append(value)
+        """값 추가 (O(1), Welford)"""
+        if self.keep_values:
+            self.values.append(value)
         self.count += 1
-        self.min = min(self.min, value)
-        self.max = max(self.max, value)
-        self.mean = sum(self.values) / len(self.values)
+        self.total += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
         
-        if len(self.values) > 1:
-            variance = sum((x - self.mean) ** 2 for x in self.values) / len(self.values)
-            self.stddev = variance ** 0.5
+        if self.count > 1:
+            self.stddev = (self.m2 / self.count) ** 0.5
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """checkpoint용 dict (values 제외)"""
+        data = {f.name: getattr(self, f.name) for f in fields(self) if f.name != "values"}
+        # inf는 JSON 표준 밖이므로 None으로 저장
+        data["min"] = self.min if self.count else None
+        data["max"] = self.max if self.count else None
+        return data
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "MetricStats":
+        """checkpoint 복원"""
+        stats = cls(**{key: value for key, value in data.items() if key not in ("min", "max")})
+        if data.get("min") is not None:
+            stats.min = data["min"]
+            stats.max = data["max"]
+        return stats
+
+
+@dataclass
+class TrendStats:
+    """시간(h) 대비 값의 온라인 선형 회귀 추세"""
+    count: int = 0
+    sum_x: float = 0.0
+    sum_y: float = 0.0
+    sum_xx: float = 0.0
+    sum_xy: float = 0.0
+    first_x: Optional[float] = None
+    last_x: float = 0.0
+    
+    def update(self, x: float, y: float):
+        """(경과 시간 h, 값) 추가"""
+        if self.first_x is None:
+            self.first_x = x
+        self.last_x = x
+        self.count += 1
+        self.sum_x += x
+        self.sum_y += y
+        self.sum_xx += x * x
+        self.sum_xy += x * y
+    
+    @property
+    def slope_per_hour(self) -> float:
+        """최소제곱 기울기 (값/h)"""
+        denominator = self.count * self.sum_xx - self.sum_x * self.sum_x
+        if self.count < 2 or denominator <= 0:
+            return 0.0
+        return (self.count * self.sum_xy - self.sum_x * self.sum_y) / denominator
+    
+    @property
+    def span_hours(self) -> float:
+        """관측 구간 길이 (h)"""
+        return self.last_x - self.first_x if self.first_x is not None else 0.0
+    
+    @property
+    def projected_change(self) -> float:
+        """관측 구간 전체에 걸친 추세 변화량 (기울기 × 구간)"""
+        return self.slope_per_hour * self.span_hours
 
 
 @dataclass
@@ -82,6 +165,16 @@ class LongrunReport:
     ws_queue_lag_warn_count: int = 0  # > 1000ms 경고 횟수
     ws_queue_lag_stats: MetricStats = field(default_factory=MetricStats)
     
+    # D93-2: 스트리밍 분석 메트릭
+    entries_processed: int = 0
+    memory_mb_stats: MetricStats = field(default_factory=MetricStats)
+    loop_time_trend: TrendStats = field(default_factory=TrendStats)
+    ws_latency_trend: TrendStats = field(default_factory=TrendStats)
+    memory_trend: TrendStats = field(default_factory=TrendStats)
+    error_rate_trend: TrendStats = field(default_factory=TrendStats)
+    latency_percentiles: Dict[str, Dict[str, float]] = field(default_factory=dict)
+    loop_time_spike_count: int = 0
+    
     # 이상 징후
     anomalies: List[AnomalyAlert] = field(default_factory=list)
     
@@ -104,6 +197,8 @@ class LongrunReport:
 class LongrunAnalyzer:
     """롱런 테스트 분석기"""
     
+    MIN_TREND_SAMPLES = 30  # D93-2: 추세 판정 최소 샘플 수
+    
     def __init__(self, scenario: str = "S1"):
         """
         Args:
@@ -155,88 +250,13 @@ class LongrunAnalyzer:
         Returns:
             LongrunReport
         """
-        report = LongrunReport(
-            scenario=self.scenario,
-            duration_minutes=len(log_data),  # 근사값
-        )
-        
-        # 메트릭 데이터 처리
-        for entry in log_data:
-            # 루프 시간
-            if "loop_time_ms" in entry:
-                loop_time = entry["loop_time_ms"]
-                report.loop_time_stats.update(loop_time)
-                
-                # 루프 시간 이상 징후
-                if loop_time > self.thresholds["loop_time_max_ms"]:
-                    report.add_anomaly(AnomalyAlert(
-                        severity="WARN",
-                        category="LOOP_TIME",
-                        message=f"Loop time spike: {loop_time:.2f}ms > {self.thresholds['loop_time_max_ms']}ms",
-                        value=loop_time,
-                        threshold=self.thresholds["loop_time_max_ms"],
-                    ))
-            
-            # 체결 수
-            if "trades_opened" in entry:
-                trades = entry["trades_opened"]
-                report.trades_opened_stats.update(trades)
-            
-            # 스프레드
-            if "spread_bps" in entry:
-                spread = entry["spread_bps"]
-                report.spread_bps_stats.update(spread)
-            
-            # 스냅샷 None
-            if entry.get("snapshot_none", False):
-                report.snapshot_none_count += 1
-            
-            # Guard 이벤트
-            if entry.get("guard_rejected", False):
-                report.guard_rejected_count += 1
-            if entry.get("guard_stop", False):
-                report.guard_stop_count += 1
-            
-            # 에러/경고 로그
-            if entry.get("error_log", False):
-                report.error_log_count += 1
-            if entry.get("warning_log", False):
-                report.warning_log_count += 1
-            
-            # D52: WebSocket 메트릭
-            if "ws_latency_ms" in entry:
-                ws_latency = entry["ws_latency_ms"]
-                report.ws_latency_stats.update(ws_latency)
-                
-                # WS 지연 시간 이상 징후
-                if ws_latency > 2000:
-                    report.ws_latency_error_count += 1
-                elif ws_latency > 500:
-                    report.ws_latency_warn_count += 1
-            
-            if entry.get("ws_reconnect", False):
-                report.ws_reconnect_count += 1
-            
-            if entry.get("ws_message_gap", False):
-                report.ws_message_gap_count += 1
-            
-            # D63: WebSocket Queue Optimization 메트릭
-            if "ws_queue_depth" in entry:
-                queue_depth = entry["ws_queue_depth"]
-                report.ws_queue_depth_max = max(report.ws_queue_depth_max, queue_depth)
-            
-            if "ws_queue_lag_ms" in entry:
-                queue_lag = entry["ws_queue_lag_ms"]
-                report.ws_queue_lag_stats.update(queue_lag)
-                report.ws_queue_lag_ms_max = max(report.ws_queue_lag_ms_max, queue_lag)
-                
-                # 큐 지연 경고 (> 1000ms)
-                if queue_lag > 1000:
-                    report.ws_queue_lag_warn_count += 1
-        
-        # 이상 징후 탐지
-        self._detect_anomalies(report)
-        
+        # D93-2: 리스트 입력도 스트리밍 분석기로 1회 통과 (기존 호환을 위해 values 보관)
+        analyzer = StreamingLongrunAnalyzer(scenario=self.scenario, keep_values=True)
+        analyzer.thresholds = self.thresholds
+        analyzer.feed(log_data)
+        report = analyzer.report()
+        report.start_time = None
+        report.end_time = None
         return report
     
     def _detect_anomalies(self, report: LongrunReport):
@@ -283,7 +303,7 @@ class LongrunAnalyzer:
             ))
         
         # 5. 체결 신호 부족 (총 체결 수 기준)
-        total_trades = sum(report.trades_opened_stats.values) if report.trades_opened_stats.values else 0
+        total_trades = report.trades_opened_stats.total
         if total_trades < self.thresholds["trades_opened_min"]:
             report.add_anomaly(AnomalyAlert(
                 severity="WARN",
@@ -371,7 +391,44 @@ class LongrunAnalyzer:
                 threshold=self.thresholds.get("ws_queue_depth_max", 100),
             ))
         
-        # 13. 이상 징후가 없으면 상태를 OK로 설정
+        # 13. D93-2: 루프 시간 drift (구간 전체 추세 증가량)
+        drift_max = self.thresholds.get("loop_time_drift_max_ms", 200)
+        if report.loop_time_trend.count >= self.MIN_TREND_SAMPLES and report.loop_time_trend.projected_change > drift_max:
+            report.add_anomaly(AnomalyAlert(
+                severity="WARN",
+                category="LOOP_TIME_DRIFT",
+                message=f"Loop time drift: +{report.loop_time_trend.projected_change:.2f}ms over {report.loop_time_trend.span_hours:.2f}h > {drift_max}ms",
+                value=report.loop_time_trend.projected_change,
+                threshold=drift_max,
+            ))
+        
+        # 14. D93-2: 메모리 누수 (메모리 증가 추세)
+        memory_max = self.thresholds["memory_increase_max_mb"]
+        if report.memory_trend.count >= self.MIN_TREND_SAMPLES and report.memory_trend.projected_change > memory_max:
+            report.add_anomaly(AnomalyAlert(
+                severity="WARN",
+                category="MEMORY",
+                message=f"Memory growth: +{report.memory_trend.projected_change:.1f}MB ({report.memory_trend.slope_per_hour:.2f}MB/h) > {memory_max}MB",
+                value=report.memory_trend.projected_change,
+                threshold=memory_max,
+            ))
+        
+        # 15. D93-2: 에러율 증가 추세
+        error_rate_max = self.thresholds.get("error_rate_increase_max", 0.05)
+        if (
+            report.error_log_count > 0
+            and report.error_rate_trend.count >= self.MIN_TREND_SAMPLES
+            and report.error_rate_trend.projected_change > error_rate_max
+        ):
+            report.add_anomaly(AnomalyAlert(
+                severity="WARN",
+                category="ERROR_RATE_TREND",
+                message=f"Error rate rising: +{report.error_rate_trend.projected_change:.3f} over {report.error_rate_trend.span_hours:.2f}h > {error_rate_max}",
+                value=report.error_rate_trend.projected_change,
+                threshold=error_rate_max,
+            ))
+        
+        # 16. 이상 징후가 없으면 상태를 OK로 설정
         if not report.anomalies and report.overall_status == "UNKNOWN":
             report.overall_status = "OK"
     
@@ -441,6 +498,22 @@ class LongrunAnalyzer:
         lines.append(f"지연 에러 (> 2000ms): {report.ws_latency_error_count} 회")
         lines.append("")
         
+        # D93-2: percentile / 추세
+        if report.latency_percentiles:
+            lines.append("[지연 Percentile (D93-2)]")
+            for name, percentiles in report.latency_percentiles.items():
+                values = " ".join(f"{key}={value:.2f}" for key, value in percentiles.items())
+                lines.append(f"{name}: {values}")
+            lines.append("")
+        lines.append("[추세 분석 (D93-2)]")
+        lines.append(f"루프 시간 drift: {report.loop_time_trend.slope_per_hour:+.2f} ms/h")
+        lines.append(f"WS 지연 drift: {report.ws_latency_trend.slope_per_hour:+.2f} ms/h")
+        if report.memory_mb_stats.count > 0:
+            lines.append(f"메모리: 최대 {report.memory_mb_stats.max:.1f} MB, 기울기 {report.memory_trend.slope_per_hour:+.2f} MB/h")
+        lines.append(f"에러율 추세: {report.error_rate_trend.slope_per_hour:+.4f} /h")
+        lines.append(f"분석 구간: {report.error_rate_trend.span_hours:.2f} h ({report.entries_processed} entries)")
+        lines.append("")
+        
         # 이상 징후
         lines.append("[이상 징후]")
         lines.append(f"스냅샷 None: {report.snapshot_none_count} 회")
@@ -494,37 +567,511 @@ class LongrunAnalyzer:
         }
 
 
-def analyze_longrun_log(log_file: str, scenario: str = "S1") -> LongrunReport:
+class StreamingLongrunAnalyzer(LongrunAnalyzer):
+    """
+    스트리밍 롱런 분석기 (D93-2)
+    
+    entry마다 통계/추세/히스토그램을 누적하고 값 목록은 보관하지 않아
+    입력 크기와 무관하게 메모리 사용량이 고정됨. 파일은 chunk 단위로 1회 통과하며
+    checkpoint(offset + 누적 상태)로 중간부터 재개 가능.
+    """
+    
+    MAX_SPIKE_ALERTS = 100  # 개별 루프 스파이크 알림 상한 (초과분은 count만 누적)
+    PERCENTILE_METRICS = ("loop_time_ms", "ws_latency_ms", "ws_queue_lag_ms")
+    HISTOGRAM_FLUSH_SIZE = 4096  # 히스토그램 값 버퍼 (record_many 일괄 기록)
+    
+    def __init__(
+        self,
+        scenario: str = "S1",
+        keep_values: bool = False,
+        interval_seconds: float = 60.0,
+        chunk_bytes: int = CHUNK_BYTES,
+    ):
+        """
+        Args:
+            scenario: S1, S2, S3
+            keep_values: MetricStats.values 보관 여부 (리스트 분석 호환용, 스트리밍 시 False)
+            interval_seconds: timestamp 없는 entry 간 간격 간주값 (추세 시간축)
+            chunk_bytes: 파일 읽기 chunk 크기
+        """
+        super().__init__(scenario=scenario)
+        self.keep_values = keep_values
+        self.interval_seconds = interval_seconds
+        self.chunk_bytes = chunk_bytes
+        
+        # 입력 파일 위치 (JSONL: byte, Parquet: row)
+        self.source: Optional[str] = None
+        self.offset = 0
+        self.offset_unit = "bytes"
+        self.parse_error_count = 0
+        self._head_digest: Optional[str] = None
+        self._head_length = 0
+        
+        self._report = self._new_report()
+        self._histograms = {name: LatencyHistogram() for name in self.PERCENTILE_METRICS}
+        self._loop_time_values: List[float] = []
+        self._ws_latency_values: List[float] = []
+        self._queue_lag_values: List[float] = []
+        self._origin_seconds: Optional[float] = None
+        self._last_seconds: Optional[float] = None
+        self._first_timestamp: Any = None
+        self._last_timestamp: Any = None
+    
+    def _new_report(self) -> LongrunReport:
+        report = LongrunReport(scenario=self.scenario, duration_minutes=0)
+        for f in fields(report):
+            if isinstance(getattr(report, f.name), MetricStats):
+                setattr(report, f.name, MetricStats(keep_values=self.keep_values))
+        return report
+    
+    # ------------------------------------------------------------------
+    # 누적
+    # ------------------------------------------------------------------
+    
+    def feed(self, entries: Iterable[Dict[str, Any]]) -> int:
+        """
+        메트릭 entry 누적.
+        
+        Returns:
+            처리한 entry 수
+        """
+        account = self._account
+        count = 0
+        for entry in entries:
+            account(entry)
+            count += 1
+        return count
+    
+    def _seconds_of(self, timestamp: Any) -> float:
+        """entry timestamp → epoch 초 (없거나 파싱 불가면 직전 + interval)"""
+        if timestamp is not None:
+            try:
+                if isinstance(timestamp, str):
+                    return datetime.fromisoformat(timestamp).timestamp()
+                if isinstance(timestamp, datetime):
+                    return timestamp.timestamp()
+                return float(timestamp)
+            except (TypeError, ValueError):
+                pass
+        last = self._last_seconds
+        return last + self.interval_seconds if last is not None else 0.0
+    
+    def _account(self, entry: Dict[str, Any]):
+        """entry 1건 누적 (O(1))"""
+        report = self._report
+        timestamp = entry.get("timestamp")
+        seconds = self._seconds_of(timestamp)
+        if self._origin_seconds is None:
+            self._origin_seconds = seconds
+            self._first_timestamp = timestamp
+        self._last_seconds = seconds
+        self._last_timestamp = timestamp
+        hours = (seconds - self._origin_seconds) / 3600.0
+        report.entries_processed += 1
+        
+        # 루프 시간
+        loop_time = entry.get("loop_time_ms")
+        if loop_time is not None:
+            report.loop_time_stats.update(loop_time)
+            report.loop_time_trend.update(hours, loop_time)
+            self._loop_time_values.append(loop_time)
+            
+            # 루프 시간 이상 징후 (알림은 MAX_SPIKE_ALERTS건까지)
+            loop_time_max = self.thresholds["loop_time_max_ms"]
+            if loop_time > loop_time_max:
+                report.loop_time_spike_count += 1
+                if report.loop_time_spike_count <= self.MAX_SPIKE_ALERTS:
+                    report.add_anomaly(AnomalyAlert(
+                        severity="WARN",
+                        category="LOOP_TIME",
+                        message=f"Loop time spike: {loop_time:.2f}ms > {loop_time_max}ms",
+                        timestamp=_timestamp_text(timestamp),
+                        value=loop_time,
+                        threshold=loop_time_max,
+                    ))
+        
+        # 체결 수 / 스프레드
+        trades = entry.get("trades_opened")
+        if trades is not None:
+            report.trades_opened_stats.update(trades)
+        spread = entry.get("spread_bps")
+        if spread is not None:
+            report.spread_bps_stats.update(spread)
+        
+        # 스냅샷 None / Guard 이벤트
+        if entry.get("snapshot_none"):
+            report.snapshot_none_count += 1
+        if entry.get("guard_rejected"):
+            report.guard_rejected_count += 1
+        if entry.get("guard_stop"):
+            report.guard_stop_count += 1
+        
+        # 에러/경고 로그 (에러율 추세는 모든 entry를 0/1로 누적)
+        if entry.get("error_log"):
+            report.error_log_count += 1
+            report.error_rate_trend.update(hours, 1.0)
+        else:
+            report.error_rate_trend.update(hours, 0.0)
+        if entry.get("warning_log"):
+            report.warning_log_count += 1
+        
+        # D52: WebSocket 메트릭
+        ws_latency = entry.get("ws_latency_ms")
+        if ws_latency is not None:
+            report.ws_latency_stats.update(ws_latency)
+            report.ws_latency_trend.update(hours, ws_latency)
+            self._ws_latency_values.append(ws_latency)
+            if ws_latency > 2000:
+                report.ws_latency_error_count += 1
+            elif ws_latency > 500:
+                report.ws_latency_warn_count += 1
+        if entry.get("ws_reconnect"):
+            report.ws_reconnect_count += 1
+        if entry.get("ws_message_gap"):
+            report.ws_message_gap_count += 1
+        
+        # D63: WebSocket Queue 메트릭
+        queue_depth = entry.get("ws_queue_depth")
+        if queue_depth is not None and queue_depth > report.ws_queue_depth_max:
+            report.ws_queue_depth_max = queue_depth
+        queue_lag = entry.get("ws_queue_lag_ms")
+        if queue_lag is not None:
+            report.ws_queue_lag_stats.update(queue_lag)
+            self._queue_lag_values.append(queue_lag)
+            if queue_lag > report.ws_queue_lag_ms_max:
+                report.ws_queue_lag_ms_max = queue_lag
+            if queue_lag > 1000:
+                report.ws_queue_lag_warn_count += 1
+        
+        # 메모리 (누수 기울기)
+        memory = entry.get("memory_mb")
+        if memory is None:
+            memory = entry.get("rss_mb")
+        if memory is not None:
+            report.memory_mb_stats.update(memory)
+            report.memory_trend.update(hours, memory)
+        
+        # 버퍼별로 확인 (ws 전용 로그처럼 loop_time이 없는 입력도 메모리 상한 유지)
+        limit = self.HISTOGRAM_FLUSH_SIZE
+        if (
+            len(self._loop_time_values) >= limit
+            or len(self._ws_latency_values) >= limit
+            or len(self._queue_lag_values) >= limit
+        ):
+            self._flush_histograms()
+    
+    def _flush_histograms(self):
+        """버퍼된 지연 값을 히스토그램에 일괄 기록"""
+        for name, values in (
+            ("loop_time_ms", self._loop_time_values),
+            ("ws_latency_ms", self._ws_latency_values),
+            ("ws_queue_lag_ms", self._queue_lag_values),
+        ):
+            if values:
+                self._histograms[name].record_many(values)
+                values.clear()
+    
+    # ------------------------------------------------------------------
+    # 파일 입력
+    # ------------------------------------------------------------------
+    
+    def attach(self, path: str, offset_unit: str = "bytes"):
+        """
+        분석 대상 파일 지정. checkpoint에서 복원된 경우 같은 파일인지 검증.
+        
+        Raises:
+            ValueError: 다른 파일이거나 checkpoint 이후 파일이 교체/축소된 경우
+        """
+        source = os.path.abspath(path)
+        if self.source is None:
+            self.source = source
+            self.offset_unit = offset_unit
+            return
+        if self.source != source or self.offset_unit != offset_unit:
+            raise ValueError(f"analyzer is bound to {self.source} ({self.offset_unit}), not {source} ({offset_unit})")
+        if offset_unit == "bytes" and os.path.getsize(source) < self.offset:
+            raise ValueError(f"{source} is shorter than checkpoint offset {self.offset}")
+        if self._head_digest is not None and self._read_head_digest(self._head_length) != self._head_digest:
+            raise ValueError(f"{source} changed since checkpoint (head digest mismatch)")
+    
+    def _read_head_digest(self, length: int) -> str:
+        with open(self.source, "rb") as f:
+            return hashlib.sha1(f.read(length)).hexdigest()
+    
+    def feed_file(
+        self,
+        path: str,
+        max_bytes: Optional[int] = None,
+        checkpoint_path: Optional[str] = None,
+        checkpoint_every_bytes: int = CHECKPOINT_EVERY_BYTES,
+    ) -> int:
+        """
+        JSONL 메트릭 파일을 현재 offset부터 chunk 단위로 읽어 누적.
+        
+        개행 없이 끝난 마지막 줄이 파싱되지 않으면 기록 중인 줄로 보고
+        offset을 그 앞에 둔 채 멈춤 (다음 호출에서 이어 읽음).
+        
+        Args:
+            path: JSONL 파일 경로
+            max_bytes: 이번 호출에서 읽을 최대 byte (chunk 경계 단위, None이면 끝까지)
+            checkpoint_path: 지정 시 checkpoint_every_bytes마다, 그리고 종료 시 저장
+            checkpoint_every_bytes: checkpoint 저장 간격
+        
+        Returns:
+            이번 호출에서 처리한 entry 수
+        """
+        self.attach(path, "bytes")
+        account = self._account
+        loads = json.loads
+        processed = 0
+        start_offset = saved_offset = offset = self.offset
+        
+        with open(self.source, "rb") as f:
+            f.seek(offset)
+            while True:
+                lines = f.readlines(self.chunk_bytes)
+                if not lines:
+                    break
+                partial = False
+                for line in lines:
+                    try:
+                        # bytes를 직접 넘기면 줄마다 인코딩 감지(Python 코드)가 실행되므로 먼저 decode
+                        entry = loads(line.decode())
+                    except ValueError:
+                        if not line.endswith(b"\n"):
+                            partial = True
+                            break
+                        if line.strip():
+                            self.parse_error_count += 1
+                            logger.warning(f"[LONGRUN_STREAM] Failed to parse JSON line at byte {offset}")
+                        offset += len(line)
+                        continue
+                    offset += len(line)
+                    if isinstance(entry, dict):
+                        account(entry)
+                        processed += 1
+                    else:
+                        self.parse_error_count += 1
+                self.offset = offset
+                if partial or (max_bytes is not None and offset - start_offset >= max_bytes):
+                    break
+                if checkpoint_path and offset - saved_offset >= checkpoint_every_bytes:
+                    self.save_checkpoint(checkpoint_path)
+                    saved_offset = offset
+        
+        if checkpoint_path:
+            self.save_checkpoint(checkpoint_path)
+        return processed
+    
+    def feed_parquet(
+        self,
+        path: str,
+        max_rows: Optional[int] = None,
+        checkpoint_path: Optional[str] = None,
+        batch_rows: int = 65536,
+    ) -> int:
+        """
+        Parquet(열 기반) 메트릭 파일을 record batch 단위로 누적. offset은 row 단위.
+        
+        Raises:
+            ImportError: pyarrow 미설치
+        """
+        try:
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise ImportError("pyarrow is required to analyze Parquet metrics files") from e
+        
+        self.attach(path, "rows")
+        skip = self.offset
+        processed = 0
+        for batch in pq.ParquetFile(self.source).iter_batches(batch_size=batch_rows):
+            if skip >= batch.num_rows:
+                skip -= batch.num_rows
+                continue
+            rows = batch.slice(skip).to_pylist()
+            skip = 0
+            if max_rows is not None:
+                rows = rows[:max_rows - processed]
+            processed += self.feed(rows)
+            self.offset += len(rows)
+            if max_rows is not None and processed >= max_rows:
+                break
+        
+        if checkpoint_path:
+            self.save_checkpoint(checkpoint_path)
+        return processed
+    
+    # ------------------------------------------------------------------
+    # 리포트 / checkpoint
+    # ------------------------------------------------------------------
+    
+    def report(self) -> LongrunReport:
+        """현재까지 누적된 리포트 (이상 징후 판정 포함, 누적 상태는 유지)"""
+        self._flush_histograms()
+        report = copy.deepcopy(self._report)
+        report.duration_minutes = report.entries_processed  # 기존과 동일한 근사 (entry 1건 = 1분)
+        report.start_time = _timestamp_text(self._first_timestamp)
+        report.end_time = _timestamp_text(self._last_timestamp)
+        report.latency_percentiles = {
+            name: {f"p{percentile:g}": value for percentile, value in histogram.percentiles(DEFAULT_PERCENTILES).items()}
+            for name, histogram in self._histograms.items()
+            if histogram.count
+        }
+        
+        suppressed = report.loop_time_spike_count - self.MAX_SPIKE_ALERTS
+        if suppressed > 0:
+            report.add_anomaly(AnomalyAlert(
+                severity="WARN",
+                category="LOOP_TIME",
+                message=f"Loop time spikes: {suppressed} more alerts suppressed ({report.loop_time_spike_count} total)",
+                value=report.loop_time_spike_count,
+                threshold=self.MAX_SPIKE_ALERTS,
+            ))
+        
+        self._detect_anomalies(report)
+        return report
+    
+    def checkpoint(self) -> Dict[str, Any]:
+        """누적 상태 + 파일 offset (JSON 직렬화 가능, MetricStats.values는 제외)"""
+        self._flush_histograms()
+        if self.source is not None and self.offset_unit == "bytes":
+            self._head_length = min(self.offset, HEAD_DIGEST_BYTES)
+        elif self.source is not None:
+            self._head_length = HEAD_DIGEST_BYTES
+        if self.source is not None:
+            self._head_digest = self._read_head_digest(self._head_length)
+        
+        state = {}
+        for f in fields(self._report):
+            value = getattr(self._report, f.name)
+            if isinstance(value, MetricStats):
+                value = value.to_dict()
+            elif isinstance(value, TrendStats):
+                value = asdict(value)
+            elif f.name == "anomalies":
+                value = [asdict(alert) for alert in value]
+            state[f.name] = value
+        
+        return {
+            "version": CHECKPOINT_VERSION,
+            "scenario": self.scenario,
+            "interval_seconds": self.interval_seconds,
+            "source": self.source,
+            "offset": self.offset,
+            "offset_unit": self.offset_unit,
+            "head_digest": self._head_digest,
+            "head_length": self._head_length,
+            "parse_error_count": self.parse_error_count,
+            "origin_seconds": self._origin_seconds,
+            "last_seconds": self._last_seconds,
+            "first_timestamp": _timestamp_text(self._first_timestamp),
+            "last_timestamp": _timestamp_text(self._last_timestamp),
+            "histograms": {name: histogram.snapshot() for name, histogram in self._histograms.items()},
+            "report": state,
+        }
+    
+    @classmethod
+    def from_checkpoint(cls, data: Dict[str, Any], chunk_bytes: int = CHUNK_BYTES) -> "StreamingLongrunAnalyzer":
+        """
+        checkpoint 복원.
+        
+        Raises:
+            ValueError: 지원하지 않는 checkpoint 버전
+        """
+        if data.get("version") != CHECKPOINT_VERSION:
+            raise ValueError(f"unsupported checkpoint version: {data.get('version')}")
+        
+        analyzer = cls(scenario=data["scenario"], interval_seconds=data["interval_seconds"], chunk_bytes=chunk_bytes)
+        analyzer.source = data["source"]
+        analyzer.offset = data["offset"]
+        analyzer.offset_unit = data["offset_unit"]
+        analyzer._head_digest = data["head_digest"]
+        analyzer._head_length = data["head_length"]
+        analyzer.parse_error_count = data["parse_error_count"]
+        analyzer._origin_seconds = data["origin_seconds"]
+        analyzer._last_seconds = data["last_seconds"]
+        analyzer._first_timestamp = data["first_timestamp"]
+        analyzer._last_timestamp = data["last_timestamp"]
+        analyzer._histograms = {
+            name: LatencyHistogram.from_snapshot(snapshot) for name, snapshot in data["histograms"].items()
+        }
+        
+        report = analyzer._report
+        for f in fields(report):
+            if f.name not in data["report"]:
+                continue
+            value = data["report"][f.name]
+            current = getattr(report, f.name)
+            if isinstance(current, MetricStats):
+                value = MetricStats.from_dict(value)
+            elif isinstance(current, TrendStats):
+                value = TrendStats(**value)
+            elif f.name == "anomalies":
+                value = [AnomalyAlert(**alert) for alert in value]
+            setattr(report, f.name, value)
+        return analyzer
+    
+    def save_checkpoint(self, path: str):
+        """checkpoint 파일 저장 (임시 파일 → rename으로 원자적 교체)"""
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.checkpoint(), f)
+        os.replace(tmp_path, path)
+    
+    @classmethod
+    def load_checkpoint(cls, path: str, chunk_bytes: int = CHUNK_BYTES) -> "StreamingLongrunAnalyzer":
+        """checkpoint 파일 로드"""
+        with open(path, "r", encoding="utf-8") as f:
+            return cls.from_checkpoint(json.load(f), chunk_bytes=chunk_bytes)
+
+
+def _timestamp_text(timestamp: Any) -> Any:
+    """리포트/checkpoint용 timestamp (datetime → ISO 문자열, 나머지는 그대로)"""
+    if isinstance(timestamp, datetime):
+        return timestamp.isoformat()
+    return timestamp
+
+
+def analyze_longrun_log(
+    log_file: str,
+    scenario: str = "S1",
+    checkpoint_path: Optional[str] = None,
+) -> LongrunReport:
     """
     롱런 로그 파일 분석.
     
+    D93-2: 파일 전체를 메모리에 올리지 않고 스트리밍 분석.
+    checkpoint_path가 주어지면 저장된 지점부터 재개하고 진행 상태를 저장.
+    
     Args:
-        log_file: 로그 파일 경로
+        log_file: 로그 파일 경로 (JSON Lines, .parquet는 열 기반)
         scenario: S1, S2, S3
+        checkpoint_path: checkpoint 파일 경로 (선택)
     
     Returns:
         LongrunReport
     """
-    analyzer = LongrunAnalyzer(scenario=scenario)
-    
-    # 로그 파일 읽기 (JSON Lines 형식 가정)
-    log_data = []
-    try:
-        with open(log_file, "r", encoding="utf-8") as f:
-            for line in f:
-                if line.strip():
-                    try:
-                        entry = json.loads(line)
-                        log_data.append(entry)
-                    except json.JSONDecodeError:
-                        logger.warning(f"Failed to parse JSON line: {line}")
-    except FileNotFoundError:
+    if not os.path.exists(log_file):
         logger.error(f"Log file not found: {log_file}")
         return LongrunReport(scenario=scenario, duration_minutes=0)
     
-    # 분석
-    report = analyzer.analyze_metrics_log(log_data)
-    report.start_time = log_data[0].get("timestamp") if log_data else None
-    report.end_time = log_data[-1].get("timestamp") if log_data else None
+    offset_unit = "rows" if str(log_file).endswith(".parquet") else "bytes"
+    analyzer = None
+    if checkpoint_path and os.path.exists(checkpoint_path):
+        try:
+            analyzer = StreamingLongrunAnalyzer.load_checkpoint(checkpoint_path)
+            if analyzer.scenario != scenario:
+                raise ValueError(f"checkpoint scenario {analyzer.scenario} != {scenario}")
+            analyzer.attach(log_file, offset_unit)
+            logger.info(f"[LONGRUN_STREAM] Resuming {log_file} from {analyzer.offset} {offset_unit}")
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"[LONGRUN_STREAM] Ignoring checkpoint {checkpoint_path}: {e}")
+            analyzer = None
+    if analyzer is None:
+        analyzer = StreamingLongrunAnalyzer(scenario=scenario)
     
-    return report
+    if offset_unit == "rows":
+        analyzer.feed_parquet(log_file, checkpoint_path=checkpoint_path)
+    else:
+        analyzer.feed_file(log_file, checkpoint_path=checkpoint_path)
+    return analyzer.report()
@@ -38,6 +38,8 @@ Features:
 - Per-symbol independent coroutine
 - Shared Portfolio/RiskGuard (D73-3에서 강화)
 - Config-based single/multi mode switch
+- D74-5: 멀티프로세스 샤딩 (run_multi(num_shards=N))
+  심볼을 N개 워커 프로세스에 분배, 리스크 상태는 SharedRiskLedger(D74-6)로 공유
 
 Author: D73-2 Implementation Team
 Date: 2025-11-21
@@ -45,6 +47,9 @@ Date: 2025-11-21
 
 import asyncio
 import logging
+import multiprocessing
+import os
+import queue
 import time
 from typing import Dict, List, Optional, Any
 
@@ -52,9 +57,74 @@ from arbitrage.symbol_universe import SymbolUniverse, build_symbol_universe, Sym
 from arbitrage.live_runner import ArbitrageLiveRunner, ArbitrageLiveConfig
 from arbitrage.arbitrage_core import ArbitrageEngine, ArbitrageConfig as LegacyEngineConfig
 from arbitrage.exchanges.base import BaseExchange
+from arbitrage.risk.multi_symbol_risk_guard import RiskGuardDecision
+from arbitrage.risk.shared_risk_ledger import SharedRiskLedger
 
 logger = logging.getLogger(__name__)
 
+# SharedRiskLedger 스냅샷 저장용 StateStore 세션 ID
+LEDGER_SESSION_ID = "multi_symbol_risk_ledger"
+
+
+def partition_symbols(symbols: List[str], num_shards: int) -> List[List[str]]:
+    """
+    심볼을 샤드별로 분배 (round-robin)
+    
+    Universe는 거래량 순으로 정렬되어 있으므로 round-robin으로 고거래량 심볼을 고르게 분산.
+    빈 샤드는 만들지 않음.
+    """
+    num_shards = max(1, min(num_shards, len(symbols)))
+    return [symbols[i::num_shards] for i in range(num_shards)]
+
+
+class ShardMetrics:
+    """
+    샤드별 실시간 카운터 (공유 메모리)
+    
+    샤드는 자기 슬롯만 기록하므로 lock 없이 갱신.
+    """
+    
+    FIELDS = ("iterations", "trades_opened", "trades_closed")
+    
+    def __init__(self, num_shards: int, context: Optional[Any] = None):
+        ctx = context or multiprocessing.get_context()
+        self.num_shards = num_shards
+        self._values = ctx.RawArray("q", num_shards * len(self.FIELDS))
+    
+    def add(self, shard_id: int, field: str, count: int = 1) -> None:
+        self._values[shard_id * len(self.FIELDS) + self.FIELDS.index(field)] += count
+    
+    def snapshot(self) -> List[Dict[str, int]]:
+        width = len(self.FIELDS)
+        return [
+            {"shard_id": shard_id, **dict(zip(self.FIELDS, self._values[shard_id * width:(shard_id + 1) * width]))}
+            for shard_id in range(self.num_shards)
+        ]
+
+
+def _default_start_method() -> str:
+    """fork 가능하면 fork (거래소/설정 객체 pickle 불필요)"""
+    return "fork" if "fork" in multiprocessing.get_all_start_methods() else "spawn"
+
+
+def _run_shard(
+    runner: "MultiSymbolEngineRunner",
+    shard_id: int,
+    symbols: List[str],
+    max_iterations: Optional[int],
+    max_runtime_seconds: Optional[float],
+    result_queue: Any,
+) -> None:
+    """샤드 워커 프로세스 진입점 (자체 event loop에서 담당 심볼 실행)"""
+    runner._shard_id = shard_id
+    try:
+        stats = asyncio.run(runner._run_symbols(symbols, max_iterations, max_runtime_seconds))
+    except BaseException as e:
+        stats = {"error": str(e), "symbols": symbols}
+    stats["shard_id"] = shard_id
+    stats["pid"] = os.getpid()
+    result_queue.put(stats)
+
 
 class MultiSymbolEngineRunner:
     """
@@ -126,6 +196,11 @@ class MultiSymbolEngineRunner:
         self._running = False
         self._tasks: List[asyncio.Task] = []
         
+        # D74-5: 샤드 실행 상태 (워커 프로세스에서 _shard_id 설정)
+        self._shard_id: Optional[int] = None
+        self._shard_metrics: Optional[ShardMetrics] = None
+        self._stop_event: Optional[Any] = None
+        
         # Handle both string and enum mode
         mode_str = universe.config.mode.value if hasattr(universe.config.mode, 'value') else universe.config.mode
         logger.info(
@@ -133,7 +208,13 @@ class MultiSymbolEngineRunner:
             f"universe_mode={mode_str}"
         )
     
-    async def run_multi(self, max_iterations: Optional[int] = None, max_runtime_seconds: Optional[float] = None) -> Dict[str, Any]:
+    async def run_multi(
+        self,
+        max_iterations: Optional[int] = None,
+        max_runtime_seconds: Optional[float] = None,
+        num_shards: int = 1,
+        start_method: Optional[str] = None,
+    ) -> Dict[str, Any]:
         """
         Multi-Symbol Engine 실행
         
@@ -142,6 +223,8 @@ class MultiSymbolEngineRunner:
         Args:
             max_iterations: 최대 iteration 수 (테스트용, None이면 무제한)
             max_runtime_seconds: 최대 실행 시간 (초, None이면 무제한)
+            num_shards: 워커 프로세스 수 (D74-5, 1이면 단일 event loop)
+            start_method: multiprocessing start method (None이면 fork 우선)
         
         Returns:
             실행 통계 dict
@@ -153,6 +236,19 @@ class MultiSymbolEngineRunner:
             logger.warning("[D73-2_MULTI] No symbols from Universe, exiting")
             return {"error": "No symbols"}
         
+        if num_shards > 1 and len(symbols) > 1:
+            return await self._run_sharded(
+                symbols, num_shards, max_iterations, max_runtime_seconds, start_method
+            )
+        return await self._run_symbols(symbols, max_iterations, max_runtime_seconds)
+    
+    async def _run_symbols(
+        self,
+        symbols: List[str],
+        max_iterations: Optional[int] = None,
+        max_runtime_seconds: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """현재 event loop에서 심볼별 코루틴 동시 실행"""
         logger.info(
             f"[D73-2_MULTI] Starting multi-symbol engine: "
             f"{len(symbols)} symbols = {symbols}, "
@@ -188,9 +284,18 @@ class MultiSymbolEngineRunner:
             }
             
             # Per-symbol 결과 집계
+            per_symbol = {}
             for i, result in enumerate(results):
-                if isinstance(result, Exception):
+                if isinstance(result, BaseException):
                     logger.error(f"[D73-2_MULTI] Symbol {symbols[i]} failed: {result}")
+                else:
+                    per_symbol[symbols[i]] = result
+            
+            total_iterations = sum(r.get("iteration_count", 0) for r in per_symbol.values())
+            stats["total_iterations"] = total_iterations
+            stats["total_trades"] = sum(r.get("trade_count", 0) for r in per_symbol.values())
+            stats["iterations_per_second"] = total_iterations / runtime if runtime > 0 else 0.0
+            stats["per_symbol"] = per_symbol
             
             logger.info(f"[D73-2_MULTI] Multi-symbol engine completed: {stats}")
             return stats
@@ -202,6 +307,137 @@ class MultiSymbolEngineRunner:
             self._running = False
             logger.info("[D73-2_MULTI] Multi-symbol engine stopped")
     
+    async def _run_sharded(
+        self,
+        symbols: List[str],
+        num_shards: int,
+        max_iterations: Optional[int] = None,
+        max_runtime_seconds: Optional[float] = None,
+        start_method: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        D74-5: 심볼을 워커 프로세스에 분배하여 실행
+        
+        각 워커는 자체 event loop / ArbitrageLiveRunner 집합 / 거래소 인스턴스를 사용.
+        RiskCoordinator는 SharedRiskLedger에 연결하여 전체/심볼 노출과 손실을 공유.
+        state_store가 있으면 원장을 스냅샷에서 복원하고 주기적으로 저장.
+        
+        Returns:
+            샤드별 통계 + 전체 집계 dict
+        """
+        start_method = start_method or _default_start_method()
+        ctx = multiprocessing.get_context(start_method)
+        shards = partition_symbols(symbols, num_shards)
+        
+        ledger = None
+        if self.risk_coordinator is not None:
+            ledger = self.risk_coordinator.ledger
+            if ledger is None:
+                ledger = SharedRiskLedger(max_symbols=max(256, len(symbols)), context=ctx)
+                if self.state_store is not None:
+                    ledger.load_snapshot(self.state_store, LEDGER_SESSION_ID)
+                self.risk_coordinator.attach_ledger(ledger)
+            if self.state_store is not None:
+                ledger.start_snapshots(self.state_store, LEDGER_SESSION_ID)
+        self._shard_metrics = ShardMetrics(len(shards), ctx)
+        self._stop_event = ctx.Event()
+        result_queue = ctx.Queue()
+        
+        logger.info(
+            f"[D74-5_SHARD] Starting {len(shards)} shard(s) ({start_method}): "
+            f"{[len(shard) for shard in shards]} symbols per shard"
+        )
+        
+        processes = [
+            ctx.Process(
+                target=_run_shard,
+                args=(self, shard_id, shard_symbols, max_iterations, max_runtime_seconds, result_queue),
+                name=f"shard-{shard_id}",
+                daemon=True,
+            )
+            for shard_id, shard_symbols in enumerate(shards)
+        ]
+        
+        self._running = True
+        start_time = time.time()
+        results: Dict[int, Dict[str, Any]] = {}
+        try:
+            for process in processes:
+                process.start()
+            
+            # 결과 수집 (워커 비정상 종료 시에도 대기하지 않도록 polling)
+            while len(results) < len(processes):
+                try:
+                    result = result_queue.get_nowait()
+                    results[result["shard_id"]] = result
+                    continue
+                except queue.Empty:
+                    pass
+                if not any(process.is_alive() for process in processes):
+                    try:
+                        result = result_queue.get(timeout=0.5)
+                        results[result["shard_id"]] = result
+                        continue
+                    except queue.Empty:
+                        break
+                await asyncio.sleep(0.05)
+        finally:
+            self._stop_event.set()
+            for process in processes:
+                process.join(timeout=5.0)
+                if process.is_alive():
+                    logger.error(f"[D74-5_SHARD] {process.name} did not exit, terminating")
+                    process.terminate()
+                    process.join()
+            self._stop_event = None
+            self._running = False
+            if ledger is not None and self.state_store is not None:
+                ledger.stop_snapshots(self.state_store, LEDGER_SESSION_ID)
+        
+        runtime = time.time() - start_time
+        shard_stats = []
+        for shard_id, process in enumerate(processes):
+            result = results.get(shard_id)
+            if result is None:
+                result = {
+                    "shard_id": shard_id,
+                    "symbols": shards[shard_id],
+                    "error": f"worker exited without result (exitcode={process.exitcode})",
+                }
+                logger.error(f"[D74-5_SHARD] shard {shard_id}: {result['error']}")
+            shard_stats.append({
+                "shard_id": shard_id,
+                "pid": result.get("pid"),
+                "symbols": result.get("symbols", shards[shard_id]),
+                "total_iterations": result.get("total_iterations", 0),
+                "total_trades": result.get("total_trades", 0),
+                "runtime_seconds": result.get("runtime_seconds", 0.0),
+                "iterations_per_second": result.get("iterations_per_second", 0.0),
+                **({"error": result["error"]} if "error" in result else {}),
+            })
+        
+        total_iterations = sum(shard["total_iterations"] for shard in shard_stats)
+        stats = {
+            "runtime_seconds": runtime,
+            "symbols": symbols,
+            "num_symbols": len(symbols),
+            "num_shards": len(shards),
+            "start_method": start_method,
+            "universe_mode": self.universe.config.mode.value if hasattr(self.universe.config.mode, 'value') else str(self.universe.config.mode),
+            "total_iterations": total_iterations,
+            "total_trades": sum(shard["total_trades"] for shard in shard_stats),
+            "iterations_per_second": total_iterations / runtime if runtime > 0 else 0.0,
+            "shards": shard_stats,
+        }
+        if self.risk_coordinator is not None:
+            stats["global_risk"] = self.risk_coordinator.global_guard.get_stats()
+        
+        logger.info(
+            f"[D74-5_SHARD] Completed: shards={len(shards)}, "
+            f"iterations={total_iterations}, iter/sec={stats['iterations_per_second']:.2f}"
+        )
+        return stats
+    
     async def _run_for_symbol(self, symbol: str, max_iterations: Optional[int] = None, max_runtime_seconds: Optional[float] = None) -> Dict[str, Any]:
         """
         단일 심볼 엔진 실행 (per-symbol 코루틴)
@@ -220,6 +456,7 @@ class MultiSymbolEngineRunner:
         
         iteration_count = 0
         trade_count = 0
+        closed_count = 0
         risk_allowed_count = 0
         risk_denied_count = 0
         start_time = time.time()
@@ -242,6 +479,8 @@ class MultiSymbolEngineRunner:
                 market_data_provider=self.market_data_provider,
                 metrics_collector=self.metrics_collector,
                 state_store=self.state_store,
+                risk_coordinator=self.risk_coordinator,
+                risk_symbol=symbol,
             )
             
             self._symbol_runners[symbol] = runner
@@ -266,6 +505,18 @@ class MultiSymbolEngineRunner:
                     logger.info(f"[D73-4_MULTI] {symbol}: Max runtime ({max_runtime_seconds}s) reached")
                     break
                 
+                if self._stop_event is not None and self._stop_event.is_set():
+                    logger.info(f"[D74-5_SHARD] {symbol}: Stop requested")
+                    break
+                
+                # D74-5: 전체 손실 한도 (샤드 간 공유) 초과 시 종료
+                if (
+                    self.risk_coordinator is not None
+                    and self.risk_coordinator.global_guard.check_global_limits() == RiskGuardDecision.SESSION_STOP
+                ):
+                    logger.error(f"[D74-5_SHARD] {symbol}: Global session stop")
+                    break
+                
                 # D74-3: Periodic progress logging
                 current_time = time.time()
                 if current_time - last_log_time >= log_interval:
@@ -284,12 +535,21 @@ class MultiSymbolEngineRunner:
                     success = await runner.run_once()
                     iteration_count += 1
                     
-                    if success:
-                        # Trade 발생 시 카운트 (추후 정확한 로직 추가 가능)
-                        current_trades = getattr(runner, '_total_trades_opened', 0)
-                        if current_trades > trade_count:
-                            trade_count = current_trades
-                            logger.info(f"[D73-4_MULTI] {symbol}: Trade opened (total={trade_count})")
+                    # Runner 카운터 변화를 샤드 카운터에 반영
+                    # (RiskCoordinator 예약/확정/해제는 runner가 진입/청산 시점에 직접 수행)
+                    opened = getattr(runner, '_total_trades_opened', 0) - trade_count
+                    closed = getattr(runner, '_total_trades_closed', 0) - closed_count
+                    if opened > 0:
+                        trade_count += opened
+                        logger.info(f"[D73-4_MULTI] {symbol}: Trade opened (total={trade_count})")
+                    if closed > 0:
+                        closed_count += closed
+                    if self._shard_metrics is not None and self._shard_id is not None:
+                        self._shard_metrics.add(self._shard_id, "iterations")
+                        if opened > 0:
+                            self._shard_metrics.add(self._shard_id, "trades_opened", opened)
+                        if closed > 0:
+                            self._shard_metrics.add(self._shard_id, "trades_closed", closed)
                     
                     # D74-3: Adaptive sleep based on activity
                     # 거래가 없으면 짧게 대기, 있으면 더 길게 대기
@@ -305,6 +565,7 @@ class MultiSymbolEngineRunner:
                 "symbol": symbol,
                 "iteration_count": iteration_count,
                 "trade_count": trade_count,
+                "closed_count": closed_count,
                 "runtime_seconds": runtime,
                 "success": True,
             }
@@ -367,6 +628,10 @@ class MultiSymbolEngineRunner:
             logger.warning("[D73-2_MULTI] Engine not running, nothing to stop")
             return
         
+        # D74-5: 샤드 워커에 종료 신호
+        if self._stop_event is not None:
+            self._stop_event.set()
+        
         logger.info(f"[D73-2_MULTI] Stopping {len(self._tasks)} symbol tasks...")
         
         for task in self._tasks:
@@ -393,6 +658,7 @@ class MultiSymbolEngineRunner:
             'running': self._running,
             'num_tasks': len(self._tasks),
             'universe_mode': mode_str,
+            **({'shards': self._shard_metrics.snapshot()} if self._shard_metrics is not None else {}),
         }
 
 
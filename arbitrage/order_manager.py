@@ -71,16 +71,33 @@ class Order:
         }
 
 
+# 거래소 OrderStatus(value) → 로컬 OrderStatus
+_EXCHANGE_STATUS_MAP = {
+    "PENDING": OrderStatus.PENDING,
+    "OPEN": OrderStatus.PENDING,
+    "PARTIALLY_FILLED": OrderStatus.PARTIAL,
+    "FILLED": OrderStatus.FILLED,
+    "CANCELED": OrderStatus.CANCELLED,
+    "REJECTED": OrderStatus.FAILED,
+}
+
+
 class OrderManager:
     """주문 관리자"""
     
-    def __init__(self, config: Dict[str, Any] = None):
+    def __init__(self, config: Dict[str, Any] = None, order_state=None):
         """
         Args:
             config: 설정 딕셔너리
+            order_state: private 스트림 OrderStateTable (선택, push 기반 상태 갱신)
         """
         self.config = config or {}
         self.orders: Dict[str, Order] = {}
+        self._exchange_order_ids: Dict[str, str] = {}  # exchange order_id → 로컬 order_id
+        
+        self.order_state = order_state
+        if order_state is not None:
+            order_state.add_listener(self._on_order_update)
         
         # 주문 설정
         self.max_retries = self.config.get("max_retries", 3)
@@ -159,6 +176,41 @@ class OrderManager:
             f"status={status.value}, filled={filled_quantity}, latency={latency_ms:.1f}ms"
         )
     
+    def link_exchange_order(self, order_id: str, exchange_order_id: str) -> None:
+        """
+        거래소 주문 ID 연결 (이후 private 스트림 이벤트로 상태 자동 갱신)
+        
+        Args:
+            order_id: 로컬 주문 ID
+            exchange_order_id: 거래소 주문 ID
+        """
+        order = self.orders.get(order_id)
+        if order is None:
+            return
+        self._exchange_order_ids[exchange_order_id] = order_id
+        if self.order_state is not None:
+            self.order_state.track(order.exchange, exchange_order_id, order.symbol)
+            # 연결 전에 도착한 이벤트 반영
+            update = self.order_state.get(exchange_order_id)
+            if update is not None and update.event_time > 0:
+                self._on_order_update(update)
+    
+    def _on_order_update(self, update) -> None:
+        """OrderStateTable 이벤트 → 로컬 주문 상태"""
+        order_id = self._exchange_order_ids.get(update.order_id)
+        if order_id is None or order_id not in self.orders:
+            return
+        
+        status = _EXCHANGE_STATUS_MAP.get(update.status.value, OrderStatus.PENDING)
+        latency_ms = (datetime.now() - self.orders[order_id].created_at).total_seconds() * 1000
+        self.update_order_status(
+            order_id,
+            status,
+            filled_quantity=update.filled_qty,
+            average_fill_price=update.avg_price,
+            latency_ms=latency_ms,
+        )
+    
     def get_order(self, order_id: str) -> Optional[Order]:
         """주문 조회"""
         return self.orders.get(order_id)
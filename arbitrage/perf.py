@@ -8,95 +8,406 @@ Performance Profiling Module (PHASE D12)
 메트릭 시스템에 자동 통합.
 
 특징:
-- LoopProfiler: 루프 지연 (평균, P95, 최대)
+- LatencyHistogram: HDR 방식 로그 버킷 히스토그램 (O(1) 기록, 병합/스냅샷)
+- SlidingWindowHistogram: 시간 기반 슬라이딩 윈도우 히스토그램
+- LoopProfiler: 루프 지연 (평균, P50/P95/P99/P999, 최대)
 - WebsocketLagProfiler: WS 지연 (이동 평균, 스파이크 감지)
 - RedisLatencyProfiler: Redis heartbeat 나이 추적
+- LatencyHistogramCollector: Prometheus native histogram export
 """
 
 import logging
-from typing import Dict, Any, List, Optional
+import math
+import time
+from bisect import bisect_left
+from collections import deque
+from itertools import accumulate, islice
+from typing import Any, Callable, Deque, Dict, Iterable, List, Optional, Sequence, Tuple
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_PERCENTILES = (50.0, 95.0, 99.0, 99.9)
+
+
+class LatencyHistogram:
+    """
+    HDR 방식 로그 버킷 지연 히스토그램
+    
+    2의 거듭제곱 구간마다 sub-bucket을 선형으로 나눠
+    값 범위 전체에서 상대 오차를 10^-significant_figures 이하로 유지.
+    기록 O(1), percentile 조회 O(buckets).
+    """
+    
+    def __init__(
+        self,
+        significant_figures: int = 2,
+        unit: float = 0.001,
+        highest: float = 3_600_000.0,
+    ):
+        """
+        Args:
+            significant_figures: 유효 자릿수 (1~5)
+            unit: 최소 구분 단위 (기본 0.001ms = 1us)
+            highest: 추적 최대값 (초과 값은 최상위 버킷에 기록, 기본 1시간)
+        """
+        if not 1 <= significant_figures <= 5:
+            raise ValueError(f"significant_figures must be 1..5, got {significant_figures}")
+        if unit <= 0 or highest <= unit:
+            raise ValueError(f"invalid range: unit={unit}, highest={highest}")
+        
+        self.significant_figures = significant_figures
+        self.unit = unit
+        self.highest = highest
+        
+        self._sub_bucket_bits = math.ceil(math.log2(2 * 10 ** significant_figures))
+        self._sub_bucket_count = 1 << self._sub_bucket_bits
+        self._half_count = self._sub_bucket_count >> 1
+        self._max_index = self._index_of_units(int(highest / unit))
+        
+        self.counts: List[int] = [0] * (self._max_index + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = 0.0
+    
+    @property
+    def layout(self) -> Tuple[int, float, float]:
+        """버킷 배치 (병합 호환성 판단용)"""
+        return (self.significant_figures, self.unit, self.highest)
+    
+    def _index_of_units(self, units: int) -> int:
+        if units < self._sub_bucket_count:
+            return units
+        mantissa, exponent = math.frexp(units)
+        return (exponent - self._sub_bucket_bits) * self._half_count + int(mantissa * self._sub_bucket_count)
+    
+    def index_of(self, value: float) -> int:
+        """값 → 버킷 인덱스"""
+        if value <= 0:
+            return 0
+        return min(self._index_of_units(int(value / self.unit)), self._max_index)
+    
+    def lowest_equivalent(self, index: int) -> float:
+        """버킷 하한값"""
+        if index < self._sub_bucket_count:
+            return index * self.unit
+        shift = index // self._half_count - 1
+        return (index - shift * self._half_count) * (1 << shift) * self.unit
+    
+    def highest_equivalent(self, index: int) -> float:
+        """버킷 상한값 (다음 버킷 하한)"""
+        return self.lowest_equivalent(index + 1)
+    
+    def record(self, value: float, count: int = 1) -> None:
+        """값 기록 (O(1))"""
+        self._add(self.index_of(value), value, count)
+    
+    def record_many(self, values: Iterable[float]) -> None:
+        """여러 값 기록 (index 계산 inline → 값마다 record 호출하는 것보다 함수 호출 비용 절감)"""
+        counts = self.counts
+        unit = self.unit
+        sub_bucket_count = self._sub_bucket_count
+        sub_bucket_bits = self._sub_bucket_bits
+        half_count = self._half_count
+        max_index = self._max_index
+        frexp = math.frexp
+        total = 0
+        value_sum = 0.0
+        low = self.min
+        high = self.max
+        for value in values:
+            units = int(value / unit) if value > 0 else 0
+            if units < sub_bucket_count:
+                index = units
+            else:
+                mantissa, exponent = frexp(units)
+                index = (exponent - sub_bucket_bits) * half_count + int(mantissa * sub_bucket_count)
+                if index > max_index:
+                    index = max_index
+            counts[index] += 1
+            total += 1
+            value_sum += value
+            if value < low:
+                low = value
+            if value > high:
+                high = value
+        self.count += total
+        self.sum += value_sum
+        self.min = low
+        self.max = high
+    
+    def _add(self, index: int, value: float, count: int) -> None:
+        self.counts[index] += count
+        self.count += count
+        self.sum += value * count
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+    
+    def mean(self) -> float:
+        """평균 (정확값)"""
+        return self.sum / self.count if self.count else 0.0
+    
+    def value_at_percentile(self, percentile: float) -> float:
+        """percentile 값 (버킷 상한, min/max로 clamp)"""
+        return self.percentiles((percentile,))[percentile]
+    
+    def percentiles(self, percentiles: Sequence[float] = DEFAULT_PERCENTILES) -> Dict[float, float]:
+        """여러 percentile을 누적합 한 번으로 계산"""
+        if not self.count:
+            return {p: 0.0 for p in percentiles}
+        
+        cumulative = list(accumulate(self.counts))
+        result = {}
+        for p in percentiles:
+            rank = max(1, math.ceil(self.count * min(max(p, 0.0), 100.0) / 100.0))
+            index = bisect_left(cumulative, rank)
+            value = self.highest_equivalent(index) if index < self._max_index else self.max
+            result[p] = min(max(value, self.min), self.max)
+        return result
+    
+    def cumulative_counts(self, bounds: Sequence[float]) -> List[int]:
+        """bound 이하(≈) 누적 카운트 목록 (Prometheus bucket용)"""
+        cumulative = list(accumulate(self.counts))
+        return [
+            cumulative[index - 1] if index > 0 else 0
+            for index in (self.index_of(bound) for bound in bounds)
+        ]
+    
+    def merge(self, other: "LatencyHistogram") -> "LatencyHistogram":
+        """다른 히스토그램 합산 (심볼/프로세스 간 집계)"""
+        if other.layout != self.layout:
+            raise ValueError(f"histogram layout mismatch: {self.layout} != {other.layout}")
+        for index, count in enumerate(other.counts):
+            if count:
+                self.counts[index] += count
+        self.count += other.count
+        self.sum += other.sum
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        return self
+    
+    def subtract(self, other: "LatencyHistogram") -> None:
+        """다른 히스토그램 차감 (min/max는 호출자가 재계산)"""
+        for index, count in enumerate(other.counts):
+            if count:
+                self.counts[index] -= count
+        self.count -= other.count
+        self.sum -= other.sum
+    
+    def copy(self) -> "LatencyHistogram":
+        """복사본"""
+        return LatencyHistogram(*self.layout).merge(self)
+    
+    def reset(self) -> None:
+        """초기화"""
+        self.counts = [0] * (self._max_index + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = 0.0
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """직렬화 가능한 sparse 스냅샷 (JSON/Redis 전송용)"""
+        return {
+            'significant_figures': self.significant_figures,
+            'unit': self.unit,
+            'highest': self.highest,
+            'count': self.count,
+            'sum': self.sum,
+            'min': self.min if self.count else None,
+            'max': self.max,
+            'buckets': [[index, count] for index, count in enumerate(self.counts) if count],
+        }
+    
+    @classmethod
+    def from_snapshot(cls, snapshot: Dict[str, Any]) -> "LatencyHistogram":
+        """스냅샷 복원"""
+        histogram = cls(snapshot['significant_figures'], snapshot['unit'], snapshot['highest'])
+        for index, count in snapshot['buckets']:
+            histogram.counts[index] = count
+        histogram.count = snapshot['count']
+        histogram.sum = snapshot['sum']
+        histogram.min = snapshot['min'] if snapshot['min'] is not None else math.inf
+        histogram.max = snapshot['max']
+        return histogram
+
+
+class SlidingWindowHistogram:
+    """
+    시간 기반 슬라이딩 윈도우 히스토그램
+    
+    window_seconds를 slices개 구간으로 나누고, 윈도우 합계 히스토그램에서
+    만료된 구간만 차감한다. 기록은 O(1), 구간 회전은 O(buckets).
+    누적(lifetime) 히스토그램은 Prometheus export에 사용.
+    """
+    
+    def __init__(
+        self,
+        window_seconds: float = 60.0,
+        slices: int = 6,
+        significant_figures: int = 2,
+        unit: float = 0.001,
+        highest: float = 3_600_000.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            window_seconds: 윈도우 길이 (초)
+            slices: 윈도우 분할 수 (만료 해상도 = window_seconds / slices)
+            significant_figures: 유효 자릿수
+            unit: 최소 구분 단위
+            highest: 추적 최대값
+            clock: 시계 (테스트 주입용)
+        """
+        if window_seconds <= 0 or slices < 1:
+            raise ValueError(f"invalid window: window_seconds={window_seconds}, slices={slices}")
+        
+        self.window_seconds = window_seconds
+        self.slice_seconds = window_seconds / slices
+        self.clock = clock
+        
+        self.window = LatencyHistogram(significant_figures, unit, highest)
+        self.lifetime = LatencyHistogram(significant_figures, unit, highest)
+        self._slices = [LatencyHistogram(significant_figures, unit, highest) for _ in range(slices)]
+        self._slice_epochs: List[Optional[int]] = [None] * slices
+        self._epoch = int(clock() // self.slice_seconds)
+        self._current = self._slices[self._epoch % slices]
+        self._slice_epochs[self._epoch % slices] = self._epoch
+    
+    def record(self, value: float, now: Optional[float] = None) -> None:
+        """값 기록 (O(1), 구간 경계에서만 회전)"""
+        epoch = int((self.clock() if now is None else now) // self.slice_seconds)
+        if epoch != self._epoch:
+            self._rotate(epoch)
+        
+        index = self.window.index_of(value)
+        self._current._add(index, value, 1)
+        self.window._add(index, value, 1)
+        self.lifetime._add(index, value, 1)
+    
+    def expire(self, now: Optional[float] = None) -> LatencyHistogram:
+        """만료 구간 정리 후 윈도우 히스토그램 반환"""
+        epoch = int((self.clock() if now is None else now) // self.slice_seconds)
+        if epoch != self._epoch:
+            self._rotate(epoch)
+        return self.window
+    
+    def _rotate(self, epoch: int) -> None:
+        oldest = epoch - len(self._slices)
+        for position, slice_epoch in enumerate(self._slice_epochs):
+            if slice_epoch is not None and slice_epoch <= oldest:
+                self.window.subtract(self._slices[position])
+                self._slices[position].reset()
+                self._slice_epochs[position] = None
+        
+        position = epoch % len(self._slices)
+        self._slice_epochs[position] = epoch
+        self._current = self._slices[position]
+        self._epoch = epoch
+        
+        # min/max는 차감 불가 → 남은 구간에서 재계산 (O(slices))
+        active = [histogram for histogram in self._slices if histogram.count]
+        if not active:
+            self.window.reset()
+            return
+        self.window.min = min(histogram.min for histogram in active)
+        self.window.max = max(histogram.max for histogram in active)
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """현재 윈도우 스냅샷"""
+        return self.expire().snapshot()
+
 
 class LoopProfiler:
     """루프 성능 프로파일러"""
     
-    def __init__(self, window_size: int = 100):
+    def __init__(
+        self,
+        window_seconds: float = 60.0,
+        significant_figures: int = 2,
+        clock: Callable[[], float] = time.monotonic,
+    ):
         """
         Args:
-            window_size: 히스토리 윈도우 크기
+            window_seconds: 히스토리 윈도우 길이 (초)
+            significant_figures: 히스토그램 유효 자릿수
+            clock: 시계 (테스트 주입용)
         """
-        self.window_size = window_size
-        self.latencies: List[float] = []
+        self.histogram = SlidingWindowHistogram(
+            window_seconds, significant_figures=significant_figures, clock=clock
+        )
         self.total_loops = 0
     
     def record(self, latency_ms: float) -> None:
         """루프 지연 기록"""
-        self.latencies.append(latency_ms)
-        if len(self.latencies) > self.window_size:
-            self.latencies.pop(0)
+        self.histogram.record(latency_ms)
         self.total_loops += 1
     
     def get_avg_latency(self) -> float:
         """평균 루프 지연"""
-        if not self.latencies:
-            return 0.0
-        return sum(self.latencies) / len(self.latencies)
+        return self.histogram.expire().mean()
     
     def get_p95_latency(self) -> float:
         """P95 루프 지연"""
-        if not self.latencies:
-            return 0.0
-        sorted_latencies = sorted(self.latencies)
-        idx = int(len(sorted_latencies) * 0.95)
-        return sorted_latencies[min(idx, len(sorted_latencies) - 1)]
+        return self.histogram.expire().value_at_percentile(95.0)
     
     def get_max_latency(self) -> float:
         """최대 루프 지연"""
-        if not self.latencies:
-            return 0.0
-        return max(self.latencies)
+        return self.histogram.expire().max
     
     def get_metrics(self) -> Dict[str, float]:
         """메트릭 반환"""
+        window = self.histogram.expire()
+        percentiles = window.percentiles()
         return {
-            'loop_avg_ms': self.get_avg_latency(),
-            'loop_p95_ms': self.get_p95_latency(),
-            'loop_max_ms': self.get_max_latency()
+            'loop_avg_ms': window.mean(),
+            'loop_p50_ms': percentiles[50.0],
+            'loop_p95_ms': percentiles[95.0],
+            'loop_p99_ms': percentiles[99.0],
+            'loop_p999_ms': percentiles[99.9],
+            'loop_max_ms': window.max
         }
 
 
 class WebsocketLagProfiler:
     """WebSocket 지연 프로파일러"""
     
-    def __init__(self, window_size: int = 50):
+    def __init__(
+        self,
+        window_seconds: float = 30.0,
+        significant_figures: int = 2,
+        clock: Callable[[], float] = time.monotonic,
+    ):
         """
         Args:
-            window_size: 이동 평균 윈도우 크기
+            window_seconds: 이동 평균 윈도우 길이 (초)
+            significant_figures: 히스토그램 유효 자릿수
+            clock: 시계 (테스트 주입용)
         """
-        self.window_size = window_size
-        self.lags: List[float] = []
+        self.histogram = SlidingWindowHistogram(
+            window_seconds, significant_figures=significant_figures, clock=clock
+        )
         self.spike_threshold_multiplier = 2.0  # 평균의 2배 이상을 스파이크로 간주
+        self.spike_min_samples = 9  # 비교 기준 최소 샘플 수 (현재 샘플 제외)
         self.spike_count = 0
     
     def record(self, lag_ms: float) -> None:
         """WS 지연 기록"""
-        self.lags.append(lag_ms)
-        if len(self.lags) > self.window_size:
-            self.lags.pop(0)
-        
-        # 스파이크 감지
-        if len(self.lags) >= 10:
-            avg = sum(self.lags[:-1]) / len(self.lags[:-1])
-            if lag_ms > avg * self.spike_threshold_multiplier:
+        now = self.histogram.clock()
+        
+        # 스파이크 감지 (윈도우 누적합 기준, 재합산 없음)
+        window = self.histogram.expire(now)
+        if window.count >= self.spike_min_samples:
+            if lag_ms > window.mean() * self.spike_threshold_multiplier:
                 self.spike_count += 1
+        
+        self.histogram.record(lag_ms, now)
     
     def get_moving_avg(self) -> float:
         """이동 평균 WS 지연"""
-        if not self.lags:
-            return 0.0
-        return sum(self.lags) / len(self.lags)
+        return self.histogram.expire().mean()
     
     def get_spike_count(self) -> int:
         """스파이크 감지 횟수"""
@@ -104,8 +415,11 @@ class WebsocketLagProfiler:
     
     def get_metrics(self) -> Dict[str, Any]:
         """메트릭 반환"""
+        percentiles = self.histogram.expire().percentiles((95.0, 99.0))
         return {
             'ws_lag_ma': self.get_moving_avg(),
+            'ws_lag_p95_ms': percentiles[95.0],
+            'ws_lag_p99_ms': percentiles[99.0],
             'ws_spike_count': self.spike_count
         }
 
@@ -119,14 +433,12 @@ class RedisLatencyProfiler:
             window_size: 히스토리 윈도우 크기
         """
         self.window_size = window_size
-        self.heartbeat_ages: List[float] = []
+        self.heartbeat_ages: Deque[float] = deque(maxlen=window_size)
         self.max_age_observed = 0.0
     
     def record(self, heartbeat_age_ms: float) -> None:
         """Redis heartbeat 나이 기록"""
         self.heartbeat_ages.append(heartbeat_age_ms)
-        if len(self.heartbeat_ages) > self.window_size:
-            self.heartbeat_ages.pop(0)
         
         # 최대 나이 추적
         if heartbeat_age_ms > self.max_age_observed:
@@ -149,8 +461,8 @@ class RedisLatencyProfiler:
         if len(self.heartbeat_ages) < 5:
             return "insufficient_data"
         
-        recent_avg = sum(self.heartbeat_ages[-5:]) / 5
-        older_avg = sum(self.heartbeat_ages[:5]) / 5
+        recent_avg = sum(islice(reversed(self.heartbeat_ages), 5)) / 5
+        older_avg = sum(islice(self.heartbeat_ages, 5)) / 5
         
         if recent_avg > older_avg * 1.1:
             return "increasing"
@@ -168,13 +480,82 @@ class RedisLatencyProfiler:
         }
 
 
+def merge_snapshots(snapshots: Iterable[Dict[str, Any]]) -> LatencyHistogram:
+    """여러 스냅샷(심볼/프로세스별)을 하나의 히스토그램으로 병합"""
+    merged: Optional[LatencyHistogram] = None
+    for snapshot in snapshots:
+        histogram = LatencyHistogram.from_snapshot(snapshot)
+        merged = histogram if merged is None else merged.merge(histogram)
+    return merged if merged is not None else LatencyHistogram()
+
+
+def export_bounds(lowest: float = 0.01, highest: float = 60_000.0, per_octave: int = 2) -> List[float]:
+    """Prometheus bucket 경계 (2^(1/per_octave) 간격 기하급수)"""
+    bounds = []
+    step = 2.0 ** (1.0 / per_octave)
+    bound = lowest
+    while bound <= highest * (1 + 1e-9):
+        bounds.append(bound)
+        bound *= step
+    return bounds
+
+
+class LatencyHistogramCollector:
+    """
+    Prometheus custom collector
+    
+    LatencyHistogram(누적)을 scrape 시점에 native histogram으로 변환.
+    기록 경로에는 prometheus_client 비용이 없다.
+    """
+    
+    def __init__(self, scale: float = 0.001, bounds: Optional[Sequence[float]] = None):
+        """
+        Args:
+            scale: 기록 단위 → export 단위 배율 (기본 ms → seconds)
+            bounds: bucket 경계 (기록 단위, 기본 export_bounds())
+        """
+        self.scale = scale
+        self.bounds = list(bounds) if bounds is not None else export_bounds()
+        self._families: Dict[str, Tuple[str, Tuple[str, ...]]] = {}
+        self._histograms: Dict[str, Dict[Tuple[str, ...], LatencyHistogram]] = {}
+    
+    def add(
+        self,
+        name: str,
+        documentation: str,
+        histogram: LatencyHistogram,
+        labels: Optional[Dict[str, str]] = None,
+    ) -> None:
+        """히스토그램 등록 (같은 name은 label 값으로 구분)"""
+        labels = labels or {}
+        label_names = tuple(sorted(labels))
+        if name in self._families and self._families[name][1] != label_names:
+            raise ValueError(f"label names mismatch for {name}: {label_names}")
+        self._families.setdefault(name, (documentation, label_names))
+        self._histograms.setdefault(name, {})[tuple(labels[key] for key in label_names)] = histogram
+    
+    def collect(self):
+        from prometheus_client.core import HistogramMetricFamily
+        
+        for name, (documentation, label_names) in self._families.items():
+            family = HistogramMetricFamily(name, documentation, labels=list(label_names))
+            for label_values, histogram in self._histograms[name].items():
+                buckets = [
+                    (f"{bound * self.scale:.6g}", float(count))
+                    for bound, count in zip(self.bounds, histogram.cumulative_counts(self.bounds))
+                ]
+                buckets.append(("+Inf", float(histogram.count)))
+                family.add_metric(list(label_values), buckets, histogram.sum * self.scale)
+            yield family
+
+
 class PerformanceProfiler:
     """통합 성능 프로파일러"""
     
-    def __init__(self):
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
         """프로파일러 초기화"""
-        self.loop_profiler = LoopProfiler()
-        self.ws_profiler = WebsocketLagProfiler()
+        self.loop_profiler = LoopProfiler(clock=clock)
+        self.ws_profiler = WebsocketLagProfiler(clock=clock)
         self.redis_profiler = RedisLatencyProfiler()
     
     def record_loop(self, latency_ms: float) -> None:
@@ -189,6 +570,49 @@ class PerformanceProfiler:
         """Redis heartbeat 나이 기록"""
         self.redis_profiler.record(age_ms)
     
+    def get_snapshots(self) -> Dict[str, Dict[str, Any]]:
+        """윈도우 히스토그램 스냅샷 (merge_snapshots로 프로세스 간 집계)"""
+        return {
+            'loop': self.loop_profiler.histogram.snapshot(),
+            'ws_lag': self.ws_profiler.histogram.snapshot(),
+        }
+    
+    def register_prometheus(
+        self,
+        collector: Optional[LatencyHistogramCollector] = None,
+        registry=None,
+        labels: Optional[Dict[str, str]] = None,
+    ) -> Optional[LatencyHistogramCollector]:
+        """
+        누적 히스토그램을 Prometheus collector에 등록
+        
+        Args:
+            collector: 공유 collector (여러 심볼/러너가 label로 구분해 등록)
+            registry: collector 신규 생성 시 등록할 CollectorRegistry (None = default REGISTRY)
+            labels: 이 프로파일러의 label 값
+        
+        Returns:
+            collector (prometheus_client 미설치 시 None)
+        """
+        if collector is None:
+            try:
+                from prometheus_client import REGISTRY
+            except ImportError:
+                logger.warning("[PERF] prometheus_client not installed, histogram export disabled")
+                return None
+            collector = LatencyHistogramCollector()
+            (registry or REGISTRY).register(collector)
+        
+        collector.add(
+            "arb_loop_latency_seconds", "Main loop latency",
+            self.loop_profiler.histogram.lifetime, labels,
+        )
+        collector.add(
+            "arb_ws_lag_seconds", "WebSocket message lag",
+            self.ws_profiler.histogram.lifetime, labels,
+        )
+        return collector
+    
     def get_all_metrics(self) -> Dict[str, Any]:
         """모든 성능 메트릭 반환"""
         metrics = {}
@@ -206,6 +630,7 @@ class PerformanceProfiler:
         return (
             f"Loop: avg={loop_metrics['loop_avg_ms']:.1f}ms, "
             f"p95={loop_metrics['loop_p95_ms']:.1f}ms, "
+            f"p99={loop_metrics['loop_p99_ms']:.1f}ms, "
             f"max={loop_metrics['loop_max_ms']:.1f}ms | "
             f"WS: ma={ws_metrics['ws_lag_ma']:.1f}ms, "
             f"spikes={ws_metrics['ws_spike_count']} | "
@@ -8,7 +8,7 @@ High-Performance Portfolio Optimization Layer (PHASE D15)
 
 특징:
 - NumPy 벡터화 상관관계 행렬
-- Pandas DataFrame 기반 데이터 관리
+- 사전 할당 링 행렬 + rank-1 증분 공분산 (tick 빈도, 200+ 심볼)
 - 리스크 패리티 가중치 (벡터화)
 - 평균-분산 최적화 (Markowitz, 벡터화)
 """
@@ -18,6 +18,8 @@ import numpy as np
 import pandas as pd
 from typing import Dict, List, Optional, Tuple
 
+from arbitrage.rolling_stats import RingMatrix, RollingCovariance
+
 logger = logging.getLogger(__name__)
 
 
@@ -25,19 +27,38 @@ class PortfolioOptimizer:
     """
     고성능 포트폴리오 최적화기
     
-    NumPy 벡터화 연산과 Pandas DataFrame을 활용한 포트폴리오 최적화.
+    사전 할당된 (window × symbols) NumPy 링 행렬과 rank-1 증분 공분산으로 수익률을 관리합니다.
+    
+    관측 모델:
+    - 1행 = 1 관측 스텝. add_returns()는 현재 행에 심볼 값을 기록하며,
+      같은 심볼이 다시 들어오거나 flush_row()/통계 조회 시 행이 확정됩니다.
+    - 해당 스텝에 값이 없는 심볼은 0 수익률로 채워집니다
+      (새 심볼의 과거 행도 0 → 증분 합계와 자동으로 일치).
     """
     
-    def __init__(self, window_size: int = 60):
+    # 수치 오차 누적 방지를 위한 정확 재계산 주기 (window 배수)
+    REFRESH_FACTOR = 8
+    
+    def __init__(self, window_size: int = 60, max_symbols: int = 256):
         """
         Args:
             window_size: 상관관계 계산 윈도우 크기
+            max_symbols: 초기 심볼(열) 용량 (초과 시 자동 확장)
         """
         self.window_size = window_size
         
-        # Pandas DataFrame으로 수익률 관리 (벡터화)
-        self.returns_df = pd.DataFrame()
+        # 심볼 → 열 인덱스
         self.symbols: List[str] = []
+        self._symbol_index: Dict[str, int] = {}
+        
+        # 수익률 링 행렬 + 증분 통계
+        self._returns = RingMatrix(window_size, max_symbols)
+        self._moments = RollingCovariance(max_symbols)
+        self._rows_since_refresh = 0
+        
+        # 확정 전 현재 행
+        self._pending_row = np.zeros(max_symbols, dtype=np.float64)
+        self._pending_mask = np.zeros(max_symbols, dtype=bool)
         
         # 캐시된 통계
         self.correlation_matrix: Optional[np.ndarray] = None
@@ -45,51 +66,148 @@ class PortfolioOptimizer:
         self.mean_returns: Optional[np.ndarray] = None
         self.volatilities: Optional[np.ndarray] = None
     
+    @property
+    def returns_df(self) -> pd.DataFrame:
+        """확정된 수익률 윈도우 (조회용 DataFrame, 매 호출 시 생성)"""
+        self.flush_row()
+        return pd.DataFrame(
+            self._returns.view(len(self.symbols)).copy(),
+            columns=list(self.symbols)
+        )
+    
+    @property
+    def num_observations(self) -> int:
+        return len(self._returns)
+    
+    def _column(self, symbol: str) -> int:
+        """심볼 열 인덱스 (신규 심볼은 열 추가)"""
+        col = self._symbol_index.get(symbol)
+        if col is not None:
+            return col
+        
+        col = len(self.symbols)
+        self.symbols.append(symbol)
+        self._symbol_index[symbol] = col
+        
+        if col >= len(self._pending_row):
+            capacity = max(col + 1, 2 * len(self._pending_row))
+            self._returns.ensure_columns(capacity)
+            self._moments.ensure_columns(capacity)
+            pending_row = np.zeros(capacity, dtype=np.float64)
+            pending_row[:len(self._pending_row)] = self._pending_row
+            pending_mask = np.zeros(capacity, dtype=bool)
+            pending_mask[:len(self._pending_mask)] = self._pending_mask
+            self._pending_row = pending_row
+            self._pending_mask = pending_mask
+        
+        return col
+    
     def add_returns(self, symbol: str, returns: float) -> None:
         """
-        수익률 추가 (벡터화)
+        수익률 추가 (O(1), 행 확정 시 O(symbols²) rank-1 갱신)
         
         Args:
             symbol: 자산 심볼
             returns: 수익률 (%)
         """
-        if symbol not in self.returns_df.columns:
-            self.returns_df[symbol] = np.nan
-            self.symbols.append(symbol)
+        col = self._column(symbol)
         
-        # 새 행 추가
-        self.returns_df.loc[len(self.returns_df)] = np.nan
-        self.returns_df.loc[len(self.returns_df) - 1, symbol] = returns
+        # 같은 심볼이 다시 들어오면 새 관측 스텝
+        if self._pending_mask[col]:
+            self.flush_row()
         
-        # 윈도우 크기 유지
-        if len(self.returns_df) > self.window_size:
-            self.returns_df = self.returns_df.iloc[-self.window_size:]
+        self._pending_row[col] = returns
+        self._pending_mask[col] = True
+    
+    def add_returns_row(self, returns_by_symbol: Dict[str, float]) -> None:
+        """
+        관측 스텝 1행 추가
         
-        # 캐시 무효화
-        self._invalidate_cache()
+        Args:
+            returns_by_symbol: {symbol: returns} 딕셔너리 (누락 심볼은 0)
+        """
+        self.flush_row()
+        if not returns_by_symbol:
+            return
+        
+        index = self._symbol_index
+        columns = [
+            index[symbol] if symbol in index else self._column(symbol)
+            for symbol in returns_by_symbol
+        ]
+        self._pending_row[columns] = list(returns_by_symbol.values())
+        self._pending_mask[columns] = True
+        self.flush_row()
     
     def add_returns_batch(self, returns_dict: Dict[str, List[float]]) -> None:
         """
         배치 수익률 추가 (벡터화)
         
+        각 리스트의 i번째 값들이 한 행을 이룹니다. 길이가 다르면 최신 값 기준으로 정렬(우측 정렬)하고
+        앞쪽 부족분은 0으로 채웁니다.
+        
         Args:
             returns_dict: {symbol: [returns]} 딕셔너리
         """
-        for symbol, returns_list in returns_dict.items():
-            if symbol not in self.returns_df.columns:
-                self.returns_df[symbol] = np.nan
-                self.symbols.append(symbol)
-            
-            # 벡터화 추가
-            returns_array = np.array(returns_list, dtype=np.float32)
-            self.returns_df[symbol] = returns_array
+        self.flush_row()
+        if not returns_dict:
+            return
+        
+        columns = [self._column(symbol) for symbol in returns_dict]
+        num_rows = max(len(v) for v in returns_dict.values())
+        rows = np.zeros((num_rows, len(self.symbols)), dtype=np.float64)
+        for col, values in zip(columns, returns_dict.values()):
+            values = np.asarray(values, dtype=np.float64)
+            if len(values):
+                rows[num_rows - len(values):, col] = values
+        
+        # 윈도우를 넘는 앞부분은 어차피 밀려나므로 건너뜀
+        rows = rows[-self.window_size:]
+        
+        if len(rows) * 4 >= self.window_size:
+            # 대량 배치: 링에 기록 후 벡터화 재계산
+            for row in rows:
+                self._returns.append_row(self._full_row(row))
+            self._refresh_moments()
+        else:
+            for row in rows:
+                self._push_row(self._full_row(row))
         
-        # 윈도우 크기 유지
-        if len(self.returns_df) > self.window_size:
-            self.returns_df = self.returns_df.iloc[-self.window_size:]
+        self._invalidate_cache()
+    
+    def flush_row(self) -> None:
+        """현재 행 확정 (값이 없으면 무시)"""
+        if not self._pending_mask.any():
+            return
         
+        row = self._pending_row.copy()
+        self._pending_row[:] = 0.0
+        self._pending_mask[:] = False
+        self._push_row(row)
         self._invalidate_cache()
     
+    def _full_row(self, row: np.ndarray) -> np.ndarray:
+        """활성 열 행을 열 용량 크기로 확장"""
+        full = np.zeros(self._returns.column_capacity, dtype=np.float64)
+        full[:len(row)] = row
+        return full
+    
+    def _push_row(self, row: np.ndarray) -> None:
+        """링에 행 추가 + rank-1 증분 갱신"""
+        k = len(self.symbols)
+        evicted = self._returns.append_row(row[:self._returns.column_capacity])
+        self._moments.update(row[:k], None if evicted is None else evicted[:k])
+        
+        if evicted is not None:
+            self._rows_since_refresh += 1
+            if self._rows_since_refresh >= self.REFRESH_FACTOR * self.window_size:
+                self._refresh_moments()
+    
+    def _refresh_moments(self) -> None:
+        """링 윈도우로부터 증분 통계 정확 재계산"""
+        self._moments.reset(self._returns.view(len(self.symbols)))
+        self._rows_since_refresh = 0
+    
     def _invalidate_cache(self) -> None:
         """캐시 무효화"""
         self.correlation_matrix = None
@@ -99,17 +217,22 @@ class PortfolioOptimizer:
     
     def calculate_correlation_matrix(self) -> Optional[np.ndarray]:
         """
-        상관관계 행렬 계산 (벡터화)
+        상관관계 행렬 계산 (증분 공분산 기반, 윈도우 길이와 무관)
         
         Returns:
             (n_symbols, n_symbols) 상관관계 행렬
         """
-        if len(self.returns_df) < 2 or len(self.symbols) < 2:
+        self.flush_row()
+        if self.num_observations < 2 or len(self.symbols) < 2:
             return None
         
+        if self.correlation_matrix is not None:
+            return self.correlation_matrix
+        
         try:
-            # Pandas 벡터화 상관관계 계산
-            self.correlation_matrix = self.returns_df[self.symbols].corr().values
+            self.correlation_matrix = self._moments.correlation(
+                len(self.symbols), cov=self.calculate_covariance_matrix()
+            )
             return self.correlation_matrix
         
         except Exception as e:
@@ -118,17 +241,20 @@ class PortfolioOptimizer:
     
     def calculate_covariance_matrix(self) -> Optional[np.ndarray]:
         """
-        공분산 행렬 계산 (벡터화)
+        공분산 행렬 계산 (증분 공분산 기반, 윈도우 길이와 무관)
         
         Returns:
             (n_symbols, n_symbols) 공분산 행렬
         """
-        if len(self.returns_df) < 2 or len(self.symbols) < 2:
+        self.flush_row()
+        if self.num_observations < 2 or len(self.symbols) < 2:
             return None
         
+        if self.covariance_matrix is not None:
+            return self.covariance_matrix
+        
         try:
-            # Pandas 벡터화 공분산 계산
-            self.covariance_matrix = self.returns_df[self.symbols].cov().values
+            self.covariance_matrix = self._moments.covariance(len(self.symbols))
             return self.covariance_matrix
         
         except Exception as e:
@@ -136,18 +262,25 @@ class PortfolioOptimizer:
             return None
     
     def _compute_statistics(self) -> None:
-        """통계 계산 (벡터화)"""
-        if len(self.returns_df) == 0:
+        """통계 계산 (증분 합계 기반, 캐시)"""
+        self.flush_row()
+        if self.num_observations == 0:
+            return
+        
+        if self.mean_returns is not None and self.volatilities is not None:
             return
         
-        # 평균 수익률 (벡터화)
-        self.mean_returns = self.returns_df[self.symbols].mean().values
+        k = len(self.symbols)
+        
+        # 평균 수익률
+        self.mean_returns = self._moments.mean(k)
         
-        # 변동성 (벡터화)
-        self.volatilities = self.returns_df[self.symbols].std().values
+        # 변동성 (표본 표준편차, ddof=1)
+        cov = self.calculate_covariance_matrix() if k >= 2 else self._moments.covariance(k)
+        volatilities = np.sqrt(np.diag(cov))
         
-        # 0 변동성 처리
-        self.volatilities = np.where(self.volatilities > 0, self.volatilities, 1.0)
+        # 0 변동성 처리 (관측치 1개 → NaN 포함)
+        self.volatilities = np.where(volatilities > 0, volatilities, 1.0)
     
     def get_risk_parity_weights(self) -> Dict[str, float]:
         """
@@ -272,7 +405,7 @@ class PortfolioOptimizer:
         return {
             'num_symbols': len(self.symbols),
             'symbols': self.symbols,
-            'num_observations': len(self.returns_df),
+            'num_observations': self.num_observations,
             'correlation_matrix_available': self.correlation_matrix is not None,
             'covariance_matrix_available': self.covariance_matrix is not None
         }
@@ -10,16 +10,20 @@ Multi-Symbol 환경에서 3-tier 리스크 관리:
 
 from .multi_symbol_risk_guard import (
     GlobalGuard,
+    SharedGlobalGuard,
     PortfolioGuard,
     SymbolGuard,
     MultiSymbolRiskCoordinator,
     RiskGuardDecision,
 )
+from .shared_risk_ledger import SharedRiskLedger
 
 __all__ = [
     "GlobalGuard",
+    "SharedGlobalGuard",
     "PortfolioGuard",
     "SymbolGuard",
     "MultiSymbolRiskCoordinator",
     "RiskGuardDecision",
+    "SharedRiskLedger",
 ]
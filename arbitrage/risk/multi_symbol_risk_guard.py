@@ -7,6 +7,9 @@ D73-3: Multi-Symbol RiskGuard Implementation
 - PortfolioGuard: Symbol allocation and portfolio balance
 - SymbolGuard: Per-symbol limits (position size, cooldown, circuit breaker)
 
+D74-6: 각 Guard는 SharedRiskLedger(공유 메모리 원장)에 연결 가능.
+연결 시 노출/손실/포지션 수를 원장에서 읽고 쓰므로 프로세스 간 한도가 일관됨.
+
 Redis Keyspace (D72-2 규격 준수):
 - {ns}:{env}:{run_id}:risk:global:state
 - {ns}:{env}:{run_id}:risk:portfolio:state
@@ -19,6 +22,8 @@ from dataclasses import dataclass, field
 from enum import Enum
 from typing import Dict, List, Optional, Any
 
+from arbitrage.risk.shared_risk_ledger import SharedRiskLedger
+
 logger = logging.getLogger(__name__)
 
 
@@ -74,6 +79,45 @@ class SymbolRiskState:
     circuit_breaker_until: float = 0.0
 
 
+class LedgerGlobalState:
+    """
+    SharedRiskLedger 전체 행을 GlobalRiskState 속성명으로 노출하는 뷰
+    
+    속성 접근마다 원장을 다시 읽으므로, 여러 필드를 함께 볼 때는 snapshot() 사용.
+    """
+    
+    def __init__(self, ledger: SharedRiskLedger, session_start_time: float):
+        self._ledger = ledger
+        self.session_start_time = session_start_time
+    
+    def snapshot(self) -> GlobalRiskState:
+        entry = self._ledger.read()
+        return GlobalRiskState(
+            total_exposure_usd=entry.total_exposure_usd,
+            total_daily_loss_usd=entry.daily_loss_usd,
+            total_trades_executed=int(entry.trades_executed),
+            total_trades_rejected=int(entry.trades_rejected),
+            session_start_time=self.session_start_time,
+            emergency_stop_triggered=bool(entry.emergency_stop),
+        )
+    
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self.snapshot(), name)
+
+
+def _global_deltas(state: GlobalRiskState) -> Dict[str, float]:
+    """GlobalRiskState → 원장 필드 증분"""
+    return {
+        "exposure_usd": state.total_exposure_usd,
+        "daily_loss_usd": state.total_daily_loss_usd,
+        "trades_executed": state.total_trades_executed,
+        "trades_rejected": state.total_trades_rejected,
+        "emergency_stop": 1.0 if state.emergency_stop_triggered else 0.0,
+    }
+
+
 # ============================================================================
 # Global Guard
 # ============================================================================
@@ -93,18 +137,23 @@ class GlobalGuard:
         max_total_exposure_usd: float = 10000.0,
         max_daily_loss_usd: float = 500.0,
         emergency_stop_loss_usd: float = 1000.0,
+        ledger: Optional[SharedRiskLedger] = None,
     ):
         """
         Args:
             max_total_exposure_usd: 전체 최대 노출 (USD)
             max_daily_loss_usd: 일일 최대 손실 (USD)
             emergency_stop_loss_usd: 긴급 중단 손실 (USD)
+            ledger: 공유 리스크 원장 (D74-6, 선택)
         """
         self.max_total_exposure_usd = max_total_exposure_usd
         self.max_daily_loss_usd = max_daily_loss_usd
         self.emergency_stop_loss_usd = emergency_stop_loss_usd
         
         self.state = GlobalRiskState()
+        self.ledger: Optional[SharedRiskLedger] = None
+        if ledger is not None:
+            self.attach_ledger(ledger)
         
         logger.info(
             f"[D73-3_GLOBAL_GUARD] Initialized: "
@@ -113,6 +162,18 @@ class GlobalGuard:
             f"emergency_stop={emergency_stop_loss_usd}"
         )
     
+    def attach_ledger(self, ledger: SharedRiskLedger) -> None:
+        """공유 원장 연결 (현재 로컬 상태를 원장 전체 행에 합산)"""
+        if self.ledger is ledger:
+            return
+        ledger.add(None, **_global_deltas(self.snapshot_state()))
+        self.state = LedgerGlobalState(ledger, self.state.session_start_time)
+        self.ledger = ledger
+    
+    def snapshot_state(self) -> GlobalRiskState:
+        """현재 상태 (원장 연결 시 일관된 1회 읽기)"""
+        return self.state.snapshot() if self.ledger is not None else self.state
+    
     def check_global_limits(
         self,
         additional_exposure_usd: float = 0.0,
@@ -126,29 +187,34 @@ class GlobalGuard:
         Returns:
             RiskGuardDecision
         """
+        state = self.snapshot_state()
+        
         # 1. Emergency stop 체크
-        if self.state.emergency_stop_triggered:
+        if state.emergency_stop_triggered:
             logger.error("[D73-3_GLOBAL_GUARD] Emergency stop triggered")
             return RiskGuardDecision.SESSION_STOP
         
-        if self.state.total_daily_loss_usd >= self.emergency_stop_loss_usd:
+        if state.total_daily_loss_usd >= self.emergency_stop_loss_usd:
             logger.error(
                 f"[D73-3_GLOBAL_GUARD] Emergency stop: "
-                f"daily_loss={self.state.total_daily_loss_usd} >= {self.emergency_stop_loss_usd}"
+                f"daily_loss={state.total_daily_loss_usd} >= {self.emergency_stop_loss_usd}"
             )
-            self.state.emergency_stop_triggered = True
+            if self.ledger is not None:
+                self.ledger.set_emergency_stop()
+            else:
+                self.state.emergency_stop_triggered = True
             return RiskGuardDecision.SESSION_STOP
         
         # 2. 일일 최대 손실 체크
-        if self.state.total_daily_loss_usd >= self.max_daily_loss_usd:
+        if state.total_daily_loss_usd >= self.max_daily_loss_usd:
             logger.warning(
                 f"[D73-3_GLOBAL_GUARD] Max daily loss reached: "
-                f"daily_loss={self.state.total_daily_loss_usd} >= {self.max_daily_loss_usd}"
+                f"daily_loss={state.total_daily_loss_usd} >= {self.max_daily_loss_usd}"
             )
             return RiskGuardDecision.REJECTED_GLOBAL
         
         # 3. 전체 노출 한도 체크
-        new_total_exposure = self.state.total_exposure_usd + additional_exposure_usd
+        new_total_exposure = state.total_exposure_usd + additional_exposure_usd
         if new_total_exposure > self.max_total_exposure_usd:
             logger.warning(
                 f"[D73-3_GLOBAL_GUARD] Max total exposure exceeded: "
@@ -160,6 +226,9 @@ class GlobalGuard:
     
     def update_exposure(self, delta_usd: float) -> None:
         """노출 업데이트 (양수=증가, 음수=감소)"""
+        if self.ledger is not None:
+            self.ledger.add(None, exposure_usd=delta_usd)
+            return
         self.state.total_exposure_usd += delta_usd
         logger.debug(
             f"[D73-3_GLOBAL_GUARD] Exposure updated: {self.state.total_exposure_usd:.2f} USD"
@@ -168,24 +237,82 @@ class GlobalGuard:
     def update_daily_loss(self, loss_usd: float) -> None:
         """일일 손실 업데이트 (양수=손실)"""
         if loss_usd > 0:
+            if self.ledger is not None:
+                self.ledger.add(None, daily_loss_usd=loss_usd)
+                return
             self.state.total_daily_loss_usd += loss_usd
             logger.debug(
                 f"[D73-3_GLOBAL_GUARD] Daily loss updated: {self.state.total_daily_loss_usd:.2f} USD"
             )
     
+    def record_trade_executed(self) -> None:
+        """체결 거래 수 증가"""
+        if self.ledger is not None:
+            self.ledger.add(None, trades_executed=1)
+        else:
+            self.state.total_trades_executed += 1
+    
     def get_stats(self) -> Dict[str, Any]:
         """Global Guard 통계"""
+        state = self.snapshot_state()
         return {
-            "total_exposure_usd": self.state.total_exposure_usd,
+            "total_exposure_usd": state.total_exposure_usd,
             "max_total_exposure_usd": self.max_total_exposure_usd,
-            "total_daily_loss_usd": self.state.total_daily_loss_usd,
+            "total_daily_loss_usd": state.total_daily_loss_usd,
             "max_daily_loss_usd": self.max_daily_loss_usd,
-            "trades_executed": self.state.total_trades_executed,
-            "trades_rejected": self.state.total_trades_rejected,
-            "emergency_stop_triggered": self.state.emergency_stop_triggered,
+            "trades_executed": state.total_trades_executed,
+            "trades_rejected": state.total_trades_rejected,
+            "emergency_stop_triggered": state.emergency_stop_triggered,
         }
 
 
+# ============================================================================
+# Shared Global Guard (D74-5: 멀티프로세스 샤딩)
+# ============================================================================
+
+class SharedGlobalGuard(GlobalGuard):
+    """
+    프로세스 간 공유 GlobalGuard
+    
+    SharedRiskLedger 전체 행을 상태로 사용 (D74-6).
+    샤드 프로세스들이 동일한 전체 노출/일일 손실 한도를 공유.
+    """
+    
+    def __init__(
+        self,
+        max_total_exposure_usd: float = 10000.0,
+        max_daily_loss_usd: float = 500.0,
+        emergency_stop_loss_usd: float = 1000.0,
+        ledger: Optional[SharedRiskLedger] = None,
+        context: Optional[Any] = None,
+    ):
+        super().__init__(
+            max_total_exposure_usd=max_total_exposure_usd,
+            max_daily_loss_usd=max_daily_loss_usd,
+            emergency_stop_loss_usd=emergency_stop_loss_usd,
+            ledger=ledger or SharedRiskLedger(context=context),
+        )
+    
+    @classmethod
+    def from_guard(
+        cls,
+        guard: GlobalGuard,
+        ledger: Optional[SharedRiskLedger] = None,
+        context: Optional[Any] = None,
+    ) -> "SharedGlobalGuard":
+        """기존 GlobalGuard의 한도/상태를 복사하여 생성"""
+        shared = cls(
+            max_total_exposure_usd=guard.max_total_exposure_usd,
+            max_daily_loss_usd=guard.max_daily_loss_usd,
+            emergency_stop_loss_usd=guard.emergency_stop_loss_usd,
+            ledger=ledger,
+            context=context,
+        )
+        shared.ledger.add(None, **_global_deltas(guard.snapshot_state()))
+        shared.state.session_start_time = guard.state.session_start_time
+        return shared
+
+
 # ============================================================================
 # Portfolio Guard
 # ============================================================================
@@ -204,16 +331,21 @@ class PortfolioGuard:
         self,
         total_capital_usd: float = 10000.0,
         max_symbol_allocation_pct: float = 0.3,  # 심볼당 최대 30%
+        ledger: Optional[SharedRiskLedger] = None,
     ):
         """
         Args:
             total_capital_usd: 전체 자본
             max_symbol_allocation_pct: 심볼당 최대 할당 비율
+            ledger: 공유 리스크 원장 (D74-6, 선택)
         """
         self.total_capital_usd = total_capital_usd
         self.max_symbol_allocation_pct = max_symbol_allocation_pct
         
         self.state = PortfolioRiskState()
+        self.ledger: Optional[SharedRiskLedger] = None
+        if ledger is not None:
+            self.attach_ledger(ledger)
         
         logger.info(
             f"[D73-3_PORTFOLIO_GUARD] Initialized: "
@@ -266,6 +398,15 @@ class PortfolioGuard:
         
         return allocations
     
+    def attach_ledger(self, ledger: SharedRiskLedger) -> None:
+        """공유 원장 연결 (심볼별 노출을 원장 심볼 행으로 이전)"""
+        if self.ledger is ledger:
+            return
+        for symbol, exposure in self.state.symbol_exposures.items():
+            if exposure:
+                ledger.add(symbol, exposure_usd=exposure)
+        self.ledger = ledger
+    
     def check_symbol_allocation(self, symbol: str, additional_exposure_usd: float) -> RiskGuardDecision:
         """
         심볼별 할당 한도 체크
@@ -278,7 +419,10 @@ class PortfolioGuard:
             RiskGuardDecision
         """
         allocated = self.state.symbol_allocations.get(symbol, 0.0)
-        current_exposure = self.state.symbol_exposures.get(symbol, 0.0)
+        if self.ledger is not None:
+            current_exposure = self.ledger.read(symbol).total_exposure_usd
+        else:
+            current_exposure = self.state.symbol_exposures.get(symbol, 0.0)
         new_exposure = current_exposure + additional_exposure_usd
         
         if new_exposure > allocated:
@@ -292,6 +436,9 @@ class PortfolioGuard:
     
     def update_symbol_exposure(self, symbol: str, delta_usd: float) -> None:
         """심볼별 노출 업데이트"""
+        if self.ledger is not None:
+            self.ledger.add(symbol, exposure_usd=delta_usd)
+            return
         current = self.state.symbol_exposures.get(symbol, 0.0)
         self.state.symbol_exposures[symbol] = current + delta_usd
         logger.debug(
@@ -300,11 +447,17 @@ class PortfolioGuard:
     
     def get_stats(self) -> Dict[str, Any]:
         """Portfolio Guard 통계"""
+        if self.ledger is not None:
+            symbol_exposures = {
+                symbol: self.ledger.read(symbol).exposure_usd for symbol in self.state.symbol_allocations
+            }
+        else:
+            symbol_exposures = dict(self.state.symbol_exposures)
         return {
             "total_capital_usd": self.total_capital_usd,
             "total_allocated_capital": self.state.total_allocated_capital,
             "symbol_allocations": dict(self.state.symbol_allocations),
-            "symbol_exposures": dict(self.state.symbol_exposures),
+            "symbol_exposures": symbol_exposures,
             "rebalance_count": self.state.rebalance_count,
         }
 
@@ -333,6 +486,7 @@ class SymbolGuard:
         max_symbol_daily_loss_usd: float = 200.0,
         circuit_breaker_loss_count: int = 3,  # 연속 3회 손실 시 차단
         circuit_breaker_duration: float = 300.0,  # 5분간 차단
+        ledger: Optional[SharedRiskLedger] = None,
     ):
         """
         Args:
@@ -343,6 +497,7 @@ class SymbolGuard:
             max_symbol_daily_loss_usd: 심볼별 일일 최대 손실
             circuit_breaker_loss_count: Circuit breaker 발동 손실 횟수
             circuit_breaker_duration: Circuit breaker 지속 시간 (초)
+            ledger: 공유 리스크 원장 (D74-6, 선택)
         """
         self.symbol = symbol
         self.max_position_size_usd = max_position_size_usd
@@ -354,6 +509,9 @@ class SymbolGuard:
         
         self.state = SymbolRiskState(symbol=symbol)
         self._consecutive_losses = 0
+        self.ledger: Optional[SharedRiskLedger] = None
+        if ledger is not None:
+            self.attach_ledger(ledger)
         
         logger.info(
             f"[D73-3_SYMBOL_GUARD] {symbol} Initialized: "
@@ -362,6 +520,42 @@ class SymbolGuard:
             f"cooldown={cooldown_seconds}s"
         )
     
+    def attach_ledger(self, ledger: SharedRiskLedger) -> None:
+        """
+        공유 원장 연결
+        
+        포지션 수 / 일일 손실 / 체결·거부 수는 원장 심볼 행에서 관리.
+        쿨다운 / circuit breaker는 심볼을 담당하는 프로세스 로컬 상태로 유지.
+        """
+        if self.ledger is ledger:
+            return
+        ledger.add(
+            self.symbol,
+            position_count=self.state.current_position_count,
+            daily_loss_usd=self.state.daily_loss_usd,
+            trades_executed=self.state.trades_executed,
+            trades_rejected=self.state.trades_rejected,
+        )
+        self.ledger = ledger
+    
+    def _counters(self) -> tuple:
+        """(포지션 수, 일일 손실, 체결 수, 거부 수)"""
+        if self.ledger is not None:
+            entry = self.ledger.read(self.symbol)
+            return (
+                int(entry.position_count), entry.daily_loss_usd,
+                int(entry.trades_executed), int(entry.trades_rejected),
+            )
+        state = self.state
+        return state.current_position_count, state.daily_loss_usd, state.trades_executed, state.trades_rejected
+    
+    def record_rejected(self) -> None:
+        """거부 수 증가"""
+        if self.ledger is not None:
+            self.ledger.add(self.symbol, trades_rejected=1)
+        else:
+            self.state.trades_rejected += 1
+    
     def check_symbol_limits(
         self,
         position_size_usd: float,
@@ -409,18 +603,19 @@ class SymbolGuard:
             return RiskGuardDecision.REJECTED_SYMBOL
         
         # 4. 포지션 수 체크
-        if self.state.current_position_count >= self.max_position_count:
+        position_count, daily_loss_usd, _, _ = self._counters()
+        if position_count >= self.max_position_count:
             logger.warning(
                 f"[D73-3_SYMBOL_GUARD] {self.symbol} max position count reached: "
-                f"{self.state.current_position_count} >= {self.max_position_count}"
+                f"{position_count} >= {self.max_position_count}"
             )
             return RiskGuardDecision.REJECTED_SYMBOL
         
         # 5. 심볼별 일일 손실 체크
-        if self.state.daily_loss_usd >= self.max_symbol_daily_loss_usd:
+        if daily_loss_usd >= self.max_symbol_daily_loss_usd:
             logger.warning(
                 f"[D73-3_SYMBOL_GUARD] {self.symbol} max daily loss reached: "
-                f"{self.state.daily_loss_usd} >= {self.max_symbol_daily_loss_usd}"
+                f"{daily_loss_usd} >= {self.max_symbol_daily_loss_usd}"
             )
             return RiskGuardDecision.REJECTED_SYMBOL
         
@@ -430,8 +625,11 @@ class SymbolGuard:
         """진입 시 호출"""
         now = time.time()
         self.state.current_exposure_usd += position_size_usd
-        self.state.current_position_count += 1
-        self.state.trades_executed += 1
+        if self.ledger is not None:
+            self.ledger.add(self.symbol, position_count=1, trades_executed=1)
+        else:
+            self.state.current_position_count += 1
+            self.state.trades_executed += 1
         self.state.last_entry_time = now
         self.state.cooldown_until = now + self.cooldown_seconds
         
@@ -443,12 +641,15 @@ class SymbolGuard:
     
     def on_exit(self, pnl_usd: float) -> None:
         """청산 시 호출"""
-        self.state.current_position_count = max(0, self.state.current_position_count - 1)
+        loss = abs(pnl_usd) if pnl_usd < 0 else 0.0
+        if self.ledger is not None:
+            self.ledger.add(self.symbol, position_count=-1, daily_loss_usd=loss)
+        else:
+            self.state.current_position_count = max(0, self.state.current_position_count - 1)
+            self.state.daily_loss_usd += loss
         
         # 손실 처리
         if pnl_usd < 0:
-            loss = abs(pnl_usd)
-            self.state.daily_loss_usd += loss
             self._consecutive_losses += 1
             
             # Circuit breaker 체크
@@ -464,22 +665,20 @@ class SymbolGuard:
             self._consecutive_losses = 0
         
         logger.debug(
-            f"[D73-3_SYMBOL_GUARD] {self.symbol} exit: "
-            f"pnl={pnl_usd:.2f}, "
-            f"daily_loss={self.state.daily_loss_usd:.2f}, "
-            f"count={self.state.current_position_count}"
+            f"[D73-3_SYMBOL_GUARD] {self.symbol} exit: pnl={pnl_usd:.2f}"
         )
     
     def get_stats(self) -> Dict[str, Any]:
         """Symbol Guard 통계"""
+        position_count, daily_loss_usd, trades_executed, trades_rejected = self._counters()
         return {
             "symbol": self.symbol,
             "current_exposure_usd": self.state.current_exposure_usd,
-            "current_position_count": self.state.current_position_count,
-            "daily_loss_usd": self.state.daily_loss_usd,
+            "current_position_count": position_count,
+            "daily_loss_usd": daily_loss_usd,
             "max_symbol_daily_loss_usd": self.max_symbol_daily_loss_usd,
-            "trades_executed": self.state.trades_executed,
-            "trades_rejected": self.state.trades_rejected,
+            "trades_executed": trades_executed,
+            "trades_rejected": trades_rejected,
             "circuit_breaker_triggered": self.state.circuit_breaker_triggered,
             "consecutive_losses": self._consecutive_losses,
         }
@@ -512,6 +711,7 @@ class MultiSymbolRiskCoordinator:
         portfolio_guard: PortfolioGuard,
         symbols: Optional[List[str]] = None,
         symbol_guard_config: Optional[Dict[str, Any]] = None,
+        ledger: Optional[SharedRiskLedger] = None,
     ):
         """
         Args:
@@ -519,6 +719,7 @@ class MultiSymbolRiskCoordinator:
             portfolio_guard: PortfolioGuard 인스턴스
             symbols: 심볼 리스트
             symbol_guard_config: SymbolGuard 설정 (공통 설정)
+            ledger: 공유 리스크 원장 (D74-6, 선택)
         """
         self.global_guard = global_guard
         self.portfolio_guard = portfolio_guard
@@ -528,6 +729,10 @@ class MultiSymbolRiskCoordinator:
         if symbols:
             self._initialize_symbol_guards(symbols, symbol_guard_config or {})
         
+        self.ledger: Optional[SharedRiskLedger] = None
+        if ledger is not None:
+            self.attach_ledger(ledger)
+        
         logger.info(
             f"[D73-3_COORDINATOR] Initialized with {len(self.symbol_guards)} symbols"
         )
@@ -545,6 +750,14 @@ class MultiSymbolRiskCoordinator:
                 circuit_breaker_duration=config.get("circuit_breaker_duration", 300.0),
             )
     
+    def attach_ledger(self, ledger: SharedRiskLedger) -> None:
+        """모든 Guard를 공유 원장에 연결"""
+        self.global_guard.attach_ledger(ledger)
+        self.portfolio_guard.attach_ledger(ledger)
+        for guard in self.symbol_guards.values():
+            guard.attach_ledger(ledger)
+        self.ledger = ledger
+    
     def check_trade_allowed(
         self,
         symbol: str,
@@ -584,20 +797,57 @@ class MultiSymbolRiskCoordinator:
                 logger.warning(
                     f"[D73-3_COORDINATOR] {symbol} rejected by SymbolGuard: {decision.value}"
                 )
-                symbol_guard.state.trades_rejected += 1
+                symbol_guard.record_rejected()
                 return decision
         
         logger.debug(f"[D73-3_COORDINATOR] {symbol} trade allowed (size={position_size_usd:.2f})")
         return RiskGuardDecision.OK
     
-    def on_trade_entry(self, symbol: str, position_size_usd: float) -> None:
-        """거래 진입 시 호출"""
-        # Global update
-        self.global_guard.update_exposure(position_size_usd)
-        self.global_guard.state.total_trades_executed += 1
+    def reserve_trade(self, symbol: str, position_size_usd: float) -> RiskGuardDecision:
+        """
+        거래 허용 체크 + 노출 예약
+        
+        원장 연결 시 전체/심볼 한도 재확인과 예약을 원자적으로 수행하여
+        다른 프로세스와 동시에 한도를 넘기지 않음. 성공 시 on_trade_entry(reserved=True)
+        또는 cancel_reservation()으로 마무리.
+        """
+        decision = self.check_trade_allowed(symbol, position_size_usd)
+        if decision != RiskGuardDecision.OK or self.ledger is None:
+            return decision
+        
+        reserved = self.ledger.reserve(
+            symbol,
+            position_size_usd,
+            max_total_exposure_usd=self.global_guard.max_total_exposure_usd,
+            max_symbol_exposure_usd=self.portfolio_guard.state.symbol_allocations.get(symbol, 0.0),
+        )
+        if not reserved:
+            logger.warning(f"[D74-6_COORDINATOR] {symbol} reservation rejected by ledger")
+            return RiskGuardDecision.REJECTED_GLOBAL
+        return RiskGuardDecision.OK
+    
+    def cancel_reservation(self, symbol: str, position_size_usd: float) -> None:
+        """예약 취소 (진입 실패 시)"""
+        if self.ledger is not None:
+            self.ledger.cancel(symbol, position_size_usd)
+    
+    def on_trade_entry(self, symbol: str, position_size_usd: float, reserved: bool = False) -> None:
+        """
+        거래 진입 시 호출
         
-        # Portfolio update
-        self.portfolio_guard.update_symbol_exposure(symbol, position_size_usd)
+        Args:
+            reserved: reserve_trade()로 예약한 노출이면 True
+        """
+        if self.ledger is not None:
+            # 전체/심볼 노출 확정을 원장에서 한 번에 처리
+            self.ledger.commit(symbol, position_size_usd, reserved=reserved)
+        else:
+            # Global update
+            self.global_guard.update_exposure(position_size_usd)
+            self.global_guard.record_trade_executed()
+            
+            # Portfolio update
+            self.portfolio_guard.update_symbol_exposure(symbol, position_size_usd)
         
         # Symbol update
         symbol_guard = self.symbol_guards.get(symbol)
@@ -606,13 +856,16 @@ class MultiSymbolRiskCoordinator:
     
     def on_trade_exit(self, symbol: str, position_size_usd: float, pnl_usd: float) -> None:
         """거래 청산 시 호출"""
-        # Global update
-        self.global_guard.update_exposure(-position_size_usd)
-        if pnl_usd < 0:
-            self.global_guard.update_daily_loss(abs(pnl_usd))
-        
-        # Portfolio update
-        self.portfolio_guard.update_symbol_exposure(symbol, -position_size_usd)
+        if self.ledger is not None:
+            self.ledger.release(symbol, position_size_usd, pnl_usd)
+        else:
+            # Global update
+            self.global_guard.update_exposure(-position_size_usd)
+            if pnl_usd < 0:
+                self.global_guard.update_daily_loss(abs(pnl_usd))
+            
+            # Portfolio update
+            self.portfolio_guard.update_symbol_exposure(symbol, -position_size_usd)
         
         # Symbol update
         symbol_guard = self.symbol_guards.get(symbol)
@@ -631,6 +884,7 @@ class MultiSymbolRiskCoordinator:
         
         self.symbol_guards[symbol] = SymbolGuard(
             symbol=symbol,
+            ledger=self.ledger,
             **(config or {})
         )
         logger.info(f"[D73-3_COORDINATOR] Added symbol: {symbol}")
@@ -0,0 +1,410 @@
+# -*- coding: utf-8 -*-
+"""
+D74-6: Shared-Memory Risk Ledger
+
+멀티프로세스 리스크 체크용 공유 원장.
+
+- multiprocessing.shared_memory 위의 고정 레이아웃 (전체 1행 + 심볼별 슬롯)
+- seqlock 읽기: 읽기 측은 lock 없이 일관된 스냅샷 획득 (수 µs)
+  재시도가 SPIN_LIMIT를 넘으면 (writer 중단 등) lock 획득 후 읽기로 fallback
+- 쓰기 측은 짧은 lock 구간에서 seq를 홀수→짝수로 갱신
+- reserve / commit / cancel / release: 노출 예약/확정/취소/해제를 원자적으로 처리
+- StateStore 주기 스냅샷 → 워커/프로세스 재시작 후 복원
+
+Layout:
+    header  int64[2]            seq, slot_count
+    rows    float64[N+1, F]     row 0 = 전체, row 1..N = 심볼
+    names   S24[N+1]            row별 심볼명 (row 0은 비움)
+"""
+
+import logging
+import math
+import multiprocessing
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from multiprocessing import resource_tracker, shared_memory
+from typing import Any, Callable, Dict, Iterator, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+LEDGER_FIELDS = (
+    "exposure_usd",
+    "reserved_usd",
+    "daily_loss_usd",
+    "trades_executed",
+    "trades_rejected",
+    "position_count",
+    "emergency_stop",
+)
+_FIELD_INDEX = {name: index for index, name in enumerate(LEDGER_FIELDS)}
+_NON_NEGATIVE = (_FIELD_INDEX["reserved_usd"], _FIELD_INDEX["position_count"])
+_EXPOSURE = _FIELD_INDEX["exposure_usd"]
+_RESERVED = _FIELD_INDEX["reserved_usd"]
+_DAILY_LOSS = _FIELD_INDEX["daily_loss_usd"]
+_EXECUTED = _FIELD_INDEX["trades_executed"]
+_REJECTED = _FIELD_INDEX["trades_rejected"]
+_EMERGENCY = _FIELD_INDEX["emergency_stop"]
+
+SYMBOL_NAME_BYTES = 24
+_HEADER_BYTES = 2 * 8
+GLOBAL_ROW = 0
+SNAPSHOT_CATEGORY = "risk_ledger"
+
+
+@dataclass(frozen=True)
+class LedgerEntry:
+    """원장 1행 스냅샷 (전체 또는 심볼)"""
+    exposure_usd: float = 0.0
+    reserved_usd: float = 0.0
+    daily_loss_usd: float = 0.0
+    trades_executed: float = 0.0
+    trades_rejected: float = 0.0
+    position_count: float = 0.0
+    emergency_stop: float = 0.0
+    
+    @property
+    def total_exposure_usd(self) -> float:
+        """확정 노출 + 예약 노출"""
+        return self.exposure_usd + self.reserved_usd
+
+
+_EMPTY_ENTRY = LedgerEntry()
+
+
+class SharedRiskLedger:
+    """
+    공유 메모리 리스크 원장
+    
+    fork 워커는 그대로 상속, spawn 워커는 pickle 시 이름으로 재연결.
+    생성한 프로세스가 close/unlink 책임을 가짐.
+    """
+    
+    SPIN_LIMIT = 10_000  # seqlock 재시도 상한
+    LOCKED_READ_TIMEOUT = 1.0  # fallback 읽기 lock 대기 (초)
+    
+    def __init__(
+        self,
+        max_symbols: int = 256,
+        name: Optional[str] = None,
+        create: bool = True,
+        lock: Optional[Any] = None,
+        context: Optional[Any] = None,
+    ):
+        """
+        Args:
+            max_symbols: 심볼 슬롯 수
+            name: 공유 메모리 이름 (None이면 자동 생성)
+            create: True면 신규 생성, False면 기존 원장에 연결
+            lock: 쓰기 lock (연결 시 생성 측 lock 전달)
+            context: multiprocessing context
+        """
+        ctx = context or multiprocessing.get_context()
+        self.max_symbols = max_symbols
+        self._lock = lock or ctx.Lock()
+        size = _HEADER_BYTES + (max_symbols + 1) * (len(LEDGER_FIELDS) * 8 + SYMBOL_NAME_BYTES)
+        self._shm = shared_memory.SharedMemory(name=name, create=create, size=size if create else 0)
+        if not create:
+            # 연결 측 종료 시 resource_tracker가 원장을 unlink하지 않도록
+            resource_tracker.unregister(self._shm._name, "shared_memory")
+        self._owner_pid = os.getpid() if create else None
+        self._map()
+        self._slots: Dict[str, int] = {}
+        self._snapshot_thread: Optional[threading.Thread] = None
+        self._snapshot_stop = threading.Event()
+        
+        logger.info(
+            f"[RISK_LEDGER] {'Created' if create else 'Attached'} {self._shm.name}: "
+            f"max_symbols={max_symbols}, size={size}B"
+        )
+    
+    def _map(self) -> None:
+        rows = self.max_symbols + 1
+        buf = self._shm.buf
+        self._header = np.ndarray((2,), dtype=np.int64, buffer=buf, offset=0)
+        self._rows = np.ndarray((rows, len(LEDGER_FIELDS)), dtype=np.float64, buffer=buf, offset=_HEADER_BYTES)
+        self._names = np.ndarray(
+            (rows,), dtype=f"S{SYMBOL_NAME_BYTES}", buffer=buf, offset=_HEADER_BYTES + self._rows.nbytes
+        )
+    
+    @property
+    def name(self) -> str:
+        return self._shm.name
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        return {"name": self._shm.name, "max_symbols": self.max_symbols, "lock": self._lock}
+    
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__init__(state["max_symbols"], name=state["name"], create=False, lock=state["lock"])
+    
+    # ========== seqlock ==========
+    
+    @contextmanager
+    def _writing(self) -> Iterator[None]:
+        with self._lock:
+            self._header[0] += 1
+            try:
+                yield
+            finally:
+                self._header[0] += 1
+    
+    def _read_consistent(self, read: Callable[[], Any]) -> Any:
+        """
+        seqlock 일관 읽기
+        
+        SPIN_LIMIT 내에 안정된 seq를 얻지 못하면 lock 획득 후 읽기.
+        
+        Raises:
+            TimeoutError: LOCKED_READ_TIMEOUT 내 lock 획득 실패 (writer가 lock 보유 중 종료)
+        """
+        header = self._header
+        for _ in range(self.SPIN_LIMIT):
+            seq = int(header[0])
+            if seq & 1:
+                time.sleep(0)
+                continue
+            value = read()
+            if int(header[0]) == seq:
+                return value
+        
+        logger.warning(f"[RISK_LEDGER] {self.name}: seqlock spin limit reached, falling back to locked read")
+        if not self._lock.acquire(timeout=self.LOCKED_READ_TIMEOUT):
+            logger.error(f"[RISK_LEDGER] {self.name}: writer stalled (seq={int(header[0])})")
+            raise TimeoutError(f"risk ledger {self.name}: writer stalled")
+        try:
+            return read()
+        finally:
+            self._lock.release()
+    
+    def _read_row(self, row: int) -> LedgerEntry:
+        values = self._rows[row]
+        return LedgerEntry(*self._read_consistent(values.tolist))
+    
+    # ========== 슬롯 ==========
+    
+    def slot(self, symbol: str, create: bool = True) -> int:
+        """
+        심볼 row 번호 (없으면 할당)
+        
+        Returns:
+            row 번호, create=False이고 없으면 -1
+        """
+        row = self._slots.get(symbol)
+        if row is not None:
+            return row
+        
+        encoded = symbol.encode()[:SYMBOL_NAME_BYTES]
+        with self._lock:
+            count = int(self._header[1])
+            matches = np.flatnonzero(self._names[1:count + 1] == encoded)
+            if len(matches):
+                row = int(matches[0]) + 1
+            elif not create:
+                return -1
+            elif count >= self.max_symbols:
+                raise ValueError(f"risk ledger full ({self.max_symbols} symbols)")
+            else:
+                row = count + 1
+                self._names[row] = encoded
+                self._header[1] = count + 1
+        self._slots[symbol] = row
+        return row
+    
+    # ========== 읽기 (lock 없음) ==========
+    
+    def read(self, symbol: Optional[str] = None) -> LedgerEntry:
+        """전체(None) 또는 심볼 행 스냅샷"""
+        if symbol is None:
+            return self._read_row(GLOBAL_ROW)
+        row = self.slot(symbol, create=False)
+        return self._read_row(row) if row > 0 else _EMPTY_ENTRY
+    
+    # ========== 쓰기 ==========
+    
+    def add(self, symbol: Optional[str] = None, **deltas: float) -> None:
+        """
+        필드 증감 (symbol=None이면 전체 행)
+        
+        reserved_usd / position_count는 0 미만으로 내려가지 않음.
+        """
+        row = self._rows[GLOBAL_ROW if symbol is None else self.slot(symbol)]
+        indexed = [(_FIELD_INDEX[field], delta) for field, delta in deltas.items()]
+        with self._writing():
+            for index, delta in indexed:
+                row[index] += delta
+            for index in _NON_NEGATIVE:
+                if row[index] < 0.0:
+                    row[index] = 0.0
+    
+    def set_emergency_stop(self, triggered: bool = True) -> None:
+        with self._writing():
+            self._rows[GLOBAL_ROW, _EMERGENCY] = 1.0 if triggered else 0.0
+    
+    def reserve(
+        self,
+        symbol: str,
+        amount_usd: float,
+        max_total_exposure_usd: float = math.inf,
+        max_symbol_exposure_usd: float = math.inf,
+    ) -> bool:
+        """
+        노출 예약 (한도 체크 + 예약을 원자적으로)
+        
+        전체/심볼 (확정 + 예약) 노출이 한도를 넘거나 긴급 중단 상태면 거부.
+        
+        Returns:
+            예약 성공 여부
+        """
+        total = self._rows[GLOBAL_ROW]
+        row = self._rows[self.slot(symbol)]
+        with self._writing():
+            if (
+                total[_EMERGENCY]
+                or total[_EXPOSURE] + total[_RESERVED] + amount_usd > max_total_exposure_usd
+                or row[_EXPOSURE] + row[_RESERVED] + amount_usd > max_symbol_exposure_usd
+            ):
+                total[_REJECTED] += 1
+                row[_REJECTED] += 1
+                return False
+            total[_RESERVED] += amount_usd
+            row[_RESERVED] += amount_usd
+        return True
+    
+    def commit(self, symbol: str, amount_usd: float, reserved: bool = True) -> None:
+        """
+        노출 확정 (예약분 → 확정 노출, 전체 체결 수 증가)
+        
+        Args:
+            reserved: False면 예약 없이 바로 확정 (사후 반영)
+        """
+        total = self._rows[GLOBAL_ROW]
+        row = self._rows[self.slot(symbol)]
+        with self._writing():
+            if reserved:
+                total[_RESERVED] = max(0.0, total[_RESERVED] - amount_usd)
+                row[_RESERVED] = max(0.0, row[_RESERVED] - amount_usd)
+            total[_EXPOSURE] += amount_usd
+            row[_EXPOSURE] += amount_usd
+            total[_EXECUTED] += 1
+    
+    def cancel(self, symbol: str, amount_usd: float) -> None:
+        """예약 취소 (주문 미체결 등), 전체/심볼 행을 한 번의 쓰기로 갱신"""
+        total = self._rows[GLOBAL_ROW]
+        row = self._rows[self.slot(symbol)]
+        with self._writing():
+            total[_RESERVED] = max(0.0, total[_RESERVED] - amount_usd)
+            row[_RESERVED] = max(0.0, row[_RESERVED] - amount_usd)
+    
+    def release(self, symbol: str, amount_usd: float, pnl_usd: float = 0.0) -> None:
+        """노출 해제 (청산), 손실이면 전체 일일 손실 누적"""
+        total = self._rows[GLOBAL_ROW]
+        row = self._rows[self.slot(symbol)]
+        with self._writing():
+            total[_EXPOSURE] -= amount_usd
+            row[_EXPOSURE] -= amount_usd
+            if pnl_usd < 0:
+                total[_DAILY_LOSS] -= pnl_usd
+    
+    # ========== 스냅샷 ==========
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        전체 원장 스냅샷 (seqlock 일관 읽기)
+        
+        Returns:
+            {"global": {...}, "symbols": {symbol: {...}}, "timestamp": float}
+        """
+        def read():
+            count = int(self._header[1])
+            return self._rows[:count + 1].tolist(), self._names[1:count + 1].tolist()
+        
+        rows, names = self._read_consistent(read)
+        return {
+            "global": dict(zip(LEDGER_FIELDS, rows[GLOBAL_ROW])),
+            "symbols": {
+                name.decode(): dict(zip(LEDGER_FIELDS, values))
+                for name, values in zip(names, rows[1:])
+            },
+            "timestamp": time.time(),
+        }
+    
+    def restore(self, snapshot: Dict[str, Any]) -> None:
+        """
+        스냅샷 복원
+        
+        예약 노출은 복원하지 않음 (예약한 워커는 이미 종료).
+        """
+        for symbol in snapshot.get("symbols", {}):
+            self.slot(symbol)
+        with self._writing():
+            self._rows[:] = 0.0
+            for symbol, values in [(None, snapshot.get("global", {}))] + list(snapshot.get("symbols", {}).items()):
+                row = self._rows[GLOBAL_ROW if symbol is None else self._slots[symbol]]
+                for field, value in values.items():
+                    if field in _FIELD_INDEX and field != "reserved_usd":
+                        row[_FIELD_INDEX[field]] = value
+        logger.info(f"[RISK_LEDGER] Restored {len(snapshot.get('symbols', {}))} symbol(s) from snapshot")
+    
+    def save_snapshot(self, state_store: Any, session_id: str) -> bool:
+        """StateStore(Redis)에 스냅샷 저장"""
+        return state_store.save_state_to_redis(session_id, {SNAPSHOT_CATEGORY: self.snapshot()})
+    
+    def load_snapshot(self, state_store: Any, session_id: str) -> bool:
+        """StateStore에서 스냅샷 복원 (없으면 False)"""
+        state = state_store.load_state_from_redis(session_id) or {}
+        snapshot = state.get(SNAPSHOT_CATEGORY)
+        if not snapshot:
+            return False
+        self.restore(snapshot)
+        return True
+    
+    def start_snapshots(self, state_store: Any, session_id: str, interval_seconds: float = 5.0) -> None:
+        """주기 스냅샷 스레드 시작"""
+        if self._snapshot_thread is not None and self._snapshot_thread.is_alive():
+            return
+        self._snapshot_stop.clear()
+        
+        def worker():
+            while not self._snapshot_stop.wait(interval_seconds):
+                try:
+                    self.save_snapshot(state_store, session_id)
+                except Exception as e:
+                    logger.warning(f"[RISK_LEDGER] Snapshot failed: {e}")
+        
+        self._snapshot_thread = threading.Thread(target=worker, name="risk-ledger-snapshot", daemon=True)
+        self._snapshot_thread.start()
+    
+    def stop_snapshots(self, state_store: Optional[Any] = None, session_id: Optional[str] = None) -> None:
+        """주기 스냅샷 중지 (state_store 지정 시 마지막 스냅샷 저장)"""
+        self._snapshot_stop.set()
+        if self._snapshot_thread is not None:
+            self._snapshot_thread.join(timeout=5.0)
+            self._snapshot_thread = None
+        if state_store is not None and session_id is not None:
+            self.save_snapshot(state_store, session_id)
+    
+    # ========== 정리 ==========
+    
+    def close(self) -> None:
+        """매핑 해제 (생성 프로세스면 공유 메모리 삭제)"""
+        if self._shm is None:
+            return
+        self._snapshot_stop.set()
+        self._header = self._rows = self._names = None
+        self._shm.close()
+        if self._owner_pid == os.getpid():
+            try:
+                self._shm.unlink()
+            except FileNotFoundError:
+                pass
+        self._shm = None
+    
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
@@ -9,6 +9,7 @@ VaR, Expected Shortfall, 스트레스 테스트 (고성능 버전).
 특징:
 - NumPy 벡터화 Historical VaR (95%, 99%)
 - NumPy 벡터화 Expected Shortfall
+- 링 버퍼 기반 O(1) 기록 + 증분 추정기 (rolling_stats)
 - 벡터화 스트레스 테스트
 - 유동성 조정 리스크 페널티
 """
@@ -18,6 +19,8 @@ import numpy as np
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 
+from arbitrage.rolling_stats import RollingWindow
+
 logger = logging.getLogger(__name__)
 
 
@@ -45,49 +48,49 @@ class QuantitativeRiskManager:
         """
         self.window_size = window_size
         
-        # NumPy 배열로 히스토리 관리 (벡터화)
-        self.returns_history = np.array([], dtype=np.float32)
-        self.pnl_history = np.array([], dtype=np.float32)
-        self.volatility_history = np.array([], dtype=np.float32)
+        # 고정 용량 링 버퍼 + 증분 추정기로 히스토리 관리 (재할당 없음)
+        self._returns = RollingWindow(window_size, dtype=np.float32, track_order=True)
+        self._pnl = RollingWindow(window_size, dtype=np.float32, track_drawdown=True)
+        self._volatility = RollingWindow(window_size, dtype=np.float32)
+    
+    @property
+    def returns_history(self) -> np.ndarray:
+        """수익률 윈도우 (zero-copy 읽기 전용 뷰)"""
+        return self._returns.values
+    
+    @property
+    def pnl_history(self) -> np.ndarray:
+        """손익 윈도우 (zero-copy 읽기 전용 뷰)"""
+        return self._pnl.values
+    
+    @property
+    def volatility_history(self) -> np.ndarray:
+        """변동성 윈도우 (zero-copy 읽기 전용 뷰)"""
+        return self._volatility.values
     
     def record_return(self, return_pct: float) -> None:
-        """수익률 기록 (벡터화)"""
-        self.returns_history = np.append(self.returns_history, return_pct)
-        if len(self.returns_history) > self.window_size:
-            self.returns_history = self.returns_history[-self.window_size:]
+        """수익률 기록 (O(1) 링 버퍼 + 증분 분위수)"""
+        self._returns.append(return_pct)
     
     def record_returns_batch(self, returns: np.ndarray) -> None:
         """배치 수익률 기록 (벡터화)"""
-        returns = np.asarray(returns, dtype=np.float32)
-        self.returns_history = np.append(self.returns_history, returns)
-        if len(self.returns_history) > self.window_size:
-            self.returns_history = self.returns_history[-self.window_size:]
+        self._returns.extend(returns)
     
     def record_pnl(self, pnl: float) -> None:
-        """손익 기록 (벡터화)"""
-        self.pnl_history = np.append(self.pnl_history, pnl)
-        if len(self.pnl_history) > self.window_size:
-            self.pnl_history = self.pnl_history[-self.window_size:]
+        """손익 기록 (O(1) 링 버퍼)"""
+        self._pnl.append(pnl)
     
     def record_pnl_batch(self, pnl: np.ndarray) -> None:
         """배치 손익 기록 (벡터화)"""
-        pnl = np.asarray(pnl, dtype=np.float32)
-        self.pnl_history = np.append(self.pnl_history, pnl)
-        if len(self.pnl_history) > self.window_size:
-            self.pnl_history = self.pnl_history[-self.window_size:]
+        self._pnl.extend(pnl)
     
     def record_volatility(self, volatility: float) -> None:
-        """변동성 기록 (벡터화)"""
-        self.volatility_history = np.append(self.volatility_history, volatility)
-        if len(self.volatility_history) > self.window_size:
-            self.volatility_history = self.volatility_history[-self.window_size:]
+        """변동성 기록 (O(1) 링 버퍼)"""
+        self._volatility.append(volatility)
     
     def record_volatilities_batch(self, volatilities: np.ndarray) -> None:
         """배치 변동성 기록 (벡터화)"""
-        volatilities = np.asarray(volatilities, dtype=np.float32)
-        self.volatility_history = np.append(self.volatility_history, volatilities)
-        if len(self.volatility_history) > self.window_size:
-            self.volatility_history = self.volatility_history[-self.window_size:]
+        self._volatility.extend(volatilities)
     
     def calculate_var(self, confidence_level: float = 0.95) -> float:
         """
@@ -99,12 +102,11 @@ class QuantitativeRiskManager:
         Returns:
             VaR 값 (음수)
         """
-        if len(self.returns_history) < 10:
+        if len(self._returns) < 10:
             return 0.0
         
-        # NumPy 벡터화 quantile 계산
-        var = float(np.quantile(self.returns_history, 1 - confidence_level))
-        return var
+        # 증분 order-statistics 분위수 (np.quantile 'linear'와 동일)
+        return self._returns.quantile(1 - confidence_level)
     
     def calculate_expected_shortfall(self, confidence_level: float = 0.95) -> float:
         """
@@ -118,20 +120,19 @@ class QuantitativeRiskManager:
         Returns:
             Expected Shortfall 값 (음수)
         """
-        if len(self.returns_history) < 10:
+        if len(self._returns) < 10:
             return 0.0
         
         # VaR 계산
         var = self.calculate_var(confidence_level)
         
-        # 벡터화 필터링
-        tail_returns = self.returns_history[self.returns_history <= var]
+        # VaR 이하 꼬리 평균 (정렬 윈도우의 하위 k개 합)
+        tail_mean = self._returns.tail_mean(var)
         
-        if len(tail_returns) == 0:
+        if tail_mean is None:
             return var
         
-        # 벡터화 평균
-        return float(np.mean(tail_returns))
+        return float(tail_mean)
     
     def calculate_max_drawdown(self) -> float:
         """
@@ -140,19 +141,11 @@ class QuantitativeRiskManager:
         Returns:
             최대 낙폭 (음수)
         """
-        if len(self.pnl_history) < 2:
+        if len(self._pnl) < 2:
             return 0.0
         
-        # 벡터화 누적합
-        cumulative_pnl = np.cumsum(self.pnl_history)
-        
-        # 벡터화 누적 최대값
-        running_max = np.maximum.accumulate(cumulative_pnl)
-        
-        # 벡터화 낙폭 계산
-        drawdown = cumulative_pnl - running_max
-        
-        return float(np.min(drawdown))
+        # 누적 최대값 기반 낙폭 (증분 추적, 윈도우 슬라이딩 시 1회 재계산 후 캐시)
+        return self._pnl.max_drawdown()
     
     def calculate_sharpe_ratio(self, risk_free_rate: float = 0.02) -> float:
         """
@@ -164,12 +157,12 @@ class QuantitativeRiskManager:
         Returns:
             샤프 지수
         """
-        if len(self.returns_history) < 2:
+        if len(self._returns) < 2:
             return 0.0
         
-        # 벡터화 평균, 표준편차
-        mean_return = np.mean(self.returns_history)
-        std_return = np.std(self.returns_history)
+        # 롤링 평균, 표준편차 (O(1))
+        mean_return = self._returns.mean()
+        std_return = self._returns.std()
         
         if std_return == 0:
             return 0.0
@@ -207,11 +200,11 @@ class QuantitativeRiskManager:
         Returns:
             예상 손실 (KRW)
         """
-        if len(self.volatility_history) == 0:
+        if len(self._volatility) == 0:
             return 0.0
         
-        # 벡터화 평균
-        avg_volatility = np.mean(self.volatility_history)
+        # 롤링 평균 (O(1))
+        avg_volatility = self._volatility.mean()
         stressed_volatility = avg_volatility * volatility_multiplier
         
         # 변동성 증가 → 손실 증가
@@ -338,7 +331,7 @@ class QuantitativeRiskManager:
             'expected_shortfall': metrics.expected_shortfall,
             'max_drawdown': metrics.max_drawdown,
             'sharpe_ratio': metrics.sharpe_ratio,
-            'num_returns': len(self.returns_history),
-            'num_pnl': len(self.pnl_history),
-            'num_volatility': len(self.volatility_history)
+            'num_returns': len(self._returns),
+            'num_pnl': len(self._pnl),
+            'num_volatility': len(self._volatility)
         }
@@ -0,0 +1,613 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+High-Performance Rolling Window Statistics (PHASE D15)
+======================================================
+
+고정 용량 NumPy 링 버퍼와 증분 추정기.
+
+특징:
+- O(1) append, 재할당 없는 zero-copy 윈도우 뷰 (미러링 링 버퍼)
+- 롤링 평균/표준편차 (Welford add/remove, O(1))
+- 정확한 롤링 분위수 (블록 정렬 리스트 기반 order-statistics, O(log n + B))
+- 누적 손익 최대 낙폭 (증가 구간 O(1), 슬라이딩 구간은 조회 시 1회 재계산 후 캐시)
+"""
+
+import bisect
+import math
+from typing import List, Optional
+
+import numpy as np
+
+
+class RingBuffer:
+    """
+    고정 용량 NumPy 링 버퍼
+    
+    내부 배열을 2배 크기로 두고 모든 값을 두 위치에 기록(미러링)하여,
+    가장 오래된 값부터 최신 값까지의 윈도우를 항상 연속 슬라이스(zero-copy)로 제공합니다.
+    """
+    
+    def __init__(self, capacity: int, dtype=np.float64):
+        """
+        Args:
+            capacity: 최대 보관 개수
+            dtype: 저장 dtype
+        """
+        if capacity <= 0:
+            raise ValueError(f"capacity must be positive: {capacity}")
+        
+        self.capacity = capacity
+        self._data = np.zeros(2 * capacity, dtype=dtype)
+        self._head = 0  # 다음 기록 위치 (0..capacity-1)
+        self._size = 0
+    
+    @property
+    def dtype(self) -> np.dtype:
+        return self._data.dtype
+    
+    @property
+    def full(self) -> bool:
+        return self._size == self.capacity
+    
+    def __len__(self) -> int:
+        return self._size
+    
+    def append(self, value: float) -> Optional[float]:
+        """
+        값 추가 (O(1))
+        
+        Returns:
+            윈도우에서 밀려난 값 (없으면 None)
+        """
+        evicted = None
+        if self._size == self.capacity:
+            evicted = self._data[self._head].item()
+        else:
+            self._size += 1
+        
+        self._data[self._head] = value
+        self._data[self._head + self.capacity] = value
+        self._head = (self._head + 1) % self.capacity
+        return evicted
+    
+    def extend(self, values: np.ndarray) -> np.ndarray:
+        """
+        배치 추가 (벡터화)
+        
+        Returns:
+            윈도우에서 밀려난 값 배열 (오래된 순, 배치 자체에서 밀려난 값 포함)
+        """
+        values = np.asarray(values, dtype=self._data.dtype).ravel()
+        k = len(values)
+        if k == 0:
+            return values
+        
+        overflow = self._size + k - self.capacity
+        if overflow > 0:
+            evicted = np.concatenate([self.view(), values])[:overflow].copy()
+        else:
+            evicted = values[:0]
+        
+        if k >= self.capacity:
+            tail = values[-self.capacity:]
+            self._data[:self.capacity] = tail
+            self._data[self.capacity:] = tail
+            self._head = 0
+            self._size = self.capacity
+            return evicted
+        
+        idx = (self._head + np.arange(k)) % self.capacity
+        self._data[idx] = values
+        self._data[idx + self.capacity] = values
+        self._head = (self._head + k) % self.capacity
+        self._size = min(self._size + k, self.capacity)
+        return evicted
+    
+    def view(self) -> np.ndarray:
+        """현재 윈도우 (오래된 순) 읽기 전용 zero-copy 뷰"""
+        start = (self._head - self._size) % self.capacity
+        window = self._data[start:start + self._size]
+        window.flags.writeable = False
+        return window
+    
+    def clear(self) -> None:
+        self._head = 0
+        self._size = 0
+
+
+class RollingMoments:
+    """
+    롤링 평균/분산 (Welford add/remove, O(1))
+    
+    모집단 분산 (np.var/np.std 기본값 ddof=0 과 동일).
+    """
+    
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+    
+    def add(self, x: float) -> None:
+        self.count += 1
+        delta = x - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (x - self.mean)
+    
+    def remove(self, x: float) -> None:
+        if self.count <= 1:
+            self.count = 0
+            self.mean = 0.0
+            self._m2 = 0.0
+            return
+        old_mean = self.mean
+        self.count -= 1
+        self.mean = (old_mean * (self.count + 1) - x) / self.count
+        self._m2 -= (x - old_mean) * (x - self.mean)
+        if self._m2 < 0.0:
+            self._m2 = 0.0
+    
+    def reset(self, values: np.ndarray) -> None:
+        """윈도우 전체로부터 정확히 재계산 (벡터화)"""
+        values = np.asarray(values, dtype=np.float64)
+        self.count = len(values)
+        if self.count == 0:
+            self.mean = 0.0
+            self._m2 = 0.0
+            return
+        self.mean = float(np.mean(values))
+        self._m2 = float(np.sum((values - self.mean) ** 2))
+    
+    @property
+    def variance(self) -> float:
+        if self.count == 0:
+            return 0.0
+        return self._m2 / self.count
+    
+    @property
+    def std(self) -> float:
+        return math.sqrt(self.variance)
+
+
+class OrderStatisticWindow:
+    """
+    정렬 윈도우 (정확한 롤링 분위수)
+    
+    크기 load 내외의 정렬된 블록 리스트로 값을 보관합니다 (sortedcontainers 방식).
+    삽입/삭제는 블록 이진 탐색 + 블록 내 insort, k번째 값과 하위 k개 합은
+    블록 길이/합 누적으로 계산합니다.
+    """
+    
+    def __init__(self, load: int = 256):
+        self._load = load
+        self._blocks: List[List[float]] = []
+        self._maxes: List[float] = []
+        self._sums: List[float] = []
+        self._size = 0
+    
+    def __len__(self) -> int:
+        return self._size
+    
+    def insert(self, x: float) -> None:
+        x = float(x)
+        self._size += 1
+        if not self._blocks:
+            self._blocks.append([x])
+            self._maxes.append(x)
+            self._sums.append(x)
+            return
+        
+        pos = bisect.bisect_left(self._maxes, x)
+        if pos == len(self._blocks):
+            pos -= 1
+        block = self._blocks[pos]
+        bisect.insort(block, x)
+        self._maxes[pos] = block[-1]
+        self._sums[pos] += x
+        
+        if len(block) > 2 * self._load:
+            half = block[self._load:]
+            del block[self._load:]
+            self._blocks.insert(pos + 1, half)
+            self._maxes[pos] = block[-1]
+            self._maxes.insert(pos + 1, half[-1])
+            self._sums[pos] = math.fsum(block)
+            self._sums.insert(pos + 1, math.fsum(half))
+    
+    def remove(self, x: float) -> None:
+        x = float(x)
+        pos = bisect.bisect_left(self._maxes, x)
+        if pos == len(self._blocks):
+            raise ValueError(f"value not in window: {x}")
+        block = self._blocks[pos]
+        idx = bisect.bisect_left(block, x)
+        if idx == len(block) or block[idx] != x:
+            raise ValueError(f"value not in window: {x}")
+        
+        del block[idx]
+        self._size -= 1
+        if not block:
+            del self._blocks[pos]
+            del self._maxes[pos]
+            del self._sums[pos]
+            return
+        self._maxes[pos] = block[-1]
+        self._sums[pos] -= x
+    
+    def reset(self, values: np.ndarray) -> None:
+        """윈도우 전체로부터 재구성 (벡터화 정렬)"""
+        ordered = np.sort(np.asarray(values, dtype=np.float64)).tolist()
+        self._blocks = [
+            ordered[i:i + self._load] for i in range(0, len(ordered), self._load)
+        ]
+        self._maxes = [block[-1] for block in self._blocks]
+        self._sums = [math.fsum(block) for block in self._blocks]
+        self._size = len(ordered)
+    
+    def kth(self, k: int) -> float:
+        """k번째(0-based) 작은 값"""
+        if not 0 <= k < self._size:
+            raise IndexError(k)
+        for block in self._blocks:
+            if k < len(block):
+                return block[k]
+            k -= len(block)
+        raise IndexError(k)
+    
+    def count_le(self, x: float) -> int:
+        """x 이하 값 개수"""
+        pos = bisect.bisect_right(self._maxes, x)
+        count = sum(len(block) for block in self._blocks[:pos])
+        if pos < len(self._blocks):
+            count += bisect.bisect_right(self._blocks[pos], x)
+        return count
+    
+    def sum_smallest(self, k: int) -> float:
+        """가장 작은 k개 값의 합"""
+        total = 0.0
+        for block, block_sum in zip(self._blocks, self._sums):
+            if k <= 0:
+                break
+            if k >= len(block):
+                total += block_sum
+                k -= len(block)
+            else:
+                total += math.fsum(block[:k])
+                k = 0
+        return total
+    
+    def quantile(self, q: float, dtype=np.float64) -> float:
+        """
+        분위수 (np.quantile 기본 'linear' 방식과 동일한 보간)
+        
+        Args:
+            q: 분위 (0~1)
+            dtype: 보간 연산 dtype (np.quantile은 입력 배열 dtype으로 보간)
+        """
+        n = self._size
+        if n == 0:
+            raise ValueError("quantile of empty window")
+        virtual_index = n * q + (1 - q) - 1
+        lo = int(math.floor(virtual_index))
+        lo = min(max(lo, 0), n - 1)
+        hi = min(lo + 1, n - 1)
+        t = dtype(virtual_index - lo)
+        a = dtype(self.kth(lo))
+        b = dtype(self.kth(hi))
+        diff = b - a
+        if t >= 0.5:
+            return float(b - diff * (1 - t))
+        return float(a + diff * t)
+
+
+class RollingWindow:
+    """
+    링 버퍼 + 증분 추정기 묶음
+    
+    append/extend 시 밀려난 값을 각 추정기에서 제거하여 모든 통계를 윈도우 기준으로 유지합니다.
+    """
+    
+    # 수치 오차 누적 방지를 위한 정확 재계산 주기 (capacity 배수)
+    REFRESH_FACTOR = 4
+    
+    def __init__(
+        self,
+        capacity: int,
+        dtype=np.float32,
+        track_order: bool = False,
+        track_drawdown: bool = False,
+    ):
+        """
+        Args:
+            capacity: 윈도우 크기
+            dtype: 저장 dtype
+            track_order: 분위수/꼬리 평균 추정기 유지 여부
+            track_drawdown: 누적합 최대 낙폭 추적 여부
+        """
+        self.buffer = RingBuffer(capacity, dtype=dtype)
+        self.moments = RollingMoments()
+        self.order: Optional[OrderStatisticWindow] = (
+            OrderStatisticWindow() if track_order else None
+        )
+        self._track_drawdown = track_drawdown
+        self._cum = 0.0
+        self._peak = 0.0
+        self._max_drawdown = 0.0
+        self._drawdown_dirty = False
+        self._evictions_since_refresh = 0
+    
+    @property
+    def capacity(self) -> int:
+        return self.buffer.capacity
+    
+    @property
+    def values(self) -> np.ndarray:
+        """현재 윈도우 zero-copy 뷰"""
+        return self.buffer.view()
+    
+    def __len__(self) -> int:
+        return len(self.buffer)
+    
+    def append(self, value: float) -> None:
+        """값 추가 (O(1) / 분위수 추적 시 O(log n + B))"""
+        # 저장 dtype으로 반올림된 값 기준으로 추정기 갱신
+        stored = self.buffer.dtype.type(value).item()
+        evicted = self.buffer.append(stored)
+        
+        if evicted is not None:
+            self.moments.remove(evicted)
+            if self.order is not None:
+                self.order.remove(evicted)
+            self._drawdown_dirty = True
+            self._evictions_since_refresh += 1
+        
+        self.moments.add(stored)
+        if self.order is not None:
+            self.order.insert(stored)
+        
+        if self._track_drawdown and not self._drawdown_dirty:
+            self._cum += stored
+            if len(self.buffer) == 1:
+                self._peak = self._cum
+            self._peak = max(self._peak, self._cum)
+            self._max_drawdown = min(self._max_drawdown, self._cum - self._peak)
+        
+        if self._evictions_since_refresh >= self.REFRESH_FACTOR * self.capacity:
+            self.refresh()
+    
+    def extend(self, values: np.ndarray) -> None:
+        """배치 추가 (대량 배치는 벡터화 재구성)"""
+        values = np.asarray(values, dtype=self.buffer.dtype).ravel()
+        if len(values) == 0:
+            return
+        
+        if len(values) >= max(1, self.capacity // 4):
+            self.buffer.extend(values)
+            self.refresh()
+            return
+        
+        for value in values:
+            self.append(value)
+    
+    def refresh(self) -> None:
+        """현재 윈도우로부터 모든 추정기를 정확히 재계산"""
+        window = self.buffer.view()
+        self.moments.reset(window)
+        if self.order is not None:
+            self.order.reset(window)
+        self._drawdown_dirty = True
+        self._evictions_since_refresh = 0
+    
+    def clear(self) -> None:
+        self.buffer.clear()
+        self.refresh()
+        self._cum = 0.0
+        self._peak = 0.0
+        self._max_drawdown = 0.0
+        self._drawdown_dirty = False
+    
+    def mean(self) -> float:
+        return self.moments.mean
+    
+    def std(self) -> float:
+        return self.moments.std
+    
+    def quantile(self, q: float) -> float:
+        if self.order is None:
+            return float(np.quantile(self.values, q))
+        return self.order.quantile(q, dtype=self.buffer.dtype.type)
+    
+    def tail_mean(self, threshold: float) -> Optional[float]:
+        """threshold 이하 값들의 평균 (해당 값 없으면 None)"""
+        if self.order is None:
+            window = self.values
+            tail = window[window <= threshold]
+            return float(np.mean(tail)) if len(tail) else None
+        k = self.order.count_le(threshold)
+        if k == 0:
+            return None
+        return self.order.sum_smallest(k) / k
+    
+    def max_drawdown(self) -> float:
+        """
+        윈도우 누적합 기준 최대 낙폭 (음수 또는 0)
+        
+        윈도우가 차기 전에는 증분 갱신되며, 값이 밀려난 뒤에는 조회 시 1회 벡터화 재계산 후 캐시합니다.
+        """
+        if self._drawdown_dirty:
+            window = self.values
+            if len(window) == 0:
+                self._cum = self._peak = self._max_drawdown = 0.0
+            else:
+                cumulative = np.cumsum(window, dtype=np.float64)
+                running_max = np.maximum.accumulate(cumulative)
+                self._max_drawdown = float(np.min(cumulative - running_max))
+                self._cum = float(cumulative[-1])
+                self._peak = float(running_max[-1])
+            # 다음 eviction 전까지는 다시 증분 갱신 가능
+            self._drawdown_dirty = not self._track_drawdown
+        return self._max_drawdown
+
+
+class RingMatrix:
+    """
+    고정 행 용량 NumPy 링 행렬 (window × columns)
+    
+    RingBuffer와 동일한 미러링 방식으로 최근 행들을 항상 연속 슬라이스로 제공합니다.
+    열 용량은 미리 할당하며, 초과 시에만 2배로 재할당합니다.
+    """
+    
+    def __init__(self, capacity: int, columns: int, dtype=np.float64):
+        """
+        Args:
+            capacity: 최대 보관 행 수
+            columns: 초기 열 용량
+            dtype: 저장 dtype
+        """
+        if capacity <= 0:
+            raise ValueError(f"capacity must be positive: {capacity}")
+        
+        self.capacity = capacity
+        self._data = np.zeros((2 * capacity, max(1, columns)), dtype=dtype)
+        self._head = 0
+        self._size = 0
+    
+    @property
+    def column_capacity(self) -> int:
+        return self._data.shape[1]
+    
+    def __len__(self) -> int:
+        return self._size
+    
+    def ensure_columns(self, columns: int) -> None:
+        """열 용량 확보 (부족 시 2배 재할당, 새 열은 0으로 채움)"""
+        if columns <= self.column_capacity:
+            return
+        new_columns = max(columns, 2 * self.column_capacity)
+        grown = np.zeros((self._data.shape[0], new_columns), dtype=self._data.dtype)
+        grown[:, :self.column_capacity] = self._data
+        self._data = grown
+    
+    def append_row(self, row: np.ndarray) -> Optional[np.ndarray]:
+        """
+        행 추가 (O(columns))
+        
+        Returns:
+            밀려난 행 복사본 (없으면 None)
+        """
+        evicted = None
+        if self._size == self.capacity:
+            evicted = self._data[self._head].copy()
+        else:
+            self._size += 1
+        
+        self._data[self._head] = row
+        self._data[self._head + self.capacity] = row
+        self._head = (self._head + 1) % self.capacity
+        return evicted
+    
+    def view(self, columns: Optional[int] = None) -> np.ndarray:
+        """현재 윈도우 (오래된 행 순) 읽기 전용 zero-copy 뷰"""
+        start = (self._head - self._size) % self.capacity
+        window = self._data[start:start + self._size, :columns]
+        window.flags.writeable = False
+        return window
+    
+    def clear(self) -> None:
+        self._head = 0
+        self._size = 0
+
+
+class RollingCovariance:
+    """
+    롤링 평균/공분산 (rank-1 증분 갱신)
+    
+    행 합 벡터 S와 외적 합 행렬 P = Σ x xᵀ 를 유지하여
+    행 진입/이탈 시 O(k²), 공분산 조회 시 O(k²) (윈도우 길이와 무관).
+    """
+    
+    _RANK2_SIGNS = np.array([[1.0], [-1.0]])
+    
+    def __init__(self, columns: int):
+        self.count = 0
+        self._sum = np.zeros(max(1, columns), dtype=np.float64)
+        self._outer = np.zeros((max(1, columns), max(1, columns)), dtype=np.float64)
+    
+    def ensure_columns(self, columns: int) -> None:
+        """열 용량 확보 (새 열은 0 → 기존 행들의 0-채움과 일치)"""
+        current = len(self._sum)
+        if columns <= current:
+            return
+        new_columns = max(columns, 2 * current)
+        grown_sum = np.zeros(new_columns, dtype=np.float64)
+        grown_sum[:current] = self._sum
+        grown_outer = np.zeros((new_columns, new_columns), dtype=np.float64)
+        grown_outer[:current, :current] = self._outer
+        self._sum = grown_sum
+        self._outer = grown_outer
+    
+    def update(self, added: np.ndarray, removed: Optional[np.ndarray] = None) -> None:
+        """행 1개 진입 (+ 선택적으로 행 1개 이탈) 반영"""
+        added = np.asarray(added, dtype=np.float64)
+        k = len(added)
+        
+        if removed is None:
+            self._sum[:k] += added
+            self._outer[:k, :k] += np.outer(added, added)
+            self.count += 1
+            return
+        
+        # 진입/이탈을 rank-2 갱신 1회 (GEMM)로 처리: P += a aᵀ - r rᵀ
+        removed = np.asarray(removed, dtype=np.float64)[:k]
+        rows = np.stack([added, removed])
+        signed = rows * self._RANK2_SIGNS
+        self._sum[:k] += added - removed
+        self._outer[:k, :k] += signed.T @ rows
+    
+    def reset(self, rows: np.ndarray) -> None:
+        """윈도우 전체로부터 정확히 재계산 (벡터화)"""
+        rows = np.asarray(rows, dtype=np.float64)
+        k = rows.shape[1] if rows.ndim == 2 else 0
+        self._sum[:] = 0.0
+        self._outer[:] = 0.0
+        self.count = rows.shape[0]
+        if self.count and k:
+            self._sum[:k] = rows.sum(axis=0)
+            self._outer[:k, :k] = rows.T @ rows
+    
+    def mean(self, columns: int) -> np.ndarray:
+        if self.count == 0:
+            return np.full(columns, np.nan)
+        return self._sum[:columns] / self.count
+    
+    def covariance(self, columns: int, ddof: int = 1) -> np.ndarray:
+        """표본 공분산 행렬 (pandas DataFrame.cov 와 동일, ddof=1)"""
+        n = self.count
+        if n - ddof <= 0:
+            return np.full((columns, columns), np.nan)
+        s = self._sum[:columns]
+        cov = (self._outer[:columns, :columns] - np.outer(s, s) / n) / (n - ddof)
+        # 대각 성분 상쇄 오차 보정 (음수/극소 분산 → 0)
+        diag = np.diag_indices(columns)
+        scale = np.diag(self._outer[:columns, :columns]) / n
+        cov[diag] = np.where(cov[diag] <= 1e-12 * scale, 0.0, cov[diag])
+        return cov
+    
+    def correlation(self, columns: int, cov: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        상관관계 행렬 (분산 0 인 열은 NaN, pandas DataFrame.corr 와 동일)
+        
+        Args:
+            columns: 활성 열 수
+            cov: 이미 계산된 공분산 행렬 (재사용)
+        """
+        if cov is None:
+            cov = self.covariance(columns)
+        std = np.sqrt(np.diag(cov))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            corr = cov / np.outer(std, std)
+        corr = np.clip(corr, -1.0, 1.0)
+        corr[np.diag_indices(columns)] = 1.0
+        corr[:, std == 0] = np.nan
+        corr[std == 0, :] = np.nan
+        return corr
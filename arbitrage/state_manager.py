@@ -14,12 +14,23 @@ D21: Redis 통합 및 in-memory fallback
 - Redis 미사용 시 in-memory 모드로 자동 fallback
 - Namespace 기반 key 체계화 (live:docker, paper:local, shadow:docker 등)
 - Observability 메트릭 지원
+
+Redis 접근 구조:
+- 도메인별 인덱스 (KEYS 스캔 없음)
+  - index:signal / index:orders / index:positions / index:stats: 살아있는 ID set
+  - index:execution:{symbol}: 실행 결과 sorted set (score = timestamp)
+  - 인덱스 도입 전에 기록된 key는 인덱스별 최초 조회 시 SCAN 1회로 인덱스에 등록 (backfill)
+    완료 후 {index}:backfilled 마커 key를 남겨 이후 프로세스는 SCAN 없이 인덱스만 사용 (1회성 마이그레이션)
+- 다중 key 읽기/쓰기는 pipeline 1회 왕복
+- 타입별 접근자 (_get_hash / _get_string)로 hash/string 이중 조회 제거
+- 변경 알림: 쓰기와 같은 pipeline에서 events 채널로 PUBLISH (도메인 이름)
+  + 같은 프로세스 리스너 콜백 (in-memory 모드 포함)
 """
 
 import logging
 import json
 import os
-from typing import Dict, List, Optional, Any
+from typing import Callable, Dict, List, Optional, Any
 from datetime import datetime
 import redis
 import numpy as np
@@ -72,6 +83,9 @@ class StateManager:
         
         self._redis: Optional[redis.Redis] = None
         self._in_memory_store: Dict[str, Any] = {}  # in-memory fallback
+        self._in_memory_index: Dict[str, Dict[str, float]] = {}  # index key → {member: score}
+        self._backfilled_indexes: set = set()  # SCAN backfill을 마친 인덱스 키
+        self._change_listeners: List[Callable[[str], None]] = []
         self._redis_connected = False
         
         # 자동 연결 시도
@@ -116,38 +130,268 @@ class StateManager:
         # namespace:key_prefix:parts
         return f"{self.namespace}:{self.key_prefix}:{':'.join(parts)}"
     
-    def _set_redis_or_memory(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
-        """Redis 또는 in-memory에 저장"""
+    def _index_key(self, domain: str, *parts: str) -> str:
+        """도메인 인덱스 키 (예: ns:prefix:index:signal)"""
+        return self._get_key("index", domain, *parts)
+    
+    @property
+    def changes_channel(self) -> str:
+        """상태 변경 알림 채널 (메시지 = 도메인 이름)"""
+        return self._get_key("events")
+    
+    def add_change_listener(self, callback: Callable[[str], None]) -> None:
+        """같은 프로세스 내 상태 변경 리스너 등록 (인자: 도메인 이름)"""
+        self._change_listeners.append(callback)
+    
+    def remove_change_listener(self, callback: Callable[[str], None]) -> None:
+        """상태 변경 리스너 해제"""
+        if callback in self._change_listeners:
+            self._change_listeners.remove(callback)
+    
+    def subscribe_changes(self):
+        """
+        다른 프로세스의 상태 변경 구독 (Redis pub/sub)
+        
+        Returns:
+            changes_channel을 구독한 PubSub (Redis 미연결 시 None)
+        """
+        if not (self._redis_connected and self._redis):
+            return None
+        try:
+            pubsub = self._redis.pubsub(ignore_subscribe_messages=True)
+            pubsub.subscribe(self.changes_channel)
+            return pubsub
+        except Exception as e:
+            logger.warning(f"[STATE_MANAGER] Redis subscribe failed: {e}")
+            return None
+    
+    def _notify(self, domain: Optional[str]) -> None:
+        """로컬 리스너에 변경 알림"""
+        if domain is None:
+            return
+        for callback in self._change_listeners:
+            try:
+                callback(domain)
+            except Exception as e:
+                logger.warning(f"[STATE_MANAGER] Change listener error: {e}")
+    
+    def _pipeline(self):
+        """비트랜잭션 pipeline (명령을 모아 1회 왕복으로 전송)"""
+        return self._redis.pipeline(transaction=False)
+    
+    def _memory_index_add(self, index_key: str, member: str, score: float = 0.0) -> None:
+        self._in_memory_index.setdefault(index_key, {})[member] = score
+    
+    def _memory_index_remove(self, index_key: str, *members: str) -> None:
+        index = self._in_memory_index.get(index_key)
+        if index:
+            for member in members:
+                index.pop(member, None)
+    
+    def _backfill_index(self, index_key: str, key_prefix: str, sorted_index: bool = False) -> None:
+        """
+        인덱스 도입 전에 기록된 key를 인덱스에 등록 (1회성 마이그레이션)
+        
+        SCAN 완료 후 영속 마커 key({index_key}:backfilled)를 같은 pipeline에서 기록.
+        마커가 있으면 SCAN 없이 반환 → keyspace 크기와 무관하게 EXISTS 1회 (프로세스당)
+        
+        Args:
+            index_key: 인덱스 키
+            key_prefix: 도메인 key prefix (예: ns:prefix:signal:) — 나머지가 멤버
+            sorted_index: True면 sorted set (멤버를 timestamp score로 사용)
+        """
+        if index_key in self._backfilled_indexes:
+            return
+        marker_key = f"{index_key}:backfilled"
+        if self._redis.exists(marker_key):
+            self._backfilled_indexes.add(index_key)
+            return
+        members = [
+            key[len(key_prefix):]
+            for key in self._redis.scan_iter(match=f"{key_prefix}*", count=1000)
+        ]
+        pipe = self._pipeline()
+        if members:
+            if sorted_index:
+                scores = {}
+                for member in members:
+                    try:
+                        scores[member] = float(member)
+                    except ValueError:
+                        continue
+                if scores:
+                    pipe.zadd(index_key, scores)
+            else:
+                pipe.sadd(index_key, *members)
+        pipe.set(marker_key, datetime.utcnow().isoformat())
+        pipe.execute()
+        if members:
+            logger.info(f"[STATE_MANAGER] Backfilled {len(members)} members into {index_key}")
+        self._backfilled_indexes.add(index_key)
+    
+    def _set_hash(
+        self,
+        key: str,
+        mapping: Dict[str, str],
+        ttl: Optional[int] = None,
+        index_key: Optional[str] = None,
+        member: Optional[str] = None,
+        score: Optional[float] = None,
+        notify: Optional[str] = None,
+    ) -> None:
+        """
+        Hash 저장 (+ 인덱스 등록, 변경 알림) — pipeline 1회 왕복
+        
+        Args:
+            key: hash 키
+            mapping: 필드 딕셔너리
+            ttl: 만료 시간 (초)
+            index_key: 등록할 인덱스 키 (None이면 인덱스 없음)
+            member: 인덱스 멤버 (ID/심볼)
+            score: 지정 시 sorted set 인덱스 (ZADD), 아니면 set 인덱스 (SADD)
+            notify: 변경 알림 도메인 (None이면 알림 없음)
+        """
         if self._redis_connected and self._redis:
             try:
-                if isinstance(value, dict):
-                    self._redis.hset(key, mapping=value)
-                else:
-                    self._redis.set(key, value)
+                pipe = self._pipeline()
+                pipe.hset(key, mapping=mapping)
                 if ttl:
-                    self._redis.expire(key, ttl)
+                    pipe.expire(key, ttl)
+                if index_key is not None:
+                    if score is None:
+                        pipe.sadd(index_key, member)
+                    else:
+                        pipe.zadd(index_key, {member: score})
+                        if ttl:
+                            # 만료된 hash를 가리키는 멤버 정리 (O(log N + M))
+                            pipe.zremrangebyscore(index_key, "-inf", f"({score - ttl}")
+                    if ttl:
+                        pipe.expire(index_key, ttl)
+                if notify is not None:
+                    pipe.publish(self.changes_channel, notify)
+                pipe.execute()
+                self._notify(notify)
+                return
+            except Exception as e:
+                logger.warning(f"[STATE_MANAGER] Redis write failed: {e}. Falling back to in-memory.")
+        self._in_memory_store[key] = mapping
+        if index_key is not None:
+            self._memory_index_add(index_key, member, 0.0 if score is None else score)
+        self._notify(notify)
+    
+    def _set_string(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        """String 저장 (SET EX 단일 명령)"""
+        if self._redis_connected and self._redis:
+            try:
+                self._redis.set(key, value, ex=ttl or None)
+                return
             except Exception as e:
                 logger.warning(f"[STATE_MANAGER] Redis write failed: {e}. Falling back to in-memory.")
-                self._in_memory_store[key] = value
+        self._in_memory_store[key] = value
+    
+    def _get_hash(self, key: str) -> Optional[Dict[str, str]]:
+        """Hash 조회 (HGETALL 1회)"""
+        if self._redis_connected and self._redis:
+            try:
+                return self._redis.hgetall(key) or None
+            except Exception as e:
+                logger.warning(f"[STATE_MANAGER] Redis read failed: {e}. Falling back to in-memory.")
+        return self._in_memory_store.get(key)
+    
+    def _get_string(self, key: str) -> Optional[str]:
+        """String 조회 (GET 1회)"""
+        if self._redis_connected and self._redis:
+            try:
+                return self._redis.get(key)
+            except Exception as e:
+                logger.warning(f"[STATE_MANAGER] Redis read failed: {e}. Falling back to in-memory.")
+        return self._in_memory_store.get(key)
+    
+    def _get_indexed_hashes(
+        self,
+        index_key: str,
+        key_for: Any,
+        limit: Optional[int] = None,
+    ) -> List[tuple]:
+        """
+        인덱스 멤버들의 hash를 일괄 조회
+        
+        set 인덱스는 SMEMBERS, sorted set 인덱스(limit 지정)는 ZREVRANGE로 멤버를 얻고
+        HGETALL을 pipeline으로 묶어 보낸다. 만료되어 비어 있는 hash의 멤버는 인덱스에서 제거.
+        
+        Args:
+            index_key: 인덱스 키
+            key_for: 멤버 → hash 키 변환 함수
+            limit: 지정 시 sorted set 인덱스에서 최신 limit개
+        
+        Returns:
+            [(member, data), ...]
+        """
+        if self._redis_connected and self._redis:
+            try:
+                self._backfill_index(index_key, key_for(""), sorted_index=limit is not None)
+                if limit is None:
+                    members = sorted(self._redis.smembers(index_key))
+                else:
+                    members = self._redis.zrevrange(index_key, 0, limit - 1) if limit > 0 else []
+                if not members:
+                    return []
+                
+                pipe = self._pipeline()
+                for member in members:
+                    pipe.hgetall(key_for(member))
+                rows = pipe.execute()
+                
+                results = [(m, data) for m, data in zip(members, rows) if data]
+                stale = [m for m, data in zip(members, rows) if not data]
+                if stale:
+                    if limit is None:
+                        self._redis.srem(index_key, *stale)
+                    else:
+                        self._redis.zrem(index_key, *stale)
+                return results
+            except Exception as e:
+                logger.warning(f"[STATE_MANAGER] Redis read failed: {e}. Falling back to in-memory.")
+        
+        # in-memory fallback
+        index = self._in_memory_index.get(index_key, {})
+        if limit is None:
+            members = sorted(index)
+        else:
+            members = sorted(index, key=lambda m: (index[m], m), reverse=True)[:max(0, limit)]
+        results = []
+        for member in members:
+            data = self._in_memory_store.get(key_for(member))
+            if data:
+                results.append((member, data))
+        return results
+    
+    def _set_redis_or_memory(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        """Redis 또는 in-memory에 저장 (dict → hash, 그 외 → string)"""
+        if isinstance(value, dict):
+            self._set_hash(key, value, ttl=ttl)
         else:
-            self._in_memory_store[key] = value
+            self._set_string(key, value, ttl=ttl)
     
     def _get_redis_or_memory(self, key: str) -> Optional[Any]:
-        """Redis 또는 in-memory에서 조회"""
+        """
+        Redis 또는 in-memory에서 조회 (타입 미상 key용)
+        
+        HGETALL/GET을 한 pipeline으로 보내 1회 왕복으로 처리 (타입이 다른 쪽은 WRONGTYPE).
+        타입을 아는 경우 _get_hash / _get_string 사용.
+        """
         if self._redis_connected and self._redis:
             try:
-                # 먼저 hash 타입으로 시도
-                data = self._redis.hgetall(key)
-                if data:
+                pipe = self._pipeline()
+                pipe.hgetall(key)
+                pipe.get(key)
+                data, value = pipe.execute(raise_on_error=False)
+                if isinstance(data, dict) and data:
                     return data
-                # hash가 아니면 string 타입으로 시도
-                value = self._redis.get(key)
-                return value
+                return None if isinstance(value, Exception) else value
             except Exception as e:
                 logger.warning(f"[STATE_MANAGER] Redis read failed: {e}. Falling back to in-memory.")
-                return self._in_memory_store.get(key)
-        else:
-            return self._in_memory_store.get(key)
+        return self._in_memory_store.get(key)
     
     # ========== 가격 관리 ==========
     
@@ -168,12 +412,12 @@ class StateManager:
             "mid": str((bid + ask) / 2),
             "timestamp": datetime.utcnow().isoformat()
         }
-        self._set_redis_or_memory(key, data, ttl=60)
+        self._set_hash(key, data, ttl=60)
     
     def get_price(self, exchange: str, symbol: str) -> Optional[Dict]:
         """가격 조회"""
         key = self._get_key("prices", exchange, symbol)
-        return self._get_redis_or_memory(key)
+        return self._get_hash(key)
     
     # ========== 신호 관리 ==========
     
@@ -195,36 +439,26 @@ class StateManager:
             "spread_pct": str(signal.spread_pct),
             "timestamp": signal.timestamp.isoformat()
         }
-        self._set_redis_or_memory(key, data, ttl=300)
+        self._set_hash(
+            key,
+            data,
+            ttl=300,
+            index_key=self._index_key("signal"),
+            member=signal.symbol,
+            notify="signal",
+        )
     
     def get_signal(self, symbol: str) -> Optional[Dict]:
         """신호 조회"""
         key = self._get_key("signal", symbol)
-        return self._get_redis_or_memory(key)
+        return self._get_hash(key)
     
     def get_all_signals(self) -> Dict[str, Dict]:
-        """모든 신호 조회"""
-        if self._redis_connected and self._redis:
-            try:
-                pattern = self._get_key("signal", "*")
-                keys = self._redis.keys(pattern)
-                signals = {}
-                for key in keys:
-                    symbol = key.split(":")[-1]
-                    data = self._redis.hgetall(key)
-                    if data:
-                        signals[symbol] = data
-                return signals
-            except Exception as e:
-                logger.warning(f"[STATE_MANAGER] Redis read failed: {e}. Falling back to in-memory.")
-        
-        # in-memory fallback
-        signals = {}
-        for key, value in self._in_memory_store.items():
-            if "signal" in key:
-                symbol = key.split(":")[-1]
-                signals[symbol] = value
-        return signals
+        """모든 신호 조회 (index:signal)"""
+        rows = self._get_indexed_hashes(
+            self._index_key("signal"), lambda symbol: self._get_key("signal", symbol)
+        )
+        return dict(rows)
     
     # ========== 주문 관리 ==========
     
@@ -249,36 +483,26 @@ class StateManager:
             "created_at": order.created_at.isoformat(),
             "updated_at": order.updated_at.isoformat()
         }
-        self._set_redis_or_memory(key, data, ttl=86400)
+        self._set_hash(
+            key,
+            data,
+            ttl=86400,
+            index_key=self._index_key("orders"),
+            member=order.order_id,
+            notify="orders",
+        )
     
     def get_order(self, order_id: str) -> Optional[Dict]:
         """주문 조회"""
         key = self._get_key("orders", order_id)
-        return self._get_redis_or_memory(key)
+        return self._get_hash(key)
     
     def get_all_orders(self) -> Dict[str, Dict]:
-        """모든 주문 조회"""
-        if self._redis_connected and self._redis:
-            try:
-                pattern = self._get_key("orders", "*")
-                keys = self._redis.keys(pattern)
-                orders = {}
-                for key in keys:
-                    order_id = key.split(":")[-1]
-                    data = self._redis.hgetall(key)
-                    if data:
-                        orders[order_id] = data
-                return orders
-            except Exception as e:
-                logger.warning(f"[STATE_MANAGER] Redis read failed: {e}. Falling back to in-memory.")
-        
-        # in-memory fallback
-        orders = {}
-        for key, value in self._in_memory_store.items():
-            if "orders" in key:
-                order_id = key.split(":")[-1]
-                orders[order_id] = value
-        return orders
+        """모든 주문 조회 (index:orders)"""
+        rows = self._get_indexed_hashes(
+            self._index_key("orders"), lambda order_id: self._get_key("orders", order_id)
+        )
+        return dict(rows)
     
     # ========== 포지션 관리 ==========
     
@@ -300,47 +524,44 @@ class StateManager:
             "pnl_pct": str(position.pnl_pct),
             "timestamp": position.timestamp.isoformat()
         }
-        self._set_redis_or_memory(key, data, ttl=86400)
+        self._set_hash(
+            key,
+            data,
+            ttl=86400,
+            index_key=self._index_key("positions"),
+            member=position.symbol,
+            notify="positions",
+        )
     
     def get_position(self, symbol: str) -> Optional[Dict]:
         """포지션 조회"""
         key = self._get_key("positions", symbol)
-        return self._get_redis_or_memory(key)
+        return self._get_hash(key)
     
     def get_all_positions(self) -> Dict[str, Dict]:
-        """모든 포지션 조회"""
-        if self._redis_connected and self._redis:
-            try:
-                pattern = self._get_key("positions", "*")
-                keys = self._redis.keys(pattern)
-                positions = {}
-                for key in keys:
-                    symbol = key.split(":")[-1]
-                    data = self._redis.hgetall(key)
-                    if data:
-                        positions[symbol] = data
-                return positions
-            except Exception as e:
-                logger.warning(f"[STATE_MANAGER] Redis read failed: {e}. Falling back to in-memory.")
-        
-        # in-memory fallback
-        positions = {}
-        for key, value in self._in_memory_store.items():
-            if "positions" in key:
-                symbol = key.split(":")[-1]
-                positions[symbol] = value
-        return positions
+        """모든 포지션 조회 (index:positions)"""
+        rows = self._get_indexed_hashes(
+            self._index_key("positions"), lambda symbol: self._get_key("positions", symbol)
+        )
+        return dict(rows)
     
     def delete_position(self, symbol: str) -> None:
-        """포지션 삭제"""
+        """포지션 삭제 (인덱스 포함)"""
         key = self._get_key("positions", symbol)
+        index_key = self._index_key("positions")
         if self._redis_connected and self._redis:
             try:
-                self._redis.delete(key)
+                pipe = self._pipeline()
+                pipe.delete(key)
+                pipe.srem(index_key, symbol)
+                pipe.publish(self.changes_channel, "positions")
+                pipe.execute()
             except Exception as e:
                 logger.warning(f"[STATE_MANAGER] Redis delete failed: {e}")
         if key in self._in_memory_store:
             del self._in_memory_store[key]
+        self._memory_index_remove(index_key, symbol)
+        self._notify("positions")
     
     # ========== 실행 결과 관리 ==========
     
@@ -351,7 +572,9 @@ class StateManager:
         Args:
             execution: ExecutionResult 객체
         """
-        key = self._get_key("execution", execution.symbol, str(execution.timestamp.timestamp()))
+        ts = execution.timestamp.timestamp()
+        member = str(ts)
+        key = self._get_key("execution", execution.symbol, member)
         data = {
             "symbol": execution.symbol,
             "buy_order_id": execution.buy_order_id,
@@ -365,7 +588,15 @@ class StateManager:
             "pnl_pct": str(execution.pnl_pct),
             "timestamp": execution.timestamp.isoformat()
         }
-        self._set_redis_or_memory(key, data, ttl=86400)
+        self._set_hash(
+            key,
+            data,
+            ttl=86400,
+            index_key=self._index_key("execution", execution.symbol),
+            member=member,
+            score=ts,
+            notify="executions",
+        )
     
     def get_executions(self, symbol: str, limit: int = 100) -> List[Dict]:
         """
@@ -376,30 +607,14 @@ class StateManager:
             limit: 조회 개수
         
         Returns:
-            실행 결과 리스트
+            실행 결과 리스트 (최신순, index:execution:{symbol} ZREVRANGE)
         """
-        if self._redis_connected and self._redis:
-            try:
-                pattern = self._get_key("execution", symbol, "*")
-                keys = self._redis.keys(pattern)
-                keys = sorted(keys, reverse=True)[:limit]
-                executions = []
-                for key in keys:
-                    data = self._redis.hgetall(key)
-                    if data:
-                        executions.append(data)
-                return executions
-            except Exception as e:
-                logger.warning(f"[STATE_MANAGER] Redis read failed: {e}. Falling back to in-memory.")
-        
-        # in-memory fallback
-        executions = []
-        for key, value in sorted(self._in_memory_store.items(), reverse=True):
-            if f"execution:{symbol}" in key:
-                executions.append(value)
-                if len(executions) >= limit:
-                    break
-        return executions
+        rows = self._get_indexed_hashes(
+            self._index_key("execution", symbol),
+            lambda member: self._get_key("execution", symbol, member),
+            limit=limit,
+        )
+        return [data for _, data in rows]
     
     # ========== 메트릭 관리 ==========
     
@@ -419,12 +634,12 @@ class StateManager:
                 data[k] = str(v)
         
         if data:
-            self._set_redis_or_memory(key, data, ttl=300)
+            self._set_hash(key, data, ttl=300, notify="metrics")
     
     def get_metrics(self) -> Dict[str, float]:
         """메트릭 조회"""
         key = self._get_key("metrics", "live")
-        data = self._get_redis_or_memory(key)
+        data = self._get_hash(key)
         
         if not data:
             return {}
@@ -456,12 +671,12 @@ class StateManager:
             "utilization_rate": str(state.utilization_rate),
             "timestamp": state.timestamp.isoformat()
         }
-        self._set_redis_or_memory(key, data, ttl=300)
+        self._set_hash(key, data, ttl=300, notify="portfolio")
     
     def get_portfolio_state(self) -> Optional[Dict]:
         """포트폴리오 상태 조회"""
         key = self._get_key("portfolio", "state")
-        return self._get_redis_or_memory(key)
+        return self._get_hash(key)
     
     # ========== 통계 관리 ==========
     
@@ -476,7 +691,10 @@ class StateManager:
         key = self._get_key("stats", stat_name)
         if self._redis_connected and self._redis:
             try:
-                self._redis.incrbyfloat(key, value)
+                pipe = self._pipeline()
+                pipe.incrbyfloat(key, value)
+                pipe.sadd(self._index_key("stats"), stat_name)
+                pipe.execute()
             except Exception as e:
                 logger.warning(f"[STATE_MANAGER] Redis incr failed: {e}. Falling back to in-memory.")
                 current = float(self._in_memory_store.get(key, 0))
@@ -499,18 +717,20 @@ class StateManager:
         return float(value) if value else 0.0
     
     def reset_stats(self) -> None:
-        """통계 리셋"""
+        """통계 리셋 (index:stats)"""
+        index_key = self._index_key("stats")
         if self._redis_connected and self._redis:
             try:
-                pattern = self._get_key("stats", "*")
-                keys = self._redis.keys(pattern)
-                if keys:
-                    self._redis.delete(*keys)
+                self._backfill_index(index_key, self._get_key("stats", ""))
+                names = self._redis.smembers(index_key)
+                keys = [self._get_key("stats", name) for name in names]
+                self._redis.delete(index_key, *keys)
             except Exception as e:
                 logger.warning(f"[STATE_MANAGER] Redis delete failed: {e}")
         
         # in-memory 리셋
-        keys_to_delete = [k for k in self._in_memory_store.keys() if "stats" in k]
+        prefix = self._get_key("stats", "")
+        keys_to_delete = [k for k in self._in_memory_store.keys() if k.startswith(prefix)]
         for k in keys_to_delete:
             del self._in_memory_store[k]
     
@@ -524,9 +744,9 @@ class StateManager:
             component: 컴포넌트 이름
         """
         key = self._get_key("heartbeat", component)
-        self._set_redis_or_memory(key, datetime.utcnow().isoformat(), ttl=60)
+        self._set_string(key, datetime.utcnow().isoformat(), ttl=60)
     
     def get_heartbeat(self, component: str) -> Optional[str]:
         """하트비트 조회"""
         key = self._get_key("heartbeat", component)
-        return self._get_redis_or_memory(key)
+        return self._get_string(key)
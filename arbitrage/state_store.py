@@ -160,7 +160,7 @@ class StateStore:
             return self._load_from_db_fallback(session_id)
         
         try:
-            categories = ['session', 'positions', 'metrics', 'risk_guard']
+            categories = ['session', 'positions', 'metrics', 'risk_guard', 'risk_ledger']
             state_data = {}
             
             for category in categories:
@@ -0,0 +1,433 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+D93-1: Tick-to-Order Tracing
+
+시장 데이터 1건이 WS 수신부터 주문 제출까지 어디서 시간을 쓰는지 추적.
+
+구성:
+- TickTrace: tick 1건의 span 목록 (time.monotonic_ns 스탬프). 스냅샷/거래 객체에 실려 전달
+- TickTracer: trace 생성(샘플링) + 종료 시 stage별 지연 히스토그램 기록 + 느린 tick span tree 덤프(JSONL)
+- LoopLagSampler: asyncio 이벤트 루프 지연 샘플러 (sleep 예정 시각 대비 실제 wake-up 지연)
+
+Stage (순서대로 기록):
+    ws.decode          recv 반환 → json.loads
+    ws.parse           → OrderBookSnapshot
+    md.aggregate       provider callback (aggregator / latest snapshot 갱신)
+    runner.queue_wait  → runner가 스냅샷을 가져갈 때까지 (폴링 대기 + 스냅샷 조립)
+    engine.on_snapshot ArbitrageEngine.on_snapshot
+    runner.handoff     → execute_trades 진입 (event loop yield 포함)
+    runner.execute     execute_trades 전체 (하위: risk.check / executor.submit / executor.close)
+
+오버헤드:
+- mark 1회 = monotonic_ns + list append (수백 ns). 히스토그램 기록은 runner가 trace를 종료할 때 1회
+- sample_every로 N건 중 1건만 추적 (미추적 메시지 비용 = 카운터 감소 1회)
+
+Author: arbitrage-lite project
+Date: 2025-12-16 (D93-1)
+"""
+
+import asyncio
+import json
+import logging
+import threading
+import time
+from collections import defaultdict, deque
+from typing import Any, Callable, DefaultDict, Deque, Dict, List, Optional
+
+from arbitrage.perf import DEFAULT_PERCENTILES, LatencyHistogram, SlidingWindowHistogram
+
+logger = logging.getLogger(__name__)
+
+STAGE_WS_DECODE = "ws.decode"
+STAGE_WS_PARSE = "ws.parse"
+STAGE_AGGREGATE = "md.aggregate"
+STAGE_REST_FETCH = "rest.fetch"
+STAGE_QUEUE_WAIT = "runner.queue_wait"
+STAGE_ENGINE = "engine.on_snapshot"
+STAGE_HANDOFF = "runner.handoff"
+STAGE_EXECUTE = "runner.execute"
+STAGE_RISK = "risk.check"
+STAGE_SUBMIT = "executor.submit"
+STAGE_CLOSE = "executor.close"
+
+TICK_TO_DECISION = "tick_to_decision"
+TICK_TO_ORDER = "tick_to_order"
+
+
+class TickTrace:
+    """
+    tick 1건의 span 목록.
+    
+    spans: [name, start_ns, end_ns, parent_index] 리스트
+    - mark(name): 직전 스탬프 → 현재까지를 span 하나로 기록 (순차 stage)
+    - begin(name)/end(index): 하위 span을 감싸는 부모 span (그 사이 mark는 자식)
+    """
+    
+    __slots__ = ("trace_id", "origin_ns", "spans", "tracer", "claimed", "finished", "_cursor_ns", "_open", "_parent")
+    
+    def __init__(self, trace_id: int, origin_ns: int, tracer: Optional["TickTracer"] = None):
+        self.trace_id = trace_id
+        self.origin_ns = origin_ns
+        self.spans: List[List[Any]] = []
+        self.tracer = tracer
+        self.claimed = False
+        self.finished = False
+        self._cursor_ns = origin_ns
+        self._open: List[int] = []
+        self._parent = -1
+    
+    def mark(self, name: str, now_ns: Optional[int] = None) -> None:
+        """직전 스탬프부터 지금까지를 name stage로 기록"""
+        now = time.monotonic_ns() if now_ns is None else now_ns
+        self.spans.append([name, self._cursor_ns, now, self._parent])
+        self._cursor_ns = now
+    
+    def begin(self, name: str, now_ns: Optional[int] = None) -> int:
+        """부모 span 시작 → span index"""
+        now = time.monotonic_ns() if now_ns is None else now_ns
+        index = len(self.spans)
+        self.spans.append([name, now, None, self._parent])
+        self._open.append(index)
+        self._parent = index
+        self._cursor_ns = now
+        return index
+    
+    def end(self, index: int, now_ns: Optional[int] = None) -> None:
+        """부모 span 종료 (안쪽에 열린 span도 함께 종료)"""
+        now = time.monotonic_ns() if now_ns is None else now_ns
+        while self._open:
+            open_index = self._open.pop()
+            self.spans[open_index][2] = now
+            if open_index == index:
+                break
+        self._parent = self._open[-1] if self._open else -1
+        self._cursor_ns = now
+    
+    def claim(self) -> bool:
+        """
+        runner가 처리할 trace로 점유.
+        
+        같은 스냅샷이 다음 루프에서 다시 읽히면(새 데이터 없음) False → 중복 기록 방지
+        """
+        if self.claimed:
+            return False
+        self.claimed = True
+        return True
+    
+    def finish(self, now_ns: Optional[int] = None) -> None:
+        """소속 tracer에 종료 보고 (tracer 없으면 열린 span만 닫음)"""
+        if self.tracer is not None:
+            self.tracer.finish(self, now_ns)
+        elif self._open:
+            self.end(self._open[0], now_ns)
+    
+    @property
+    def end_ns(self) -> int:
+        return self._cursor_ns
+    
+    def duration_ms(self) -> float:
+        """origin → 마지막 스탬프 (ms)"""
+        return (self._cursor_ns - self.origin_ns) / 1e6
+    
+    def to_tree(self) -> Dict[str, Any]:
+        """span tree (덤프용, origin 기준 offset ms)"""
+        nodes = [
+            {
+                "name": name,
+                "start_ms": round((start - self.origin_ns) / 1e6, 4),
+                "duration_ms": round(((end if end is not None else self._cursor_ns) - start) / 1e6, 4),
+                "children": [],
+            }
+            for name, start, end, _ in self.spans
+        ]
+        roots = []
+        for node, (_, _, _, parent) in zip(nodes, self.spans):
+            (nodes[parent]["children"] if parent >= 0 else roots).append(node)
+        return {
+            "trace_id": self.trace_id,
+            "total_ms": round(self.duration_ms(), 4),
+            "spans": roots,
+        }
+
+
+class TickTracer:
+    """
+    TickTrace 생성 + stage별 지연 히스토그램 + 느린 tick 덤프
+    
+    사용 예:
+        tracer = TickTracer(sample_every=64, slow_threshold_ms=50.0, slow_dump_path="logs/d93/slow_ticks.jsonl")
+        ws_adapter.tracer = tracer          # WS 수신 시 trace 시작
+        ...
+        tracer.get_metrics()                # {"trace_engine.on_snapshot_p99_ms": ..., ...}
+    """
+    
+    FLUSH_SIZE = 4096
+    
+    def __init__(
+        self,
+        sample_every: int = 64,
+        slow_threshold_ms: float = 50.0,
+        slow_dump_path: Optional[str] = None,
+        max_slow_dumps_per_minute: int = 60,
+        significant_figures: int = 2,
+        clock_ns: Callable[[], int] = time.monotonic_ns,
+    ):
+        """
+        Args:
+            sample_every: N건 중 1건 추적 (1 = 전부)
+            slow_threshold_ms: 이 이상 걸린 tick은 span tree 덤프
+            slow_dump_path: 덤프 JSONL 경로 (None이면 최근 덤프만 메모리에 보관)
+            max_slow_dumps_per_minute: 분당 최대 덤프 수 (장애 시 디스크 폭주 방지)
+            significant_figures: 히스토그램 유효 자릿수
+            clock_ns: 나노초 단조 시계 (테스트 주입용)
+        """
+        if sample_every < 1:
+            raise ValueError(f"sample_every must be >= 1, got {sample_every}")
+        self.sample_every = sample_every
+        self.slow_threshold_ms = slow_threshold_ms
+        self.slow_dump_path = slow_dump_path
+        self.max_slow_dumps_per_minute = max_slow_dumps_per_minute
+        self.significant_figures = significant_figures
+        self.clock_ns = clock_ns
+        
+        self.histograms: Dict[str, LatencyHistogram] = {}
+        # finish()는 duration만 모아두고 조회/FLUSH_SIZE 도달 시 히스토그램에 일괄 기록
+        self._pending: DefaultDict[str, List[float]] = defaultdict(list)
+        self._pending_count = 0
+        self.recent_slow: Deque[Dict[str, Any]] = deque(maxlen=20)
+        self.started = 0
+        self.finished = 0
+        self.slow_ticks = 0
+        self.slow_dumps = 0
+        self.slow_dumps_dropped = 0
+        # 여러 WS 어댑터 스레드가 공유 → start()의 countdown/id 갱신은 lock으로 보호
+        self._start_lock = threading.Lock()
+        self._countdown = 1
+        self._next_id = 1
+        self._dump_times: Deque[float] = deque()
+        self._dump_file = None
+    
+    def start(self, origin_ns: Optional[int] = None) -> Optional[TickTrace]:
+        """샘플 대상이면 새 TickTrace, 아니면 None (여러 스레드에서 호출 가능)"""
+        with self._start_lock:
+            self._countdown -= 1
+            if self._countdown > 0:
+                return None
+            self._countdown = self.sample_every
+            trace_id = self._next_id
+            self._next_id += 1
+            self.started += 1
+        return TickTrace(trace_id, self.clock_ns() if origin_ns is None else origin_ns, self)
+    
+    def _histogram(self, name: str) -> LatencyHistogram:
+        histogram = self.histograms.get(name)
+        if histogram is None:
+            histogram = LatencyHistogram(self.significant_figures)
+            self.histograms[name] = histogram
+        return histogram
+    
+    def finish(self, trace: TickTrace, now_ns: Optional[int] = None) -> None:
+        """trace 종료 → stage 히스토그램 기록 + 느린 tick 덤프"""
+        if trace.finished:
+            return
+        trace.finished = True
+        if trace._open:
+            trace.end(trace._open[0], now_ns)
+        self.finished += 1
+        
+        pending = self._pending
+        submit_end = None
+        for name, start, end, _ in trace.spans:
+            pending[name].append((end - start) / 1e6)
+            if submit_end is None and name == STAGE_SUBMIT:
+                submit_end = end
+        
+        total_ms = trace.duration_ms()
+        pending[TICK_TO_DECISION].append(total_ms)
+        if submit_end is not None:
+            pending[TICK_TO_ORDER].append((submit_end - trace.origin_ns) / 1e6)
+        self._pending_count += len(trace.spans) + 1
+        if self._pending_count >= self.FLUSH_SIZE:
+            self.flush()
+        
+        if total_ms >= self.slow_threshold_ms:
+            self.slow_ticks += 1
+            self._dump_slow(trace)
+    
+    def _dump_slow(self, trace: TickTrace) -> None:
+        now = time.monotonic()
+        while self._dump_times and now - self._dump_times[0] > 60.0:
+            self._dump_times.popleft()
+        if len(self._dump_times) >= self.max_slow_dumps_per_minute:
+            self.slow_dumps_dropped += 1
+            return
+        self._dump_times.append(now)
+        
+        tree = trace.to_tree()
+        tree["wall_time"] = time.time()
+        self.recent_slow.append(tree)
+        self.slow_dumps += 1
+        
+        if self.slow_dump_path is None:
+            return
+        try:
+            if self._dump_file is None:
+                self._dump_file = open(self.slow_dump_path, "a", encoding="utf-8")
+            self._dump_file.write(json.dumps(tree) + "\n")
+            self._dump_file.flush()
+        except OSError as e:
+            logger.warning(f"[TICK_TRACE] Failed to write slow tick dump: {e}")
+    
+    def flush(self) -> None:
+        """모아둔 duration을 stage 히스토그램에 기록"""
+        for name, values in self._pending.items():
+            if values:
+                self._histogram(name).record_many(values)
+                values.clear()
+        self._pending_count = 0
+    
+    def stage_histograms(self) -> Dict[str, LatencyHistogram]:
+        """stage별 히스토그램 (flush 후)"""
+        self.flush()
+        return self.histograms
+    
+    def percentiles(self, name: str) -> Dict[float, float]:
+        """stage percentile (ms). 기록 없으면 빈 dict"""
+        histogram = self.stage_histograms().get(name)
+        if histogram is None or not histogram.count:
+            return {}
+        return histogram.percentiles(DEFAULT_PERCENTILES)
+    
+    def get_metrics(self) -> Dict[str, float]:
+        """stage별 avg/p50/p99/max (ms) + 카운터 (Watchdog/metrics 병합용 flat dict)"""
+        metrics: Dict[str, float] = {
+            "trace_started": self.started,
+            "trace_finished": self.finished,
+            "trace_slow_ticks": self.slow_ticks,
+            "trace_slow_dumps": self.slow_dumps,
+        }
+        for name, histogram in self.stage_histograms().items():
+            if not histogram.count:
+                continue
+            percentiles = histogram.percentiles((50.0, 99.0))
+            metrics[f"trace_{name}_avg_ms"] = histogram.mean()
+            metrics[f"trace_{name}_p50_ms"] = percentiles[50.0]
+            metrics[f"trace_{name}_p99_ms"] = percentiles[99.0]
+            metrics[f"trace_{name}_max_ms"] = histogram.max
+        return metrics
+    
+    def get_summary(self) -> str:
+        """stage별 요약 (로그용)"""
+        lines = [f"[TICK_TRACE] traces={self.finished} slow={self.slow_ticks}"]
+        for name, histogram in sorted(self.stage_histograms().items()):
+            if not histogram.count:
+                continue
+            percentiles = histogram.percentiles((50.0, 99.0))
+            lines.append(
+                f"  {name:<20} n={histogram.count:<7} avg={histogram.mean():8.3f}ms "
+                f"p50={percentiles[50.0]:8.3f}ms p99={percentiles[99.0]:8.3f}ms max={histogram.max:8.3f}ms"
+            )
+        return "\n".join(lines)
+    
+    def reset(self) -> None:
+        for values in self._pending.values():
+            values.clear()
+        self._pending_count = 0
+        for histogram in self.histograms.values():
+            histogram.reset()
+    
+    def close(self) -> None:
+        if self._dump_file is not None:
+            self._dump_file.close()
+            self._dump_file = None
+
+
+def newest_trace(*snapshots: Any) -> Optional[TickTrace]:
+    """
+    여러 거래소 스냅샷 중 가장 최근에 수신된(아직 점유되지 않은) trace.
+    
+    교차 거래소 스냅샷은 마지막으로 갱신된 쪽이 이번 tick을 유발한 것으로 본다.
+    """
+    newest = None
+    for snapshot in snapshots:
+        trace = snapshot.trace
+        if trace is None or trace.claimed:
+            continue
+        if newest is None or trace.origin_ns > newest.origin_ns:
+            newest = trace
+    return newest
+
+
+class LoopLagSampler:
+    """
+    asyncio 이벤트 루프 지연 샘플러
+    
+    interval마다 sleep 후 깨어난 시각과 예정 시각의 차이를 기록.
+    동기 블로킹 호출(REST, 파일 I/O, 무거운 계산)이 루프를 잡고 있으면 지연이 커진다.
+    """
+    
+    def __init__(
+        self,
+        interval_seconds: float = 0.1,
+        window_seconds: float = 60.0,
+        significant_figures: int = 2,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            interval_seconds: 샘플 간격 (초)
+            window_seconds: 히스토그램 윈도우 (초)
+            significant_figures: 히스토그램 유효 자릿수
+            clock: 시계 (테스트 주입용)
+        """
+        if interval_seconds <= 0:
+            raise ValueError(f"interval_seconds must be > 0, got {interval_seconds}")
+        self.interval_seconds = interval_seconds
+        self.clock = clock
+        self.histogram = SlidingWindowHistogram(
+            window_seconds, significant_figures=significant_figures, clock=clock
+        )
+        self.samples = 0
+        self._task: Optional[asyncio.Task] = None
+    
+    def record(self, lag_ms: float) -> None:
+        """지연 기록 (ms)"""
+        self.histogram.record(lag_ms)
+        self.samples += 1
+    
+    async def _run(self) -> None:
+        interval = self.interval_seconds
+        clock = self.clock
+        expected = clock() + interval
+        while True:
+            await asyncio.sleep(interval)
+            now = clock()
+            self.record(max(0.0, (now - expected) * 1000.0))
+            expected = now + interval
+    
+    def start(self) -> "asyncio.Task":
+        """실행 중인 이벤트 루프에 샘플러 task 등록"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+        return self._task
+    
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+    
+    def get_metrics(self) -> Dict[str, float]:
+        """윈도우 기준 avg/p99/max (ms)"""
+        window = self.histogram.expire()
+        return {
+            "event_loop_lag_avg_ms": window.mean(),
+            "event_loop_lag_p99_ms": window.value_at_percentile(99.0) if window.count else 0.0,
+            "event_loop_lag_max_ms": window.max,
+            "event_loop_lag_samples": self.samples,
+        }
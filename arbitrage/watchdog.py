@@ -7,15 +7,20 @@ Watchdog System (PHASE D11)
 장시간 운용 중 비정상 상황을 감시하고 경고/조치를 수행하는 모듈.
 
 특징:
-- 메트릭 기반 상태 판단
+- 메트릭 기반 상태 판단 (설정 → 컴파일된 rule table)
 - 단계적 경고 (WARN → ERROR → SHUTDOWN)
+- 상태 전이 시에만 AlertEvent 생성
+- RollingWindow: ring buffer 기반 O(1) 집계 (mean, max, rate)
 - 선택적 graceful shutdown 요청
 - AlertSystem과 자연스럽게 연동
 """
 
 import logging
+import math
+import time
+from collections import deque
 from dataclasses import dataclass, field
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Callable, Iterator, Sequence
 from enum import Enum
 
 logger = logging.getLogger(__name__)
@@ -80,19 +85,245 @@ class WatchdogStatus:
     consecutive_errors: int = 0
     should_shutdown: bool = False
     shutdown_reason: Optional[str] = None
+    # 이번 평가에서 발생한 레벨 전이 (복구는 AlertLevel.OK 이벤트)
+    transitions: Sequence[AlertEvent] = ()
+
+
+# rule 집계 방식
+AGG_LAST = "last"              # 현재 값
+AGG_MEAN = "mean"              # 윈도우 평균
+AGG_MAX = "max"                # 윈도우 최대
+AGG_RATE = "rate"              # 윈도우 변화율 (단위/초)
+AGG_TIME_ABOVE = "time_above"  # above_threshold 초과 연속 지속 시간 (초)
+
+# 내부 레벨 코드 (비교 비용 최소화)
+_LEVEL_OK = 0
+_LEVEL_WARN = 1
+_LEVEL_ERROR = 2
+_LEVELS = (AlertLevel.OK, AlertLevel.WARN, AlertLevel.ERROR)
+
+
+class RollingWindow:
+    """
+    고정 크기 ring buffer 롤링 윈도우
+    
+    push / mean / max / rate 모두 O(1) (max는 단조 deque, amortized).
+    """
+    
+    __slots__ = ("size", "_values", "_timestamps", "_start", "_count", "_sum", "_max_queue", "_seq")
+    
+    def __init__(self, size: int = 100):
+        """
+        Args:
+            size: 보관 샘플 수
+        """
+        if size < 1:
+            raise ValueError(f"size must be >= 1, got {size}")
+        self.size = size
+        self._values: List[float] = [0.0] * size
+        self._timestamps: List[float] = [0.0] * size
+        self._start = 0
+        self._count = 0
+        self._sum = 0.0
+        self._max_queue: deque = deque()  # (seq, value), value 단조 감소
+        self._seq = 0
+    
+    def push(self, value: float, ts: float = 0.0) -> None:
+        """샘플 추가 (가장 오래된 샘플 자동 제거)"""
+        size = self.size
+        if self._count == size:
+            self._sum -= self._values[self._start]
+            index = self._start
+            self._start = (self._start + 1) % size
+        else:
+            index = (self._start + self._count) % size
+            self._count += 1
+        self._values[index] = value
+        self._timestamps[index] = ts
+        self._sum += value
+        
+        seq = self._seq
+        self._seq = seq + 1
+        queue = self._max_queue
+        while queue and queue[-1][1] <= value:
+            queue.pop()
+        queue.append((seq, value))
+        if queue[0][0] <= seq - size:
+            queue.popleft()
+    
+    def __len__(self) -> int:
+        return self._count
+    
+    def __iter__(self) -> Iterator[float]:
+        """오래된 순서로 순회"""
+        for offset in range(self._count):
+            yield self._values[(self._start + offset) % self.size]
+    
+    @property
+    def last(self) -> float:
+        if not self._count:
+            return 0.0
+        return self._values[(self._start + self._count - 1) % self.size]
+    
+    def mean(self) -> float:
+        """윈도우 평균"""
+        return self._sum / self._count if self._count else 0.0
+    
+    def max(self) -> float:
+        """윈도우 최대"""
+        return self._max_queue[0][1] if self._max_queue else 0.0
+    
+    def rate(self) -> float:
+        """윈도우 처음~마지막 변화율 (단위/초)"""
+        if self._count < 2:
+            return 0.0
+        newest = (self._start + self._count - 1) % self.size
+        elapsed = self._timestamps[newest] - self._timestamps[self._start]
+        if elapsed <= 0:
+            return 0.0
+        return (self._values[newest] - self._values[self._start]) / elapsed
+
+
+@dataclass(frozen=True)
+class WatchdogRule:
+    """
+    워치독 rule
+    
+    message 템플릿은 {value}, {threshold}로 포맷되며 상태 전이 시에만 렌더링.
+    """
+    metric_name: str
+    component: str
+    warn_threshold: Optional[float] = None
+    error_threshold: Optional[float] = None
+    warn_message: str = "{metric} warning: {value:.1f} > {threshold}"
+    error_message: str = "{metric} critical: {value:.1f} > {threshold}"
+    aggregate: str = AGG_LAST
+    window_size: int = 100
+    above_threshold: float = 0.0  # AGG_TIME_ABOVE 기준값
+
+
+def compile_rules(config: WatchdogConfig) -> List[WatchdogRule]:
+    """WatchdogConfig → 기본 rule table"""
+    return [
+        WatchdogRule(
+            metric_name="ws_lag_ms",
+            component="WebSocket",
+            warn_threshold=config.ws_lag_warn_threshold_ms,
+            error_threshold=config.max_ws_lag_ms,
+            warn_message="WS lag warning: {value:.1f}ms > {threshold}ms",
+            error_message="WS lag critical: {value:.1f}ms > {threshold}ms",
+        ),
+        WatchdogRule(
+            metric_name="redis_heartbeat_age_ms",
+            component="Redis",
+            warn_threshold=config.redis_heartbeat_warn_threshold_ms,
+            error_threshold=config.max_redis_heartbeat_age_ms,
+            warn_message="Redis heartbeat aging: {value:.1f}ms > {threshold}ms",
+            error_message="Redis heartbeat stale: {value:.1f}ms > {threshold}ms",
+        ),
+        WatchdogRule(
+            metric_name="loop_latency_ms",
+            component="MainLoop",
+            warn_threshold=config.loop_latency_warn_threshold_ms,
+            error_threshold=config.max_loop_latency_ms,
+            warn_message="Loop latency warning: {value:.1f}ms > {threshold}ms",
+            error_message="Loop latency critical: {value:.1f}ms > {threshold}ms",
+        ),
+        WatchdogRule(
+            metric_name="safety_rejections_count",
+            component="Safety",
+            warn_threshold=config.max_safety_rejections_per_minute,
+            warn_message="Safety rejections high: {value} > {threshold}",
+        ),
+    ]
+
+
+class _RuleState:
+    """rule별 평가 상태 (현재 레벨, 활성 경고, 롤링 윈도우)"""
+    
+    __slots__ = (
+        "rule", "metric_name", "aggregated", "warn", "error", "floor",
+        "level", "alert", "window", "above_since",
+    )
+    
+    def __init__(self, rule: WatchdogRule):
+        self.rule = rule
+        self.metric_name = rule.metric_name
+        self.aggregated = rule.aggregate != AGG_LAST
+        self.warn = math.inf if rule.warn_threshold is None else rule.warn_threshold
+        self.error = math.inf if rule.error_threshold is None else rule.error_threshold
+        self.floor = min(self.warn, self.error)  # 이하이면 OK (정상 경로 비교 1회)
+        self.level = _LEVEL_OK
+        self.alert: Optional[AlertEvent] = None
+        self.window = RollingWindow(rule.window_size) if rule.aggregate in (AGG_MEAN, AGG_MAX, AGG_RATE) else None
+        self.above_since: Optional[float] = None
+    
+    def aggregate(self, value: float, now: float) -> float:
+        """집계 값 계산 (AGG_LAST 외)"""
+        aggregate = self.rule.aggregate
+        if aggregate == AGG_TIME_ABOVE:
+            if value > self.rule.above_threshold:
+                if self.above_since is None:
+                    self.above_since = now
+                return now - self.above_since
+            self.above_since = None
+            return 0.0
+        
+        window = self.window
+        window.push(value, now)
+        if aggregate == AGG_MEAN:
+            return window.mean()
+        if aggregate == AGG_MAX:
+            return window.max()
+        return window.rate()
+    
+    def materialize(self, level: int, value: float) -> AlertEvent:
+        """전이 시 AlertEvent 생성 (OK 전이는 복구 이벤트)"""
+        rule = self.rule
+        if level == _LEVEL_OK:
+            return AlertEvent(
+                level=AlertLevel.OK,
+                component=rule.component,
+                message=f"{rule.metric_name} recovered: {value}",
+                metric_name=rule.metric_name,
+                metric_value=float(value),
+            )
+        
+        threshold = rule.error_threshold if level == _LEVEL_ERROR else rule.warn_threshold
+        template = rule.error_message if level == _LEVEL_ERROR else rule.warn_message
+        return AlertEvent(
+            level=_LEVELS[level],
+            component=rule.component,
+            message=template.format(value=value, threshold=threshold, metric=rule.metric_name),
+            metric_name=rule.metric_name,
+            metric_value=float(value),
+            threshold=float(threshold),
+        )
 
 
 class Watchdog:
     """워치독 시스템"""
     
-    def __init__(self, config: Optional[WatchdogConfig] = None):
+    def __init__(
+        self,
+        config: Optional[WatchdogConfig] = None,
+        extra_rules: Optional[Sequence[WatchdogRule]] = None,
+        clock: Callable[[], float] = time.time,
+    ):
         """
         Args:
             config: WatchdogConfig 인스턴스
+            extra_rules: 기본 rule table에 추가할 rule (집계 rule 등)
+            clock: 시계 (테스트/리플레이 주입용)
         """
         self.config = config or WatchdogConfig()
+        self.clock = clock
         self.status = WatchdogStatus()
-        self.metrics_history: Dict[str, List[float]] = {}
+        self.metrics_history: Dict[str, RollingWindow] = {}
+        self._extra_rules: List[WatchdogRule] = list(extra_rules or [])
+        self._rule_states: List[_RuleState] = []
+        self._active_alerts: List[AlertEvent] = []
+        self.recompile()
         self.rejection_count_per_minute = 0
         self.error_count_per_minute = 0
         self.last_minute_reset_ts = 0.0
@@ -103,6 +334,23 @@ class Watchdog:
         self.last_critical_ts = 0.0         # 마지막 CRITICAL 시간
         self.consecutive_warn_count = 0     # 연속 WARN 경고 수
     
+    @property
+    def rules(self) -> List[WatchdogRule]:
+        """현재 rule table"""
+        return [state.rule for state in self._rule_states]
+    
+    def recompile(self) -> None:
+        """설정 변경 후 rule table 재컴파일 (rule 상태 초기화)"""
+        self._rule_states = [_RuleState(rule) for rule in compile_rules(self.config) + self._extra_rules]
+        self._needs_clock = any(state.rule.aggregate != AGG_LAST for state in self._rule_states)
+        self._active_alerts = []
+    
+    def add_rule(self, rule: WatchdogRule) -> None:
+        """rule 추가 (기존 rule 상태는 유지)"""
+        self._extra_rules.append(rule)
+        self._rule_states.append(_RuleState(rule))
+        self._needs_clock = self._needs_clock or rule.aggregate != AGG_LAST
+    
     def update_metrics(self, metrics: Dict[str, Any]) -> None:
         """
         메트릭 업데이트
@@ -110,9 +358,7 @@ class Watchdog:
         Args:
             metrics: MetricsCollector.get_all_metrics() 결과
         """
-        import time
-        
-        current_ts = time.time()
+        current_ts = self.clock()
         
         # 분 단위 카운터 리셋
         if current_ts - self.last_minute_reset_ts > 60:
@@ -120,21 +366,116 @@ class Watchdog:
             self.error_count_per_minute = 0
             self.last_minute_reset_ts = current_ts
         
-        # 메트릭 히스토리 저장
+        # 메트릭 히스토리 저장 (최근 100개, ring buffer)
+        history = self.metrics_history
         for key, value in metrics.items():
             if isinstance(value, (int, float)):
-                if key not in self.metrics_history:
-                    self.metrics_history[key] = []
-                self.metrics_history[key].append(value)
-                # 최근 100개만 보관
-                if len(self.metrics_history[key]) > 100:
-                    self.metrics_history[key].pop(0)
+                window = history.get(key)
+                if window is None:
+                    window = history[key] = RollingWindow(100)
+                window.push(value, current_ts)
         
         self.status.last_check_ts = current_ts
     
-    def evaluate(self, metrics: Dict[str, Any]) -> WatchdogStatus:
+    def evaluate(self, metrics: Dict[str, Any], now: Optional[float] = None) -> WatchdogStatus:
+        """
+        현재 상태 평가 (compiled rule table)
+        
+        rule 레벨이 바뀔 때만 AlertEvent를 생성하고, 유지 중인 경고는
+        전이 시점 이벤트를 재사용한다. 결과는 evaluate_full()과 동일.
+        
+        Args:
+            metrics: MetricsCollector.get_all_metrics() 결과
+            now: 평가 시각 (None = clock(), 집계 rule에서만 사용)
+        
+        Returns:
+            WatchdogStatus
+        """
+        status = self.status
+        if now is None and self._needs_clock:
+            now = self.clock()
+        
+        transitions = None
+        error_count = 0
+        warn_count = 0
+        get = metrics.get
+        for state in self._rule_states:
+            value = get(state.metric_name, 0.0)
+            if state.aggregated:
+                value = state.aggregate(value, now)
+            
+            if not value > state.floor:
+                if not state.level:
+                    continue
+                level = _LEVEL_OK
+            elif value > state.error:
+                level = _LEVEL_ERROR
+                error_count += 1
+            elif value > state.warn:
+                level = _LEVEL_WARN
+                warn_count += 1
+            else:
+                level = _LEVEL_OK
+            
+            if level != state.level:
+                event = state.materialize(level, value)
+                state.level = level
+                state.alert = event if level != _LEVEL_OK else None
+                if transitions is None:
+                    transitions = []
+                transitions.append(event)
+        
+        if transitions is not None:
+            self._active_alerts = [state.alert for state in self._rule_states if state.alert is not None]
+            status.transitions = transitions
+        elif status.transitions:
+            status.transitions = ()
+        status.alerts = self._active_alerts
+        status.is_healthy = not error_count
+        
+        if error_count:
+            status.consecutive_errors += 1
+            self.error_cycle_count += 1
+            self.warn_cycle_count = 0  # ERROR 발생 시 WARN 카운트 리셋
+            
+            # D12: ERROR 상태 자동 리셋 (error_reset_cycles 후)
+            if self.error_cycle_count >= self.config.error_reset_cycles:
+                self.soft_reset()
+            
+            # 연속 ERROR 3회 이상 → CRITICAL (graceful shutdown 요청)
+            if status.consecutive_errors >= 3:
+                status.should_shutdown = True
+                status.shutdown_reason = f"Consecutive errors: {status.consecutive_errors}"
+                status.alerts = self._active_alerts + [AlertEvent(
+                    level=AlertLevel.CRITICAL,
+                    component="Watchdog",
+                    message=f"Requesting graceful shutdown: {status.shutdown_reason}"
+                )]
+                # CRITICAL 시간 기록
+                self.last_critical_ts = self.clock() if now is None else now
+        elif warn_count:
+            # WARN만 있는 경우
+            self.warn_cycle_count += 1
+            self.error_cycle_count = 0  # WARN 상태에서는 ERROR 카운트 리셋
+            self.consecutive_warn_count = warn_count
+            
+            # D12: WARN 상태 자동 리셋 (warn_reset_cycles 후)
+            if self.warn_cycle_count >= self.config.warn_reset_cycles:
+                self.soft_reset()
+        else:
+            # 정상 상태
+            status.consecutive_errors = 0
+            self.warn_cycle_count = 0
+            self.error_cycle_count = 0
+            self.consecutive_warn_count = 0
+        
+        return status
+    
+    def evaluate_full(self, metrics: Dict[str, Any]) -> WatchdogStatus:
         """
-        현재 상태 평가
+        현재 상태 평가 (기존 if/elif 체인, 리플레이 비교용 기준 경로)
+        
+        rule 상태를 갱신하지 않으므로 evaluate()와 같은 인스턴스에서 섞어 쓰지 않는다.
         
         Args:
             metrics: MetricsCollector.get_all_metrics() 결과
@@ -247,8 +588,7 @@ class Watchdog:
                     message=f"Requesting graceful shutdown: {self.status.shutdown_reason}"
                 ))
                 # CRITICAL 시간 기록
-                import time
-                self.last_critical_ts = time.time()
+                self.last_critical_ts = self.clock()
         elif warn_alerts:
             # WARN만 있는 경우
             self.warn_cycle_count += 1
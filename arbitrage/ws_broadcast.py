@@ -0,0 +1,408 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+WebSocket Broadcast (D16 API / D15 Dashboard)
+=============================================
+
+Push 기반 WebSocket fan-out:
+- BroadcastHub: 프레임을 한 번 직렬화하여 모든 구독자 큐에 분배
+  - 클라이언트별 bounded queue + writer task (동시 전송)
+  - 큐가 가득 찬 느린 클라이언트는 drop
+  - key별 최신 프레임(snapshot)을 신규 구독자에게 즉시 전달
+- StatePublisher: StateManager 변경 알림(pub/sub + 로컬 리스너)을 받아
+  상태를 한 번만 읽고 diff를 계산하여 허브에 발행
+
+백엔드 조회 횟수는 접속한 뷰어 수와 무관하게 일정.
+"""
+
+import asyncio
+import json
+import logging
+import threading
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+# 클라이언트별 최대 대기 프레임 수
+DEFAULT_MAX_QUEUE = 64
+
+# drop 시 close code (1008 = policy violation)
+SLOW_CONSUMER_CLOSE_CODE = 1008
+
+
+def encode_frame(payload: Dict[str, Any]) -> str:
+    """프레임 직렬화 (구독자 수와 무관하게 1회)"""
+    return json.dumps(payload, default=str, separators=(",", ":"))
+
+
+class BroadcastSubscriber:
+    """구독자 (WebSocket 1개 + bounded queue)"""
+    
+    def __init__(self, websocket: Any, max_queue: int = DEFAULT_MAX_QUEUE):
+        self.websocket = websocket
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue)
+        self.dropped = False
+        self._writer: Optional[asyncio.Task] = None
+    
+    def offer(self, frame: str) -> bool:
+        """
+        프레임 적재 (블로킹 없음)
+        
+        Returns:
+            False면 큐가 가득 참 (느린 클라이언트)
+        """
+        try:
+            self.queue.put_nowait(frame)
+            return True
+        except asyncio.QueueFull:
+            return False
+    
+    def drop(self) -> None:
+        """느린 클라이언트 연결 종료 예약 (writer 취소 → close)"""
+        self.dropped = True
+        if self._writer is not None:
+            self._writer.cancel()
+    
+    async def _write_loop(self) -> None:
+        """큐 → 전송. 종료 시 연결을 닫아 reader(수신 루프)도 끝나게 한다"""
+        code = 1000
+        try:
+            while True:
+                frame = await self.queue.get()
+                await self.websocket.send_text(frame)
+        except asyncio.CancelledError:
+            if not self.dropped:
+                raise
+            code = SLOW_CONSUMER_CLOSE_CODE
+        except Exception as e:
+            logger.debug(f"[WS_BROADCAST] Send failed: {e!r}")
+        try:
+            await self.websocket.close(code=code)
+        except Exception:
+            pass
+
+
+class BroadcastHub:
+    """
+    WebSocket fan-out 허브
+    
+    publish()는 동기 함수로, 이미 직렬화된 프레임을 각 구독자 큐에 넣기만 한다.
+    실제 전송은 구독자별 writer task가 병렬로 수행하므로 느린 클라이언트가
+    다른 클라이언트나 발행자를 막지 않는다.
+    """
+    
+    def __init__(self, name: str = "default", max_queue: int = DEFAULT_MAX_QUEUE):
+        """
+        Args:
+            name: 허브 이름 (로그용)
+            max_queue: 클라이언트별 최대 대기 프레임 수
+        """
+        self.name = name
+        self.max_queue = max_queue
+        self._subscribers: Set[BroadcastSubscriber] = set()
+        self._snapshot: Dict[str, str] = {}
+        
+        self.frames_published = 0
+        self.clients_dropped = 0
+    
+    @property
+    def client_count(self) -> int:
+        return len(self._subscribers)
+    
+    @property
+    def websockets(self) -> List[Any]:
+        return [subscriber.websocket for subscriber in self._subscribers]
+    
+    def latest(self, key: str) -> Optional[str]:
+        """key의 최신 프레임"""
+        return self._snapshot.get(key)
+    
+    def publish(self, frame: str, key: Optional[str] = None) -> None:
+        """
+        프레임 브로드캐스트
+        
+        Args:
+            frame: 직렬화된 프레임
+            key: 지정 시 snapshot으로 보관 (신규 구독자에게 전달)
+        """
+        if key is not None:
+            self._snapshot[key] = frame
+        self.frames_published += 1
+        
+        for subscriber in list(self._subscribers):
+            self.send_to(subscriber, frame)
+    
+    def send_to(self, subscriber: BroadcastSubscriber, frame: str) -> bool:
+        """단일 구독자에게 프레임 전송 예약 (큐가 가득 차면 drop)"""
+        if subscriber.offer(frame):
+            return True
+        self._drop(subscriber)
+        return False
+    
+    def publish_json(self, payload: Dict[str, Any], key: Optional[str] = None) -> str:
+        """payload를 1회 직렬화하여 브로드캐스트"""
+        frame = encode_frame(payload)
+        self.publish(frame, key=key)
+        return frame
+    
+    def forget(self, key: str) -> None:
+        """snapshot에서 key 제거"""
+        self._snapshot.pop(key, None)
+    
+    def subscribe(self, websocket: Any) -> BroadcastSubscriber:
+        """
+        구독자 등록 (현재 snapshot 프레임 선적재)
+        
+        snapshot key 수가 max_queue보다 많아도 초기 상태가 잘리지 않도록
+        큐 크기를 snapshot 크기만큼 늘린다 (실시간 프레임 여유는 max_queue 유지).
+        """
+        frames = list(self._snapshot.values())
+        subscriber = BroadcastSubscriber(websocket, self.max_queue + len(frames))
+        for frame in frames:
+            subscriber.offer(frame)
+        self._subscribers.add(subscriber)
+        return subscriber
+    
+    def unsubscribe(self, subscriber: BroadcastSubscriber) -> None:
+        self._subscribers.discard(subscriber)
+    
+    async def serve(
+        self,
+        websocket: Any,
+        on_message: Optional[Callable[[BroadcastSubscriber, str], None]] = None,
+    ) -> None:
+        """
+        accept된 WebSocket을 구독자로 등록하고 연결이 끝날 때까지 서비스
+        
+        전송은 구독자별 writer task가 담당하고, 이 코루틴은 수신 루프를 돌며
+        on_message 호출과 연결 종료 감지를 맡는다.
+        
+        Args:
+            websocket: accept된 WebSocket
+            on_message: 클라이언트 메시지 콜백 (subscriber, text)
+        """
+        subscriber = self.subscribe(websocket)
+        subscriber._writer = asyncio.create_task(subscriber._write_loop())
+        try:
+            while True:
+                message = await websocket.receive_text()
+                if on_message is not None:
+                    on_message(subscriber, message)
+        except Exception as e:
+            # WebSocketDisconnect / 서버 측 close 이후 수신 등
+            logger.debug(f"[WS_BROADCAST] {self.name} client closed: {e!r}")
+        finally:
+            subscriber._writer.cancel()
+            self.unsubscribe(subscriber)
+    
+    async def close(self) -> None:
+        """모든 구독자 종료"""
+        for subscriber in list(self._subscribers):
+            subscriber.drop()
+    
+    def _drop(self, subscriber: BroadcastSubscriber) -> None:
+        if subscriber.dropped:
+            return
+        logger.warning(f"[WS_BROADCAST] {self.name}: dropping slow client (queue full)")
+        self._subscribers.discard(subscriber)
+        self.clients_dropped += 1
+        subscriber.drop()
+    
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "clients": self.client_count,
+            "frames_published": self.frames_published,
+            "clients_dropped": self.clients_dropped,
+            "snapshot_keys": len(self._snapshot),
+        }
+
+
+class StatePublisher:
+    """
+    StateManager → BroadcastHub 단일 발행자
+    
+    변경 알림이 오면 해당 도메인만 한 번 읽고, 이전 값과 비교하여 바뀐 부분만 발행.
+    알림 누락에 대비해 resync_interval마다 전체 도메인을 다시 읽는다.
+    
+    프레임 형식은 기존 /ws/metrics, /ws/signals와 동일.
+    """
+    
+    METRIC_DOMAINS = frozenset({"metrics", "portfolio"})
+    SIGNAL_DOMAINS = frozenset({"signal"})
+    ALL_DOMAINS = METRIC_DOMAINS | SIGNAL_DOMAINS
+    
+    def __init__(
+        self,
+        state_manager: Any,
+        metrics_hub: BroadcastHub,
+        signals_hub: BroadcastHub,
+        resync_interval: float = 5.0,
+        coalesce_interval: float = 0.05,
+    ):
+        """
+        Args:
+            state_manager: StateManager
+            metrics_hub: /ws/metrics 허브
+            signals_hub: /ws/signals 허브
+            resync_interval: 알림 없이 전체 재조회하는 주기 (초)
+            coalesce_interval: 알림 burst를 묶는 대기 시간 (초)
+        """
+        self.state_manager = state_manager
+        self.metrics_hub = metrics_hub
+        self.signals_hub = signals_hub
+        self.resync_interval = resync_interval
+        self.coalesce_interval = coalesce_interval
+        
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._event: Optional[asyncio.Event] = None
+        self._dirty: Set[str] = set()
+        self._task: Optional[asyncio.Task] = None
+        self._listener_thread: Optional[threading.Thread] = None
+        self._stopping = threading.Event()
+        
+        self._last_metrics: Optional[tuple] = None
+        self._last_signals: Dict[str, Dict] = {}
+        
+        self.refresh_count = 0
+    
+    async def start(self) -> None:
+        """발행 task 시작 (실행 중인 event loop 필요)"""
+        if self._task is not None:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._event = asyncio.Event()
+        self._stopping.clear()
+        
+        self.state_manager.add_change_listener(self._on_change)
+        pubsub = self.state_manager.subscribe_changes()
+        if pubsub is not None:
+            self._listener_thread = threading.Thread(
+                target=self._listen, args=(pubsub,), name="state-publisher", daemon=True
+            )
+            self._listener_thread.start()
+        
+        self._dirty = set(self.ALL_DOMAINS)
+        self._event.set()
+        self._task = asyncio.create_task(self._run())
+    
+    async def stop(self) -> None:
+        """발행 task 종료"""
+        self._stopping.set()
+        self.state_manager.remove_change_listener(self._on_change)
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        if self._listener_thread is not None:
+            self._listener_thread.join(timeout=2.0)
+            self._listener_thread = None
+    
+    def _on_change(self, domain: Any) -> None:
+        """변경 알림 (임의 스레드에서 호출 가능)"""
+        if isinstance(domain, bytes):
+            domain = domain.decode()
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            return
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            self._mark(domain)
+        else:
+            loop.call_soon_threadsafe(self._mark, domain)
+    
+    def _mark(self, domain: str) -> None:
+        if domain in self.ALL_DOMAINS:
+            self._dirty.add(domain)
+            self._event.set()
+    
+    def _listen(self, pubsub: Any) -> None:
+        """Redis pub/sub 수신 스레드"""
+        try:
+            while not self._stopping.is_set():
+                message = pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+                if message and message.get("type") == "message":
+                    self._on_change(message.get("data"))
+        except Exception as e:
+            logger.warning(f"[WS_BROADCAST] Pub/sub listener stopped: {e}")
+        finally:
+            try:
+                pubsub.close()
+            except Exception:
+                pass
+    
+    async def _run(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._event.wait(), timeout=self.resync_interval)
+                if self.coalesce_interval > 0:
+                    await asyncio.sleep(self.coalesce_interval)
+            except asyncio.TimeoutError:
+                self._dirty.update(self.ALL_DOMAINS)
+            
+            self._event.clear()
+            domains, self._dirty = self._dirty, set()
+            try:
+                await self.refresh(domains)
+            except Exception as e:
+                logger.error(f"[WS_BROADCAST] Refresh failed: {e}")
+    
+    async def refresh(self, domains: Iterable[str]) -> None:
+        """
+        도메인 재조회 → diff → 발행
+        
+        StateManager 호출은 블로킹 I/O이므로 스레드에서 실행.
+        """
+        domains = set(domains)
+        self.refresh_count += 1
+        if domains & self.METRIC_DOMAINS:
+            metrics, portfolio = await asyncio.to_thread(self._read_metrics)
+            self.publish_metrics(metrics, portfolio)
+        if domains & self.SIGNAL_DOMAINS:
+            signals = await asyncio.to_thread(self.state_manager.get_all_signals)
+            self.publish_signals(signals)
+    
+    def _read_metrics(self) -> tuple:
+        return self.state_manager.get_metrics(), self.state_manager.get_portfolio_state()
+    
+    def publish_metrics(self, metrics: Dict, portfolio: Optional[Dict]) -> bool:
+        """메트릭/포트폴리오가 바뀌었으면 1회 직렬화하여 발행"""
+        current = (metrics, portfolio)
+        if current == self._last_metrics:
+            return False
+        self._last_metrics = current
+        self.metrics_hub.publish_json(
+            {
+                "type": "metrics",
+                "metrics": metrics,
+                "portfolio": portfolio,
+                "timestamp": datetime.utcnow().isoformat(),
+            },
+            key="metrics",
+        )
+        return True
+    
+    def publish_signals(self, signals: Dict[str, Dict]) -> int:
+        """새로운/변경된 신호만 발행, 사라진 신호는 snapshot에서 제거"""
+        published = 0
+        for symbol, signal in signals.items():
+            if self._last_signals.get(symbol) == signal:
+                continue
+            self.signals_hub.publish_json(
+                {
+                    "type": "signal",
+                    "symbol": symbol,
+                    "signal": signal,
+                    "timestamp": datetime.utcnow().isoformat(),
+                },
+                key=symbol,
+            )
+            published += 1
+        for symbol in set(self._last_signals) - set(signals):
+            self.signals_hub.forget(symbol)
+        self._last_signals = dict(signals)
+        return published
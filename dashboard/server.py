@@ -11,6 +11,7 @@ FastAPI + WebSocket 기반 실시간 대시보드.
 - WebSocket 엔드포인트
 - Grafana 호환성
 - 프로덕션 급 설계
+- Push fan-out: 1회 직렬화, 클라이언트별 bounded queue로 동시 전송
 """
 
 import logging
@@ -18,6 +19,8 @@ import json
 from datetime import datetime, timezone
 from typing import Dict, Any, Optional, List
 
+from arbitrage.ws_broadcast import BroadcastHub, encode_frame
+
 logger = logging.getLogger(__name__)
 
 # FastAPI 선택적 임포트
@@ -45,7 +48,8 @@ class DashboardServer:
         self.port = port
         self.app: Optional[FastAPI] = None
         self.metrics_data: Dict[str, Any] = {}
-        self.connected_clients: List[WebSocket] = []
+        self.hub = BroadcastHub("dashboard")
+        self._metrics_frame: Optional[str] = None
         
         if HAS_FASTAPI:
             self._setup_app()
@@ -94,24 +98,26 @@ class DashboardServer:
         
         @self.app.websocket("/ws/metrics")
         async def websocket_metrics(websocket: WebSocket):
-            """메트릭 WebSocket"""
+            """메트릭 WebSocket (ping 메시지마다 최신 메트릭 + broadcast push)"""
             await websocket.accept()
-            self.connected_clients.append(websocket)
             
-            try:
-                while True:
-                    # 클라이언트로부터 메시지 수신 (ping/pong)
-                    data = await websocket.receive_text()
-                    
-                    # 메트릭 데이터 전송
-                    await websocket.send_json(self.metrics_data)
+            def on_message(subscriber, _text):
+                # 클라이언트 ping → 캐시된 프레임 응답 (재직렬화 없음)
+                self.hub.send_to(subscriber, self.metrics_frame)
             
-            except WebSocketDisconnect:
-                self.connected_clients.remove(websocket)
-            except Exception as e:
-                logger.error(f"[Dashboard] WebSocket error: {e}")
-                if websocket in self.connected_clients:
-                    self.connected_clients.remove(websocket)
+            await self.hub.serve(websocket, on_message=on_message)
+    
+    @property
+    def connected_clients(self) -> List[Any]:
+        """연결된 클라이언트 WebSocket 목록"""
+        return self.hub.websockets
+    
+    @property
+    def metrics_frame(self) -> str:
+        """직렬화된 현재 메트릭 (update_metrics 이후 1회만 직렬화)"""
+        if self._metrics_frame is None:
+            self._metrics_frame = encode_frame(self.metrics_data)
+        return self._metrics_frame
     
     def update_metrics(self, metrics: Dict[str, Any]) -> None:
         """
@@ -124,24 +130,16 @@ class DashboardServer:
             'timestamp': datetime.now(timezone.utc).isoformat(),
             **metrics
         }
+        self._metrics_frame = None
     
     async def broadcast_metrics(self) -> None:
-        """모든 연결된 클라이언트에 메트릭 브로드캐스트"""
-        if not self.connected_clients:
-            return
-        
-        disconnected = []
-        for client in self.connected_clients:
-            try:
-                await client.send_json(self.metrics_data)
-            except Exception as e:
-                logger.error(f"[Dashboard] Broadcast error: {e}")
-                disconnected.append(client)
+        """
+        모든 연결된 클라이언트에 메트릭 브로드캐스트
         
-        # 연결 끊긴 클라이언트 제거
-        for client in disconnected:
-            if client in self.connected_clients:
-                self.connected_clients.remove(client)
+        1회 직렬화한 프레임을 각 클라이언트 큐에 넣고 즉시 반환.
+        전송은 클라이언트별 writer task가 동시에 수행하며, 큐가 가득 찬 클라이언트는 drop.
+        """
+        self.hub.publish(self.metrics_frame, key="metrics")
     
     def start(self) -> None:
         """대시보드 서버 시작"""
@@ -0,0 +1,428 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Batched Volatility Inference Service (PHASE D15)
+================================================
+
+심볼별 VolatilityPredictor들의 최신 윈도우를 모아 단일 (N, seq_len, 1) 순전파로 예측합니다.
+
+특징:
+- 심볼별 예측 캐시 (히스토리 변경 시에만 재계산)
+- 고정 주기 백그라운드 배치 (asyncio, 전용 단일 스레드 executor)
+- 선택적 TorchScript / ONNX Runtime 백엔드 + 추론 스레드 수 제한
+- p50/p99 추론 지연 리포트
+"""
+
+import asyncio
+import io
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+import torch
+
+from arbitrage.rolling_stats import RollingWindow
+from ml.volatility_model import VolatilityLSTM, VolatilityPredictor
+
+logger = logging.getLogger(__name__)
+
+# 지원 백엔드
+BACKEND_EAGER = "eager"
+BACKEND_TORCHSCRIPT = "torchscript"
+BACKEND_ONNX = "onnx"
+
+
+class VolatilityInferenceService:
+    """
+    공유 배치 변동성 추론 서비스
+    
+    사용 예:
+        service = VolatilityInferenceService(sequence_length=20, num_threads=1)
+        service.register("BTC", VolatilityPredictor(sequence_length=20))
+        service.record_volatility("BTC", 0.25)
+        pred = service.predict("BTC")       # 캐시 또는 더티 심볼 전체 배치
+        await service.run(interval_sec=1.0)  # 고정 주기 배치 (선택)
+    """
+    
+    def __init__(
+        self,
+        model_path: str = "models/volatility_lstm.pt",
+        sequence_length: int = 20,
+        device: Optional[str] = None,
+        backend: str = BACKEND_EAGER,
+        num_threads: Optional[int] = 1,
+        export_path: Optional[str] = None,
+        latency_window: int = 1000,
+        model: Optional[VolatilityLSTM] = None,
+    ):
+        """
+        Args:
+            model_path: 모델 가중치 경로 (없으면 새 모델)
+            sequence_length: 입력 시퀀스 길이
+            device: 실행 디바이스 ('cpu', 'cuda', None=자동 선택)
+            backend: 'eager' | 'torchscript' | 'onnx'
+            num_threads: 추론 intra-op 스레드 수 상한 (None이면 변경 안 함)
+            export_path: TorchScript/ONNX 내보내기 경로 (None이면 파일로 저장하지 않음)
+            latency_window: 지연 통계 윈도우 크기
+            model: 이미 로드된 모델 (지정 시 model_path 무시)
+        """
+        self.model_path = Path(model_path)
+        self.sequence_length = sequence_length
+        self.backend = backend
+        self.num_threads = num_threads
+        
+        if device is None:
+            self.device = "cuda" if torch.cuda.is_available() else "cpu"
+        else:
+            self.device = device
+        
+        # 추론 스레드 수 제한 (트레이딩 루프와 CPU 경쟁 방지, 프로세스 전역 설정)
+        if num_threads is not None and self.device == "cpu":
+            torch.set_num_threads(num_threads)
+        
+        self.model = model if model is not None else self._load_model()
+        self.model.to(self.device)
+        self.model.eval()
+        
+        self._onnx_session = None
+        self._runner = self._build_backend(export_path)
+        
+        # 심볼 등록/캐시
+        self._predictors: Dict[str, VolatilityPredictor] = {}
+        self._cache: Dict[str, float] = {}
+        self._cache_versions: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        
+        # 통계
+        self._latency_ms = RollingWindow(latency_window, dtype=np.float64, track_order=True)
+        self._batch_sizes = RollingWindow(latency_window, dtype=np.float64)
+        self.batches_run = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        
+        # 백그라운드 실행
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._running = False
+        
+        logger.info(
+            f"[VolatilityInference] Initialized: backend={self.backend}, "
+            f"device={self.device}, num_threads={num_threads}"
+        )
+    
+    # ------------------------------------------------------------------
+    # 모델/백엔드
+    # ------------------------------------------------------------------
+    
+    def _load_model(self) -> VolatilityLSTM:
+        """모델 로드 또는 새로 생성"""
+        model = VolatilityLSTM()
+        try:
+            if self.model_path.exists():
+                state_dict = torch.load(self.model_path, map_location=self.device)
+                model.load_state_dict(state_dict)
+                logger.info(f"[VolatilityInference] Model loaded from {self.model_path}")
+            else:
+                logger.info("[VolatilityInference] New model created")
+        except Exception as e:
+            logger.error(f"[VolatilityInference] Model load failed, using new model: {e}")
+            model = VolatilityLSTM()
+        return model
+    
+    def _example_input(self, batch_size: int = 2) -> torch.Tensor:
+        return torch.zeros(batch_size, self.sequence_length, 1, device=self.device)
+    
+    def _build_backend(self, export_path: Optional[str]):
+        """추론 실행 함수 생성 (numpy (N, seq, 1) → numpy (N,))"""
+        if self.backend == BACKEND_TORCHSCRIPT:
+            return self._build_torchscript(export_path)
+        
+        if self.backend == BACKEND_ONNX:
+            try:
+                return self._build_onnx(export_path)
+            except ImportError as e:
+                logger.warning(
+                    f"[VolatilityInference] ONNX backend unavailable ({e}), "
+                    f"falling back to TorchScript"
+                )
+                self.backend = BACKEND_TORCHSCRIPT
+                return self._build_torchscript(export_path)
+        
+        if self.backend != BACKEND_EAGER:
+            raise ValueError(f"Unknown inference backend: {self.backend}")
+        
+        model = self.model
+        
+        def run_eager(batch: np.ndarray) -> np.ndarray:
+            x = torch.from_numpy(batch).to(self.device)
+            with torch.inference_mode():
+                return model(x).reshape(-1).cpu().numpy()
+        
+        return run_eager
+    
+    def _build_torchscript(self, export_path: Optional[str]):
+        """TorchScript trace 백엔드"""
+        with torch.inference_mode():
+            scripted = torch.jit.trace(self.model, self._example_input())
+        scripted = torch.jit.freeze(scripted.eval()) if self.device == "cpu" else scripted
+        
+        if export_path:
+            try:
+                Path(export_path).parent.mkdir(parents=True, exist_ok=True)
+                torch.jit.save(scripted, export_path)
+                logger.info(f"[VolatilityInference] TorchScript model exported to {export_path}")
+            except Exception as e:
+                logger.warning(f"[VolatilityInference] TorchScript export failed: {e}")
+        
+        def run_torchscript(batch: np.ndarray) -> np.ndarray:
+            x = torch.from_numpy(batch).to(self.device)
+            with torch.inference_mode():
+                return scripted(x).reshape(-1).cpu().numpy()
+        
+        return run_torchscript
+    
+    def _build_onnx(self, export_path: Optional[str]):
+        """ONNX Runtime 백엔드 (onnx, onnxruntime 필요)"""
+        try:
+            import onnx  # noqa: F401  (torch.onnx.export 의존성)
+            import onnxruntime as ort
+        except ImportError:
+            raise ImportError(
+                "onnx and onnxruntime are required for the ONNX backend. "
+                "Install them with: pip install onnx onnxruntime"
+            )
+        
+        # export_path가 없으면 메모리에서만 변환
+        target = export_path if export_path else io.BytesIO()
+        if export_path:
+            Path(export_path).parent.mkdir(parents=True, exist_ok=True)
+        torch.onnx.export(
+            self.model.cpu(),
+            self._example_input().cpu(),
+            target,
+            input_names=["input"],
+            output_names=["output"],
+            dynamic_axes={"input": {0: "batch"}, "output": {0: "batch"}},
+        )
+        self.model.to(self.device)
+        if export_path:
+            logger.info(f"[VolatilityInference] ONNX model exported to {export_path}")
+        model_source = export_path if export_path else target.getvalue()
+        
+        options = ort.SessionOptions()
+        if self.num_threads is not None:
+            options.intra_op_num_threads = self.num_threads
+            options.inter_op_num_threads = 1
+        self._onnx_session = ort.InferenceSession(
+            model_source, options, providers=["CPUExecutionProvider"]
+        )
+        session = self._onnx_session
+        
+        def run_onnx(batch: np.ndarray) -> np.ndarray:
+            return session.run(None, {"input": batch})[0].reshape(-1)
+        
+        return run_onnx
+    
+    # ------------------------------------------------------------------
+    # 심볼 등록 / 기록
+    # ------------------------------------------------------------------
+    
+    def register(
+        self,
+        symbol: str,
+        predictor: Optional[VolatilityPredictor] = None,
+    ) -> VolatilityPredictor:
+        """
+        심볼 등록
+        
+        Args:
+            symbol: 심볼
+            predictor: 기존 예측기 (None이면 서비스 모델을 공유하는 예측기 생성)
+        
+        Returns:
+            등록된 VolatilityPredictor (히스토리 저장소로 사용)
+        """
+        if predictor is None:
+            predictor = VolatilityPredictor(
+                model_path=str(self.model_path),
+                sequence_length=self.sequence_length,
+                device=self.device,
+                model=self.model,
+            )
+        
+        if predictor.sequence_length != self.sequence_length:
+            raise ValueError(
+                f"sequence_length mismatch for {symbol}: "
+                f"{predictor.sequence_length} != {self.sequence_length}"
+            )
+        
+        with self._lock:
+            self._predictors[symbol] = predictor
+            self._cache.pop(symbol, None)
+            self._cache_versions.pop(symbol, None)
+        return predictor
+    
+    def unregister(self, symbol: str) -> None:
+        """심볼 등록 해제"""
+        with self._lock:
+            self._predictors.pop(symbol, None)
+            self._cache.pop(symbol, None)
+            self._cache_versions.pop(symbol, None)
+    
+    @property
+    def symbols(self) -> List[str]:
+        return list(self._predictors)
+    
+    def record_volatility(self, symbol: str, volatility: float) -> None:
+        """심볼 변동성 기록 (미등록 심볼은 자동 등록)"""
+        predictor = self._predictors.get(symbol)
+        if predictor is None:
+            predictor = self.register(symbol)
+        predictor.record_volatility(volatility)
+    
+    # ------------------------------------------------------------------
+    # 예측
+    # ------------------------------------------------------------------
+    
+    @staticmethod
+    def _fallback(history: np.ndarray) -> float:
+        """데이터 부족/실패 시 값 (VolatilityPredictor.predict 와 동일)"""
+        if len(history) > 0:
+            return float(history[-1])
+        return 0.5
+    
+    def predict(self, symbol: str) -> float:
+        """
+        심볼 예측값 조회
+        
+        캐시가 최신이면 즉시 반환하고, 아니면 변경된 모든 심볼을 한 번에 배치 예측합니다.
+        """
+        predictor = self._predictors.get(symbol)
+        if predictor is None:
+            raise KeyError(f"Symbol not registered: {symbol}")
+        
+        if self._cache_versions.get(symbol) == predictor.version:
+            self.cache_hits += 1
+            return self._cache[symbol]
+        
+        self.predict_all()
+        return self._cache[symbol]
+    
+    def predict_all(self) -> Dict[str, float]:
+        """
+        변경된 심볼 전체를 단일 순전파로 예측하고 전체 캐시 반환
+        
+        Returns:
+            {symbol: 예측 변동성}
+        """
+        with self._lock:
+            dirty_symbols: List[str] = []
+            windows: List[np.ndarray] = []
+            versions: List[int] = []
+            
+            for symbol, predictor in self._predictors.items():
+                version = predictor.version
+                if self._cache_versions.get(symbol) == version:
+                    continue
+                self.cache_misses += 1
+                
+                history = predictor.volatility_history
+                if len(history) < self.sequence_length:
+                    self._cache[symbol] = self._fallback(history)
+                    self._cache_versions[symbol] = version
+                    continue
+                
+                dirty_symbols.append(symbol)
+                windows.append(history[-self.sequence_length:])
+                versions.append(version)
+            
+            if dirty_symbols:
+                self._run_batch(dirty_symbols, windows, versions)
+            
+            return dict(self._cache)
+    
+    def _run_batch(
+        self,
+        symbols: List[str],
+        windows: List[np.ndarray],
+        versions: List[int],
+    ) -> None:
+        """(N, seq_len, 1) 단일 순전파 실행 후 캐시 갱신 (lock 보유 상태에서 호출)"""
+        batch = np.stack(windows).astype(np.float32, copy=False)[:, :, np.newaxis]
+        
+        start = time.perf_counter()
+        try:
+            preds = np.clip(self._runner(np.ascontiguousarray(batch)), 0.0, 1.0)
+        except Exception as e:
+            logger.error(f"[VolatilityInference] Batch inference failed: {e}")
+            preds = np.array([self._fallback(w) for w in windows], dtype=np.float32)
+        elapsed_ms = (time.perf_counter() - start) * 1000.0
+        
+        self._latency_ms.append(elapsed_ms)
+        self._batch_sizes.append(len(symbols))
+        self.batches_run += 1
+        
+        for symbol, version, pred in zip(symbols, versions, preds):
+            self._cache[symbol] = float(pred)
+            self._cache_versions[symbol] = version
+    
+    # ------------------------------------------------------------------
+    # 고정 주기 실행
+    # ------------------------------------------------------------------
+    
+    async def run(self, interval_sec: float = 1.0) -> None:
+        """
+        고정 주기로 predict_all 실행 (stop() 호출 시 종료)
+        
+        추론은 전용 단일 스레드 executor에서 실행되어 이벤트 루프를 막지 않습니다.
+        """
+        loop = asyncio.get_running_loop()
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="volatility-inference"
+            )
+        self._running = True
+        logger.info(f"[VolatilityInference] Batch loop started: interval={interval_sec}s")
+        
+        try:
+            while self._running:
+                started = loop.time()
+                await loop.run_in_executor(self._executor, self.predict_all)
+                await asyncio.sleep(max(0.0, interval_sec - (loop.time() - started)))
+        finally:
+            self._running = False
+            logger.info("[VolatilityInference] Batch loop stopped")
+    
+    def stop(self) -> None:
+        """고정 주기 실행 중지"""
+        self._running = False
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+    
+    # ------------------------------------------------------------------
+    # 통계
+    # ------------------------------------------------------------------
+    
+    def get_stats(self) -> dict:
+        """
+        통계 반환
+        
+        Returns:
+            배치 수, 캐시 적중/미스, 평균 배치 크기, 추론 지연 p50/p99 (ms)
+        """
+        has_latency = len(self._latency_ms) > 0
+        return {
+            'backend': self.backend,
+            'num_symbols': len(self._predictors),
+            'batches_run': self.batches_run,
+            'cache_hits': self.cache_hits,
+            'cache_misses': self.cache_misses,
+            'avg_batch_size': self._batch_sizes.mean() if len(self._batch_sizes) else 0.0,
+            'p50_latency_ms': self._latency_ms.quantile(0.50) if has_latency else 0.0,
+            'p99_latency_ms': self._latency_ms.quantile(0.99) if has_latency else 0.0,
+            'max_latency_ms': float(np.max(self._latency_ms.values)) if has_latency else 0.0,
+        }
@@ -22,6 +22,8 @@ import torch
 import torch.nn as nn
 from torch.utils.data import TensorDataset, DataLoader
 
+from arbitrage.rolling_stats import RollingWindow
+
 logger = logging.getLogger(__name__)
 
 
@@ -110,17 +112,26 @@ class VolatilityPredictor:
         self,
         model_path: str = "models/volatility_lstm.pt",
         sequence_length: int = 20,
-        device: Optional[str] = None
+        device: Optional[str] = None,
+        model: Optional[VolatilityLSTM] = None
     ):
         """
         Args:
             model_path: 모델 저장 경로
             sequence_length: 입력 시퀀스 길이
             device: 실행 디바이스 ('cpu', 'cuda', None=자동 선택)
+            model: 공유 모델 (지정 시 로드/생성 생략, 예: 배치 추론 서비스와 공유)
         """
         self.model_path = Path(model_path)
         self.sequence_length = sequence_length
         
+        # 변동성 히스토리 (고정 용량 링 버퍼, 재할당 없음)
+        self.max_history = 1000
+        self._history = RollingWindow(self.max_history, dtype=np.float32)
+        
+        # 히스토리 변경 카운터 (추론 서비스 캐시 무효화용)
+        self.version = 0
+        
         # 디바이스 자동 선택
         if device is None:
             self.device = "cuda" if torch.cuda.is_available() else "cpu"
@@ -130,12 +141,14 @@ class VolatilityPredictor:
         logger.info(f"[VolatilityPredictor] Using device: {self.device}")
         
         # 모델 초기화
-        self.model: Optional[VolatilityLSTM] = None
-        self._load_or_create_model()
-        
-        # 변동성 히스토리 (NumPy 배열로 관리)
-        self.volatility_history = np.array([], dtype=np.float32)
-        self.max_history = 1000
+        self.model: Optional[VolatilityLSTM] = model
+        if self.model is None:
+            self._load_or_create_model()
+    
+    @property
+    def volatility_history(self) -> np.ndarray:
+        """변동성 윈도우 (zero-copy 읽기 전용 뷰)"""
+        return self._history.values
     
     def _load_or_create_model(self) -> None:
         """모델 로드 또는 새로 생성"""
@@ -162,17 +175,13 @@ class VolatilityPredictor:
     
     def record_volatility(self, volatility: float) -> None:
         """
-        변동성 기록 (벡터화)
+        변동성 기록 (O(1) 링 버퍼)
         
         Args:
             volatility: 변동성 값
         """
-        # NumPy 배열에 추가
-        self.volatility_history = np.append(self.volatility_history, volatility)
-        
-        # 히스토리 크기 제한
-        if len(self.volatility_history) > self.max_history:
-            self.volatility_history = self.volatility_history[-self.max_history:]
+        self._history.append(volatility)
+        self.version += 1
     
     def record_volatilities_batch(self, volatilities: np.ndarray) -> None:
         """
@@ -181,11 +190,8 @@ class VolatilityPredictor:
         Args:
             volatilities: (N,) 형태의 변동성 배열
         """
-        volatilities = np.asarray(volatilities, dtype=np.float32)
-        self.volatility_history = np.append(self.volatility_history, volatilities)
-        
-        if len(self.volatility_history) > self.max_history:
-            self.volatility_history = self.volatility_history[-self.max_history:]
+        self._history.extend(volatilities)
+        self.version += 1
     
     def predict(self) -> float:
         """
@@ -205,7 +211,7 @@ class VolatilityPredictor:
             recent_vol = self.volatility_history[-self.sequence_length:]
             
             # (1, seq_length, 1) 형태로 변환
-            x = torch.FloatTensor(recent_vol).reshape(1, -1, 1).to(self.device)
+            x = torch.tensor(recent_vol, dtype=torch.float32).reshape(1, -1, 1).to(self.device)
             
             # 예측
             with torch.no_grad():
@@ -270,12 +276,12 @@ class VolatilityPredictor:
                 'max_volatility': 0.0
             }
         
-        # NumPy 벡터화 연산
+        # 롤링 평균/표준편차 (O(1)), 최소/최대는 zero-copy 뷰에서 벡터화
         return {
             'history_length': len(self.volatility_history),
             'current_volatility': float(self.volatility_history[-1]),
-            'mean_volatility': float(np.mean(self.volatility_history)),
-            'std_volatility': float(np.std(self.volatility_history)),
+            'mean_volatility': self._history.mean(),
+            'std_volatility': self._history.std(),
             'min_volatility': float(np.min(self.volatility_history)),
             'max_volatility': float(np.max(self.volatility_history))
         }
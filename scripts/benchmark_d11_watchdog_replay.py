@@ -0,0 +1,150 @@
+"""
+D11: Watchdog Rule Table Replay Benchmark
+
+녹화된(또는 합성된) 메트릭 스트림을 evaluate_full() (기존 if/elif 체인)과
+evaluate() (compiled rule table)에 같은 순서로 넣고,
+사이클별 상태와 레벨 전이가 동일한지 검증 + 평가 비용 비교.
+
+입력 파일은 한 줄에 메트릭 dict 하나인 JSONL (--input).
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+# 프로젝트 루트 추가
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from arbitrage.watchdog import AlertLevel, Watchdog, WatchdogConfig, WatchdogStatus
+
+
+def synthetic_stream(cycles: int, seed: int = 11) -> List[Dict[str, Any]]:
+    """대부분 정상, 간헐적 지연 스파이크/장애 구간이 있는 메트릭 스트림"""
+    rng = random.Random(seed)
+    stream = []
+    ws_lag, redis_age, loop_latency = 100.0, 2000.0, 50.0
+    incident = 0
+    for _ in range(cycles):
+        if incident == 0 and rng.random() < 0.01:
+            incident = rng.randint(2, 30)
+        if incident:
+            incident -= 1
+            ws_lag = rng.uniform(1500.0, 7000.0)
+            redis_age = rng.uniform(10000.0, 40000.0) if rng.random() < 0.3 else redis_age
+            loop_latency = rng.uniform(1000.0, 6000.0) if rng.random() < 0.3 else 50.0
+        else:
+            ws_lag = max(0.0, ws_lag * 0.5 + rng.gauss(100.0, 30.0))
+            redis_age = rng.uniform(500.0, 5000.0)
+            loop_latency = rng.uniform(20.0, 200.0)
+        stream.append({
+            "ws_lag_ms": ws_lag,
+            "redis_heartbeat_age_ms": redis_age,
+            "loop_latency_ms": loop_latency,
+            "safety_rejections_count": rng.randint(8, 14) if incident else rng.randint(0, 3),
+            "pnl": rng.gauss(0.0, 1000.0),
+            "num_trades": rng.randint(0, 100),
+        })
+    return stream
+
+
+def cycle_key(watchdog: Watchdog, status: WatchdogStatus) -> Tuple:
+    """사이클 상태 비교 키 (경고는 레벨/메트릭 기준)"""
+    return (
+        tuple((alert.level, alert.component, alert.metric_name) for alert in status.alerts),
+        status.is_healthy,
+        status.should_shutdown,
+        status.shutdown_reason,
+        status.consecutive_errors,
+        watchdog.warn_cycle_count,
+        watchdog.error_cycle_count,
+        watchdog.consecutive_warn_count,
+    )
+
+
+def replay(stream: List[Dict[str, Any]], config: WatchdogConfig) -> Dict[str, Any]:
+    """두 경로 리플레이 → 사이클 키, 전이 목록, 소요 시간"""
+    full = Watchdog(config)
+    fast = Watchdog(config)
+    full_keys, fast_keys = [], []
+    full_transitions, fast_transitions = [], []
+    full_elapsed = fast_elapsed = 0.0
+    previous: Dict[str, Tuple[AlertLevel, str]] = {}
+    
+    for cycle, metrics in enumerate(stream):
+        started = time.perf_counter()
+        status = full.evaluate_full(metrics)
+        full_elapsed += time.perf_counter() - started
+        full_keys.append(cycle_key(full, status))
+        
+        # 기존 경로의 전이 = 메트릭별 레벨 변화 (전이 시점 메시지 포함)
+        current = {
+            alert.metric_name: (alert.level, alert.message)
+            for alert in status.alerts if alert.metric_name is not None
+        }
+        for metric_name in sorted(set(previous) | set(current)):
+            before = previous.get(metric_name, (AlertLevel.OK, None))[0]
+            after = current.get(metric_name, (AlertLevel.OK, None))
+            if before != after[0]:
+                message = after[1] if after[0] != AlertLevel.OK else None
+                full_transitions.append((cycle, metric_name, after[0], message))
+        previous = current
+        
+        started = time.perf_counter()
+        status = fast.evaluate(metrics)
+        fast_elapsed += time.perf_counter() - started
+        fast_keys.append(cycle_key(fast, status))
+        for event in sorted(status.transitions, key=lambda event: event.metric_name):
+            message = event.message if event.level != AlertLevel.OK else None
+            fast_transitions.append((cycle, event.metric_name, event.level, message))
+    
+    return {
+        "full": (full_keys, full_transitions, full_elapsed),
+        "fast": (fast_keys, fast_transitions, fast_elapsed),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Watchdog rule table replay benchmark")
+    parser.add_argument("--input", type=str, default=None, help="메트릭 스트림 JSONL")
+    parser.add_argument("--cycles", type=int, default=200_000, help="합성 스트림 길이")
+    parser.add_argument("--seed", type=int, default=11)
+    args = parser.parse_args()
+    
+    print("=" * 80)
+    print("D11: Watchdog Rule Table Replay Benchmark")
+    print("=" * 80)
+    
+    if args.input:
+        with open(args.input, "r", encoding="utf-8") as f:
+            stream = [json.loads(line) for line in f if line.strip()]
+    else:
+        stream = synthetic_stream(args.cycles, args.seed)
+    
+    results = replay(stream, WatchdogConfig())
+    full_keys, full_transitions, full_elapsed = results["full"]
+    fast_keys, fast_transitions, fast_elapsed = results["fast"]
+    
+    mismatches = sum(1 for a, b in zip(full_keys, fast_keys) if a != b)
+    transitions_match = full_transitions == fast_transitions
+    cycles = len(stream)
+    print(f"Cycles:      {cycles:,}")
+    print(f"Transitions: {len(full_transitions):,} (full) / {len(fast_transitions):,} (compiled)")
+    print(f"full        {full_elapsed / cycles * 1e6:7.2f} us/cycle")
+    print(
+        f"compiled    {fast_elapsed / cycles * 1e6:7.2f} us/cycle  "
+        f"({fast_elapsed / full_elapsed * 100:5.1f}% of full)"
+    )
+    print(f"State mismatches: {mismatches}  transitions identical: {transitions_match}")
+    passed = mismatches == 0 and transitions_match
+    print("✅ PASS: identical transitions" if passed else "❌ FAIL: replay mismatch")
+    print("=" * 80)
+    return 0 if passed else 1
+
+
+if __name__ == "__main__":
+    exit(main())
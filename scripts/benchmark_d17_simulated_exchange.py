@@ -0,0 +1,143 @@
+"""
+D17: SimulatedExchange Matching Engine Benchmark
+
+L2 스냅샷 스트림(랜덤 워크 mid) 위에서 시장가 / IOC / GTC 지정가 주문과
+취소를 섞어 보내고, 초당 처리 주문 수와 체결 통계를 측정한다.
+
+검증: 매수 VWAP이 지정가를 넘지 않는지 (매도는 지정가 미만 아님)
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+# 프로젝트 루트 추가
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from arbitrage.exchange.simulated import (
+    TIME_IN_FORCE_GTC,
+    TIME_IN_FORCE_IOC,
+    SimulatedExchange,
+)
+from arbitrage.types import OrderSide, OrderStatus
+
+SYMBOL = "KRW-BTC"
+TICK = 1000.0
+
+
+def make_snapshot(
+    rng: random.Random, mid: float, levels: int = 20
+) -> Tuple[List[Tuple[float, float]], List[Tuple[float, float]]]:
+    """mid 기준 L2 스냅샷 (최우선부터 정렬)"""
+    bids = [(mid - TICK * (i + 1), rng.uniform(0.05, 2.0)) for i in range(levels)]
+    asks = [(mid + TICK * (i + 1), rng.uniform(0.05, 2.0)) for i in range(levels)]
+    return bids, asks
+
+
+def run(
+    orders: int,
+    orders_per_snapshot: int = 20,
+    levels: int = 20,
+    latency_ms: float = 50.0,
+    seed: int = 17,
+) -> Dict[str, float]:
+    """벤치마크 실행 → 통계"""
+    rng = random.Random(seed)
+    exchange = SimulatedExchange(
+        initial_balance={"KRW": 1e18, "BTC": 1e9},
+        latency_ms=latency_ms,
+    )
+    
+    # 주문 흐름은 미리 생성 (측정 구간에서 난수 비용 제외)
+    mid = 100_000_000.0
+    snapshots = []
+    for _ in range(orders // orders_per_snapshot + 1):
+        mid += TICK * rng.choice([-2, -1, 0, 1, 2])
+        snapshots.append((mid, make_snapshot(rng, mid, levels)))
+    flow = []
+    for i in range(orders):
+        snapshot_mid = snapshots[i // orders_per_snapshot][0]
+        side = OrderSide.BUY if rng.random() < 0.5 else OrderSide.SELL
+        kind = rng.random()
+        if kind < 0.3:
+            price, time_in_force = None, TIME_IN_FORCE_IOC
+        else:
+            offset = TICK * rng.randint(-3, 3)
+            price = snapshot_mid + offset if side == OrderSide.BUY else snapshot_mid - offset
+            time_in_force = TIME_IN_FORCE_IOC if kind < 0.6 else TIME_IN_FORCE_GTC
+        flow.append((side, rng.uniform(0.01, 1.5), price, time_in_force, rng.random() < 0.1))
+    
+    now = 0.0
+    started = time.perf_counter()
+    submit = exchange.submit_order
+    resting_ids = []
+    for i, (side, quantity, price, time_in_force, cancel) in enumerate(flow):
+        if i % orders_per_snapshot == 0:
+            now += 0.01
+            bids, asks = snapshots[i // orders_per_snapshot][1]
+            exchange.update_order_book(SYMBOL, bids, asks, timestamp=now)
+        order_id = submit(SYMBOL, side, quantity, price, time_in_force)
+        if time_in_force == TIME_IN_FORCE_GTC and cancel:
+            resting_ids.append(order_id)
+        if len(resting_ids) > 100:
+            for resting_id in resting_ids:
+                exchange.submit_cancel(resting_id)
+            resting_ids.clear()
+    exchange.advance_to(now + 1.0)
+    elapsed = time.perf_counter() - started
+    
+    violations = 0
+    statuses: Dict[OrderStatus, int] = {}
+    for order_id, (side, _, price, _, _) in zip(map(str, range(1, orders + 1)), flow):
+        order = exchange.get_order(order_id)
+        statuses[order.status] = statuses.get(order.status, 0) + 1
+        average = exchange.get_average_fill_price(order_id)
+        if average is not None and price is not None:
+            if (side == OrderSide.BUY and average > price * (1 + 1e-12)) or (
+                side == OrderSide.SELL and average < price * (1 - 1e-12)
+            ):
+                violations += 1
+    
+    stats = exchange.get_stats()
+    return {
+        "orders": orders,
+        "elapsed": elapsed,
+        "orders_per_sec": orders / elapsed,
+        "fills": stats["total_fills"],
+        "resting": stats["resting_orders"],
+        "violations": violations,
+        "statuses": {status.value: count for status, count in statuses.items()},
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="SimulatedExchange matching engine benchmark")
+    parser.add_argument("--orders", type=int, default=200_000)
+    parser.add_argument("--orders-per-snapshot", type=int, default=20)
+    parser.add_argument("--levels", type=int, default=20, help="스냅샷 호가 레벨 수 (한쪽)")
+    parser.add_argument("--latency-ms", type=float, default=50.0)
+    parser.add_argument("--seed", type=int, default=17)
+    args = parser.parse_args()
+    
+    print("=" * 80)
+    print("D17: SimulatedExchange Matching Engine Benchmark")
+    print("=" * 80)
+    
+    result = run(args.orders, args.orders_per_snapshot, args.levels, args.latency_ms, args.seed)
+    
+    print(f"Orders:      {result['orders']:,}  ({result['elapsed']:.2f}s)")
+    print(f"Throughput:  {result['orders_per_sec']:,.0f} orders/s")
+    print(f"Fills:       {result['fills']:,}  resting={result['resting']:,}")
+    print(f"Statuses:    {result['statuses']}")
+    print(f"Limit price violations: {result['violations']}")
+    print("✅ PASS" if result["violations"] == 0 else "❌ FAIL: fill beyond limit price")
+    print("=" * 80)
+    return 0 if result["violations"] == 0 else 1
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,179 @@
+"""
+D75-5: FourTierRiskGuard Compiled Plan Benchmark
+
+evaluate_full() (전체 Tier 평가) vs evaluate() (compiled plan, 단락 평가)
+vs evaluate_many() (배치) 결정 일치 확인 및 평가 비용 비교.
+
+무작위 상태 시퀀스를 세 경로에 같은 순서로 넣고 (allow, degraded,
+cooldown_seconds, max_notional)이 모두 같은지 검증한다.
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+# 프로젝트 루트 추가
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from arbitrage.domain.arb_route import RouteScore
+from arbitrage.domain.risk_guard import (
+    ExchangeState,
+    FourTierRiskGuard,
+    FourTierRiskGuardConfig,
+    GlobalState,
+    RiskGuardDecision,
+    RouteState,
+    SymbolState,
+)
+from arbitrage.infrastructure.exchange_health import ExchangeHealthStatus, HealthMetrics
+
+SYMBOL_PAIRS = [("KRW-BTC", "BTCUSDT"), ("KRW-ETH", "ETHUSDT"), ("KRW-XRP", "XRPUSDT"), ("KRW-SOL", "SOLUSDT")]
+
+
+class FakeClock:
+    """수동 진행 시계 (cooldown 비교를 결정적으로 만들기 위함)"""
+    
+    def __init__(self, now: float = 1_700_000_000.0):
+        self.now = now
+    
+    def __call__(self) -> float:
+        return self.now
+
+
+def random_tick(rng: random.Random, routes: int = 4) -> Tuple[
+    Dict[str, ExchangeState], List[RouteState], Dict[str, SymbolState], GlobalState
+]:
+    """무작위 tick 상태 생성 (대부분 정상, 일부 임계값 초과)"""
+    def rare(p: float = 0.05) -> bool:
+        return rng.random() < p
+    
+    statuses = [ExchangeHealthStatus.HEALTHY] * 17 + [
+        ExchangeHealthStatus.DEGRADED,
+        ExchangeHealthStatus.FROZEN,
+        ExchangeHealthStatus.DOWN,
+    ]
+    exchange_states = {
+        name: ExchangeState(
+            exchange_name=name,
+            health_status=rng.choice(statuses),
+            health_metrics=HealthMetrics(),
+            rate_limit_remaining_pct=rng.uniform(0.0, 0.3) if rare() else rng.uniform(0.3, 1.0),
+            daily_loss_usd=rng.uniform(10000.0, 20000.0) if rare() else rng.uniform(0.0, 5000.0),
+        )
+        for name in ("UPBIT", "BINANCE")
+    }
+    
+    route_states = []
+    for _ in range(routes):
+        symbol_a, symbol_b = rng.choice(SYMBOL_PAIRS)
+        route_score = None
+        if rng.random() < 0.8:
+            route_score = RouteScore(
+                spread_score=rng.uniform(20.0, 100.0),
+                health_score=rng.uniform(30.0, 100.0),
+                fee_score=rng.uniform(30.0, 100.0),
+                inventory_penalty=rng.uniform(20.0, 100.0),
+            )
+        route_states.append(RouteState(
+            symbol_a=symbol_a,
+            symbol_b=symbol_b,
+            route_score=route_score,
+            gross_spread_bps=rng.uniform(500.0, 800.0) if rare() else rng.uniform(0.0, 200.0),
+            recent_trades=[-1.0 if rng.random() < 0.25 else 1.0 for _ in range(rng.randint(0, 6))],
+        ))
+    
+    symbol_states = {}
+    for symbol in rng.sample(["BTC", "ETH", "XRP", "SOL"], rng.randint(0, 3)):
+        peak = rng.uniform(0.0, 1000.0)
+        symbol_states[symbol] = SymbolState(
+            symbol=symbol,
+            total_exposure_usd=rng.uniform(0.0, 70000.0) if rare() else rng.uniform(0.0, 30000.0),
+            total_notional_usd=0.0,
+            unrealized_pnl_usd=0.0,
+            intraday_pnl_usd=peak * rng.uniform(0.6, 1.0) if rare() else peak * rng.uniform(0.9, 1.0),
+            intraday_peak_usd=peak,
+            volatility_proxy=rng.uniform(0.1, 0.2) if rare() else rng.uniform(0.0, 0.1),
+        )
+    
+    global_state = GlobalState(
+        total_portfolio_value_usd=100000.0,
+        total_exposure_usd=rng.uniform(100000.0, 120000.0) if rare() else rng.uniform(0.0, 90000.0),
+        total_margin_used_usd=0.0,
+        global_daily_loss_usd=rng.uniform(50000.0, 60000.0) if rare() else rng.uniform(0.0, 20000.0),
+        global_cumulative_loss_usd=0.0,
+        cross_exchange_imbalance_ratio=rng.uniform(-1.0, 1.0) if rare() else rng.uniform(-0.4, 0.4),
+        cross_exchange_exposure_risk=rng.uniform(0.8, 1.0) if rare() else rng.uniform(0.0, 0.7),
+    )
+    return exchange_states, route_states, symbol_states, global_state
+
+
+def decision_key(decision: RiskGuardDecision) -> Tuple:
+    """비교용 결정 튜플"""
+    return (decision.allow, decision.degraded, decision.cooldown_seconds, decision.max_notional)
+
+
+def run_paths(ticks: List[Tuple], tick_seconds: float = 30.0) -> Dict[str, Tuple[List[Tuple], float]]:
+    """세 경로 실행 → {경로: (결정 튜플 목록, 소요 초)}"""
+    results = {}
+    for path in ("full", "compiled", "batch"):
+        clock = FakeClock()
+        guard = FourTierRiskGuard(FourTierRiskGuardConfig(), clock=clock)
+        keys = []
+        elapsed = 0.0
+        for exchange_states, route_states, symbol_states, global_state in ticks:
+            started = time.perf_counter()
+            if path == "batch":
+                decisions = guard.evaluate_many(exchange_states, route_states, symbol_states, global_state)
+            else:
+                evaluate = guard.evaluate_full if path == "full" else guard.evaluate
+                decisions = [
+                    evaluate(exchange_states, route_state, symbol_states, global_state)
+                    for route_state in route_states
+                ]
+            elapsed += time.perf_counter() - started
+            keys.extend(decision_key(decision) for decision in decisions)
+            clock.now += tick_seconds
+        results[path] = (keys, elapsed)
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="FourTierRiskGuard compiled plan benchmark")
+    parser.add_argument("--ticks", type=int, default=5000)
+    parser.add_argument("--routes", type=int, default=8, help="tick당 후보 route 수")
+    parser.add_argument("--seed", type=int, default=75)
+    args = parser.parse_args()
+    
+    print("=" * 80)
+    print("D75-5: FourTierRiskGuard Compiled Plan Benchmark")
+    print("=" * 80)
+    
+    rng = random.Random(args.seed)
+    ticks = [random_tick(rng, args.routes) for _ in range(args.ticks)]
+    results = run_paths(ticks)
+    
+    reference, full_elapsed = results["full"]
+    evaluations = len(reference)
+    exit_code = 0
+    for path, (keys, elapsed) in results.items():
+        mismatches = sum(1 for a, b in zip(reference, keys) if a != b)
+        print(
+            f"{path:<9} {elapsed / evaluations * 1e6:8.2f} us/route  "
+            f"({elapsed / full_elapsed * 100:5.1f}% of full)  mismatches={mismatches}"
+        )
+        if mismatches:
+            exit_code = 1
+    
+    blocked = sum(1 for key in reference if not key[0] and not key[1])
+    print(f"\nEvaluations: {evaluations}  (blocked/cooldown {blocked}, {blocked / evaluations * 100:.1f}%)")
+    print("✅ PASS: identical decisions" if exit_code == 0 else "❌ FAIL: decision mismatch")
+    print("=" * 80)
+    return exit_code
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,159 @@
+"""
+D80-5: Multi-Source FX Aggregation Benchmark
+
+3소스 WS tick 스트림을 기존 방식(매 tick 전체 리스트 재구성 + outlier 제거 +
+정렬 median)과 IncrementalFxAggregator에 같은 순서로 넣고,
+tick별 집계 환율이 동일한지 검증 + tick 처리 비용 / get_rate() 비용 비교.
+"""
+
+import argparse
+import logging
+import random
+import sys
+import time
+from decimal import Decimal
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+# 프로젝트 루트 추가
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from arbitrage.common.currency import Currency, MultiSourceFxRateProvider
+from arbitrage.common.fx_aggregator import IncrementalFxAggregator
+
+SOURCES = ("binance", "okx", "bybit")
+THRESHOLD = MultiSourceFxRateProvider.OUTLIER_THRESHOLD_PCT
+
+
+def legacy_aggregate(source_rates: Dict[str, Optional[Decimal]]) -> Optional[Decimal]:
+    """기존 _aggregate_and_update_cache 집계 규칙 (리스트 재구성 + 정렬 median)"""
+    rates = [rate for rate in source_rates.values() if rate is not None]
+    if not rates:
+        return None
+    
+    def median(values: List[Decimal]) -> Decimal:
+        ordered = sorted(values)
+        n = len(ordered)
+        if n % 2 == 1:
+            return ordered[n // 2]
+        return (ordered[n // 2 - 1] + ordered[n // 2]) / Decimal("2")
+    
+    if len(rates) >= 3:
+        center = median(rates)
+        low = center * (Decimal("1.0") - THRESHOLD)
+        high = center * (Decimal("1.0") + THRESHOLD)
+        filtered = [r for r in rates if low <= r <= high]
+        if filtered:
+            rates = filtered
+    return median(rates)
+
+
+def synthetic_ticks(count: int, seed: int = 5) -> List[Tuple[str, Decimal]]:
+    """소스별 tick (대부분 값 반복, 간헐적 outlier)"""
+    rng = random.Random(seed)
+    ticks = []
+    mid = 1.0
+    last = {source: Decimal("1.0000") for source in SOURCES}
+    for _ in range(count):
+        source = rng.choice(SOURCES)
+        roll = rng.random()
+        if roll < 0.7:
+            rate = last[source]  # 호가 변동 없는 tick
+        elif roll < 0.995:
+            mid = min(1.02, max(0.98, mid + rng.gauss(0.0, 0.0002)))
+            rate = Decimal(f"{mid + rng.gauss(0.0, 0.0001):.4f}")
+        else:
+            rate = Decimal(f"{mid * rng.choice([0.9, 1.1]):.4f}")  # outlier
+        last[source] = rate
+        ticks.append((source, rate))
+    return ticks
+
+
+def replay(ticks: List[Tuple[str, Decimal]]) -> Dict[str, float]:
+    """두 경로 리플레이 → 불일치 수, tick당 비용"""
+    source_rates: Dict[str, Optional[Decimal]] = {source: None for source in SOURCES}
+    legacy_rates = []
+    started = time.perf_counter()
+    for source, rate in ticks:
+        source_rates[source] = rate
+        legacy_rates.append(legacy_aggregate(source_rates))
+    legacy_elapsed = time.perf_counter() - started
+    
+    aggregator = IncrementalFxAggregator(SOURCES, outlier_threshold_pct=THRESHOLD)
+    fast_rates = []
+    now = 0.0
+    started = time.perf_counter()
+    for source, rate in ticks:
+        now += 0.001
+        fast_rates.append(aggregator.update(source, rate, now)[0].rate)
+    fast_elapsed = time.perf_counter() - started
+    
+    mismatches = sum(
+        1 for a, b in zip(legacy_rates, fast_rates) if a != b or str(a) != str(b)
+    )
+    return {
+        "ticks": len(ticks),
+        "mismatches": mismatches,
+        "legacy_us": legacy_elapsed / len(ticks) * 1e6,
+        "fast_us": fast_elapsed / len(ticks) * 1e6,
+        "recomputes": aggregator.recompute_count,
+    }
+
+
+def measure_get_rate(iterations: int) -> Dict[str, float]:
+    """get_rate() 비용: 발행 스냅샷 vs 기존 FxCache 경로"""
+    fx = MultiSourceFxRateProvider(enable_websocket=False, cache_ttl_seconds=3600.0)
+    fx.cache.set(Currency.USD, Currency.KRW, Decimal("1420.0"))
+    for source, rate in zip(SOURCES, (Decimal("1.000"), Decimal("0.999"), Decimal("1.001"))):
+        fx._on_source_update(source, rate, time.time())
+    
+    get_rate = fx.get_rate
+    started = time.perf_counter()
+    for _ in range(iterations):
+        get_rate(Currency.USDT, Currency.KRW)
+    snapshot_ns = (time.perf_counter() - started) / iterations * 1e9
+    
+    cache_get = fx.cache.get
+    started = time.perf_counter()
+    for _ in range(iterations):
+        cache_get(Currency.USDT, Currency.KRW)
+    cache_ns = (time.perf_counter() - started) / iterations * 1e9
+    
+    return {"snapshot_ns": snapshot_ns, "cache_ns": cache_ns}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Multi-source FX aggregation benchmark")
+    parser.add_argument("--ticks", type=int, default=200_000)
+    parser.add_argument("--get-rate-iterations", type=int, default=500_000)
+    parser.add_argument("--seed", type=int, default=5)
+    args = parser.parse_args()
+    
+    logging.disable(logging.WARNING)
+    
+    print("=" * 80)
+    print("D80-5: Multi-Source FX Aggregation Benchmark")
+    print("=" * 80)
+    
+    result = replay(synthetic_ticks(args.ticks, args.seed))
+    print(f"Ticks:       {result['ticks']:,}  (recomputes: {result['recomputes']:,})")
+    print(f"legacy      {result['legacy_us']:7.2f} us/tick")
+    print(
+        f"incremental {result['fast_us']:7.2f} us/tick  "
+        f"({result['fast_us'] / result['legacy_us'] * 100:5.1f}% of legacy)"
+    )
+    
+    rate_cost = measure_get_rate(args.get_rate_iterations)
+    print(f"get_rate    {rate_cost['snapshot_ns']:7.0f} ns (snapshot)  "
+          f"{rate_cost['cache_ns']:7.0f} ns (FxCache.get)")
+    
+    print(f"Rate mismatches: {result['mismatches']}")
+    passed = result["mismatches"] == 0
+    print("✅ PASS: identical aggregated rates" if passed else "❌ FAIL: aggregation mismatch")
+    print("=" * 80)
+    return 0 if passed else 1
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,205 @@
+"""
+D92-8: Compiled Zone Profile Lookup Benchmark
+
+Zone 판정(기존 경계 리스트 선형 스캔 vs CompiledZoneProfile bisect)과
+CalibrationTable.select_zone(기존 dict → CalibrationZone 선형 스캔 vs Entry slot 인덱스)을
+같은 입력으로 돌려 결과가 동일한지 검증 + 조회 비용 비교.
+"""
+
+import argparse
+import logging
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+# 프로젝트 루트 추가
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from arbitrage.core.zone_profile_applier import ZoneProfileApplier
+from arbitrage.execution.fill_model import CalibrationTable, CalibrationZone
+
+DEFAULT_YAML = PROJECT_ROOT / "config" / "arbitrage" / "zone_profiles_v2.yaml"
+
+# D86 calibration 형태 (entry 경계 공유, tp 범위 별도)
+CALIBRATION_ZONES: List[Dict[str, Any]] = [
+    {"zone_id": "Z1", "entry_min": 5.0, "entry_max": 7.0, "tp_min": 7.0, "tp_max": 12.0,
+     "buy_fill_ratio": 0.2615, "sell_fill_ratio": 1.0, "samples": 120},
+    {"zone_id": "Z2", "entry_min": 7.0, "entry_max": 12.0, "tp_min": 10.0, "tp_max": 20.0,
+     "buy_fill_ratio": 0.6307, "sell_fill_ratio": 1.0, "samples": 80},
+    {"zone_id": "Z3", "entry_min": 12.0, "entry_max": 20.0, "tp_min": 15.0, "tp_max": 25.0,
+     "buy_fill_ratio": 0.2615, "sell_fill_ratio": 1.0, "samples": 40},
+    {"zone_id": "Z4", "entry_min": 20.0, "entry_max": 30.0, "tp_min": 25.0, "tp_max": 40.0,
+     "buy_fill_ratio": 0.2615, "sell_fill_ratio": 1.0, "samples": 10},
+]
+
+
+def legacy_zone_index(boundaries: Sequence[Tuple[float, float]], spread_bps: float) -> int:
+    """기존 방식: 경계 리스트 선형 스캔 (inclusive first-match)"""
+    for i, (zone_min, zone_max) in enumerate(boundaries):
+        if zone_min <= spread_bps <= zone_max:
+            return i
+    return -1
+
+
+def legacy_entry_threshold(thresholds: Dict[str, float], symbol: str) -> float:
+    """기존 ZoneProfileApplier.get_entry_threshold (in 검사 + dict 조회)"""
+    if symbol not in thresholds:
+        raise ValueError(f"No Zone Profile configured for symbol: {symbol}")
+    return thresholds[symbol]
+
+
+def legacy_select_zone(zones: List[Any], entry_bps: float, tp_bps: float) -> Optional[CalibrationZone]:
+    """기존 CalibrationTable.select_zone (매 호출 dict → CalibrationZone 변환 + 선형 스캔)"""
+    for zone_data in zones:
+        if isinstance(zone_data, dict):
+            zone = CalibrationZone(
+                zone_id=zone_data["zone_id"],
+                entry_min=zone_data["entry_min"],
+                entry_max=zone_data["entry_max"],
+                tp_min=zone_data["tp_min"],
+                tp_max=zone_data["tp_max"],
+                buy_fill_ratio=zone_data["buy_fill_ratio"],
+                sell_fill_ratio=zone_data["sell_fill_ratio"],
+                samples=zone_data["samples"],
+            )
+        else:
+            zone = zone_data
+        if (zone.entry_min <= entry_bps <= zone.entry_max and
+                zone.tp_min <= tp_bps <= zone.tp_max):
+            return zone
+    return None
+
+
+def make_calibration(zones: List[Any]) -> CalibrationTable:
+    """벤치마크/테스트용 CalibrationTable"""
+    return CalibrationTable(
+        version="bench",
+        zones=zones,
+        default_buy_fill_ratio=0.2615,
+        default_sell_fill_ratio=1.0,
+        created_at="",
+        source="benchmark",
+    )
+
+
+def sample_spreads(count: int, low: float, high: float, edges: Sequence[float], seed: int) -> List[float]:
+    """랜덤 spread + 경계값 그대로 (경계 first-match 검증용)"""
+    rng = random.Random(seed)
+    return [rng.choice(edges) if rng.random() < 0.1 else rng.uniform(low, high) for _ in range(count)]
+
+
+def compare_zone_profile(applier: ZoneProfileApplier, samples: int, seed: int) -> Dict[str, float]:
+    """심볼별 Zone 판정: 선형 스캔 vs compiled bisect"""
+    compiled = applier.compiled
+    mismatches = 0
+    legacy_elapsed = 0.0
+    fast_elapsed = 0.0
+    legacy_threshold_elapsed = 0.0
+    fast_threshold_elapsed = 0.0
+    legacy_thresholds = dict(zip(compiled.symbols, compiled.thresholds))
+    legacy_boundaries = {symbol: applier.get_zone_boundaries(symbol) for symbol in compiled.symbols}
+    
+    for symbol in compiled.symbols:
+        boundaries = legacy_boundaries[symbol]
+        edges = [edge for zone in boundaries for edge in zone]
+        spreads = sample_spreads(samples, edges[0] - 5.0, edges[-1] + 5.0, edges, seed)
+        
+        started = time.perf_counter()
+        expected = [legacy_zone_index(legacy_boundaries[symbol], s) for s in spreads]
+        legacy_elapsed += time.perf_counter() - started
+        
+        zone_index = applier.get_zone_index
+        started = time.perf_counter()
+        actual = [zone_index(symbol, s) for s in spreads]
+        fast_elapsed += time.perf_counter() - started
+        
+        mismatches += sum(1 for a, b in zip(expected, actual) if a != b)
+        
+        # entry threshold: 기존 dict 조회 (in + getitem) vs compiled threshold_map
+        started = time.perf_counter()
+        for _ in range(samples):
+            legacy_entry_threshold(legacy_thresholds, symbol)
+        legacy_threshold_elapsed += time.perf_counter() - started
+        
+        get_entry_threshold = applier.get_entry_threshold
+        started = time.perf_counter()
+        for _ in range(samples):
+            get_entry_threshold(symbol)
+        fast_threshold_elapsed += time.perf_counter() - started
+    
+    lookups = samples * len(compiled.symbols)
+    return {
+        "lookups": lookups,
+        "mismatches": mismatches,
+        "legacy_ns": legacy_elapsed / lookups * 1e9,
+        "fast_ns": fast_elapsed / lookups * 1e9,
+        "legacy_threshold_ns": legacy_threshold_elapsed / lookups * 1e9,
+        "fast_threshold_ns": fast_threshold_elapsed / lookups * 1e9,
+    }
+
+
+def compare_calibration(samples: int, seed: int) -> Dict[str, float]:
+    """CalibrationTable.select_zone: 기존 선형 스캔 vs Entry slot 인덱스"""
+    rng = random.Random(seed)
+    edges = sorted({z[k] for z in CALIBRATION_ZONES for k in ("entry_min", "entry_max", "tp_min", "tp_max")})
+    queries = [
+        (
+            rng.choice(edges) if rng.random() < 0.1 else rng.uniform(0.0, 45.0),
+            rng.choice(edges) if rng.random() < 0.1 else rng.uniform(0.0, 45.0),
+        )
+        for _ in range(samples)
+    ]
+    calibration = make_calibration(CALIBRATION_ZONES)
+    
+    started = time.perf_counter()
+    expected = [legacy_select_zone(CALIBRATION_ZONES, e, t) for e, t in queries]
+    legacy_elapsed = time.perf_counter() - started
+    
+    select_zone = calibration.select_zone
+    started = time.perf_counter()
+    actual = [select_zone(e, t) for e, t in queries]
+    fast_elapsed = time.perf_counter() - started
+    
+    return {
+        "lookups": samples,
+        "mismatches": sum(1 for a, b in zip(expected, actual) if a != b),
+        "legacy_ns": legacy_elapsed / samples * 1e9,
+        "fast_ns": fast_elapsed / samples * 1e9,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Compiled zone profile lookup benchmark")
+    parser.add_argument("--yaml", type=str, default=str(DEFAULT_YAML))
+    parser.add_argument("--samples", type=int, default=200_000)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+    
+    logging.disable(logging.WARNING)
+    
+    print("=" * 80)
+    print("D92-8: Compiled Zone Profile Lookup Benchmark")
+    print("=" * 80)
+    
+    applier = ZoneProfileApplier.from_file(args.yaml)
+    zone = compare_zone_profile(applier, args.samples, args.seed)
+    print(f"Zone profile: {args.yaml} ({len(applier.compiled.symbols)} symbols, {zone['lookups']:,} lookups)")
+    print(f"zone index  legacy {zone['legacy_ns']:7.0f} ns   compiled {zone['fast_ns']:7.0f} ns")
+    print(f"threshold   legacy {zone['legacy_threshold_ns']:7.0f} ns   compiled {zone['fast_threshold_ns']:7.0f} ns")
+    
+    calibration = compare_calibration(args.samples, args.seed)
+    print(f"select_zone legacy {calibration['legacy_ns']:7.0f} ns   indexed  {calibration['fast_ns']:7.0f} ns")
+    
+    mismatches = zone["mismatches"] + calibration["mismatches"]
+    print(f"Mismatches: {mismatches}")
+    passed = mismatches == 0
+    print("✅ PASS: identical zone resolution" if passed else "❌ FAIL: zone resolution mismatch")
+    print("=" * 80)
+    return 0 if passed else 1
+
+
+if __name__ == "__main__":
+    exit(main())
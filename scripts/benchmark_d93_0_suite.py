@@ -0,0 +1,167 @@
+"""
+D93-0: Unified Benchmark Suite
+
+핫 경로 공통 벤치마크 실행 + baseline 비교 (회귀 시 exit 1).
+
+사용 예:
+    # baseline 저장
+    python scripts/benchmark_d93_0_suite.py --output logs/d93/baseline.json
+    # 변경 후 비교 (회귀 있으면 exit 1, dataset 불일치 exit 2)
+    python scripts/benchmark_d93_0_suite.py --baseline logs/d93/baseline.json
+    # 녹화 데이터셋 + 일부 케이스
+    python scripts/benchmark_d93_0_suite.py --recorded data/ws_capture.jsonl --cases "ws_parse.*"
+    # 저장된 리포트 2개만 비교
+    python scripts/benchmark_d93_0_suite.py --compare old.json new.json
+
+Redis/PostgreSQL은 in-process stand-in 사용 (서버 불필요).
+"""
+
+import argparse
+import logging
+import sys
+from pathlib import Path
+
+# 프로젝트 루트 추가
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from arbitrage.benchmark import (
+    BenchmarkReport,
+    BenchmarkResult,
+    BenchmarkRunner,
+    BenchmarkSettings,
+    ComparisonReport,
+    compare_reports,
+    default_cases,
+    load_recorded,
+    save_recorded,
+    select_cases,
+    synthetic_dataset,
+)
+
+EXIT_OK = 0
+EXIT_REGRESSION = 1
+EXIT_INCOMPARABLE = 2
+
+
+def format_result(result: BenchmarkResult) -> str:
+    """결과 한 줄"""
+    if not result.ok:
+        return f"{result.name:<28} {result.status:<8} {result.reason}"
+    peak = f"{result.peak_bytes:>10,} B" if result.peak_bytes is not None else f"{'-':>12}"
+    return (
+        f"{result.name:<28} {result.median_ns:10.0f} {result.p95_ns:10.0f} {result.cv * 100:5.1f}% "
+        f"{peak} {result.ops:>7,}"
+    )
+
+
+def print_comparison(comparison: ComparisonReport) -> None:
+    print("-" * 80)
+    if not comparison.comparable:
+        print("⚠️  dataset fingerprint mismatch: baseline과 입력이 달라 비교 불가")
+    for case in comparison.comparisons:
+        print(case.describe())
+    print("-" * 80)
+    if comparison.regressions:
+        names = ", ".join(case.name for case in comparison.regressions)
+        print(f"❌ FAIL: {len(comparison.regressions)} regression(s): {names}")
+    elif comparison.comparable:
+        print(f"✅ PASS: no regression (alpha={comparison.alpha}, threshold={comparison.threshold * 100:.0f}%)")
+
+
+def exit_code(comparison: ComparisonReport) -> int:
+    if not comparison.comparable:
+        return EXIT_INCOMPARABLE
+    return EXIT_REGRESSION if comparison.regressions else EXIT_OK
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Unified benchmark suite + regression gate")
+    parser.add_argument("--cases", nargs="*", default=None, help="케이스 glob 패턴 (예: 'ws_parse.*')")
+    parser.add_argument("--list", action="store_true", help="케이스 목록 출력")
+    parser.add_argument("--ticks", type=int, default=2000, help="합성 데이터셋 tick 수")
+    parser.add_argument("--seed", type=int, default=93, help="합성 데이터셋 seed")
+    parser.add_argument("--recorded", type=str, default=None, help="녹화 JSONL 데이터셋 경로")
+    parser.add_argument("--record-to", type=str, default=None, help="사용한 데이터셋을 JSONL로 저장")
+    parser.add_argument("--warmup", type=int, default=2)
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--no-memory", action="store_true", help="tracemalloc 측정 생략")
+    parser.add_argument("--output", type=str, default=None, help="리포트 JSON 저장 경로 (baseline)")
+    parser.add_argument("--baseline", type=str, default=None, help="비교할 baseline JSON")
+    parser.add_argument("--compare", nargs=2, metavar=("BASELINE", "CURRENT"), default=None,
+                        help="실행 없이 저장된 리포트 2개 비교")
+    parser.add_argument("--alpha", type=float, default=0.01, help="유의수준")
+    parser.add_argument("--threshold", type=float, default=0.05, help="median 회귀 임계값 (0.05 = 5%%)")
+    parser.add_argument("--memory-threshold", type=float, default=0.25, help="peak 메모리 회귀 임계값")
+    args = parser.parse_args()
+    
+    logging.basicConfig(level=logging.WARNING, format="%(levelname)s %(message)s")
+    # 측정 대상 코드의 INFO/DEBUG 로그 출력 비용 제외 (f-string 생성 비용은 실제 경로대로 포함)
+    logging.disable(logging.INFO)
+    
+    print("=" * 80)
+    print("D93-0: Unified Benchmark Suite")
+    print("=" * 80)
+    
+    if args.compare:
+        comparison = compare_reports(
+            BenchmarkReport.load(args.compare[0]),
+            BenchmarkReport.load(args.compare[1]),
+            alpha=args.alpha,
+            threshold=args.threshold,
+            memory_threshold=args.memory_threshold,
+        )
+        print_comparison(comparison)
+        print("=" * 80)
+        return exit_code(comparison)
+    
+    cases = select_cases(default_cases(), args.cases)
+    if args.list:
+        for case in cases:
+            print(f"{case.name:<28} {case.description}")
+        return EXIT_OK
+    if not cases:
+        print(f"❌ FAIL: no case matches {args.cases}")
+        return EXIT_REGRESSION
+    
+    dataset = load_recorded(args.recorded) if args.recorded else synthetic_dataset(ticks=args.ticks, seed=args.seed)
+    if args.record_to:
+        save_recorded(dataset, args.record_to)
+        print(f"Dataset saved: {args.record_to}")
+    print(f"Dataset: {dataset.name} ({dataset.ticks:,} ticks, fingerprint {dataset.fingerprint[:12]})")
+    print(f"Settings: warmup={args.warmup}, repeat={args.repeat}, memory={'off' if args.no_memory else 'on'}")
+    print("-" * 80)
+    print(f"{'case':<28} {'median ns':>10} {'p95 ns':>10} {'cv':>6} {'peak mem':>12} {'ops':>7}")
+    
+    runner = BenchmarkRunner(BenchmarkSettings(
+        warmup=args.warmup,
+        repetitions=args.repeat,
+        track_memory=not args.no_memory,
+    ))
+    report = runner.run(cases, dataset, progress=lambda result: print(format_result(result)))
+    
+    if args.output:
+        report.save(args.output)
+        print(f"Report saved: {args.output}")
+    
+    errors = [result.name for result in report.results if result.status == "error"]
+    if errors:
+        print(f"❌ FAIL: case error(s): {', '.join(errors)}")
+    
+    code = EXIT_REGRESSION if errors else EXIT_OK
+    if args.baseline:
+        comparison = compare_reports(
+            BenchmarkReport.load(args.baseline),
+            report,
+            alpha=args.alpha,
+            threshold=args.threshold,
+            memory_threshold=args.memory_threshold,
+        )
+        print_comparison(comparison)
+        code = max(code, exit_code(comparison))
+    print("=" * 80)
+    return code
+
+
+if __name__ == "__main__":
+    exit(main())
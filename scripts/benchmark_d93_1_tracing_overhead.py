@@ -0,0 +1,191 @@
+"""
+D93-1: Tick Tracing Overhead Benchmark
+
+WS frame 수신 → 어댑터 파싱 → ArbitrageLiveRunner(build_snapshot → process_snapshot → execute_trades)
+전체 경로를 tracer 없이/있이 번갈아 실행해 오버헤드 측정.
+
+- 입력: D93-0 합성 데이터셋 (Upbit/Binance frame 교대, 최대 메시지 속도 = 대기 없음)
+- 판정: 오버헤드 < 1% (기본 sample_every)
+  전 frame 추적 시 오버헤드(paired median)를 sample_every로 환산 + 미샘플 frame 고정 비용
+
+사용 예:
+    python scripts/benchmark_d93_1_tracing_overhead.py
+    python scripts/benchmark_d93_1_tracing_overhead.py --sample-every 1 --ticks 5000
+"""
+
+import argparse
+import gc
+import logging
+import statistics
+import sys
+import time
+import timeit
+from pathlib import Path
+
+# 프로젝트 루트 추가
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from arbitrage.arbitrage_core import ArbitrageConfig, ArbitrageEngine
+from arbitrage.benchmark import synthetic_dataset
+from arbitrage.exchanges import PaperExchange
+from arbitrage.exchanges.binance_ws_adapter import BinanceWebSocketAdapter
+from arbitrage.exchanges.market_data_provider import MarketDataProvider
+from arbitrage.exchanges.upbit_ws_adapter import UpbitWebSocketAdapter
+from arbitrage.live_runner import ArbitrageLiveConfig, ArbitrageLiveRunner, RiskLimits
+from arbitrage.tracing import TICK_TO_DECISION, TickTracer, newest_trace
+
+MAX_OVERHEAD = 0.01
+
+
+class AdapterSnapshotProvider(MarketDataProvider):
+    """어댑터가 마지막으로 파싱한 스냅샷을 그대로 제공 (WS provider 최소 대체)"""
+    
+    def __init__(self, adapters):
+        super().__init__()
+        self.adapters = adapters
+    
+    def get_latest_snapshot(self, symbol):
+        return self.adapters[symbol]._last_snapshots.get(symbol)
+    
+    def start(self):
+        pass
+    
+    def stop(self):
+        pass
+
+
+def build_pipeline(dataset, tracer):
+    """tracer 설정된 (또는 None) 수신 → runner 파이프라인"""
+    upbit = UpbitWebSocketAdapter(symbols=["KRW-BTC"], callback=lambda snapshot: None)
+    binance = BinanceWebSocketAdapter(symbols=["btcusdt"], callback=lambda snapshot: None)
+    upbit.tracer = tracer
+    binance.tracer = tracer
+    
+    engine = ArbitrageEngine(ArbitrageConfig(
+        min_spread_bps=30.0,
+        taker_fee_a_bps=5.0,
+        taker_fee_b_bps=10.0,
+        slippage_bps=5.0,
+        max_position_usd=1000.0,
+        exchange_a_to_b_rate=dataset.fx_rate,
+    ))
+    runner = ArbitrageLiveRunner(
+        engine=engine,
+        exchange_a=PaperExchange(),
+        exchange_b=PaperExchange(),
+        config=ArbitrageLiveConfig(
+            symbol_a="KRW-BTC",
+            symbol_b="BTCUSDT",
+            data_source="ws",
+            # 진입/종료가 계속 일어나도록 RiskGuard 한도 해제
+            risk_limits=RiskLimits(max_daily_loss=float("inf"), max_open_trades=1_000_000),
+        ),
+        market_data_provider=AdapterSnapshotProvider({"KRW-BTC": upbit, "BTCUSDT": binance}),
+        tracer=tracer,
+    )
+    
+    frames = list(zip(dataset.upbit_frames, dataset.binance_frames))
+    
+    def run() -> int:
+        for upbit_raw, binance_raw in frames:
+            for adapter, raw in ((upbit, upbit_raw), (binance, binance_raw)):
+                adapter._handle_raw_message(raw)
+                snapshot = runner.build_snapshot()
+                if snapshot is None:
+                    continue
+                runner.execute_trades(runner.process_snapshot(snapshot))
+        return len(frames) * 2
+    return run
+
+
+def measure(run) -> float:
+    """1회 실행 → frame당 ns"""
+    gc.collect()
+    start = time.perf_counter_ns()
+    ops = run()
+    return (time.perf_counter_ns() - start) / ops
+
+
+def paired_overhead(dataset, tracer, rounds):
+    """baseline/traced 교대 실행 → (baseline median ns, 라운드별 traced/baseline 비율 median - 1)"""
+    baseline, traced = [], []
+    for round_index in range(rounds):
+        # 실행 순서를 번갈아 바꿔 직전 실행의 garbage/캐시 영향 상쇄
+        order = ((baseline, None), (traced, tracer))
+        for samples, round_tracer in (order if round_index % 2 == 0 else order[::-1]):
+            # 라운드마다 새 파이프라인 (엔진 포지션 상태를 동일 조건으로 시작)
+            samples.append(measure(build_pipeline(dataset, round_tracer)))
+    return statistics.median(baseline), statistics.median(t / b for b, t in zip(baseline, traced)) - 1.0
+
+
+def unsampled_cost_ns(dataset) -> float:
+    """미샘플 frame이 추가로 치르는 비용 (tracer.start 카운터 + runner의 newest_trace 조회)"""
+    tracer = TickTracer(sample_every=10 ** 9)
+    tracer.start()
+    upbit = UpbitWebSocketAdapter(symbols=["KRW-BTC"], callback=lambda snapshot: None)
+    binance = BinanceWebSocketAdapter(symbols=["btcusdt"], callback=lambda snapshot: None)
+    upbit._handle_raw_message(dataset.upbit_frames[0])
+    binance._handle_raw_message(dataset.binance_frames[0])
+    snapshot_a = upbit._last_snapshots["KRW-BTC"]
+    snapshot_b = binance._last_snapshots["BTCUSDT"]
+    
+    def path():
+        tracer.start()
+        newest_trace(snapshot_a, snapshot_b)
+    
+    count = 200_000
+    return min(timeit.repeat(path, number=count, repeat=5)) / count * 1e9
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Tick tracing overhead benchmark")
+    parser.add_argument("--ticks", type=int, default=500, help="합성 데이터셋 tick 수")
+    parser.add_argument("--seed", type=int, default=93)
+    parser.add_argument("--sample-every", type=int, default=TickTracer().sample_every, help="N건 중 1건 추적")
+    parser.add_argument("--rounds", type=int, default=21, help="baseline/traced 교대 실행 횟수")
+    args = parser.parse_args()
+    
+    logging.disable(logging.CRITICAL)
+    
+    print("=" * 80)
+    print("D93-1: Tick Tracing Overhead Benchmark")
+    print("=" * 80)
+    
+    dataset = synthetic_dataset(ticks=args.ticks, seed=args.seed)
+    print(f"Dataset: {dataset.name} ({dataset.ticks:,} ticks → {dataset.ticks * 2:,} frames)")
+    print(f"sample_every={args.sample_every}, rounds={args.rounds}")
+    
+    # 전 frame 추적(sample_every=1)으로 trace 1건 비용을 측정하고 sample_every로 환산.
+    # 1% 미만 차이는 반복 실행 간 노이즈(수 %)에 묻혀 직접 비교로는 판정 불가
+    tracer = TickTracer(sample_every=1, slow_threshold_ms=float("inf"))
+    build_pipeline(dataset, None)()
+    build_pipeline(dataset, tracer)()
+    tracer.reset()
+    
+    baseline_ns, full_overhead = paired_overhead(dataset, tracer, args.rounds)
+    fixed_overhead = unsampled_cost_ns(dataset) / baseline_ns
+    overhead = fixed_overhead + max(full_overhead - fixed_overhead, 0.0) / args.sample_every
+    
+    print("-" * 80)
+    print(f"baseline:              {baseline_ns / 1000:8.2f} µs/frame (median)")
+    print(f"trace every frame:     {full_overhead * 100:+8.2f}% (median of paired rounds)")
+    print(f"unsampled frame cost:  {fixed_overhead * 100:+8.3f}%")
+    print(f"sample_every={args.sample_every:<9} {overhead * 100:+8.3f}% (estimated)")
+    print("-" * 80)
+    print(tracer.get_summary())
+    print("-" * 80)
+    
+    if not tracer.percentiles(TICK_TO_DECISION):
+        print("❌ FAIL: no trace finished")
+        return 1
+    if overhead >= MAX_OVERHEAD:
+        print(f"❌ FAIL: overhead {overhead * 100:.2f}% >= {MAX_OVERHEAD * 100:.0f}%")
+        return 1
+    print(f"✅ PASS: overhead {overhead * 100:.2f}% < {MAX_OVERHEAD * 100:.0f}%")
+    print("=" * 80)
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,129 @@
+"""
+D93-2: Streaming Long-run Analyzer Benchmark
+
+합성 롱런 메트릭 JSONL 파일을 만들어
+리스트 적재 후 분석(analyze_metrics_log) vs 스트리밍 분석(StreamingLongrunAnalyzer.feed_file)의
+처리량(MB/s, entries/s)과 peak 메모리(tracemalloc)를 비교.
+
+- 판정: 스트리밍 peak 메모리가 입력 크기와 무관하게 상한 이내 (기본 64MB)
+
+사용 예:
+    python scripts/benchmark_d93_2_longrun_analyzer.py
+    python scripts/benchmark_d93_2_longrun_analyzer.py --entries 1000000 --skip-list
+"""
+
+import argparse
+import json
+import logging
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# 프로젝트 루트 추가
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from arbitrage.monitoring.longrun_analyzer import LongrunAnalyzer, StreamingLongrunAnalyzer
+
+MAX_STREAMING_PEAK_MB = 64.0
+
+
+def write_metrics(path: str, entries: int, seed: int) -> None:
+    """1초 간격 합성 메트릭 (메모리 완만 증가, 간헐적 스파이크/에러)"""
+    rng = random.Random(seed)
+    start = datetime(2025, 12, 1)
+    with open(path, "w", encoding="utf-8") as f:
+        for i in range(entries):
+            f.write(json.dumps({
+                "timestamp": (start + timedelta(seconds=i)).isoformat(),
+                "loop_time_ms": rng.uniform(900.0, 1100.0) if i % 5000 else 1800.0,
+                "trades_opened": 1 if i % 100 == 0 else 0,
+                "spread_bps": rng.uniform(-5.0, 60.0),
+                "snapshot_none": False,
+                "error_log": i % 2000 == 0,
+                "warning_log": False,
+                "ws_latency_ms": rng.uniform(20.0, 80.0),
+                "ws_queue_lag_ms": rng.uniform(0.0, 10.0),
+                "ws_queue_depth": rng.randint(0, 20),
+                "memory_mb": 300.0 + i / 36000.0,
+            }) + "\n")
+
+
+def run_list(path: str):
+    """기존 방식: 전체 적재 → 분석"""
+    with open(path, "r", encoding="utf-8") as f:
+        log_data = [json.loads(line) for line in f if line.strip()]
+    return LongrunAnalyzer(scenario="S3").analyze_metrics_log(log_data)
+
+
+def run_streaming(path: str):
+    analyzer = StreamingLongrunAnalyzer(scenario="S3")
+    analyzer.feed_file(path)
+    return analyzer.report()
+
+
+def measure(name: str, run, path: str, size_mb: float):
+    """(처리 시간, peak MB, report) — 시간은 tracemalloc 없이 별도 측정"""
+    start = time.perf_counter()
+    report = run(path)
+    elapsed = time.perf_counter() - start
+    
+    tracemalloc.start()
+    run(path)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    peak_mb = peak / (1024 * 1024)
+    
+    print(
+        f"{name:<10} {elapsed:8.2f}s  {size_mb / elapsed:8.1f} MB/s  "
+        f"{report.entries_processed / elapsed:12,.0f} entries/s  peak {peak_mb:8.1f} MB"
+    )
+    return elapsed, peak_mb, report
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Streaming long-run analyzer benchmark")
+    parser.add_argument("--entries", type=int, default=200_000, help="합성 메트릭 entry 수 (1초 간격)")
+    parser.add_argument("--seed", type=int, default=93)
+    parser.add_argument("--skip-list", action="store_true", help="리스트 적재 방식 측정 생략 (대용량)")
+    args = parser.parse_args()
+    
+    logging.disable(logging.CRITICAL)
+    
+    print("=" * 80)
+    print("D93-2: Streaming Long-run Analyzer Benchmark")
+    print("=" * 80)
+    
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "metrics.jsonl")
+        write_metrics(path, args.entries, args.seed)
+        size_mb = os.path.getsize(path) / (1024 * 1024)
+        print(f"Input: {args.entries:,} entries ({args.entries / 3600:.1f}h @1s), {size_mb:.1f} MB")
+        print("-" * 80)
+        
+        if not args.skip_list:
+            measure("list", run_list, path, size_mb)
+        _, peak_mb, report = measure("streaming", run_streaming, path, size_mb)
+    
+    print("-" * 80)
+    print(f"memory slope: {report.memory_trend.slope_per_hour:+.2f} MB/h, "
+          f"loop drift: {report.loop_time_trend.slope_per_hour:+.3f} ms/h, "
+          f"loop p99: {report.latency_percentiles['loop_time_ms']['p99']:.1f} ms")
+    print(f"anomalies: {sorted({a.category for a in report.anomalies})}")
+    print("-" * 80)
+    
+    if peak_mb >= MAX_STREAMING_PEAK_MB:
+        print(f"❌ FAIL: streaming peak {peak_mb:.1f} MB >= {MAX_STREAMING_PEAK_MB:.0f} MB")
+        return 1
+    print(f"✅ PASS: streaming peak {peak_mb:.1f} MB < {MAX_STREAMING_PEAK_MB:.0f} MB")
+    print("=" * 80)
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,129 @@
+"""
+D93-3: Buffered Storage Write Benchmark
+
+CsvStorage 즉시 기록(행마다 open/append/close) vs 버퍼링 기록(BufferedWriter + writer 스레드)의
+호출자(트레이딩 스레드) 측 log_* 지연 p50/p99/max와 처리량 비교.
+
+- 판정: 버퍼링 모드 호출자 p99가 기준 이하 (기본 0.5ms) + 누락/버림 없음
+
+사용 예:
+    python scripts/benchmark_d93_3_storage_write.py
+    python scripts/benchmark_d93_3_storage_write.py --rows 50000 --fsync never
+"""
+
+import argparse
+import logging
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+# 프로젝트 루트 추가
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from arbitrage.models import OrderLeg, SpreadOpportunity
+from arbitrage.perf import LatencyHistogram
+from arbitrage.storage import CsvStorage, WriteBufferConfig
+
+MAX_BUFFERED_P99_MS = 0.5
+
+
+def run(storage: CsvStorage, rows: int):
+    """spread/order를 번갈아 기록 → (호출 지연 히스토그램, 총 소요 시간)"""
+    start_ts = datetime(2025, 12, 1, tzinfo=timezone.utc)
+    histogram = LatencyHistogram()
+    begin = time.perf_counter()
+    for i in range(rows):
+        if i % 2:
+            record = OrderLeg(
+                symbol="BTC",
+                venue="upbit",
+                side="buy",
+                qty=0.01,
+                price_theoretical=50_000_000.0,
+                timestamp=start_ts + timedelta(milliseconds=i),
+                leg_id=f"pos_{i}_leg_0",
+            )
+            start = time.perf_counter()
+            storage.log_order(record)
+        else:
+            record = SpreadOpportunity(
+                symbol="BTC",
+                upbit_price=50_000_000.0 + i,
+                binance_price=37_000.0,
+                binance_price_krw=49_950_000.0,
+                spread_pct=0.1,
+                net_spread_pct=0.05,
+                timestamp=1_700_000_000_000 + i,
+            )
+            start = time.perf_counter()
+            storage.log_spread(record)
+        histogram.record((time.perf_counter() - start) * 1000.0)
+    storage.close()
+    return histogram, time.perf_counter() - begin
+
+
+def report(name: str, histogram: LatencyHistogram, elapsed: float, rows: int) -> None:
+    p = histogram.percentiles((50, 99))
+    print(
+        f"{name:<10} p50 {p[50]:7.3f} ms  p99 {p[99]:7.3f} ms  max {histogram.max:8.3f} ms  "
+        f"{rows / elapsed:10,.0f} rows/s"
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Buffered storage write benchmark")
+    parser.add_argument("--rows", type=int, default=20_000, help="기록할 행 수")
+    parser.add_argument("--fsync", default="batch", choices=["never", "batch", "interval"])
+    parser.add_argument("--batch-rows", type=int, default=500)
+    args = parser.parse_args()
+    
+    logging.disable(logging.CRITICAL)
+    
+    print("=" * 80)
+    print("D93-3: Buffered Storage Write Benchmark")
+    print("=" * 80)
+    print(f"Rows: {args.rows:,}, fsync: {args.fsync}, max_batch_rows: {args.batch_rows}")
+    print("-" * 80)
+    
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        direct, direct_elapsed = run(CsvStorage(str(Path(tmp_dir) / "direct")), args.rows)
+        report("direct", direct, direct_elapsed, args.rows)
+        
+        buffer = WriteBufferConfig(max_batch_rows=args.batch_rows, fsync=args.fsync)
+        storage = CsvStorage(str(Path(tmp_dir) / "buffered"), buffer=buffer)
+        buffered, buffered_elapsed = run(storage, args.rows)
+        report("buffered", buffered, buffered_elapsed, args.rows)
+        
+        metrics = storage.get_write_metrics()
+        written = sum(
+            len((Path(tmp_dir) / "buffered" / name).read_text(encoding="utf-8").splitlines()) - 1
+            for name in ("spreads.csv", "orders.csv")
+        )
+    
+    print("-" * 80)
+    print(
+        f"flushes: {metrics['storage_csv_flush_count']}, "
+        f"flush avg {metrics['storage_csv_flush_latency_avg_ms']:.2f} ms / "
+        f"p99 {metrics['storage_csv_flush_latency_p99_ms']:.2f} ms, "
+        f"max depth {metrics['storage_csv_buffer_max_depth']}, "
+        f"blocked {metrics['storage_csv_blocked_count']}, dropped {metrics['storage_csv_dropped_rows']}"
+    )
+    print("-" * 80)
+    
+    p99 = buffered.value_at_percentile(99.0)
+    if written != args.rows or metrics["storage_csv_dropped_rows"]:
+        print(f"❌ FAIL: {written:,}/{args.rows:,} rows written, {metrics['storage_csv_dropped_rows']} dropped")
+        return 1
+    if p99 > MAX_BUFFERED_P99_MS:
+        print(f"❌ FAIL: buffered caller p99 {p99:.3f} ms > {MAX_BUFFERED_P99_MS} ms")
+        return 1
+    print(f"✅ PASS: buffered caller p99 {p99:.3f} ms <= {MAX_BUFFERED_P99_MS} ms, all rows written")
+    print("=" * 80)
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
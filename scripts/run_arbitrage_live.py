@@ -111,6 +111,10 @@ def create_exchanges(config: dict, mode: str):
         exchange_b_config = exchanges_config.get("b", {}).get("config", {})
         exchange_b = BinanceFuturesExchange(exchange_b_config)
         
+        # 첫 주문 전에 keep-alive 커넥션 확보
+        exchange_a.prewarm()
+        exchange_b.prewarm()
+        
         logger.info(f"[D47_CLI] Created Live Trading exchanges: A={exchange_a.name}, B={exchange_b.name}")
         return exchange_a, exchange_b
     
@@ -225,6 +225,9 @@ class BotService:
             self.logger.error(f"[BOT] Unexpected error: {e}", exc_info=True)
             return 1
         finally:
+            # 버퍼된 저장소 기록 반영 (D93-3)
+            if self.storage is not None:
+                self.storage.close()
             self.logger.info(
                 f"[BOT] Shutting down (completed {iteration_count} iterations)"
             )
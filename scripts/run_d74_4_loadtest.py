@@ -14,6 +14,7 @@ Usage:
     python scripts/run_d74_4_loadtest.py --top-n 10
     python scripts/run_d74_4_loadtest.py --top-n 20 --duration-minutes 15
     python scripts/run_d74_4_loadtest.py --top-n 50 --duration-minutes 10 --log-level INFO
+    python scripts/run_d74_4_loadtest.py --top-n 50 --duration-minutes 10 --shards 4  # D74-5
 """
 
 import argparse
@@ -248,6 +249,7 @@ async def run_d74_4_campaign(
     config: ArbitrageConfig,
     top_n: int,
     duration_minutes: float = 15.0,
+    num_shards: int = 1,
 ) -> Dict[str, Any]:
     """
     D74-4 Load Test 캠페인 실행 (CPU/Memory 측정 포함)
@@ -256,13 +258,14 @@ async def run_d74_4_campaign(
         config: ArbitrageConfig
         top_n: 심볼 개수
         duration_minutes: 실행 시간 (분)
+        num_shards: 워커 프로세스 수 (D74-5, 1이면 단일 프로세스)
     
     Returns:
         실행 통계 dict
     """
     logger.info(f"\n{'='*80}")
     logger.info(f"D74-4: Multi-Symbol Load Test (Top-{top_n})")
-    logger.info(f"Duration: {duration_minutes:.1f} minutes")
+    logger.info(f"Duration: {duration_minutes:.1f} minutes, shards: {num_shards}")
     logger.info(f"{'='*80}\n")
     
     # 1. Paper Exchange 생성
@@ -314,7 +317,8 @@ async def run_d74_4_campaign(
     try:
         stats = await runner.run_multi(
             max_iterations=None,
-            max_runtime_seconds=max_runtime
+            max_runtime_seconds=max_runtime,
+            num_shards=num_shards,
         )
         
         runtime = time.time() - start_time
@@ -354,6 +358,7 @@ async def run_d74_4_campaign(
             stats["risk_stats"] = final_risk_stats
         
         # 11. PaperExchange 체결 분석
+        # (샤드 모드에서는 워커별 거래소 사본에서 체결되므로 샤드 통계의 total_trades 사용)
         trade_stats_a = analyze_paper_exchange_trades(exchange_a)
         trade_stats_b = analyze_paper_exchange_trades(exchange_b)
         
@@ -368,6 +373,14 @@ async def run_d74_4_campaign(
         stats["traded_symbols_list"] = list(all_traded_symbols)
         stats["total_filled_orders"] = trade_stats_a["filled_orders"] + trade_stats_b["filled_orders"]
         
+        # D74-5: 샤드별 처리량 (스케일링 확인)
+        for shard in stats.get("shards", []):
+            logger.info(
+                f"[D74-5_SHARD] shard {shard['shard_id']} (pid={shard['pid']}): "
+                f"symbols={len(shard['symbols'])}, iterations={shard['total_iterations']}, "
+                f"trades={shard['total_trades']}, iter/sec={shard['iterations_per_second']:.2f}"
+            )
+        
         # 12. 성능 지표 계산
         if runtime > 0 and stats.get("total_iterations", 0) > 0:
             total_iterations = stats["total_iterations"]
@@ -435,6 +448,7 @@ def print_summary(stats: Dict[str, Any]) -> None:
     # 체결 정보
     print(f"\n[Trade Execution]")
     print(f"  Total filled orders: {stats.get('total_filled_orders', 0)}")
+    print(f"  Total trades opened: {stats.get('total_trades', 0)}")
     print(f"  Traded symbols count: {stats.get('total_traded_symbols', 0)}")
     
     # 성능 지표
@@ -445,6 +459,16 @@ def print_summary(stats: Dict[str, Any]) -> None:
         print(f"  Throughput: {perf.get('throughput_iter_per_sec', 0):.2f} iter/sec")
         print(f"  Total iterations: {perf.get('total_iterations', 0)}")
     
+    # D74-5: 샤드별 처리량
+    if stats.get("shards"):
+        print(f"\n[Shards] ({stats.get('num_shards')} workers, {stats.get('start_method')})")
+        for shard in stats["shards"]:
+            print(
+                f"  shard {shard['shard_id']}: {len(shard['symbols'])} symbols, "
+                f"{shard['iterations_per_second']:.2f} iter/sec"
+                + (f", error={shard['error']}" if "error" in shard else "")
+            )
+    
     # 리소스 사용량
     if "resource_metrics" in stats:
         res = stats["resource_metrics"]
@@ -482,6 +506,12 @@ def main():
         choices=["DEBUG", "INFO", "WARNING", "ERROR"],
         help="Log level (default: INFO)"
     )
+    parser.add_argument(
+        "--shards",
+        type=int,
+        default=1,
+        help="Worker processes for symbol sharding (D74-5, default: 1)"
+    )
     
     args = parser.parse_args()
     
@@ -511,6 +541,7 @@ def main():
         config=config,
         top_n=args.top_n,
         duration_minutes=args.duration_minutes,
+        num_shards=args.shards,
     ))
     
     # 요약 출력
@@ -25,11 +25,12 @@ import logging
 import os
 import sys
 import time
+from collections import deque
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 
 try:
     import psutil
@@ -198,6 +199,7 @@ def evaluate_validation(
 
 from arbitrage.domain.topn_provider import TopNProvider, TopNMode
 from arbitrage.domain.exit_strategy import ExitStrategy, ExitConfig, ExitReason
+from arbitrage.domain.exit_scheduler import ExitScheduler
 from config.base import (
     ArbitrageConfig,
     ExchangeConfig,
@@ -433,7 +435,12 @@ class D77PAPERRunner:
             selection_rate_limit_enabled=self.settings.topn_selection.selection_rate_limit_enabled,
             selection_batch_size=self.settings.topn_selection.selection_batch_size,
             selection_batch_delay_sec=self.settings.topn_selection.selection_batch_delay_sec,
+            # TTL 만료 시 이전 Universe 유지, 백그라운드 갱신
+            background_refresh=True,
         )
+        # 갱신 스레드 → 메인 루프 churn 이벤트 전달 (deque append/popleft는 스레드 안전)
+        self._topn_churn_events: deque = deque()
+        self.topn_provider.add_churn_listener(self._topn_churn_events.append)
         logger.info(
             f"[D82-2/D82-3] TopNProvider Hybrid Mode: "
             f"selection={self.settings.topn_selection.selection_data_source}, "
@@ -453,6 +460,8 @@ class D77PAPERRunner:
                 spread_reversal_threshold_bps=-10.0,
             )
         )
+        # TP/SL 트리거 레벨 + TIME_LIMIT 타이머 휠 (트리거된 position만 check_exit)
+        self.exit_scheduler = ExitScheduler(self.exit_strategy)
         logger.info(f"[D92-7-5] Exit Strategy: max_hold_time={max_hold_time}s (gate_mode={self.gate_mode})")
         
         # Metrics
@@ -572,6 +581,8 @@ class D77PAPERRunner:
         logger.info(f"[D77-0] TopN symbols selected: {len(topn_result.symbols)} symbols")
         for i, (symbol_a, symbol_b) in enumerate(topn_result.symbols[:10], 1):
             logger.info(f"  #{i:2d}: {symbol_a} ↔ {symbol_b}")
+        universe = list(topn_result.symbols)
+        self._topn_churn_events.clear()
         
         # 2. PAPER 실행 (Simplified mock loop)
         logger.info("[D77-0] Starting PAPER loop...")
@@ -607,8 +618,16 @@ class D77PAPERRunner:
                 
                 break  # 즉시 중단
             
+            # TopN 갱신 반영 (TTL 만료 시 백그라운드 갱신, 루프는 대기하지 않음)
+            self.topn_provider.get_topn_symbols()
+            self._apply_topn_churn(universe)
+            
+            # D92-8: Zone Profile YAML 변경 시 검증 후 교체 (재시작 불필요)
+            if self.zone_profile_applier:
+                self.zone_profile_applier.maybe_reload()
+            
             # D82-0: Real PaperExecutor 기반 arbitrage iteration
-            await self._real_arbitrage_iteration(iteration, topn_result.symbols)
+            await self._real_arbitrage_iteration(iteration, universe)
             
             loop_latency_ms = (time.time() - loop_start) * 1000
             loop_latency_seconds = loop_latency_ms / 1000.0
@@ -688,6 +707,23 @@ class D77PAPERRunner:
             logger.info(f"[D82-0] Created PaperExecutor for {symbol}")
         return self.executors[symbol]
     
+    def _apply_topn_churn(self, universe: List[tuple[str, str]]) -> None:
+        """
+        TopN churn 이벤트를 Universe에 증분 반영.
+        
+        제거된 심볼의 열린 포지션은 Exit 로직이 계속 처리한다.
+        """
+        while self._topn_churn_events:
+            event = self._topn_churn_events.popleft()
+            removed = set(event.removed)
+            universe[:] = [pair for pair in universe if pair not in removed]
+            present = set(universe)
+            universe.extend(pair for pair in event.added if pair not in present)
+            logger.info(
+                f"[TOPN_CHURN] +{len(event.added)} / -{len(event.removed)} symbols "
+                f"(universe={len(universe)}, churn_rate={event.result.churn_rate:.2%})"
+            )
+    
     async def _real_arbitrage_iteration(
         self,
         iteration: int,
@@ -837,7 +873,7 @@ class D77PAPERRunner:
                     
                     # Exit Strategy 등록
                     if result.status == "success" or result.status == "partial":
-                        self.exit_strategy.register_position(
+                        self.exit_scheduler.register_position(
                             position_id=position_id,
                             symbol_a=symbol_a,
                             symbol_b=symbol_b,
@@ -863,23 +899,26 @@ class D77PAPERRunner:
                         self.metrics["failed_fills_count"] += 1
         
         # D82-1: Exit 로직 - Real Market Data 기반
-        exit_config = self.settings.topn_entry_exit
-        for position_id, position in list(self.exit_strategy.get_open_positions().items()):
+        # 심볼당 스프레드 1회 조회 → ExitScheduler가 트리거된 position만 평가
+        exit_signals = []
+        for symbol_a in self.exit_scheduler.tracked_symbols():
             # D82-1: TopNProvider를 통해 실제 현재 스프레드 조회
-            spread_snapshot = self.topn_provider.get_current_spread(position.symbol_a, cross_exchange=False)
+            spread_snapshot = self.topn_provider.get_current_spread(symbol_a, cross_exchange=False)
             if spread_snapshot is None:
-                logger.warning(f"[D82-1] No spread data for {position.symbol_a}, skipping exit check")
+                logger.warning(f"[D82-1] No spread data for {symbol_a}, skipping exit check")
                 continue
             
-            # Exit 조건 체크
-            exit_signal = self.exit_strategy.check_exit(
-                position_id=position_id,
-                current_price_a=spread_snapshot.upbit_bid,
-                current_price_b=spread_snapshot.upbit_ask,
-                current_spread_bps=spread_snapshot.spread_bps,
-            )
-            
-            if exit_signal.should_exit:
+            for position_id, exit_signal in self.exit_scheduler.on_book_update(
+                symbol_a,
+                price_a=spread_snapshot.upbit_bid,
+                price_b=spread_snapshot.upbit_ask,
+                spread_bps=spread_snapshot.spread_bps,
+            ):
+                exit_signals.append((position_id, exit_signal, spread_snapshot))
+        
+        for position_id, exit_signal, spread_snapshot in exit_signals:
+            position = self.exit_strategy.get_position(position_id)
+            if position is not None:
                 # D82-1: Exit MockTrade (Real price 사용)
                 exit_trade = MockTrade(
                     trade_id=f"EXIT_{position_id}",
@@ -898,7 +937,7 @@ class D77PAPERRunner:
                     exit_result = exit_results[0]
                     
                     # Exit Strategy 제거
-                    self.exit_strategy.unregister_position(position_id)
+                    self.exit_scheduler.unregister_position(position_id)
                     self.metrics["exit_trades"] += 1
                     self.metrics["round_trips_completed"] += 1
                     self.metrics["total_trades"] += 1
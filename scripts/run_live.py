@@ -447,6 +447,8 @@ def main():
         # WebSocket 정리
         if ws_config.get("enabled", False):
             ws_manager.stop()
+        # 버퍼된 저장소 기록 반영 (D93-3)
+        storage.close()
         logger.info(f"[LIVE] Shutting down (completed {iteration_count} iterations)")
     
     return 0
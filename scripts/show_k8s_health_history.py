@@ -45,6 +45,11 @@ def main():
   python scripts/show_k8s_health_history.py \
     --history-file outputs/k8s_health_history.jsonl \
     --limit 50
+  
+  # 타임스탬프 범위 레코드 표시 (인덱스 기반 조회)
+  python scripts/show_k8s_health_history.py \
+    --history-file outputs/k8s_health_history.jsonl \
+    --since 2025-11-16T00:00:00 --until 2025-11-17T00:00:00
         """
     )
     
@@ -67,6 +72,18 @@ def main():
         help="요약만 표시"
     )
     
+    parser.add_argument(
+        "--since",
+        default=None,
+        help="시작 타임스탬프 (ISO 8601, 포함)"
+    )
+    
+    parser.add_argument(
+        "--until",
+        default=None,
+        help="종료 타임스탬프 (ISO 8601, 포함)"
+    )
+    
     args = parser.parse_args()
     
     try:
@@ -78,6 +95,10 @@ def main():
             # 요약 표시
             summary = store.summarize()
             _print_summary(summary)
+        elif args.since or args.until:
+            # 범위 레코드 표시 (최근 limit개)
+            records = store.load_range(args.since, args.until)
+            _print_records(records[-args.limit:] if args.limit > 0 else records)
         else:
             # 최근 레코드 표시
             records = store.load_recent(limit=args.limit)
@@ -4,6 +4,8 @@ D75-4: ArbUniverse Unit Tests
 UniverseProvider, UniverseDecision, Ranking 검증
 """
 
+import random
+
 import pytest
 from arbitrage.arbitrage_core import OrderBookSnapshot
 from arbitrage.domain.arb_universe import (
@@ -15,6 +17,7 @@ from arbitrage.domain.arb_universe import (
 from arbitrage.domain.arb_route import RouteDirection
 from arbitrage.domain.fee_model import create_fee_model_upbit_binance
 from arbitrage.domain.market_spec import create_market_spec_upbit_binance
+from arbitrage.infrastructure.exchange_health import HealthMonitor
 
 
 class TestUniverseDecision:
@@ -234,3 +237,135 @@ class TestUniverseProvider:
         if len(decision.ranked_routes) >= 2:
             assert decision.ranked_routes[0].symbol_a == "KRW-BTC"
             assert decision.ranked_routes[1].symbol_a == "KRW-ETH"
+
+
+def _build_random_universe(seed, count, mode, top_n=10, min_score_threshold=50.0):
+    """동일한 route/snapshot으로 벡터화/per-route provider 한 쌍 생성"""
+    rng = random.Random(seed)
+    monitors = []
+    for name in ("UPBIT", "BINANCE", "BYBIT"):
+        monitor = HealthMonitor(name)
+        monitor.metrics.rest_latency_ms = rng.uniform(10, 300)
+        monitor.metrics.error_ratio = rng.uniform(0, 0.05)
+        monitor.metrics.orderbook_age_ms = rng.uniform(0, 3000)
+        monitors.append(monitor)
+    
+    keys = [(f"KRW-S{i}", f"S{i}USDT") for i in range(count)]
+    custom = keys[::3]
+    providers = [
+        UniverseProvider(
+            mode=mode,
+            top_n=top_n,
+            custom_symbols=list(custom),
+            min_score_threshold=min_score_threshold,
+            vectorized=vectorized,
+        )
+        for vectorized in (True, False)
+    ]
+    
+    snapshots = {}
+    inventory = {}
+    for i, (symbol_a, symbol_b) in enumerate(keys):
+        monitor_a = rng.choice(monitors + [None])
+        monitor_b = rng.choice(monitors)
+        min_spread = rng.choice([20.0, 30.0, 50.0])
+        for provider in providers:
+            provider.register_route(
+                symbol_a=symbol_a,
+                symbol_b=symbol_b,
+                market_spec=create_market_spec_upbit_binance(symbol_a, symbol_b),
+                fee_model=create_fee_model_upbit_binance(vip_tier=i % 2),
+                health_monitor_a=monitor_a,
+                health_monitor_b=monitor_b,
+                min_spread_bps=min_spread,
+            )
+        
+        # 동점 순위를 검증하기 위해 일부 route는 같은 호가 사용
+        price_b = 100.0 if i % 5 == 0 else rng.uniform(1, 1000)
+        premium = 0.012 if i % 5 == 0 else rng.uniform(-0.02, 0.02)
+        price_a = price_b * 1370.0 * (1.0 + premium)
+        snapshots[(symbol_a, symbol_b)] = OrderBookSnapshot(
+            timestamp="2025-01-01T00:00:00Z",
+            best_bid_a=price_a * 0.9995,
+            best_ask_a=price_a * 1.0005,
+            best_bid_b=price_b * 0.9995,
+            best_ask_b=price_b * 1.0005,
+        )
+        inventory[(symbol_a, symbol_b)] = 0.0 if i % 5 == 0 else rng.uniform(-0.8, 0.8)
+    
+    # 미등록 route도 후보 수에 포함
+    snapshots[("KRW-UNKNOWN", "UNKNOWNUSDT")] = OrderBookSnapshot(
+        timestamp="2025-01-01T00:00:00Z",
+        best_bid_a=1.0, best_ask_a=1.0, best_bid_b=1.0, best_ask_b=1.0,
+    )
+    return providers, snapshots, inventory
+
+
+class TestVectorizedUniverse:
+    """벡터화 scoring이 per-route 경로와 동일한지 검증"""
+    
+    @pytest.mark.parametrize(
+        "mode,top_n,threshold",
+        [
+            (UniverseMode.TOP_N, 10, 50.0),
+            (UniverseMode.TOP_N, 3, 60.0),
+            (UniverseMode.TOP_N, 1000, 50.0),
+            (UniverseMode.ALL_SYMBOLS, 10, 50.0),
+            (UniverseMode.CUSTOM_LIST, 10, 55.0),
+        ],
+    )
+    def test_matches_per_route(self, mode, top_n, threshold):
+        (vectorized, per_route), snapshots, inventory = _build_random_universe(
+            seed=top_n, count=300, mode=mode, top_n=top_n, min_score_threshold=threshold,
+        )
+        
+        fast = vectorized.evaluate_universe(snapshots, inventory)
+        slow = per_route.evaluate_universe(snapshots, inventory)
+        
+        assert fast.total_candidates == slow.total_candidates == 301
+        assert fast.valid_routes == slow.valid_routes > 0
+        for a, b in zip(fast.ranked_routes, slow.ranked_routes):
+            assert (a.symbol_a, a.symbol_b) == (b.symbol_a, b.symbol_b)
+            assert a.direction == b.direction
+            assert a.score == b.score
+            assert a.reason == b.reason
+            assert a.decision.route_score == b.decision.route_score
+    
+    def test_ties_keep_input_order(self):
+        """동점 route는 입력(snapshot) 순서 유지"""
+        (vectorized, per_route), snapshots, _ = _build_random_universe(
+            seed=1, count=50, mode=UniverseMode.TOP_N, top_n=4,
+        )
+        for provider in (vectorized, per_route):
+            for route in provider._route_cache.values():
+                route.health_monitor_a = None
+        vectorized.refresh_route_params()
+        
+        fast = vectorized.evaluate_universe(snapshots)
+        slow = per_route.evaluate_universe(snapshots)
+        
+        assert [r.symbol_a for r in fast.ranked_routes] == [r.symbol_a for r in slow.ranked_routes]
+    
+    def test_refresh_route_params(self):
+        """MarketSpec 변경 후 refresh_route_params()로 반영"""
+        (vectorized, per_route), snapshots, inventory = _build_random_universe(
+            seed=2, count=40, mode=UniverseMode.ALL_SYMBOLS,
+        )
+        vectorized.evaluate_universe(snapshots, inventory)
+        for provider in (vectorized, per_route):
+            for route in provider._route_cache.values():
+                route.market_spec.fx_rate_a_to_b = 1350.0
+        vectorized.refresh_route_params()
+        
+        fast = vectorized.evaluate_universe(snapshots, inventory)
+        slow = per_route.evaluate_universe(snapshots, inventory)
+        
+        assert [(r.symbol_a, r.score) for r in fast.ranked_routes] == [
+            (r.symbol_a, r.score) for r in slow.ranked_routes
+        ]
+    
+    def test_empty_snapshots(self):
+        provider = UniverseProvider(mode=UniverseMode.TOP_N, top_n=3)
+        decision = provider.evaluate_universe({})
+        assert decision.ranked_routes == []
+        assert decision.total_candidates == 0
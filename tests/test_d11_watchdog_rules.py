@@ -0,0 +1,148 @@
+"""
+D11: Watchdog Rule Table 테스트
+
+evaluate()가 evaluate_full()과 같은 상태/전이를 내는지, 전이 시에만
+AlertEvent를 생성하는지, RollingWindow 집계와 집계 rule 검증.
+"""
+
+import random
+
+import pytest
+
+from arbitrage.watchdog import (
+    AGG_MEAN,
+    AGG_TIME_ABOVE,
+    AlertLevel,
+    RollingWindow,
+    Watchdog,
+    WatchdogConfig,
+    WatchdogRule,
+)
+from scripts.benchmark_d11_watchdog_replay import replay, synthetic_stream
+
+
+class FakeClock:
+    """수동 진행 시계"""
+    
+    def __init__(self, now=1000.0):
+        self.now = now
+    
+    def __call__(self):
+        return self.now
+
+
+HEALTHY = {
+    "ws_lag_ms": 100.0,
+    "redis_heartbeat_age_ms": 5000.0,
+    "loop_latency_ms": 50.0,
+    "safety_rejections_count": 0,
+}
+
+
+class TestRollingWindow:
+    """RollingWindow 테스트"""
+    
+    def test_aggregates_match_naive_window(self):
+        rng = random.Random(1)
+        window = RollingWindow(size=17)
+        samples = []
+        for step in range(500):
+            value = rng.uniform(-50.0, 150.0)
+            window.push(value, ts=step * 0.5)
+            samples.append((step * 0.5, value))
+            recent = samples[-17:]
+            values = [v for _, v in recent]
+            
+            assert list(window) == values
+            assert window.mean() == pytest.approx(sum(values) / len(values))
+            assert window.max() == max(values)
+            if len(recent) > 1:
+                expected_rate = (recent[-1][1] - recent[0][1]) / (recent[-1][0] - recent[0][0])
+                assert window.rate() == pytest.approx(expected_rate)
+
+
+class TestCompiledRules:
+    """compiled rule table 테스트"""
+    
+    @pytest.mark.parametrize("seed", [1, 2])
+    def test_replay_identical_to_full(self, seed):
+        results = replay(synthetic_stream(5000, seed), WatchdogConfig())
+        
+        full_keys, full_transitions, _ = results["full"]
+        fast_keys, fast_transitions, _ = results["fast"]
+        assert fast_keys == full_keys
+        assert fast_transitions == full_transitions
+        assert len(full_transitions) > 100
+    
+    def test_alerts_materialized_only_on_transition(self):
+        watchdog = Watchdog()
+        warn = dict(HEALTHY, ws_lag_ms=3000.0)
+        
+        first = watchdog.evaluate(warn)
+        alert = first.alerts[0]
+        assert [event.level for event in first.transitions] == [AlertLevel.WARN]
+        assert alert.message == "WS lag warning: 3000.0ms > 2000.0ms"
+        
+        second = watchdog.evaluate(dict(warn, ws_lag_ms=3500.0))
+        assert second.alerts[0] is alert
+        assert list(second.transitions) == []
+        
+        recovered = watchdog.evaluate(HEALTHY)
+        assert recovered.alerts == []
+        assert [(event.level, event.metric_name) for event in recovered.transitions] == [
+            (AlertLevel.OK, "ws_lag_ms")
+        ]
+    
+    def test_recompile_after_config_change(self):
+        watchdog = Watchdog()
+        watchdog.config.ws_lag_warn_threshold_ms = 50.0
+        watchdog.recompile()
+        
+        status = watchdog.evaluate(HEALTHY)
+        
+        assert [alert.metric_name for alert in status.alerts] == ["ws_lag_ms"]
+
+
+class TestAggregateRules:
+    """집계 rule 테스트"""
+    
+    def test_mean_rule_smooths_single_spike(self):
+        rule = WatchdogRule(
+            metric_name="cpu_pct",
+            component="System",
+            warn_threshold=80.0,
+            aggregate=AGG_MEAN,
+            window_size=5,
+        )
+        watchdog = Watchdog(extra_rules=[rule], clock=FakeClock())
+        
+        for value in (50.0, 50.0, 50.0, 50.0, 99.0):
+            status = watchdog.evaluate(dict(HEALTHY, cpu_pct=value))
+        assert status.alerts == []
+        
+        for _ in range(3):
+            status = watchdog.evaluate(dict(HEALTHY, cpu_pct=99.0))
+        assert [alert.component for alert in status.alerts] == ["System"]
+    
+    def test_time_above_rule(self):
+        clock = FakeClock()
+        rule = WatchdogRule(
+            metric_name="ws_lag_ms",
+            component="WebSocketSustained",
+            error_threshold=20.0,
+            error_message="WS lag above 1000ms for {value:.0f}s",
+            aggregate=AGG_TIME_ABOVE,
+            above_threshold=1000.0,
+        )
+        watchdog = Watchdog(extra_rules=[rule], clock=clock)
+        lagging = dict(HEALTHY, ws_lag_ms=1500.0)
+        
+        for _ in range(3):
+            status = watchdog.evaluate(lagging)
+            clock.now += 15.0
+        
+        assert status.is_healthy is False
+        assert status.alerts[-1].message == "WS lag above 1000ms for 30s"
+        
+        status = watchdog.evaluate(HEALTHY)
+        assert status.is_healthy is True
@@ -0,0 +1,190 @@
+"""
+D12: Performance Profiler 히스토그램 테스트
+
+LatencyHistogram 정밀도/병합/스냅샷, 시간 기반 슬라이딩 윈도우,
+프로파일러 get_metrics 호환성, Prometheus export 검증.
+"""
+
+import json
+import math
+import random
+
+import pytest
+
+from arbitrage.perf import (
+    LatencyHistogram,
+    LatencyHistogramCollector,
+    PerformanceProfiler,
+    SlidingWindowHistogram,
+    WebsocketLagProfiler,
+    merge_snapshots,
+)
+
+
+class FakeClock:
+    """수동 진행 시계"""
+    
+    def __init__(self, now=1000.0):
+        self.now = now
+    
+    def __call__(self):
+        return self.now
+
+
+def _exact_percentile(values, percentile):
+    ordered = sorted(values)
+    return ordered[max(1, math.ceil(len(ordered) * percentile / 100.0)) - 1]
+
+
+class TestLatencyHistogram:
+    """LatencyHistogram 테스트"""
+    
+    @pytest.mark.parametrize("significant_figures", [1, 2, 3])
+    def test_percentile_relative_error_within_precision(self, significant_figures):
+        rng = random.Random(significant_figures)
+        values = [rng.lognormvariate(0, 1.5) * 5 for _ in range(20000)]
+        histogram = LatencyHistogram(significant_figures=significant_figures)
+        for value in values:
+            histogram.record(value)
+        
+        tolerance = 10 ** -significant_figures
+        for percentile, value in histogram.percentiles().items():
+            exact = _exact_percentile(values, percentile)
+            assert abs(value - exact) / exact <= tolerance
+        assert histogram.count == len(values)
+        assert histogram.mean() == pytest.approx(sum(values) / len(values))
+        assert histogram.max == max(values)
+    
+    def test_merge_and_snapshot_round_trip(self):
+        rng = random.Random(3)
+        per_symbol = {symbol: LatencyHistogram() for symbol in ("BTC", "ETH", "XRP")}
+        combined = LatencyHistogram()
+        for _ in range(3000):
+            symbol = rng.choice(list(per_symbol))
+            value = rng.uniform(0.1, 250.0)
+            per_symbol[symbol].record(value)
+            combined.record(value)
+        
+        # 프로세스 간 전송을 가정한 JSON 직렬화
+        snapshots = [json.loads(json.dumps(h.snapshot())) for h in per_symbol.values()]
+        merged = merge_snapshots(snapshots)
+        
+        assert merged.counts == combined.counts
+        assert merged.percentiles() == combined.percentiles()
+        assert (merged.min, merged.max, merged.count) == (combined.min, combined.max, combined.count)
+        
+        with pytest.raises(ValueError):
+            merged.merge(LatencyHistogram(significant_figures=3))
+    
+    def test_out_of_range_values_clamped(self):
+        histogram = LatencyHistogram(highest=1000.0)
+        histogram.record(0.0)
+        histogram.record(5000.0)
+        
+        assert histogram.value_at_percentile(100.0) == 5000.0
+        assert histogram.value_at_percentile(0.0) <= histogram.unit
+        assert LatencyHistogram().value_at_percentile(99.0) == 0.0
+
+
+class TestSlidingWindowHistogram:
+    """시간 기반 슬라이딩 윈도우 테스트"""
+    
+    def test_expired_slices_leave_window(self):
+        clock = FakeClock()
+        histogram = SlidingWindowHistogram(window_seconds=10.0, slices=5, clock=clock)
+        for _ in range(100):
+            histogram.record(500.0)
+        clock.now += 6.0
+        for _ in range(100):
+            histogram.record(5.0)
+        
+        window = histogram.expire()
+        assert window.count == 200
+        assert window.max == 500.0
+        
+        clock.now += 6.0  # 첫 구간만 만료
+        window = histogram.expire()
+        assert window.count == 100
+        assert window.max == 5.0
+        assert window.mean() == pytest.approx(5.0)
+        assert histogram.lifetime.count == 200
+        
+        clock.now += 60.0
+        assert histogram.expire().count == 0
+        assert histogram.expire().sum == 0.0
+    
+    def test_window_matches_recent_samples(self):
+        rng = random.Random(5)
+        clock = FakeClock()
+        histogram = SlidingWindowHistogram(window_seconds=4.0, slices=4, clock=clock)
+        recorded = []
+        for _ in range(5000):
+            clock.now += rng.uniform(0.0, 0.01)
+            value = rng.uniform(1.0, 100.0)
+            histogram.record(value)
+            recorded.append((clock.now, value))
+        
+        # 구간 경계 기준으로 유지되는 샘플 = 현재 구간 포함 최근 4개 구간
+        oldest_epoch = int(clock.now // 1.0) - 3
+        expected = LatencyHistogram()
+        for timestamp, value in recorded:
+            if int(timestamp // 1.0) >= oldest_epoch:
+                expected.record(value)
+        
+        window = histogram.expire()
+        assert window.counts == expected.counts
+        assert (window.min, window.max) == (expected.min, expected.max)
+
+
+class TestProfilers:
+    """프로파일러 API 호환성 테스트"""
+    
+    def test_get_all_metrics_keys(self):
+        profiler = PerformanceProfiler(clock=FakeClock())
+        for latency in range(1, 101):
+            profiler.record_loop(float(latency))
+            profiler.record_ws_lag(10.0)
+            profiler.record_redis_heartbeat(float(latency))
+        
+        metrics = profiler.get_all_metrics()
+        
+        assert metrics['loop_avg_ms'] == pytest.approx(50.5)
+        assert metrics['loop_p95_ms'] == pytest.approx(95.0, rel=0.01)
+        assert metrics['loop_max_ms'] == 100.0
+        assert metrics['loop_p50_ms'] <= metrics['loop_p99_ms'] <= metrics['loop_p999_ms'] <= 100.0
+        assert metrics['ws_lag_ma'] == pytest.approx(10.0)
+        assert metrics['redis_heartbeat_max_ms'] == 100.0
+        assert metrics['redis_heartbeat_trend'] == "increasing"
+        assert "p99=" in profiler.get_summary()
+    
+    def test_ws_spike_detection(self):
+        profiler = WebsocketLagProfiler(clock=FakeClock())
+        profiler.record(100.0)  # 기준 샘플 부족 → 스파이크 아님
+        for _ in range(9):
+            profiler.record(10.0)
+        profiler.record(50.0)
+        profiler.record(25.0)
+        
+        assert profiler.get_spike_count() == 1
+    
+    def test_prometheus_export(self):
+        prometheus_client = pytest.importorskip("prometheus_client")
+        registry = prometheus_client.CollectorRegistry()
+        collector = LatencyHistogramCollector()
+        registry.register(collector)
+        for symbol, latency in (("BTC", 2.0), ("ETH", 200.0)):
+            profiler = PerformanceProfiler(clock=FakeClock())
+            for _ in range(10):
+                profiler.record_loop(latency)
+            profiler.register_prometheus(collector, labels={"symbol": symbol})
+        
+        def sample(name, **labels):
+            return registry.get_sample_value(name, {"symbol": "BTC", **labels})
+        
+        assert sample("arb_loop_latency_seconds_count") == 10.0
+        assert sample("arb_loop_latency_seconds_sum") == pytest.approx(0.02)
+        assert sample("arb_loop_latency_seconds_bucket", le="0.00128") == 0.0
+        assert sample("arb_loop_latency_seconds_bucket", le="0.00256") == 10.0
+        assert registry.get_sample_value(
+            "arb_loop_latency_seconds_bucket", {"symbol": "ETH", "le": "0.16384"}
+        ) == 0.0
@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+MODULE D15 Rolling Window Statistics Tests
+
+링 버퍼 / 증분 추정기가 기존 전체 재계산(np.quantile, np.std, cumsum) 결과와 일치하는지 검증.
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# 프로젝트 루트 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from arbitrage.rolling_stats import (
+    RingBuffer,
+    RollingMoments,
+    OrderStatisticWindow,
+    RollingWindow,
+    RingMatrix,
+    RollingCovariance,
+)
+from arbitrage.risk_quant import QuantitativeRiskManager
+from arbitrage.portfolio_optimizer import PortfolioOptimizer
+
+
+class TestRingBuffer:
+    """RingBuffer 테스트"""
+    
+    def test_append_and_evict(self):
+        buf = RingBuffer(3)
+        assert buf.append(1.0) is None
+        assert buf.append(2.0) is None
+        assert buf.append(3.0) is None
+        assert buf.append(4.0) == 1.0
+        assert buf.view().tolist() == [2.0, 3.0, 4.0]
+    
+    def test_view_is_zero_copy_and_readonly(self):
+        buf = RingBuffer(4)
+        for i in range(10):
+            buf.append(float(i))
+        window = buf.view()
+        assert window.base is not None
+        assert not window.flags.writeable
+        assert window.tolist() == [6.0, 7.0, 8.0, 9.0]
+    
+    def test_extend_matches_slicing(self):
+        rng = np.random.default_rng(0)
+        buf = RingBuffer(50)
+        reference = np.array([])
+        for size in (10, 30, 7, 100, 1, 49):
+            values = rng.normal(size=size)
+            evicted = buf.extend(values)
+            combined = np.concatenate([reference, values])
+            expected_evicted = combined[:max(0, len(combined) - 50)]
+            reference = combined[-50:]
+            assert np.array_equal(buf.view(), reference)
+            assert np.array_equal(evicted, expected_evicted)
+    
+    def test_invalid_capacity(self):
+        with pytest.raises(ValueError):
+            RingBuffer(0)
+
+
+class TestIncrementalEstimators:
+    """증분 추정기 테스트"""
+    
+    def test_rolling_moments_match_numpy(self):
+        rng = np.random.default_rng(1)
+        values = rng.normal(0.001, 0.02, 500)
+        moments = RollingMoments()
+        window = 50
+        for i, value in enumerate(values):
+            moments.add(value)
+            if i >= window:
+                moments.remove(values[i - window])
+            current = values[max(0, i - window + 1):i + 1]
+            assert moments.mean == pytest.approx(np.mean(current), abs=1e-12)
+            assert moments.std == pytest.approx(np.std(current), abs=1e-12)
+    
+    def test_order_statistics_quantile_matches_numpy(self):
+        rng = np.random.default_rng(2)
+        values = rng.normal(size=2000)
+        order = OrderStatisticWindow(load=16)
+        window = 300
+        for i, value in enumerate(values):
+            order.insert(value)
+            if i >= window:
+                order.remove(values[i - window])
+            current = values[max(0, i - window + 1):i + 1]
+            for q in (0.01, 0.05, 0.5, 0.95):
+                assert order.quantile(q) == pytest.approx(np.quantile(current, q), abs=1e-12)
+    
+    def test_order_statistics_remove_missing(self):
+        order = OrderStatisticWindow()
+        order.insert(1.0)
+        with pytest.raises(ValueError):
+            order.remove(2.0)
+    
+    def test_rolling_window_drawdown_matches_cumsum(self):
+        rng = np.random.default_rng(3)
+        window = RollingWindow(40, dtype=np.float64, track_drawdown=True)
+        values = rng.normal(0, 100, 300)
+        for i, value in enumerate(values):
+            window.append(value)
+            current = values[max(0, i - 39):i + 1]
+            cumulative = np.cumsum(current)
+            expected = np.min(cumulative - np.maximum.accumulate(cumulative))
+            assert window.max_drawdown() == pytest.approx(expected, abs=1e-9)
+    
+    def test_rolling_window_tail_mean(self):
+        rng = np.random.default_rng(4)
+        window = RollingWindow(100, dtype=np.float64, track_order=True)
+        window.extend(rng.normal(size=250))
+        values = window.values
+        threshold = np.quantile(values, 0.05)
+        assert window.tail_mean(threshold) == pytest.approx(
+            np.mean(values[values <= threshold]), abs=1e-12
+        )
+        assert window.tail_mean(values.min() - 1.0) is None
+
+
+class TestQuantitativeRiskManagerRolling:
+    """QuantitativeRiskManager 링 버퍼 전환 회귀 테스트"""
+    
+    def test_metrics_match_full_recompute(self):
+        rng = np.random.default_rng(5)
+        manager = QuantitativeRiskManager(window_size=100)
+        returns = rng.normal(0.001, 0.02, 400).astype(np.float32)
+        pnl = rng.normal(10, 50, 400).astype(np.float32)
+        
+        for r, p in zip(returns, pnl):
+            manager.record_return(float(r))
+            manager.record_pnl(float(p))
+        
+        window_returns = returns[-100:]
+        window_pnl = pnl[-100:]
+        assert np.array_equal(manager.returns_history, window_returns)
+        assert manager.returns_history.dtype == np.float32
+        
+        var_95 = float(np.quantile(window_returns, 0.05))
+        assert manager.calculate_var(0.95) == pytest.approx(var_95, abs=1e-7)
+        
+        tail = window_returns[window_returns <= var_95]
+        assert manager.calculate_expected_shortfall(0.95) == pytest.approx(
+            float(np.mean(tail)), abs=1e-6
+        )
+        
+        cumulative = np.cumsum(window_pnl.astype(np.float64))
+        expected_dd = float(np.min(cumulative - np.maximum.accumulate(cumulative)))
+        assert manager.calculate_max_drawdown() == pytest.approx(expected_dd, rel=1e-5)
+        
+        expected_sharpe = (
+            (np.mean(window_returns) - 0.02 / 252) / np.std(window_returns) * np.sqrt(252)
+        )
+        assert manager.calculate_sharpe_ratio() == pytest.approx(float(expected_sharpe), rel=1e-4)
+    
+    def test_batch_and_single_record_agree(self):
+        rng = np.random.default_rng(6)
+        returns = rng.normal(0.0, 0.02, 250).astype(np.float32)
+        
+        single = QuantitativeRiskManager(window_size=64)
+        for r in returns:
+            single.record_return(float(r))
+        
+        batch = QuantitativeRiskManager(window_size=64)
+        batch.record_returns_batch(returns[:20])
+        batch.record_returns_batch(returns[20:])
+        
+        assert np.array_equal(single.returns_history, batch.returns_history)
+        assert single.calculate_var(0.99) == pytest.approx(batch.calculate_var(0.99), abs=1e-9)
+        assert single.get_stats()["num_returns"] == 64
+
+
+class TestRingMatrixCovariance:
+    """RingMatrix / RollingCovariance 테스트"""
+    
+    def test_ring_matrix_view_and_column_growth(self):
+        matrix = RingMatrix(3, 2)
+        for i in range(5):
+            matrix.append_row(np.array([i, -i], dtype=float))
+        matrix.ensure_columns(5)
+        
+        assert matrix.column_capacity >= 5
+        assert matrix.view(2).tolist() == [[2.0, -2.0], [3.0, -3.0], [4.0, -4.0]]
+        assert matrix.view(3)[:, 2].tolist() == [0.0, 0.0, 0.0]
+    
+    def test_rank_one_updates_match_numpy_cov(self):
+        rng = np.random.default_rng(7)
+        rows = rng.normal(0.1, 1.0, size=(200, 6))
+        window = 40
+        moments = RollingCovariance(6)
+        for i, row in enumerate(rows):
+            removed = rows[i - window] if i >= window else None
+            moments.update(row, removed)
+            current = rows[max(0, i - window + 1):i + 1]
+            if len(current) >= 2:
+                assert np.allclose(moments.covariance(6), np.cov(current.T), atol=1e-10)
+                assert np.allclose(moments.correlation(6), np.corrcoef(current.T), atol=1e-10)
+
+
+class TestPortfolioOptimizerIncremental:
+    """PortfolioOptimizer 링 행렬 / 증분 공분산 테스트"""
+    
+    def test_matches_pandas_with_growing_symbol_set(self):
+        rng = np.random.default_rng(8)
+        optimizer = PortfolioOptimizer(window_size=30, max_symbols=2)
+        symbols = [f"S{i}" for i in range(6)]
+        rows = []
+        
+        for step in range(150):
+            row = {s: rng.normal(0.1, 1.0) for s in symbols[:min(6, 2 + step // 25)]}
+            optimizer.add_returns_row(row)
+            rows.append(row)
+        
+        expected = pd.DataFrame(rows).fillna(0.0)[optimizer.symbols].iloc[-30:]
+        assert np.allclose(optimizer.calculate_covariance_matrix(), expected.cov().values, atol=1e-9)
+        assert np.allclose(optimizer.calculate_correlation_matrix(), expected.corr().values, atol=1e-9)
+        assert optimizer.get_stats()["num_observations"] == 30
+        
+        weights = optimizer.get_risk_parity_weights()
+        inv_vols = 1.0 / expected.std().values
+        for symbol, w in zip(optimizer.symbols, inv_vols / inv_vols.sum()):
+            assert weights[symbol] == pytest.approx(w, rel=1e-9)
+    
+    def test_add_returns_starts_new_row_on_repeat_symbol(self):
+        optimizer = PortfolioOptimizer(window_size=10)
+        optimizer.add_returns("BTC", 1.0)
+        optimizer.add_returns("ETH", 2.0)
+        optimizer.add_returns("BTC", 3.0)
+        
+        frame = optimizer.returns_df
+        
+        assert frame.values.tolist() == [[1.0, 2.0], [3.0, 0.0]]
+    
+    def test_batch_matches_row_by_row(self):
+        rng = np.random.default_rng(9)
+        data = {s: rng.normal(size=50) for s in ("BTC", "ETH", "XRP")}
+        
+        batch = PortfolioOptimizer(window_size=20)
+        batch.add_returns_batch(data)
+        
+        single = PortfolioOptimizer(window_size=20)
+        for i in range(50):
+            single.add_returns_row({s: v[i] for s, v in data.items()})
+        
+        assert np.allclose(batch.calculate_covariance_matrix(), single.calculate_covariance_matrix())
+        assert batch.get_mean_variance_weights() == pytest.approx(single.get_mean_variance_weights())
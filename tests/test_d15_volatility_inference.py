@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+MODULE D15 Batched Volatility Inference Service Tests
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# 프로젝트 루트 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from ml.volatility_model import VolatilityPredictor
+from ml.volatility_inference import VolatilityInferenceService
+
+
+MODEL_PATH = "/nonexistent/volatility_lstm.pt"
+
+
+@pytest.fixture
+def service():
+    """배치 추론 서비스 (CPU, 단일 스레드)"""
+    return VolatilityInferenceService(
+        model_path=MODEL_PATH,
+        sequence_length=10,
+        device="cpu",
+        num_threads=1,
+    )
+
+
+def _make_predictors(service, count, length=30, seed=0):
+    rng = np.random.default_rng(seed)
+    predictors = {}
+    for i in range(count):
+        predictor = VolatilityPredictor(
+            model_path=MODEL_PATH,
+            sequence_length=10,
+            device="cpu",
+            model=service.model,
+        )
+        predictor.record_volatilities_batch(rng.uniform(0.1, 0.5, length).astype(np.float32))
+        service.register(f"SYM{i}", predictor)
+        predictors[f"SYM{i}"] = predictor
+    return predictors
+
+
+class TestVolatilityInferenceService:
+    """VolatilityInferenceService 테스트"""
+    
+    def test_batch_matches_per_symbol_predict(self, service):
+        """단일 배치 결과가 심볼별 predict()와 동일"""
+        predictors = _make_predictors(service, 8)
+        
+        results = service.predict_all()
+        
+        for symbol, predictor in predictors.items():
+            assert results[symbol] == pytest.approx(predictor.predict(), abs=1e-5)
+        stats = service.get_stats()
+        assert stats["batches_run"] == 1
+        assert stats["avg_batch_size"] == 8
+    
+    def test_cache_until_new_data(self, service):
+        """새 데이터가 없으면 캐시 사용, 기록되면 해당 심볼만 재예측"""
+        predictors = _make_predictors(service, 4)
+        service.predict_all()
+        
+        service.predict("SYM0")
+        assert service.get_stats()["cache_hits"] == 1
+        assert service.get_stats()["batches_run"] == 1
+        
+        predictors["SYM2"].record_volatility(0.9)
+        service.predict("SYM0")
+        assert service.get_stats()["batches_run"] == 1
+        
+        service.predict("SYM2")
+        
+        stats = service.get_stats()
+        assert stats["batches_run"] == 2
+        assert stats["avg_batch_size"] == pytest.approx((4 + 1) / 2)
+    
+    def test_insufficient_history_fallback(self, service):
+        """시퀀스 길이 미만이면 마지막 값 (배치 제외)"""
+        service.record_volatility("NEW", 0.33)
+        
+        assert service.predict("NEW") == pytest.approx(0.33)
+        assert service.get_stats()["batches_run"] == 0
+    
+    def test_unregistered_symbol(self, service):
+        with pytest.raises(KeyError):
+            service.predict("UNKNOWN")
+    
+    def test_sequence_length_mismatch(self, service):
+        predictor = VolatilityPredictor(
+            model_path=MODEL_PATH, sequence_length=20, device="cpu", model=service.model
+        )
+        with pytest.raises(ValueError):
+            service.register("BAD", predictor)
+    
+    def test_torchscript_backend_matches_eager(self, service, tmp_path):
+        """TorchScript 백엔드가 eager와 동일한 결과"""
+        predictors = _make_predictors(service, 5)
+        scripted = VolatilityInferenceService(
+            model_path=MODEL_PATH,
+            sequence_length=10,
+            device="cpu",
+            backend="torchscript",
+            export_path=str(tmp_path / "volatility.ts.pt"),
+            model=service.model,
+        )
+        for symbol, predictor in predictors.items():
+            scripted.register(symbol, predictor)
+        
+        eager = service.predict_all()
+        traced = scripted.predict_all()
+        
+        assert (tmp_path / "volatility.ts.pt").exists()
+        for symbol in predictors:
+            assert traced[symbol] == pytest.approx(eager[symbol], abs=1e-6)
+    
+    def test_unknown_backend(self):
+        with pytest.raises(ValueError):
+            VolatilityInferenceService(model_path=MODEL_PATH, device="cpu", backend="tensorrt")
+    
+    def test_run_loop_reports_latency(self, service):
+        """고정 주기 루프가 배치를 실행하고 p99 지연을 보고"""
+        predictors = _make_predictors(service, 3)
+        
+        async def scenario():
+            task = asyncio.create_task(service.run(interval_sec=0.01))
+            await asyncio.sleep(0.05)
+            predictors["SYM1"].record_volatility(0.4)
+            await asyncio.sleep(0.05)
+            service.stop()
+            await asyncio.wait_for(task, timeout=1.0)
+        
+        asyncio.run(scenario())
+        
+        stats = service.get_stats()
+        assert stats["batches_run"] == 2
+        assert stats["p99_latency_ms"] >= stats["p50_latency_ms"] > 0.0
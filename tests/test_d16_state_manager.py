@@ -53,9 +53,11 @@ class TestStateManager:
         """가격 저장"""
         state_manager.set_price("upbit", "KRW-BTC", 50_000_000, 50_100_000)
         
-        # hset 호출 확인
-        state_manager._redis.hset.assert_called_once()
-        state_manager._redis.expire.assert_called_once()
+        # hset + expire가 pipeline 1회로 전송
+        pipe = state_manager._redis.pipeline.return_value
+        pipe.hset.assert_called_once()
+        pipe.expire.assert_called_once()
+        pipe.execute.assert_called_once()
     
     def test_get_price(self, state_manager):
         """가격 조회"""
@@ -83,8 +85,10 @@ class TestStateManager:
         
         state_manager.set_signal(signal)
         
-        state_manager._redis.hset.assert_called_once()
-        state_manager._redis.expire.assert_called_once()
+        pipe = state_manager._redis.pipeline.return_value
+        pipe.hset.assert_called_once()
+        pipe.sadd.assert_called_once_with("test:local:arbitrage:index:signal", "BTC")
+        pipe.execute.assert_called_once()
     
     def test_set_order(self, state_manager):
         """주문 저장"""
@@ -100,8 +104,10 @@ class TestStateManager:
         
         state_manager.set_order(order)
         
-        state_manager._redis.hset.assert_called_once()
-        state_manager._redis.expire.assert_called_once()
+        pipe = state_manager._redis.pipeline.return_value
+        pipe.hset.assert_called_once()
+        pipe.sadd.assert_called_once_with("test:local:arbitrage:index:orders", "order_123")
+        pipe.execute.assert_called_once()
     
     def test_set_position(self, state_manager):
         """포지션 저장"""
@@ -115,14 +121,18 @@ class TestStateManager:
         
         state_manager.set_position(position)
         
-        state_manager._redis.hset.assert_called_once()
-        state_manager._redis.expire.assert_called_once()
+        pipe = state_manager._redis.pipeline.return_value
+        pipe.hset.assert_called_once()
+        pipe.sadd.assert_called_once_with("test:local:arbitrage:index:positions", "KRW-BTC")
+        pipe.execute.assert_called_once()
     
     def test_delete_position(self, state_manager):
         """포지션 삭제"""
         state_manager.delete_position("KRW-BTC")
         
-        state_manager._redis.delete.assert_called_once()
+        pipe = state_manager._redis.pipeline.return_value
+        pipe.delete.assert_called_once_with("test:local:arbitrage:positions:KRW-BTC")
+        pipe.srem.assert_called_once_with("test:local:arbitrage:index:positions", "KRW-BTC")
     
     def test_set_execution(self, state_manager):
         """실행 결과 저장"""
@@ -140,8 +150,11 @@ class TestStateManager:
         
         state_manager.set_execution(execution)
         
-        state_manager._redis.hset.assert_called_once()
-        state_manager._redis.expire.assert_called_once()
+        pipe = state_manager._redis.pipeline.return_value
+        pipe.hset.assert_called_once()
+        pipe.zadd.assert_called_once()
+        pipe.zremrangebyscore.assert_called_once()
+        pipe.execute.assert_called_once()
     
     def test_set_metrics(self, state_manager):
         """메트릭 저장"""
@@ -153,8 +166,9 @@ class TestStateManager:
         
         state_manager.set_metrics(metrics)
         
-        state_manager._redis.hset.assert_called_once()
-        state_manager._redis.expire.assert_called_once()
+        pipe = state_manager._redis.pipeline.return_value
+        pipe.hset.assert_called_once()
+        pipe.expire.assert_called_once()
     
     def test_get_metrics(self, state_manager):
         """메트릭 조회"""
@@ -172,7 +186,9 @@ class TestStateManager:
         """통계 증가"""
         state_manager.increment_stat("trades", 1.0)
         
-        state_manager._redis.incrbyfloat.assert_called_once()
+        pipe = state_manager._redis.pipeline.return_value
+        pipe.incrbyfloat.assert_called_once()
+        pipe.sadd.assert_called_once_with("test:local:arbitrage:index:stats", "trades")
     
     def test_get_stat(self, state_manager):
         """통계 조회"""
@@ -195,6 +211,126 @@ class TestStateManager:
         heartbeat = state_manager.get_heartbeat("live_trader")
         
         assert heartbeat is not None
+    
+    def test_get_all_signals_uses_index(self, state_manager):
+        """KEYS 스캔 없이 인덱스 + pipeline으로 조회, 만료된 멤버는 정리"""
+        state_manager._redis.smembers.return_value = {"BTC", "ETH"}
+        pipe = state_manager._redis.pipeline.return_value
+        pipe.execute.return_value = [{"symbol": "BTC"}, {}]
+        
+        signals = state_manager.get_all_signals()
+        
+        assert signals == {"BTC": {"symbol": "BTC"}}
+        state_manager._redis.keys.assert_not_called()
+        assert pipe.hgetall.call_count == 2
+        state_manager._redis.srem.assert_called_once_with(
+            "test:local:arbitrage:index:signal", "ETH"
+        )
+    
+    def test_index_backfill_from_existing_keys(self, state_manager):
+        """인덱스 도입 전 key는 최초 조회 시 SCAN 1회로 인덱스에 등록 + 완료 마커 기록"""
+        redis_client = state_manager._redis
+        redis_client.exists.return_value = 0
+        redis_client.scan_iter.return_value = iter([
+            "test:local:arbitrage:orders:order_1",
+            "test:local:arbitrage:orders:order:2",
+        ])
+        redis_client.smembers.return_value = {"order_1", "order:2"}
+        pipe = redis_client.pipeline.return_value
+        pipe.execute.side_effect = [None, [{"order_id": "order:2"}, {"order_id": "order_1"}]]
+        
+        orders = state_manager.get_all_orders()
+        
+        redis_client.scan_iter.assert_called_once_with(
+            match="test:local:arbitrage:orders:*", count=1000
+        )
+        pipe.sadd.assert_called_once_with(
+            "test:local:arbitrage:index:orders", "order_1", "order:2"
+        )
+        redis_client.exists.assert_called_once_with("test:local:arbitrage:index:orders:backfilled")
+        assert pipe.set.call_args[0][0] == "test:local:arbitrage:index:orders:backfilled"
+        assert sorted(orders) == ["order:2", "order_1"]
+        
+        # 두 번째 조회는 SCAN 없이 인덱스만 사용
+        pipe.execute.side_effect = None
+        pipe.execute.return_value = [{"order_id": "order:2"}, {"order_id": "order_1"}]
+        state_manager.get_all_orders()
+        redis_client.scan_iter.assert_called_once()
+    
+    def test_execution_index_backfill_uses_timestamp_score(self, state_manager):
+        """실행 결과 인덱스 backfill은 멤버(timestamp)를 score로 ZADD"""
+        redis_client = state_manager._redis
+        redis_client.exists.return_value = 0
+        redis_client.scan_iter.return_value = iter([
+            "test:local:arbitrage:execution:BTC:1700000001.0",
+            "test:local:arbitrage:execution:BTC:1700000002.5",
+        ])
+        redis_client.zrevrange.return_value = []
+        
+        state_manager.get_executions("BTC", limit=10)
+        
+        redis_client.pipeline.return_value.zadd.assert_called_once_with(
+            "test:local:arbitrage:index:execution:BTC",
+            {"1700000001.0": 1700000001.0, "1700000002.5": 1700000002.5},
+        )
+    
+    def test_backfill_skipped_when_marker_exists(self, state_manager):
+        """다른 프로세스가 backfill을 마쳤으면(마커 존재) SCAN 없이 인덱스만 사용"""
+        redis_client = state_manager._redis
+        redis_client.exists.return_value = 1
+        redis_client.smembers.return_value = set()
+        
+        state_manager.get_all_positions()
+        state_manager.get_all_positions()
+        
+        redis_client.scan_iter.assert_not_called()
+        redis_client.exists.assert_called_once_with("test:local:arbitrage:index:positions:backfilled")
+    
+    def test_get_executions_uses_sorted_index(self, state_manager):
+        """실행 결과는 ZREVRANGE로 최신 limit개만 조회"""
+        state_manager._redis.zrevrange.return_value = ["1700000002.0", "1700000001.0"]
+        pipe = state_manager._redis.pipeline.return_value
+        pipe.execute.return_value = [{"net_pnl": "2"}, {"net_pnl": "1"}]
+        
+        executions = state_manager.get_executions("BTC", limit=2)
+        
+        assert executions == [{"net_pnl": "2"}, {"net_pnl": "1"}]
+        state_manager._redis.zrevrange.assert_called_once_with(
+            "test:local:arbitrage:index:execution:BTC", 0, 1
+        )
+        pipe.hgetall.assert_any_call("test:local:arbitrage:execution:BTC:1700000002.0")
+        state_manager._redis.keys.assert_not_called()
+    
+    def test_in_memory_indexes(self):
+        """in-memory 모드에서도 동일한 인덱스 동작"""
+        manager = StateManager(namespace="test:memory", enabled=False)
+        for i, symbol in enumerate(["BTC", "ETH", "XRP"]):
+            manager.set_position(Position(
+                symbol=symbol,
+                quantity=1.0,
+                entry_price=100.0,
+                current_price=101.0,
+                side=OrderSide.BUY,
+            ))
+            for j in range(3):
+                manager.set_execution(ExecutionResult(
+                    symbol="BTC",
+                    buy_order_id=f"buy_{i}_{j}",
+                    sell_order_id=f"sell_{i}_{j}",
+                    buy_price=100.0,
+                    sell_price=101.0,
+                    quantity=1.0,
+                    gross_pnl=1.0,
+                    net_pnl=float(i * 3 + j),
+                    fees=0.0,
+                    timestamp=datetime.fromtimestamp(1_700_000_000 + i * 3 + j),
+                ))
+        manager.delete_position("ETH")
+        
+        assert sorted(manager.get_all_positions()) == ["BTC", "XRP"]
+        executions = manager.get_executions("BTC", limit=4)
+        assert [e["net_pnl"] for e in executions] == ["8.0", "7.0", "6.0", "5.0"]
+        assert manager.get_all_signals() == {}
 
 
 if __name__ == "__main__":
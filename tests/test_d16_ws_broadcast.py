@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+D16 Tests — WebSocket Broadcast
+================================
+
+BroadcastHub fan-out / 느린 클라이언트 drop / StatePublisher 단일 조회 검증.
+"""
+
+import asyncio
+import json
+from datetime import datetime
+
+import pytest
+
+from arbitrage.state_manager import StateManager
+from arbitrage.types import Signal, ExchangeType, PortfolioState
+from arbitrage.ws_broadcast import BroadcastHub, StatePublisher
+
+
+class FakeWebSocket:
+    """송신 프레임을 기록하는 WebSocket 대역"""
+    
+    def __init__(self, send_delay: float = 0.0, block: bool = False):
+        self.sent = []
+        self.send_delay = send_delay
+        self.block = block
+        self.closed_code = None
+        self._incoming: asyncio.Queue = asyncio.Queue()
+    
+    async def send_text(self, frame):
+        if self.block:
+            await asyncio.Event().wait()
+        if self.send_delay:
+            await asyncio.sleep(self.send_delay)
+        self.sent.append(json.loads(frame))
+    
+    async def receive_text(self):
+        message = await self._incoming.get()
+        if message is None:
+            raise ConnectionError("client disconnected")
+        return message
+    
+    async def close(self, code=1000):
+        # 서버 측 close → 클라이언트 disconnect
+        self.closed_code = code
+        self._incoming.put_nowait(None)
+    
+    def client_send(self, message):
+        self._incoming.put_nowait(message)
+
+
+class CountingStateManager(StateManager):
+    """조회 횟수를 세는 in-memory StateManager"""
+    
+    def __init__(self):
+        super().__init__(namespace="test:ws", enabled=False)
+        self.reads = {"signals": 0, "metrics": 0}
+    
+    def get_all_signals(self):
+        self.reads["signals"] += 1
+        return super().get_all_signals()
+    
+    def get_metrics(self):
+        self.reads["metrics"] += 1
+        return super().get_metrics()
+
+
+def _signal(symbol, spread):
+    return Signal(
+        symbol=symbol,
+        buy_exchange=ExchangeType.UPBIT,
+        sell_exchange=ExchangeType.BINANCE,
+        buy_price=100.0,
+        sell_price=100.0 + spread,
+        spread=spread,
+        spread_pct=spread,
+    )
+
+
+class TestBroadcastHub:
+    """BroadcastHub 테스트"""
+    
+    def test_fan_out_and_snapshot(self):
+        async def scenario():
+            hub = BroadcastHub("test")
+            clients = [FakeWebSocket() for _ in range(5)]
+            tasks = [asyncio.create_task(hub.serve(ws)) for ws in clients]
+            await asyncio.sleep(0)
+            
+            hub.publish_json({"n": 1}, key="a")
+            hub.publish_json({"n": 2}, key="b")
+            await asyncio.sleep(0.01)
+            
+            late = FakeWebSocket()
+            tasks.append(asyncio.create_task(hub.serve(late)))
+            await asyncio.sleep(0.01)
+            
+            assert hub.client_count == 6
+            for ws in clients:
+                assert ws.sent == [{"n": 1}, {"n": 2}]
+            # 신규 구독자는 key별 최신 프레임을 즉시 수신
+            assert late.sent == [{"n": 1}, {"n": 2}]
+            
+            for ws in clients + [late]:
+                ws.client_send(None)
+            await asyncio.gather(*tasks)
+            assert hub.client_count == 0
+        
+        asyncio.run(scenario())
+    
+    def test_snapshot_larger_than_queue_is_fully_preloaded(self):
+        """snapshot key 수가 max_queue보다 많아도 신규 구독자는 전체 초기 상태를 수신"""
+        async def scenario():
+            hub = BroadcastHub("test", max_queue=4)
+            for i in range(10):
+                hub.publish_json({"n": i}, key=f"k{i}")
+            
+            late = FakeWebSocket()
+            task = asyncio.create_task(hub.serve(late))
+            await asyncio.sleep(0)
+            # 선적재 직후에도 실시간 프레임 max_queue개 여유
+            for i in range(10, 14):
+                hub.publish_json({"n": i})
+            await asyncio.sleep(0.01)
+            
+            assert [m["n"] for m in late.sent] == list(range(14))
+            assert hub.get_stats()["clients_dropped"] == 0
+            
+            late.client_send(None)
+            await task
+        
+        asyncio.run(scenario())
+    
+    def test_slow_client_dropped_without_blocking_others(self):
+        async def scenario():
+            hub = BroadcastHub("test", max_queue=4)
+            fast = FakeWebSocket()
+            stuck = FakeWebSocket(block=True)
+            tasks = [asyncio.create_task(hub.serve(ws)) for ws in (fast, stuck)]
+            await asyncio.sleep(0)
+            
+            for i in range(20):
+                hub.publish_json({"n": i})
+                await asyncio.sleep(0)
+            await asyncio.wait_for(tasks[1], timeout=1.0)
+            
+            assert stuck.closed_code == 1008
+            assert hub.get_stats()["clients_dropped"] == 1
+            assert [m["n"] for m in fast.sent] == list(range(20))
+            
+            fast.client_send(None)
+            await tasks[0]
+        
+        asyncio.run(scenario())
+    
+    def test_concurrent_send(self):
+        """전송은 클라이언트별 task에서 병렬 수행"""
+        async def scenario():
+            hub = BroadcastHub("test")
+            clients = [FakeWebSocket(send_delay=0.05) for _ in range(20)]
+            tasks = [asyncio.create_task(hub.serve(ws)) for ws in clients]
+            await asyncio.sleep(0)
+            
+            loop = asyncio.get_running_loop()
+            started = loop.time()
+            hub.publish_json({"n": 1})
+            while any(not ws.sent for ws in clients):
+                await asyncio.sleep(0.005)
+            elapsed = loop.time() - started
+            
+            assert elapsed < 0.05 * 5
+            for ws in clients:
+                ws.client_send(None)
+            await asyncio.gather(*tasks)
+        
+        asyncio.run(scenario())
+
+
+class TestStatePublisher:
+    """StatePublisher 테스트"""
+    
+    def test_reads_once_per_change_regardless_of_viewers(self):
+        async def scenario():
+            manager = CountingStateManager()
+            metrics_hub = BroadcastHub("metrics")
+            signals_hub = BroadcastHub("signals")
+            publisher = StatePublisher(
+                manager, metrics_hub, signals_hub, resync_interval=60.0, coalesce_interval=0.01
+            )
+            viewers = [FakeWebSocket() for _ in range(30)]
+            tasks = [asyncio.create_task(signals_hub.serve(ws)) for ws in viewers]
+            metric_viewers = [FakeWebSocket() for _ in range(10)]
+            tasks += [asyncio.create_task(metrics_hub.serve(ws)) for ws in metric_viewers]
+            
+            await publisher.start()
+            await asyncio.sleep(0.05)
+            baseline = dict(manager.reads)
+            
+            btc = _signal("BTC", 1.0)
+            manager.set_signal(btc)
+            manager.set_signal(_signal("ETH", 2.0))
+            await asyncio.sleep(0.05)
+            manager.set_signal(btc)  # 동일 내용 → 발행 없음
+            await asyncio.sleep(0.05)
+            manager.set_metrics({"trades": 3})
+            await asyncio.sleep(0.05)
+            
+            await publisher.stop()
+            
+            # 조회 횟수는 뷰어 수와 무관
+            assert manager.reads["signals"] - baseline["signals"] == 2
+            assert manager.reads["metrics"] - baseline["metrics"] == 1
+            
+            for ws in viewers:
+                symbols = [m["symbol"] for m in ws.sent if m["type"] == "signal"]
+                assert sorted(symbols) == ["BTC", "ETH"]
+            for ws in metric_viewers:
+                assert ws.sent[-1]["type"] == "metrics"
+                assert ws.sent[-1]["metrics"] == {"trades": 3.0}
+            
+            for ws in viewers + metric_viewers:
+                ws.client_send(None)
+            await asyncio.gather(*tasks)
+        
+        asyncio.run(scenario())
+    
+    def test_late_viewer_gets_current_state(self):
+        async def scenario():
+            manager = CountingStateManager()
+            manager.set_signal(_signal("XRP", 0.5))
+            manager.set_portfolio_state(PortfolioState(
+                total_balance=1000.0,
+                available_balance=900.0,
+                positions={},
+                orders={},
+                timestamp=datetime.utcnow(),
+            ))
+            metrics_hub = BroadcastHub("metrics")
+            signals_hub = BroadcastHub("signals")
+            publisher = StatePublisher(manager, metrics_hub, signals_hub, coalesce_interval=0.0)
+            await publisher.start()
+            await asyncio.sleep(0.05)
+            
+            ws = FakeWebSocket()
+            task = asyncio.create_task(signals_hub.serve(ws))
+            ws_metrics = FakeWebSocket()
+            task_metrics = asyncio.create_task(metrics_hub.serve(ws_metrics))
+            await asyncio.sleep(0.01)
+            
+            assert [m["symbol"] for m in ws.sent] == ["XRP"]
+            assert ws_metrics.sent[0]["portfolio"]["total_balance"] == "1000.0"
+            
+            await publisher.stop()
+            ws.client_send(None)
+            ws_metrics.client_send(None)
+            await asyncio.gather(task, task_metrics)
+        
+        asyncio.run(scenario())
@@ -0,0 +1,138 @@
+"""
+D17: SimulatedExchange 매칭 엔진 테스트
+
+L2 레벨 소진, 이벤트 시간 지연 큐(도착/보고), 잔존 지정가 주문의
+가격-시간 우선 체결, 취소 경합 검증.
+"""
+
+import pytest
+
+from arbitrage.exchange.simulated import (
+    TIME_IN_FORCE_IOC,
+    SimulatedExchange,
+)
+from arbitrage.types import OrderSide, OrderStatus
+
+SYMBOL = "KRW-BTC"
+
+
+def _exchange(latency_ms=0.0, fee_bps=0.0):
+    exchange = SimulatedExchange(
+        initial_balance={"KRW": 1_000_000.0, "BTC": 10.0},
+        fee_bps=fee_bps,
+        latency_ms=latency_ms,
+    )
+    exchange.update_order_book(SYMBOL, [(99.0, 1.0), (98.0, 2.0)], [(101.0, 1.0), (102.0, 2.0), (103.0, 5.0)])
+    return exchange
+
+
+class TestMatching:
+    """호가 레벨 소진 테스트"""
+    
+    def test_market_order_walks_levels(self):
+        exchange = _exchange(fee_bps=10.0)
+        
+        order = exchange.get_order(exchange.submit_order(SYMBOL, OrderSide.BUY, 2.5))
+        
+        assert order.status == OrderStatus.FILLED
+        assert order.filled_quantity == pytest.approx(2.5)
+        assert exchange.get_average_fill_price(order.order_id) == pytest.approx((101.0 + 1.5 * 102.0) / 2.5)
+        assert exchange.get_order_book(SYMBOL).asks.levels() == [(102.0, 0.5), (103.0, 5.0)]
+        notional = 101.0 + 1.5 * 102.0
+        assert exchange.balance["KRW"] == pytest.approx(1_000_000.0 - notional * 1.001)
+        assert exchange.balance["BTC"] == pytest.approx(12.5)
+    
+    def test_limit_ioc_stops_at_price(self):
+        exchange = _exchange()
+        
+        order = exchange.get_order(
+            exchange.submit_order(SYMBOL, OrderSide.SELL, 5.0, 98.5, TIME_IN_FORCE_IOC)
+        )
+        
+        assert order.status == OrderStatus.PARTIALLY_FILLED
+        assert order.filled_quantity == pytest.approx(1.0)
+        assert exchange.get_order_book(SYMBOL).bid == 98.0
+    
+    def test_no_book_rejected(self):
+        exchange = _exchange()
+        
+        order = exchange.get_order(exchange.submit_order("KRW-ETH", OrderSide.BUY, 1.0))
+        
+        assert order.status == OrderStatus.REJECTED
+    
+    def test_legacy_set_price_keeps_slippage(self):
+        exchange = SimulatedExchange(slippage_bps=10.0, fee_bps=0.0, latency_ms=0.0)
+        exchange.set_price(SYMBOL, 99.0, 100.0)
+        
+        order_id = exchange.submit_order(SYMBOL, OrderSide.BUY, 1.0)
+        
+        assert exchange.get_average_fill_price(order_id) == pytest.approx(100.1)
+
+
+class TestLatencyQueue:
+    """이벤트 시간 지연 테스트"""
+    
+    def test_order_sees_book_at_arrival_and_report_after_ack(self):
+        exchange = _exchange(latency_ms=100.0)
+        order = exchange.get_order(exchange.submit_order(SYMBOL, OrderSide.BUY, 1.0))
+        
+        # 도착 전 호가 변경 → 도착 시점 호가로 체결
+        exchange.update_order_book(SYMBOL, [(99.0, 1.0)], [(105.0, 1.0)], timestamp=0.05)
+        exchange.advance_to(0.15)
+        
+        assert order.status == OrderStatus.PENDING  # 체결됐지만 보고 전
+        assert exchange.get_average_fill_price(order.order_id) == 105.0
+        
+        exchange.advance_to(0.2)
+        assert order.status == OrderStatus.FILLED
+    
+    def test_cancel_loses_race_against_fill(self):
+        exchange = _exchange(latency_ms=100.0)
+        order_id = exchange.submit_order(SYMBOL, OrderSide.BUY, 1.0, 100.0)
+        exchange.advance_to(0.2)
+        assert exchange.get_order(order_id).status == OrderStatus.PENDING  # 잔존 ack
+        
+        # 취소 요청 전송 후, 도착 전에 호가가 지정가에 닿음
+        assert exchange.submit_cancel(order_id)
+        exchange.update_order_book(SYMBOL, [(99.0, 1.0)], [(100.0, 3.0)], timestamp=0.25)
+        exchange.advance_to(1.0)
+        
+        assert exchange.get_order(order_id).status == OrderStatus.FILLED
+        assert not exchange.submit_cancel(order_id)
+    
+    def test_cancel_resting_order(self):
+        exchange = _exchange(latency_ms=100.0)
+        order_id = exchange.submit_order(SYMBOL, OrderSide.SELL, 1.0, 110.0)
+        exchange.submit_cancel(order_id)
+        exchange.advance_to(1.0)
+        
+        exchange.update_order_book(SYMBOL, [(120.0, 5.0)], [(121.0, 5.0)], timestamp=2.0)
+        exchange.advance_to(3.0)
+        
+        assert exchange.get_order(order_id).status == OrderStatus.CANCELLED
+        assert exchange.get_order(order_id).filled_quantity == 0.0
+
+
+class TestRestingOrders:
+    """잔존 지정가 주문 테스트"""
+    
+    def test_price_time_priority_on_book_move(self):
+        exchange = _exchange()
+        first = exchange.submit_order(SYMBOL, OrderSide.BUY, 1.0, 100.0)
+        second = exchange.submit_order(SYMBOL, OrderSide.BUY, 1.0, 100.0)
+        better = exchange.submit_order(SYMBOL, OrderSide.BUY, 1.0, 100.5)
+        
+        # 1.5 수량만 지정가 이하로 내려옴
+        exchange.update_order_book(SYMBOL, [(99.0, 1.0)], [(100.0, 1.5), (101.0, 1.0)])
+        
+        assert exchange.get_order(better).status == OrderStatus.FILLED
+        assert exchange.get_order(first).status == OrderStatus.PARTIALLY_FILLED
+        assert exchange.get_order(first).filled_quantity == pytest.approx(0.5)
+        assert exchange.get_order(second).filled_quantity == 0.0
+        assert exchange.get_stats()["resting_orders"] == 2
+        
+        exchange.apply_delta(SYMBOL, OrderSide.SELL, 99.5, 2.0)
+        
+        assert exchange.get_order(first).status == OrderStatus.FILLED
+        assert exchange.get_order(second).status == OrderStatus.FILLED
+        assert exchange.get_order_book(SYMBOL).asks.levels(1) == [(99.5, 0.5)]
@@ -218,9 +218,10 @@ class TestK8sHealthHistoryStore:
         with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.jsonl') as f:
             temp_path = f.name
         yield temp_path
-        # 정리
-        if os.path.exists(temp_path):
-            os.remove(temp_path)
+        # 정리 (사이드카 포함)
+        for path in (temp_path, f"{temp_path}.idx", f"{temp_path}.summary.json"):
+            if os.path.exists(path):
+                os.remove(path)
     
     @pytest.fixture
     def store(self, temp_file):
@@ -448,6 +449,138 @@ class TestK8sHealthHistoryStore:
         assert record.jobs_error == 1
 
 
+class TestK8sHealthHistoryStoreIndexed:
+    """K8sHealthHistoryStore tail-read / 인덱스 / 증분 요약 테스트"""
+    
+    @pytest.fixture
+    def temp_file(self):
+        """임시 파일"""
+        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.jsonl') as f:
+            temp_path = f.name
+        yield temp_path
+        # 정리 (사이드카 포함)
+        for path in (temp_path, f"{temp_path}.idx", f"{temp_path}.summary.json"):
+            if os.path.exists(path):
+                os.remove(path)
+    
+    @staticmethod
+    def _snapshot(i, health="OK"):
+        return K8sHealthSnapshot(
+            namespace="trading-bots",
+            selector="app=arbitrage-tuning",
+            jobs_health=[],
+            errors=[],
+            overall_health=health,
+            timestamp=f"2025-11-16T{i // 60:02d}:{i % 60:02d}:00Z"
+        )
+    
+    def test_load_recent_tail_read_order(self, temp_file):
+        """역방향 tail-read가 최근 N개를 오래된 순으로 반환"""
+        store = K8sHealthHistoryStore(temp_file)
+        for i in range(300):
+            store.append(self._snapshot(i))
+        
+        records = store.load_recent(limit=5)
+        
+        assert [r.timestamp for r in records] == [
+            self._snapshot(i).timestamp for i in range(295, 300)
+        ]
+    
+    def test_load_recent_small_block_boundaries(self, temp_file):
+        """블록 경계에 걸친 라인도 정확히 복원"""
+        store = K8sHealthHistoryStore(temp_file)
+        for i in range(50):
+            store.append(self._snapshot(i))
+        
+        with open(temp_file, 'rb') as f:
+            lines = list(K8sHealthHistoryStore._iter_lines_reverse(f, block_size=7))
+        
+        with open(temp_file, 'rb') as f:
+            expected = f.read().split(b'\n')
+        
+        assert [l for l in lines if l] == list(reversed([l for l in expected if l]))
+    
+    def test_load_range_uses_index(self, temp_file):
+        """범위 조회 결과가 전체 스캔 결과와 동일"""
+        store = K8sHealthHistoryStore(temp_file)
+        for i in range(500):
+            store.append(self._snapshot(i))
+        
+        start = self._snapshot(200).timestamp
+        end = self._snapshot(209).timestamp
+        records = store.load_range(start, end)
+        
+        assert [r.timestamp for r in records] == [
+            self._snapshot(i).timestamp for i in range(200, 210)
+        ]
+        assert os.path.exists(store.index_path)
+        
+        # 열린 범위
+        assert len(store.load_range(start_timestamp=self._snapshot(490).timestamp)) == 10
+        assert len(store.load_range(end_timestamp=self._snapshot(9).timestamp)) == 10
+    
+    def test_summary_counters_persist_across_instances(self, temp_file):
+        """증분 요약 카운터가 사이드카로 유지됨"""
+        store = K8sHealthHistoryStore(temp_file)
+        for i in range(3):
+            store.append(self._snapshot(i, "OK"))
+        store.append(self._snapshot(3, "ERROR"))
+        
+        reopened = K8sHealthHistoryStore(temp_file)
+        summary = reopened.summarize()
+        
+        assert summary["total_records"] == 4
+        assert summary["ok_count"] == 3
+        assert summary["error_count"] == 1
+        assert summary["last_overall_health"] == "ERROR"
+        assert summary["last_timestamp"] == self._snapshot(3).timestamp
+    
+    def test_summary_catches_up_external_appends(self, temp_file):
+        """외부에서 추가된 라인을 증분 반영"""
+        store = K8sHealthHistoryStore(temp_file)
+        store.append(self._snapshot(0, "OK"))
+        assert store.summarize()["total_records"] == 1
+        
+        with open(temp_file, 'a', encoding='utf-8') as f:
+            f.write(json.dumps({"timestamp": "2025-11-16T01:00:00Z", "overall_health": "WARN"}) + "\n")
+            f.write("invalid json line\n")
+        
+        summary = store.summarize()
+        
+        assert summary["total_records"] == 2
+        assert summary["warn_count"] == 1
+        assert summary["last_overall_health"] == "WARN"
+    
+    def test_sidecars_rebuilt_after_truncation(self, temp_file):
+        """히스토리 파일 로테이션(축소) 시 사이드카 재구성"""
+        store = K8sHealthHistoryStore(temp_file)
+        for i in range(10):
+            store.append(self._snapshot(i))
+        
+        # 로테이션: 파일을 비우고 새 레코드 1개
+        open(temp_file, 'w').close()
+        reopened = K8sHealthHistoryStore(temp_file)
+        reopened.append(self._snapshot(100, "WARN"))
+        
+        summary = reopened.summarize()
+        
+        assert summary["total_records"] == 1
+        assert summary["warn_count"] == 1
+    
+    def test_corrupted_summary_sidecar_rebuilt(self, temp_file):
+        """손상된 요약 사이드카는 재구성"""
+        store = K8sHealthHistoryStore(temp_file)
+        for i in range(5):
+            store.append(self._snapshot(i))
+        
+        with open(store.summary_path, 'w') as f:
+            f.write("{not json")
+        
+        summary = K8sHealthHistoryStore(temp_file).summarize()
+        
+        assert summary["total_records"] == 5
+
+
 class TestObservabilityPolicyD34:
     """D34 Observability 정책 준수 테스트"""
     
@@ -33,7 +33,7 @@ class TestD46BinanceAdapter:
         assert exchange.leverage == 1
         assert exchange.live_enabled is False
 
-    @patch("requests.get")
+    @patch("requests.Session.request")
     def test_get_orderbook_success(self, mock_get):
         """호가 조회 성공"""
         config = {
@@ -69,7 +69,7 @@ class TestD46BinanceAdapter:
         assert snapshot.bids[0][0] == 40000.0  # 최상단 bid
         assert snapshot.asks[0][0] == 40100.0  # 최상단 ask
 
-    @patch("requests.get")
+    @patch("requests.Session.request")
     def test_get_orderbook_network_error(self, mock_get):
         """호가 조회 네트워크 에러"""
         config = {
@@ -87,7 +87,7 @@ class TestD46BinanceAdapter:
         with pytest.raises(NetworkError):
             exchange.get_orderbook("BTCUSDT")
 
-    @patch("requests.get")
+    @patch("requests.Session.request")
     def test_get_orderbook_empty_response(self, mock_get):
         """호가 조회 빈 응답"""
         config = {
@@ -130,7 +130,7 @@ class TestD46BinanceAdapter:
         with pytest.raises(AuthenticationError):
             exchange.get_balance()
 
-    @patch("requests.get")
+    @patch("requests.Session.request")
     def test_get_balance_success(self, mock_get):
         """잔고 조회 성공"""
         config = {
@@ -170,7 +170,7 @@ class TestD46BinanceAdapter:
         assert balances["USDT"].free == 10000.0
         assert balances["BTC"].free == 1.5
 
-    @patch("requests.get")
+    @patch("requests.Session.request")
     def test_get_balance_network_error(self, mock_get):
         """잔고 조회 네트워크 에러"""
         config = {
@@ -31,7 +31,7 @@ class TestD46UpbitAdapter:
         assert exchange.api_secret == "test_secret"
         assert exchange.live_enabled is False
 
-    @patch("requests.get")
+    @patch("requests.Session.request")
     def test_get_orderbook_success(self, mock_get):
         """호가 조회 성공"""
         config = {
@@ -73,7 +73,7 @@ class TestD46UpbitAdapter:
         assert snapshot.bids[0][0] == 100000.0  # 최상단 bid
         assert snapshot.asks[0][0] == 100500.0  # 최상단 ask
 
-    @patch("requests.get")
+    @patch("requests.Session.request")
     def test_get_orderbook_network_error(self, mock_get):
         """호가 조회 네트워크 에러"""
         config = {
@@ -91,7 +91,7 @@ class TestD46UpbitAdapter:
         with pytest.raises(NetworkError):
             exchange.get_orderbook("BTC-KRW")
 
-    @patch("requests.get")
+    @patch("requests.Session.request")
     def test_get_orderbook_empty_response(self, mock_get):
         """호가 조회 빈 응답"""
         config = {
@@ -133,7 +133,7 @@ class TestD46UpbitAdapter:
         with pytest.raises(AuthenticationError):
             exchange.get_balance()
 
-    @patch("requests.get")
+    @patch("requests.Session.request")
     def test_get_balance_success(self, mock_get):
         """잔고 조회 성공"""
         config = {
@@ -170,7 +170,7 @@ class TestD46UpbitAdapter:
         assert balances["KRW"].free == 1000000.0
         assert balances["BTC"].free == 1.5
 
-    @patch("requests.get")
+    @patch("requests.Session.request")
     def test_get_balance_network_error(self, mock_get):
         """잔고 조회 네트워크 에러"""
         config = {
@@ -37,7 +37,7 @@ class TestD48HTTPClientRateLimit:
         assert client.config.max_retry == 3
         assert client.config.base_backoff_seconds == 0.5
 
-    @patch('arbitrage.exchanges.http_client.requests.request')
+    @patch('requests.Session.request')
     def test_http_get_success(self, mock_request):
         """GET 요청 성공"""
         mock_response = Mock()
@@ -52,7 +52,7 @@ class TestD48HTTPClientRateLimit:
         assert response.json() == {"result": "ok"}
         mock_request.assert_called_once()
 
-    @patch('arbitrage.exchanges.http_client.requests.request')
+    @patch('requests.Session.request')
     def test_http_post_success(self, mock_request):
         """POST 요청 성공"""
         mock_response = Mock()
@@ -69,7 +69,7 @@ class TestD48HTTPClientRateLimit:
         assert response.status_code == 201
         mock_request.assert_called_once()
 
-    @patch('arbitrage.exchanges.http_client.requests.request')
+    @patch('requests.Session.request')
     def test_http_delete_success(self, mock_request):
         """DELETE 요청 성공"""
         mock_response = Mock()
@@ -82,7 +82,7 @@ class TestD48HTTPClientRateLimit:
         assert response.status_code == 204
         mock_request.assert_called_once()
 
-    @patch('arbitrage.exchanges.http_client.requests.request')
+    @patch('requests.Session.request')
     @patch('arbitrage.exchanges.http_client.time.sleep')
     def test_http_retry_on_500_error(self, mock_sleep, mock_request):
         """500 에러 시 재시도"""
@@ -107,7 +107,7 @@ class TestD48HTTPClientRateLimit:
         assert mock_request.call_count == 3
         assert mock_sleep.call_count == 2  # 2번 재시도
 
-    @patch('arbitrage.exchanges.http_client.requests.request')
+    @patch('requests.Session.request')
     @patch('arbitrage.exchanges.http_client.time.sleep')
     def test_http_retry_on_429_rate_limit(self, mock_sleep, mock_request):
         """429 (Rate Limit) 에러 시 재시도"""
@@ -129,7 +129,7 @@ class TestD48HTTPClientRateLimit:
         assert response.status_code == 200
         assert mock_request.call_count == 2
 
-    @patch('arbitrage.exchanges.http_client.requests.request')
+    @patch('requests.Session.request')
     @patch('arbitrage.exchanges.http_client.time.sleep')
     def test_http_retry_exhausted(self, mock_sleep, mock_request):
         """재시도 횟수 초과"""
@@ -144,7 +144,7 @@ class TestD48HTTPClientRateLimit:
         assert response.status_code == 500
         assert mock_request.call_count == 2
 
-    @patch('arbitrage.exchanges.http_client.requests.request')
+    @patch('requests.Session.request')
     @patch('arbitrage.exchanges.http_client.time.sleep')
     def test_http_retry_on_timeout(self, mock_sleep, mock_request):
         """타임아웃 시 재시도"""
@@ -159,7 +159,7 @@ class TestD48HTTPClientRateLimit:
         assert response.status_code == 200
         assert mock_request.call_count == 2
 
-    @patch('arbitrage.exchanges.http_client.requests.request')
+    @patch('requests.Session.request')
     def test_http_timeout_exhausted(self, mock_request):
         """타임아웃 재시도 횟수 초과"""
         mock_request.side_effect = requests.Timeout("Connection timeout")
@@ -171,7 +171,7 @@ class TestD48HTTPClientRateLimit:
         
         assert mock_request.call_count == 2
 
-    @patch('arbitrage.exchanges.http_client.requests.request')
+    @patch('requests.Session.request')
     @patch('arbitrage.exchanges.http_client.time.sleep')
     def test_exponential_backoff(self, mock_sleep, mock_request):
         """Exponential backoff 검증"""
@@ -202,7 +202,7 @@ class TestD48HTTPClientRateLimit:
         # 첫 번째 backoff: 0.5 * 2^0 = 0.5
         # 두 번째 backoff: 0.5 * 2^1 = 1.0
 
-    @patch('arbitrage.exchanges.http_client.requests.request')
+    @patch('requests.Session.request')
     def test_rate_limit_enforcement(self, mock_request):
         """레이트리밋 적용 검증"""
         mock_response = Mock()
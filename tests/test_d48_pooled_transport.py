@@ -0,0 +1,142 @@
+"""
+D48: Pooled Transport & Signing 테스트
+
+keep-alive 커넥션 재사용, DNS 캐시, 단계별 지연 계측, 사전 계산 서명 검증
+"""
+
+import hashlib
+import hmac
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from arbitrage.exchanges.binance_futures import BinanceFuturesExchange
+from arbitrage.exchanges.http_client import HTTPClient
+from arbitrage.exchanges.signing import HmacSigner
+from arbitrage.exchanges.transport import PooledTransport, RequestTiming, TransportConfig
+from arbitrage.exchanges.upbit_spot import UpbitSpotExchange
+
+
+class _JSONHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    
+    def do_GET(self):
+        body = json.dumps({"path": self.path}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def do_HEAD(self):
+        self.send_response(200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+    
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _JSONHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://localhost:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+class TestD48PooledTransport:
+    """D48 PooledTransport 테스트"""
+    
+    def test_keep_alive_reuses_connection(self, server_url):
+        """두 번째 요청부터 커넥션 재사용 (connect 시간 없음)"""
+        transport = PooledTransport(name="test")
+        
+        first = transport.get(f"{server_url}/a", timeout=5)
+        second = transport.get(f"{server_url}/b", timeout=5)
+        
+        assert transport.parse_json(first) == {"path": "/a"}
+        assert transport.parse_json(second) == {"path": "/b"}
+        assert first.timing.reused is False
+        assert first.timing.connect_ms > 0.0
+        assert second.timing.reused is True
+        assert second.timing.connect_ms == 0.0
+        
+        stats = transport.get_stats()
+        assert stats["requests_sent"] == 2
+        assert stats["connections_opened"] == 1
+        assert stats["connection_reuse_ratio"] == pytest.approx(0.5)
+        assert stats["total_p99_ms"] >= stats["ttfb_p50_ms"] > 0.0
+        transport.close()
+    
+    def test_dns_cache_used_for_new_connections(self, server_url):
+        """커넥션이 새로 열릴 때만 DNS 조회, TTL 내 재사용"""
+        transport = PooledTransport(TransportConfig(pool_maxsize=1), name="test")
+        
+        transport.get(f"{server_url}/a", timeout=5)
+        transport.session.close()  # 풀 비우기 → 재연결
+        transport.get(f"{server_url}/b", timeout=5)
+        
+        stats = transport.get_stats()
+        assert stats["connections_opened"] == 2
+        assert stats["dns_cache_misses"] == 1
+        assert stats["dns_cache_hits"] == 1
+        transport.close()
+    
+    def test_prewarm(self, server_url):
+        """pre-warm 후 첫 요청은 커넥션 재사용, 실패 URL은 예외 없이 건너뜀"""
+        transport = PooledTransport(TransportConfig(prewarm_timeout=0.5), name="test")
+        
+        assert transport.prewarm([f"{server_url}/", "http://127.0.0.1:9/"]) == 1
+        response = transport.get(f"{server_url}/order", timeout=5)
+        
+        assert response.timing.reused is True
+        transport.close()
+    
+    def test_http_client_uses_transport(self, server_url):
+        """HTTPClient 요청이 주입된 transport를 통해 전송"""
+        transport = PooledTransport(name="test")
+        client = HTTPClient(transport=transport)
+        
+        response = client.get(f"{server_url}/x")
+        
+        assert isinstance(response.timing, RequestTiming)
+        assert client.get_latency_stats()["requests_sent"] == 1
+        transport.close()
+
+
+class TestD48Signing:
+    """D48 사전 계산 서명 테스트"""
+    
+    def test_hmac_signer_matches_hmac_new(self):
+        signer = HmacSigner("test_secret")
+        for message in ("", "timestamp=1", "symbol=BTCUSDT&side=BUY&quantity=0.01"):
+            expected = hmac.new(b"test_secret", message.encode(), hashlib.sha256).hexdigest()
+            assert signer.sign(message) == expected
+    
+    def test_upbit_auth_headers(self):
+        exchange = UpbitSpotExchange({"api_key": "test_key", "api_secret": "test_secret"})
+        
+        headers = exchange._auth_headers("market=KRW-BTC")
+        message = f"{headers['X-Nonce']}{headers['X-Timestamp']}market=KRW-BTC"
+        
+        assert headers["Authorization"] == "Bearer test_key"
+        assert headers["X-Signature"] == hmac.new(
+            b"test_secret", message.encode(), hashlib.sha256
+        ).hexdigest()
+        # 템플릿은 요청 간 공유되지 않음
+        assert "X-Nonce" not in exchange._auth_header_template
+    
+    def test_exchanges_share_transport_per_exchange(self):
+        """동일 거래소 어댑터는 커넥션 풀 공유"""
+        upbit_a = UpbitSpotExchange({"api_key": "a", "api_secret": "a"})
+        upbit_b = UpbitSpotExchange({"api_key": "b", "api_secret": "b"})
+        binance = BinanceFuturesExchange({"api_key": "c", "api_secret": "c"})
+        
+        assert upbit_a.transport is upbit_b.transport
+        assert upbit_a.http_client.transport is upbit_a.transport
+        assert binance.transport is not upbit_a.transport
@@ -0,0 +1,330 @@
+"""
+D49: Private User Data Stream 테스트
+
+로컬 WebSocket 서버로 주문/체결 push, 재연결 시 reconcile, 단조 상태 갱신 검증
+"""
+
+import asyncio
+import json
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+websockets = pytest.importorskip("websockets")
+from websockets.asyncio.server import serve
+
+from arbitrage.exchanges.base import OrderResult, OrderSide, OrderStatus, OrderType
+from arbitrage.exchanges.user_data_stream import (
+    BinanceUserDataStream,
+    OrderStateTable,
+    OrderUpdate,
+    UpbitPrivateStream,
+    UserDataStream,
+)
+from arbitrage.exchanges.ws_client import ReconnectBackoffConfig
+from arbitrage.execution.executor import LiveExecutor
+from arbitrage.order_manager import OrderManager
+
+FAST_RECONNECT = ReconnectBackoffConfig(initial=0.01, max=0.05)
+
+
+class StubBinance:
+    """listenKey / REST 주문 조회 stub"""
+    
+    def __init__(self):
+        self.listen_keys = 0
+        self.status_calls = []
+    
+    def create_listen_key(self):
+        self.listen_keys += 1
+        return f"key{self.listen_keys}"
+    
+    def keepalive_listen_key(self):
+        pass
+    
+    def get_order_status(self, order_id):
+        self.status_calls.append(order_id)
+        return OrderResult(
+            order_id=order_id,
+            symbol="BTCUSDT",
+            side=OrderSide.SELL,
+            qty=0.01,
+            price=40000.0,
+            order_type=OrderType.LIMIT,
+            status=OrderStatus.FILLED,
+            filled_qty=0.01,
+        )
+
+
+def _order_trade_update(order_id, status, filled, event_ms):
+    return json.dumps({
+        "e": "ORDER_TRADE_UPDATE",
+        "E": event_ms,
+        "o": {
+            "s": "BTCUSDT", "i": order_id, "S": "SELL", "q": "0.01", "p": "40000",
+            "X": status, "z": str(filled), "ap": "40001.5",
+        },
+    })
+
+
+class TestOrderStateTable:
+    """OrderStateTable 테스트"""
+    
+    def test_monotonic_updates(self):
+        table = OrderStateTable()
+        table.apply(OrderUpdate("binance", "1", "BTCUSDT", OrderStatus.PARTIALLY_FILLED, filled_qty=0.5, event_time=2.0))
+        
+        # 과거 이벤트 / 체결량 감소는 무시
+        assert not table.apply(OrderUpdate("binance", "1", "BTCUSDT", OrderStatus.OPEN, event_time=1.0))
+        assert not table.apply(OrderUpdate("binance", "1", "BTCUSDT", OrderStatus.PARTIALLY_FILLED, filled_qty=0.2, event_time=3.0))
+        assert table.apply(OrderUpdate("binance", "1", "BTCUSDT", OrderStatus.FILLED, filled_qty=1.0, event_time=3.0))
+        # 종료 후 이벤트 무시
+        assert not table.apply(OrderUpdate("binance", "1", "BTCUSDT", OrderStatus.CANCELED, filled_qty=1.0, event_time=4.0))
+        
+        assert table.get("1").status == OrderStatus.FILLED
+        assert table.updates_ignored == 3
+    
+    def test_sync_waiter_woken_by_push(self):
+        table = OrderStateTable()
+        table.track("upbit", "u1", "KRW-BTC")
+        
+        def push():
+            time.sleep(0.02)
+            table.apply(OrderUpdate("upbit", "u1", "KRW-BTC", OrderStatus.FILLED, filled_qty=1.0))
+        
+        threading.Thread(target=push).start()
+        started = time.perf_counter()
+        update = table.wait_for_fill_sync("u1", timeout=2.0)
+        
+        assert update.is_terminal
+        assert time.perf_counter() - started < 1.0
+        with pytest.raises(TimeoutError):
+            table.wait_for_fill_sync("missing", timeout=0.01)
+    
+    def test_order_manager_follows_stream(self):
+        table = OrderStateTable()
+        manager = OrderManager(order_state=table)
+        order = manager.create_order("binance", "BTCUSDT", "SELL", 0.01, 40000.0)
+        manager.link_exchange_order(order.order_id, "777")
+        
+        table.apply(OrderUpdate("binance", "777", "BTCUSDT", OrderStatus.FILLED, filled_qty=0.01, avg_price=40001.0))
+        
+        assert manager.is_order_filled(order.order_id)
+        assert manager.get_order(order.order_id).average_fill_price == 40001.0
+
+
+class TestBinanceUserDataStream:
+    """Binance listenKey 스트림 테스트 (로컬 서버)"""
+    
+    def test_push_fill_and_reconcile_on_reconnect(self):
+        async def scenario():
+            paths = []
+            
+            async def handler(connection):
+                paths.append(connection.request.path)
+                if len(paths) == 1:
+                    await connection.send(_order_trade_update(1, "NEW", 0, 1000))
+                    await connection.send(_order_trade_update(1, "FILLED", 0.01, 1001))
+                    await connection.send(json.dumps({
+                        "e": "ACCOUNT_UPDATE", "E": 1002,
+                        "a": {"B": [{"a": "USDT", "wb": "100.0", "cw": "90.0"}]},
+                    }))
+                    await asyncio.sleep(0.05)
+                    # 주문 2 이벤트 전송 전 연결 끊김 → gap
+                    await connection.close()
+                    return
+                await connection.wait_closed()
+            
+            async with serve(handler, "127.0.0.1", 0) as server:
+                port = server.sockets[0].getsockname()[1]
+                exchange = StubBinance()
+                stream = BinanceUserDataStream(
+                    exchange,
+                    ws_base_url=f"ws://127.0.0.1:{port}",
+                    reconnect_config=FAST_RECONNECT,
+                )
+                await stream.start()
+                
+                update = await stream.wait_for_fill("1", timeout=2.0)
+                assert update.status == OrderStatus.FILLED
+                assert update.avg_price == pytest.approx(40001.5)
+                stream.orders.track("binance", "2", "BTCUSDT")
+                await asyncio.sleep(0.02)
+                assert stream.balances["USDT"].locked == pytest.approx(10.0)
+                assert exchange.status_calls == []
+                
+                # 재연결(새 listenKey) 후 reconcile로 주문 2 상태 보정
+                update = await stream.wait_for_fill("2", timeout=2.0)
+                assert update.status == OrderStatus.FILLED
+                # 주문 1은 push로 종료 → REST 조회 없음
+                assert exchange.status_calls == ["2"]
+                assert paths[:2] == ["/ws/key1", "/ws/key2"]
+                
+                await stream.stop()
+        
+        asyncio.run(scenario())
+    
+    def test_reconcile_skipped_without_order_status_support(self):
+        """placeholder get_order_status 어댑터는 reconcile하지 않음 (상태 유지)"""
+        exchange = StubBinance()
+        exchange.supports_order_status = False
+        stream = BinanceUserDataStream(exchange)
+        stream.orders.track("binance", "2", "BTCUSDT")
+        
+        assert asyncio.run(stream.reconcile()) == 0
+        assert exchange.status_calls == []
+        assert stream.orders.get("2").status == OrderStatus.OPEN
+        assert stream.reconciles == 0
+    
+    def test_stream_without_parse_message_cannot_be_created(self):
+        """parse_message 미구현 스트림은 첫 메시지가 아니라 생성 시점에 실패"""
+        class IncompleteStream(UserDataStream):
+            async def subscribe(self, channels):
+                pass
+        
+        with pytest.raises(TypeError, match="parse_message"):
+            IncompleteStream(StubBinance(), "wss://example.invalid")
+
+
+class TestUpbitPrivateStream:
+    """Upbit myOrder / myAsset 스트림 테스트"""
+    
+    def test_subscribe_with_auth_and_parse(self):
+        async def scenario():
+            received = {}
+            
+            async def handler(connection):
+                received["auth"] = connection.request.headers.get("Authorization")
+                received["subscribe"] = json.loads(await connection.recv())
+                await connection.send(json.dumps({
+                    "type": "myOrder", "code": "KRW-BTC", "uuid": "abc", "ask_bid": "BID",
+                    "state": "trade", "volume": 1.0, "executed_volume": 0.4,
+                    "remaining_volume": 0.6, "avg_price": 50000000.0, "timestamp": 1000,
+                }).encode())
+                await connection.send(json.dumps({
+                    "type": "myOrder", "code": "KRW-BTC", "uuid": "abc", "ask_bid": "BID",
+                    "state": "done", "volume": 1.0, "executed_volume": 1.0,
+                    "remaining_volume": 0.0, "avg_price": 50000100.0, "timestamp": 1001,
+                }).encode())
+                await connection.send(json.dumps({
+                    "type": "myAsset",
+                    "assets": [{"currency": "KRW", "balance": "1000", "locked": "50"}],
+                }).encode())
+                await connection.wait_closed()
+            
+            async with serve(handler, "127.0.0.1", 0) as server:
+                port = server.sockets[0].getsockname()[1]
+                exchange = SimpleNamespace(_auth_headers=lambda: {"Authorization": "Bearer k"})
+                stream = UpbitPrivateStream(exchange, url=f"ws://127.0.0.1:{port}")
+                await stream.start()
+                
+                update = await stream.wait_for_fill("abc", timeout=2.0)
+                assert update.status == OrderStatus.FILLED
+                assert update.side == OrderSide.BUY
+                assert update.filled_qty == 1.0
+                await asyncio.sleep(0.02)
+                assert stream.balances["KRW"].locked == 50.0
+                assert received["auth"] == "Bearer k"
+                assert [item.get("type") for item in received["subscribe"][1:]] == ["myOrder", "myAsset"]
+                
+                await stream.stop()
+        
+        asyncio.run(scenario())
+
+
+class RecordingOrderApi:
+    """LiveExecutor용 주문 API stub (생성/취소 기록, 취소 시 CANCELED push)"""
+    
+    def __init__(self, exchange, id_key, first_id, table=None):
+        self.exchange = exchange
+        self.id_key = id_key
+        self.next_id = first_id
+        self.table = table
+        self.created = []
+        self.canceled = []
+    
+    def create_order(self, **kwargs):
+        self.created.append(kwargs)
+        order_id = self.next_id
+        self.next_id = f"{order_id}x" if isinstance(order_id, str) else order_id + 1
+        return {self.id_key: order_id}
+    
+    def cancel_order(self, order_id):
+        self.canceled.append(order_id)
+        if self.table is not None:
+            current = self.table.get(order_id)
+            self.table.apply(OrderUpdate(
+                self.exchange, order_id, current.symbol, OrderStatus.CANCELED,
+                filled_qty=current.filled_qty, event_time=time.time(),
+            ))
+
+
+class TestLiveExecutorFills:
+    """LiveExecutor 체결 대기 테스트"""
+    
+    def _executor(self, table, fill_timeout=0.2, upbit_api=None, binance_api=None):
+        upbit_api = upbit_api or SimpleNamespace(create_order=lambda **kwargs: {"uuid": "u1"})
+        binance_api = binance_api or SimpleNamespace(create_order=lambda **kwargs: {"orderId": 9})
+        return LiveExecutor(
+            symbol="KRW-BTC",
+            portfolio_state=None,
+            risk_guard=None,
+            upbit_api=upbit_api,
+            binance_api=binance_api,
+            dry_run=False,
+            order_state=table,
+            fill_timeout=fill_timeout,
+        )
+    
+    def _trade(self):
+        return SimpleNamespace(
+            trade_id="t1", symbol="KRW-BTC", buy_exchange="upbit", sell_exchange="binance",
+            quantity=1.0, buy_price=100.0, sell_price=101.0,
+        )
+    
+    def test_partial_when_leg_not_filled(self):
+        table = OrderStateTable()
+        table.apply(OrderUpdate("upbit", "u1", "KRW-BTC", OrderStatus.FILLED, filled_qty=1.0))
+        table.apply(OrderUpdate("binance", "9", "BTCUSDT", OrderStatus.PARTIALLY_FILLED, filled_qty=0.5))
+        
+        result = self._executor(table)._execute_single_trade(self._trade())
+        
+        assert result.status == "partial"
+        assert result.buy_fill_ratio == 1.0
+        assert result.sell_fill_ratio == 0.5
+    
+    def test_partial_cancels_remainder_and_unwinds_excess(self):
+        """부분 체결: 잔량 취소 → 매칭 수량 포지션 기록 → 초과 매수분 시장가 매도"""
+        table = OrderStateTable()
+        upbit_api = RecordingOrderApi("upbit", "uuid", "u1", table)
+        binance_api = RecordingOrderApi("binance", "orderId", 9, table)
+        table.apply(OrderUpdate("upbit", "u1", "KRW-BTC", OrderStatus.FILLED, filled_qty=1.0))
+        table.apply(OrderUpdate("binance", "9", "BTCUSDT", OrderStatus.PARTIALLY_FILLED, filled_qty=0.25, event_time=0.0))
+        executor = self._executor(table, upbit_api=upbit_api, binance_api=binance_api)
+        
+        result = executor._execute_single_trade(self._trade())
+        
+        assert binance_api.canceled == ["9"]
+        assert upbit_api.canceled == []
+        assert result.status == "partial"
+        assert result.quantity == pytest.approx(0.25)
+        assert result.pnl == pytest.approx(0.25)
+        assert result.unwind_qty == pytest.approx(0.75)
+        assert result.unwind_order_id == "u1x"
+        assert upbit_api.created[-1] == {
+            "market": "KRW-BTC", "side": "ask", "ord_type": "market", "volume": pytest.approx(0.75),
+        }
+        positions = list(executor.get_positions().values())
+        assert len(positions) == 1
+        assert positions[0].quantity == pytest.approx(0.25)
+    
+    def test_success_when_both_filled(self):
+        table = OrderStateTable()
+        table.apply(OrderUpdate("upbit", "u1", "KRW-BTC", OrderStatus.FILLED, filled_qty=1.0))
+        table.apply(OrderUpdate("binance", "9", "BTCUSDT", OrderStatus.FILLED, filled_qty=1.0))
+        
+        result = self._executor(table)._execute_single_trade(self._trade())
+        
+        assert result.status == "success"
@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+"""
+D74-5: Sharded Multi-Symbol Engine 테스트
+
+심볼 분배 / 프로세스 간 GlobalGuard 공유 / 샤드별 통계 집계 검증.
+"""
+
+import multiprocessing
+import os
+
+import pytest
+
+from arbitrage.arbitrage_core import ArbitrageConfig as LegacyEngineConfig
+from arbitrage.exchanges.paper_exchange import PaperExchange
+from arbitrage.live_runner import ArbitrageLiveConfig
+from arbitrage.multi_symbol_engine import MultiSymbolEngineRunner, partition_symbols
+from arbitrage.risk.multi_symbol_risk_guard import (
+    GlobalGuard,
+    MultiSymbolRiskCoordinator,
+    PortfolioGuard,
+    RiskGuardDecision,
+    SharedGlobalGuard,
+)
+from arbitrage.symbol_universe import (
+    DummySymbolSource,
+    SymbolUniverse,
+    SymbolUniverseConfig,
+    SymbolUniverseMode,
+)
+
+pytestmark = pytest.mark.skipif(
+    "fork" not in multiprocessing.get_all_start_methods(),
+    reason="fork start method required",
+)
+
+SYMBOLS = ["BTCUSDT", "ETHUSDT", "BNBUSDT", "XRPUSDT"]
+
+
+def _add_exposure(guard, count):
+    for _ in range(count):
+        guard.update_exposure(1.0)
+        guard.record_trade_executed()
+
+
+def _runner(global_guard=None):
+    universe = SymbolUniverse(
+        SymbolUniverseConfig(mode=SymbolUniverseMode.FIXED_LIST, whitelist=SYMBOLS),
+        DummySymbolSource(),
+    )
+    coordinator = MultiSymbolRiskCoordinator(
+        global_guard=global_guard or GlobalGuard(),
+        portfolio_guard=PortfolioGuard(),
+        symbols=SYMBOLS,
+    )
+    return MultiSymbolEngineRunner(
+        universe=universe,
+        exchange_a=PaperExchange(initial_balance={"KRW": 10000000.0}),
+        exchange_b=PaperExchange(initial_balance={"USDT": 10000.0}),
+        engine_config=LegacyEngineConfig(
+            min_spread_bps=30.0,
+            taker_fee_a_bps=5.0,
+            taker_fee_b_bps=5.0,
+            slippage_bps=5.0,
+            max_position_usd=1000.0,
+        ),
+        live_config=ArbitrageLiveConfig(symbol_a="KRW-BTC", symbol_b="BTCUSDT", mode="paper"),
+        risk_coordinator=coordinator,
+    )
+
+
+class TestPartition:
+    """심볼 분배 테스트"""
+    
+    def test_round_robin_without_empty_shards(self):
+        assert partition_symbols(SYMBOLS, 2) == [["BTCUSDT", "BNBUSDT"], ["ETHUSDT", "XRPUSDT"]]
+        assert partition_symbols(SYMBOLS[:2], 8) == [["BTCUSDT"], ["ETHUSDT"]]
+
+
+class TestSharedGlobalGuard:
+    """프로세스 간 GlobalGuard 공유 테스트"""
+    
+    def test_updates_from_workers_are_atomic(self):
+        ctx = multiprocessing.get_context("fork")
+        guard = SharedGlobalGuard(max_total_exposure_usd=1000.0, context=ctx)
+        
+        workers = [ctx.Process(target=_add_exposure, args=(guard, 200)) for _ in range(3)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        
+        assert guard.state.total_exposure_usd == 600.0
+        assert guard.state.total_trades_executed == 600
+        assert guard.check_global_limits(400.0) == RiskGuardDecision.OK
+        assert guard.check_global_limits(401.0) == RiskGuardDecision.REJECTED_GLOBAL
+    
+    def test_emergency_stop_visible_across_processes(self):
+        ctx = multiprocessing.get_context("fork")
+        guard = SharedGlobalGuard(emergency_stop_loss_usd=100.0, context=ctx)
+        
+        worker = ctx.Process(target=guard.update_daily_loss, args=(150.0,))
+        worker.start()
+        worker.join()
+        
+        assert guard.check_global_limits() == RiskGuardDecision.SESSION_STOP
+        assert guard.get_stats()["emergency_stop_triggered"] is True
+    
+    def test_from_guard_copies_state(self):
+        guard = GlobalGuard(max_total_exposure_usd=500.0)
+        guard.update_exposure(120.0)
+        
+        shared = SharedGlobalGuard.from_guard(guard)
+        
+        assert shared.max_total_exposure_usd == 500.0
+        assert shared.state.total_exposure_usd == 120.0
+
+
+class TestShardedRun:
+    """샤드 실행 테스트"""
+    
+    @pytest.mark.asyncio
+    async def test_sharded_run_aggregates_per_shard_stats(self):
+        runner = _runner()
+        
+        stats = await runner.run_multi(max_iterations=2, num_shards=2, start_method="fork")
+        
+        assert stats["num_shards"] == 2
+        assert stats["total_iterations"] == 2 * len(SYMBOLS)
+        assert [shard["symbols"] for shard in stats["shards"]] == partition_symbols(SYMBOLS, 2)
+        pids = {shard["pid"] for shard in stats["shards"]}
+        assert len(pids) == 2 and os.getpid() not in pids
+        assert all(shard["total_iterations"] == 4 for shard in stats["shards"])
+        assert runner.risk_coordinator.ledger is not None
+        
+        live = runner.get_stats()["shards"]
+        assert sum(shard["iterations"] for shard in live) == 2 * len(SYMBOLS)
+    
+    @pytest.mark.asyncio
+    async def test_global_session_stop_halts_all_shards(self):
+        guard = SharedGlobalGuard(emergency_stop_loss_usd=100.0)
+        guard.update_daily_loss(200.0)
+        runner = _runner(guard)
+        
+        stats = await runner.run_multi(max_iterations=5, num_shards=2, start_method="fork")
+        
+        assert stats["total_iterations"] == 0
+        assert stats["global_risk"]["emergency_stop_triggered"] is True
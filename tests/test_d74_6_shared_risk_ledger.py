@@ -0,0 +1,320 @@
+# -*- coding: utf-8 -*-
+"""
+D74-6: Shared-Memory Risk Ledger 테스트
+
+원자적 reserve/commit/release, seqlock 일관 읽기, 스냅샷 복원, Guard 연동 검증.
+"""
+
+import multiprocessing
+import os
+import threading
+import time
+
+import pytest
+
+from arbitrage.arbitrage_core import ArbitrageConfig, ArbitrageEngine, OrderBookSnapshot
+from arbitrage.exchanges.paper_exchange import PaperExchange
+from arbitrage.live_runner import ArbitrageLiveConfig, ArbitrageLiveRunner
+from arbitrage.risk.multi_symbol_risk_guard import (
+    GlobalGuard,
+    MultiSymbolRiskCoordinator,
+    PortfolioGuard,
+    RiskGuardDecision,
+)
+from arbitrage.risk.shared_risk_ledger import SharedRiskLedger
+
+pytestmark = pytest.mark.skipif(
+    "fork" not in multiprocessing.get_all_start_methods(),
+    reason="fork start method required",
+)
+
+
+class DictStateStore:
+    """StateStore Redis 인터페이스 stub"""
+    
+    def __init__(self):
+        self.saved = {}
+    
+    def save_state_to_redis(self, session_id, state_data):
+        self.saved.setdefault(session_id, {}).update(state_data)
+        return True
+    
+    def load_state_from_redis(self, session_id):
+        return self.saved.get(session_id)
+
+
+def _reserve_many(ledger, symbol, attempts, results):
+    for _ in range(attempts):
+        if ledger.reserve(symbol, 10.0, max_total_exposure_usd=1000.0):
+            results.put(1)
+
+
+def _shift_reserved_to_exposure(ledger, count):
+    for _ in range(count):
+        ledger.add(None, exposure_usd=1.0, reserved_usd=-1.0)
+
+
+def _die_mid_write(ledger):
+    """쓰기 도중 종료된 writer (lock 보유 + seq 홀수 상태로 종료)"""
+    ledger._lock.acquire()
+    ledger._header[0] += 1
+    os._exit(0)
+
+
+@pytest.fixture
+def ledger():
+    ctx = multiprocessing.get_context("fork")
+    ledger = SharedRiskLedger(max_symbols=16, context=ctx)
+    yield ledger
+    ledger.close()
+
+
+class TestSharedRiskLedger:
+    """원장 기본 동작 테스트"""
+    
+    def test_reserve_commit_release_lifecycle(self, ledger):
+        assert ledger.reserve("BTCUSDT", 100.0, max_total_exposure_usd=150.0, max_symbol_exposure_usd=120.0)
+        assert not ledger.reserve("BTCUSDT", 30.0, max_symbol_exposure_usd=120.0)
+        assert ledger.read().total_exposure_usd == 100.0
+        
+        ledger.commit("BTCUSDT", 100.0)
+        entry = ledger.read("BTCUSDT")
+        assert (entry.exposure_usd, entry.reserved_usd, entry.trades_rejected) == (100.0, 0.0, 1.0)
+        
+        ledger.release("BTCUSDT", 100.0, pnl_usd=-7.5)
+        total = ledger.read()
+        assert total.exposure_usd == 0.0
+        assert total.daily_loss_usd == 7.5
+        assert total.trades_executed == 1.0
+        assert ledger.read("UNKNOWN").exposure_usd == 0.0
+    
+    def test_reserve_is_atomic_across_processes(self, ledger):
+        ctx = multiprocessing.get_context("fork")
+        results = ctx.Queue()
+        workers = [
+            ctx.Process(target=_reserve_many, args=(ledger, symbol, 50, results))
+            for symbol in ("BTCUSDT", "ETHUSDT", "BTCUSDT", "XRPUSDT")
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        
+        granted = 0
+        while not results.empty():
+            granted += results.get()
+        # 4 × 50 × 10 USD 시도 중 한도 1000 USD만큼만 예약
+        assert granted == 100
+        assert ledger.read().reserved_usd == 1000.0
+    
+    def test_seqlock_reads_are_consistent(self, ledger):
+        ledger.add(None, reserved_usd=50000.0)
+        ctx = multiprocessing.get_context("fork")
+        writer = ctx.Process(target=_shift_reserved_to_exposure, args=(ledger, 20000))
+        writer.start()
+        
+        reads = 0
+        while writer.is_alive() or reads == 0:
+            entry = ledger.read()
+            assert entry.exposure_usd + entry.reserved_usd == 50000.0
+            reads += 1
+        writer.join()
+        
+        assert ledger.read().exposure_usd == 20000.0
+    
+    def test_stalled_writer_falls_back_to_locked_read(self, ledger):
+        """seqlock 재시도 상한 초과 시 lock 획득 후 읽기 (writer 종료까지 대기)"""
+        ledger.SPIN_LIMIT = 10
+        ledger.add(None, exposure_usd=1.0)
+        entered = threading.Event()
+        
+        def slow_writer():
+            with ledger._writing():
+                entered.set()
+                time.sleep(0.1)
+                ledger._rows[0, 0] += 1.0
+        
+        writer = threading.Thread(target=slow_writer)
+        writer.start()
+        entered.wait()
+        
+        assert ledger.read().exposure_usd == 2.0
+        assert ledger.snapshot()["global"]["exposure_usd"] == 2.0
+        writer.join()
+    
+    def test_dead_writer_read_times_out(self, ledger):
+        """lock을 쥔 채 종료된 writer → 무한 대기 대신 TimeoutError"""
+        ledger.SPIN_LIMIT = 10
+        ledger.LOCKED_READ_TIMEOUT = 0.05
+        ctx = multiprocessing.get_context("fork")
+        writer = ctx.Process(target=_die_mid_write, args=(ledger,))
+        writer.start()
+        writer.join()
+        
+        with pytest.raises(TimeoutError):
+            ledger.read()
+        with pytest.raises(TimeoutError):
+            ledger.snapshot()
+    
+    def test_cancel_is_single_write(self, ledger):
+        ledger.reserve("BTCUSDT", 100.0)
+        seq = int(ledger._header[0])
+        
+        ledger.cancel("BTCUSDT", 100.0)
+        
+        assert int(ledger._header[0]) == seq + 2
+        assert ledger.read().reserved_usd == 0.0
+        assert ledger.read("BTCUSDT").reserved_usd == 0.0
+    
+    def test_read_latency_microseconds(self, ledger):
+        ledger.add("BTCUSDT", exposure_usd=1.0)
+        started = time.perf_counter()
+        for _ in range(10000):
+            ledger.read("BTCUSDT")
+        per_read_us = (time.perf_counter() - started) / 10000 * 1e6
+        
+        assert per_read_us < 50.0
+    
+    def test_snapshot_restore_drops_reservations(self, ledger):
+        store = DictStateStore()
+        ledger.commit("ETHUSDT", 300.0, reserved=False)
+        ledger.reserve("ETHUSDT", 50.0)
+        ledger.add(None, daily_loss_usd=12.0)
+        assert ledger.save_snapshot(store, "s1")
+        
+        restored = SharedRiskLedger(max_symbols=4)
+        try:
+            assert restored.load_snapshot(store, "s1")
+            assert restored.read("ETHUSDT").exposure_usd == 300.0
+            assert restored.read().reserved_usd == 0.0
+            assert restored.read().daily_loss_usd == 12.0
+            assert not restored.load_snapshot(store, "missing")
+        finally:
+            restored.close()
+    
+    def test_periodic_snapshots(self, ledger):
+        store = DictStateStore()
+        ledger.add("BTCUSDT", exposure_usd=5.0)
+        ledger.start_snapshots(store, "s1", interval_seconds=0.01)
+        time.sleep(0.1)
+        ledger.stop_snapshots()
+        
+        assert store.saved["s1"]["risk_ledger"]["symbols"]["BTCUSDT"]["exposure_usd"] == 5.0
+
+
+class TestLedgerGuards:
+    """Guard ↔ 원장 연동 테스트"""
+    
+    def _coordinator(self, ledger=None, total_capital_usd=1000.0, max_total_exposure_usd=600.0):
+        portfolio = PortfolioGuard(total_capital_usd=total_capital_usd, max_symbol_allocation_pct=1.0)
+        portfolio.allocate_capital(["BTCUSDT", "ETHUSDT"])
+        return MultiSymbolRiskCoordinator(
+            global_guard=GlobalGuard(max_total_exposure_usd=max_total_exposure_usd),
+            portfolio_guard=portfolio,
+            symbols=["BTCUSDT", "ETHUSDT"],
+            symbol_guard_config={"cooldown_seconds": 0.0, "max_position_count": 5},
+            ledger=ledger,
+        )
+    
+    def test_coordinators_share_limits(self, ledger):
+        shard_a = self._coordinator(ledger)
+        shard_b = self._coordinator(ledger)
+        
+        assert shard_a.reserve_trade("BTCUSDT", 400.0) == RiskGuardDecision.OK
+        shard_a.on_trade_entry("BTCUSDT", 400.0, reserved=True)
+        
+        # 다른 샤드에서도 전체 노출 400 USD가 보임
+        assert shard_b.global_guard.get_stats()["total_exposure_usd"] == 400.0
+        assert shard_b.reserve_trade("ETHUSDT", 300.0) == RiskGuardDecision.REJECTED_GLOBAL
+        assert shard_b.reserve_trade("ETHUSDT", 200.0) == RiskGuardDecision.OK
+        shard_b.cancel_reservation("ETHUSDT", 200.0)
+        
+        shard_a.on_trade_exit("BTCUSDT", 400.0, pnl_usd=-20.0)
+        stats = shard_b.get_stats()
+        assert stats["global"]["total_exposure_usd"] == 0.0
+        assert stats["global"]["total_daily_loss_usd"] == 20.0
+        assert stats["symbols"]["BTCUSDT"]["daily_loss_usd"] == 20.0
+        assert stats["symbols"]["BTCUSDT"]["current_position_count"] == 0
+    
+    def test_attach_carries_local_state(self, ledger):
+        coordinator = self._coordinator()
+        coordinator.on_trade_entry("BTCUSDT", 100.0)
+        
+        coordinator.attach_ledger(ledger)
+        
+        assert ledger.read().exposure_usd == 100.0
+        assert ledger.read("BTCUSDT").exposure_usd == 100.0
+        assert ledger.read("BTCUSDT").position_count == 1.0
+        assert coordinator.check_trade_allowed("BTCUSDT", 501.0) == RiskGuardDecision.REJECTED_GLOBAL
+    
+    def _live_runner(self, coordinator):
+        exchange_a = PaperExchange()
+        runner = ArbitrageLiveRunner(
+            engine=ArbitrageEngine(ArbitrageConfig(
+                min_spread_bps=30.0,
+                taker_fee_a_bps=5.0,
+                taker_fee_b_bps=5.0,
+                slippage_bps=5.0,
+                max_position_usd=1000.0,
+            )),
+            exchange_a=exchange_a,
+            exchange_b=PaperExchange(),
+            config=ArbitrageLiveConfig(symbol_a="KRW-BTC", symbol_b="BTCUSDT"),
+            risk_coordinator=coordinator,
+        )
+        return runner, exchange_a
+    
+    def test_runner_reserves_before_entry(self, ledger):
+        """runner는 진입 전 원장에 예약, 다른 샤드 노출로 한도 초과면 주문 없이 거부"""
+        other_shard = self._coordinator(ledger, total_capital_usd=10000.0, max_total_exposure_usd=1500.0)
+        coordinator = self._coordinator(ledger, total_capital_usd=10000.0, max_total_exposure_usd=1500.0)
+        snapshot = OrderBookSnapshot("t", 100000.0, 100100.0, 41000.0, 41100.0)
+        
+        assert other_shard.reserve_trade("ETHUSDT", 1000.0) == RiskGuardDecision.OK
+        other_shard.on_trade_entry("ETHUSDT", 1000.0, reserved=True)
+        runner, exchange_a = self._live_runner(coordinator)
+        runner.execute_trades(runner.process_snapshot(snapshot))
+        
+        assert exchange_a._orders == {}
+        assert ledger.read("BTCUSDT").total_exposure_usd == 0.0
+        
+        other_shard.on_trade_exit("ETHUSDT", 1000.0, pnl_usd=0.0)
+        runner, exchange_a = self._live_runner(coordinator)
+        trades = runner.process_snapshot(snapshot)
+        runner.execute_trades(trades)
+        
+        assert len(exchange_a._orders) == 1
+        entry = ledger.read("BTCUSDT")
+        assert entry.exposure_usd == trades[0].notional_usd
+        assert entry.reserved_usd == 0.0
+    
+    def test_rejected_entry_close_does_not_release_exposure(self, ledger):
+        """거절된 진입을 엔진이 종료해도 원장 노출은 해제하지 않음 (확정된 진입만 해제)"""
+        other_shard = self._coordinator(ledger, total_capital_usd=10000.0, max_total_exposure_usd=1500.0)
+        coordinator = self._coordinator(ledger, total_capital_usd=10000.0, max_total_exposure_usd=1500.0)
+        entry_snapshot = OrderBookSnapshot("t1", 100000.0, 100100.0, 41000.0, 41100.0)
+        exit_snapshot = OrderBookSnapshot("t2", 100000.0, 100100.0, 40000.0, 40050.0)
+        
+        assert other_shard.reserve_trade("ETHUSDT", 1000.0) == RiskGuardDecision.OK
+        other_shard.on_trade_entry("ETHUSDT", 1000.0, reserved=True)
+        runner, exchange_a = self._live_runner(coordinator)
+        runner.execute_trades(runner.process_snapshot(entry_snapshot))
+        assert exchange_a._orders == {}
+        
+        # 엔진은 거절된 진입도 open으로 유지하다 스프레드 역전 시 종료
+        closed = runner.process_snapshot(exit_snapshot)
+        assert [trade.is_open for trade in closed] == [False]
+        runner.execute_trades(closed)
+        
+        assert ledger.read("BTCUSDT").exposure_usd == 0.0
+        assert ledger.read().exposure_usd == 1000.0
+        assert coordinator.reserve_trade("BTCUSDT", 550.0) == RiskGuardDecision.REJECTED_GLOBAL
+        
+        # 확정된 진입은 종료 시 노출 해제
+        other_shard.on_trade_exit("ETHUSDT", 1000.0, pnl_usd=0.0)
+        runner, exchange_a = self._live_runner(coordinator)
+        runner.execute_trades(runner.process_snapshot(entry_snapshot))
+        assert ledger.read("BTCUSDT").exposure_usd > 0.0
+        runner.execute_trades(runner.process_snapshot(exit_snapshot))
+        assert ledger.read("BTCUSDT").exposure_usd == 0.0
+        assert ledger.read().exposure_usd == 0.0
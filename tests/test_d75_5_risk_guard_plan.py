@@ -0,0 +1,119 @@
+"""
+D75-5: FourTierRiskGuard Compiled Plan 테스트
+
+evaluate()/evaluate_many() 결정이 evaluate_full()과 동일한지, 단락 평가와
+지연 reason 생성이 동작하는지 검증.
+"""
+
+import random
+
+import pytest
+
+from arbitrage.domain.risk_guard import (
+    FourTierRiskGuard,
+    FourTierRiskGuardConfig,
+    GuardDecisionType,
+    GuardReasonCode,
+    GuardTier,
+    LazyTierDecisions,
+    RouteState,
+)
+from scripts.benchmark_d75_5_risk_guard_plan import FakeClock, random_tick, run_paths
+
+
+class ExplodingStates(dict):
+    """조회되면 실패하는 상태 dict (단락 평가 확인용)"""
+    
+    def values(self):
+        raise AssertionError("tier should have been skipped")
+
+
+def _guard():
+    clock = FakeClock()
+    return FourTierRiskGuard(FourTierRiskGuardConfig(), clock=clock), clock
+
+
+class TestCompiledPlanEquivalence:
+    """evaluate_full과의 결정 일치 테스트"""
+    
+    @pytest.mark.parametrize("seed", [1, 2, 3])
+    def test_randomized_decisions_identical(self, seed):
+        rng = random.Random(seed)
+        ticks = [random_tick(rng, routes=6) for _ in range(400)]
+        
+        results = run_paths(ticks)
+        
+        reference = results["full"][0]
+        assert results["compiled"][0] == reference
+        assert results["batch"][0] == reference
+        # 모든 결정 유형이 실제로 등장하는지 (테스트 데이터 검증)
+        assert {(allow, degraded) for allow, degraded, _, _ in reference} == {
+            (True, False), (False, True), (False, False),
+        }
+    
+    def test_lazy_tier_decisions_match_full_reasons(self):
+        rng = random.Random(7)
+        full_guard, full_clock = _guard()
+        fast_guard, fast_clock = _guard()
+        
+        for _ in range(200):
+            exchange_states, route_states, symbol_states, global_state = random_tick(rng, routes=3)
+            for route_state in route_states:
+                full = full_guard.evaluate_full(exchange_states, route_state, symbol_states, global_state)
+                fast = fast_guard.evaluate(exchange_states, route_state, symbol_states, global_state)
+                
+                assert isinstance(fast.tier_decisions, LazyTierDecisions)
+                assert not fast.tier_decisions.loaded
+                assert dict(fast.tier_decisions) == full.tier_decisions
+                assert fast.get_reason_summary() == full.get_reason_summary()
+            full_clock.now += 30.0
+            fast_clock.now += 30.0
+        
+        assert fast_guard._route_cooldown_until == full_guard._route_cooldown_until
+
+
+class TestShortCircuit:
+    """단락 평가 / cooldown 테스트"""
+    
+    def test_block_skips_remaining_tiers(self):
+        guard, _ = _guard()
+        exchange_states, route_states, _, global_state = random_tick(random.Random(0), routes=1)
+        global_state.global_daily_loss_usd = 1e9
+        
+        decision = guard.evaluate(exchange_states, route_states[0], ExplodingStates(), global_state)
+        
+        assert decision.allow is False and decision.degraded is False
+    
+    def test_streak_cooldown_applies_within_batch(self):
+        guard, clock = _guard()
+        exchange_states, _, symbol_states, global_state = random_tick(random.Random(0), routes=1)
+        global_state.global_daily_loss_usd = 1e9
+        routes = [
+            RouteState("KRW-BTC", "BTCUSDT", recent_trades=[-1.0, -1.0, -1.0]),
+            RouteState("KRW-BTC", "BTCUSDT"),
+        ]
+        
+        first, second = guard.evaluate_many(exchange_states, routes, symbol_states, global_state)
+        
+        # Global BLOCK이어도 route streak cooldown은 설정됨
+        assert first.cooldown_seconds == 300.0
+        assert second.cooldown_seconds == 300.0
+        assert second.tier_decisions[GuardTier.ROUTE].decision == GuardDecisionType.COOLDOWN_ONLY
+        # reason 생성은 cooldown 상태를 바꾸지 않음
+        assert first.tier_decisions[GuardTier.ROUTE].reasons == [GuardReasonCode.ROUTE_STREAK_LOSS]
+        assert guard._route_cooldown_until[("KRW-BTC", "BTCUSDT")] == clock.now + 300.0
+    
+    def test_recompile_after_config_change(self):
+        guard, _ = _guard()
+        exchange_states, _, symbol_states, global_state = random_tick(random.Random(0), routes=1)
+        route_state = RouteState("KRW-ETH", "ETHUSDT", gross_spread_bps=100.0)
+        for state in exchange_states.values():
+            state.daily_loss_usd = 0.0
+        global_state.global_daily_loss_usd = 0.0
+        
+        guard.config.route.abnormal_spread_threshold_bps = 50.0
+        guard.recompile()
+        decision = guard.evaluate(exchange_states, route_state, {}, global_state)
+        
+        assert guard.plan.route_abnormal_spread_bps == 50.0
+        assert GuardReasonCode.ROUTE_SPREAD_ABNORMAL in decision.tier_decisions[GuardTier.ROUTE].reasons
@@ -0,0 +1,149 @@
+"""
+D77-0: Exit Scheduler 테스트
+
+TimerWheel 만료 시점, 트리거 레벨 인덱싱, 전체 스캔(check_exit)과의 결과 일치 검증.
+"""
+
+import random
+
+import pytest
+
+from arbitrage.domain.exit_scheduler import ExitScheduler, TimerWheel
+from arbitrage.domain.exit_strategy import ExitConfig, ExitReason, ExitStrategy
+
+
+class FakeClock:
+    """수동 진행 시계"""
+    
+    def __init__(self, now=1000.0):
+        self.now = now
+    
+    def __call__(self):
+        return self.now
+
+
+def _config(max_hold=60.0):
+    return ExitConfig(
+        tp_threshold_pct=0.25,
+        sl_threshold_pct=0.20,
+        max_hold_time_seconds=max_hold,
+        spread_reversal_threshold_bps=-10.0,
+    )
+
+
+class TestTimerWheel:
+    """TimerWheel 테스트"""
+    
+    def test_fires_not_before_deadline_across_levels(self):
+        # 4 slot × 2 level → 0.4초 / 1.6초 범위, 그 이상은 overflow
+        wheel = TimerWheel(tick_seconds=0.1, slots_per_level=4, levels=2, start_time=0.0)
+        deadlines = {"a": 0.25, "b": 0.9, "c": 1.55, "d": 7.3, "e": 0.0}
+        for key, deadline in deadlines.items():
+            wheel.schedule(key, deadline)
+        
+        fired = {}
+        now = 0.0
+        while len(wheel):
+            for key in wheel.advance(now):
+                fired[key] = now
+            now = round(now + 0.05, 2)
+        
+        for key, deadline in deadlines.items():
+            assert deadline <= fired[key] <= deadline + 0.1 + 1e-9
+    
+    def test_cancel_and_reschedule(self):
+        wheel = TimerWheel(tick_seconds=0.1, start_time=0.0)
+        wheel.schedule("a", 1.0)
+        wheel.schedule("b", 1.0)
+        assert wheel.cancel("a")
+        assert not wheel.cancel("a")
+        wheel.schedule("b", 5.0)
+        
+        assert wheel.advance(2.0) == []
+        assert wheel.advance(5.0) == ["b"]
+        assert len(wheel) == 0
+
+
+class TestExitScheduler:
+    """ExitScheduler 테스트"""
+    
+    @pytest.mark.parametrize("seed,max_hold", [(1, 5.0), (2, 60.0), (3, 5.0)])
+    def test_matches_full_scan(self, seed, max_hold):
+        rng = random.Random(seed)
+        clock = FakeClock()
+        reference = ExitStrategy(_config(max_hold))
+        scheduler = ExitScheduler(ExitStrategy(_config(max_hold)), clock=clock)
+        prices = {symbol: (100000.0, 99900.0) for symbol in ("BTC", "ETH", "XRP")}
+        position_id = 0
+        exits = 0
+        
+        for _ in range(1500):
+            clock.now += rng.choice([0.05, 0.5, 1.5])
+            if rng.random() < 0.3:
+                symbol = rng.choice(list(prices))
+                price_a, price_b = prices[symbol]
+                reference.register_position(position_id, symbol, "USDT", price_a, price_b, 10.0, 1.0, open_time=clock.now)
+                scheduler.register_position(position_id, symbol, "USDT", price_a, price_b, 10.0, 1.0)
+                position_id += 1
+            
+            for symbol, (price_a, price_b) in prices.items():
+                price_a *= 1 + rng.gauss(0, 0.0008)
+                price_b *= 1 + rng.gauss(0, 0.0008)
+                prices[symbol] = (price_a, price_b)
+                spread_bps = rng.gauss(20, 15)
+                
+                expected = {}
+                for pid, position in reference.get_open_positions().items():
+                    if position.symbol_a == symbol:
+                        decision = reference.check_exit(pid, price_a, price_b, spread_bps, now=clock.now)
+                        if decision.should_exit:
+                            expected[pid] = decision.reason
+                actual = {
+                    pid: decision.reason
+                    for pid, decision in scheduler.on_book_update(symbol, price_a, price_b, spread_bps)
+                }
+                
+                assert actual == expected
+                for pid in expected:
+                    reference.unregister_position(pid)
+                    scheduler.unregister_position(pid)
+                exits += len(expected)
+        
+        assert exits > 100
+        # 평가 횟수 = 실제 exit 수 (HOLD position은 평가하지 않음)
+        assert scheduler.get_stats()["exit_checks"] <= exits + scheduler.get_stats()["timer_expirations"]
+    
+    def test_book_update_touches_only_crossed_positions(self):
+        clock = FakeClock()
+        scheduler = ExitScheduler(ExitStrategy(_config(max_hold=600.0)), clock=clock)
+        for pid in range(1000):
+            # entry gap 0 ~ 99.9 → TP 레벨 ≈ gap + 250, SL 레벨 ≈ gap - 200
+            scheduler.register_position(pid, "BTC", "USDT", 100000.0 + pid * 0.1, 100000.0, 10.0, 1.0)
+        
+        assert scheduler.on_book_update("BTC", 100000.0, 100000.0, 20.0) == []
+        assert scheduler.get_stats()["exit_checks"] == 0
+        
+        # x = 250.05 → TP 레벨을 넘는 position은 pid 0 (250.0)뿐
+        exits = scheduler.on_book_update("BTC", 100250.05, 100000.0, 20.0)
+        
+        assert [pid for pid, _ in exits] == [0]
+        assert exits[0][1].reason == ExitReason.TAKE_PROFIT
+        assert scheduler.get_stats()["exit_checks"] == 1
+    
+    def test_time_limit_via_poll(self):
+        clock = FakeClock()
+        scheduler = ExitScheduler(ExitStrategy(_config(max_hold=30.0)), clock=clock)
+        scheduler.register_position(1, "BTC", "USDT", 100000.0, 99900.0, 10.0, 1.0)
+        scheduler.on_book_update("BTC", 100000.0, 99900.0, 20.0)
+        
+        clock.now += 29.0
+        assert scheduler.poll() == []
+        clock.now += 1.0
+        exits = scheduler.poll()
+        
+        assert [(pid, decision.reason) for pid, decision in exits] == [(1, ExitReason.TIME_LIMIT)]
+        # exit 실행 전까지는 다음 호가 갱신에서도 재평가
+        assert len(scheduler.on_book_update("BTC", 100000.0, 99900.0, 20.0)) == 1
+        scheduler.unregister_position(1)
+        assert scheduler.get_stats()["tracked_positions"] == 0
+        assert scheduler.strategy.get_position_count() == 0
@@ -87,6 +87,37 @@ class TestUpbitPublicDataClient:
         assert orderbook.bids[0].price == 49990000.0
         assert orderbook.asks[0].price == 50010000.0
     
+    def test_fetch_tickers_and_orderbooks_multi_market(self):
+        """다중 마켓 티커/호가 조회 (요청 1회)"""
+        client = UpbitPublicDataClient()
+        
+        ticker_resp = Mock()
+        ticker_resp.status_code = 200
+        ticker_resp.json.return_value = [
+            {"market": "KRW-BTC", "trade_price": 50000000.0, "acc_trade_price_24h": 5e9},
+            {"market": "KRW-ETH", "trade_price": 3000000.0, "acc_trade_price_24h": 1e9},
+        ]
+        orderbook_resp = Mock()
+        orderbook_resp.status_code = 200
+        orderbook_resp.json.return_value = [
+            {"market": "KRW-BTC", "timestamp": 1, "orderbook_units": [
+                {"bid_price": 49990000.0, "bid_size": 0.1, "ask_price": 50010000.0, "ask_size": 0.2},
+            ]},
+            {"market": "KRW-ETH", "timestamp": 1, "orderbook_units": [
+                {"bid_price": 2999000.0, "bid_size": 1.0, "ask_price": 3001000.0, "ask_size": 1.0},
+            ]},
+        ]
+        
+        with patch.object(client.session, 'get', side_effect=[ticker_resp, orderbook_resp]) as mock_get:
+            tickers = client.fetch_tickers(["KRW-BTC", "KRW-ETH"])
+            orderbooks = client.fetch_orderbooks(["KRW-BTC", "KRW-ETH"])
+        
+        assert mock_get.call_count == 2
+        assert mock_get.call_args_list[0].kwargs["params"] == {"markets": "KRW-BTC,KRW-ETH"}
+        assert tickers["KRW-ETH"].acc_trade_price_24h == 1e9
+        assert orderbooks["KRW-BTC"].bids[0].price == 49990000.0
+        assert orderbooks["KRW-ETH"].asks[0].price == 3001000.0
+    
     def test_fetch_top_symbols_success(self):
         """Top symbols 조회 성공"""
         client = UpbitPublicDataClient()
@@ -0,0 +1,263 @@
+# -*- coding: utf-8 -*-
+"""
+D79-4: Concurrent Two-Leg Execution Tests
+
+레그 동시 제출 / 공유 deadline / leg skew / 부분 체결 헷지 검증.
+"""
+
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from arbitrage.cross_exchange import (
+    CrossExchangeExecutor,
+    CrossExchangeDecision,
+    CrossExchangeAction,
+    FXConverter,
+)
+from arbitrage.exchanges.base import OrderResult, OrderStatus, OrderSide, OrderType
+from arbitrage.monitoring.cross_exchange_metrics import CrossExchangeMetrics
+
+
+class LatencyStubExchange:
+    """주문 응답 지연을 주입할 수 있는 stub 거래소"""
+    
+    def __init__(
+        self,
+        name: str,
+        latency: float = 0.0,
+        fill_ratio: float = 1.0,
+        fill_ratio_on_cancel: float = None,
+    ):
+        self.name = name
+        self.latency = latency
+        self.fill_ratio = fill_ratio
+        # 취소 요청과 응답 사이에 추가 체결된 비율 (None이면 추가 체결 없음)
+        self.fill_ratio_on_cancel = fill_ratio_on_cancel
+        self.orders = []
+        self.canceled = []
+        self._lock = threading.Lock()
+    
+    def create_order(self, symbol, side, qty, price, order_type=OrderType.LIMIT, **kwargs):
+        time.sleep(self.latency)
+        filled = qty if order_type == OrderType.MARKET else qty * self.fill_ratio
+        if filled >= qty:
+            status = OrderStatus.FILLED
+        elif filled > 0:
+            status = OrderStatus.PARTIALLY_FILLED
+        else:
+            status = OrderStatus.OPEN
+        with self._lock:
+            order = OrderResult(
+                order_id=f"{self.name}_{len(self.orders) + 1}",
+                symbol=symbol,
+                side=side,
+                qty=qty,
+                price=price,
+                order_type=order_type,
+                status=status,
+                filled_qty=filled,
+            )
+            self.orders.append(order)
+        return order
+    
+    def cancel_order(self, order_id):
+        self.canceled.append(order_id)
+        order = self.get_order_status(order_id)
+        if self.fill_ratio_on_cancel is not None:
+            order.filled_qty = order.qty * self.fill_ratio_on_cancel
+        order.status = OrderStatus.FILLED if order.filled_qty >= order.qty else OrderStatus.CANCELED
+        return True
+    
+    def get_order_status(self, order_id):
+        with self._lock:
+            return next(order for order in self.orders if order.order_id == order_id)
+
+
+def _net_exposure(*exchanges):
+    """체결 기준 순 포지션 (BUY +, SELL -)"""
+    return sum(
+        order.filled_qty if order.side == OrderSide.BUY else -order.filled_qty
+        for exchange in exchanges
+        for order in exchange.orders
+    )
+
+
+def _executor(upbit, binance, **kwargs):
+    return CrossExchangeExecutor(
+        upbit_client=upbit,
+        binance_client=binance,
+        position_manager=Mock(),
+        fx_converter=FXConverter(),
+        **kwargs,
+    )
+
+
+def _decision():
+    return CrossExchangeDecision(
+        action=CrossExchangeAction.ENTRY_POSITIVE,
+        symbol_upbit="KRW-BTC",
+        symbol_binance="BTCUSDT",
+        notional_krw=100_000_000,
+        spread_percent=0.8,
+        reason="test entry",
+        timestamp=time.time(),
+    )
+
+
+class TestConcurrentLegs:
+    """동시 레그 제출 테스트"""
+    
+    def test_concurrent_legs_reduce_skew(self):
+        """동시 제출 시 leg skew가 순차 제출 대비 감소"""
+        sequential = _executor(
+            LatencyStubExchange("upbit", 0.05), LatencyStubExchange("binance", 0.05),
+            concurrent_legs=False,
+        )
+        concurrent = _executor(
+            LatencyStubExchange("upbit", 0.05), LatencyStubExchange("binance", 0.05),
+        )
+        
+        seq_result = sequential.execute_decision(_decision())
+        con_result = concurrent.execute_decision(_decision())
+        
+        assert seq_result.status == con_result.status == "success"
+        # 순차: Binance 레그가 Upbit 왕복만큼 뒤처짐
+        assert seq_result.leg_skew_ms >= 45.0
+        assert con_result.leg_skew_ms < 25.0
+        assert con_result.execution_time_ms < seq_result.execution_time_ms
+        
+        metrics = concurrent.get_metrics()
+        assert metrics["leg_skew_p99_ms"] == pytest.approx(con_result.leg_skew_ms)
+        assert metrics["upbit_leg_latency_p50_ms"] >= 45.0
+        concurrent.close()
+        sequential.close()
+    
+    def test_shared_deadline_marks_slow_leg_pending(self):
+        """deadline 초과 레그는 pending(체결 미확정) 처리, 늦은 응답은 late_legs로 집계"""
+        upbit = LatencyStubExchange("upbit", 0.0)
+        binance = LatencyStubExchange("binance", 0.3)
+        executor = _executor(upbit, binance, leg_deadline_sec=0.05)
+        
+        started = time.perf_counter()
+        result = executor.execute_decision(_decision())
+        elapsed = time.perf_counter() - started
+        
+        assert elapsed < 0.25
+        assert result.upbit.is_filled()
+        assert result.binance.is_pending()
+        assert result.binance.error == "deadline exceeded"
+        assert result.status == "hedge_pending"
+        assert result.hedge is None
+        assert executor.get_metrics()["hedge_pending_executions"] == 1
+        
+        time.sleep(0.4)
+        assert executor.get_metrics()["late_legs"] == 1
+        executor.close()
+    
+    def test_late_fill_after_deadline_is_not_unwound(self):
+        """deadline 이후 전량 체결된 레그는 헷지로 되돌리지 않음 (naked 포지션 방지)"""
+        upbit = LatencyStubExchange("upbit", 0.0)
+        binance = LatencyStubExchange("binance", 0.3)
+        executor = _executor(upbit, binance, leg_deadline_sec=0.05, auto_hedge=True)
+        
+        result = executor.execute_decision(_decision())
+        
+        assert result.binance.is_pending()
+        assert result.status == "hedge_pending"
+        assert result.hedge is None
+        
+        time.sleep(0.4)
+        assert len(binance.orders) == 1
+        assert len(upbit.orders) == 1
+        assert _net_exposure(upbit, binance) == pytest.approx(0.0)
+        metrics = executor.get_metrics()
+        assert metrics["late_legs"] == 1
+        assert metrics["hedge_orders"] == 0
+        executor.close()
+    
+    def test_late_partial_leg_is_canceled_and_hedged(self):
+        """늦게 도착한 부분 체결 레그: 취소 → 실제 체결 수량 조회 → 차이만큼 헷지"""
+        upbit = LatencyStubExchange("upbit", 0.0)
+        binance = LatencyStubExchange("binance", 0.3, fill_ratio=0.25, fill_ratio_on_cancel=0.5)
+        executor = _executor(upbit, binance, leg_deadline_sec=0.05, auto_hedge=True)
+        
+        result = executor.execute_decision(_decision())
+        assert result.status == "hedge_pending"
+        assert result.hedge is None
+        
+        time.sleep(0.4)
+        binance_order = binance.orders[0]
+        assert binance.canceled == [binance_order.order_id]
+        hedge_order = upbit.orders[-1]
+        assert hedge_order.order_type == OrderType.MARKET
+        assert hedge_order.side == OrderSide.BUY
+        assert hedge_order.qty == pytest.approx(result.upbit.filled_qty - binance_order.qty * 0.5)
+        assert _net_exposure(upbit, binance) == pytest.approx(0.0)
+        assert executor.get_metrics()["hedge_orders"] == 1
+        executor.close()
+    
+    def test_pending_leg_resolved_in_grace_uses_queried_fill(self):
+        """추가 대기 내 도착한 레그는 취소 후 조회한 체결 수량으로 헷지 판단"""
+        upbit = LatencyStubExchange("upbit", 0.0)
+        binance = LatencyStubExchange("binance", 0.15, fill_ratio=0.25, fill_ratio_on_cancel=0.5)
+        executor = _executor(upbit, binance, leg_deadline_sec=0.1, auto_hedge=True)
+        
+        result = executor.execute_decision(_decision())
+        
+        assert result.binance.status == "canceled"
+        assert result.binance.filled_qty == pytest.approx(result.binance.requested_qty * 0.5)
+        assert result.hedge is not None
+        executor.close()
+        assert _net_exposure(upbit, binance) == pytest.approx(0.0)
+        assert executor.get_metrics()["late_legs"] == 1
+    
+    def test_auto_hedge_fires_compensating_order(self):
+        """한쪽만 체결되면 초과 체결분을 반대 방향 시장가로 헷지"""
+        upbit = LatencyStubExchange("upbit", 0.0)
+        binance = LatencyStubExchange("binance", 0.0, fill_ratio=0.25)
+        executor = _executor(upbit, binance, auto_hedge=True)
+        
+        result = executor.execute_decision(_decision())
+        
+        assert result.status == "partial_hedged"
+        assert binance.canceled == [result.binance.order_id]
+        assert result.hedge is not None
+        assert result.hedge.exchange == "upbit"
+        # ENTRY_POSITIVE: Upbit SELL → 헷지는 BUY
+        assert result.hedge.side == OrderSide.BUY
+        hedge_order = upbit.orders[-1]
+        assert hedge_order.order_type == OrderType.MARKET
+        assert hedge_order.qty == pytest.approx(result.upbit.filled_qty - result.binance.filled_qty)
+        assert executor.get_metrics()["hedge_orders"] == 1
+        executor.close()
+    
+    def test_no_hedge_by_default(self):
+        upbit = LatencyStubExchange("upbit", 0.0)
+        binance = LatencyStubExchange("binance", 0.0, fill_ratio=0.0)
+        executor = _executor(upbit, binance)
+        
+        result = executor.execute_decision(_decision())
+        
+        assert result.status == "partial_hedged"
+        assert result.hedge is None
+        assert len(upbit.orders) == 1
+        executor.close()
+    
+    def test_leg_metrics_exported(self):
+        """레그 지연 / skew가 CrossExchangeMetrics 히스토그램으로 기록"""
+        metrics = CrossExchangeMetrics()
+        executor = _executor(
+            LatencyStubExchange("upbit", 0.01), LatencyStubExchange("binance", 0.01),
+            metrics_collector=metrics,
+        )
+        
+        executor.execute_decision(_decision())
+        
+        histograms = metrics.get_metrics_snapshot()["histograms"]
+        assert "cross_leg_latency_seconds{exchange=upbit}" in histograms
+        assert "cross_leg_latency_seconds{exchange=binance}" in histograms
+        assert any(key.startswith("cross_leg_skew_seconds") for key in histograms)
+        executor.close()
@@ -0,0 +1,189 @@
+"""
+D80-1: Fixed-point Money 테스트
+
+FixedMoney / 벡터 합산 / PnLTracker 고정소수점 누적이 Decimal(Money) 경로와
+값 + 표현(repr)까지 동일한지 seed 고정 랜덤 property 테스트로 검증.
+"""
+
+import random
+from decimal import Decimal
+
+import numpy as np
+import pytest
+
+from arbitrage.common.currency import Currency, Money, StaticFxRateProvider
+from arbitrage.common.fixed_money import (
+    FIXED_SCALES,
+    INT64_MAX,
+    FixedMoney,
+    sum_money,
+    sum_units,
+)
+from arbitrage.cross_exchange.risk_guard import (
+    CrossExchangePnLTracker,
+    CrossExchangeRiskGuard,
+    CrossExchangeRiskGuardConfig,
+)
+
+FX = StaticFxRateProvider({
+    (Currency.USD, Currency.KRW): Decimal("1420.50"),
+    (Currency.USDT, Currency.KRW): Decimal("1500.00"),
+    (Currency.BTC, Currency.KRW): Decimal("143250000"),
+})
+
+
+def random_amount(rng, currency, inexact=0.0):
+    """scale 이내 지수의 랜덤 금액 (inexact 확률로 scale 초과 자릿수)"""
+    scale = FIXED_SCALES[currency]
+    exponent = rng.randint(-scale, 0)
+    if rng.random() < inexact:
+        exponent = -scale - rng.randint(1, 4)
+    # int64 한도의 1/1000 이내 (합산/곱셈 여유)
+    bound = min(INT64_MAX // 10 ** scale // 1000 * 10 ** -exponent, 10 ** 12)
+    coefficient = rng.randint(-bound, bound)
+    return Money(Decimal(coefficient).scaleb(exponent), currency)
+
+
+def reference_sum(pnls, base, fx):
+    """Decimal 경로 기준값"""
+    total = Money(Decimal("0"), base)
+    for pnl in pnls:
+        total += pnl.convert_to(base, fx)
+    return total
+
+
+class TestFixedMoneyEquivalence:
+    """FixedMoney ↔ Money 연산 동일성"""
+    
+    @pytest.mark.parametrize("currency", list(Currency))
+    def test_roundtrip_and_arithmetic(self, currency):
+        rng = random.Random(hash(currency.value) & 0xFFFF)
+        for _ in range(300):
+            a = random_amount(rng, currency)
+            b = random_amount(rng, currency)
+            fa, fb = FixedMoney.from_money(a), FixedMoney.from_money(b)
+            scalar = rng.choice([2, -3, 0.5, Decimal("1.25")])
+            
+            assert repr(fa.to_money()) == repr(a)
+            assert repr((fa + fb).to_money()) == repr(a + b)
+            assert repr((fa - fb).to_money()) == repr(a - b)
+            assert repr((-fa).to_money()) == repr(-a)
+            product = a * scalar
+            if product.amount.as_tuple().exponent >= -FIXED_SCALES[currency]:
+                assert repr((fa * scalar).to_money()) == repr(product)
+            else:
+                with pytest.raises(ValueError):
+                    fa * scalar
+            assert (fa < fb, fa <= fb, fa > fb, fa >= fb) == (a < b, a <= b, a > b, a >= b)
+    
+    def test_convert_matches_decimal(self):
+        rng = random.Random(7)
+        for _ in range(300):
+            usd = random_amount(rng, Currency.USD)
+            rate = Decimal(rng.randint(100000, 200000)).scaleb(-rng.randint(2, 4))
+            fx = StaticFxRateProvider({(Currency.USD, Currency.KRW): rate})
+            
+            expected = usd.convert_to(Currency.KRW, fx)
+            
+            if expected.amount.as_tuple().exponent >= -FIXED_SCALES[Currency.KRW]:
+                converted = FixedMoney.from_money(usd).convert_to(Currency.KRW, rate)
+                assert repr(converted.to_money()) == repr(expected)
+            else:
+                with pytest.raises(ValueError):
+                    FixedMoney.from_money(usd).convert_to(Currency.KRW, rate)
+    
+    def test_inexact_and_overflow(self):
+        with pytest.raises(ValueError):
+            FixedMoney.from_money(Money(Decimal("0.0000001"), Currency.KRW))
+        assert FixedMoney.try_from_money(Money(Decimal("1E+30"), Currency.KRW)) is None
+        
+        near_max = FixedMoney(INT64_MAX, Currency.KRW)
+        with pytest.raises(OverflowError):
+            near_max + FixedMoney(1, Currency.KRW)
+        with pytest.raises(OverflowError):
+            near_max * 2
+        with pytest.raises(ValueError):
+            FixedMoney(1, Currency.KRW) + FixedMoney(1, Currency.USD)
+
+
+class TestVectorizedSum:
+    """NumPy 포트폴리오 합산"""
+    
+    def test_sum_money_matches_decimal(self):
+        rng = random.Random(11)
+        for _ in range(50):
+            currencies = [Currency.KRW, Currency.USD, Currency.USDT]
+            pnls = [random_amount(rng, rng.choice(currencies), inexact=0.05) for _ in range(40)]
+            
+            total = sum_money(pnls, Currency.KRW, FX)
+            
+            assert repr(total) == repr(reference_sum(pnls, Currency.KRW, FX))
+    
+    def test_sum_units_checked(self):
+        units = np.array([INT64_MAX // 2, INT64_MAX // 2, 1], dtype=np.int64)
+        assert sum_units(units) == INT64_MAX
+        
+        with pytest.raises(OverflowError):
+            sum_units(np.array([INT64_MAX, 1], dtype=np.int64))
+
+
+class TestPnLTrackerFixedPath:
+    """PnLTracker 고정소수점 누적 동일성"""
+    
+    @pytest.mark.parametrize("seed", [1, 2, 3])
+    def test_tracker_matches_decimal_reference(self, seed):
+        rng = random.Random(seed)
+        tracker = CrossExchangePnLTracker(base_currency=Currency.KRW, fx_provider=FX)
+        reference = Money(Decimal("0"), Currency.KRW)
+        consecutive = 0
+        last_negative = False
+        
+        for _ in range(500):
+            kind = rng.random()
+            if kind < 0.2:
+                pnl = Money(Decimal(str(rng.uniform(-1e5, 1e5))), Currency.KRW)
+                tracker.add_trade(float(pnl.amount))
+            else:
+                pnl = random_amount(
+                    rng, rng.choice([Currency.KRW, Currency.USD, Currency.BTC]), inexact=0.02
+                )
+                tracker.add_trade(pnl)
+            reference += pnl.convert_to(Currency.KRW, FX)
+            if pnl.is_negative:
+                consecutive = consecutive + 1 if last_negative else 1
+            else:
+                consecutive = 0
+            last_negative = pnl.is_negative
+            
+            assert repr(tracker.get_daily_pnl()) == repr(reference)
+            assert tracker.get_consecutive_loss_count() == consecutive
+    
+    def test_add_trades_matches_sequential(self):
+        rng = random.Random(5)
+        pnls = [random_amount(rng, rng.choice([Currency.KRW, Currency.USD])) for _ in range(200)]
+        sequential = CrossExchangePnLTracker(fx_provider=FX)
+        batched = CrossExchangePnLTracker(fx_provider=FX)
+        
+        for pnl in pnls:
+            sequential.add_trade(pnl)
+        batched.add_trades(pnls[:120])
+        batched.add_trades(pnls[120:])
+        
+        assert repr(batched.get_daily_pnl()) == repr(sequential.get_daily_pnl())
+        assert batched.get_consecutive_loss_count() == sequential.get_consecutive_loss_count()
+    
+    def test_circuit_breaker_matches_money_comparison(self):
+        rng = random.Random(9)
+        config = CrossExchangeRiskGuardConfig(max_daily_loss=Money(Decimal("100000"), Currency.KRW))
+        tracker = CrossExchangePnLTracker(fx_provider=FX)
+        guard = CrossExchangeRiskGuard(None, None, None, config=config, pnl_tracker=tracker)
+        
+        for _ in range(300):
+            tracker.add_trade(random_amount(rng, Currency.USD, inexact=0.05))
+            expected = tracker.get_daily_pnl() < -config.max_daily_loss
+            assert guard._is_daily_loss_exceeded() == expected
+        
+        # 직접 설정한 Money도 반영 (D80-7 테스트 호환)
+        tracker._daily_pnl = Money(Decimal("-150000"), Currency.KRW)
+        assert tracker.get_daily_pnl_units() is not None
+        assert guard._is_daily_loss_exceeded() is True
@@ -0,0 +1,155 @@
+"""
+D80-5: IncrementalFxAggregator 테스트
+
+기존 집계 규칙(리스트 재구성 + outlier 제거 + 정렬 median)과 tick별 동일성,
+값 변화 없는 tick 재계산 생략, staleness 제외/가중, 스냅샷 기반 get_rate 검증.
+"""
+
+import random
+import statistics
+import threading
+import time
+from decimal import Decimal
+from unittest import mock
+
+import pytest
+
+from arbitrage.common.currency import Currency, MultiSourceFxRateProvider
+from arbitrage.common.fx_aggregator import IncrementalFxAggregator
+from scripts.benchmark_d80_5_fx_aggregation import SOURCES, legacy_aggregate, synthetic_ticks
+
+
+class TestIncrementalAggregation:
+    """집계 결과 동일성"""
+    
+    @pytest.mark.parametrize("seed", [1, 2, 3])
+    def test_matches_legacy_rule(self, seed):
+        rng = random.Random(seed)
+        sources = ("a", "b", "c", "d", "e")
+        aggregator = IncrementalFxAggregator(sources)
+        source_rates = {source: None for source in sources}
+        
+        for step in range(3000):
+            source = rng.choice(sources)
+            rate = Decimal(rng.choice(["0.998", "0.999", "1.000", "1.001", "1.2", "0.8"]))
+            source_rates[source] = rate
+            
+            aggregate, _ = aggregator.update(source, rate, now=float(step))
+            
+            assert aggregate.rate == legacy_aggregate(source_rates)
+            assert str(aggregate.rate) == str(legacy_aggregate(source_rates))
+            used = sorted(r for r in source_rates.values() if r is not None)
+            for outlier in aggregate.outliers:
+                used.remove(outlier)
+            expected_mad = statistics.median([abs(r - aggregate.rate) for r in used])
+            assert aggregate.mad == expected_mad
+    
+    def test_unchanged_tick_skips_recompute(self):
+        aggregator = IncrementalFxAggregator(SOURCES)
+        ticks = synthetic_ticks(2000, seed=3)
+        
+        for step, (source, rate) in enumerate(ticks):
+            aggregator.update(source, rate, now=float(step))
+        
+        last = {}
+        changes = 0
+        for source, rate in ticks:
+            changes += last.get(source) != rate
+            last[source] = rate
+        assert aggregator.recompute_count < len(ticks)
+        assert aggregator.last_update == float(len(ticks) - 1)
+        assert aggregator.get_stats()["updates"] == len(ticks)
+        assert aggregator.recompute_count == changes
+    
+    def test_epsilon_suppresses_small_moves(self):
+        aggregator = IncrementalFxAggregator(SOURCES, rate_epsilon=0.001)
+        aggregator.update("binance", Decimal("1.0000"), now=0.0)
+        
+        _, recomputed = aggregator.update("binance", Decimal("1.0005"), now=1.0)
+        assert recomputed is False
+        assert aggregator.snapshot.rate == Decimal("1.0000")
+        
+        _, recomputed = aggregator.update("binance", Decimal("1.0020"), now=2.0)
+        assert recomputed is True
+        assert aggregator.snapshot.rate == Decimal("1.0020")
+
+
+class TestStaleness:
+    """소스 staleness 제외/가중"""
+    
+    def test_stale_source_excluded(self):
+        aggregator = IncrementalFxAggregator(SOURCES, max_source_age_seconds=10.0)
+        aggregator.update("binance", Decimal("1.000"), now=0.0)
+        aggregator.update("okx", Decimal("1.010"), now=5.0)
+        
+        aggregate, _ = aggregator.update("okx", Decimal("1.010"), now=12.0)
+        
+        assert aggregate.rate == Decimal("1.010")
+        assert aggregate.sources_used == 1
+    
+    def test_half_life_prefers_fresh_source(self):
+        aggregator = IncrementalFxAggregator(SOURCES, staleness_half_life_seconds=5.0)
+        aggregator.update("binance", Decimal("1.000"), now=0.0)
+        aggregator.update("okx", Decimal("1.002"), now=0.0)
+        
+        # 동일 가중 → 일반 median
+        assert aggregator.snapshot.rate == Decimal("1.001")
+        
+        aggregate, _ = aggregator.update("okx", Decimal("1.002"), now=10.0)
+        assert aggregate.rate == Decimal("1.002")
+
+
+class TestProviderSnapshot:
+    """MultiSourceFxRateProvider 발행 스냅샷"""
+    
+    def test_get_rate_reads_snapshot_and_chain(self):
+        fx = MultiSourceFxRateProvider(enable_websocket=False)
+        fx.cache.set(Currency.USD, Currency.KRW, Decimal("1420.0"))
+        fx._on_source_update("binance", Decimal("1.000"), time.time())
+        fx._on_source_update("okx", Decimal("0.999"), time.time())
+        fx._on_source_update("bybit", Decimal("1.100"), time.time())
+        
+        with mock.patch.object(fx.cache, "get", side_effect=AssertionError("cache read")):
+            assert fx.get_rate(Currency.USDT, Currency.USD) == Decimal("0.9995")
+            assert fx.get_rate(Currency.USDT, Currency.KRW) == Decimal("0.9995") * Decimal("1420.0")
+        
+        assert fx.get_outlier_count_total() == 1
+        assert fx.get_aggregate().outliers == (Decimal("1.100"),)
+    
+    def test_expired_snapshot_falls_back(self):
+        fx = MultiSourceFxRateProvider(enable_websocket=False, cache_ttl_seconds=3.0)
+        fx._on_source_update("binance", Decimal("1.000"), time.time())
+        
+        with mock.patch("time.time", return_value=time.time() + 10.0), \
+                mock.patch.object(fx.http_provider, "get_rate", return_value=Decimal("0.5")):
+            assert fx.get_rate(Currency.USDT, Currency.USD) == Decimal("0.5")
+    
+    def test_concurrent_writers_and_readers(self):
+        fx = MultiSourceFxRateProvider(enable_websocket=False, cache_ttl_seconds=60.0)
+        valid = {Decimal("1.000"), Decimal("1.001"), Decimal("1.002"), Decimal("1.0005"), Decimal("1.0015")}
+        errors = []
+        
+        def writer(source, seed):
+            rng = random.Random(seed)
+            for _ in range(2000):
+                fx._on_source_update(source, Decimal(rng.choice(["1.000", "1.001", "1.002"])), time.time())
+        
+        def reader():
+            for _ in range(5000):
+                try:
+                    rate = fx.get_rate(Currency.USDT, Currency.USD)
+                    if rate not in valid:
+                        errors.append(rate)
+                except Exception as e:  # noqa: BLE001
+                    errors.append(e)
+        
+        fx._on_source_update("binance", Decimal("1.000"), time.time())
+        threads = [threading.Thread(target=writer, args=(source, i)) for i, source in enumerate(SOURCES)]
+        threads.append(threading.Thread(target=reader))
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        assert errors == []
+        assert fx.aggregator.get_stats()["updates"] == 6001
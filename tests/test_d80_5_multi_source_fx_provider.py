@@ -408,5 +408,29 @@ def test_source_update_to_cache_to_executor():
     assert rate == Decimal("1.000")  # Median([1.000, 0.999, 1.001])
 
 
+
+def test_stale_aggregate_not_published_over_newer():
+    """소스 스레드 경합으로 오래된 집계가 늦게 발행돼도 최신 스냅샷/캐시 유지"""
+    fx = MultiSourceFxRateProvider(enable_websocket=False)
+    now = time.time()
+    
+    older, _ = fx.aggregator.update("binance", Decimal("1.000"), now)
+    newer, _ = fx.aggregator.update("okx", Decimal("1.002"), now - 0.001)
+    assert newer.sequence > older.sequence
+    
+    # 나중 집계가 먼저 발행되고, 먼저 계산된 집계가 뒤늦게 도착
+    fx._publish(newer, True, now - 0.001)
+    fx._publish(older, True, now)
+    
+    snapshot = fx._snapshot
+    assert snapshot.aggregate is newer
+    assert fx.cache.get(Currency.USDT, Currency.USD) == newer.rate
+    
+    # 같은 집계(값 변화 없음)의 재발행은 timestamp만 전진
+    fx._publish(newer, False, now + 1.0)
+    assert fx._snapshot.updated_at == now + 1.0
+    fx._publish(newer, False, now + 0.5)
+    assert fx._snapshot.updated_at == now + 1.0
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
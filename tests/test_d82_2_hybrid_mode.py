@@ -9,6 +9,7 @@ Tests for Hybrid TopN Selection Mode:
 """
 
 import sys
+import threading
 from pathlib import Path
 import time
 
@@ -231,14 +232,14 @@ def test_topn_real_selection_rate_limited_mocked(monkeypatch):
     def mock_fetch_top_symbols(self, *args, **kwargs):
         return mock_candidate_symbols
     
-    def mock_fetch_ticker(self, symbol):
+    def mock_fetch_tickers(self, symbols):
         fetch_count["ticker"] += 1
         # Mock ticker 데이터
         class MockTicker:
             acc_trade_price_24h = 1_000_000_000  # 1B KRW
-        return MockTicker()
+        return {symbol: MockTicker() for symbol in symbols}
     
-    def mock_fetch_orderbook(self, symbol):
+    def mock_fetch_orderbooks(self, symbols):
         fetch_count["orderbook"] += 1
         # Mock orderbook 데이터
         class MockLevel:
@@ -251,7 +252,7 @@ def test_topn_real_selection_rate_limited_mocked(monkeypatch):
                 self.bids = [MockLevel(100000, 0.1) for _ in range(5)]
                 self.asks = [MockLevel(100100, 0.1) for _ in range(5)]
         
-        return MockOrderbook()
+        return {symbol: MockOrderbook() for symbol in symbols}
     
     # Provider 생성 (Real Selection, batch_size=10)
     provider = TopNProvider(
@@ -268,26 +269,91 @@ def test_topn_real_selection_rate_limited_mocked(monkeypatch):
         mock_fetch_top_symbols
     )
     monkeypatch.setattr(
-        "arbitrage.exchanges.upbit_public_data.UpbitPublicDataClient.fetch_ticker",
-        mock_fetch_ticker
+        "arbitrage.exchanges.upbit_public_data.UpbitPublicDataClient.fetch_tickers",
+        mock_fetch_tickers
     )
     monkeypatch.setattr(
-        "arbitrage.exchanges.upbit_public_data.UpbitPublicDataClient.fetch_orderbook",
-        mock_fetch_orderbook
+        "arbitrage.exchanges.upbit_public_data.UpbitPublicDataClient.fetch_orderbooks",
+        mock_fetch_orderbooks
     )
     
     # TopN selection 실행
     result = provider._fetch_real_metrics_safe()
     
-    # 검증: 25개 심볼에 대해 ticker + orderbook 호출 (각 25회)
-    assert fetch_count["ticker"] == 25
-    assert fetch_count["orderbook"] == 25
+    # 검증: 25개 심볼 / 배치 10개 = 3 batches → ticker/orderbook 다중 마켓 요청 각 3회
+    assert fetch_count["ticker"] == 3
+    assert fetch_count["orderbook"] == 3
     
     # 결과 검증
     assert len(result) == 25
+    assert "SYM00/KRW" in result
+
+
+def test_topn_background_refresh_serves_stale(monkeypatch):
+    """TTL 만료 시 이전 결과를 즉시 반환하고 백그라운드에서 갱신"""
+    provider = TopNProvider(
+        mode=TopNMode.TOP_10,
+        selection_data_source="mock",
+        cache_ttl_seconds=60,
+        background_refresh=True,
+    )
+    first = provider.get_topn_symbols()
+    
+    release = threading.Event()
+    original = provider._fetch_mock_metrics
+    
+    def slow_metrics():
+        release.wait(2.0)
+        metrics = original()
+        metrics.pop("BTC/KRW")  # BTC 탈락 → churn
+        return metrics
+    
+    monkeypatch.setattr(provider, "_fetch_mock_metrics", slow_metrics)
+    events = []
+    provider.add_churn_listener(events.append)
+    provider._selection_cache_ts -= 120  # TTL 만료
+    
+    started = time.perf_counter()
+    stale = provider.get_topn_symbols()
+    assert time.perf_counter() - started < 0.5
+    assert stale is first
+    assert provider.is_refreshing()
+    # 갱신 중 중복 호출은 스레드를 추가로 만들지 않음
+    assert provider.get_topn_symbols() is first
+    
+    release.set()
+    assert provider.wait_for_refresh(timeout=2.0)
+    
+    fresh = provider.get_topn_symbols()
+    assert fresh is not first
+    assert ("BTC/KRW", "BTC/USDT") not in fresh.symbols
+    assert len(events) == 1
+    assert events[0].removed == [("BTC/KRW", "BTC/USDT")]
+    assert len(events[0].added) == 1
+    assert events[0].result is fresh
+
+
+def test_topn_background_refresh_failure_keeps_previous(monkeypatch):
+    """백그라운드 갱신 실패 시 이전 결과 유지"""
+    provider = TopNProvider(
+        mode=TopNMode.TOP_10,
+        selection_data_source="mock",
+        cache_ttl_seconds=60,
+        background_refresh=True,
+    )
+    first = provider.get_topn_symbols()
+    
+    def failing_metrics():
+        raise RuntimeError("API down")
+    
+    monkeypatch.setattr(provider, "_fetch_mock_metrics", failing_metrics)
+    provider._selection_cache_ts -= 120
     
-    # 배치 처리 확인: 25개 심볼 / 10개 배치 = 3 batches (10 + 10 + 5)
-    # (이 테스트에서는 batch_delay=0이므로 시간 체크는 생략)
+    assert provider.get_topn_symbols() is first
+    assert provider.wait_for_refresh(timeout=2.0)
+    # 실패 후 TTL 주기 동안 재시도하지 않음
+    assert provider.get_topn_symbols() is first
+    assert not provider.is_refreshing()
 
 
 def test_topn_real_selection_fallback_on_error(monkeypatch):
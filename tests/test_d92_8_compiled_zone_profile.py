@@ -0,0 +1,203 @@
+"""
+D92-8: Compiled Zone Profile 테스트
+
+CompiledZoneProfile bisect 판정 / CalibrationTable slot 인덱스가 기존 선형 스캔과
+동일한지 seed 고정 랜덤 테스트로 검증 + 컴파일 검증 실패, hot reload(검증 후 교체) 확인.
+"""
+
+import os
+import random
+
+import pytest
+import yaml
+
+from arbitrage.core.compiled_zone_profile import compile_zone_profiles
+from arbitrage.core.zone_profile_applier import ZoneProfileApplier
+from scripts.benchmark_d92_8_zone_lookup import (
+    legacy_select_zone,
+    legacy_zone_index,
+    make_calibration,
+)
+
+
+def random_boundaries(rng):
+    """정렬 + 비중첩 Zone 경계 (공유 경계/gap/한 점 Zone 포함)"""
+    boundaries = []
+    edge = rng.choice([0.0, 2.0, 5.0])
+    for _ in range(rng.randint(1, 6)):
+        low = edge + rng.choice([0.0, 0.0, 0.5, 1.0])
+        high = low + rng.choice([0.0, 1.5, 2.0, 5.0])
+        boundaries.append((low, high))
+        edge = high
+    return boundaries
+
+
+def make_profile(boundaries, threshold_bps=None, mode="advisory"):
+    return {
+        "profile_name": "advisory_z2_focus",
+        "profile_weights": [0.5, 3.0, 1.5, 0.5],
+        "zone_boundaries": boundaries,
+        "mode": mode,
+        "threshold_bps": threshold_bps,
+    }
+
+
+def write_yaml(path, thresholds):
+    """symbol_mappings 스키마 YAML 작성"""
+    data = {
+        "profiles": {"advisory_z2_focus": {"weights": [0.5, 3.0, 1.5, 0.5]}},
+        "symbol_mappings": {
+            symbol: {
+                "market": "upbit",
+                "default_profiles": {"strict": "strict_uniform", "advisory": "advisory_z2_focus"},
+                "threshold_bps": threshold,
+                "zone_boundaries": [[5.0, 7.0], [7.0, 12.0], [12.0, 20.0], [20.0, 30.0]],
+            }
+            for symbol, threshold in thresholds.items()
+        },
+    }
+    path.write_text(yaml.safe_dump(data), encoding="utf-8")
+
+
+def bump_mtime(path, seconds):
+    stat = os.stat(path)
+    os.utime(path, (stat.st_atime, stat.st_mtime + seconds))
+
+
+class TestCompiledZoneIndex:
+    """Zone 판정 동일성"""
+    
+    @pytest.mark.parametrize("seed", [1, 2, 3])
+    def test_matches_linear_scan(self, seed):
+        rng = random.Random(seed)
+        for _ in range(50):
+            boundaries = random_boundaries(rng)
+            compiled = compile_zone_profiles({"BTC": make_profile(boundaries, threshold_bps=5.0)})
+            edges = [edge for zone in boundaries for edge in zone]
+            
+            for _ in range(200):
+                spread = rng.choice(edges) if rng.random() < 0.3 else rng.uniform(-1.0, edges[-1] + 1.0)
+                assert compiled.zone_index("BTC", spread) == legacy_zone_index(boundaries, spread)
+        
+        assert compiled.zone_index("UNKNOWN", 5.0) == -1
+        assert compiled.zone_index("BTC", float("nan")) == -1
+    
+    def test_threshold_rules(self):
+        boundaries = [(5.0, 7.0), (7.0, 12.0), (12.0, 20.0), (20.0, 30.0)]
+        compiled = compile_zone_profiles({
+            "BTC": make_profile(boundaries, threshold_bps=4.5),
+            "ETH": make_profile(boundaries),
+            "XRP": make_profile(boundaries, mode="strict"),
+        })
+        
+        assert list(compiled.thresholds) == pytest.approx([0.00045, 0.00095, 0.0005])
+        assert compiled.threshold("ETH") == compiled.thresholds[compiled.row("ETH")]
+        assert compiled.row("UNKNOWN") == -1
+    
+    @pytest.mark.parametrize("boundaries, message", [
+        ([], "non-empty"),
+        ([(5.0, 7.0), (6.0, 12.0)], "overlaps"),
+        ([(7.0, 5.0)], "min > max"),
+        ([(5.0, float("nan"))], "finite"),
+        ([(5.0, "7")], "numeric"),
+        ([(5.0,)], r"\[min, max\]"),
+    ])
+    def test_invalid_boundaries_rejected(self, boundaries, message):
+        with pytest.raises(ValueError, match=message):
+            compile_zone_profiles({"BTC": make_profile(boundaries, threshold_bps=5.0)})
+
+
+class TestHotReload:
+    """파일 변경 시 검증 후 원자적 교체"""
+    
+    def test_reload_on_change(self, tmp_path):
+        path = tmp_path / "zone_profiles.yaml"
+        write_yaml(path, {"BTC": 4.5, "ETH": 6.0})
+        applier = ZoneProfileApplier.from_file(str(path))
+        applier.reload_check_interval_seconds = 0.0
+        before = applier.compiled
+        
+        assert applier.maybe_reload(now=1.0) is False
+        
+        write_yaml(path, {"BTC": 8.0, "SOL": 9.0})
+        bump_mtime(path, 10)
+        
+        assert applier.maybe_reload(now=2.0) is True
+        assert applier.get_entry_threshold("BTC") == pytest.approx(0.0008)
+        assert applier.has_profile("SOL") and not applier.has_profile("ETH")
+        assert applier.compiled.version == before.version + 1
+        # 이전 스냅샷은 그대로 (reader가 들고 있던 참조 불변)
+        assert before.threshold("BTC") == pytest.approx(0.00045)
+        assert applier.maybe_reload(now=3.0) is False
+    
+    def test_invalid_file_keeps_previous(self, tmp_path):
+        path = tmp_path / "zone_profiles.yaml"
+        write_yaml(path, {"BTC": 4.5})
+        applier = ZoneProfileApplier.from_file(str(path))
+        applier.reload_check_interval_seconds = 0.0
+        
+        path.write_text("symbol_mappings: {BTC: {zone_boundaries: [[7.0, 5.0]]}}", encoding="utf-8")
+        bump_mtime(path, 10)
+        
+        assert applier.maybe_reload(now=1.0) is False
+        assert applier.reload_failures == 1
+        assert applier.get_entry_threshold("BTC") == pytest.approx(0.00045)
+        # 같은 파일은 다시 시도하지 않음
+        assert applier.maybe_reload(now=2.0) is False
+        assert applier.reload_failures == 1
+    
+    def test_stat_throttled(self, tmp_path):
+        path = tmp_path / "zone_profiles.yaml"
+        write_yaml(path, {"BTC": 4.5})
+        applier = ZoneProfileApplier.from_file(str(path))
+        applier.reload_check_interval_seconds = 5.0
+        assert applier.maybe_reload(now=100.0) is False
+        
+        write_yaml(path, {"BTC": 8.0})
+        bump_mtime(path, 10)
+        
+        assert applier.maybe_reload(now=101.0) is False
+        assert applier.maybe_reload(now=105.0) is True
+
+
+class TestCalibrationIndex:
+    """CalibrationTable.select_zone slot 인덱스 동일성"""
+    
+    @pytest.mark.parametrize("seed", [1, 2, 3])
+    def test_matches_linear_scan(self, seed):
+        rng = random.Random(seed)
+        for _ in range(30):
+            zones = []
+            for i in range(rng.randint(0, 6)):
+                entry_min = rng.choice([0.0, 5.0, 7.0, 12.0, 20.0])
+                tp_min = rng.choice([0.0, 5.0, 10.0, 20.0])
+                zones.append({
+                    "zone_id": f"Z{i + 1}",
+                    "entry_min": entry_min,
+                    "entry_max": entry_min + rng.choice([-1.0, 0.0, 2.0, 5.0, 10.0]),
+                    "tp_min": tp_min,
+                    "tp_max": tp_min + rng.choice([0.0, 5.0, 10.0]),
+                    "buy_fill_ratio": rng.random(),
+                    "sell_fill_ratio": 1.0,
+                    "samples": rng.randint(0, 100),
+                })
+            calibration = make_calibration(zones)
+            edges = [0.0, 5.0, 7.0, 10.0, 12.0, 15.0, 20.0, 25.0, 30.0]
+            
+            for _ in range(300):
+                entry = rng.choice(edges) if rng.random() < 0.3 else rng.uniform(-1.0, 32.0)
+                tp = rng.choice(edges) if rng.random() < 0.3 else rng.uniform(-1.0, 32.0)
+                assert calibration.select_zone(entry, tp) == legacy_select_zone(zones, entry, tp)
+    
+    def test_index_rebuilt_on_zone_change(self):
+        zones = [{"zone_id": "Z1", "entry_min": 5.0, "entry_max": 7.0, "tp_min": 5.0, "tp_max": 10.0,
+                  "buy_fill_ratio": 0.3, "sell_fill_ratio": 1.0, "samples": 1}]
+        calibration = make_calibration(zones)
+        assert calibration.select_zone(8.0, 6.0) is None
+        
+        zones.append({"zone_id": "Z2", "entry_min": 7.0, "entry_max": 12.0, "tp_min": 5.0, "tp_max": 10.0,
+                      "buy_fill_ratio": 0.6, "sell_fill_ratio": 1.0, "samples": 1})
+        assert calibration.select_zone(8.0, 6.0).zone_id == "Z2"
+        
+        calibration.zones = zones[:1]
+        assert calibration.select_zone(8.0, 6.0) is None
@@ -0,0 +1,294 @@
+"""
+D93-0: Benchmark Harness 테스트
+
+데이터셋 결정성/녹화 round-trip, 반복 측정/skip/error 처리, 리포트 JSON round-trip,
+Mann-Whitney 기반 회귀 판정, Redis/PostgreSQL stand-in, 기본 suite smoke 실행 검증.
+"""
+
+import random
+import sys
+
+import pytest
+
+from arbitrage.benchmark import (
+    BenchmarkCase,
+    BenchmarkReport,
+    BenchmarkResult,
+    BenchmarkRunner,
+    BenchmarkSettings,
+    InMemoryPostgresConnection,
+    InMemoryRedis,
+    compare_reports,
+    default_cases,
+    load_recorded,
+    mann_whitney_u,
+    save_recorded,
+    select_cases,
+    synthetic_dataset,
+)
+
+
+def make_report(samples, fingerprint="abc", peak_bytes=None, name="case.a"):
+    result = BenchmarkResult(name=name, ops=100, samples_ns=list(samples), peak_bytes=peak_bytes)
+    return BenchmarkReport(
+        dataset={"fingerprint": fingerprint},
+        settings={},
+        environment={},
+        results=[result],
+    )
+
+
+def noisy(rng, center, count=10, spread=0.02):
+    return [center * (1.0 + rng.uniform(-spread, spread)) for _ in range(count)]
+
+
+class TestDatasets:
+    """결정적 데이터셋 + 녹화 형식"""
+    
+    def test_synthetic_is_deterministic(self):
+        a = synthetic_dataset(ticks=200, seed=1)
+        b = synthetic_dataset(ticks=200, seed=1)
+        c = synthetic_dataset(ticks=200, seed=2)
+        
+        assert a.fingerprint == b.fingerprint
+        assert a.fingerprint != c.fingerprint
+        assert a.quotes() == b.quotes()
+        assert len(a.quotes()) == a.ticks == 200
+        for q in a.quotes():
+            assert q.bid_a < q.ask_a and q.bid_b < q.ask_b
+    
+    def test_recorded_round_trip(self, tmp_path):
+        dataset = synthetic_dataset(ticks=50, seed=3)
+        path = tmp_path / "capture.jsonl"
+        save_recorded(dataset, str(path))
+        
+        loaded = load_recorded(str(path))
+        
+        assert loaded.fingerprint == dataset.fingerprint
+        assert loaded.quotes() == dataset.quotes()
+        assert loaded.source == str(path)
+    
+    def test_recorded_invalid(self, tmp_path):
+        path = tmp_path / "bad.jsonl"
+        path.write_text('{"exchange": "upbit", "raw": "{}"}\n', encoding="utf-8")
+        with pytest.raises(ValueError, match="both upbit and binance"):
+            load_recorded(str(path))
+        
+        path.write_text('{"exchange": "kraken", "raw": "{}"}\n', encoding="utf-8")
+        with pytest.raises(ValueError, match=":1:"):
+            load_recorded(str(path))
+
+
+class TestRunner:
+    """warmup/반복 측정 + 예외 처리"""
+    
+    def test_repetitions_and_stats(self):
+        calls = []
+        
+        def setup(dataset):
+            calls.append("setup")
+            return lambda: sum(range(1000)) and 1000
+        
+        runner = BenchmarkRunner(BenchmarkSettings(warmup=2, repetitions=5, track_memory=True))
+        result = runner.run_case(BenchmarkCase("demo.sum", setup), synthetic_dataset(ticks=5))
+        
+        assert result.ok
+        assert result.ops == 1000
+        assert len(result.samples_ns) == 5
+        # warmup 2 + 측정 5 + 메모리 1
+        assert len(calls) == 8
+        assert result.min_ns <= result.median_ns <= result.p95_ns
+        assert result.peak_bytes is not None and result.net_blocks is not None
+    
+    def test_memory_tracks_allocation(self):
+        def setup(dataset):
+            def run():
+                data = [bytes(1024) for _ in range(1000)]
+                return len(data)
+            return run
+        
+        result = BenchmarkRunner(BenchmarkSettings(warmup=0, repetitions=1)).run_case(
+            BenchmarkCase("demo.alloc", setup), synthetic_dataset(ticks=5)
+        )
+        
+        assert result.peak_bytes >= 1000 * 1024
+        assert result.retained_bytes < result.peak_bytes
+    
+    def test_missing_dependency_skipped_and_error_recorded(self):
+        def missing(dataset):
+            import arbitrage_module_that_does_not_exist  # noqa: F401
+        
+        def broken(dataset):
+            def run():
+                raise RuntimeError("boom")
+            return run
+        
+        report = BenchmarkRunner(BenchmarkSettings(warmup=0, repetitions=2)).run(
+            [BenchmarkCase("demo.missing", missing), BenchmarkCase("demo.broken", broken)],
+            synthetic_dataset(ticks=5),
+        )
+        
+        assert report.get("demo.missing").status == "skipped"
+        assert report.get("demo.broken").status == "error"
+        assert "boom" in report.get("demo.broken").reason
+        assert not report.get("demo.broken").samples_ns
+    
+    def test_report_json_round_trip(self, tmp_path):
+        report = make_report([10.0, 11.0, 12.0], peak_bytes=2048)
+        path = tmp_path / "nested" / "baseline.json"
+        report.save(str(path))
+        
+        loaded = BenchmarkReport.load(str(path))
+        
+        assert loaded.dataset == report.dataset
+        assert loaded.get("case.a").samples_ns == [10.0, 11.0, 12.0]
+        assert loaded.get("case.a").peak_bytes == 2048
+        assert loaded.get("case.a").median_ns == 11.0
+
+
+class TestComparator:
+    """Mann-Whitney 회귀 판정"""
+    
+    def test_mann_whitney_properties(self):
+        _, p_same = mann_whitney_u([1.0] * 5, [1.0] * 5)
+        assert p_same == 1.0
+        
+        u, p_separated = mann_whitney_u(list(range(10)), list(range(10, 20)))
+        assert u == 0.0
+        assert p_separated < 0.001
+        
+        rng = random.Random(7)
+        a = [rng.gauss(0, 1) for _ in range(12)]
+        b = [rng.gauss(0, 1) for _ in range(9)]
+        ua, pa = mann_whitney_u(a, b)
+        ub, pb = mann_whitney_u(b, a)
+        assert ua + ub == len(a) * len(b)
+        assert pa == pytest.approx(pb)
+    
+    @pytest.mark.parametrize("seed", [1, 2, 3])
+    def test_verdicts(self, seed):
+        rng = random.Random(seed)
+        base = make_report(noisy(rng, 1000.0))
+        
+        assert compare_reports(base, make_report(noisy(rng, 1300.0))).get("case.a").verdict == "regression"
+        assert compare_reports(base, make_report(noisy(rng, 700.0))).get("case.a").verdict == "improvement"
+        # 유의하지만 임계값 미만
+        small = compare_reports(base, make_report(noisy(rng, 1030.0, spread=0.001)), threshold=0.05)
+        assert small.get("case.a").verdict == "unchanged"
+        assert not small.regressions
+    
+    def test_large_but_noisy_change_not_flagged(self):
+        base = make_report([1000.0, 3000.0, 1000.0, 3000.0, 1000.0, 3000.0])
+        current = make_report([1200.0, 3200.0, 1200.0, 3200.0, 1200.0, 3200.0])
+        assert compare_reports(base, current).get("case.a").verdict == "unchanged"
+    
+    def test_fingerprint_and_membership(self):
+        base = make_report([1.0, 2.0, 3.0])
+        other = make_report([1.0, 2.0, 3.0], fingerprint="other", name="case.b")
+        
+        comparison = compare_reports(base, other)
+        
+        assert not comparison.comparable
+        assert comparison.get("case.a").verdict == "missing"
+        assert comparison.get("case.b").verdict == "new"
+        
+        mismatch = compare_reports(base, make_report([9.0, 9.0, 9.0], fingerprint="other"))
+        assert mismatch.get("case.a").verdict == "incomparable"
+        assert not mismatch.regressions
+    
+    def test_memory_regression(self):
+        rng = random.Random(1)
+        samples = noisy(rng, 1000.0)
+        base = make_report(samples, peak_bytes=100_000)
+        
+        grown = compare_reports(base, make_report(samples, peak_bytes=400_000))
+        assert grown.get("case.a").verdict == "unchanged"
+        assert grown.get("case.a").memory_regression
+        assert grown.regressions
+        
+        # 비율은 커도 절대 증가량이 작으면 무시
+        tiny = compare_reports(make_report(samples, peak_bytes=1000), make_report(samples, peak_bytes=5000))
+        assert not tiny.regressions
+
+
+class TestStandins:
+    """Redis/PostgreSQL stand-in"""
+    
+    def test_in_memory_redis(self):
+        client = InMemoryRedis()
+        assert client.ping()
+        client.set("arb:paper:s1:state", '{"a": 1}')
+        client.set("arb:paper:s2:state", b"x")
+        
+        assert client.get("arb:paper:s1:state") == b'{"a": 1}'
+        assert sorted(client.scan_iter(match="arb:paper:s1:*")) == [b"arb:paper:s1:state"]
+        assert client.delete("arb:paper:s1:state", "missing") == 1
+        assert client.get("arb:paper:s1:state") is None
+    
+    def test_in_memory_postgres_transactions(self):
+        conn = InMemoryPostgresConnection()
+        cursor = conn.cursor()
+        cursor.execute("INSERT INTO session_snapshots (a) VALUES (%s) RETURNING snapshot_id", ("s1",))
+        snapshot_id = cursor.fetchone()[0]
+        cursor.execute("INSERT INTO metrics_snapshots (a) VALUES (%s)", (snapshot_id,))
+        conn.rollback()
+        assert conn.row_count("session_snapshots") == 0
+        
+        cursor.execute("INSERT INTO session_snapshots (a) VALUES (%s) RETURNING snapshot_id", ("s2",))
+        assert cursor.fetchone()[0] == snapshot_id + 2
+        conn.commit()
+        assert conn.row_count("session_snapshots") == 1
+    
+    def test_state_store_against_standins(self):
+        pytest.importorskip("psycopg2")
+        from arbitrage.benchmark.suite import state_payloads
+        from arbitrage.state_store import StateStore
+        
+        conn = InMemoryPostgresConnection()
+        store = StateStore(redis_client=InMemoryRedis(), db_conn=conn, env="paper")
+        payload = state_payloads(synthetic_dataset(ticks=5), count=1)[0]
+        
+        assert store.save_state_to_redis("bench", payload)
+        assert store.save_snapshot_to_db("bench", payload) is not None
+        assert conn.row_count("session_snapshots") == 1
+        assert conn.row_count("metrics_snapshots") == 1
+
+
+class TestSuite:
+    """기본 suite"""
+    
+    def test_select_cases(self):
+        names = [case.name for case in select_cases(default_cases(), ["fill.*", "backtest.run"])]
+        assert names == ["fill.simple", "fill.advanced", "backtest.run"]
+        assert len(select_cases(default_cases(), None)) == len(default_cases())
+    
+    def test_default_suite_runs(self):
+        report = BenchmarkRunner(BenchmarkSettings(warmup=0, repetitions=2, track_memory=False)).run(
+            default_cases(), synthetic_dataset(ticks=40)
+        )
+        
+        assert [r.status for r in report.results if r.status == "error"] == []
+        for name in ("detection.on_snapshot", "ws_parse.upbit", "ws_parse.binance",
+                     "risk.four_tier_evaluate", "fill.simple", "fill.advanced", "backtest.run"):
+            result = report.get(name)
+            assert result.ok, result.reason
+            assert len(result.samples_ns) == 2
+        assert report.get("risk.four_tier_evaluate").ops == 40 * 4
+        assert report.get("fill.simple").ops == 40 * 2
+    
+    def test_cli_compare_exit_codes(self, tmp_path, monkeypatch):
+        from scripts.benchmark_d93_0_suite import main
+        
+        rng = random.Random(5)
+        base, slow, other = tmp_path / "base.json", tmp_path / "slow.json", tmp_path / "other.json"
+        make_report(noisy(rng, 1000.0)).save(str(base))
+        make_report(noisy(rng, 1500.0)).save(str(slow))
+        make_report(noisy(rng, 1000.0), fingerprint="other").save(str(other))
+        
+        def run(*argv):
+            monkeypatch.setattr(sys, "argv", ["benchmark_d93_0_suite.py", *argv])
+            return main()
+        
+        assert run("--compare", str(base), str(base)) == 0
+        assert run("--compare", str(base), str(slow)) == 1
+        assert run("--compare", str(base), str(other)) == 2
@@ -0,0 +1,377 @@
+"""
+D93-1: Tick-to-Order Tracing 테스트
+
+span 기록/트리 변환, 샘플링, stage 히스토그램, 느린 tick 덤프(rate limit),
+WS 어댑터 → ArbitrageLiveRunner 전체 경로 trace 전달, 이벤트 루프 지연 샘플러 검증.
+"""
+
+import asyncio
+import json
+import random
+import threading
+import time
+from datetime import datetime
+
+import pytest
+
+from arbitrage.arbitrage_core import ArbitrageConfig, ArbitrageEngine, ArbitrageTrade, OrderBookSnapshot
+from arbitrage.benchmark import synthetic_dataset
+from arbitrage.exchanges import PaperExchange
+from arbitrage.exchanges.base import OrderBookSnapshot as ExchangeOrderBookSnapshot
+from arbitrage.exchanges.binance_ws_adapter import BinanceWebSocketAdapter
+from arbitrage.exchanges.upbit_ws_adapter import UpbitWebSocketAdapter
+from arbitrage.live_runner import ArbitrageLiveConfig, ArbitrageLiveRunner
+from arbitrage.perf import LatencyHistogram
+from arbitrage.tracing import (
+    STAGE_AGGREGATE,
+    STAGE_ENGINE,
+    STAGE_EXECUTE,
+    STAGE_HANDOFF,
+    STAGE_QUEUE_WAIT,
+    STAGE_RISK,
+    STAGE_SUBMIT,
+    STAGE_WS_DECODE,
+    STAGE_WS_PARSE,
+    TICK_TO_DECISION,
+    TICK_TO_ORDER,
+    LoopLagSampler,
+    TickTrace,
+    TickTracer,
+    newest_trace,
+)
+
+MS = 1_000_000
+
+
+class TestTickTrace:
+    """span 기록 + tree"""
+    
+    def test_marks_and_nested_spans(self):
+        trace = TickTrace(1, origin_ns=0)
+        trace.mark("a", now_ns=2 * MS)
+        parent = trace.begin("outer", now_ns=3 * MS)
+        trace.mark("child1", now_ns=5 * MS)
+        trace.mark("child2", now_ns=6 * MS)
+        trace.end(parent, now_ns=7 * MS)
+        trace.mark("after", now_ns=8 * MS)
+        
+        tree = trace.to_tree()
+        
+        assert tree["total_ms"] == 8.0
+        assert [span["name"] for span in tree["spans"]] == ["a", "outer", "after"]
+        outer = tree["spans"][1]
+        assert outer["start_ms"] == 3.0 and outer["duration_ms"] == 4.0
+        assert [(c["name"], c["duration_ms"]) for c in outer["children"]] == [("child1", 2.0), ("child2", 1.0)]
+        assert tree["spans"][2]["duration_ms"] == 1.0
+    
+    def test_claim_once(self):
+        trace = TickTrace(1, origin_ns=0)
+        assert trace.claim()
+        assert not trace.claim()
+    
+    def test_newest_trace(self):
+        old, new = TickTrace(1, origin_ns=10), TickTrace(2, origin_ns=20)
+        a = OrderBookSnapshot("t", 1.0, 2.0, 3.0, 4.0, trace=old)
+        b = OrderBookSnapshot("t", 1.0, 2.0, 3.0, 4.0, trace=new)
+        untraced = OrderBookSnapshot("t", 1.0, 2.0, 3.0, 4.0)
+        
+        assert newest_trace(a, b) is new
+        assert newest_trace(a, untraced) is old
+        new.claim()
+        assert newest_trace(a, b) is old
+        old.claim()
+        assert newest_trace(a, b) is None
+    
+    def test_trace_excluded_from_equality_and_serialization(self):
+        a = OrderBookSnapshot("t", 1.0, 2.0, 3.0, 4.0, trace=TickTrace(1, 0))
+        assert a == OrderBookSnapshot("t", 1.0, 2.0, 3.0, 4.0)
+        trade = ArbitrageTrade(open_timestamp="t", trace=TickTrace(1, 0))
+        assert "trace" not in trade.to_dict()
+
+
+class TestTickTracer:
+    """샘플링 + 히스토그램 + 덤프"""
+    
+    def test_sampling(self):
+        tracer = TickTracer(sample_every=3)
+        sampled = [tracer.start() is not None for _ in range(9)]
+        assert sampled == [True, False, False] * 3
+        assert tracer.started == 3
+        with pytest.raises(ValueError):
+            TickTracer(sample_every=0)
+    
+    def test_sampling_recovers_from_negative_countdown(self):
+        """countdown이 0을 건너뛰어도(<= 0) 샘플링 재개"""
+        tracer = TickTracer(sample_every=4)
+        tracer._countdown = -1
+        assert tracer.start() is not None
+        assert [tracer.start() is not None for _ in range(4)] == [False, False, False, True]
+    
+    def test_sampling_thread_safe(self):
+        """두 WS 어댑터 스레드가 동시에 start() → 정확히 1/N 샘플, trace_id 중복 없음"""
+        tracer = TickTracer(sample_every=7)
+        barrier = threading.Barrier(4)
+        traces = []
+        
+        def worker():
+            barrier.wait()
+            local = [tracer.start() for _ in range(7_000)]
+            traces.extend(trace for trace in local if trace is not None)
+        
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        assert tracer.started == len(traces) == 4_000
+        assert len({trace.trace_id for trace in traces}) == 4_000
+        # 28,000건째 = 마지막 샘플 이후 6건 → 다음 1건이 샘플
+        assert tracer._countdown == 1
+    
+    def test_finish_records_stages(self):
+        tracer = TickTracer(sample_every=1, slow_threshold_ms=1000.0)
+        trace = tracer.start(origin_ns=0)
+        trace.mark(STAGE_WS_DECODE, now_ns=1 * MS)
+        trace.mark(STAGE_ENGINE, now_ns=3 * MS)
+        span = trace.begin(STAGE_EXECUTE, now_ns=4 * MS)
+        trace.mark(STAGE_SUBMIT, now_ns=9 * MS)
+        trace.end(span, now_ns=10 * MS)
+        trace.finish()
+        trace.finish()  # 중복 종료 무시
+        
+        assert tracer.finished == 1
+        assert tracer.percentiles(STAGE_ENGINE)[50.0] == pytest.approx(2.0, rel=0.01)
+        assert tracer.percentiles(STAGE_EXECUTE)[50.0] == pytest.approx(6.0, rel=0.01)
+        assert tracer.percentiles(TICK_TO_DECISION)[50.0] == pytest.approx(10.0, rel=0.01)
+        assert tracer.percentiles(TICK_TO_ORDER)[50.0] == pytest.approx(9.0, rel=0.01)
+        assert tracer.percentiles("missing") == {}
+        
+        metrics = tracer.get_metrics()
+        assert metrics["trace_finished"] == 1
+        assert metrics[f"trace_{STAGE_SUBMIT}_max_ms"] == pytest.approx(5.0)
+        assert STAGE_ENGINE in tracer.get_summary()
+    
+    def test_finish_closes_open_spans(self):
+        tracer = TickTracer(sample_every=1)
+        trace = tracer.start(origin_ns=0)
+        trace.begin(STAGE_EXECUTE, now_ns=1 * MS)
+        trace.finish(now_ns=4 * MS)
+        assert tracer.percentiles(STAGE_EXECUTE)[50.0] == pytest.approx(3.0, rel=0.01)
+    
+    def test_slow_tick_dump_and_rate_limit(self, tmp_path):
+        path = tmp_path / "slow.jsonl"
+        tracer = TickTracer(sample_every=1, slow_threshold_ms=5.0, slow_dump_path=str(path), max_slow_dumps_per_minute=2)
+        for total_ms in (1, 6, 7, 8):
+            trace = tracer.start(origin_ns=0)
+            trace.mark(STAGE_ENGINE, now_ns=total_ms * MS)
+            trace.finish()
+        tracer.close()
+        
+        lines = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+        assert tracer.slow_ticks == 3
+        assert tracer.slow_dumps == 2 and tracer.slow_dumps_dropped == 1
+        assert [line["total_ms"] for line in lines] == [6.0, 7.0]
+        assert lines[0]["spans"][0]["name"] == STAGE_ENGINE
+        assert len(tracer.recent_slow) == 2
+    
+    def test_pending_flush_matches_direct_record(self):
+        tracer = TickTracer(sample_every=1)
+        tracer.FLUSH_SIZE = 7
+        expected = LatencyHistogram()
+        rng = random.Random(3)
+        for _ in range(50):
+            duration = rng.randint(1, 5000) * 1000
+            trace = tracer.start(origin_ns=0)
+            trace.mark(STAGE_ENGINE, now_ns=duration)
+            trace.finish()
+            expected.record(duration / 1e6)
+        
+        histogram = tracer.stage_histograms()[STAGE_ENGINE]
+        assert histogram.counts == expected.counts
+        assert histogram.count == 50
+        assert histogram.max == expected.max
+        
+        tracer.reset()
+        assert tracer.percentiles(STAGE_ENGINE) == {}
+
+
+def make_runner(tracer, provider=None):
+    engine = ArbitrageEngine(ArbitrageConfig(
+        min_spread_bps=30.0,
+        taker_fee_a_bps=5.0,
+        taker_fee_b_bps=5.0,
+        slippage_bps=5.0,
+        max_position_usd=1000.0,
+    ))
+    return ArbitrageLiveRunner(
+        engine=engine,
+        exchange_a=PaperExchange(),
+        exchange_b=PaperExchange(),
+        config=ArbitrageLiveConfig(symbol_a="KRW-BTC", symbol_b="BTCUSDT"),
+        market_data_provider=provider,
+        tracer=tracer,
+    )
+
+
+def wide_spread_snapshot(trace=None):
+    return OrderBookSnapshot(
+        timestamp=datetime.utcnow().isoformat(),
+        best_bid_a=100000.0,
+        best_ask_a=100100.0,
+        best_bid_b=41000.0,
+        best_ask_b=41100.0,
+        trace=trace,
+    )
+
+
+class TestPipeline:
+    """WS 어댑터 → runner 경로"""
+    
+    def test_ws_adapters_attach_trace(self):
+        dataset = synthetic_dataset(ticks=4, seed=1)
+        tracer = TickTracer(sample_every=1)
+        received = []
+        upbit = UpbitWebSocketAdapter(symbols=["KRW-BTC"], callback=received.append)
+        binance = BinanceWebSocketAdapter(symbols=["btcusdt"], callback=received.append)
+        upbit.tracer = binance.tracer = tracer
+        
+        upbit._handle_raw_message(dataset.upbit_frames[0].encode("utf-8"))
+        binance._handle_raw_message(dataset.binance_frames[0])
+        upbit._handle_raw_message("not json")
+        
+        assert len(received) == 2
+        for snapshot in received:
+            assert [span[0] for span in snapshot.trace.spans] == [STAGE_WS_DECODE, STAGE_WS_PARSE, STAGE_AGGREGATE]
+        assert received[1].trace.origin_ns > received[0].trace.origin_ns
+        assert upbit._active_trace is None
+    
+    def test_ws_adapter_marks_before_publish(self):
+        """callback(발행) 시점에 어댑터 stage가 모두 기록됨 → runner 점유 후 trace 미변경"""
+        dataset = synthetic_dataset(ticks=2, seed=1)
+        tracer = TickTracer(sample_every=1)
+        seen = []
+        
+        def claim(snapshot):
+            assert snapshot.trace.claim()
+            seen.append([span[0] for span in snapshot.trace.spans])
+            snapshot.trace.mark(STAGE_QUEUE_WAIT)
+        
+        for adapter, frame in (
+            (UpbitWebSocketAdapter(symbols=["KRW-BTC"], callback=claim), dataset.upbit_frames[0]),
+            (BinanceWebSocketAdapter(symbols=["btcusdt"], callback=claim), dataset.binance_frames[0]),
+        ):
+            adapter.tracer = tracer
+            adapter._handle_raw_message(frame)
+            (snapshot,) = adapter._last_snapshots.values()
+            assert [span[0] for span in snapshot.trace.spans] == [
+                STAGE_WS_DECODE, STAGE_WS_PARSE, STAGE_AGGREGATE, STAGE_QUEUE_WAIT,
+            ]
+        assert seen == [[STAGE_WS_DECODE, STAGE_WS_PARSE, STAGE_AGGREGATE]] * 2
+    
+    def test_untraced_adapter(self):
+        dataset = synthetic_dataset(ticks=2, seed=1)
+        received = []
+        adapter = UpbitWebSocketAdapter(symbols=["KRW-BTC"], callback=received.append)
+        adapter._handle_raw_message(dataset.upbit_frames[0])
+        assert received[0].trace is None
+    
+    def test_runner_records_tick_to_order(self):
+        tracer = TickTracer(sample_every=1, slow_threshold_ms=1000.0)
+        runner = make_runner(tracer)
+        trace = tracer.start()
+        trace.mark(STAGE_WS_DECODE)
+        snapshot = wide_spread_snapshot(trace)
+        
+        trades = runner.process_snapshot(snapshot)
+        assert trades and all(t.trace is trace for t in trades)
+        runner.execute_trades(trades)
+        
+        names = [span[0] for span in trace.spans]
+        assert names[:4] == [STAGE_WS_DECODE, STAGE_QUEUE_WAIT, STAGE_ENGINE, STAGE_HANDOFF]
+        assert names[4] == STAGE_EXECUTE
+        assert STAGE_RISK in names and STAGE_SUBMIT in names
+        execute_index = names.index(STAGE_EXECUTE)
+        assert all(span[3] == execute_index for span in trace.spans[execute_index + 1:])
+        assert tracer.finished == 1
+        assert tracer.percentiles(TICK_TO_ORDER)
+        
+        # 같은 스냅샷 재처리(새 데이터 없음) → 중복 기록 없음
+        runner.execute_trades(runner.process_snapshot(snapshot))
+        assert tracer.finished == 1
+    
+    def test_runner_finishes_trace_without_trades(self):
+        tracer = TickTracer(sample_every=1)
+        runner = make_runner(tracer)
+        trace = tracer.start()
+        snapshot = OrderBookSnapshot("t", 100000.0, 100010.0, 40000.0, 40004.0, trace=trace)
+        
+        assert runner.process_snapshot(snapshot) == []
+        assert tracer.finished == 1
+        assert tracer.percentiles(TICK_TO_DECISION)
+        assert not tracer.percentiles(TICK_TO_ORDER)
+    
+    def test_rest_path_starts_trace(self):
+        tracer = TickTracer(sample_every=1)
+        runner = make_runner(tracer)
+        runner.exchange_a.set_orderbook(
+            "KRW-BTC", ExchangeOrderBookSnapshot("KRW-BTC", time.time(), [(100000.0, 1.0)], [(100100.0, 1.0)])
+        )
+        runner.exchange_b.set_orderbook(
+            "BTCUSDT", ExchangeOrderBookSnapshot("BTCUSDT", time.time(), [(41000.0, 1.0)], [(41100.0, 1.0)])
+        )
+        
+        assert asyncio.run(runner.run_once())
+        
+        assert tracer.finished == 1
+        assert tracer.percentiles("rest.fetch")
+
+
+class TestLoopLagSampler:
+    """이벤트 루프 지연"""
+    
+    def test_detects_blocking_call(self):
+        sampler = LoopLagSampler(interval_seconds=0.01)
+        
+        async def scenario():
+            sampler.start()
+            await asyncio.sleep(0.05)
+            time.sleep(0.08)  # 루프 블로킹
+            await asyncio.sleep(0.05)
+            await sampler.stop()
+        
+        asyncio.run(scenario())
+        
+        metrics = sampler.get_metrics()
+        assert metrics["event_loop_lag_samples"] >= 3
+        assert metrics["event_loop_lag_max_ms"] >= 50.0
+        assert metrics["event_loop_lag_p99_ms"] >= 50.0
+    
+    def test_runner_starts_and_stops_sampler(self):
+        runner = make_runner(TickTracer(sample_every=1))
+        runner.config.poll_interval_seconds = 0.05
+        runner.config.max_runtime_seconds = 0.3
+        
+        asyncio.run(runner.run_forever())
+        
+        sampler = runner.loop_lag_sampler
+        assert sampler is not None
+        assert sampler._task is None  # 종료 시 정지
+        assert sampler.samples >= 1
+        assert runner.get_stats()["event_loop_lag_samples"] == sampler.samples
+    
+    def test_untraced_runner_has_no_sampler(self):
+        runner = make_runner(None)
+        assert runner.loop_lag_sampler is None
+        assert "event_loop_lag_samples" not in runner.get_stats()
+    
+    def test_record_and_validation(self):
+        now = [0.0]
+        sampler = LoopLagSampler(window_seconds=10.0, clock=lambda: now[0])
+        for lag in (1.0, 2.0, 3.0):
+            sampler.record(lag)
+        assert sampler.get_metrics()["event_loop_lag_avg_ms"] == pytest.approx(2.0)
+        now[0] = 100.0
+        assert sampler.get_metrics()["event_loop_lag_max_ms"] == 0.0
+        with pytest.raises(ValueError):
+            LoopLagSampler(interval_seconds=0)
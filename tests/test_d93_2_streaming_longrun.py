@@ -0,0 +1,302 @@
+# -*- coding: utf-8 -*-
+"""
+D93-2: Streaming Long-run Analyzer 테스트
+
+Welford/추세 통계, 리스트 분석과 파일 스트리밍 결과 일치, drift/메모리 누수/에러율 추세 탐지,
+checkpoint 재개, 기록 중인 마지막 줄 처리, 파일 교체 감지 검증.
+"""
+
+import json
+import random
+from datetime import datetime, timedelta
+
+import pytest
+
+from arbitrage.monitoring.longrun_analyzer import (
+    LongrunAnalyzer,
+    MetricStats,
+    StreamingLongrunAnalyzer,
+    TrendStats,
+    analyze_longrun_log,
+)
+
+START = datetime(2025, 12, 1, 0, 0, 0)
+
+
+def make_entries(count, seed=1, interval_seconds=60, **overrides):
+    """1분 간격 메트릭 entry (overrides: key → i를 받는 함수)"""
+    rng = random.Random(seed)
+    entries = []
+    for i in range(count):
+        entry = {
+            "timestamp": (START + timedelta(seconds=i * interval_seconds)).isoformat(),
+            "loop_time_ms": rng.uniform(900.0, 1100.0),
+            "trades_opened": 1 if i % 20 == 0 else 0,
+            "spread_bps": rng.uniform(-5.0, 60.0),
+            "snapshot_none": False,
+            "error_log": False,
+            "warning_log": False,
+            "ws_latency_ms": rng.uniform(20.0, 80.0),
+            "ws_queue_lag_ms": rng.uniform(0.0, 10.0),
+            "ws_queue_depth": rng.randint(0, 20),
+            "memory_mb": 300.0 + rng.uniform(-2.0, 2.0),
+        }
+        for key, value in overrides.items():
+            entry[key] = value(i)
+        entries.append(entry)
+    return entries
+
+
+def write_jsonl(path, entries):
+    with open(path, "w", encoding="utf-8") as f:
+        for entry in entries:
+            f.write(json.dumps(entry) + "\n")
+
+
+def categories(report):
+    return sorted(alert.category for alert in report.anomalies)
+
+
+class TestStats:
+    """MetricStats(Welford) / TrendStats"""
+    
+    def test_welford_matches_naive(self):
+        rng = random.Random(3)
+        values = [rng.gauss(100.0, 15.0) for _ in range(500)]
+        stats = MetricStats(keep_values=False)
+        for value in values:
+            stats.update(value)
+        
+        mean = sum(values) / len(values)
+        stddev = (sum((v - mean) ** 2 for v in values) / len(values)) ** 0.5
+        assert stats.values == []
+        assert stats.count == 500
+        assert stats.mean == pytest.approx(mean)
+        assert stats.stddev == pytest.approx(stddev)
+        assert stats.total == pytest.approx(sum(values))
+        assert (stats.min, stats.max) == (min(values), max(values))
+    
+    def test_metric_stats_round_trip(self):
+        stats = MetricStats(keep_values=False)
+        restored = MetricStats.from_dict(json.loads(json.dumps(stats.to_dict())))
+        assert restored.min == float("inf") and restored.count == 0
+        
+        for value in (3.0, 1.0, 2.0):
+            stats.update(value)
+        restored = MetricStats.from_dict(json.loads(json.dumps(stats.to_dict())))
+        restored.update(10.0)
+        stats.update(10.0)
+        assert restored == stats
+    
+    def test_trend_slope(self):
+        trend = TrendStats()
+        for i in range(100):
+            trend.update(i / 60.0, 50.0 + 12.0 * (i / 60.0))
+        
+        assert trend.slope_per_hour == pytest.approx(12.0)
+        assert trend.span_hours == pytest.approx(99 / 60.0)
+        assert trend.projected_change == pytest.approx(12.0 * 99 / 60.0)
+        assert TrendStats().slope_per_hour == 0.0
+
+
+class TestStreaming:
+    """파일 스트리밍 분석"""
+    
+    def test_file_matches_list_analysis(self, tmp_path):
+        entries = make_entries(300, error_log=lambda i: i % 50 == 0)
+        path = tmp_path / "metrics.jsonl"
+        write_jsonl(path, entries)
+        
+        expected = LongrunAnalyzer(scenario="S1").analyze_metrics_log(entries)
+        analyzer = StreamingLongrunAnalyzer(scenario="S1", chunk_bytes=1024)
+        assert analyzer.feed_file(str(path)) == 300
+        report = analyzer.report()
+        
+        assert report.loop_time_stats.values == []
+        assert report.loop_time_stats.mean == pytest.approx(expected.loop_time_stats.mean)
+        assert report.loop_time_stats.stddev == pytest.approx(expected.loop_time_stats.stddev)
+        assert report.trades_opened_stats.total == sum(e["trades_opened"] for e in entries)
+        assert report.error_log_count == expected.error_log_count == 6
+        assert report.ws_queue_depth_max == max(e["ws_queue_depth"] for e in entries)
+        assert report.duration_minutes == 300
+        assert report.start_time == entries[0]["timestamp"]
+        assert report.end_time == entries[-1]["timestamp"]
+        assert categories(report) == categories(expected)
+        assert report.overall_status == expected.overall_status
+    
+    def test_latency_percentiles(self):
+        analyzer = StreamingLongrunAnalyzer()
+        analyzer.feed({"loop_time_ms": float(i)} for i in range(1, 1001))
+        
+        percentiles = analyzer.report().latency_percentiles
+        
+        assert set(percentiles) == {"loop_time_ms"}
+        assert percentiles["loop_time_ms"]["p50"] == pytest.approx(500.0, rel=0.02)
+        assert percentiles["loop_time_ms"]["p99"] == pytest.approx(990.0, rel=0.02)
+    
+    def test_ws_only_buffers_are_bounded(self, monkeypatch):
+        monkeypatch.setattr(StreamingLongrunAnalyzer, "HISTOGRAM_FLUSH_SIZE", 100)
+        analyzer = StreamingLongrunAnalyzer()
+        analyzer.feed({"ws_latency_ms": float(i), "ws_queue_lag_ms": 1.0} for i in range(1, 1001))
+        
+        assert len(analyzer._ws_latency_values) < 100
+        assert len(analyzer._queue_lag_values) < 100
+        percentiles = analyzer.report().latency_percentiles
+        assert set(percentiles) == {"ws_latency_ms", "ws_queue_lag_ms"}
+        assert percentiles["ws_latency_ms"]["p50"] == pytest.approx(500.0, rel=0.02)
+    
+    def test_steady_run_has_no_trend_anomalies(self):
+        analyzer = StreamingLongrunAnalyzer()
+        analyzer.feed(make_entries(720))
+        report = analyzer.report()
+        
+        assert report.loop_time_trend.span_hours == pytest.approx(719 / 60.0)
+        assert abs(report.memory_trend.slope_per_hour) < 1.0
+        assert report.anomalies == []
+        assert report.overall_status == "OK"
+    
+    def test_trend_anomalies(self):
+        # 12시간 동안 메모리 +240MB, 루프 시간 +600ms, 후반부 에러 증가
+        entries = make_entries(
+            720,
+            memory_mb=lambda i: 300.0 + i / 3.0,
+            loop_time_ms=lambda i: 700.0 + i * (600.0 / 720),
+            error_log=lambda i: i > 600 and i % 4 == 0,
+        )
+        analyzer = StreamingLongrunAnalyzer()
+        analyzer.feed(entries)
+        report = analyzer.report()
+        
+        assert report.memory_trend.slope_per_hour == pytest.approx(20.0, rel=0.01)
+        assert {"MEMORY", "LOOP_TIME_DRIFT", "ERROR_RATE_TREND"} <= set(categories(report))
+        
+        text = analyzer.generate_report(report)
+        assert "추세 분석" in text and "MB/h" in text
+    
+    def test_spike_alerts_are_capped(self):
+        analyzer = StreamingLongrunAnalyzer()
+        analyzer.feed({"loop_time_ms": 5000.0, "trades_opened": 1} for _ in range(1000))
+        report = analyzer.report()
+        
+        spikes = [a for a in report.anomalies if a.category == "LOOP_TIME"]
+        assert report.loop_time_spike_count == 1000
+        assert len(spikes) == StreamingLongrunAnalyzer.MAX_SPIKE_ALERTS + 2  # 요약 + 평균 초과
+        assert "900 more" in spikes[StreamingLongrunAnalyzer.MAX_SPIKE_ALERTS].message
+    
+    def test_report_does_not_consume_state(self):
+        analyzer = StreamingLongrunAnalyzer()
+        analyzer.feed(make_entries(10))
+        first = analyzer.report()
+        analyzer.feed(make_entries(10, seed=2))
+        
+        assert first.entries_processed == 10
+        assert analyzer.report().entries_processed == 20
+
+
+class TestFileInput:
+    """checkpoint 재개 / 기록 중 파일 / 잘못된 줄"""
+    
+    def test_checkpoint_resume_matches_single_pass(self, tmp_path):
+        entries = make_entries(400, error_log=lambda i: i % 30 == 0, loop_time_ms=lambda i: 2000.0 if i % 97 == 0 else 1000.0)
+        path = tmp_path / "metrics.jsonl"
+        checkpoint = tmp_path / "metrics.ckpt.json"
+        write_jsonl(path, entries)
+        
+        full = StreamingLongrunAnalyzer(chunk_bytes=2048)
+        full.feed_file(str(path))
+        expected = full.report()
+        
+        partial = StreamingLongrunAnalyzer(chunk_bytes=2048)
+        first = partial.feed_file(str(path), max_bytes=20_000, checkpoint_path=str(checkpoint))
+        assert 0 < first < 400
+        
+        resumed = StreamingLongrunAnalyzer.load_checkpoint(str(checkpoint), chunk_bytes=2048)
+        assert resumed.offset == partial.offset
+        assert resumed.feed_file(str(path)) == 400 - first
+        report = resumed.report()
+        
+        assert report.entries_processed == expected.entries_processed == 400
+        assert report.loop_time_stats.mean == pytest.approx(expected.loop_time_stats.mean)
+        assert report.loop_time_stats.stddev == pytest.approx(expected.loop_time_stats.stddev)
+        assert report.error_rate_trend.slope_per_hour == pytest.approx(expected.error_rate_trend.slope_per_hour)
+        assert report.latency_percentiles == expected.latency_percentiles
+        assert report.loop_time_spike_count == expected.loop_time_spike_count
+        assert [a.message for a in report.anomalies] == [a.message for a in expected.anomalies]
+        assert report.start_time == expected.start_time
+    
+    def test_partial_last_line_is_retried(self, tmp_path):
+        entries = make_entries(3)
+        path = tmp_path / "live.jsonl"
+        write_jsonl(path, entries[:2])
+        tail = json.dumps(entries[2])
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(tail[:20])
+        
+        analyzer = StreamingLongrunAnalyzer()
+        assert analyzer.feed_file(str(path)) == 2
+        offset = analyzer.offset
+        
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(tail[20:] + "\n")
+        assert analyzer.feed_file(str(path)) == 1
+        assert analyzer.offset > offset
+        assert analyzer.report().entries_processed == 3
+        assert analyzer.parse_error_count == 0
+    
+    def test_bad_lines_skipped(self, tmp_path):
+        path = tmp_path / "metrics.jsonl"
+        path.write_text('{"loop_time_ms": 1000}\nnot json\n\n[1, 2]\n{"loop_time_ms": 1200}', encoding="utf-8")
+        
+        analyzer = StreamingLongrunAnalyzer()
+        assert analyzer.feed_file(str(path)) == 2
+        assert analyzer.parse_error_count == 2
+        assert analyzer.report().loop_time_stats.mean == pytest.approx(1100.0)
+    
+    def test_analyze_longrun_log_checkpoint(self, tmp_path):
+        path = tmp_path / "metrics.jsonl"
+        checkpoint = tmp_path / "ckpt.json"
+        write_jsonl(path, make_entries(50))
+        
+        report = analyze_longrun_log(str(path), checkpoint_path=str(checkpoint))
+        assert report.entries_processed == 50
+        
+        # 추가 기록 후 재실행 → 새 줄만 읽음
+        with open(path, "a", encoding="utf-8") as f:
+            for entry in make_entries(10, seed=9):
+                f.write(json.dumps(entry) + "\n")
+        assert analyze_longrun_log(str(path), checkpoint_path=str(checkpoint)).entries_processed == 60
+        
+        # 파일 교체 → checkpoint 무시하고 처음부터
+        write_jsonl(path, make_entries(5, seed=4))
+        assert analyze_longrun_log(str(path), checkpoint_path=str(checkpoint)).entries_processed == 5
+    
+    def test_attach_rejects_other_file(self, tmp_path):
+        a, b = tmp_path / "a.jsonl", tmp_path / "b.jsonl"
+        write_jsonl(a, make_entries(2))
+        write_jsonl(b, make_entries(2))
+        
+        analyzer = StreamingLongrunAnalyzer()
+        analyzer.feed_file(str(a))
+        with pytest.raises(ValueError, match="bound to"):
+            analyzer.feed_file(str(b))
+    
+    def test_missing_file(self, tmp_path):
+        report = analyze_longrun_log(str(tmp_path / "missing.jsonl"))
+        assert report.duration_minutes == 0
+        assert report.entries_processed == 0
+    
+    def test_parquet_resume(self, tmp_path):
+        pa = pytest.importorskip("pyarrow")
+        pq = pytest.importorskip("pyarrow.parquet")
+        entries = make_entries(100)
+        path = tmp_path / "metrics.parquet"
+        pq.write_table(pa.Table.from_pylist(entries), str(path), row_group_size=16)
+        
+        partial = StreamingLongrunAnalyzer()
+        assert partial.feed_parquet(str(path), max_rows=37, batch_rows=10) == 37
+        resumed = StreamingLongrunAnalyzer.from_checkpoint(json.loads(json.dumps(partial.checkpoint())))
+        assert resumed.feed_parquet(str(path), batch_rows=10) == 63
+        
+        expected = StreamingLongrunAnalyzer()
+        expected.feed(entries)
+        assert resumed.report().loop_time_stats.mean == pytest.approx(expected.report().loop_time_stats.mean)
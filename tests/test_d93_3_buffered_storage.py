@@ -0,0 +1,572 @@
+# -*- coding: utf-8 -*-
+"""
+D93-3: 버퍼링 저장소 쓰기 경로 테스트
+
+BufferedWriter의 크기/시간/flush/close 조건, 실패 배치 재시도, backpressure(대기/버림) 메트릭,
+CsvStorage 버퍼 모드와 즉시 기록 모드의 파일 결과 일치, fsync 정책, Redis pipeline 기록 검증.
+"""
+
+import threading
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from arbitrage.benchmark.standins import InMemoryPostgresConnection, parse_copy_csv
+from arbitrage.models import OrderLeg, Position, SpreadOpportunity
+from arbitrage import storage as storage_module
+from arbitrage.storage import (
+    BufferedWriter,
+    CsvStorage,
+    RedisCacheStorage,
+    WriteBufferConfig,
+    get_storage,
+)
+
+START = datetime(2025, 12, 1, tzinfo=timezone.utc)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+    
+    def __call__(self):
+        return self.now
+
+
+class RecordingSink:
+    def __init__(self, fail_times=0, bad_rows=()):
+        self.batches = []
+        self.fail_times = fail_times
+        self.bad_rows = set(bad_rows)  # 포함된 배치는 항상 실패
+        self.calls = 0
+    
+    def __call__(self, table, rows):
+        self.calls += 1
+        if self.fail_times > 0:
+            self.fail_times -= 1
+            raise IOError("disk full")
+        if self.bad_rows.intersection(rows):
+            raise ValueError("bad row")
+        self.batches.append((table, list(rows)))
+    
+    def rows(self, table):
+        return [row for t, batch in self.batches if t == table for row in batch]
+
+
+def inline_config(**overrides):
+    values = dict(max_batch_rows=3, flush_interval_seconds=1.0, background=False)
+    values.update(overrides)
+    return WriteBufferConfig(**values)
+
+
+def make_position(i, closed=False):
+    position = Position(
+        symbol="BTC",
+        direction="long_upbit_short_binance",
+        size=0.01 * (i + 1),
+        entry_upbit_price=50_000_000.0 + i,
+        entry_binance_price=37_000.0 + i,
+        entry_spread_pct=0.8,
+        timestamp_open=START + timedelta(minutes=i),
+    )
+    if closed:
+        position.timestamp_close = START + timedelta(minutes=i, seconds=30)
+        position.exit_upbit_price = 50_100_000.0
+        position.exit_binance_price = 37_050.0
+        position.exit_spread_pct = 0.1
+        position.pnl_krw = 1234.0
+        position.pnl_pct = 0.25
+        position.status = "CLOSED"
+    return position
+
+
+def write_sample(storage, count=20):
+    for i in range(count):
+        storage.log_spread(SpreadOpportunity(
+            symbol="BTC",
+            upbit_price=50_000_000.0 + i,
+            binance_price=37_000.0,
+            binance_price_krw=49_950_000.0,
+            spread_pct=0.1,
+            net_spread_pct=0.05,
+            timestamp=1_700_000_000_000 + i,
+            is_opportunity=i % 2 == 0,
+        ))
+        storage.log_order(OrderLeg(
+            symbol="BTC",
+            venue="upbit",
+            side="buy",
+            qty=0.01,
+            price_theoretical=50_000_000.0,
+            timestamp=START + timedelta(seconds=i),
+            leg_id=f"pos_{i}_leg_0",
+        ))
+        if i % 5 == 0:
+            storage.log_position_open(make_position(i))
+            storage.log_position_close(make_position(i, closed=True))
+
+
+class TestWriteBufferConfig:
+    def test_from_config(self):
+        assert WriteBufferConfig.from_config(None) is None
+        assert WriteBufferConfig.from_config({"enabled": False, "max_batch_rows": 10}) is None
+        assert WriteBufferConfig.from_config({"max_batch_rows": 10}) is None  # opt-in
+        
+        config = WriteBufferConfig.from_config({"enabled": True, "max_batch_rows": 10, "fsync": "never"})
+        assert config.max_batch_rows == 10
+        assert config.fsync == "never"
+    
+    def test_validation(self):
+        with pytest.raises(ValueError):
+            WriteBufferConfig(fsync="always")
+        with pytest.raises(ValueError):
+            WriteBufferConfig(max_batch_rows=100, max_pending_rows=10)
+        with pytest.raises(ValueError):
+            WriteBufferConfig(flush_interval_seconds=0)
+        with pytest.raises(ValueError):
+            WriteBufferConfig(max_retries=-1)
+    
+    def test_defaults_never_block_caller(self):
+        assert WriteBufferConfig().max_block_seconds == 0
+
+
+class TestBufferedWriter:
+    def test_flush_on_size_per_table(self):
+        sink = RecordingSink()
+        writer = BufferedWriter(sink, inline_config(), clock=FakeClock())
+        
+        for i in range(2):
+            writer.submit("a", i)
+            writer.submit("b", i)
+        assert sink.batches == []
+        assert writer.depth == 4
+        
+        writer.submit("a", 2)
+        assert sink.batches == [("a", [0, 1, 2])]
+        assert writer.depth == 2
+        writer.close()
+    
+    def test_flush_on_interval(self):
+        clock = FakeClock()
+        sink = RecordingSink()
+        writer = BufferedWriter(sink, inline_config(max_batch_rows=100), clock=clock)
+        
+        writer.submit("a", 0)
+        clock.now += 0.5
+        writer.submit("a", 1)
+        assert sink.batches == []
+        
+        clock.now += 0.6
+        writer.submit("a", 2)
+        assert sink.rows("a") == [0, 1, 2]
+        writer.close()
+    
+    def test_flush_and_close_drain(self):
+        sink = RecordingSink()
+        writer = BufferedWriter(sink, inline_config(max_batch_rows=100), clock=FakeClock())
+        writer.submit("a", 0)
+        assert writer.flush() is True
+        assert sink.rows("a") == [0]
+        
+        writer.submit("b", 1)
+        writer.close()
+        assert sink.rows("b") == [1]
+        assert writer.depth == 0
+        with pytest.raises(RuntimeError):
+            writer.submit("a", 2)
+        writer.close()  # 중복 호출 안전
+    
+    def test_failed_batch_is_retried_in_order(self):
+        clock = FakeClock()
+        sink = RecordingSink(fail_times=1)
+        writer = BufferedWriter(sink, inline_config(), clock=clock)
+        
+        for i in range(3):
+            writer.submit("a", i)
+        assert sink.batches == []
+        assert writer.depth == 3
+        
+        writer.submit("a", 3)  # 배치가 가득 차 있어도 재시도는 flush_interval 이후
+        assert sink.batches == []
+        clock.now += 1.0
+        writer.submit("a", 4)
+        assert sink.rows("a") == [0, 1, 2, 3, 4]
+        
+        metrics = writer.get_metrics()
+        assert metrics["storage_flush_errors"] == 1
+        assert metrics["storage_rows_written"] == 5
+        assert metrics["storage_dropped_rows"] == 0
+        writer.close()
+    
+    def test_bad_row_isolated_after_max_retries(self):
+        """재시도 한도 초과 시 반씩 나눠 기록 → 불량 행만 버리고 나머지는 순서대로 기록"""
+        clock = FakeClock()
+        sink = RecordingSink(bad_rows={5})
+        writer = BufferedWriter(sink, inline_config(max_batch_rows=8, max_retries=2), clock=clock)
+        
+        for i in range(8):
+            writer.submit("a", i)
+        for _ in range(2):
+            assert sink.batches == []
+            assert writer.depth == 8
+            clock.now += 1.0
+            assert writer.flush() is False
+        
+        assert sink.rows("a") == [0, 1, 2, 3, 4, 6, 7]
+        metrics = writer.get_metrics()
+        assert metrics["storage_dropped_rows"] == 1
+        assert metrics["storage_rows_written"] == 7
+        assert metrics["storage_flush_errors"] == 3
+        assert metrics["storage_buffer_depth"] == 0
+        
+        # 한도 도달 후 성공하면 실패 횟수 초기화 → 다음 실패는 다시 재시도부터
+        writer.submit("a", 5)
+        assert writer.flush() is False
+        assert writer.depth == 1
+        writer.close()
+    
+    def test_close_drops_rows_when_sink_keeps_failing(self):
+        sink = RecordingSink(fail_times=10)
+        writer = BufferedWriter(sink, inline_config(max_batch_rows=100), clock=FakeClock())
+        writer.submit("a", 0)
+        writer.close()
+        metrics = writer.get_metrics()
+        assert metrics["storage_dropped_rows"] == 1
+        assert metrics["storage_buffer_depth"] == 0
+    
+    def test_close_salvages_good_rows(self):
+        """종료 중 실패는 재시도 대신 바로 분리 기록 (정상 행은 보존)"""
+        sink = RecordingSink(bad_rows={"x"})
+        writer = BufferedWriter(sink, inline_config(max_batch_rows=100), clock=FakeClock())
+        for row in ("a0", "x", "a1", "a2"):
+            writer.submit("a", row)
+        writer.close()
+        assert sink.rows("a") == ["a0", "a1", "a2"]
+        assert writer.get_metrics()["storage_dropped_rows"] == 1
+    
+    def test_background_writer_preserves_order(self):
+        sink = RecordingSink()
+        config = WriteBufferConfig(max_batch_rows=50, flush_interval_seconds=0.05)
+        writer = BufferedWriter(sink, config, name="bg")
+        
+        def produce(table):
+            for i in range(500):
+                writer.submit(table, i)
+        
+        threads = [threading.Thread(target=produce, args=(t,)) for t in ("a", "b")]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert writer.flush(timeout=5.0) is True
+        
+        assert sink.rows("a") == list(range(500))
+        assert sink.rows("b") == list(range(500))
+        metrics = writer.get_metrics()
+        assert metrics["bg_buffer_depth"] == 0
+        assert metrics["bg_rows_written"] == 1000
+        assert metrics["bg_flush_count"] >= 2
+        assert metrics["bg_flush_latency_max_ms"] >= metrics["bg_flush_latency_avg_ms"] > 0
+        writer.close()
+    
+    def test_background_time_flush(self):
+        sink = RecordingSink()
+        done = threading.Event()
+        
+        def sink_and_signal(table, rows):
+            sink(table, rows)
+            done.set()
+        
+        writer = BufferedWriter(sink_and_signal, WriteBufferConfig(flush_interval_seconds=0.05))
+        writer.submit("a", 1)
+        assert done.wait(2.0)
+        assert sink.rows("a") == [1]
+        writer.close()
+    
+    def test_background_flush_reports_failure_then_retries(self):
+        sink = RecordingSink(fail_times=1)
+        writer = BufferedWriter(sink, WriteBufferConfig(flush_interval_seconds=1.0), name="retry")
+        writer.submit("a", 1)
+        assert writer.flush(timeout=2.0) is False
+        assert writer.flush(timeout=2.0) is True
+        assert sink.rows("a") == [1]
+        assert writer.get_metrics()["retry_flush_errors"] == 1
+        writer.close()
+    
+    def test_backpressure_blocks_then_drops(self):
+        release = threading.Event()
+        entered = threading.Event()
+        
+        def slow_sink(table, rows):
+            entered.set()
+            release.wait(5.0)
+        
+        config = WriteBufferConfig(
+            max_batch_rows=2,
+            max_pending_rows=4,
+            max_block_seconds=0.05,
+            flush_interval_seconds=0.01,
+        )
+        writer = BufferedWriter(slow_sink, config, name="bp")
+        writer.submit("a", 0)
+        writer.submit("a", 1)
+        assert entered.wait(2.0)
+        
+        # writer는 sink에서 막혀 있고 기록 중인 2행 + 새 2행으로 상한 도달
+        assert writer.submit("a", 2)
+        assert writer.submit("a", 3)
+        assert writer.submit("a", 4) is False
+        
+        metrics = writer.get_metrics()
+        assert metrics["bp_dropped_rows"] == 1
+        assert metrics["bp_blocked_count"] == 1
+        assert metrics["bp_blocked_ms"] >= 40.0
+        assert metrics["bp_buffer_max_depth"] == 4
+        
+        release.set()
+        writer.close()
+        assert writer.get_metrics()["bp_rows_written"] == 4
+    
+    def test_backpressure_drops_without_blocking_by_default(self):
+        release = threading.Event()
+        entered = threading.Event()
+        
+        def slow_sink(table, rows):
+            entered.set()
+            release.wait(5.0)
+        
+        config = WriteBufferConfig(max_batch_rows=2, max_pending_rows=2, flush_interval_seconds=0.01)
+        writer = BufferedWriter(slow_sink, config, name="bp")
+        writer.submit("a", 0)
+        writer.submit("a", 1)
+        assert entered.wait(2.0)
+        
+        assert writer.submit("a", 2) is False
+        metrics = writer.get_metrics()
+        assert metrics["bp_dropped_rows"] == 1
+        assert metrics["bp_blocked_count"] == 0
+        
+        release.set()
+        writer.close()
+
+
+class TestCsvStorageBuffered:
+    def test_same_files_as_unbuffered(self, tmp_path):
+        direct = CsvStorage(str(tmp_path / "direct"))
+        buffered = CsvStorage(str(tmp_path / "buffered"), buffer=inline_config(max_batch_rows=7))
+        write_sample(direct)
+        write_sample(buffered)
+        buffered.close()
+        
+        for name in ("spreads.csv", "positions.csv", "trades.csv", "orders.csv"):
+            expected = (tmp_path / "direct" / name).read_text(encoding="utf-8")
+            assert (tmp_path / "buffered" / name).read_text(encoding="utf-8") == expected, name
+    
+    def test_background_append_to_existing_file(self, tmp_path):
+        CsvStorage(str(tmp_path)).log_position_open(make_position(0))
+        
+        storage = CsvStorage(str(tmp_path), buffer=WriteBufferConfig(max_batch_rows=100))
+        storage.log_position_open(make_position(1))
+        storage.log_error("boom")
+        
+        positions = storage.load_positions()  # flush 후 로드
+        assert [p.size for p in positions] == [0.01, 0.02]
+        storage.close()
+        
+        lines = (tmp_path / "positions.csv").read_text(encoding="utf-8").splitlines()
+        assert len(lines) == 3
+        assert lines[0].startswith("timestamp_open,")
+        assert "boom" in (tmp_path / "errors.log").read_text(encoding="utf-8")
+        assert storage.get_write_metrics()["storage_csv_rows_written"] == 2
+    
+    @pytest.mark.parametrize("policy, expected_calls", [("never", 0), ("batch", 3)])
+    def test_fsync_policy(self, tmp_path, monkeypatch, policy, expected_calls):
+        calls = []
+        monkeypatch.setattr(storage_module.os, "fsync", lambda fd: calls.append(fd))
+        storage = CsvStorage(str(tmp_path), buffer=inline_config(max_batch_rows=2, fsync=policy))
+        for i in range(6):
+            storage.log_position_open(make_position(i))
+        assert len(calls) == expected_calls
+        storage.close()
+    
+    def test_failed_batch_leaves_no_partial_rows(self, tmp_path):
+        direct = CsvStorage(str(tmp_path / "direct"))
+        storage = CsvStorage(str(tmp_path / "buffered"), buffer=inline_config(max_batch_rows=3))
+        for i in range(3):
+            direct.log_position_open(make_position(i))
+            storage.log_position_open(make_position(i))
+        
+        class TornHandle:
+            """첫 write에서 절반만 기록하고 실패하는 파일 핸들"""
+            
+            def __init__(self, fh):
+                self.fh = fh
+            
+            def write(self, data):
+                self.fh.write(data[: len(data) // 2])
+                self.fh.flush()
+                raise OSError("disk full")
+            
+            def __getattr__(self, name):
+                return getattr(self.fh, name)
+        
+        storage._handles["positions"] = TornHandle(storage._handles["positions"])
+        for i in range(3, 6):
+            direct.log_position_open(make_position(i))
+            storage.log_position_open(make_position(i))
+        assert storage.get_write_metrics()["storage_csv_flush_errors"] == 1
+        storage.close()
+        
+        expected = (tmp_path / "direct" / "positions.csv").read_text(encoding="utf-8")
+        assert (tmp_path / "buffered" / "positions.csv").read_text(encoding="utf-8") == expected
+    
+    def test_unbuffered_has_no_metrics(self, tmp_path):
+        storage = CsvStorage(str(tmp_path))
+        storage.flush()
+        storage.close()
+        assert storage.get_write_metrics() == {}
+    
+    def test_get_storage_buffer_section(self, tmp_path):
+        config = {
+            "data_dir": str(tmp_path),
+            "storage": {"backend": "csv", "buffer": {"enabled": True, "background": False}},
+        }
+        storage = get_storage(config)
+        assert storage.get_write_metrics()["storage_csv_buffer_depth"] == 0
+        storage.close()
+        
+        config["storage"]["buffer"]["enabled"] = False
+        assert get_storage(config).get_write_metrics() == {}
+
+
+class FakeRedis:
+    """set/get/pipeline만 가진 인메모리 클라이언트"""
+    
+    def __init__(self):
+        self.data = {}
+        self.set_calls = 0
+        self.pipelines = []
+    
+    def set(self, key, value, ex=None):
+        self.set_calls += 1
+        self.data[key] = (str(value).encode(), ex)
+    
+    def get(self, key):
+        item = self.data.get(key)
+        return item[0] if item else None
+    
+    def pipeline(self, transaction=True):
+        client = self
+        commands = []
+        self.pipelines.append(commands)
+        
+        class Pipeline:
+            def set(self, key, value, ex=None):
+                commands.append((key, value, ex))
+            
+            def execute(self):
+                for key, value, ex in commands:
+                    client.set(key, value, ex=ex)
+        
+        return Pipeline()
+
+
+class TestRedisCacheStorage:
+    def test_direct_set_get(self):
+        client = FakeRedis()
+        cache = RedisCacheStorage({"prefix": "arb"}, client=client)
+        cache.set_fx_rate("USDKRW", 1350.5)
+        cache.set_spread_snapshot("BTC", {"spread_pct": 0.4})
+        cache.set_health_heartbeat("live")
+        
+        assert cache.get_fx_rate("USDKRW") == 1350.5
+        assert cache.get_spread_snapshot("BTC") == {"spread_pct": 0.4}
+        assert client.data["arb:fx:usdkrw"][1] == 3
+        assert client.data["arb:health:live"][1] == RedisCacheStorage.HEARTBEAT_TTL
+        assert cache.get_fx_rate("EURKRW") is None
+    
+    def test_buffered_pipeline_keeps_last_value(self):
+        client = FakeRedis()
+        cache = RedisCacheStorage({}, client=client, buffer=inline_config(max_batch_rows=100))
+        for i in range(50):
+            cache.set_fx_rate("USDKRW", 1300.0 + i)
+        cache.set_health_heartbeat("paper")
+        assert client.data == {}
+        
+        cache.flush()
+        assert len(client.pipelines) == 1
+        assert len(client.pipelines[0]) == 2
+        assert cache.get_fx_rate("USDKRW") == 1349.0
+        assert cache.get_write_metrics()["storage_redis_rows_written"] == 51
+        cache.close()
+
+
+class TestPostgresBulkWrite:
+    """PostgresStorage 버퍼 모드: COPY 본문 인코딩 + 배치 트랜잭션 (InMemoryPostgresConnection)"""
+    
+    def test_copy_csv_nulls_booleans_timestamps(self):
+        rows = [
+            ("BTC", 50_000_000.0, None, True, START),
+            ("", "say \"hi\", then\nbye", None, False, None),
+        ]
+        text = storage_module._copy_csv(rows)
+        
+        assert text.splitlines()[0] == '"BTC",50000000.0,,True,2025-12-01 00:00:00+00:00'
+        # 빈 문자열은 따옴표("") → NULL(따옴표 없는 빈 값)과 구분
+        assert parse_copy_csv(text) == [
+            ("BTC", "50000000.0", None, "True", "2025-12-01 00:00:00+00:00"),
+            ("", 'say "hi", then\nbye', None, "False", None),
+        ]
+    
+    @pytest.fixture
+    def postgres(self, monkeypatch):
+        psycopg2 = pytest.importorskip("psycopg2")
+        conn = InMemoryPostgresConnection()
+        monkeypatch.setattr(psycopg2, "connect", lambda dsn: conn)
+        storage = storage_module.PostgresStorage({}, buffer=inline_config(max_batch_rows=100))
+        yield storage, conn, psycopg2
+        storage.close()
+    
+    def test_batch_copies_rows(self, postgres):
+        storage, conn, _ = postgres
+        write_sample(storage, count=2)
+        storage.flush()
+        
+        spread = conn.tables["spreads"][0]
+        assert spread[-2:] == ("True", "2023-11-14 22:13:20+00:00")
+        order = conn.tables["orders"][1]
+        assert order[:3] == ("BTC", "upbit", "buy")
+        # price_effective / slippage_bps / order_id 미설정 → NULL
+        assert order[5:7] == (None, None) and order[8] is None
+        assert len(conn.tables["spreads"]) == len(conn.tables["orders"]) == 2
+    
+    def test_inserts_and_closes_keep_order_in_one_transaction(self, postgres):
+        storage, conn, _ = postgres
+        commits = conn.commits
+        storage.log_position_open(make_position(0))
+        storage.log_position_close(make_position(0, closed=True))
+        storage.log_position_open(make_position(1))
+        storage.log_position_open(make_position(2))
+        storage.flush()
+        
+        assert conn.commits == commits + 1
+        assert [(op, table) for op, table, _ in conn.statements] == [
+            ("COPY", "positions"), ("UPDATE", "positions"), ("COPY", "positions"), ("COPY", "positions"),
+        ]
+        close_params = conn.statements[1][2]
+        assert close_params[5:] == ("CLOSED", START + timedelta(seconds=30), "BTC", "long_upbit_short_binance")
+    
+    def test_failed_batch_rolls_back_then_retries(self, postgres):
+        storage, conn, psycopg2 = postgres
+        storage.log_position_open(make_position(0))
+        storage.log_position_close(make_position(0, closed=True))
+        
+        # COPY 다음 UPDATE에서 실패 → 앞선 COPY까지 rollback
+        conn.fail_on = ("UPDATE", psycopg2.DataError("invalid input"))
+        assert storage._writer.flush() is False
+        assert conn.rollbacks == 1
+        assert conn.statements == [] and "positions" not in conn.tables
+        
+        assert storage._writer.flush() is True
+        assert [op for op, _, _ in conn.statements] == ["COPY", "UPDATE"]
+        assert storage.get_write_metrics()["storage_postgres_flush_errors"] == 1